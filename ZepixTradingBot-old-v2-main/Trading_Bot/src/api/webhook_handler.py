@@ -5,13 +5,16 @@ Receives TradingView alerts and routes to appropriate plugins
 Part of Plan 02: Webhook Routing & Signal Processing
 """
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from typing import Dict, Any, Optional
 import logging
 import json
 
-from src.utils.signal_parser import SignalParser
+from src.utils.fast_signal_parser import FastSignalParser, decode_alert, encode_alert
 from src.core.plugin_router import PluginRouter, get_plugin_router as _get_router
+from src.monitoring.metrics_registry import get_metrics_registry, webhook_latency_middleware
+from src.monitoring.metrics_collectors import routing_stats_collector
+from src.monitoring.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,7 @@ app = FastAPI(
     description="Webhook endpoint for TradingView alerts",
     version="2.0.0"
 )
+app.middleware("http")(webhook_latency_middleware)
 
 # Plugin router singleton
 _plugin_router: Optional[PluginRouter] = None
@@ -39,6 +43,9 @@ def init_plugin_router(plugin_registry) -> PluginRouter:
     """
     global _plugin_router
     _plugin_router = _get_router(plugin_registry)
+    get_metrics_registry().register_collector(
+        "plugin_router", routing_stats_collector(_plugin_router)
+    )
     logger.info("Webhook handler initialized with plugin router")
     return _plugin_router
 
@@ -65,16 +72,33 @@ async def webhook_endpoint(request: Request) -> JSONResponse:
     4. Route to plugin
     5. Return result
     
+    Every alert is traced; the trace id is returned in the X-Trace-Id header.
+    
     Returns:
         JSONResponse with processing result
     """
+    tracer = get_tracer()
+    with tracer.start_trace("webhook", endpoint=request.url.path) as trace:
+        response = await _process_webhook(request)
+        if trace is not None:
+            trace.attributes["http_status"] = response.status_code
+            response.headers["X-Trace-Id"] = trace.trace_id
+        return response
+
+
+async def _process_webhook(request: Request) -> JSONResponse:
+    """Parse, validate and route one webhook alert (runs inside the alert trace)"""
+    tracer = get_tracer()
     try:
         # Get raw alert
-        raw_alert = await request.json()
+        with tracer.span("webhook.read_body"):
+            raw_alert = decode_alert(await request.body())
         logger.info(f"Received webhook alert: {raw_alert.get('type', raw_alert.get('strategy', 'unknown'))}")
+        tracer.tag_trace(alert_type=raw_alert.get('type'), symbol=raw_alert.get('symbol'))
         
-        # Parse alert using SignalParser
-        signal = SignalParser.parse(raw_alert)
+        # Parse alert using the fast-path SignalParser equivalent
+        with tracer.span("signal.parse"):
+            signal = FastSignalParser.parse(raw_alert)
         if not signal:
             logger.warning("Failed to parse alert")
             return JSONResponse(
@@ -83,7 +107,7 @@ async def webhook_endpoint(request: Request) -> JSONResponse:
             )
         
         # Validate signal
-        if not SignalParser.validate(signal):
+        if not FastSignalParser.validate(signal):
             logger.warning("Signal validation failed")
             return JSONResponse(
                 status_code=200,
@@ -136,11 +160,11 @@ async def webhook_v3_endpoint(request: Request) -> JSONResponse:
     Forces V3 strategy detection.
     """
     try:
-        raw_alert = await request.json()
+        raw_alert = decode_alert(await request.body())
         raw_alert['strategy'] = 'V3_COMBINED'  # Force V3
         
         # Reuse main webhook logic
-        request._body = json.dumps(raw_alert).encode()
+        request._body = encode_alert(raw_alert)
         return await webhook_endpoint(request)
         
     except Exception as e:
@@ -158,11 +182,11 @@ async def webhook_v6_endpoint(request: Request) -> JSONResponse:
     Forces V6 strategy detection.
     """
     try:
-        raw_alert = await request.json()
+        raw_alert = decode_alert(await request.body())
         raw_alert['strategy'] = 'V6_PRICE_ACTION'  # Force V6
         
         # Parse and route
-        signal = SignalParser.parse(raw_alert)
+        signal = FastSignalParser.parse(raw_alert)
         if not signal:
             return JSONResponse(
                 status_code=200,
@@ -260,3 +284,22 @@ async def health_check() -> JSONResponse:
             "version": "2.0.0"
         }
     )
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint (unified metrics registry)"""
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/traces/slowest")
+async def slowest_traces(limit: int = 10) -> JSONResponse:
+    """Slowest recent alerts with their span breakdown"""
+    traces = get_tracer().get_slowest(limit=limit)
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "traces": [t.to_dict() for t in traces]}
+    )
@@ -7,24 +7,38 @@ import sys
 import asyncio
 import logging
 from pathlib import Path
+from datetime import date, timedelta
+from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, FileResponse
+from starlette.background import BackgroundTask
 import uvicorn
 
 # Import bot components
 from src.config import Config
 from src.clients.mt5_client import MT5Client
+from src.clients.account_shards import ShardedMT5Client
 from src.managers.risk_manager import RiskManager
 from src.core.trading_engine import TradingEngine
 from src.processors.alert_processor import AlertProcessor
 from src.managers.session_manager import SessionManager
 from src.database import TradeDatabase
+from src.database.trade_export import TradeExporter, ExportRequest
+from src.utils.fast_signal_parser import decode_alert
 from src.telegram.core.multi_bot_manager import MultiBotManager
+from src.telegram.render_cache import get_menu_render_cache
+from src.monitoring.metrics_registry import (
+    get_metrics_registry, webhook_latency_middleware, get_lag_monitor
+)
+from src.monitoring.metrics_collectors import service_api_collector
+from src.monitoring.tracing import get_tracer
+from src.monitoring.profiler import get_profiler
+from src.monitoring.loop_watchdog import get_loop_watchdog
 
 # Setup logging
 logging.basicConfig(
@@ -43,12 +57,14 @@ app = FastAPI(
     description="Automated Trading Bot with V3/V6 Logic, Re-entry, Profit Chains, Telegram Integration",
     version="2.0.0"
 )
+app.middleware("http")(webhook_latency_middleware)
 
 # Global bot components
 config = None
 mt5_client = None
 trading_engine = None
 telegram_manager = None
+loop_lag_monitor = get_lag_monitor()
 
 
 @app.on_event("startup")
@@ -64,6 +80,7 @@ async def startup_event():
         # 1. Load Configuration
         logger.info("Loading configuration...")
         config = Config()
+        get_menu_render_cache().attach(config)  # drop cached menus when settings change
         logger.info("✅ Configuration loaded")
         
         # 2. Initialize MT5 Client
@@ -75,6 +92,12 @@ async def startup_event():
         else:
             logger.warning("⚠️  MT5 connection failed - running in restricted mode")
         
+        # 2b. Mirror orders onto additional accounts (one worker process each)
+        if config.get("accounts", {}).get("workers"):
+            mt5_client = ShardedMT5Client(mt5_client, config)
+            await asyncio.to_thread(mt5_client.start)
+            logger.info(f"✅ Account workers started ({len(mt5_client.shards)} mirrored accounts)")
+        
         # 3. Initialize Database & Session Manager
         logger.info("Initializing database...")
         db = TradeDatabase()
@@ -123,6 +146,16 @@ async def startup_event():
         await telegram_manager.start()
         logger.info("✅ Telegram bots started")
         
+        # 11. Metrics
+        get_metrics_registry().register_collector(
+            "service_api", service_api_collector(trading_engine.service_api)
+        )
+        loop_lag_monitor.start()
+        watchdog = get_loop_watchdog()
+        watchdog.threshold_ms = config.get("loop_watchdog_threshold_ms", watchdog.threshold_ms)
+        watchdog.start()
+        logger.info("✅ Metrics registry ready (/metrics)")
+        
         logger.info("=" * 60)
         logger.info("✅ BOT API READY")
         logger.info("=" * 60)
@@ -137,6 +170,15 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down bot...")
     
+    await get_loop_watchdog().stop()
+    await loop_lag_monitor.stop()
+    
+    if trading_engine and hasattr(trading_engine, 'plugin_registry'):
+        await trading_engine.plugin_registry.shutdown_workers()
+    
+    if trading_engine and getattr(trading_engine, 'state_snapshots', None):
+        await trading_engine.state_snapshots.stop()
+    
     if mt5_client:
         mt5_client.shutdown()
     
@@ -219,11 +261,23 @@ async def webhook(request: Request):
     """
     Webhook endpoint for TradingView alerts
     
-    Receives alerts and routes them to appropriate plugins
+    Receives alerts and routes them to appropriate plugins.
+    The alert trace id is returned in the X-Trace-Id header.
     """
+    with get_tracer().start_trace("webhook", endpoint="/webhook") as trace:
+        response = await _handle_webhook(request)
+        if trace is not None:
+            trace.attributes["http_status"] = response.status_code
+            response.headers["X-Trace-Id"] = trace.trace_id
+        return response
+
+
+async def _handle_webhook(request: Request) -> JSONResponse:
+    """Process one webhook alert inside its trace"""
     try:
         # Get raw alert
-        raw_alert = await request.json()
+        with get_tracer().span("webhook.read_body"):
+            raw_alert = decode_alert(await request.body())
         
         logger.info(f"📨 Webhook received: {raw_alert.get('type', 'unknown')}")
         
@@ -249,6 +303,125 @@ async def webhook(request: Request):
         )
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    Prometheus scrape endpoint
+    
+    Per-stage latency histograms (webhook ack, plugin processing, MT5 calls,
+    DB writes, Telegram sends, event-loop lag) plus collected component stats
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/traces/slowest")
+async def slowest_traces(limit: int = 10, minutes: Optional[float] = None):
+    """Slowest recent alerts with their span breakdown"""
+    traces = get_tracer().get_slowest(limit=limit, since_minutes=minutes)
+    return {"count": len(traces), "traces": [t.to_dict() for t in traces]}
+
+
+@app.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """Full span breakdown for one alert"""
+    trace = get_tracer().get_trace(trace_id)
+    if trace is None:
+        return JSONResponse(status_code=404, content={"status": "error", "message": "trace not found"})
+    return trace.to_dict()
+
+
+@app.post("/profiler/start")
+async def start_profiler(duration: float = 10.0, mode: str = "sample", threshold_ms: float = 100.0):
+    """
+    Start a time-boxed profiling session on the event loop
+    
+    mode: "sample" (stack sampling, collapsed stacks) or "cprofile"
+    """
+    try:
+        session_id = get_profiler().start_timed(
+            duration=duration, mode=mode, block_threshold_ms=threshold_ms
+        )
+    except (RuntimeError, ValueError) as e:
+        return JSONResponse(status_code=409, content={"status": "error", "message": str(e)})
+    return {"status": "started", "session_id": session_id, "duration": duration, "mode": mode}
+
+
+@app.post("/profiler/stop")
+async def stop_profiler():
+    """Stop the running profiling session early"""
+    report = get_profiler().stop()
+    if report is None:
+        return JSONResponse(status_code=404, content={"status": "error", "message": "no active session"})
+    return report.to_dict()
+
+
+@app.get("/profiler/status")
+async def profiler_status():
+    """Profiler session status"""
+    return get_profiler().status()
+
+
+@app.get("/profiler/report")
+async def profiler_report(download: bool = False):
+    """Last profiling report (``download=true`` returns the collapsed-stack / .prof file)"""
+    report = get_profiler().last_report
+    if report is None:
+        return JSONResponse(status_code=404, content={"status": "error", "message": "no report yet"})
+    if download and report.output_path and os.path.exists(report.output_path):
+        return FileResponse(report.output_path, filename=os.path.basename(report.output_path))
+    return report.to_dict()
+
+
+@app.get("/export/trades")
+async def export_trades(
+    kind: str = "trades",
+    format: str = "csv",
+    gzip: bool = False,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    days: Optional[int] = None,
+    plugin: Optional[str] = None
+):
+    """
+    Download closed trades (``kind=trades``) or daily totals (``kind=daily``)
+    
+    format: csv (``gzip=true`` to compress), parquet or arrow. Filter with
+    ``start``/``end`` dates or ``days``, and ``plugin`` (logic/strategy name).
+    """
+    if not trading_engine or not getattr(trading_engine, 'db', None):
+        return JSONResponse(status_code=503, content={"status": "error", "message": "database not ready"})
+    
+    if days is not None and start is None:
+        start = date.today() - timedelta(days=days)
+    request = ExportRequest(kind=kind, fmt=format, compress=gzip, start=start, end=end, plugin=plugin)
+    try:
+        request.validate()
+        result = await TradeExporter.from_connection(trading_engine.db.conn).export_async(request)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"status": "error", "message": str(e)})
+    except ImportError as e:
+        return JSONResponse(status_code=501, content={"status": "error", "message": str(e)})
+    
+    return FileResponse(
+        result.path,
+        filename=result.filename,
+        media_type="application/octet-stream",
+        headers={"X-Export-Rows": str(result.rows)},
+        background=BackgroundTask(result.cleanup)
+    )
+
+
+@app.get("/accounts")
+async def accounts_report():
+    """Per-account balances, positions and risk counters with totals"""
+    if not isinstance(mt5_client, ShardedMT5Client):
+        return JSONResponse(status_code=404, content={"status": "error", "message": "multi-account mode is not enabled"})
+    return await asyncio.to_thread(mt5_client.get_accounts_report)
+
+
 @app.get("/config")
 async def get_config():
     """Get current configuration (sensitive data masked)"""
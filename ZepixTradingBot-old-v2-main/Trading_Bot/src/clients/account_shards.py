@@ -0,0 +1,655 @@
+"""
+Account Shards - Multi-Account Order Fan-Out
+Mirrors the bot's orders onto additional broker accounts, one worker process each
+
+One intake and one plugin-decision layer drive N accounts. The bot's
+own MT5Client stays the primary account (trade tracking, re-entry and
+the database keep working off its tickets); ShardedMT5Client wraps it
+and dispatches every order, close and SL/TP modification to the
+account workers concurrently:
+- Each account worker is a spawned process owning one MT5 session
+  (or an MT5Emulator when ``emulator`` is set, for local testing)
+- Lots are scaled per account (fixed multiplier or balance ratio)
+- Per-account risk (daily drawdown, open positions, max lot) is checked
+  inside the worker before an order is sent
+- Primary tickets map to the mirrored tickets on every account, so
+  closes and modifications follow the primary position; the map is
+  persisted to ``mirrors_path`` and reconciled with open positions on
+  start, so it survives restarts
+
+Configuration (all optional; no ``accounts.workers`` = single account):
+    "accounts": {
+        "call_timeout": 15,
+        "mirrors_path": "data/account_mirrors.json",
+        "workers": [
+            {"account_id": "acc2", "login": 123, "password": "...", "server": "...",
+             "lot_mode": "multiplier", "lot_multiplier": 0.5, "max_lot": 2.0,
+             "daily_loss_limit": 300, "max_open_positions": 10},
+            {"account_id": "sim", "emulator": {"balance": 5000, "seed": 7}}
+        ]
+    }
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import threading
+
+from src.clients.order_pipeline import OrderLeg, OrderBatchResult
+
+logger = logging.getLogger(__name__)
+
+
+# Order-path methods an account worker will execute
+WORKER_METHODS = frozenset((
+    "place_order", "close_position", "modify_position", "get_positions",
+    "get_account_balance", "get_account_info_detailed", "get_current_price",
+    "get_closed_trade_profit", "report",
+))
+
+LOT_STEP = 0.01
+
+DEFAULT_MIRRORS_PATH = "data/account_mirrors.json"
+
+
+class AccountShardError(Exception):
+    """An account worker could not complete a call"""
+
+
+# ==================== Account Spec ====================
+
+@dataclass
+class AccountSpec:
+    """One mirrored broker account"""
+    account_id: str
+    login: int = 0
+    password: str = ""
+    server: str = ""
+    enabled: bool = True
+    lot_mode: str = "multiplier"          # "multiplier" or "balance_ratio"
+    lot_multiplier: float = 1.0
+    min_lot: float = LOT_STEP
+    max_lot: Optional[float] = None
+    daily_loss_limit: Optional[float] = None
+    max_open_positions: Optional[int] = None
+    symbol_mapping: Optional[Dict[str, str]] = None
+    emulator: Optional[Dict[str, Any]] = None
+    config_overrides: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AccountSpec":
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def scale_lot(self, lot_size: float, balance_ratio: float = 1.0) -> float:
+        """Account lot for a primary lot, rounded down to the broker step"""
+        factor = balance_ratio if self.lot_mode == "balance_ratio" else 1.0
+        lot = math.floor(lot_size * self.lot_multiplier * factor / LOT_STEP + 1e-9) * LOT_STEP
+        lot = max(lot, self.min_lot)
+        if self.max_lot is not None:
+            lot = min(lot, self.max_lot)
+        return round(lot, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["password"] = "***" if self.password else ""
+        return data
+
+
+# ==================== Worker Process Side ====================
+
+class AccountRiskGuard:
+    """Per-account pre-trade checks, evaluated inside the account worker"""
+
+    def __init__(self, spec: AccountSpec):
+        self.spec = spec
+        self.day = date.today()
+        self.day_start_balance: Optional[float] = None
+
+    def _roll(self, balance: float):
+        today = date.today()
+        if self.day_start_balance is None or today != self.day:
+            self.day = today
+            self.day_start_balance = balance
+
+    def daily_pnl(self, info: Dict[str, float]) -> float:
+        self._roll(info.get("balance", 0.0))
+        return info.get("equity", info.get("balance", 0.0)) - self.day_start_balance
+
+    def check(self, client, lot_size: float) -> Optional[str]:
+        """Reason the order is blocked, or None"""
+        if not self.spec.enabled:
+            return "account disabled"
+        if self.spec.max_open_positions is not None:
+            if len(client.get_positions()) >= self.spec.max_open_positions:
+                return f"max open positions ({self.spec.max_open_positions}) reached"
+        if self.spec.daily_loss_limit is not None:
+            pnl = self.daily_pnl(client.get_account_info_detailed())
+            if -pnl >= self.spec.daily_loss_limit:
+                return f"daily loss limit ${self.spec.daily_loss_limit:.2f} reached (${-pnl:.2f})"
+        if lot_size <= 0:
+            return "lot size is zero"
+        return None
+
+
+class _AccountSession:
+    """Worker-side account: one MT5Client plus risk and counters"""
+
+    def __init__(self, spec: AccountSpec, base_config: Dict[str, Any]):
+        from src.clients.mt5_client import MT5Client
+
+        self.spec = spec
+        config = dict(base_config)
+        config.update(spec.config_overrides)
+        config.update({"mt5_login": spec.login, "mt5_password": spec.password, "mt5_server": spec.server})
+        if spec.symbol_mapping is not None:
+            config["symbol_mapping"] = spec.symbol_mapping
+
+        self.emulator = None
+        if spec.emulator is not None:
+            from src.simulation.mt5_emulator import MT5Emulator
+            self.emulator = MT5Emulator(**spec.emulator)
+            config.update({
+                "simulate_orders": False,
+                "mt5_login": spec.login or 900001,
+                "mt5_password": spec.password or "emulator",
+                "mt5_server": spec.server or "Emulator-Demo",
+            })
+
+        self.client = MT5Client(config, mt5_module=self.emulator)
+        self.risk = AccountRiskGuard(spec)
+        self.stats = {"orders_placed": 0, "orders_failed": 0, "risk_blocked": 0,
+                      "closes": 0, "modifies": 0}
+        self.last_error: Optional[str] = None
+
+    def initialize(self) -> bool:
+        return self.client.initialize()
+
+    def place_order(self, symbol: str, order_type: str, lot_size: float, price: float,
+                    sl: float, tp: float = None, comment: str = "",
+                    balance_ratio: float = 1.0) -> Dict[str, Any]:
+        lot = self.spec.scale_lot(lot_size, balance_ratio)
+        blocked = self.risk.check(self.client, lot)
+        if blocked:
+            self.stats["risk_blocked"] += 1
+            logger.warning(f"[Account {self.spec.account_id}] Order blocked: {blocked}")
+            return {"ticket": None, "lot_size": lot, "blocked": blocked}
+
+        ticket = self.client.place_order(symbol, order_type, lot, price, sl, tp, comment)
+        if ticket:
+            self.stats["orders_placed"] += 1
+        else:
+            self.stats["orders_failed"] += 1
+            self.last_error = f"order {order_type} {lot} {symbol} failed"
+        return {"ticket": ticket, "lot_size": lot, "blocked": None}
+
+    def close_position(self, ticket: int, percentage: float = 100) -> bool:
+        self.stats["closes"] += 1
+        return self.client.close_position(ticket, percentage)
+
+    def modify_position(self, ticket: int, sl: float = None, tp: float = None) -> bool:
+        self.stats["modifies"] += 1
+        return self.client.modify_position(ticket, sl=sl, tp=tp)
+
+    def report(self) -> Dict[str, Any]:
+        info = self.client.get_account_info_detailed()
+        positions = self.client.get_positions()
+        return {
+            "account_id": self.spec.account_id,
+            "login": self.spec.login,
+            "server": self.spec.server or ("Emulator-Demo" if self.emulator else ""),
+            "enabled": self.spec.enabled,
+            "emulated": self.emulator is not None,
+            "balance": round(info.get("balance", 0.0), 2),
+            "equity": round(info.get("equity", 0.0), 2),
+            "free_margin": round(info.get("free_margin", 0.0), 2),
+            "open_positions": len(positions),
+            "floating_pnl": round(sum(p.get("profit", 0.0) for p in positions), 2),
+            "daily_pnl": round(self.risk.daily_pnl(info), 2),
+            "last_error": self.last_error,
+            **self.stats,
+        }
+
+    def dispatch(self, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        if method.startswith("emulator."):
+            # Test/simulation controls, only for emulated accounts
+            if self.emulator is None:
+                raise AccountShardError(f"{method} requires an emulated account")
+            return getattr(self.emulator, method.split(".", 1)[1])(*args, **kwargs)
+        if method not in WORKER_METHODS:
+            raise AccountShardError(f"method not allowed: {method}")
+        target = getattr(self, method, None) or getattr(self.client, method)
+        return target(*args, **kwargs)
+
+
+def account_worker_main(conn, spec_data: Dict[str, Any], base_config: Dict[str, Any]):
+    """Entry point of an account worker process (serves calls until stop)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(asctime)s [account:{spec_data['account_id']}] %(name)s %(levelname)s %(message)s"
+    )
+    try:
+        session = _AccountSession(AccountSpec.from_dict(spec_data), base_config)
+        connected = session.initialize()
+        conn.send(["ready", 0, connected])
+    except Exception as e:
+        conn.send(["failed", 0, f"{type(e).__name__}: {e}"])
+        return
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        kind, call_id = message[0], message[1]
+        if kind == "stop":
+            break
+        try:
+            result = session.dispatch(message[2], message[3], message[4])
+            conn.send(["result", call_id, True, result])
+        except Exception as e:
+            session.last_error = f"{type(e).__name__}: {e}"
+            conn.send(["result", call_id, False, session.last_error])
+
+    session.client.shutdown()
+
+
+# ==================== Bot Process Side ====================
+
+class AccountShard:
+    """Bot-side handle for one account worker process"""
+
+    def __init__(self, spec: AccountSpec, base_config: Dict[str, Any],
+                 call_timeout: float = 15.0, mp_context: str = "spawn"):
+        self.spec = spec
+        self.account_id = spec.account_id
+        self.base_config = base_config
+        self.call_timeout = call_timeout
+        self._ctx = multiprocessing.get_context(mp_context)
+        self.process = None
+        self.conn = None
+        self.connected = False
+        self.restarts = 0
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._send_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        """Spawn the worker and wait for its MT5 session"""
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        self.process = self._ctx.Process(
+            target=account_worker_main,
+            args=(child_conn, asdict(self.spec), self.base_config),
+            name=f"account-{self.account_id}", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+        # MT5 login can retry for a while; allow several call timeouts
+        if not self.conn.poll(self.call_timeout * 4):
+            self.stop()
+            raise AccountShardError(f"account {self.account_id} did not start")
+        kind, _, payload = self.conn.recv()
+        if kind != "ready":
+            self.process.join(5)
+            raise AccountShardError(f"account {self.account_id} failed to start: {payload}")
+        self.connected = bool(payload)
+        threading.Thread(target=self._read_loop, args=(self.conn, self.process), daemon=True,
+                         name=f"AccountShard-{self.account_id}").start()
+        logger.info(f"[AccountShards] {self.account_id} running in pid {self.process.pid} "
+                    f"(connected={self.connected})")
+
+    def ensure_running(self):
+        """Restart a worker that has exited (positions stay on the broker)"""
+        with self._start_lock:
+            if self.is_alive():
+                return
+            logger.warning(f"[AccountShards] {self.account_id} worker is down, restarting")
+            self.restarts += 1
+            self.start()
+
+    def stop(self, timeout: float = 5.0):
+        if self.is_alive():
+            try:
+                with self._send_lock:
+                    self.conn.send(["stop", 0])
+            except (OSError, ValueError):
+                pass
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout)
+        if self.conn is not None:
+            self.conn.close()
+        self._fail_pending("worker stopped")
+
+    def call(self, method: str, *args, **kwargs) -> Future:
+        """Send a call to the worker; the returned Future resolves with its result"""
+        future: Future = Future()
+        try:
+            self.ensure_running()
+            call_id = next(self._ids)
+            self._pending[call_id] = future
+            with self._send_lock:
+                self.conn.send(["call", call_id, method, list(args), kwargs])
+        except Exception as e:
+            future.set_exception(AccountShardError(f"{self.account_id}: {e}"))
+        return future
+
+    def call_sync(self, method: str, *args, **kwargs) -> Any:
+        return self.call(method, *args, **kwargs).result(self.call_timeout)
+
+    def _read_loop(self, conn, process):
+        while True:
+            try:
+                kind, call_id, ok, value = conn.recv()
+            except (EOFError, OSError):
+                break
+            future = self._pending.pop(call_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(AccountShardError(f"{self.account_id}: {value}"))
+        if process is self.process:
+            self._fail_pending(f"worker exited (code {process.exitcode})")
+
+    def _fail_pending(self, reason: str):
+        for call_id in list(self._pending):
+            future = self._pending.pop(call_id, None)
+            if future is not None and not future.done():
+                future.set_exception(AccountShardError(f"{self.account_id}: {reason}"))
+
+
+class ShardedMT5Client:
+    """
+    MT5Client facade that mirrors order operations onto account workers.
+
+    Everything not overridden here is served by the primary client, so the
+    rest of the bot keeps seeing one account. Worker calls are issued
+    before the primary call and collected after it, so fan-out adds the
+    slowest account's latency rather than the sum of all of them.
+    """
+
+    def __init__(self, primary, config, accounts: Optional[List[AccountSpec]] = None,
+                 call_timeout: Optional[float] = None, mp_context: str = "spawn",
+                 mirrors_path: Optional[str] = None):
+        accounts_config = config.get("accounts", {}) or {}
+        if accounts is None:
+            accounts = [AccountSpec.from_dict(a) for a in accounts_config.get("workers", [])]
+        self.primary = primary
+        self.call_timeout = call_timeout or accounts_config.get("call_timeout", 15.0)
+        self.mirrors_path = mirrors_path or accounts_config.get("mirrors_path", DEFAULT_MIRRORS_PATH)
+
+        # Workers start from the bot config without the primary credentials
+        base_config = dict(getattr(config, "config", config))
+        for key in ("mt5_login", "mt5_password", "mt5_server", "accounts"):
+            base_config.pop(key, None)
+        self.shards: Dict[str, AccountShard] = {
+            spec.account_id: AccountShard(spec, base_config, self.call_timeout, mp_context)
+            for spec in accounts
+        }
+        # primary ticket -> {account_id: mirrored ticket}
+        self.mirrors: Dict[int, Dict[str, int]] = {}
+        self._uses_balance_ratio = any(s.lot_mode == "balance_ratio" for s in accounts)
+        self._account_balances: Dict[str, float] = {}
+
+    _OWN_ATTRIBUTES = frozenset((
+        "primary", "call_timeout", "mirrors_path", "shards", "mirrors", "_uses_balance_ratio",
+        "_account_balances",
+    ))
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    def __setattr__(self, name: str, value: Any):
+        # e.g. ``mt5_client.telegram_bot = ...`` must reach the primary client
+        if name in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.primary, name, value)
+
+    # -------------------- Lifecycle --------------------
+
+    def start(self):
+        """Start every account worker (failures are logged, not raised) and restore the mirror map"""
+        for shard in self.shards.values():
+            try:
+                shard.start()
+            except AccountShardError as e:
+                logger.error(f"[AccountShards] {e}")
+        self.load_mirrors()
+        if self.mirrors:
+            self.reconcile_mirrors()
+        if self._uses_balance_ratio:
+            self.refresh_balances()
+
+    def shutdown(self):
+        for shard in self.shards.values():
+            shard.stop()
+        self.primary.shutdown()
+
+    def refresh_balances(self):
+        """Cache account balances used by balance-ratio lot scaling"""
+        futures = {aid: shard.call("get_account_balance") for aid, shard in self.shards.items()}
+        for account_id, future in futures.items():
+            try:
+                self._account_balances[account_id] = future.result(self.call_timeout)
+            except (AccountShardError, FutureTimeout) as e:
+                logger.warning(f"[AccountShards] Balance refresh failed for {account_id}: {e}")
+
+    # -------------------- Mirror Map --------------------
+
+    def load_mirrors(self):
+        """Read the persisted primary -> mirrored ticket map"""
+        try:
+            with open(self.mirrors_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"[AccountShards] Could not read {self.mirrors_path}: {e}")
+            return
+        self.mirrors = {
+            int(ticket): {aid: int(t) for aid, t in mirrored.items()}
+            for ticket, mirrored in data.get("mirrors", {}).items()
+        }
+        logger.info(f"[AccountShards] Restored {len(self.mirrors)} mirrored tickets")
+
+    def save_mirrors(self):
+        """Persist the mirror map atomically (called whenever it changes)"""
+        tmp_path = self.mirrors_path + ".tmp"
+        try:
+            directory = os.path.dirname(self.mirrors_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"mirrors": self.mirrors, "updated_at": datetime.now().isoformat()}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.mirrors_path)
+        except OSError as e:
+            logger.error(f"[AccountShards] Could not save mirror map: {e}")
+
+    def reconcile_mirrors(self):
+        """
+        Drop entries whose positions closed while the bot was down.
+
+        An empty position list is also what MT5Client returns on errors, so
+        only a non-empty list is trusted to prune against.
+        """
+        open_primary = {p["ticket"] for p in self.primary.get_positions()}
+        futures = {aid: shard.call("get_positions") for aid, shard in self.shards.items()}
+        open_mirrors = {
+            aid: {p["ticket"] for p in positions}
+            for aid, positions in self._gather(futures, "get_positions").items() if positions
+        }
+
+        before = len(self.mirrors)
+        for ticket in list(self.mirrors):
+            mirrored = {aid: t for aid, t in self.mirrors[ticket].items()
+                        if aid not in open_mirrors or t in open_mirrors[aid]}
+            if open_primary and ticket not in open_primary:
+                if mirrored:
+                    logger.warning(
+                        f"[AccountShards] Primary #{ticket} closed while offline; "
+                        f"mirrored positions may still be open: {mirrored}"
+                    )
+                del self.mirrors[ticket]
+            elif mirrored:
+                self.mirrors[ticket] = mirrored
+            else:
+                del self.mirrors[ticket]
+        if len(self.mirrors) != before:
+            logger.info(f"[AccountShards] Reconciled mirror map: {before} -> {len(self.mirrors)} tickets")
+        self.save_mirrors()
+
+    # -------------------- Order Fan-Out --------------------
+
+    def _gather(self, futures: Dict[str, Future], operation: str) -> Dict[str, Any]:
+        results = {}
+        for account_id, future in futures.items():
+            try:
+                results[account_id] = future.result(self.call_timeout)
+            except (AccountShardError, FutureTimeout) as e:
+                logger.error(f"[AccountShards] {operation} failed on {account_id}: {e or 'timeout'}")
+                results[account_id] = None
+        return results
+
+    def _issue_mirrors(self, symbol: str, order_type: str, lot_size: float, price: float,
+                       sl: float, tp: float, comment: str,
+                       primary_balance: Optional[float]) -> Dict[str, Future]:
+        futures = {}
+        for account_id, shard in self.shards.items():
+            if not shard.spec.enabled:
+                continue
+            ratio = 1.0
+            if primary_balance and self._account_balances.get(account_id):
+                ratio = self._account_balances[account_id] / primary_balance
+            futures[account_id] = shard.call("place_order", symbol, order_type, lot_size, price,
+                                             sl, tp, comment, balance_ratio=ratio)
+        return futures
+
+    def _settle_mirrors(self, ticket: Optional[int], futures: Dict[str, Future]):
+        results = self._gather(futures, "place_order")
+        placed = {aid: r["ticket"] for aid, r in results.items() if r and r.get("ticket")}
+
+        if not ticket:
+            # Don't leave mirrored positions the bot is not tracking
+            if placed:
+                logger.warning(f"[AccountShards] Primary order failed, closing {len(placed)} mirrored orders")
+                self._gather({aid: self.shards[aid].call("close_position", t) for aid, t in placed.items()},
+                             "rollback")
+            return
+
+        self.mirrors[ticket] = placed
+        self.save_mirrors()
+        if len(placed) < len(futures):
+            missing = sorted(set(futures) - set(placed))
+            logger.warning(f"[AccountShards] Ticket #{ticket} not mirrored on: {missing}")
+
+    def place_order(self, symbol: str, order_type: str, lot_size: float,
+                    price: float, sl: float, tp: float = None,
+                    comment: str = "") -> Optional[int]:
+        """Place on the primary and every enabled account; returns the primary ticket"""
+        primary_balance = None
+        if self._uses_balance_ratio:
+            primary_balance = self.primary.get_account_balance() or None
+
+        futures = self._issue_mirrors(symbol, order_type, lot_size, price, sl, tp, comment,
+                                      primary_balance)
+        ticket = self.primary.place_order(symbol, order_type, lot_size, price, sl, tp, comment)
+        self._settle_mirrors(ticket, futures)
+        return ticket
+
+    def place_order_batch(self, legs: List[OrderLeg], atomic: bool = True) -> OrderBatchResult:
+        """Batch on the primary; each leg is mirrored like a single order"""
+        primary_balance = None
+        if self._uses_balance_ratio:
+            primary_balance = self.primary.get_account_balance() or None
+
+        leg_futures = [
+            self._issue_mirrors(leg.symbol, leg.order_type, leg.lot_size, 0.0, leg.sl, leg.tp,
+                                leg.comment, primary_balance)
+            for leg in legs
+        ]
+        result = self.primary.place_order_batch(legs, atomic=atomic)
+        for ticket, futures in zip(result.tickets, leg_futures):
+            self._settle_mirrors(ticket, futures)
+        return result
+
+    def close_position(self, position_id: int, percentage: float = 100):
+        mirrored = self.mirrors.get(position_id, {})
+        futures = {aid: self.shards[aid].call("close_position", t, percentage)
+                   for aid, t in mirrored.items() if aid in self.shards}
+        result = self.primary.close_position(position_id, percentage)
+        closed = self._gather(futures, "close_position")
+        if result:
+            still_open = {aid: mirrored[aid] for aid, ok in closed.items() if not ok}
+            if still_open:
+                self.mirrors[position_id] = still_open
+            else:
+                self.mirrors.pop(position_id, None)
+            if mirrored:
+                self.save_mirrors()
+        return result
+
+    def modify_position(self, ticket: int, sl: float = None, tp: float = None) -> bool:
+        futures = {aid: self.shards[aid].call("modify_position", t, sl=sl, tp=tp)
+                   for aid, t in self.mirrors.get(ticket, {}).items() if aid in self.shards}
+        result = self.primary.modify_position(ticket, sl=sl, tp=tp)
+        self._gather(futures, "modify_position")
+        return result
+
+    # -------------------- Reporting --------------------
+
+    def get_accounts_report(self) -> Dict[str, Any]:
+        """Per-account figures plus totals across all accounts"""
+        futures = {aid: shard.call("report") for aid, shard in self.shards.items()}
+
+        info = self.primary.get_account_info_detailed()
+        positions = self.primary.get_positions()
+        accounts = [{
+            "account_id": "primary",
+            "login": self.primary.config.get("mt5_login", 0),
+            "server": self.primary.config.get("mt5_server", ""),
+            "enabled": True,
+            "balance": round(info.get("balance", 0.0), 2),
+            "equity": round(info.get("equity", 0.0), 2),
+            "free_margin": round(info.get("free_margin", 0.0), 2),
+            "open_positions": len(positions),
+            "floating_pnl": round(sum(p.get("profit", 0.0) for p in positions), 2),
+        }]
+        for account_id, report in self._gather(futures, "report").items():
+            shard = self.shards[account_id]
+            if report is None:
+                report = {"account_id": account_id, "enabled": shard.spec.enabled}
+            report.update({"alive": shard.is_alive(), "restarts": shard.restarts})
+            accounts.append(report)
+
+        totals = {key: round(sum(a.get(key, 0.0) for a in accounts), 2)
+                  for key in ("balance", "equity", "floating_pnl")}
+        totals["open_positions"] = sum(a.get("open_positions", 0) for a in accounts)
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "accounts": accounts,
+            "totals": totals,
+            "mirrored_tickets": len(self.mirrors),
+        }
@@ -2,10 +2,13 @@
 Menu Callback Handler
 Handles all menu navigation callbacks for Telegram bot
 Separated for modularity and easier maintenance
+Routes are compiled once into a CallbackDispatchTable (exact dict + prefix trie)
 """
 
 import logging
 
+from src.telegram.core.dispatch_table import CallbackDispatchTable
+
 logger = logging.getLogger(__name__)
 
 class MenuCallbackHandler:
@@ -15,7 +18,76 @@ class MenuCallbackHandler:
         self.bot = telegram_bot
         self.menu_manager = telegram_bot.menu_manager
         self.fine_tune_handler = None
+        self._menu_dispatch = self._build_menu_dispatch()
     
+    def _build_menu_dispatch(self) -> CallbackDispatchTable:
+        """
+        Compile the menu routes once. Exact keys are checked before
+        prefixes and the longest matching prefix wins (so "toggle_level_"
+        beats "toggle_" and "tf_help_menu" beats "tf_help_").
+        Every target is called as target(callback_data, user_id, message_id).
+        """
+        table = CallbackDispatchTable("menu_callback_handler")
+        exact = {
+            # Main menu
+            "menu_main": self._show_main_menu,
+            # Fine-Tune menu - Special handling (two variants)
+            "menu_fine_tune": self._route_fine_tune_menu,
+            "fine_tune_menu": self._route_fine_tune_menu,
+            "menu_reentry": lambda data, uid, mid: self._handle_reentry_menu(uid, mid),
+            "menu_profit": lambda data, uid, mid: self._handle_profit_booking_menu(uid, mid),
+            # Profit booking toggles (FIX: these were incorrectly going to reentry handler)
+            "toggle_profit_sl_hunt": self._handle_profit_booking_toggle,
+            "toggle_profit_protection": self._handle_profit_booking_toggle,
+            # Voice and Clock action handlers
+            "action_voice_test": self._route_voice_test,
+            "action_clock": self._route_clock,
+            # Timeframe menu action handlers
+            "action_toggle_timeframe": lambda data, uid, mid: self._handle_timeframe_toggle(uid, mid),
+            "action_view_logic_settings": lambda data, uid, mid: self._handle_view_logic_settings(uid, mid),
+            "action_reset_timeframe_default": lambda data, uid, mid: self._handle_reset_timeframe(uid, mid),
+            # Timeframe configure/help menus
+            "tf_configure_menu": lambda data, uid, mid: self._handle_tf_configure_menu(uid, mid),
+            "tf_help_menu": lambda data, uid, mid: self._handle_tf_help_menu(uid, mid),
+            # Profit levels menu
+            "profit_levels_menu": self._route_profit_levels_menu,
+            # Recovery windows editing
+            "ft_recovery_windows_edit": self._handle_recovery_windows,
+            # Re-entry status / advanced settings
+            "reentry_view_status": lambda data, uid, mid: self._handle_reentry_status(uid, mid),
+            "reentry_advanced": lambda data, uid, mid: self._handle_reentry_advanced(uid, mid),
+        }
+        prefixes = {
+            # Individual logic configuration
+            "tf_config_logic": self._route_tf_logic_config,
+            # Parameter adjustment menus
+            "tf_adj_": self._route_tf_adjustment_menu,
+            # Set parameter value
+            "tf_set_": self._handle_tf_set_parameter,
+            # Help content pages
+            "tf_help_": self._route_tf_help_content,
+            # Detailed example scenarios
+            "tf_ex_": self._route_tf_example_scenario,
+            # Profit level toggles (longer than the generic toggle_ prefix)
+            "toggle_level_": self._route_toggle_level,
+            # Re-entry toggles
+            "toggle_": self._handle_reentry_toggle,
+            # Profit SL mode selector
+            "profit_sl_mode_": self._handle_profit_sl_mode,
+            "rw_": self._handle_recovery_windows,
+            # Advanced settings parameter editors
+            "adv_": self._handle_advanced_settings_callback,
+            # Parameter value setters
+            "set_": self._handle_parameter_setter,
+            # All other category menus
+            "menu_": self._route_category_menu,
+        }
+        for key, target in exact.items():
+            table.add_exact(key, target)
+        for prefix, target in prefixes.items():
+            table.add_prefix(prefix, target)
+        return table
+
     def handle_menu_callback(self, callback_data, user_id, message_id):
         """
         Handle menu navigation callbacks
@@ -28,133 +100,71 @@ class MenuCallbackHandler:
         Returns:
             True if handled, False if not a menu callback
         """
-        # Main menu
-        if callback_data == "menu_main":
-            self.menu_manager.show_main_menu(user_id, message_id)
-            return True
-        
-        # Fine-Tune menu - Special handling (two variants)
-        elif callback_data == "menu_fine_tune" or callback_data == "fine_tune_menu":
-            return self._handle_fine_tune_menu(user_id, message_id)
-        
-        # Re-entry menu - New handler
-        elif callback_data == "menu_reentry":
-            return self._handle_reentry_menu(user_id, message_id)
-        
-        # Profit booking menu - New handler
-        elif callback_data == "menu_profit":
-            return self._handle_profit_booking_menu(user_id, message_id)
-        
-        # Profit booking toggles (FIX: these were incorrectly going to reentry handler)
-        elif callback_data in ["toggle_profit_sl_hunt", "toggle_profit_protection"]:
-            return self._handle_profit_booking_toggle(callback_data, user_id, message_id)
-        
-        # Voice and Clock action handlers
-        elif callback_data == "action_voice_test":
-            self.bot.handle_voice_test_command(message=None) # Pass None as message since it's a callback
-            return True
-        elif callback_data == "action_clock":
-            self.bot.handle_clock_command(message=None)
-            return True
-            
-        # Timeframe menu action handlers  
-        elif callback_data == "action_toggle_timeframe":
-            return self._handle_timeframe_toggle(user_id, message_id)
-        elif callback_data == "action_view_logic_settings":
-            return self._handle_view_logic_settings(user_id, message_id)
-        elif callback_data == "action_reset_timeframe_default":
-            return self._handle_reset_timeframe(user_id, message_id)
-        
-        # NEW: Timeframe configure/help menus
-        elif callback_data == "tf_configure_menu":
-            return self._handle_tf_configure_menu(user_id, message_id)
-        elif callback_data == "tf_help_menu":
-            return self._handle_tf_help_menu(user_id, message_id)
-        
-        # NEW: Individual logic configuration
-        elif callback_data.startswith("tf_config_logic"):
-            logic_name = callback_data.replace("tf_config_", "").upper()
-            return self._handle_tf_logic_config(user_id, message_id, logic_name)
-        
-        # NEW: Parameter adjustment menus
-        elif callback_data.startswith("tf_adj_"):
-            parts = callback_data.split("_")
-            param_type = parts[2]  # lot, sl, or window
-            logic_name = parts[3]  # combinedlogic-1/2/3
-            return self._handle_tf_adjustment_menu(user_id, message_id, logic_name, param_type)
-        
-        # NEW: Set parameter value
-        elif callback_data.startswith("tf_set_"):
-            return self._handle_tf_set_parameter(callback_data, user_id, message_id)
-        
-        # NEW: Help content pages
-        elif callback_data.startswith("tf_help_"):
-            help_type = callback_data.replace("tf_help_", "")
-            if help_type != "menu":
-                return self._handle_tf_help_content(user_id, message_id, help_type)
-        
-        # NEW: Detailed example scenarios
-        elif callback_data.startswith("tf_ex_"):
-            scenario = callback_data.replace("tf_ex_", "")
-            return self._handle_tf_example_scenario(user_id, message_id, scenario)
-        
-        
-        # Profit levels menu and toggles (CHECK BEFORE generic toggle_)
-        elif callback_data == "profit_levels_menu":
-            if hasattr(self.bot, 'profit_booking_menu_handler') and self.bot.profit_booking_menu_handler:
-                self.bot.profit_booking_menu_handler.show_levels_menu(user_id, message_id)
-            return True
-        elif callback_data.startswith("toggle_level_"):
-            if hasattr(self.bot, 'profit_booking_menu_handler') and self.bot.profit_booking_menu_handler:
-                level = callback_data.split("_")[-1]  # Extract level number
-                self.bot.profit_booking_menu_handler.toggle_level(level, user_id, message_id)
-            return True
-        
-        # Re-entry toggles (MUST be after toggle_level_ check)
-        elif callback_data.startswith("toggle_"):
-            return self._handle_reentry_toggle(callback_data, user_id, message_id)
-        
-        # Profit SL mode selector
-        elif callback_data.startswith("profit_sl_mode_"):
-            return self._handle_profit_sl_mode(callback_data, user_id, message_id)
-        
-        # Recovery windows editing
-        elif callback_data.startswith("rw_") or callback_data == "ft_recovery_windows_edit":
-            return self._handle_recovery_windows(callback_data, user_id, message_id)
-        
-        # Re-entry status view
-        elif callback_data == "reentry_view_status":
-            return self._handle_reentry_status(user_id, message_id)
-        
-        # Re-entry advanced settings
-        elif callback_data == "reentry_advanced":
-            return self._handle_reentry_advanced(user_id, message_id)
-        
-        # Advanced settings parameter editors
-        elif callback_data.startswith("adv_"):
-            return self._handle_advanced_settings_callback(callback_data, user_id, message_id)
-        
-        # Parameter value setters
-        elif callback_data.startswith("set_"):
-            return self._handle_parameter_setter(callback_data, user_id, message_id)
-        
-        # All other category menus
-        elif callback_data.startswith("menu_"):
-            category = callback_data.replace("menu_", "")
-            
-            # Special handler for timeframe menu
-            if category  == "timeframe":
-                if hasattr(self.menu_manager, 'show_timeframe_menu'):
-                    self.menu_manager.show_timeframe_menu(user_id, message_id)
-                else:
-                    print("WARNING: show_timeframe_menu not found", flush=True)
-                return True
-            
-            # Generic category handler
-            self.menu_manager.show_category_menu(user_id, category, message_id)
+        target = self._menu_dispatch.resolve(callback_data)
+        if target is None:
+            return False
+        return bool(target(callback_data, user_id, message_id))
+
+    # -------------------- Inline Routes --------------------
+
+    def _show_main_menu(self, callback_data, user_id, message_id):
+        self.menu_manager.show_main_menu(user_id, message_id)
+        return True
+
+    def _route_fine_tune_menu(self, callback_data, user_id, message_id):
+        return self._handle_fine_tune_menu(user_id, message_id)
+
+    def _route_voice_test(self, callback_data, user_id, message_id):
+        self.bot.handle_voice_test_command(message=None) # Pass None as message since it's a callback
+        return True
+
+    def _route_clock(self, callback_data, user_id, message_id):
+        self.bot.handle_clock_command(message=None)
+        return True
+
+    def _route_tf_logic_config(self, callback_data, user_id, message_id):
+        logic_name = callback_data.replace("tf_config_", "").upper()
+        return self._handle_tf_logic_config(user_id, message_id, logic_name)
+
+    def _route_tf_adjustment_menu(self, callback_data, user_id, message_id):
+        parts = callback_data.split("_")
+        param_type = parts[2]  # lot, sl, or window
+        logic_name = parts[3]  # combinedlogic-1/2/3
+        return self._handle_tf_adjustment_menu(user_id, message_id, logic_name, param_type)
+
+    def _route_tf_help_content(self, callback_data, user_id, message_id):
+        help_type = callback_data.replace("tf_help_", "")
+        return self._handle_tf_help_content(user_id, message_id, help_type)
+
+    def _route_tf_example_scenario(self, callback_data, user_id, message_id):
+        scenario = callback_data.replace("tf_ex_", "")
+        return self._handle_tf_example_scenario(user_id, message_id, scenario)
+
+    def _route_profit_levels_menu(self, callback_data, user_id, message_id):
+        if hasattr(self.bot, 'profit_booking_menu_handler') and self.bot.profit_booking_menu_handler:
+            self.bot.profit_booking_menu_handler.show_levels_menu(user_id, message_id)
+        return True
+
+    def _route_toggle_level(self, callback_data, user_id, message_id):
+        if hasattr(self.bot, 'profit_booking_menu_handler') and self.bot.profit_booking_menu_handler:
+            level = callback_data.split("_")[-1]  # Extract level number
+            self.bot.profit_booking_menu_handler.toggle_level(level, user_id, message_id)
+        return True
+
+    def _route_category_menu(self, callback_data, user_id, message_id):
+        category = callback_data.replace("menu_", "")
+        
+        # Special handler for timeframe menu
+        if category  == "timeframe":
+            if hasattr(self.menu_manager, 'show_timeframe_menu'):
+                self.menu_manager.show_timeframe_menu(user_id, message_id)
+            else:
+                print("WARNING: show_timeframe_menu not found", flush=True)
             return True
         
-        return False
+        # Generic category handler
+        self.menu_manager.show_category_menu(user_id, category, message_id)
+        return True
 
     
     def _handle_fine_tune_menu(self, user_id, message_id=None):
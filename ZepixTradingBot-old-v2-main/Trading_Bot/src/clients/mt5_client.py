@@ -11,13 +11,36 @@ from typing import Dict, Any, Optional, List
 from src.config import Config
 from src.models import Trade
 from src.utils.optimized_logger import logger as opt_logger
+from src.monitoring.metrics_registry import InstrumentedMT5
+from src.monitoring.tracing import traced
+from src.clients.order_pipeline import OrderSubmissionPipeline, OrderLeg, OrderBatchResult
 
 logger = logging.getLogger(__name__)
 
 class MT5Client:
-    def __init__(self, config: Config):
+    # Capability flag checked by callers before using place_order_batch()
+    supports_order_batch = True
+
+    def __init__(self, config: Config, mt5_module=None):
+        """
+        Args:
+            config: Bot configuration
+            mt5_module: Optional object exposing the MetaTrader5 API
+                (e.g. ``src.simulation.mt5_emulator.MT5Emulator``). Defaults to
+                the real MetaTrader5 package when it is installed.
+        """
         self.config = config
         self.initialized = False
+        # MetaTrader5 API provider (real terminal or in-process emulator)
+        if mt5_module is not None:
+            self.mt5 = mt5_module
+            self.mt5_available = True
+        else:
+            self.mt5 = mt5 if MT5_AVAILABLE else None
+            self.mt5_available = MT5_AVAILABLE
+        # Time every terminal call into zepix_mt5_call_seconds{method}
+        if self.mt5 is not None:
+            self.mt5 = InstrumentedMT5(self.mt5)
         # Load symbol mapping from config for broker compatibility
         self.symbol_mapping = config.get("symbol_mapping", {})
         # Cache for symbol mappings to avoid repeated lookups and debug logs
@@ -53,14 +76,14 @@ class MT5Client:
 
     def initialize(self) -> bool:
         """Initialize MT5 connection with retry logic"""
-        if not MT5_AVAILABLE:
+        if not self.mt5_available:
             print("WARNING: Running in simulation mode (MT5 not available on this platform)")
             self.initialized = True
             return True
             
         for i in range(self.config["mt5_retries"]):
             try:
-                if not mt5.initialize():
+                if not self.mt5.initialize():
                     print(f"MT5 initialization failed, retry {i+1}/{self.config['mt5_retries']}")
                     time.sleep(self.config["mt5_wait"])
                     continue
@@ -75,18 +98,18 @@ class MT5Client:
                     time.sleep(self.config["mt5_wait"])
                     continue
                 
-                authorized = mt5.login(login, password, server)
+                authorized = self.mt5.login(login, password, server)
                 
                 if authorized:
                     self.initialized = True
                     print("SUCCESS: MT5 connection established")
-                    account_info = mt5.account_info()
+                    account_info = self.mt5.account_info()
                     if account_info:
                         print(f"Account Balance: ${account_info.balance:.2f}")
                         print(f"Account: {account_info.login} | Server: {account_info.server}")
                     return True
                 else:
-                    error = mt5.last_error()
+                    error = self.mt5.last_error()
                     print(f"MT5 login failed, retry {i+1}/{self.config['mt5_retries']}")
                     print(f"ERROR: MT5 login error: {error}")
                     time.sleep(self.config["mt5_wait"])
@@ -116,12 +139,12 @@ class MT5Client:
         Returns True if connection is healthy, False otherwise
         """
         # Skip health check in simulation mode
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", False):
+        if not self.mt5_available or self.config.get("simulate_orders", False):
             return True
         
         try:
             # Check if MT5 is still initialized
-            if not mt5.initialize():
+            if not self.mt5.initialize():
                 self.connection_errors += 1
                 opt_logger.error(f"MT5 connection lost - attempt #{self.connection_errors}")
                 
@@ -150,9 +173,11 @@ class MT5Client:
 
     def validate_order_parameters(self, symbol: str, order_type: str, 
                                   price: float, sl_price: float, 
-                                  tp_price: Optional[float] = None) -> tuple:
+                                  tp_price: Optional[float] = None,
+                                  symbol_info=None) -> tuple:
         """
         Validate order parameters against MT5 broker constraints
+        Pass ``symbol_info`` to validate against an already fetched snapshot.
         Returns: (is_valid: bool, error_message: str)
         """
         # Debug logging at start
@@ -162,7 +187,7 @@ class MT5Client:
         )
         
         # Skip validation in simulation mode
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             logger.info("VALIDATION: Skipped (simulation mode)")
             return True, "Validation passed (simulation mode)"
         
@@ -173,7 +198,8 @@ class MT5Client:
         
         try:
             # Get symbol info from MT5
-            symbol_info = mt5.symbol_info(mt5_symbol)
+            if symbol_info is None:
+                symbol_info = self.mt5.symbol_info(mt5_symbol)
             if symbol_info is None:
                 error_msg = f"Symbol {mt5_symbol} not found in MT5"
                 logger.error(f"VALIDATION FAILED: {error_msg}")
@@ -201,7 +227,7 @@ class MT5Client:
             )
             
             # Determine order direction
-            if order_type == "buy" or order_type == mt5.ORDER_TYPE_BUY:
+            if order_type == "buy" or order_type == self.mt5.ORDER_TYPE_BUY:
                 # BUY order: SL should be below entry, TP above entry
                 if sl_price >= price:
                     error_msg = f"BUY order SL {sl_price} must be below entry {price}"
@@ -229,7 +255,7 @@ class MT5Client:
                         logger.error(f"VALIDATION FAILED: {error_msg}")
                         return False, error_msg
                     
-            elif order_type == "sell" or order_type == mt5.ORDER_TYPE_SELL:
+            elif order_type == "sell" or order_type == self.mt5.ORDER_TYPE_SELL:
                 # SELL order: SL should be above entry, TP below entry
                 if sl_price <= price:
                     error_msg = f"SELL order SL {sl_price} must be above entry {price}"
@@ -267,6 +293,7 @@ class MT5Client:
             logger.error(f"VALIDATION EXCEPTION TRACEBACK: {traceback.format_exc()}")
             return False, error_msg
 
+    @traced("mt5.place_order")
     def place_order(self, symbol: str, order_type: str, lot_size: float, 
                    price: float, sl: float, tp: float = None, 
                    comment: str = "") -> Optional[int]:
@@ -279,7 +306,7 @@ class MT5Client:
                 return None
         
         # Simulation mode
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             import random
             simulated_ticket = random.randint(100000, 999999)
             print(f"SIMULATED ORDER: {order_type.upper()} {lot_size} lots {symbol} @ {price}, SL={sl}, TP={tp} (Ticket #{simulated_ticket})")
@@ -290,24 +317,24 @@ class MT5Client:
         
         try:
             # Get symbol info using the mapped broker symbol
-            symbol_info = mt5.symbol_info(mt5_symbol)
+            symbol_info = self.mt5.symbol_info(mt5_symbol)
             if symbol_info is None:
                 print(f"ERROR: Symbol {mt5_symbol} not found in MT5")
                 return None
                 
             if not symbol_info.visible:
                 print(f"Symbol {mt5_symbol} is not visible, attempting to enable")
-                if not mt5.symbol_select(mt5_symbol, True):
+                if not self.mt5.symbol_select(mt5_symbol, True):
                     print(f"ERROR: Failed to enable symbol {mt5_symbol}")
                     return None
             
             # Determine order type and get current price
             if order_type == "buy":
-                order_type_mt5 = mt5.ORDER_TYPE_BUY
-                price = mt5.symbol_info_tick(mt5_symbol).ask
+                order_type_mt5 = self.mt5.ORDER_TYPE_BUY
+                price = self.mt5.symbol_info_tick(mt5_symbol).ask
             else:
-                order_type_mt5 = mt5.ORDER_TYPE_SELL
-                price = mt5.symbol_info_tick(mt5_symbol).bid
+                order_type_mt5 = self.mt5.ORDER_TYPE_SELL
+                price = self.mt5.symbol_info_tick(mt5_symbol).bid
             
             # Round prices to symbol's digit precision
             digits = symbol_info.digits
@@ -325,7 +352,7 @@ class MT5Client:
             
             # Prepare order request with mapped symbol
             request = {
-                "action": mt5.TRADE_ACTION_DEAL,
+                "action": self.mt5.TRADE_ACTION_DEAL,
                 "symbol": mt5_symbol,  # Use broker's symbol name
                 "volume": lot_size,
                 "type": order_type_mt5,
@@ -334,8 +361,8 @@ class MT5Client:
                 "deviation": 20,
                 "magic": 234000,
                 "comment": comment,
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
+                "type_time": self.mt5.ORDER_TIME_GTC,
+                "type_filling": self.mt5.ORDER_FILLING_IOC,
             }
             
             # Add TP if provided
@@ -343,9 +370,9 @@ class MT5Client:
                 request["tp"] = tp
             
             # Send order to MT5
-            result = mt5.order_send(request)
+            result = self.mt5.order_send(request)
             
-            if result.retcode != mt5.TRADE_RETCODE_DONE:
+            if result.retcode != self.mt5.TRADE_RETCODE_DONE:
                 print(f"ERROR: Order failed: {result.comment} (Error code: {result.retcode})")
                 print(f"Request details: Symbol={mt5_symbol}, Lot={lot_size}, Price={price}, SL={sl}, TP={tp}")
                 return None
@@ -359,6 +386,16 @@ class MT5Client:
             traceback.print_exc()
             return None
 
+    @traced("mt5.place_order_batch")
+    def place_order_batch(self, legs: List[OrderLeg], atomic: bool = True) -> OrderBatchResult:
+        """
+        Place several orders from one symbol/tick snapshot and margin check,
+        submitted back-to-back. With ``atomic`` a failed leg closes the
+        legs that already filled (see src.clients.order_pipeline).
+        """
+        return OrderSubmissionPipeline(self).submit(legs, atomic=atomic)
+
+    @traced("mt5.close_position")
     def close_position(self, position_id: int, percentage: float = 100):
         """Close a position completely"""
         if not self.initialized:
@@ -366,17 +403,17 @@ class MT5Client:
                 return False
         
         # Simulation mode - always return success
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             print(f"SIMULATED CLOSE: Position #{position_id}")
             return True
         
         try:
             # Get position by ticket
-            positions = mt5.positions_get(ticket=position_id)
+            positions = self.mt5.positions_get(ticket=position_id)
             
             # Check if it's an API error vs position not found
             if positions is None:
-                error = mt5.last_error()
+                error = self.mt5.last_error()
                 print(f"ERROR: MT5 API error when getting position {position_id}: {error}")
                 return False  # API error - don't mark as closed
             
@@ -387,17 +424,17 @@ class MT5Client:
             position = positions[0]
             
             # Prepare close request
-            symbol_info = mt5.symbol_info(position.symbol)
+            symbol_info = self.mt5.symbol_info(position.symbol)
             
-            if position.type == mt5.ORDER_TYPE_BUY:
-                order_type = mt5.ORDER_TYPE_SELL
-                price = mt5.symbol_info_tick(position.symbol).bid
+            if position.type == self.mt5.ORDER_TYPE_BUY:
+                order_type = self.mt5.ORDER_TYPE_SELL
+                price = self.mt5.symbol_info_tick(position.symbol).bid
             else:
-                order_type = mt5.ORDER_TYPE_BUY
-                price = mt5.symbol_info_tick(position.symbol).ask
+                order_type = self.mt5.ORDER_TYPE_BUY
+                price = self.mt5.symbol_info_tick(position.symbol).ask
             
             request = {
-                "action": mt5.TRADE_ACTION_DEAL,
+                "action": self.mt5.TRADE_ACTION_DEAL,
                 "position": position_id,
                 "symbol": position.symbol,
                 "volume": position.volume,
@@ -406,13 +443,13 @@ class MT5Client:
                 "deviation": 20,
                 "magic": 234000,
                 "comment": f"Close_{percentage}%",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
+                "type_time": self.mt5.ORDER_TIME_GTC,
+                "type_filling": self.mt5.ORDER_FILLING_IOC,
             }
             
-            result = mt5.order_send(request)
+            result = self.mt5.order_send(request)
             
-            if result.retcode == mt5.TRADE_RETCODE_DONE:
+            if result.retcode == self.mt5.TRADE_RETCODE_DONE:
                 print(f"SUCCESS: Position {position_id} closed successfully")
                 return True
             else:
@@ -434,7 +471,7 @@ class MT5Client:
                 return None
         
         # Simulation mode - return dummy prices
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             dummy_prices = {
                 "XAUUSD": 2650.0, "GOLD": 2650.0,
                 "EURUSD": 1.0850, "GBPUSD": 1.2650,
@@ -446,7 +483,7 @@ class MT5Client:
         mt5_symbol = self._map_symbol(symbol)
         
         try:
-            tick = mt5.symbol_info_tick(mt5_symbol)
+            tick = self.mt5.symbol_info_tick(mt5_symbol)
             if tick:
                 return (tick.ask + tick.bid) / 2
             return None
@@ -460,11 +497,11 @@ class MT5Client:
                 return 0.0
         
         # Simulation mode - return dummy balance
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             return 10000.0
         
         try:
-            account_info = mt5.account_info()
+            account_info = self.mt5.account_info()
             if account_info:
                 return account_info.balance
             return 0.0
@@ -481,7 +518,7 @@ class MT5Client:
                 return []
         
         # Simulation mode - return empty list
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             return []
         
         try:
@@ -490,9 +527,9 @@ class MT5Client:
             
             # Get positions from MT5
             if mt5_symbol:
-                positions = mt5.positions_get(symbol=mt5_symbol)
+                positions = self.mt5.positions_get(symbol=mt5_symbol)
             else:
-                positions = mt5.positions_get()
+                positions = self.mt5.positions_get()
             
             if positions is None:
                 return []
@@ -528,11 +565,11 @@ class MT5Client:
                 return None
         
         # Simulation mode - return None
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             return None
         
         try:
-            positions = mt5.positions_get(ticket=ticket)
+            positions = self.mt5.positions_get(ticket=ticket)
             
             if positions is None or len(positions) == 0:
                 return None
@@ -561,7 +598,7 @@ class MT5Client:
                 return {}
         
         # Simulation mode - return dummy values
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             return {
                 "balance": 10000.0,
                 "equity": 10000.0,
@@ -571,7 +608,7 @@ class MT5Client:
             }
         
         try:
-            account_info = mt5.account_info()
+            account_info = self.mt5.account_info()
             if account_info:
                 return {
                     "balance": account_info.balance,
@@ -601,6 +638,7 @@ class MT5Client:
         info = self.get_account_info_detailed()
         return info.get("margin_level", 0.0)
 
+    @traced("mt5.modify_position")
     def modify_position(self, ticket: int, sl: float = None, tp: float = None) -> bool:
         """
         Modify Stop Loss and Take Profit for an existing position
@@ -610,14 +648,14 @@ class MT5Client:
                 return False
         
         # Simulation mode
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             print(f"SIMULATED MODIFY: Ticket {ticket} -> SL={sl}, TP={tp}")
             return True
             
         try:
             # Prepare request
             request = {
-                "action": mt5.TRADE_ACTION_SLTP,
+                "action": self.mt5.TRADE_ACTION_SLTP,
                 "position": ticket,
                 "symbol": self.get_position(ticket)['symbol'], # Helper get_position needed or use existing
                 "sl": sl,
@@ -633,8 +671,8 @@ class MT5Client:
             
             request["symbol"] = pos_info["symbol"]
             
-            result = mt5.order_send(request)
-            if result.retcode == mt5.TRADE_RETCODE_DONE:
+            result = self.mt5.order_send(request)
+            if result.retcode == self.mt5.TRADE_RETCODE_DONE:
                 logger.info(f"SUCCESS: Position {ticket} modified. SL={sl}, TP={tp}")
                 return True
             else:
@@ -655,7 +693,7 @@ class MT5Client:
                 return 0.0
         
         # Simulation mode
-        if not MT5_AVAILABLE or self.config.get("simulate_orders", True):
+        if not self.mt5_available or self.config.get("simulate_orders", True):
             # Dummy calculation
             return lot_size * 100 * 10  # Rough estimate
         
@@ -664,13 +702,13 @@ class MT5Client:
             mt5_symbol = self._map_symbol(symbol)
             
             # Get symbol info to get pip value and leverage
-            symbol_info = mt5.symbol_info(mt5_symbol)
+            symbol_info = self.mt5.symbol_info(mt5_symbol)
             if not symbol_info:
                 print(f"WARNING: Could not get symbol info for {mt5_symbol}")
                 return 0.0
             
             # Get account leverage
-            account_info = mt5.account_info()
+            account_info = self.mt5.account_info()
             if not account_info:
                 return 0.0
             
@@ -678,7 +716,7 @@ class MT5Client:
             
             # Approximate required margin per lot based on pip value
             # This is a simplified calculation - actual margin may vary
-            tick = mt5.symbol_info_tick(mt5_symbol)
+            tick = self.mt5.symbol_info_tick(mt5_symbol)
             if tick:
                 pip_value = symbol_info.point * 10  # 1 pip in currency value per 1 lot
                 required_margin = (pip_value * lot_size * 100) / leverage  # Rough estimate
@@ -708,8 +746,8 @@ class MT5Client:
 
     def shutdown(self):
         """Shutdown MT5 connection gracefully"""
-        if self.initialized:
-            mt5.shutdown()
+        if self.initialized and self.mt5_available:
+            self.mt5.shutdown()
             self.initialized = False
             print("MT5 connection closed")
 
@@ -724,14 +762,14 @@ class MT5Client:
         Returns:
             Actual profit/loss in account currency (e.g., USD), or None if not found
         """
-        if not self.initialized or not MT5_AVAILABLE:
+        if not self.initialized or not self.mt5_available:
             logger.warning(f"Cannot fetch profit for ticket {ticket_id}: MT5 not initialized")
             return None
         
         try:
             # Request trade history for this specific position
             # We need to look in deals (not positions, since it's closed)
-            deals = mt5.history_deals_get(position=ticket_id)
+            deals = self.mt5.history_deals_get(position=ticket_id)
             
             if not deals:
                 logger.warning(f"No history found for ticket {ticket_id}")
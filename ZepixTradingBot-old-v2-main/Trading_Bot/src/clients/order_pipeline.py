@@ -0,0 +1,314 @@
+"""
+Order Pipeline - Batched Multi-Leg Order Submission
+Prepares every leg from one symbol snapshot and submits them back-to-back
+
+The dual-order paths (V3 hybrid SL, V6 5M dual) used to call
+``MT5Client.place_order`` once per leg; each call repeated symbol lookup,
+tick fetch and validation, so Order B was sent a full round of terminal
+calls after Order A filled. The pipeline splits submission into:
+- prepare: one symbol_info / tick snapshot per symbol, each leg validated
+  against it, one margin check for the combined volume - nothing is sent
+  if any leg is invalid
+- submit: the prepared ``order_send`` requests back-to-back, with no
+  terminal calls or logging between them
+- rollback: if a leg fails in an atomic batch, legs that already filled
+  are closed again so no half-built dual order is left on the account
+
+Per-leg submit-to-fill latency is exported as
+``zepix_order_leg_submit_seconds`` and the first-to-last submission gap
+as ``zepix_order_leg_gap_seconds``.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+import random
+import time
+import logging
+
+from src.monitoring.metrics_registry import ORDER_LEG_LATENCY, ORDER_LEG_GAP
+
+logger = logging.getLogger(__name__)
+
+
+class OrderPipelineError(Exception):
+    """A batch could not be prepared (nothing was sent)"""
+
+
+# ==================== Batch Model ====================
+
+@dataclass
+class OrderLeg:
+    """One order of a batch"""
+    name: str
+    symbol: str
+    order_type: str
+    lot_size: float
+    sl: float
+    tp: Optional[float] = None
+    comment: str = ""
+
+
+@dataclass
+class LegResult:
+    """Outcome of one leg"""
+    name: str
+    ticket: Optional[int] = None
+    price: Optional[float] = None
+    retcode: Optional[int] = None
+    error: Optional[str] = None
+    submit_ms: float = 0.0
+    rolled_back: bool = False
+
+    @property
+    def filled(self) -> bool:
+        return self.ticket is not None and not self.rolled_back
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "ticket": self.ticket,
+            "price": self.price,
+            "retcode": self.retcode,
+            "error": self.error,
+            "submit_ms": round(self.submit_ms, 2),
+            "rolled_back": self.rolled_back,
+        }
+
+
+@dataclass
+class OrderBatchResult:
+    """Outcome of a whole batch"""
+    legs: List[LegResult] = field(default_factory=list)
+    success: bool = False
+    error: Optional[str] = None
+    prepare_ms: float = 0.0
+    gap_ms: float = 0.0
+
+    @property
+    def tickets(self) -> Tuple[Optional[int], ...]:
+        """Open ticket per leg, in leg order (None for failed or rolled-back legs)"""
+        return tuple(leg.ticket if leg.filled else None for leg in self.legs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "error": self.error,
+            "prepare_ms": round(self.prepare_ms, 2),
+            "gap_ms": round(self.gap_ms, 2),
+            "legs": [leg.to_dict() for leg in self.legs],
+        }
+
+
+def supports_order_batch(client) -> bool:
+    """True when ``client`` implements ``place_order_batch`` (mocks and older clients do not)"""
+    return getattr(client, "supports_order_batch", False) is True
+
+
+# ==================== Pipeline ====================
+
+class OrderSubmissionPipeline:
+    """
+    Prepare-then-submit order batches on an ``MT5Client``.
+
+    Usage:
+        result = OrderSubmissionPipeline(mt5_client).submit([
+            OrderLeg("A", "XAUUSD", "buy", 0.05, sl=2028.0, tp=2035.0, comment="V3_A"),
+            OrderLeg("B", "XAUUSD", "buy", 0.05, sl=2029.5, tp=2032.0, comment="V3_B"),
+        ])
+        ticket_a, ticket_b = result.tickets
+    """
+
+    def __init__(self, client, deviation: int = 20, magic: int = 234000):
+        self.client = client
+        self.deviation = deviation
+        self.magic = magic
+
+    def submit(self, legs: List[OrderLeg], atomic: bool = True) -> OrderBatchResult:
+        """
+        Args:
+            legs: Orders to place, submitted in list order
+            atomic: Close filled legs again if any leg fails
+        """
+        batch = OrderBatchResult(legs=[LegResult(leg.name) for leg in legs])
+        if not legs:
+            batch.success = True
+            return batch
+
+        client = self.client
+        if not client.initialized and not client.initialize():
+            batch.error = "MT5 not initialized"
+            return batch
+
+        # Simulation mode (mirrors MT5Client.place_order)
+        if not client.mt5_available or client.config.get("simulate_orders", True):
+            for leg, result in zip(legs, batch.legs):
+                result.ticket = random.randint(100000, 999999)
+                logger.info(
+                    f"SIMULATED ORDER: {leg.order_type.upper()} {leg.lot_size} lots {leg.symbol}, "
+                    f"SL={leg.sl}, TP={leg.tp} (Ticket #{result.ticket})"
+                )
+            batch.success = True
+            return batch
+
+        start = time.perf_counter()
+        try:
+            requests = self._prepare(legs, batch.legs)
+        except Exception as e:
+            batch.prepare_ms = (time.perf_counter() - start) * 1000
+            batch.error = str(e)
+            logger.error(f"[OrderPipeline] Batch not sent: {e}")
+            return batch
+        batch.prepare_ms = (time.perf_counter() - start) * 1000
+
+        self._send(requests, batch, atomic)
+        self._finish(legs, batch, atomic)
+        return batch
+
+    # -------------------- Prepare --------------------
+
+    def _prepare(self, legs: List[OrderLeg], results: List[LegResult]) -> List[Dict[str, Any]]:
+        """Build every ``order_send`` request from one snapshot per symbol"""
+        mt5 = self.client.mt5
+        calc_margin = getattr(mt5, "order_calc_margin", None)
+        snapshots: Dict[str, Tuple[Any, Any]] = {}
+        margin_required = 0.0
+        requests = []
+
+        for leg, result in zip(legs, results):
+            mt5_symbol = self.client._map_symbol(leg.symbol)
+            snapshot = snapshots.get(mt5_symbol)
+            if snapshot is None:
+                symbol_info = mt5.symbol_info(mt5_symbol)
+                if symbol_info is None:
+                    raise OrderPipelineError(f"Symbol {mt5_symbol} not found in MT5")
+                if not symbol_info.visible and not mt5.symbol_select(mt5_symbol, True):
+                    raise OrderPipelineError(f"Failed to enable symbol {mt5_symbol}")
+                tick = mt5.symbol_info_tick(mt5_symbol)
+                if tick is None:
+                    raise OrderPipelineError(f"No tick for {mt5_symbol}")
+                snapshot = snapshots[mt5_symbol] = (symbol_info, tick)
+            symbol_info, tick = snapshot
+
+            order_type = leg.order_type.lower()
+            if order_type == "buy":
+                order_type_mt5 = mt5.ORDER_TYPE_BUY
+                price = tick.ask
+            else:
+                order_type_mt5 = mt5.ORDER_TYPE_SELL
+                price = tick.bid
+
+            digits = symbol_info.digits
+            price = round(price, digits)
+            sl = round(leg.sl, digits)
+            tp = round(leg.tp, digits) if leg.tp else None
+
+            is_valid, error_msg = self.client.validate_order_parameters(
+                leg.symbol, order_type, price, sl, tp, symbol_info=symbol_info
+            )
+            if not is_valid:
+                result.error = error_msg
+                raise OrderPipelineError(f"Leg {leg.name} invalid: {error_msg}")
+
+            if calc_margin is not None:
+                margin = calc_margin(order_type_mt5, mt5_symbol, leg.lot_size, price)
+                if margin:
+                    margin_required += margin
+
+            request = {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "symbol": mt5_symbol,
+                "volume": leg.lot_size,
+                "type": order_type_mt5,
+                "price": price,
+                "sl": sl,
+                "deviation": self.deviation,
+                "magic": self.magic,
+                "comment": leg.comment,
+                "type_time": mt5.ORDER_TIME_GTC,
+                "type_filling": mt5.ORDER_FILLING_IOC,
+            }
+            if tp:
+                request["tp"] = tp
+            result.price = price
+            requests.append(request)
+
+        if margin_required:
+            account_info = mt5.account_info()
+            if account_info is not None and margin_required > account_info.margin_free:
+                raise OrderPipelineError(
+                    f"Insufficient margin for batch: need {margin_required:.2f}, "
+                    f"free {account_info.margin_free:.2f}"
+                )
+        return requests
+
+    # -------------------- Submit --------------------
+
+    def _send(self, requests: List[Dict[str, Any]], batch: OrderBatchResult, atomic: bool):
+        """Fire the prepared requests back-to-back; bookkeeping waits until after"""
+        mt5 = self.client.mt5
+        first_sent = last_sent = None
+
+        for request, result in zip(requests, batch.legs):
+            sent = time.perf_counter()
+            if first_sent is None:
+                first_sent = sent
+            last_sent = sent
+            try:
+                response = mt5.order_send(request)
+            except Exception as e:
+                response = None
+                result.error = str(e)
+            result.submit_ms = (time.perf_counter() - sent) * 1000
+
+            if response is not None:
+                result.retcode = response.retcode
+                if response.retcode == mt5.TRADE_RETCODE_DONE:
+                    result.ticket = response.order
+                    result.price = getattr(response, "price", None) or result.price
+                else:
+                    result.error = response.comment
+            if result.ticket is None and atomic:
+                break
+
+        batch.gap_ms = (last_sent - first_sent) * 1000
+
+    def _finish(self, legs: List[OrderLeg], batch: OrderBatchResult, atomic: bool):
+        for result in batch.legs:
+            if result.retcode is None and result.error is None:
+                result.error = "Not submitted"
+            elif result.submit_ms:
+                status = "filled" if result.ticket is not None else "failed"
+                ORDER_LEG_LATENCY.labels(leg=result.name, status=status).observe(result.submit_ms / 1000)
+        if len(legs) > 1:
+            ORDER_LEG_GAP.observe(batch.gap_ms / 1000)
+
+        failed = [r for r in batch.legs if r.ticket is None]
+        if not failed:
+            batch.success = True
+            logger.info(
+                f"[OrderPipeline] {len(legs)} legs filled | prepare={batch.prepare_ms:.1f}ms "
+                f"gap={batch.gap_ms:.1f}ms | "
+                + " ".join(f"{r.name}=#{r.ticket} ({r.submit_ms:.1f}ms)" for r in batch.legs)
+            )
+            return
+
+        batch.error = f"Leg {failed[0].name} failed: {failed[0].error}"
+        logger.error(f"[OrderPipeline] {batch.error}")
+        if atomic:
+            self._rollback(batch)
+
+    def _rollback(self, batch: OrderBatchResult):
+        """Close the legs of a failed atomic batch that did fill"""
+        for result in batch.legs:
+            if result.ticket is None:
+                continue
+            if self.client.close_position(result.ticket):
+                result.rolled_back = True
+                logger.warning(f"[OrderPipeline] Rolled back leg {result.name} (#{result.ticket})")
+            else:
+                logger.critical(
+                    f"[OrderPipeline] Rollback of leg {result.name} (#{result.ticket}) failed - "
+                    f"position left open"
+                )
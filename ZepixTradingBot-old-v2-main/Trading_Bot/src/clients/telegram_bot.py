@@ -16,6 +16,8 @@ from src.clients.menu_callback_handler import MenuCallbackHandler
 from src.menu.fine_tune_menu_handler import FineTuneMenuHandler
 from src.menu.menu_constants import REPLY_MENU_MAP
 from src.menu.menu_manager import MenuManager
+from src.telegram.render_cache import serialize_markup
+from src.database.trade_export import TradeExporter, ExportRequest
 
 if TYPE_CHECKING:
     from src.core.trading_engine import TradingEngine
@@ -64,6 +66,7 @@ class TelegramBot:
             "/performance_report": self.handle_performance,
             "/pair_report": self.handle_pair_report,
             "/strategy_report": self.handle_strategy_report,
+            "/export_trades": self.handle_export_trades,
             # Trend commands
             "/set_trend": self.handle_set_trend,
             "/set_auto": self.handle_set_auto,
@@ -669,7 +672,7 @@ class TelegramBot:
             payload = {
                 "chat_id": self.chat_id,
                 "text": message,
-                "reply_markup": reply_markup,
+                "reply_markup": serialize_markup(reply_markup),
                 "parse_mode": "HTML"  # Use HTML to support <b> tags
             }
             response = requests.post(url, json=payload, timeout=2)
@@ -815,7 +818,7 @@ class TelegramBot:
                 "parse_mode": parse_mode
             }
             if reply_markup:
-                payload["reply_markup"] = reply_markup
+                payload["reply_markup"] = serialize_markup(reply_markup)
             
             response = requests.post(url, json=payload, timeout=2)
             if response.status_code == 200:
@@ -1361,11 +1364,6 @@ class TelegramBot:
             self.send_message("❌ Session manager not initialized.")
             return
             
-        # Update stats first if active
-        active_id = self.trading_engine.session_manager.get_active_session()
-        if active_id == session_id:
-            self.trading_engine.session_manager.update_session()
-            
         report = self.trading_engine.session_manager.get_session_report(session_id)
         if not report:
             self.send_message(f"❌ Session not found: {session_id}")
@@ -1517,6 +1515,51 @@ class TelegramBot:
         
         self.send_message(msg)
 
+    def handle_export_trades(self, message):
+        """Handle /export_trades [days] [csv|csv.gz|parquet|daily] [plugin]"""
+        self._ensure_dependencies()
+        if not getattr(self, 'db', None):
+            self.send_message("❌ Bot still initializing. Please wait a moment.")
+            return
+        
+        days, kind, fmt, compress, plugin = 30, "trades", "csv", False, None
+        for part in message.get('text', '').split()[1:]:
+            lowered = part.lower()
+            if lowered.isdigit():
+                days = int(lowered)
+            elif lowered == "daily":
+                kind = "daily"
+            elif lowered in ("csv", "parquet", "arrow"):
+                fmt = lowered
+            elif lowered in ("gz", "csv.gz", "gzip"):
+                fmt, compress = "csv", True
+            else:
+                plugin = part
+        
+        request = ExportRequest.last_days(days, kind=kind, fmt=fmt, compress=compress, plugin=plugin)
+        # Build and upload off the polling thread so other commands stay responsive
+        threading.Thread(target=self.send_export, args=(request,), daemon=True,
+                         name="TradeExport").start()
+        self.send_message(f"⏳ Preparing <b>{request.filename}</b>...")
+
+    def send_export(self, request: "ExportRequest") -> bool:
+        """Stream an export to a temp file, upload it with sendDocument, then delete it"""
+        try:
+            result = TradeExporter.from_connection(self.db.conn).export(request)
+        except (ValueError, ImportError) as e:
+            self.send_message(f"❌ Export failed: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Trade export failed: {e}")
+            self.send_message("❌ Export failed, see logs for details")
+            return False
+        
+        try:
+            caption = f"📤 {result.filename}: {result.rows} rows"
+            return self.send_document(result.path, filename=result.filename, caption=caption)
+        finally:
+            result.cleanup()
+
     def handle_strategy_report(self, message):
         """Show performance breakdown by strategy logic"""
         self._ensure_dependencies()
@@ -3889,9 +3932,9 @@ class TelegramBot:
             
             # Get PnL data with safe fallbacks
             try:
-                if all([self.risk_manager, self.trading_engine, self.mt5_client, self.pip_calculator]):
+                if all([self.risk_manager, self.trading_engine, self.mt5_client]):
                     live_pnl_data = self.risk_manager.get_live_open_trades_pnl(
-                        self.trading_engine, self.mt5_client, self.pip_calculator
+                        self.trading_engine, self.mt5_client
                     )
                 else:
                     print("DEBUG: Missing dependencies for live PnL calculation")
@@ -3951,6 +3994,9 @@ class TelegramBot:
                 print(f"DEBUG: Error checking re-entry: {e}")
                 reentry_status = '🔴 OFF'
             
+            unpriced = live_pnl_data.get('unpriced_symbols') or []
+            unpriced_text = f"\n• ⚠️ Not in PnL (no pip value): {', '.join(unpriced)}" if unpriced else ""
+            
             # Format dashboard text (HTML)
             dashboard_text = f"""🤖 <b>ZEPIX TRADING BOT DASHBOARD</b>
 
@@ -3961,7 +4007,7 @@ class TelegramBot:
 • Bot: {'🟢 RUNNING' if trading_enabled else '🔴 PAUSED'}
 • Balance: ${account_balance:.2f}
 • Open Trades: {len(live_pnl_data.get('trade_details', []))}
-• Live PnL: {live_pnl_text}
+• Live PnL: {live_pnl_text}{unpriced_text}
 
 <b>💰 TODAY'S PERFORMANCE</b>
 
@@ -4918,8 +4964,8 @@ _Use /dashboard to return to main view_"""
             
             # Get live PnL data
             live_pnl_data = self.risk_manager.get_live_open_trades_pnl(
-                self.trading_engine, self.mt5_client, self.pip_calculator
-            ) if all([self.risk_manager, self.trading_engine, self.mt5_client, self.pip_calculator]) else {'trade_details': []}
+                self.trading_engine, self.mt5_client
+            ) if all([self.risk_manager, self.trading_engine, self.mt5_client]) else {'trade_details': []}
             
             text = "📈 <b>OPEN TRADES</b>\n═══════════════\n\n"
             keyboard = []
@@ -5488,9 +5534,10 @@ _Use /dashboard to return to main view_"""
 /simulation_mode - 🧪 Toggle simulation mode
 /signal_status - 📡 Signal processing status
 
-<b>📚 CATEGORY 12: REPORTS & INFO (6 commands)</b>
+<b>📚 CATEGORY 12: REPORTS & INFO (7 commands)</b>
 /pair_report - 📊 Currency pair report
 /strategy_report - 📈 Strategy analysis
+/export_trades - 📤 Export trade history (CSV/Parquet)
 /lot_size_status - 📊 Lot size status
 /set_lot_size - ⚙️ Set lot size
 /view_risk_caps - 🔒 View risk caps
@@ -3829,9 +3829,9 @@ class TelegramBot:
             
             # Get PnL data with safe fallbacks
             try:
-                if all([self.risk_manager, self.trading_engine, self.mt5_client, self.pip_calculator]):
+                if all([self.risk_manager, self.trading_engine, self.mt5_client]):
                     live_pnl_data = self.risk_manager.get_live_open_trades_pnl(
-                        self.trading_engine, self.mt5_client, self.pip_calculator
+                        self.trading_engine, self.mt5_client
                     )
                 else:
                     print("DEBUG: Missing dependencies for live PnL calculation")
@@ -3891,6 +3891,9 @@ class TelegramBot:
                 print(f"DEBUG: Error checking re-entry: {e}")
                 reentry_status = '🔴 OFF'
             
+            unpriced = live_pnl_data.get('unpriced_symbols') or []
+            unpriced_text = f"\n• ⚠️ Not in PnL (no pip value): {', '.join(unpriced)}" if unpriced else ""
+            
             # Format dashboard text (HTML)
             dashboard_text = f"""🤖 <b>ZEPIX TRADING BOT DASHBOARD</b>
 
@@ -3901,7 +3904,7 @@ class TelegramBot:
 • Bot: {'🟢 RUNNING' if trading_enabled else '🔴 PAUSED'}
 • Balance: ${account_balance:.2f}
 • Open Trades: {len(live_pnl_data.get('trade_details', []))}
-• Live PnL: {live_pnl_text}
+• Live PnL: {live_pnl_text}{unpriced_text}
 
 <b>💰 TODAY'S PERFORMANCE</b>
 
@@ -4862,8 +4865,8 @@ _Use /dashboard to return to main view_"""
             
             # Get live PnL data
             live_pnl_data = self.risk_manager.get_live_open_trades_pnl(
-                self.trading_engine, self.mt5_client, self.pip_calculator
-            ) if all([self.risk_manager, self.trading_engine, self.mt5_client, self.pip_calculator]) else {'trade_details': []}
+                self.trading_engine, self.mt5_client
+            ) if all([self.risk_manager, self.trading_engine, self.mt5_client]) else {'trade_details': []}
             
             text = "📈 <b>OPEN TRADES</b>\n═══════════════\n\n"
             keyboard = []
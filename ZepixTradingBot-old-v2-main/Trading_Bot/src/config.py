@@ -1,6 +1,7 @@
 import json
 import os
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Callable, List
 
 def safe_int_from_env(env_var: str, default: int = 0) -> int:
     """Safely parse integer from environment variable with normalization"""
@@ -118,6 +119,7 @@ class Config:
                 }
             }
         }
+        self._observers: List[Callable] = []  # notified of update()/update_nested() changes
         self.load_config()
 
     def load_config(self):
@@ -202,8 +204,10 @@ class Config:
         return self.config.get(key, default)
     
     def update(self, key, value):
+        old_value = self.config.get(key)
         self.config[key] = value
         self.save_config()
+        self._notify(key, old_value, value)
     
     def update_nested(self, path: str, value):
         """
@@ -223,7 +227,30 @@ class Config:
             current = current[key]
         
         # Set the final value
+        old_value = current.get(keys[-1])
         current[keys[-1]] = value
+        self._notify(path, old_value, value)
+    
+    def register_observer(self, callback: Callable):
+        """Call ``callback(changes)`` with ConfigChange objects on every update (as ConfigManager does)"""
+        if callback not in self._observers:
+            self._observers.append(callback)
+    
+    def unregister_observer(self, callback: Callable):
+        if callback in self._observers:
+            self._observers.remove(callback)
+    
+    def _notify(self, key: str, old_value, new_value):
+        if not self._observers:
+            return
+        from src.core.config_manager import ConfigChange, ConfigChangeType
+        change_type = ConfigChangeType.ADDED if old_value is None else ConfigChangeType.MODIFIED
+        changes = [ConfigChange(key, change_type, old_value, new_value, datetime.now())]
+        for callback in list(self._observers):
+            try:
+                callback(changes)
+            except Exception as e:
+                print(f"WARNING: Config observer failed: {e}")
     
     def save(self):
         """Alias for save_config() for compatibility"""
@@ -698,10 +698,14 @@ def create_config_manager(
         enable_watching: Whether to enable file watching
         
     Returns:
-        ConfigManager instance
+        ConfigManager instance (with the shared menu render cache attached)
     """
-    return ConfigManager(
+    from src.telegram.render_cache import get_menu_render_cache
+    
+    manager = ConfigManager(
         config_path=config_path,
         plugin_config_dir=plugin_config_dir,
         enable_watching=enable_watching
     )
+    get_menu_render_cache().attach(manager)
+    return manager
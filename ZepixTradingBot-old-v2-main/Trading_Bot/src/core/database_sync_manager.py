@@ -22,6 +22,10 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.database.connection_manager import get_connection_manager
+from src.monitoring.metrics_registry import get_metrics_registry
+from src.monitoring.metrics_collectors import sync_health_collector
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,6 +120,9 @@ class DatabaseSyncManager:
             "price_action_15m": "trades",
             "price_action_1h": "trades"
         }
+        
+        # Sync statistics on /metrics
+        get_metrics_registry().register_collector("database_sync", sync_health_collector(self))
     
     async def start(self):
         """Start automatic sync scheduler."""
@@ -315,68 +322,64 @@ class DatabaseSyncManager:
             if not os.path.exists(self.central_db_path):
                 self._create_central_db()
             
-            plugin_db = sqlite3.connect(plugin_db_path)
-            central_db = sqlite3.connect(self.central_db_path)
+            manager = get_connection_manager()
+            plugin_db = manager.database(plugin_db_path)
+            central_db = manager.database(self.central_db_path)
             
-            plugin_db.row_factory = sqlite3.Row
+            def _read_new_records() -> List[Dict]:
+                with central_db.reader() as central_conn:
+                    last_synced_id = self._get_last_synced_id(central_conn, plugin_id)
+                with plugin_db.reader(sqlite3.Row) as plugin_conn:
+                    return self._fetch_new_records(plugin_conn, plugin_id, last_synced_id)
             
-            try:
-                last_synced_id = self._get_last_synced_id(central_db, plugin_id)
-                
-                new_records = self._fetch_new_records(
-                    plugin_db,
-                    plugin_id,
-                    last_synced_id
-                )
-                
-                if len(new_records) == 0:
-                    duration = (datetime.now() - start_time).total_seconds() * 1000
-                    
-                    result = SyncResult(
-                        plugin_id=plugin_id,
-                        status=SyncStatus.SKIPPED,
-                        records_synced=0,
-                        error_message=None,
-                        duration_ms=int(duration),
-                        timestamp=datetime.now()
-                    )
-                    
-                    self._add_to_history(result)
-                    return result
-                
-                self._insert_to_central(central_db, plugin_id, new_records)
-                
-                central_db.commit()
-                
+            def _write_to_central(records: List[Dict]):
+                with central_db.writer() as central_conn:
+                    self._insert_to_central(central_conn, plugin_id, records)
+            
+            new_records = await plugin_db.arun(_read_new_records)
+            
+            if len(new_records) == 0:
                 duration = (datetime.now() - start_time).total_seconds() * 1000
                 
-                self.stats["total_syncs"] += 1
-                self.stats["total_success"] += 1
-                self.stats["total_records_synced"] += len(new_records)
-                
-                self.last_sync_time[plugin_id] = datetime.now()
-                
-                logger.info(
-                    f"Synced {len(new_records)} records for {plugin_id} "
-                    f"in {int(duration)}ms"
-                )
-                
                 result = SyncResult(
                     plugin_id=plugin_id,
-                    status=SyncStatus.SUCCESS,
-                    records_synced=len(new_records),
+                    status=SyncStatus.SKIPPED,
+                    records_synced=0,
                     error_message=None,
                     duration_ms=int(duration),
                     timestamp=datetime.now()
                 )
                 
                 self._add_to_history(result)
-                
                 return result
-                
-            finally:
-                plugin_db.close()
-                central_db.close()
+            
+            await central_db.arun(_write_to_central, new_records)
+            
+            duration = (datetime.now() - start_time).total_seconds() * 1000
+            
+            self.stats["total_syncs"] += 1
+            self.stats["total_success"] += 1
+            self.stats["total_records_synced"] += len(new_records)
+            
+            self.last_sync_time[plugin_id] = datetime.now()
+            
+            logger.info(
+                f"Synced {len(new_records)} records for {plugin_id} "
+                f"in {int(duration)}ms"
+            )
+            
+            result = SyncResult(
+                plugin_id=plugin_id,
+                status=SyncStatus.SUCCESS,
+                records_synced=len(new_records),
+                error_message=None,
+                duration_ms=int(duration),
+                timestamp=datetime.now()
+            )
+            
+            self._add_to_history(result)
+            
+            return result
                 
         except Exception as e:
             self.stats["total_syncs"] += 1
@@ -388,7 +391,13 @@ class DatabaseSyncManager:
         import os
         os.makedirs(os.path.dirname(self.central_db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.central_db_path)
+        with get_connection_manager().database(self.central_db_path).writer() as conn:
+            self._create_central_schema(conn)
+        
+        logger.info(f"Created central database: {self.central_db_path}")
+    
+    def _create_central_schema(self, conn):
+        """Create the aggregated_trades and sync_status tables."""
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -426,11 +435,6 @@ class DatabaseSyncManager:
                 sync_count INTEGER DEFAULT 0
             )
         """)
-        
-        conn.commit()
-        conn.close()
-        
-        logger.info(f"Created central database: {self.central_db_path}")
     
     def _get_last_synced_id(self, central_db, plugin_id: str) -> int:
         """Get the last synced record ID for this plugin."""
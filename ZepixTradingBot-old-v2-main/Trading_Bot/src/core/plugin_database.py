@@ -6,7 +6,7 @@ Provides isolated database access for each plugin with connection pooling.
 
 Features:
 - Per-plugin database isolation (V3 and V6 cannot access each other's data)
-- Thread-safe connection pooling
+- Pooled readers and a single writer via the shared SQLite connection manager
 - Automatic schema creation
 - Transaction support
 - Query logging and statistics
@@ -23,7 +23,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from contextlib import contextmanager
-from queue import Queue, Empty
+
+from src.database.connection_manager import get_connection_manager
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ class PluginDatabase:
     
     Features:
     - Isolated database per plugin
-    - Connection pooling for thread safety
+    - Pooled readers and one locked writer (shared connection manager)
     - Automatic schema creation
     - Transaction support
     """
@@ -75,9 +76,9 @@ class PluginDatabase:
         
         self.db_path = os.path.join(db_dir, f"zepix_{plugin_id}.db")
         
-        self._pool: Queue = Queue(maxsize=pool_size)
-        self._pool_lock = threading.Lock()
-        self._local = threading.local()
+        self._db = get_connection_manager().database(
+            self.db_path, pragmas={"foreign_keys": "ON"}, max_readers=pool_size, timeout=timeout
+        )
         
         self.stats = DatabaseStats()
         self._stats_lock = threading.Lock()
@@ -85,15 +86,11 @@ class PluginDatabase:
         self._initialize()
     
     def _initialize(self):
-        """Initialize database and connection pool."""
+        """Initialize database and schema."""
         os.makedirs(self.db_dir, exist_ok=True)
         
         is_new_db = not os.path.exists(self.db_path)
         
-        for _ in range(self.pool_size):
-            conn = self._create_connection()
-            self._pool.put(conn)
-        
         if is_new_db:
             logger.info(f"Creating new database for plugin: {self.plugin_id}")
             self._create_schema()
@@ -103,64 +100,40 @@ class PluginDatabase:
         with self._stats_lock:
             self.stats.connection_count = self.pool_size
     
-    def _create_connection(self) -> sqlite3.Connection:
-        """Create a new database connection."""
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=self.timeout,
-            check_same_thread=False
-        )
-        conn.row_factory = sqlite3.Row
-        
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        
-        return conn
-    
     @contextmanager
     def get_connection(self):
         """
-        Get a connection from the pool.
+        Get a pooled reader connection.
         
         Usage:
             with db.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM trades")
         """
-        conn = None
         try:
-            conn = self._pool.get(timeout=self.timeout)
-            yield conn
-        except Empty:
+            with self._db.reader(sqlite3.Row) as conn:
+                yield conn
+        except TimeoutError:
             raise ConnectionPoolExhausted(
                 f"Connection pool exhausted for plugin {self.plugin_id}"
             )
-        finally:
-            if conn:
-                self._pool.put(conn)
     
     @contextmanager
     def transaction(self):
         """
-        Execute operations within a transaction.
+        Execute operations within a transaction on the database's writer.
         
         Usage:
             with db.transaction() as conn:
                 conn.execute("INSERT INTO trades ...")
                 conn.execute("UPDATE stats ...")
         """
-        with self.get_connection() as conn:
-            try:
-                yield conn
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
+        with self._db.writer(sqlite3.Row) as conn:
+            yield conn
     
     def _create_schema(self):
         """Create plugin database schema."""
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -239,7 +212,6 @@ class PluginDatabase:
                 VALUES (?, '1.0.0', ?)
             """, (self.plugin_id, datetime.now().isoformat()))
             
-            conn.commit()
             logger.info(f"Schema created for plugin: {self.plugin_id}")
     
     def save_trade(self, trade_data: Dict[str, Any]) -> int:
@@ -605,13 +577,8 @@ class PluginDatabase:
             }
     
     def close(self):
-        """Close all connections in the pool."""
-        while not self._pool.empty():
-            try:
-                conn = self._pool.get_nowait()
-                conn.close()
-            except Empty:
-                break
+        """Release the database's writer and pooled readers."""
+        self._db.close()
         
         logger.info(f"Database closed for plugin: {self.plugin_id}")
     
@@ -7,8 +7,12 @@ Part of Plan 02: Webhook Routing & Signal Processing
 from typing import Dict, Any, Optional, List
 import logging
 import asyncio
+import time
 from datetime import datetime
 
+from src.monitoring.metrics_registry import PLUGIN_PROCESSING_LATENCY
+from src.monitoring.tracing import get_tracer, traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +37,7 @@ class PluginRouter:
         }
         self._last_reset = datetime.now()
     
+    @traced("plugin_router.route_signal")
     async def route_signal(self, signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Route signal to appropriate plugin and return result.
@@ -76,6 +81,7 @@ class PluginRouter:
         logger.warning(f"No plugin found for signal: {strategy}/{signal.get('timeframe')}")
         return None
     
+    @traced("plugin_router.execute_plugin")
     async def _execute_plugin(self, plugin, signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Execute plugin and track result.
@@ -88,11 +94,13 @@ class PluginRouter:
             Result from plugin processing
         """
         plugin_id = plugin.plugin_id
+        get_tracer().annotate(plugin_id=plugin_id)
         
         # Track by plugin
         if plugin_id not in self._routing_stats['by_plugin']:
             self._routing_stats['by_plugin'][plugin_id] = {'success': 0, 'failed': 0}
         
+        start = time.perf_counter()
         try:
             # Check if plugin implements process_signal (ISignalProcessor interface)
             if hasattr(plugin, 'process_signal'):
@@ -104,6 +112,9 @@ class PluginRouter:
             
             self._routing_stats['successful'] += 1
             self._routing_stats['by_plugin'][plugin_id]['success'] += 1
+            PLUGIN_PROCESSING_LATENCY.labels(plugin_id=plugin_id, status='success').observe(
+                time.perf_counter() - start
+            )
             
             logger.info(f"Plugin {plugin_id} processed signal successfully")
             return result
@@ -111,6 +122,9 @@ class PluginRouter:
         except Exception as e:
             self._routing_stats['failed'] += 1
             self._routing_stats['by_plugin'][plugin_id]['failed'] += 1
+            PLUGIN_PROCESSING_LATENCY.labels(plugin_id=plugin_id, status='error').observe(
+                time.perf_counter() - start
+            )
             logger.error(f"Plugin {plugin_id} failed: {e}")
             return {'status': 'error', 'message': str(e), 'plugin_id': plugin_id}
     
@@ -7,6 +7,7 @@ import logging
 
 from .base_plugin import BaseLogicPlugin
 from .plugin_interface import ISignalProcessor
+from src.monitoring.tracing import get_tracer, traced
 
 logger = logging.getLogger(__name__)
 
@@ -89,9 +90,28 @@ class PluginRegistry:
         self.service_api = service_api
         self.plugins: Dict[str, BaseLogicPlugin] = {}
         
-        self.plugin_dir = config.get("plugin_system", {}).get("plugin_dir", "src/logic_plugins")
+        plugin_system = config.get("plugin_system", {})
+        self.plugin_dir = plugin_system.get("plugin_dir", "src/logic_plugins")
         
-        logger.info("Plugin registry initialized")
+        # "in_process" (default) or "process": one worker process per plugin
+        self.execution_mode = plugin_system.get("execution_mode", "in_process")
+        self._worker_supervisor = None
+        
+        logger.info(f"Plugin registry initialized (execution_mode={self.execution_mode})")
+    
+    @property
+    def worker_supervisor(self):
+        """Supervisor for process-isolated plugins (created on first use)"""
+        if self._worker_supervisor is None:
+            from .plugin_worker import PluginWorkerSupervisor, WorkerBudget
+            worker_config = self.config.get("plugin_system", {}).get("workers", {})
+            self._worker_supervisor = PluginWorkerSupervisor(
+                self.service_api,
+                budget=WorkerBudget.from_config(worker_config.get("budget")),
+                budgets=worker_config.get("plugin_budgets"),
+                codec=worker_config.get("codec"),
+            )
+        return self._worker_supervisor
     
     def discover_plugins(self) -> List[str]:
         """
@@ -139,19 +159,27 @@ class PluginRegistry:
             package_path = self.plugin_dir.replace('/', '.').replace('\\', '.')
             module_path = f"{package_path}.{plugin_id}.plugin"
             
-            plugin_module = importlib.import_module(module_path)
-            
             # Get plugin class from AVAILABLE_PLUGINS if defined, otherwise construct
             if plugin_id in AVAILABLE_PLUGINS:
                 class_name = AVAILABLE_PLUGINS[plugin_id]['class']
             else:
                 # Fallback: Construct expected class name: "my_plugin" -> "MyPluginPlugin"
                 class_name = f"{plugin_id.title().replace('_', '')}Plugin"
-            plugin_class = getattr(plugin_module, class_name)
             
             # Load plugin config
             plugin_config = self.config.get("plugins", {}).get(plugin_id, {})
             
+            if self.execution_mode == "process":
+                # Module is imported only inside the worker process
+                self.plugins[plugin_id] = self.worker_supervisor.spawn(
+                    plugin_id, module_path, class_name, plugin_config
+                )
+                logger.info(f"Loaded plugin: {plugin_id} (worker process)")
+                return True
+            
+            plugin_module = importlib.import_module(module_path)
+            plugin_class = getattr(plugin_module, class_name)
+            
             # Instantiate plugin
             plugin_instance = plugin_class(
                 plugin_id=plugin_id,
@@ -184,6 +212,16 @@ class PluginRegistry:
         
         logger.info(f"Loaded {len(self.plugins)} plugins")
     
+    async def start_workers(self):
+        """Start supervising worker processes (process execution mode only)"""
+        if self._worker_supervisor is not None:
+            await self._worker_supervisor.start()
+    
+    async def shutdown_workers(self):
+        """Stop all plugin worker processes (no-op in-process)"""
+        if self._worker_supervisor is not None:
+            await self._worker_supervisor.stop()
+    
     def get_plugin(self, plugin_id: str) -> Optional[BaseLogicPlugin]:
         """
         Get plugin instance by ID.
@@ -270,8 +308,10 @@ class PluginRegistry:
             if hasattr(plugin, 'can_process_signal'):
                 # can_process_signal might be async, handle sync check
                 try:
-                    if asyncio.iscoroutinefunction(plugin.can_process_signal):
-                        # For sync context, check via get_supported_strategies instead
+                    isolated = getattr(plugin, 'execution_mode', None) == "process"
+                    if isolated or asyncio.iscoroutinefunction(plugin.can_process_signal):
+                        # For sync context (and for worker handles, whose sync calls block
+                        # the loop on IPC), check via the handshake-cached strategies instead
                         if hasattr(plugin, 'get_supported_strategies'):
                             strategy = signal_data.get('strategy', '')
                             if strategy in plugin.get_supported_strategies():
@@ -324,6 +364,7 @@ class PluginRegistry:
             logger.warning(f"Unknown signal type: {signal_type}")
             return {"error": "unknown_signal_type"}
     
+    @traced("plugin_registry.execute_hook")
     async def execute_hook(self, hook_name: str, data: Any) -> Any:
         """
         Execute a hook across all enabled plugins.
@@ -335,6 +376,7 @@ class PluginRegistry:
         Returns:
             Modified data (pipe-and-filter style) or original if no modifications
         """
+        get_tracer().annotate(hook=hook_name)
         result = data
         
         for plugin_id, plugin in self.plugins.items():
@@ -0,0 +1,988 @@
+"""
+Plugin Workers - Process-Isolated Plugin Execution
+Runs each logic plugin in its own worker process behind a proxy
+
+Optional execution mode (``plugin_system.execution_mode: "process"``).
+Each plugin is loaded in a spawned worker process and talks to the bot
+over a duplex pipe:
+- Parent side: PluginWorker looks like the plugin to PluginRegistry,
+  PluginRouter and PluginHealthMonitor; async plugin methods are
+  forwarded as calls to the worker
+- Worker side: ServiceAPIProxy stands in for ServiceAPI; sync and async
+  service methods (including one level of nested services) are executed
+  by the real ServiceAPI in the bot process
+- Messages are msgpack-encoded when msgpack is installed, pickled otherwise
+
+PluginWorkerSupervisor enforces a per-plugin budget (CPU percent and
+resident memory, reported by worker heartbeats; optional hard address
+space limit and CPU affinity) and restarts crashed, hung or over-budget
+workers with exponential backoff. A plugin that keeps failing is
+disabled instead of restarted. Callables cannot cross the process
+boundary, so plugins that register callbacks with core services should
+stay in-process.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass, asdict, is_dataclass
+from datetime import datetime, date
+from enum import Enum
+import asyncio
+import functools
+import importlib
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import traceback
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+
+# Message kinds: every message is a list [kind, call_id, *payload]
+MSG_READY = "ready"
+MSG_FAILED = "failed"
+MSG_INVOKE = "invoke"
+MSG_SERVICE = "service"
+MSG_RESULT = "result"
+MSG_HEARTBEAT = "hb"
+MSG_SET = "set"
+MSG_STOP = "stop"
+
+# Plugin attributes served from the ready handshake instead of a round trip
+CACHED_PLUGIN_METHODS = ("get_supported_strategies", "get_supported_timeframes")
+
+
+class PluginWorkerError(Exception):
+    """A call could not be completed by the worker process"""
+
+
+# ==================== Wire Codec ====================
+
+def _to_wire(obj: Any) -> Any:
+    """Fallback conversion for values msgpack cannot encode"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, BaseException):
+        return f"{type(obj).__name__}: {obj}"
+    return str(obj)
+
+
+class WireCodec:
+    """Encodes pipe messages with msgpack, or pickle when msgpack is unavailable"""
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name or ("msgpack" if msgpack is not None else "pickle")
+        if self.name == "msgpack" and msgpack is None:
+            raise ImportError("msgpack codec requested but msgpack is not installed")
+
+    def encode(self, message: Any) -> bytes:
+        if self.name == "msgpack":
+            return msgpack.packb(message, default=_to_wire, use_bin_type=True)
+        try:
+            return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return pickle.dumps(_sanitize(message), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        if self.name == "msgpack":
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        return pickle.loads(data)
+
+
+def _sanitize(obj: Any) -> Any:
+    """Recursively reduce a value to plain containers and scalars"""
+    if obj is None or isinstance(obj, (str, int, float, bool, bytes)):
+        return obj
+    if isinstance(obj, dict):
+        return {_sanitize(k): _sanitize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [_sanitize(v) for v in obj]
+    converted = _to_wire(obj)
+    return converted if isinstance(converted, str) else _sanitize(converted)
+
+
+# ==================== Budget ====================
+
+@dataclass
+class WorkerBudget:
+    """Per-plugin resource budget and supervision policy"""
+    cpu_percent: float = 90.0          # of one core, averaged over a heartbeat
+    memory_mb: float = 512.0           # resident set size
+    hard_memory_mb: Optional[float] = None  # RLIMIT_AS in the worker (None = off)
+    cpu_affinity: Optional[List[int]] = None
+    over_budget_beats: int = 5         # consecutive over-budget heartbeats before restart
+    call_timeout: float = 30.0
+    start_timeout: float = 30.0
+    heartbeat_interval: float = 1.0
+    heartbeat_timeout: float = 10.0
+    max_restarts: int = 5
+    restart_window: float = 300.0
+    restart_backoff: float = 1.0
+    max_backoff: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "WorkerBudget":
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in (config or {}).items() if k in known})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ==================== Service Manifest ====================
+
+def _callable_kind(attr: Any) -> Optional[str]:
+    if inspect.iscoroutinefunction(attr):
+        return "async"
+    if callable(attr) and not isinstance(attr, type):
+        return "sync"
+    return None
+
+
+def build_service_manifest(service_api: Any) -> Dict[str, Any]:
+    """
+    Describe ServiceAPI for the worker-side proxy.
+
+    Returns a map of dotted attribute path -> "async" | "sync" | ["value", v].
+    Service objects exposed as attributes are described one level deep
+    (e.g. ``"reentry_service.start_recovery": "async"``).
+    """
+    manifest: Dict[str, Any] = {}
+    codec = WireCodec("pickle")
+    for name in dir(service_api):
+        if name.startswith("_"):
+            continue
+        try:
+            attr = getattr(service_api, name)
+        except Exception:
+            continue
+
+        kind = _callable_kind(attr)
+        if kind:
+            manifest[name] = kind
+        elif attr is None or isinstance(attr, (str, int, float, bool)):
+            manifest[name] = ["value", attr]
+        elif isinstance(attr, (dict, list, tuple)):
+            try:
+                codec.encode(attr)
+                manifest[name] = ["value", _sanitize(attr)]
+            except Exception:
+                continue
+        else:
+            for member in dir(attr):
+                if member.startswith("_"):
+                    continue
+                try:
+                    member_kind = _callable_kind(getattr(attr, member))
+                except Exception:
+                    continue
+                if member_kind:
+                    manifest[f"{name}.{member}"] = member_kind
+    return manifest
+
+
+def _resolve_path(root: Any, path: str) -> Any:
+    target = root
+    for part in path.split("."):
+        target = getattr(target, part)
+    return target
+
+
+# ==================== Worker Process Side ====================
+
+class _WorkerChannel:
+    """Worker end of the pipe: answers invokes and issues service calls"""
+
+    def __init__(self, conn, codec: WireCodec, loop: asyncio.AbstractEventLoop, call_timeout: float):
+        self.conn = conn
+        self.codec = codec
+        self.loop = loop
+        self.call_timeout = call_timeout
+        self.plugin = None
+        self.stopped = asyncio.Event()
+        self._send_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Any] = {}
+        self._inflight = 0
+
+    def send(self, message: List[Any]):
+        data = self.codec.encode(message)
+        with self._send_lock:
+            self.conn.send_bytes(data)
+
+    # -------------------- Service Calls --------------------
+
+    async def call_service_async(self, path: str, *args, **kwargs) -> Any:
+        call_id = next(self._ids)
+        future = self.loop.create_future()
+        self._pending[call_id] = future
+        self.send([MSG_SERVICE, call_id, path, list(args), kwargs])
+        try:
+            ok, value = await asyncio.wait_for(future, self.call_timeout)
+        finally:
+            self._pending.pop(call_id, None)
+        if not ok:
+            raise PluginWorkerError(value)
+        return value
+
+    def call_service_sync(self, path: str, *args, **kwargs) -> Any:
+        call_id = next(self._ids)
+        waiter = [threading.Event(), None]
+        self._pending[call_id] = waiter
+        self.send([MSG_SERVICE, call_id, path, list(args), kwargs])
+        try:
+            if not waiter[0].wait(self.call_timeout):
+                raise PluginWorkerError(f"service call {path} timed out")
+        finally:
+            self._pending.pop(call_id, None)
+        ok, value = waiter[1]
+        if not ok:
+            raise PluginWorkerError(value)
+        return value
+
+    # -------------------- Incoming Messages --------------------
+
+    def reader(self):
+        """Reader thread: dispatch parent messages until the pipe closes"""
+        while True:
+            try:
+                message = self.codec.decode(self.conn.recv_bytes())
+            except (EOFError, OSError):
+                # Parent is gone; nothing left to serve
+                os._exit(0)
+            kind, call_id = message[0], message[1]
+            if kind == MSG_RESULT:
+                self._resolve(call_id, bool(message[2]), message[3])
+            elif kind == MSG_INVOKE:
+                self.loop.call_soon_threadsafe(
+                    lambda m=message: self.loop.create_task(self._invoke(m[1], m[2], m[3], m[4]))
+                )
+            elif kind == MSG_SET:
+                self.loop.call_soon_threadsafe(self._set_attribute, message[2], message[3])
+            elif kind == MSG_STOP:
+                self.loop.call_soon_threadsafe(self.stopped.set)
+                return
+
+    def _resolve(self, call_id: int, ok: bool, value: Any):
+        waiter = self._pending.get(call_id)
+        if waiter is None:
+            return
+        if isinstance(waiter, list):
+            waiter[1] = (ok, value)
+            waiter[0].set()
+        else:
+            self.loop.call_soon_threadsafe(
+                lambda: waiter.done() or waiter.set_result((ok, value))
+            )
+
+    def _set_attribute(self, name: str, value: Any):
+        if self.plugin is not None:
+            setattr(self.plugin, name, value)
+
+    async def _invoke(self, call_id: int, method: str, args: List[Any], kwargs: Dict[str, Any]):
+        self._inflight += 1
+        cpu_start = time.process_time()
+        try:
+            result = getattr(self.plugin, method)(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            reply = [MSG_RESULT, call_id, True, result, time.process_time() - cpu_start]
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"[PluginWorker] {method} failed: {error}\n{traceback.format_exc()}")
+            reply = [MSG_RESULT, call_id, False, error, time.process_time() - cpu_start]
+        finally:
+            self._inflight -= 1
+        try:
+            self.send(reply)
+        except Exception as e:
+            # Unencodable result: report it instead of leaving the caller waiting
+            self.send([MSG_RESULT, call_id, False, f"result could not be encoded: {e}", 0.0])
+
+    def heartbeat(self, interval: float):
+        """Heartbeat thread: report CPU time and RSS to the supervisor"""
+        while not self.stopped.is_set():
+            try:
+                self.send([MSG_HEARTBEAT, 0, {
+                    "cpu_seconds": time.process_time(),
+                    "rss_mb": _rss_mb(),
+                    "inflight": self._inflight,
+                }])
+            except (OSError, EOFError, ValueError):
+                return
+            time.sleep(interval)
+
+
+class ServiceAPIProxy:
+    """Worker-side stand-in for ServiceAPI (attribute paths come from the manifest)"""
+
+    def __init__(self, channel: _WorkerChannel, manifest: Dict[str, Any], prefix: str = ""):
+        self._channel = channel
+        self._manifest = manifest
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        path = f"{self._prefix}{name}"
+        kind = self._manifest.get(path)
+        if kind == "async":
+            return functools.partial(self._channel.call_service_async, path)
+        if kind == "sync":
+            return functools.partial(self._channel.call_service_sync, path)
+        if isinstance(kind, list):
+            return kind[1]
+        namespace = f"{path}."
+        if any(key.startswith(namespace) for key in self._manifest):
+            return ServiceAPIProxy(self._channel, self._manifest, namespace)
+        raise AttributeError(f"ServiceAPI has no attribute '{path}'")
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+            # Peak RSS (KB on Linux) where /proc is unavailable
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        except ImportError:
+            return 0.0
+
+
+def _apply_limits(budget: WorkerBudget):
+    if budget.hard_memory_mb:
+        try:
+            import resource
+            limit = int(budget.hard_memory_mb * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"[PluginWorker] Could not set memory limit: {e}")
+    if budget.cpu_affinity and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, budget.cpu_affinity)
+        except OSError as e:
+            logger.warning(f"[PluginWorker] Could not set CPU affinity: {e}")
+
+
+def _describe_plugin(plugin: Any) -> Dict[str, Any]:
+    methods = {}
+    for name in dir(plugin):
+        if name.startswith("_"):
+            continue
+        try:
+            kind = _callable_kind(getattr(plugin, name))
+        except Exception:
+            continue
+        if kind:
+            methods[name] = kind
+    info = {
+        "enabled": bool(getattr(plugin, "enabled", True)),
+        "methods": methods,
+        "priority": getattr(plugin, "priority", 0),
+        "metadata": _sanitize(getattr(plugin, "metadata", {})),
+        "pid": os.getpid(),
+    }
+    for name in CACHED_PLUGIN_METHODS:
+        if name in methods and methods[name] == "sync":
+            info[name] = _sanitize(getattr(plugin, name)())
+    if methods.get("get_status") == "sync":
+        try:
+            info["status"] = _sanitize(plugin.get_status())
+        except Exception:
+            info["status"] = None
+    return info
+
+
+def worker_main(conn, spec: Dict[str, Any]):
+    """Entry point of a plugin worker process"""
+    logging.basicConfig(
+        level=spec.get("log_level", logging.INFO),
+        format=f"%(asctime)s [worker:{spec['plugin_id']}] %(name)s %(levelname)s %(message)s"
+    )
+    budget = WorkerBudget(**spec["budget"])
+    _apply_limits(budget)
+    codec = WireCodec(spec["codec"])
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    channel = _WorkerChannel(conn, codec, loop, budget.call_timeout)
+
+    async def serve():
+        threading.Thread(target=channel.reader, daemon=True, name="PluginWorkerReader").start()
+        try:
+            module = importlib.import_module(spec["module"])
+            plugin_class = getattr(module, spec["class_name"])
+            channel.plugin = plugin_class(
+                plugin_id=spec["plugin_id"],
+                config=spec["plugin_config"],
+                service_api=ServiceAPIProxy(channel, spec["manifest"]),
+            )
+            channel.send([MSG_READY, 0, _describe_plugin(channel.plugin)])
+        except Exception as e:
+            channel.send([MSG_FAILED, 0, f"{type(e).__name__}: {e}\n{traceback.format_exc()}"])
+            return
+
+        threading.Thread(target=channel.heartbeat, args=(budget.heartbeat_interval,),
+                         daemon=True, name="PluginWorkerHeartbeat").start()
+        await channel.stopped.wait()
+
+        shutdown = getattr(channel.plugin, "shutdown", None)
+        if shutdown is not None:
+            try:
+                result = shutdown()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"[PluginWorker] Shutdown error: {e}")
+
+    try:
+        loop.run_until_complete(serve())
+    finally:
+        conn.close()
+
+
+# ==================== Bot Process Side ====================
+
+class PluginWorker:
+    """
+    Bot-side handle for one plugin running in a worker process.
+
+    Behaves like the plugin for the registry, router and health monitor:
+    async plugin methods become remote calls, ``enabled`` is mirrored to
+    the worker, and supported strategies/timeframes are served from the
+    startup handshake. The handle survives restarts, so references held
+    elsewhere stay valid. Sync plugin methods block on a pipe round trip;
+    loop-thread callers should check ``execution_mode`` and avoid them.
+    """
+
+    execution_mode = "process"
+
+    def __init__(
+        self,
+        plugin_id: str,
+        module: str,
+        class_name: str,
+        plugin_config: Dict[str, Any],
+        service_api: Any,
+        budget: Optional[WorkerBudget] = None,
+        codec: Optional[str] = None,
+        mp_context: str = "spawn"
+    ):
+        self.plugin_id = plugin_id
+        self.module = module
+        self.class_name = class_name
+        self.plugin_config = plugin_config
+        self.service_api = service_api
+        self.budget = budget or WorkerBudget()
+        self.codec = WireCodec(codec)
+        self._ctx = multiprocessing.get_context(mp_context)
+
+        self.process = None
+        self.conn = None
+        self.info: Dict[str, Any] = {}
+        self.manifest: Dict[str, Any] = {}
+        self.start_time: Optional[datetime] = None
+        self._last_heartbeat: Optional[datetime] = None
+        self._enabled = bool(plugin_config.get("enabled", True))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._send_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Any] = {}
+        self._reader: Optional[threading.Thread] = None
+        self._on_exit: Optional[Callable[["PluginWorker"], None]] = None
+
+        # Resource accounting from heartbeats
+        self.cpu_percent = 0.0
+        self.rss_mb = 0.0
+        self.over_budget_beats = 0
+        self._last_cpu: Optional[Tuple[float, float]] = None
+        self.stats = {"calls": 0, "errors": 0, "service_calls": 0, "cpu_seconds": 0.0, "restarts": 0}
+
+    # -------------------- Lifecycle --------------------
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        """Spawn the worker and wait for its ready handshake"""
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        if not self.manifest:
+            self.manifest = build_service_manifest(self.service_api)
+
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        spec = {
+            "plugin_id": self.plugin_id,
+            "module": self.module,
+            "class_name": self.class_name,
+            "plugin_config": _sanitize(dict(self.plugin_config, enabled=self._enabled)),
+            "manifest": self.manifest,
+            "budget": self.budget.to_dict(),
+            "codec": self.codec.name,
+            "log_level": logging.getLogger().getEffectiveLevel(),
+        }
+        self.process = self._ctx.Process(
+            target=worker_main, args=(child_conn, spec),
+            name=f"plugin-{self.plugin_id}", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+        self.info = self._await_ready()
+        self.start_time = datetime.now()
+        self._last_heartbeat = self.start_time
+        self._last_cpu = None
+        self.over_budget_beats = 0
+        self._reader = threading.Thread(target=self._read_loop, args=(self.conn, self.process),
+                                         daemon=True, name=f"PluginWorker-{self.plugin_id}")
+        self._reader.start()
+        logger.info(f"[PluginWorker] {self.plugin_id} running in pid {self.pid} ({self.codec.name} IPC)")
+
+    def _await_ready(self) -> Dict[str, Any]:
+        """Serve service calls made from the plugin constructor until it reports ready"""
+        deadline = time.monotonic() + self.budget.start_timeout
+        while time.monotonic() < deadline:
+            if not self.conn.poll(0.05):
+                if not self.process.is_alive():
+                    break
+                continue
+            message = self.codec.decode(self.conn.recv_bytes())
+            if message[0] == MSG_READY:
+                return message[2]
+            if message[0] == MSG_FAILED:
+                self.process.join(5)
+                raise PluginWorkerError(f"{self.plugin_id} failed to start: {message[2]}")
+            if message[0] == MSG_SERVICE:
+                if self.manifest.get(message[2]) == "async":
+                    # The bot loop is blocked in this handshake
+                    self._reply(message[1], False, "async services are unavailable during plugin construction")
+                else:
+                    self._handle_service_call(message)
+        self.kill()
+        raise PluginWorkerError(f"{self.plugin_id} did not start within {self.budget.start_timeout}s")
+
+    def restart(self):
+        """Replace the worker process, keeping this handle"""
+        self.kill()
+        self.stats["restarts"] += 1
+        self.start()
+
+    def kill(self):
+        """Stop the worker immediately and fail in-flight calls"""
+        if self.process is not None and self.process.is_alive():
+            self.process.kill()
+            self.process.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        self._fail_pending("worker stopped")
+
+    async def shutdown(self, timeout: float = 5.0):
+        """Ask the worker to shut its plugin down, then make sure it exits"""
+        if self.is_alive():
+            try:
+                self._send([MSG_STOP, 0])
+            except (OSError, ValueError):
+                pass
+            await asyncio.to_thread(self.process.join, timeout)
+        self.kill()
+
+    # -------------------- Plugin Surface --------------------
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = bool(value)
+        if self.is_alive():
+            try:
+                self._send([MSG_SET, 0, "enabled", self._enabled])
+            except (OSError, ValueError):
+                pass
+
+    @property
+    def priority(self) -> int:
+        return self.info.get("priority", 0)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.info.get("metadata", {})
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def get_supported_strategies(self) -> List[str]:
+        return list(self.info.get("get_supported_strategies", []))
+
+    def get_supported_timeframes(self) -> List[str]:
+        return list(self.info.get("get_supported_timeframes", []))
+
+    def get_status(self) -> Dict[str, Any]:
+        status = dict(self.info.get("status") or {"plugin_id": self.plugin_id})
+        status.update({
+            "enabled": self._enabled,
+            "execution_mode": self.execution_mode,
+            "worker": self.get_worker_status(),
+        })
+        return status
+
+    def get_resource_stats(self) -> Dict[str, Any]:
+        return {"memory_mb": round(self.rss_mb, 1), "cpu_pct": round(self.cpu_percent, 1)}
+
+    async def ping(self) -> bool:
+        return self.is_alive() and self._last_heartbeat is not None and (
+            (datetime.now() - self._last_heartbeat).total_seconds() < self.budget.heartbeat_timeout
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not defined on the handle
+        if name.startswith("_"):
+            raise AttributeError(name)
+        kind = self.__dict__.get("info", {}).get("methods", {}).get(name)
+        if kind == "async":
+            return functools.partial(self.invoke, name)
+        if kind == "sync":
+            return functools.partial(self.invoke_sync, name)
+        raise AttributeError(f"Plugin {self.__dict__.get('plugin_id')} has no attribute '{name}'")
+
+    async def invoke(self, method: str, *args, **kwargs) -> Any:
+        """Call a plugin method in the worker and await its result"""
+        self._loop = asyncio.get_running_loop()
+        if not self.is_alive():
+            raise PluginWorkerError(f"{self.plugin_id} worker is not running")
+        call_id = next(self._ids)
+        future = self._loop.create_future()
+        self._pending[call_id] = future
+        self.stats["calls"] += 1
+        try:
+            self._send([MSG_INVOKE, call_id, method, list(args), kwargs])
+            ok, value = await asyncio.wait_for(future, self.budget.call_timeout)
+        except asyncio.TimeoutError:
+            self.stats["errors"] += 1
+            raise PluginWorkerError(f"{self.plugin_id}.{method} timed out after {self.budget.call_timeout}s")
+        finally:
+            self._pending.pop(call_id, None)
+        if not ok:
+            self.stats["errors"] += 1
+            raise PluginWorkerError(f"{self.plugin_id}.{method}: {value}")
+        return value
+
+    def invoke_sync(self, method: str, *args, **kwargs) -> Any:
+        """
+        Blocking call for sync plugin methods.
+
+        Sync service calls made by the plugin are answered from the reader
+        thread, but async ones need the event loop; avoid calling plugin
+        methods that use async services from the loop thread.
+        """
+        if not self.is_alive():
+            raise PluginWorkerError(f"{self.plugin_id} worker is not running")
+        call_id = next(self._ids)
+        waiter = [threading.Event(), None]
+        self._pending[call_id] = waiter
+        self.stats["calls"] += 1
+        try:
+            self._send([MSG_INVOKE, call_id, method, list(args), kwargs])
+            if not waiter[0].wait(self.budget.call_timeout):
+                self.stats["errors"] += 1
+                raise PluginWorkerError(f"{self.plugin_id}.{method} timed out")
+        finally:
+            self._pending.pop(call_id, None)
+        ok, value = waiter[1]
+        if not ok:
+            self.stats["errors"] += 1
+            raise PluginWorkerError(f"{self.plugin_id}.{method}: {value}")
+        return value
+
+    # -------------------- IPC --------------------
+
+    def _send(self, message: List[Any]):
+        data = self.codec.encode(message)
+        with self._send_lock:
+            self.conn.send_bytes(data)
+
+    def _read_loop(self, conn, process):
+        while True:
+            try:
+                message = self.codec.decode(conn.recv_bytes())
+            except (EOFError, OSError):
+                break
+            kind = message[0]
+            if kind == MSG_RESULT:
+                self.stats["cpu_seconds"] += message[4] or 0.0
+                self._resolve(message[1], bool(message[2]), message[3])
+            elif kind == MSG_SERVICE:
+                self._handle_service_call(message)
+            elif kind == MSG_HEARTBEAT:
+                self._record_heartbeat(message[2])
+
+        # Only report the exit of the process this reader belongs to
+        if process is self.process:
+            self._fail_pending(f"worker exited (code {process.exitcode})")
+            if self._on_exit is not None:
+                self._on_exit(self)
+
+    def _resolve(self, call_id: int, ok: bool, value: Any):
+        waiter = self._pending.get(call_id)
+        if waiter is None:
+            return
+        if isinstance(waiter, list):
+            waiter[1] = (ok, value)
+            waiter[0].set()
+        elif self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                lambda: waiter.done() or waiter.set_result((ok, value))
+            )
+
+    def _fail_pending(self, reason: str):
+        for call_id in list(self._pending):
+            self._resolve(call_id, False, reason)
+
+    def _handle_service_call(self, message: List[Any]):
+        _, call_id, path, args, kwargs = message
+        self.stats["service_calls"] += 1
+        kind = self.manifest.get(path)
+        try:
+            target = _resolve_path(self.service_api, path)
+        except AttributeError as e:
+            self._reply(call_id, False, f"AttributeError: {e}")
+            return
+
+        if kind == "async":
+            if self._loop is None or self._loop.is_closed():
+                self._reply(call_id, False, "bot event loop is not running")
+                return
+            future = asyncio.run_coroutine_threadsafe(target(*args, **kwargs), self._loop)
+            future.add_done_callback(functools.partial(self._reply_from_future, call_id))
+            return
+
+        # Sync services are answered right here so a blocked loop cannot deadlock them
+        try:
+            self._reply(call_id, True, target(*args, **kwargs))
+        except Exception as e:
+            self._reply(call_id, False, f"{type(e).__name__}: {e}")
+
+    def _reply_from_future(self, call_id: int, future):
+        try:
+            self._reply(call_id, True, future.result())
+        except Exception as e:
+            self._reply(call_id, False, f"{type(e).__name__}: {e}")
+
+    def _reply(self, call_id: int, ok: bool, value: Any):
+        try:
+            self._send([MSG_RESULT, call_id, ok, value])
+        except (OSError, ValueError):
+            pass
+        except Exception as e:
+            self._send([MSG_RESULT, call_id, False, f"result could not be encoded: {e}"])
+
+    def _record_heartbeat(self, beat: Dict[str, Any]):
+        now = time.monotonic()
+        cpu = beat.get("cpu_seconds", 0.0)
+        if self._last_cpu is not None:
+            elapsed = now - self._last_cpu[1]
+            if elapsed > 0:
+                self.cpu_percent = max(cpu - self._last_cpu[0], 0.0) / elapsed * 100
+        self._last_cpu = (cpu, now)
+        self.rss_mb = beat.get("rss_mb", 0.0)
+        self._last_heartbeat = datetime.now()
+        if self.cpu_percent > self.budget.cpu_percent:
+            self.over_budget_beats += 1
+        else:
+            self.over_budget_beats = 0
+
+    def get_worker_status(self) -> Dict[str, Any]:
+        return {
+            "pid": self.pid,
+            "alive": self.is_alive(),
+            "codec": self.codec.name,
+            "cpu_pct": round(self.cpu_percent, 1),
+            "rss_mb": round(self.rss_mb, 1),
+            "last_heartbeat": self._last_heartbeat.isoformat() if self._last_heartbeat else None,
+            "inflight": len(self._pending),
+            **self.stats,
+        }
+
+
+# ==================== Supervisor ====================
+
+class PluginWorkerSupervisor:
+    """
+    Starts plugin workers and keeps them within budget.
+
+    ``check_workers`` runs every heartbeat interval from ``start``'s
+    monitor task and restarts workers that exited, stopped sending
+    heartbeats, exceeded the RSS budget, or stayed above the CPU budget
+    for ``over_budget_beats`` heartbeats. Restarts back off exponentially;
+    more than ``max_restarts`` within ``restart_window`` disables the plugin.
+    """
+
+    def __init__(self, service_api: Any, budget: Optional[WorkerBudget] = None,
+                 budgets: Optional[Dict[str, Dict[str, Any]]] = None,
+                 codec: Optional[str] = None, mp_context: str = "spawn"):
+        self.service_api = service_api
+        self.budget = budget or WorkerBudget()
+        self.plugin_budgets = budgets or {}
+        self.codec = codec
+        self.mp_context = mp_context
+        self.workers: Dict[str, PluginWorker] = {}
+        self._restart_history: Dict[str, List[float]] = {}
+        self._next_restart: Dict[str, float] = {}
+        self._failed: Dict[str, str] = {}
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._running = False
+
+    def budget_for(self, plugin_id: str) -> WorkerBudget:
+        overrides = self.plugin_budgets.get(plugin_id)
+        if not overrides:
+            return self.budget
+        return WorkerBudget(**{**self.budget.to_dict(), **overrides})
+
+    def spawn(self, plugin_id: str, module: str, class_name: str,
+              plugin_config: Dict[str, Any]) -> PluginWorker:
+        """Start a plugin in its own worker process"""
+        worker = PluginWorker(
+            plugin_id, module, class_name, plugin_config, self.service_api,
+            budget=self.budget_for(plugin_id), codec=self.codec, mp_context=self.mp_context
+        )
+        worker.start()
+        self.workers[plugin_id] = worker
+        self._failed.pop(plugin_id, None)
+        return worker
+
+    # -------------------- Monitoring --------------------
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+
+    async def stop(self):
+        self._running = False
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+        for worker in list(self.workers.values()):
+            await worker.shutdown()
+
+    async def _monitor_loop(self):
+        while self._running:
+            try:
+                await asyncio.to_thread(self.check_workers)
+            except Exception as e:
+                logger.error(f"[PluginWorkerSupervisor] Check failed: {e}")
+            await asyncio.sleep(self.budget.heartbeat_interval)
+
+    def check_workers(self) -> Dict[str, str]:
+        """One supervision pass; returns {plugin_id: action} for workers acted on"""
+        actions = {}
+        now = time.monotonic()
+        for plugin_id, worker in list(self.workers.items()):
+            if plugin_id in self._failed:
+                continue
+            if plugin_id in self._next_restart:
+                if now >= self._next_restart[plugin_id]:
+                    actions[plugin_id] = self._do_restart(worker)
+                continue
+
+            reason = self._violation(worker)
+            if reason:
+                actions[plugin_id] = self._schedule_restart(worker, reason, now)
+        return actions
+
+    def _violation(self, worker: PluginWorker) -> Optional[str]:
+        budget = worker.budget
+        if not worker.is_alive():
+            code = worker.process.exitcode if worker.process else None
+            return f"worker exited (code {code})"
+        if worker._last_heartbeat and (
+            (datetime.now() - worker._last_heartbeat).total_seconds() > budget.heartbeat_timeout
+        ):
+            return "no heartbeat"
+        if budget.memory_mb and worker.rss_mb > budget.memory_mb:
+            return f"memory {worker.rss_mb:.0f}MB over budget {budget.memory_mb:.0f}MB"
+        if worker.over_budget_beats >= budget.over_budget_beats:
+            return f"CPU {worker.cpu_percent:.0f}% over budget {budget.cpu_percent:.0f}%"
+        return None
+
+    def _schedule_restart(self, worker: PluginWorker, reason: str, now: float) -> str:
+        plugin_id = worker.plugin_id
+        budget = worker.budget
+        history = [t for t in self._restart_history.get(plugin_id, []) if now - t < budget.restart_window]
+        self._restart_history[plugin_id] = history
+
+        worker.kill()
+        if len(history) >= budget.max_restarts:
+            self._failed[plugin_id] = reason
+            worker.enabled = False
+            logger.error(
+                f"[PluginWorkerSupervisor] {plugin_id} disabled: {reason} "
+                f"({len(history)} restarts in {budget.restart_window:.0f}s)"
+            )
+            return "disabled"
+
+        delay = min(budget.restart_backoff * (2 ** len(history)), budget.max_backoff)
+        history.append(now)
+        self._next_restart[plugin_id] = now + delay
+        logger.warning(f"[PluginWorkerSupervisor] {plugin_id}: {reason}; restarting in {delay:.1f}s")
+        return "restart_scheduled"
+
+    def _do_restart(self, worker: PluginWorker) -> str:
+        self._next_restart.pop(worker.plugin_id, None)
+        try:
+            worker.restart()
+            logger.info(f"[PluginWorkerSupervisor] {worker.plugin_id} restarted (pid {worker.pid})")
+            return "restarted"
+        except PluginWorkerError as e:
+            logger.error(f"[PluginWorkerSupervisor] Restart failed: {e}")
+            return self._schedule_restart(worker, str(e), time.monotonic())
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            plugin_id: {
+                **worker.get_worker_status(),
+                "enabled": worker.enabled,
+                "failed": self._failed.get(plugin_id),
+                "restart_pending": plugin_id in self._next_restart,
+            }
+            for plugin_id, worker in self.workers.items()
+        }
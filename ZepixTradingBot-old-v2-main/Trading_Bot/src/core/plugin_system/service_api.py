@@ -32,9 +32,13 @@ Services Integrated:
 from typing import Dict, Any, List, Optional, Tuple, Callable
 import logging
 import asyncio
+import time
 from datetime import datetime
 from dataclasses import dataclass, field
 
+from src.monitoring.metrics_registry import SERVICE_CALL_LATENCY
+from src.monitoring.tracing import get_tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -353,19 +357,26 @@ class ServiceAPI:
             metrics.calls += 1
             metrics.last_call = datetime.now()
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         try:
-            if asyncio.iscoroutinefunction(method):
-                result = await method(*args, **kwargs)
-            else:
-                result = method(*args, **kwargs)
+            with get_tracer().span(f"service.{service_name}.{method_name}"):
+                if asyncio.iscoroutinefunction(method):
+                    result = await method(*args, **kwargs)
+                else:
+                    result = method(*args, **kwargs)
             
+            elapsed = time.perf_counter() - start_time
+            SERVICE_CALL_LATENCY.labels(
+                service=service_name, method=method_name, status='success'
+            ).observe(elapsed)
             if metrics:
-                elapsed = (datetime.now() - start_time).total_seconds() * 1000
-                metrics.total_time_ms += elapsed
+                metrics.total_time_ms += elapsed * 1000
             
             return result
         except Exception as e:
+            SERVICE_CALL_LATENCY.labels(
+                service=service_name, method=method_name, status='error'
+            ).observe(time.perf_counter() - start_time)
             if metrics:
                 metrics.errors += 1
                 metrics.last_error = str(e)
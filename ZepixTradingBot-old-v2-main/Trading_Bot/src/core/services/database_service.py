@@ -6,7 +6,7 @@ Each plugin has its own SQLite database to prevent data conflicts.
 
 Features:
 - Isolated databases per plugin
-- Async database operations
+- Async database operations on the shared SQLite connection manager
 - Cross-plugin aggregation
 - Health checks
 
@@ -21,6 +21,8 @@ from pathlib import Path
 from datetime import datetime
 from contextlib import asynccontextmanager
 
+from src.database.connection_manager import ManagedDatabase, get_connection_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +37,7 @@ class DatabaseService:
     
     This prevents data conflicts and allows plugins to
     operate independently without affecting each other.
+    Plugins mapped to the same file share its managed writer and readers.
     """
     
     # Database paths per plugin type
@@ -62,7 +65,7 @@ class DatabaseService:
             base_path: Base path for database files
         """
         self.base_path = Path(base_path)
-        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._connections: Dict[str, ManagedDatabase] = {}
         self._initialized_dbs: set = set()
         self._lock = asyncio.Lock()
     
@@ -91,35 +94,35 @@ class DatabaseService:
         data_dir = self.base_path / 'data'
         data_dir.mkdir(parents=True, exist_ok=True)
     
-    async def get_connection(self, plugin_id: str) -> sqlite3.Connection:
+    async def _get_database(self, plugin_id: str) -> ManagedDatabase:
+        """Get (or register) the managed database of a plugin"""
+        async with self._lock:
+            if plugin_id not in self._connections:
+                self._ensure_data_dir()
+                db_path = self._get_db_path(plugin_id)
+                self._connections[plugin_id] = get_connection_manager().database(str(db_path))
+                logger.info(f"[DatabaseService] Database registered for {plugin_id}: {db_path}")
+            
+            return self._connections[plugin_id]
+    
+    async def get_connection(self, plugin_id: str) -> ManagedDatabase:
         """
         Get database connection for a plugin.
         
-        Creates connection if it doesn't exist.
-        Uses synchronous sqlite3 wrapped in async for compatibility.
+        Returns the plugin's managed database rather than a raw connection,
+        so every caller writes through its writer lock and reads from its
+        reader pool (``writer()``, ``reader()`` or the async helpers). The
+        file is opened here, so a bad path fails on this call.
         
         Args:
             plugin_id: Plugin identifier
             
         Returns:
-            SQLite connection
+            Managed database of the plugin
         """
-        async with self._lock:
-            if plugin_id not in self._connections:
-                self._ensure_data_dir()
-                db_path = self._get_db_path(plugin_id)
-                
-                # Create connection in thread pool
-                loop = asyncio.get_event_loop()
-                conn = await loop.run_in_executor(
-                    None,
-                    lambda: sqlite3.connect(str(db_path), check_same_thread=False)
-                )
-                conn.row_factory = sqlite3.Row
-                self._connections[plugin_id] = conn
-                logger.info(f"[DatabaseService] Connection created for {plugin_id}: {db_path}")
-            
-            return self._connections[plugin_id]
+        db = await self._get_database(plugin_id)
+        await db.afetchone("SELECT 1")
+        return db
     
     async def initialize_database(self, plugin_id: str, schema: str = None) -> bool:
         """
@@ -136,7 +139,7 @@ class DatabaseService:
             return True
         
         try:
-            conn = await self.get_connection(plugin_id)
+            db = await self._get_database(plugin_id)
             
             # Load schema from file if not provided
             if not schema:
@@ -147,13 +150,7 @@ class DatabaseService:
                     logger.warning(f"[DatabaseService] No schema found for {plugin_id}")
                     return False
             
-            # Execute schema in thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: conn.executescript(schema)
-            )
-            await loop.run_in_executor(None, conn.commit)
+            await db.arun(db.executescript, schema)
             
             self._initialized_dbs.add(plugin_id)
             logger.info(f"[DatabaseService] Database initialized for {plugin_id}")
@@ -180,17 +177,11 @@ class DatabaseService:
         Returns:
             List of result rows as dictionaries
         """
-        conn = await self.get_connection(plugin_id)
+        db = await self._get_database(plugin_id)
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _execute():
-                cursor = conn.execute(query, params)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
-            
-            return await loop.run_in_executor(None, _execute)
+            rows = await db.afetchall(query, params, sqlite3.Row)
+            return [dict(row) for row in rows]
             
         except Exception as e:
             logger.error(f"[DatabaseService] Query failed for {plugin_id}: {e}")
@@ -213,21 +204,15 @@ class DatabaseService:
         Returns:
             ID of inserted record
         """
-        conn = await self.get_connection(plugin_id)
+        db = await self._get_database(plugin_id)
         
         columns = ', '.join(data.keys())
         placeholders = ', '.join(['?' for _ in data])
         query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _insert():
-                cursor = conn.execute(query, tuple(data.values()))
-                conn.commit()
-                return cursor.lastrowid
-            
-            return await loop.run_in_executor(None, _insert)
+            cursor = await db.aexecute(query, tuple(data.values()))
+            return cursor.lastrowid
             
         except Exception as e:
             logger.error(f"[DatabaseService] Insert failed for {plugin_id}.{table}: {e}")
@@ -252,21 +237,15 @@ class DatabaseService:
         Returns:
             Number of records updated
         """
-        conn = await self.get_connection(plugin_id)
+        db = await self._get_database(plugin_id)
         
         set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
         where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
         query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _update():
-                cursor = conn.execute(query, tuple(data.values()) + tuple(where.values()))
-                conn.commit()
-                return cursor.rowcount
-            
-            return await loop.run_in_executor(None, _update)
+            cursor = await db.aexecute(query, tuple(data.values()) + tuple(where.values()))
+            return cursor.rowcount
             
         except Exception as e:
             logger.error(f"[DatabaseService] Update failed for {plugin_id}.{table}: {e}")
@@ -289,20 +268,14 @@ class DatabaseService:
         Returns:
             Number of records deleted
         """
-        conn = await self.get_connection(plugin_id)
+        db = await self._get_database(plugin_id)
         
         where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
         query = f"DELETE FROM {table} WHERE {where_clause}"
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _delete():
-                cursor = conn.execute(query, tuple(where.values()))
-                conn.commit()
-                return cursor.rowcount
-            
-            return await loop.run_in_executor(None, _delete)
+            cursor = await db.aexecute(query, tuple(where.values()))
+            return cursor.rowcount
             
         except Exception as e:
             logger.error(f"[DatabaseService] Delete failed for {plugin_id}.{table}: {e}")
@@ -332,20 +305,18 @@ class DatabaseService:
         return rows[0]['count'] if rows else 0
     
     async def close_connection(self, plugin_id: str):
-        """Close database connection for a plugin"""
+        """Release the database handles of a plugin (reopened on next use)"""
         async with self._lock:
             if plugin_id in self._connections:
-                conn = self._connections.pop(plugin_id)
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, conn.close)
+                db = self._connections.pop(plugin_id)
+                await db.arun(db.close)
                 logger.info(f"[DatabaseService] Connection closed for {plugin_id}")
     
     async def close_all(self):
         """Close all database connections"""
         async with self._lock:
-            for plugin_id, conn in list(self._connections.items()):
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, conn.close)
+            for plugin_id, db in list(self._connections.items()):
+                await db.arun(db.close)
                 logger.info(f"[DatabaseService] Connection closed for {plugin_id}")
             self._connections.clear()
     
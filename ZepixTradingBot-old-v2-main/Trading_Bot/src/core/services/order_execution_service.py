@@ -9,9 +9,13 @@ Date: 2026-01-14
 """
 
 from typing import Dict, Any, Tuple, List, Optional
+import asyncio
 import logging
 from datetime import datetime
 
+from src.clients.order_pipeline import OrderLeg, supports_order_batch
+from src.monitoring.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +30,48 @@ class OrderExecutionService:
         self._config = config
         self._pip_calculator = pip_calculator
     
+    async def _place_order_pair(
+        self,
+        tag: str,
+        order_a: OrderLeg,
+        order_b: OrderLeg
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Submit Order A and Order B as one batch.
+        
+        Clients with ``place_order_batch`` prepare both legs from one symbol
+        snapshot, send them back-to-back off the event loop and close Order A
+        again if Order B fails. Other clients get two plain place_order calls.
+        
+        A failed batch still returns the tickets of legs whose rollback close
+        failed, so callers keep tracking positions left open.
+        """
+        if not supports_order_batch(self._mt5):
+            tickets = []
+            for leg in (order_a, order_b):
+                tickets.append(self._mt5.place_order(
+                    symbol=leg.symbol,
+                    order_type=leg.order_type,
+                    lot_size=leg.lot_size,
+                    price=0.0,
+                    sl=leg.sl,
+                    tp=leg.tp,
+                    comment=leg.comment
+                ))
+            return (tickets[0], tickets[1])
+        
+        batch = await asyncio.to_thread(self._mt5.place_order_batch, [order_a, order_b])
+        if not batch.success:
+            logger.error(f"[{tag}] Dual order batch failed: {batch.error}")
+            return batch.tickets
+        
+        logger.info(
+            f"[{tag}] Leg latency A={batch.legs[0].submit_ms:.1f}ms "
+            f"B={batch.legs[1].submit_ms:.1f}ms | gap={batch.gap_ms:.1f}ms"
+        )
+        return batch.tickets
+    
+    @traced("orders.place_dual_orders_v3")
     async def place_dual_orders_v3(
         self,
         plugin_id: str,
@@ -71,24 +117,12 @@ class OrderExecutionService:
                 f"{symbol} {direction} | A={order_a_lot} B={order_b_lot} | Route={logic_route}"
             )
             
-            order_a_ticket = self._mt5.place_order(
-                symbol=symbol,
-                order_type=direction,
-                lot_size=order_a_lot,
-                price=0.0,
-                sl=order_a_sl,
-                tp=order_a_tp,
-                comment=f"V3_A_{plugin_id}_{logic_route}"
-            )
-            
-            order_b_ticket = self._mt5.place_order(
-                symbol=symbol,
-                order_type=direction,
-                lot_size=order_b_lot,
-                price=0.0,
-                sl=order_b_sl,
-                tp=order_b_tp,
-                comment=f"V3_B_{plugin_id}_{logic_route}"
+            order_a_ticket, order_b_ticket = await self._place_order_pair(
+                "V3_DUAL",
+                OrderLeg("A", symbol, direction, order_a_lot, order_a_sl, order_a_tp,
+                         comment=f"V3_A_{plugin_id}_{logic_route}"),
+                OrderLeg("B", symbol, direction, order_b_lot, order_b_sl, order_b_tp,
+                         comment=f"V3_B_{plugin_id}_{logic_route}")
             )
             
             logger.info(
@@ -101,6 +135,7 @@ class OrderExecutionService:
             logger.error(f"[V3_DUAL] Error placing dual orders: {e}")
             return (None, None)
     
+    @traced("orders.place_single_order_a")
     async def place_single_order_a(
         self,
         plugin_id: str,
@@ -156,6 +191,7 @@ class OrderExecutionService:
             logger.error(f"[V6_ORDER_A] Error placing order: {e}")
             return None
     
+    @traced("orders.place_single_order_b")
     async def place_single_order_b(
         self,
         plugin_id: str,
@@ -211,6 +247,7 @@ class OrderExecutionService:
             logger.error(f"[V6_ORDER_B] Error placing order: {e}")
             return None
     
+    @traced("orders.place_dual_orders_v6")
     async def place_dual_orders_v6(
         self,
         plugin_id: str,
@@ -252,24 +289,12 @@ class OrderExecutionService:
                 f"{symbol} {direction} | A={order_a_lot} B={order_b_lot}"
             )
             
-            order_a_ticket = self._mt5.place_order(
-                symbol=symbol,
-                order_type=direction,
-                lot_size=order_a_lot,
-                price=0.0,
-                sl=sl_price,
-                tp=tp2_price,
-                comment=f"V6_A_{plugin_id}_DUAL"
-            )
-            
-            order_b_ticket = self._mt5.place_order(
-                symbol=symbol,
-                order_type=direction,
-                lot_size=order_b_lot,
-                price=0.0,
-                sl=sl_price,
-                tp=tp1_price,
-                comment=f"V6_B_{plugin_id}_DUAL"
+            order_a_ticket, order_b_ticket = await self._place_order_pair(
+                "V6_DUAL",
+                OrderLeg("A", symbol, direction, order_a_lot, sl_price, tp2_price,
+                         comment=f"V6_A_{plugin_id}_DUAL"),
+                OrderLeg("B", symbol, direction, order_b_lot, sl_price, tp1_price,
+                         comment=f"V6_B_{plugin_id}_DUAL")
             )
             
             logger.info(
@@ -282,6 +307,7 @@ class OrderExecutionService:
             logger.error(f"[V6_DUAL] Error placing dual orders: {e}")
             return (None, None)
     
+    @traced("orders.modify_order")
     async def modify_order(
         self,
         plugin_id: str,
@@ -319,6 +345,7 @@ class OrderExecutionService:
             logger.error(f"[MODIFY] Error modifying order {order_id}: {e}")
             return False
     
+    @traced("orders.close_position")
     async def close_position(
         self,
         plugin_id: str,
@@ -354,6 +381,7 @@ class OrderExecutionService:
             logger.error(f"[CLOSE] Error closing position {order_id}: {e}")
             return {"success": False, "error": str(e)}
     
+    @traced("orders.close_position_partial")
     async def close_position_partial(
         self,
         plugin_id: str,
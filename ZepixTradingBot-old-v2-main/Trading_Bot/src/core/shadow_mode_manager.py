@@ -2,16 +2,37 @@
 Shadow Mode Manager
 Runs new plugin system in parallel with legacy without executing trades
 
+Shadow plugins are evaluated by a background worker fed from a bounded
+queue, so the live decision never waits on them (a full queue drops the
+shadow evaluation, never the live signal). The plugin code itself runs
+on a dedicated event loop thread: a slow or CPU-bound shadow plugin
+stalls the shadow thread, not the live loop. Shadow plugins therefore
+must not share loop-bound asyncio objects (locks, queues) with the live
+path; evaluations that do fail and are recorded as errors. Decisions, comparisons and
+virtual orders are kept in fixed-size ring buffers with rolling
+discrepancy statistics, and comparisons can be streamed to a JSONL log.
+
+Config (``shadow_mode`` section):
+- max_tracked_signals: signals whose decisions are kept (default 1000)
+- max_comparisons: comparison/virtual order ring size (default 1000)
+- queue_size: pending shadow evaluations (default 1000)
+- evaluation_timeout: seconds per shadow plugin evaluation (default 5)
+- comparison_log: JSONL file every comparison is appended to (optional)
+
 Part of Plan 11: Shadow Mode Testing
-Version: 1.0.0
+Version: 1.1.0
 Date: 2026-01-15
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterable, Awaitable
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import asyncio
 import logging
 import json
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -64,34 +85,63 @@ class ShadowModeManager:
         self.mode = ExecutionMode.LEGACY_ONLY
         self.execution_mode = ExecutionMode.LEGACY_ONLY  # Alias for compatibility
         
-        # Decision storage
-        self._decisions: Dict[str, List[Decision]] = {}  # signal_id -> decisions
-        self._comparisons: List[ComparisonResult] = []
+        self.max_tracked_signals = self.config.get('max_tracked_signals', 1000)
+        ring_size = self.config.get('max_comparisons', 1000)
+        
+        # Decision storage (ring buffers)
+        self._decisions: "OrderedDict[str, List[Decision]]" = OrderedDict()  # signal_id -> decisions
+        self._comparisons: deque = deque(maxlen=ring_size)
         
         # Statistics
-        self._stats = {
-            'signals_processed': 0,
-            'matches': 0,
-            'discrepancies': 0,
-            'legacy_executes': 0,
-            'plugin_executes': 0,
-            'shadow_signals': 0
-        }
+        self._stats = self._new_stats()
         self.stats = self._stats  # Alias for compatibility
         
+        # Rolling discrepancy counts over the comparison ring, plus all-time totals
+        self._window_counts: Counter = Counter()  # (plugin_id, discrepancy_type or 'match') -> n
+        self._discrepancy_totals: Counter = Counter()  # discrepancy_type -> n
+        
         # Enabled plugins for shadow mode
         self._shadow_plugins: set = set()
         self.registered_plugins: Dict[str, Any] = {}  # Plugin registry
         
         # Virtual orders (shadow trades)
-        self._virtual_orders: List[Dict[str, Any]] = []
+        self._virtual_orders: deque = deque(maxlen=ring_size)
         
         # Execution history and mismatches
-        self.execution_history: List[Dict[str, Any]] = []
-        self.mismatches: List[Dict[str, Any]] = []
+        self.execution_history: deque = deque(maxlen=ring_size)
+        self.mismatches: deque = deque(maxlen=ring_size)
+        
+        # Background shadow evaluation
+        self._queue_size = self.config.get('queue_size', 1000)
+        self._evaluation_timeout = self.config.get('evaluation_timeout', 5.0)
+        self._shadow_queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._shadow_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shadow_thread: Optional[threading.Thread] = None
+        self._evaluator: Optional[Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]] = None
+        self._on_discrepancy: Optional[Callable[[ComparisonResult], Awaitable[None]]] = None
+        
+        # Streaming comparison log (JSONL)
+        self._comparison_log_path: Optional[str] = self.config.get('comparison_log')
+        self._comparison_log = None
         
         logger.info("ShadowModeManager initialized")
     
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {
+            'signals_processed': 0,
+            'matches': 0,
+            'discrepancies': 0,
+            'legacy_executes': 0,
+            'plugin_executes': 0,
+            'shadow_signals': 0,
+            'shadow_queued': 0,
+            'shadow_dropped': 0,
+            'shadow_evaluated': 0,
+            'shadow_errors': 0
+        }
+    
     # ==================== Mode Control ====================
     
     def set_mode(self, mode: ExecutionMode):
@@ -146,10 +196,13 @@ class ShadowModeManager:
     
     def record_decision(self, decision: Decision):
         """Record a trading decision"""
-        if decision.signal_id not in self._decisions:
-            self._decisions[decision.signal_id] = []
+        decisions = self._decisions.get(decision.signal_id)
+        if decisions is None:
+            decisions = self._decisions[decision.signal_id] = []
+            while len(self._decisions) > self.max_tracked_signals:
+                self._decisions.popitem(last=False)
         
-        self._decisions[decision.signal_id].append(decision)
+        decisions.append(decision)
         logger.debug(f"Decision recorded: {decision.source} -> {decision.action}")
     
     def record_legacy_decision(
@@ -224,7 +277,7 @@ class ShadowModeManager:
     
     def get_virtual_orders(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent virtual orders"""
-        return self._virtual_orders[-limit:]
+        return list(self._virtual_orders)[-limit:]
     
     # ==================== Comparison ====================
     
@@ -262,11 +315,27 @@ class ShadowModeManager:
         else:
             self._stats['matches'] += 1
         
-        self._comparisons.append(result)
+        self._record_comparison(result)
         self._stats['signals_processed'] += 1
         
         return result
     
+    def _record_comparison(self, result: ComparisonResult):
+        """Append to the comparison ring, keeping rolling counts in step"""
+        if len(self._comparisons) == self._comparisons.maxlen:
+            oldest = self._comparisons[0]
+            key = (oldest.plugin_decision.source, oldest.discrepancy_type or 'match')
+            self._window_counts[key] -= 1
+            if not self._window_counts[key]:
+                del self._window_counts[key]
+        self._comparisons.append(result)
+        self._window_counts[(result.plugin_decision.source, result.discrepancy_type or 'match')] += 1
+        if not result.match:
+            self._discrepancy_totals[result.discrepancy_type] += 1
+        
+        if self._comparison_log_path:
+            self._stream_comparison(result)
+    
     def _decisions_match(self, legacy: Decision, plugin: Decision) -> bool:
         """Check if two decisions match"""
         # Same action?
@@ -383,11 +452,41 @@ class ShadowModeManager:
     
     def get_recent_mismatches(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get recent mismatches between legacy and plugin decisions"""
-        return self.mismatches[-count:]
+        return list(self.mismatches)[-count:]
     
     def get_execution_history(self, count: int = 100) -> List[Dict[str, Any]]:
         """Get recent execution history"""
-        return self.execution_history[-count:]
+        return list(self.execution_history)[-count:]
+    
+    def get_discrepancy_stats(self) -> Dict[str, Any]:
+        """
+        Rolling discrepancy statistics over the comparison ring buffer.
+        
+        Returns:
+            dict: window size and match rate, discrepancy counts by type
+                  (window and all-time) and per shadow plugin match rates
+        """
+        by_type: Counter = Counter()
+        by_plugin: Dict[str, Dict[str, Any]] = {}
+        for (plugin_id, kind), count in self._window_counts.items():
+            plugin = by_plugin.setdefault(plugin_id, {'compared': 0, 'matches': 0})
+            plugin['compared'] += count
+            if kind == 'match':
+                plugin['matches'] += count
+            else:
+                by_type[kind] += count
+        for plugin in by_plugin.values():
+            plugin['match_rate'] = plugin['matches'] / plugin['compared'] * 100
+        
+        window = len(self._comparisons)
+        mismatched = sum(by_type.values())
+        return {
+            'window': window,
+            'window_match_rate': (window - mismatched) / window * 100 if window else 0,
+            'window_by_type': dict(by_type),
+            'total_by_type': dict(self._discrepancy_totals),
+            'by_plugin': by_plugin
+        }
     
     def generate_report(self) -> str:
         """Generate shadow mode report"""
@@ -411,7 +510,17 @@ Shadow Signals: {stats['shadow_signals']}
 Virtual Orders: {stats['virtual_orders_count']}
 
 Shadow Plugins: {', '.join(stats['shadow_plugins']) or 'None'}
-
+Shadow Evaluations: {stats['shadow_evaluated']} (dropped: {stats['shadow_dropped']}, errors: {stats['shadow_errors']})
+"""
+        rolling = self.get_discrepancy_stats()
+        report += f"""
+=== ROLLING DISCREPANCIES (last {rolling['window']}) ===
+Match Rate: {rolling['window_match_rate']:.1f}%
+"""
+        for kind, count in sorted(rolling['window_by_type'].items(), key=lambda kv: -kv[1]):
+            report += f"{kind}: {count}\n"
+        
+        report += """
 === RECENT DISCREPANCIES ===
 """
         for d in discrepancies:
@@ -427,50 +536,263 @@ Plugin: {d.plugin_decision.action} - {d.plugin_decision.reason}
         
         return report
     
-    def export_comparisons(self, filepath: str):
-        """Export comparisons to JSON file"""
-        data = []
-        for c in self._comparisons:
-            data.append({
-                'signal_id': c.signal_id,
-                'timestamp': c.timestamp.isoformat(),
-                'match': c.match,
-                'discrepancy_type': c.discrepancy_type,
-                'discrepancy_details': c.discrepancy_details,
-                'legacy': {
-                    'action': c.legacy_decision.action,
-                    'reason': c.legacy_decision.reason
-                },
-                'plugin': {
-                    'source': c.plugin_decision.source,
-                    'action': c.plugin_decision.action,
-                    'reason': c.plugin_decision.reason
-                }
-            })
+    @staticmethod
+    def _comparison_to_dict(c: ComparisonResult) -> Dict[str, Any]:
+        return {
+            'signal_id': c.signal_id,
+            'timestamp': c.timestamp.isoformat(),
+            'match': c.match,
+            'discrepancy_type': c.discrepancy_type,
+            'discrepancy_details': c.discrepancy_details,
+            'legacy': {
+                'action': c.legacy_decision.action,
+                'reason': c.legacy_decision.reason
+            },
+            'plugin': {
+                'source': c.plugin_decision.source,
+                'action': c.plugin_decision.action,
+                'reason': c.plugin_decision.reason
+            }
+        }
+    
+    @staticmethod
+    def _write_records(filepath: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Stream records to ``filepath`` one at a time.
         
+        ``.jsonl`` files get one record per line, anything else a compact
+        JSON array; the full export is never built in memory.
+        """
+        count = 0
+        jsonl = filepath.endswith('.jsonl')
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        logger.info(f"Exported {len(data)} comparisons to {filepath}")
+            if not jsonl:
+                f.write('[')
+            for record in records:
+                if jsonl:
+                    f.write(json.dumps(record, default=str) + '\n')
+                else:
+                    f.write((',\n' if count else '\n') + json.dumps(record, default=str))
+                count += 1
+            if not jsonl:
+                f.write('\n]\n')
+        return count
+    
+    def export_comparisons(self, filepath: str):
+        """Export comparisons to a JSON (or ``.jsonl``) file"""
+        count = self._write_records(
+            filepath, (self._comparison_to_dict(c) for c in list(self._comparisons))
+        )
+        logger.info(f"Exported {count} comparisons to {filepath}")
     
     def export_virtual_orders(self, filepath: str):
-        """Export virtual orders to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(self._virtual_orders, f, indent=2)
-        
-        logger.info(f"Exported {len(self._virtual_orders)} virtual orders to {filepath}")
+        """Export virtual orders to a JSON (or ``.jsonl``) file"""
+        count = self._write_records(filepath, list(self._virtual_orders))
+        logger.info(f"Exported {count} virtual orders to {filepath}")
+    
+    def _stream_comparison(self, result: ComparisonResult):
+        """Append one comparison to the JSONL comparison log"""
+        try:
+            if self._comparison_log is None:
+                self._comparison_log = open(self._comparison_log_path, 'a', buffering=1)
+            self._comparison_log.write(json.dumps(self._comparison_to_dict(result), default=str) + '\n')
+        except OSError as e:
+            logger.error(f"Shadow comparison log disabled ({self._comparison_log_path}): {e}")
+            self._comparison_log_path = None
     
     def reset_stats(self):
         """Reset statistics (for testing)"""
-        self._stats = {
-            'signals_processed': 0,
-            'matches': 0,
-            'discrepancies': 0,
-            'legacy_executes': 0,
-            'plugin_executes': 0,
-            'shadow_signals': 0
-        }
+        self._stats = self._new_stats()
+        self.stats = self._stats
         self._decisions.clear()
         self._comparisons.clear()
+        self._window_counts.clear()
+        self._discrepancy_totals.clear()
         self._virtual_orders.clear()
         logger.info("Shadow mode stats reset")
+    
+    # ==================== Background Shadow Evaluation ====================
+    
+    def set_evaluator(
+        self,
+        evaluator: Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]],
+        on_discrepancy: Optional[Callable[[ComparisonResult], Awaitable[None]]] = None
+    ):
+        """
+        Set how shadow plugins are evaluated.
+        
+        Args:
+            evaluator: async (plugin_id, signal_data) -> result dict, or None
+                       if the plugin cannot be evaluated without trading
+            on_discrepancy: async callback for every mismatching comparison
+        """
+        self._evaluator = evaluator
+        self._on_discrepancy = on_discrepancy
+    
+    def submit_shadow(self, signal_data: Dict[str, Any], live_source: str,
+                      live_result: Optional[Dict[str, Any]]) -> bool:
+        """
+        Queue shadow evaluation of a signal the live path has already decided.
+        
+        Never blocks and never raises: when shadow mode is off, nothing is
+        in shadow, or the queue is full, the signal is simply not shadowed.
+        
+        Args:
+            signal_data: Signal as seen by the live plugin
+            live_source: Plugin (or 'legacy') that made the live decision
+            live_result: Live processing result dict
+            
+        Returns:
+            bool: True if queued
+        """
+        if not self._shadow_plugins or self._evaluator is None or not self.is_shadow_mode_active():
+            return False
+        try:
+            if self._shadow_queue is None:
+                self._shadow_queue = asyncio.Queue(maxsize=self._queue_size)
+            if self._worker_task is None or self._worker_task.done():
+                self._worker_task = asyncio.get_running_loop().create_task(self._shadow_worker())
+            self._shadow_queue.put_nowait((dict(signal_data), live_source, live_result, time.time()))
+        except asyncio.QueueFull:
+            self._stats['shadow_dropped'] += 1
+            return False
+        except RuntimeError:
+            # No running event loop: shadowing is only available in async contexts
+            return False
+        self._stats['shadow_queued'] += 1
+        return True
+    
+    async def _shadow_worker(self):
+        """Evaluate queued signals with every shadow plugin, one at a time"""
+        while True:
+            item = await self._shadow_queue.get()
+            try:
+                await self._evaluate_shadow(*item)
+            except Exception as e:
+                self._stats['shadow_errors'] += 1
+                logger.error(f"Shadow evaluation failed: {e}")
+            finally:
+                self._shadow_queue.task_done()
+    
+    async def _evaluate_shadow(self, signal_data: Dict[str, Any], live_source: str,
+                               live_result: Optional[Dict[str, Any]], queued_at: float):
+        signal_id = str(
+            signal_data.get('signal_id') or signal_data.get('id')
+            or f"{signal_data.get('symbol', 'UNKNOWN')}_{queued_at:.6f}"
+        )
+        action, reason, order_params = self._result_to_decision(live_result)
+        self.record_decision(Decision(
+            source='legacy', signal_id=signal_id, timestamp=datetime.fromtimestamp(queued_at),
+            action=action, reason=reason, order_params=order_params,
+            metadata={'live_source': live_source}
+        ))
+        
+        for plugin_id in list(self._shadow_plugins):
+            if plugin_id == live_source:
+                continue
+            try:
+                result = await self._run_evaluator(plugin_id, dict(signal_data))
+            except asyncio.TimeoutError:
+                result = {'status': 'error', 'message': 'shadow_timeout'}
+            except Exception as e:
+                result = {'status': 'error', 'message': str(e)}
+            if result is None:
+                continue
+            if result.get('status') == 'error':
+                self._stats['shadow_errors'] += 1
+            
+            action, reason, order_params = self._result_to_decision(result)
+            self.record_plugin_decision(plugin_id, signal_id, action, reason, order_params)
+            if action == 'execute':
+                self.record_virtual_order(plugin_id, signal_id, order_params or {})
+            self._stats['shadow_evaluated'] += 1
+            
+            comparison = self.compare_decisions(signal_id)
+            if comparison is not None and not comparison.match and self._on_discrepancy:
+                try:
+                    await self._on_discrepancy(comparison)
+                except Exception as e:
+                    logger.warning(f"Shadow discrepancy callback failed: {e}")
+            # Next plugin's comparison pairs with the live decision again
+            decisions = self._decisions.get(signal_id)
+            if decisions is not None:
+                decisions[:] = [d for d in decisions if d.source == 'legacy']
+    
+    @staticmethod
+    def _result_to_decision(result: Optional[Dict[str, Any]]) -> tuple:
+        """Map a plugin result dict to (action, reason, order_params)"""
+        if not result:
+            return 'skip', 'no_result', None
+        status = str(result.get('status', '')).lower()
+        if status in ('success', 'executed', 'shadow'):
+            action = 'execute'
+        elif status == 'error':
+            action = 'error'
+        elif status in ('rejected', 'blocked'):
+            action = 'reject'
+        else:
+            action = 'skip'
+        reason = str(result.get('message') or result.get('reason') or status or 'unknown')
+        order_params = {
+            key: result[key] for key in ('symbol', 'direction', 'lot_size', 'sl_pips', 'tp_pips')
+            if key in result
+        }
+        return action, reason, order_params or None
+    
+    async def _run_evaluator(self, plugin_id: str, signal_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Evaluate one shadow plugin on the shadow loop (bounded by evaluation_timeout)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self._evaluator(plugin_id, signal_data), self._get_shadow_loop()
+        )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._evaluation_timeout)
+        finally:
+            future.cancel()  # no-op once done; stops a timed out plugin on the shadow loop
+    
+    def _get_shadow_loop(self) -> asyncio.AbstractEventLoop:
+        if self._shadow_loop is None:
+            loop = asyncio.new_event_loop()
+            self._shadow_thread = threading.Thread(
+                target=loop.run_forever, name="ShadowEvaluator", daemon=True
+            )
+            self._shadow_thread.start()
+            self._shadow_loop = loop
+        return self._shadow_loop
+    
+    @staticmethod
+    async def _cancel_pending():
+        """Cancel shadow evaluations still running on the shadow loop"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def drain(self):
+        """Wait until every queued shadow evaluation has finished"""
+        if self._shadow_queue is not None and self._worker_task is not None:
+            await self._shadow_queue.join()
+    
+    async def stop(self):
+        """Stop the shadow worker and close the comparison log"""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        if self._shadow_loop is not None:
+            try:
+                await asyncio.wait_for(asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                    self._cancel_pending(), self._shadow_loop)), self._evaluation_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Shadow evaluator did not finish cancelling")
+            self._shadow_loop.call_soon_threadsafe(self._shadow_loop.stop)
+            await asyncio.to_thread(self._shadow_thread.join, self._evaluation_timeout)
+            if not self._shadow_thread.is_alive():
+                self._shadow_loop.close()
+            self._shadow_loop = None
+            self._shadow_thread = None
+        if self._comparison_log is not None:
+            self._comparison_log.close()
+            self._comparison_log = None
@@ -0,0 +1,276 @@
+"""
+State Snapshot - Warm-Restart Snapshots of In-Memory Trading State
+Periodic, incremental snapshot of manager state to a compact binary file
+
+State that is not in the database or on the broker (pending SL hunt /
+TP / exit continuation re-entries, recovery window monitors, recent
+alerts for duplicate detection, re-entry chains) is captured by named
+sections and restored on boot, so a redeploy resumes monitoring
+immediately instead of starting from an empty slate.
+
+File format: MAGIC header followed by a pickled dict of
+{section name: zlib-compressed pickle}. Sections are re-pickled every
+cycle on the event loop (so state is not mutated mid-pickle) but only
+recompressed - and the file only rewritten - when their bytes changed.
+The periodic loop compresses and writes in a worker thread; writes go to
+a temp file, are fsynced and renamed into place.
+
+Each participating manager exposes ``export_snapshot_state()`` and
+``restore_snapshot_state(state)``; ``register_engine_sections`` wires the
+TradingEngine's managers into a store.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, Callable, List
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
+import logging
+import os
+import pickle
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b"ZPXSNAP1"
+DEFAULT_SNAPSHOT_PATH = "data/state_snapshot.bin"
+
+
+@dataclass
+class SnapshotSection:
+    """One named piece of in-memory state"""
+    name: str
+    capture: Callable[[], Any]
+    restore: Callable[[Any], Any]
+
+
+class StateSnapshotStore:
+    """
+    Captures registered sections to disk and restores them on boot.
+
+    Usage:
+        store = StateSnapshotStore("data/state_snapshot.bin", interval=2.0)
+        store.register("price_monitor", monitor.export_snapshot_state,
+                       monitor.restore_snapshot_state)
+        store.restore_all()          # on boot, before monitors start
+        await store.start()          # periodic saves
+        await store.stop()           # final save on shutdown
+    """
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH, interval: float = 2.0,
+                 max_age_seconds: float = 3600.0):
+        """
+        Args:
+            path: Snapshot file
+            interval: Seconds between save cycles
+            max_age_seconds: Snapshots older than this are not restored
+        """
+        self.path = path
+        self.interval = interval
+        self.max_age_seconds = max_age_seconds
+        self.sections: Dict[str, SnapshotSection] = {}
+        self._blobs: Dict[str, bytes] = {}      # compressed section bytes
+        self._raw: Dict[str, bytes] = {}        # last pickled bytes, for change detection
+        self._write_lock = threading.Lock()     # one writer of the file and _blobs
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self.stats = {"saves": 0, "skipped": 0, "sections_written": 0, "errors": 0,
+                      "last_save_ms": 0.0, "last_size_bytes": 0, "restored": []}
+
+    def register(self, name: str, capture: Callable[[], Any], restore: Callable[[Any], Any]):
+        self.sections[name] = SnapshotSection(name, capture, restore)
+
+    # -------------------- Save --------------------
+
+    def capture(self) -> Dict[str, bytes]:
+        """Re-pickle every section; returns the pickled bytes of those that changed"""
+        changed = {}
+        for name, section in self.sections.items():
+            try:
+                raw = pickle.dumps(section.capture(), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                # Keep the previous blob so one bad value does not lose the section
+                self.stats["errors"] += 1
+                logger.warning(f"[StateSnapshot] Could not capture {name}: {e}")
+                continue
+            if self._raw.get(name) != raw:
+                self._raw[name] = raw
+                changed[name] = raw
+        return changed
+
+    def save(self, force: bool = False) -> bool:
+        """Write the snapshot if any section changed (or ``force``)"""
+        start = time.perf_counter()
+        changed = self.capture()
+        if not changed and not force:
+            self.stats["skipped"] += 1
+            return False
+        return self._write(changed, start)
+
+    def _write(self, changed: Dict[str, bytes], start: float) -> bool:
+        """Compress the changed sections and replace the file (safe off the loop thread)"""
+        with self._write_lock:
+            for name, raw in changed.items():
+                self._blobs[name] = zlib.compress(raw, 1)
+            payload = MAGIC + pickle.dumps({
+                "version": 1,
+                "saved_at": time.time(),
+                "sections": dict(self._blobs),
+            }, protocol=pickle.HIGHEST_PROTOCOL)
+            written = self._replace_file(payload, len(changed), start)
+        if not written:
+            for name in changed:
+                self._raw.pop(name, None)  # rewrite these sections next cycle
+        return written
+
+    def _replace_file(self, payload: bytes, sections_changed: int, start: float) -> bool:
+        """Write ``payload`` to a temp file, fsync it and rename it into place"""
+        directory = os.path.dirname(self.path)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.error(f"[StateSnapshot] Write failed: {e}")
+            return False
+
+        self.stats["saves"] += 1
+        self.stats["sections_written"] += sections_changed
+        self.stats["last_save_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        self.stats["last_size_bytes"] = len(payload)
+        return True
+
+    # -------------------- Restore --------------------
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read and decode the snapshot file (None if missing, stale or corrupt)"""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"[StateSnapshot] Could not read {self.path}: {e}")
+            return None
+
+        if not data.startswith(MAGIC):
+            logger.warning(f"[StateSnapshot] {self.path} is not a snapshot file, ignoring")
+            return None
+        try:
+            envelope = pickle.loads(data[len(MAGIC):])
+        except Exception as e:
+            logger.warning(f"[StateSnapshot] Corrupt snapshot, ignoring: {e}")
+            return None
+
+        age = time.time() - envelope.get("saved_at", 0)
+        if self.max_age_seconds and age > self.max_age_seconds:
+            logger.info(f"[StateSnapshot] Snapshot is {age:.0f}s old, not restoring")
+            return None
+
+        sections = {}
+        for name, blob in envelope.get("sections", {}).items():
+            try:
+                sections[name] = pickle.loads(zlib.decompress(blob))
+            except Exception as e:
+                logger.warning(f"[StateSnapshot] Section {name} unreadable: {e}")
+        return {"saved_at": envelope.get("saved_at"), "sections": sections}
+
+    def restore_all(self) -> List[str]:
+        """Restore every registered section found in the snapshot"""
+        start = time.perf_counter()
+        snapshot = self.load()
+        if snapshot is None:
+            return []
+
+        restored = []
+        for name, state in snapshot["sections"].items():
+            section = self.sections.get(name)
+            if section is None:
+                continue
+            try:
+                section.restore(state)
+                restored.append(name)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"[StateSnapshot] Restore of {name} failed: {e}")
+
+        self.stats["restored"] = restored
+        saved_at = datetime.fromtimestamp(snapshot["saved_at"]).isoformat(timespec="seconds")
+        logger.info(
+            f"[StateSnapshot] Restored {len(restored)} sections from {saved_at} "
+            f"in {(time.perf_counter() - start) * 1000:.1f}ms: {restored}"
+        )
+        return restored
+
+    # -------------------- Background Loop --------------------
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the loop and write a final snapshot"""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.save()
+
+    async def _run(self):
+        while self._running:
+            await asyncio.sleep(self.interval)
+            try:
+                # Capture on the loop thread so state is not mutated mid-pickle;
+                # compression, write and fsync run in a worker thread
+                start = time.perf_counter()
+                changed = self.capture()
+                if changed:
+                    await asyncio.to_thread(self._write, changed, start)
+                else:
+                    self.stats["skipped"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"[StateSnapshot] Save cycle failed: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "interval": self.interval,
+            "sections": list(self.sections),
+            "running": self._running,
+            **self.stats,
+        }
+
+
+# ==================== Engine Wiring ====================
+
+def register_engine_sections(store: StateSnapshotStore, engine) -> StateSnapshotStore:
+    """Register the TradingEngine managers that keep state only in memory"""
+    candidates = {
+        "price_monitor": getattr(engine, "price_monitor", None),
+        "reentry_manager": getattr(engine, "reentry_manager", None),
+        "alert_processor": getattr(engine, "alert_processor", None),
+        "recovery_monitor": getattr(getattr(engine, "autonomous_manager", None), "recovery_monitor", None),
+    }
+    for name, manager in candidates.items():
+        if manager is not None and hasattr(manager, "export_snapshot_state"):
+            store.register(name, manager.export_snapshot_state, manager.restore_snapshot_state)
+    return store
@@ -7,6 +7,7 @@ from src.v3_alert_models import ZepixV3Alert, V3AlertResponse
 from src.config import Config
 from src.managers.risk_manager import RiskManager
 from src.clients.mt5_client import MT5Client
+from src.clients.order_pipeline import OrderLeg, supports_order_batch
 from src.processors.alert_processor import AlertProcessor
 from src.database import TradeDatabase
 from src.utils.pip_calculator import PipCalculator
@@ -25,6 +26,9 @@ from src.core.plugin_system.service_api import ServiceAPI
 # from src.telegram.multi_telegram_manager import MultiTelegramManager # REMOVED LEAGCY
 from src.telegram.core.multi_bot_manager import MultiBotManager
 from src.core.shadow_mode_manager import ShadowModeManager, ExecutionMode
+from src.core.state_snapshot import StateSnapshotStore, register_engine_sections
+from src.monitoring.metrics_registry import PLUGIN_PROCESSING_LATENCY
+from src.monitoring.tracing import get_tracer, traced
 from src.modules.voice_alert_system import VoiceAlertSystem, AlertPriority
 from src.modules.fixed_clock_system import get_clock_system
 import json
@@ -102,6 +106,16 @@ class TradingEngine:
             config, mt5_client, telegram_bot, self.db, price_monitor=self.price_monitor
         )
         
+        # Warm-restart snapshots of state that only lives in memory
+        snapshot_config = self.config.get("state_snapshot", {})
+        self.state_snapshots = None
+        if snapshot_config.get("enabled", True):
+            self.state_snapshots = register_engine_sections(StateSnapshotStore(
+                path=snapshot_config.get("path", "data/state_snapshot.bin"),
+                interval=snapshot_config.get("interval_seconds", 2.0),
+                max_age_seconds=snapshot_config.get("max_age_seconds", 3600)
+            ), self)
+        
         # Current signals per symbol
         self.current_signals = {}
         
@@ -127,6 +141,7 @@ class TradingEngine:
         # Plan 11: Initialize Shadow Mode Manager
         shadow_config = self.config.get("shadow_mode", {})
         self.shadow_manager = ShadowModeManager(shadow_config)
+        self.shadow_manager.set_evaluator(self._evaluate_shadow_plugin, self._notify_discrepancy)
         
         # Plan 07: Initialize Multi-Telegram Manager (3-Bot System)
         # self.telegram_manager: Optional[MultiTelegramManager] = None
@@ -312,6 +327,19 @@ class TradingEngine:
                 order_params=order_params or {}
             )
     
+    async def _evaluate_shadow_plugin(self, plugin_id: str, signal_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run a shadow plugin on a copy of a live signal.
+        
+        Called only from the shadow manager's background worker. Plugins
+        that are not in their own shadow mode would place real orders, so
+        they are skipped (None).
+        """
+        plugin = self.plugin_registry.get_plugin(plugin_id)
+        if plugin is None or not getattr(plugin, 'shadow_mode', False):
+            return None
+        return await self._dispatch_to_plugin(plugin, signal_data)
+    
     # ==================== End Plan 11 Shadow Mode Methods ====================
     
     def get_open_trades(self) -> List[Trade]:
@@ -333,6 +361,7 @@ class TradingEngine:
             if self.config.get("plugin_system", {}).get("enabled", True):
                 self.plugin_registry.discover_plugins()
                 self.plugin_registry.load_all_plugins()
+                await self.plugin_registry.start_workers()
 
             self.telegram_bot.set_trend_manager(self.trend_manager)
             
@@ -352,6 +381,11 @@ class TradingEngine:
                 f"  SL Reduction Per Level: {re_entry_config.get('sl_reduction_per_level', 0.5)}"
             )
             
+            # Resume pending re-entries, monitors and chains from the last snapshot
+            if self.state_snapshots:
+                self.state_snapshots.restore_all()
+                await self.state_snapshots.start()
+            
             # Start background price monitor
             await self.price_monitor.start()
             
@@ -385,6 +419,7 @@ class TradingEngine:
                 '1d': None
             }
 
+    @traced("engine.delegate_to_plugin")
     async def delegate_to_plugin(self, signal_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Delegate signal processing to the appropriate plugin.
@@ -407,35 +442,47 @@ class TradingEngine:
         logger.info(f"🔌 Delegating signal to plugin: {plugin.plugin_id}")
         
         # Process signal through plugin
+        start = time.perf_counter()
         try:
-            # Determine signal type and route to appropriate handler
-            alert_type = signal_data.get('type', '')
-            
-            if 'entry' in alert_type.lower():
-                result = await plugin.process_entry_signal(signal_data)
-            elif 'exit' in alert_type.lower():
-                result = await plugin.process_exit_signal(signal_data)
-            elif 'reversal' in alert_type.lower():
-                result = await plugin.process_reversal_signal(signal_data)
-            else:
-                # Generic signal processing
-                if hasattr(plugin, 'process_signal'):
-                    result = await plugin.process_signal(signal_data)
-                else:
-                    result = await plugin.process_entry_signal(signal_data)
+            result = await self._dispatch_to_plugin(plugin, signal_data)
             
             # Track metrics
+            PLUGIN_PROCESSING_LATENCY.labels(plugin_id=plugin.plugin_id, status='success').observe(
+                time.perf_counter() - start
+            )
             self._track_plugin_execution(plugin.plugin_id, signal_data, result)
             
+            # Shadow plugins see the same signal later, off the live path
+            self.shadow_manager.submit_shadow(signal_data, plugin.plugin_id, result)
+            
             return result if result else {"status": "error", "message": "plugin_returned_none"}
             
         except Exception as e:
+            PLUGIN_PROCESSING_LATENCY.labels(plugin_id=plugin.plugin_id, status='error').observe(
+                time.perf_counter() - start
+            )
             logger.error(f"Plugin {plugin.plugin_id} failed to process signal: {e}")
             import traceback
             traceback.print_exc()
             self._handle_plugin_failure(plugin.plugin_id, e)
             return {"status": "error", "message": str(e)}
 
+    async def _dispatch_to_plugin(self, plugin, signal_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Route a signal to the plugin handler for its alert type"""
+        alert_type = signal_data.get('type', '')
+        
+        if 'entry' in alert_type.lower():
+            return await plugin.process_entry_signal(signal_data)
+        elif 'exit' in alert_type.lower():
+            return await plugin.process_exit_signal(signal_data)
+        elif 'reversal' in alert_type.lower():
+            return await plugin.process_reversal_signal(signal_data)
+        
+        # Generic signal processing
+        if hasattr(plugin, 'process_signal'):
+            return await plugin.process_signal(signal_data)
+        return await plugin.process_entry_signal(signal_data)
+
     def _track_plugin_execution(self, plugin_id: str, signal_data: Dict, result: Dict):
         """Track plugin execution for metrics and debugging"""
         execution_record = {
@@ -481,8 +528,11 @@ class TradingEngine:
             return False
         return True
 
+    @traced("process_alert", root=True)
     async def process_alert(self, data: Dict[str, Any]) -> bool:
         """Enhanced alert router with v3 support"""
+        if isinstance(data, dict):
+            get_tracer().tag_trace(alert_type=data.get('type'), symbol=data.get('symbol'))
         
         # PLUGIN HOOK: on_signal_received
         # Allow plugins to modify or reject the signal
@@ -733,6 +783,7 @@ class TradingEngine:
             traceback.print_exc()
             return False
     
+    @traced("engine.execute_v3_entry")
     async def execute_v3_entry(self, alert: ZepixV3Alert) -> dict:
         """
         Execute v3 entry signal with hybrid dual-order strategy
@@ -857,6 +908,7 @@ class TradingEngine:
             return self.config.get("combinedlogic-3", {}).get("lot_multiplier", 0.625)
         return 1.0
     
+    @traced("engine.place_hybrid_dual_orders_v3")
     async def _place_hybrid_dual_orders_v3(self, alert: ZepixV3Alert, 
                                             order_a_lot: float, 
                                             order_b_lot: float,
@@ -971,7 +1023,25 @@ class TradingEngine:
             order_a_placed = False
             order_b_placed = False
             
-            if not self.config.get("simulate_orders", False):
+            if not self.config.get("simulate_orders", False) and supports_order_batch(self.mt5_client):
+                # Both legs from one symbol snapshot, sent back-to-back;
+                # Order A is closed again if Order B fails
+                batch = await asyncio.to_thread(self.mt5_client.place_order_batch, [
+                    OrderLeg("A", alert.symbol, alert.direction, order_a_lot,
+                             sl_price_a, tp_price_a, comment=f"{logic_type}_V3_A"),
+                    OrderLeg("B", alert.symbol, alert.direction, order_b_lot,
+                             sl_price_b, tp_price_b, comment=f"{logic_type}_V3_B"),
+                ])
+                trade_id_a, trade_id_b = batch.tickets
+                if trade_id_a:
+                    order_a.trade_id = trade_id_a
+                    order_a_placed = True
+                if trade_id_b:
+                    order_b.trade_id = trade_id_b
+                    order_b_placed = True
+                if not batch.success:
+                    logger.error(f"V3 dual order batch failed: {batch.error}")
+            elif not self.config.get("simulate_orders", False):
                 # Place Order A
                 trade_id_a = self.mt5_client.place_order(
                     symbol=alert.symbol,
@@ -1090,6 +1160,7 @@ class TradingEngine:
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
     
+    @traced("engine.handle_v3_exit")
     async def handle_v3_exit(self, alert: 'ZepixV3Alert') -> dict:
         """
         Handle v3 exit signals (Bullish_Exit, Bearish_Exit)
@@ -1231,6 +1302,7 @@ class TradingEngine:
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
     
+    @traced("engine.handle_v3_reversal")
     async def handle_v3_reversal(self, alert: 'ZepixV3Alert') -> dict:
         """
         Handle aggressive reversals for high-conviction signals
@@ -2251,6 +2323,7 @@ class TradingEngine:
         
         return False
 
+    @traced("engine.close_trade")
     async def close_trade(self, trade: Trade, reason: str, current_price: float):
         """Close a trade"""
         notification_sent = False
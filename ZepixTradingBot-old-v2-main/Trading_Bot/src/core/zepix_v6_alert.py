@@ -479,8 +479,9 @@ class V6AlertFactory:
     
     @staticmethod
     def from_payload(payload: str) -> ZepixV6Alert:
-        """Create from pipe-delimited payload"""
-        return parse_v6_payload(payload)
+        """Create from pipe-delimited payload (single-pass tokenizer)"""
+        from src.utils.fast_signal_parser import parse_v6_payload_fast
+        return parse_v6_payload_fast(payload)
     
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> ZepixV6Alert:
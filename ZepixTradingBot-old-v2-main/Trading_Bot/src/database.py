@@ -1,240 +1,288 @@
 import sqlite3
-from datetime import datetime, date
+import json
+from datetime import datetime, date, timedelta
 from src.models import Trade, ReEntryChain
 from typing import List, Dict, Any
+from src.monitoring.metrics_registry import DB_WRITE_LATENCY, timed
+from src.monitoring.tracing import traced
+from src.database.connection_manager import get_connection_manager
 
 class TradeDatabase:
+    # Incremental session summary (trading_sessions columns beyond total_pnl/total_trades)
+    SESSION_SUMMARY_COLUMNS = [
+        ("wins", "INTEGER DEFAULT 0"),
+        ("losses", "INTEGER DEFAULT 0"),
+        ("total_profit", "REAL DEFAULT 0"),
+        ("total_loss", "REAL DEFAULT 0"),
+        ("dual_orders", "INTEGER DEFAULT 0"),
+        ("profit_chains", "INTEGER DEFAULT 0"),
+        ("reentries", "INTEGER DEFAULT 0")
+    ]
+    SESSION_LIST_COLUMNS = (
+        "session_id, symbol, direction, entry_signal, exit_reason, start_time, end_time, "
+        "total_pnl, total_trades, status, wins, losses, total_profit, total_loss, "
+        "dual_orders, profit_chains, reentries"
+    )
+    DUAL_ORDER_TYPES = ("DUAL_A", "DUAL_B")
+
     def __init__(self):
-        self.conn = sqlite3.connect('data/trading_bot.db', check_same_thread=False, timeout=30.0)
-        # Enable WAL mode for better concurrency (as per 10_DATABASE_SCHEMA.md)
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        # Enable foreign key constraints
-        self.conn.execute("PRAGMA foreign_keys=ON")
+        # Managed database with WAL and the common pragmas (as per
+        # 10_DATABASE_SCHEMA.md) plus foreign key constraints. Queries here go
+        # through its writer lock and reader pool.
+        self.db = get_connection_manager().database('data/trading_bot.db', pragmas={"foreign_keys": "ON"})
+        # Legacy handle for callers that still run their own statements and
+        # commits (session manager, trend services, exporters). Their writes
+        # bypass the writer lock, so trading_bot.db is not single-writer.
+        self.conn = self.db.dedicated_connection()
         self.create_tables()
         self.create_indexes()  # Create indexes for query performance
 
     def create_tables(self):
-        cursor = self.conn.cursor()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
         
-        # Main trades table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY,
-                trade_id TEXT,
-                symbol TEXT,
-                entry_price REAL,
-                exit_price REAL,
-                sl_price REAL,
-                tp_price REAL,
-                lot_size REAL,
-                direction TEXT,
-                strategy TEXT,
-                pnl REAL,
-                commission REAL,
-                swap REAL,
-                comment TEXT,
-                status TEXT,
-                open_time DATETIME,
-                close_time DATETIME,
-                chain_id TEXT,
-                chain_level INTEGER,
-                is_re_entry BOOLEAN,
-                order_type TEXT,
-                profit_chain_id TEXT,
-                profit_level INTEGER DEFAULT 0,
-                session_id TEXT,
-                sl_adjusted INTEGER DEFAULT 0,
-                original_sl_distance REAL DEFAULT 0.0,
-                logic_type TEXT,
-                base_lot_size REAL DEFAULT 0.0,
-                final_lot_size REAL DEFAULT 0.0,
-                base_sl_pips REAL DEFAULT 0.0,
-                final_sl_pips REAL DEFAULT 0.0,
-                lot_multiplier REAL DEFAULT 1.0,
-                sl_multiplier REAL DEFAULT 1.0
-            )
-        ''')
+            # Main trades table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trades (
+                    id INTEGER PRIMARY KEY,
+                    trade_id TEXT,
+                    symbol TEXT,
+                    entry_price REAL,
+                    exit_price REAL,
+                    sl_price REAL,
+                    tp_price REAL,
+                    lot_size REAL,
+                    direction TEXT,
+                    strategy TEXT,
+                    pnl REAL,
+                    commission REAL,
+                    swap REAL,
+                    comment TEXT,
+                    status TEXT,
+                    open_time DATETIME,
+                    close_time DATETIME,
+                    chain_id TEXT,
+                    chain_level INTEGER,
+                    is_re_entry BOOLEAN,
+                    order_type TEXT,
+                    profit_chain_id TEXT,
+                    profit_level INTEGER DEFAULT 0,
+                    session_id TEXT,
+                    sl_adjusted INTEGER DEFAULT 0,
+                    original_sl_distance REAL DEFAULT 0.0,
+                    logic_type TEXT,
+                    base_lot_size REAL DEFAULT 0.0,
+                    final_lot_size REAL DEFAULT 0.0,
+                    base_sl_pips REAL DEFAULT 0.0,
+                    final_sl_pips REAL DEFAULT 0.0,
+                    lot_multiplier REAL DEFAULT 1.0,
+                    sl_multiplier REAL DEFAULT 1.0
+                )
+            ''')
         
-        # Add new columns if they don't exist (for existing databases)
-        try:
-            cursor.execute('ALTER TABLE trades ADD COLUMN order_type TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # Add new columns if they don't exist (for existing databases)
+            try:
+                cursor.execute('ALTER TABLE trades ADD COLUMN order_type TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
         
-        try:
-            cursor.execute('ALTER TABLE trades ADD COLUMN profit_chain_id TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            try:
+                cursor.execute('ALTER TABLE trades ADD COLUMN profit_chain_id TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
         
-        try:
-            cursor.execute('ALTER TABLE trades ADD COLUMN profit_level INTEGER DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            try:
+                cursor.execute('ALTER TABLE trades ADD COLUMN profit_level INTEGER DEFAULT 0')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
         
-        try:
-            cursor.execute('ALTER TABLE trades ADD COLUMN session_id TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            try:
+                cursor.execute('ALTER TABLE trades ADD COLUMN session_id TEXT')
+            except sqlite3.OperationalError:
+                pass  # Column already exists
 
-        # Add new columns for timeframe logic if they don't exist
-        db_columns_to_add = [
-            ("commission", "REAL"),
-            ("swap", "REAL"),
-            ("comment", "TEXT"),
-            ("sl_adjusted", "INTEGER DEFAULT 0"),
-            ("original_sl_distance", "REAL DEFAULT 0.0"),
-            ("logic_type", "TEXT"),
-            ("base_lot_size", "REAL DEFAULT 0.0"),
-            ("final_lot_size", "REAL DEFAULT 0.0"),
-            ("base_sl_pips", "REAL DEFAULT 0.0"),
-            ("final_sl_pips", "REAL DEFAULT 0.0"),
-            ("lot_multiplier", "REAL DEFAULT 1.0"),
-            ("sl_multiplier", "REAL DEFAULT 1.0")
-        ]
-        
-        cursor.execute("PRAGMA table_info(trades)")
-        existing_columns = [info[1] for info in cursor.fetchall()]
+            # Add new columns for timeframe logic if they don't exist
+            db_columns_to_add = [
+                ("commission", "REAL"),
+                ("swap", "REAL"),
+                ("comment", "TEXT"),
+                ("sl_adjusted", "INTEGER DEFAULT 0"),
+                ("original_sl_distance", "REAL DEFAULT 0.0"),
+                ("logic_type", "TEXT"),
+                ("base_lot_size", "REAL DEFAULT 0.0"),
+                ("final_lot_size", "REAL DEFAULT 0.0"),
+                ("base_sl_pips", "REAL DEFAULT 0.0"),
+                ("final_sl_pips", "REAL DEFAULT 0.0"),
+                ("lot_multiplier", "REAL DEFAULT 1.0"),
+                ("sl_multiplier", "REAL DEFAULT 1.0")
+            ]
+        
+            cursor.execute("PRAGMA table_info(trades)")
+            existing_columns = [info[1] for info in cursor.fetchall()]
 
-        for col_name, col_type in db_columns_to_add:
-            if col_name not in existing_columns:
-                print(f"Migrating database: Adding {col_name} to trades table...")
-                try:
-                    cursor.execute(f"ALTER TABLE trades ADD COLUMN {col_name} {col_type}")
-                except sqlite3.OperationalError as e:
-                    print(f"Error adding column {col_name}: {e}")
+            for col_name, col_type in db_columns_to_add:
+                if col_name not in existing_columns:
+                    print(f"Migrating database: Adding {col_name} to trades table...")
+                    try:
+                        cursor.execute(f"ALTER TABLE trades ADD COLUMN {col_name} {col_type}")
+                    except sqlite3.OperationalError as e:
+                        print(f"Error adding column {col_name}: {e}")
+        
+            # Re-entry chains table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS reentry_chains (
+                    chain_id TEXT PRIMARY KEY,
+                    symbol TEXT,
+                    direction TEXT,
+                    original_entry REAL,
+                    original_sl_distance REAL,
+                    max_level_reached INTEGER,
+                    total_profit REAL,
+                    status TEXT,
+                    created_at DATETIME,
+                    completed_at DATETIME
+                )
+            ''')
         
-        # Re-entry chains table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reentry_chains (
-                chain_id TEXT PRIMARY KEY,
-                symbol TEXT,
-                direction TEXT,
-                original_entry REAL,
-                original_sl_distance REAL,
-                max_level_reached INTEGER,
-                total_profit REAL,
-                status TEXT,
-                created_at DATETIME,
-                completed_at DATETIME
-            )
-        ''')
+            # SL hunting events table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sl_events (
+                    id INTEGER PRIMARY KEY,
+                    trade_id TEXT,
+                    symbol TEXT,
+                    sl_price REAL,
+                    original_entry REAL,
+                    hit_time DATETIME,
+                    recovery_attempted BOOLEAN,
+                    recovery_successful BOOLEAN
+                )
+            ''')
         
-        # SL hunting events table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sl_events (
-                id INTEGER PRIMARY KEY,
-                trade_id TEXT,
-                symbol TEXT,
-                sl_price REAL,
-                original_entry REAL,
-                hit_time DATETIME,
-                recovery_attempted BOOLEAN,
-                recovery_successful BOOLEAN
-            )
-        ''')
+            # TP re-entry tracking table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tp_reentry_events (
+                    id INTEGER PRIMARY KEY,
+                    chain_id TEXT,
+                    symbol TEXT,
+                    tp_level INTEGER,
+                    tp_price REAL,
+                    reentry_price REAL,
+                    sl_reduction_percent REAL,
+                    pnl REAL,
+                    timestamp DATETIME
+                )
+            ''')
         
-        # TP re-entry tracking table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tp_reentry_events (
-                id INTEGER PRIMARY KEY,
-                chain_id TEXT,
-                symbol TEXT,
-                tp_level INTEGER,
-                tp_price REAL,
-                reentry_price REAL,
-                sl_reduction_percent REAL,
-                pnl REAL,
-                timestamp DATETIME
-            )
-        ''')
+            # Reversal exit events table  
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS reversal_exit_events (
+                    id INTEGER PRIMARY KEY,
+                    trade_id TEXT,
+                    symbol TEXT,
+                    exit_price REAL,
+                    exit_signal TEXT,
+                    pnl REAL,
+                    timestamp DATETIME
+                )
+            ''')
         
-        # Reversal exit events table  
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reversal_exit_events (
-                id INTEGER PRIMARY KEY,
-                trade_id TEXT,
-                symbol TEXT,
-                exit_price REAL,
-                exit_signal TEXT,
-                pnl REAL,
-                timestamp DATETIME
-            )
-        ''')
+            # System state table for pause/resume control
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS system_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    updated_at DATETIME
+                )
+            ''')
         
-        # System state table for pause/resume control
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS system_state (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at DATETIME
-            )
-        ''')
+            # Profit booking chains table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS profit_booking_chains (
+                    chain_id TEXT PRIMARY KEY,
+                    symbol TEXT NOT NULL,
+                    direction TEXT NOT NULL,
+                    base_lot REAL NOT NULL,
+                    current_level INTEGER DEFAULT 0,
+                    total_profit REAL DEFAULT 0,
+                    status TEXT DEFAULT 'ACTIVE',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        # Profit booking chains table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS profit_booking_chains (
-                chain_id TEXT PRIMARY KEY,
-                symbol TEXT NOT NULL,
-                direction TEXT NOT NULL,
-                base_lot REAL NOT NULL,
-                current_level INTEGER DEFAULT 0,
-                total_profit REAL DEFAULT 0,
-                status TEXT DEFAULT 'ACTIVE',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+            # Profit booking orders table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS profit_booking_orders (
+                    order_id TEXT PRIMARY KEY,
+                    chain_id TEXT,
+                    level INTEGER,
+                    profit_target REAL,
+                    sl_reduction INTEGER,
+                    status TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (chain_id) REFERENCES profit_booking_chains(chain_id)
+                )
+            ''')
         
-        # Profit booking orders table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS profit_booking_orders (
-                order_id TEXT PRIMARY KEY,
-                chain_id TEXT,
-                level INTEGER,
-                profit_target REAL,
-                sl_reduction INTEGER,
-                status TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (chain_id) REFERENCES profit_booking_chains(chain_id)
-            )
-        ''')
+            # Profit booking events table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS profit_booking_events (
+                    id INTEGER PRIMARY KEY,
+                    chain_id TEXT,
+                    level INTEGER,
+                    profit_booked REAL,
+                    orders_closed INTEGER,
+                    orders_placed INTEGER,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        # Profit booking events table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS profit_booking_events (
-                id INTEGER PRIMARY KEY,
-                chain_id TEXT,
-                level INTEGER,
-                profit_booked REAL,
-                orders_closed INTEGER,
-                orders_placed INTEGER,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+            # Trading sessions table - NEW
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trading_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    symbol TEXT NOT NULL,
+                    direction TEXT NOT NULL,
+                    entry_signal TEXT,
+                    exit_reason TEXT,
+                    start_time DATETIME NOT NULL,
+                    end_time DATETIME,
+                    total_pnl REAL DEFAULT 0,
+                    total_trades INTEGER DEFAULT 0,
+                    status TEXT DEFAULT 'ACTIVE',
+                    metadata TEXT
+                )
+            ''')
         
-        # Trading sessions table - NEW
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trading_sessions (
-                session_id TEXT PRIMARY KEY,
-                symbol TEXT NOT NULL,
-                direction TEXT NOT NULL,
-                entry_signal TEXT,
-                exit_reason TEXT,
-                start_time DATETIME NOT NULL,
-                end_time DATETIME,
-                total_pnl REAL DEFAULT 0,
-                total_trades INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'ACTIVE',
-                metadata TEXT
-            )
-        ''')
+            # Session summary columns, updated as each trade of the session closes
+            cursor.execute("PRAGMA table_info(trading_sessions)")
+            session_columns = [info[1] for info in cursor.fetchall()]
+            for col_name, col_type in self.SESSION_SUMMARY_COLUMNS:
+                if col_name not in session_columns:
+                    cursor.execute(f"ALTER TABLE trading_sessions ADD COLUMN {col_name} {col_type}")
+        
+            # Distinct profit chains seen per session (keeps profit_chains incremental)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_profit_chains (
+                    session_id TEXT NOT NULL,
+                    profit_chain_id TEXT NOT NULL,
+                    PRIMARY KEY (session_id, profit_chain_id)
+                )
+            ''')
         
-        self.conn.commit()
+            # Frozen report document written when a session closes
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_reports (
+                    session_id TEXT PRIMARY KEY,
+                    report TEXT NOT NULL,
+                    created_at DATETIME NOT NULL
+                )
+            ''')
 
+    @timed(DB_WRITE_LATENCY, operation="save_trade")
+    @traced("db.save_trade")
     def save_trade(self, trade: Trade):
         try:
-            cursor = self.conn.cursor()
-            
             # Extract timeframe logic details if available
             logic_type = getattr(trade, 'logic_type', None)
             # Default to current values if base values not available
@@ -258,133 +306,205 @@ class TradeDatabase:
             # Get close_price if exists
             close_price = getattr(trade, 'close_price', None)
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO trades (
-                    trade_id, symbol, entry_price, exit_price, sl_price, tp_price, lot_size, direction, 
-                    strategy, pnl, commission, swap, comment, status, open_time, close_time, 
-                    chain_id, chain_level, is_re_entry, order_type, profit_chain_id, profit_level, 
-                    session_id, sl_adjusted, original_sl_distance,
-                    logic_type, base_lot_size, final_lot_size, base_sl_pips, final_sl_pips,
-                    lot_multiplier, sl_multiplier
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.trade_id, trade.symbol, trade.entry, close_price, trade.sl, 
-                trade.tp, trade.lot_size, trade.direction, trade.strategy, trade.pnl, 
-                getattr(trade, 'commission', 0.0), getattr(trade, 'swap', 0.0), getattr(trade, 'comment', None),
-                trade.status, trade.open_time, trade.close_time, getattr(trade, 'chain_id', None), 
-                getattr(trade, 'chain_level', 1), getattr(trade, 'is_re_entry', False), getattr(trade, 'order_type', None), 
-                getattr(trade, 'profit_chain_id', None), getattr(trade, 'profit_level', 0), getattr(trade, 'session_id', None),
-                getattr(trade, 'sl_adjusted', 0), getattr(trade, 'original_sl_distance', 0.0),
-                logic_type, base_lot, final_lot, base_sl_pips, final_sl_pips, lot_mult, sl_mult
-            ))
-            self.conn.commit()
+            with self.db.writer() as conn:
+                cursor = conn.cursor()
+                # Stored version of this trade, read in the write transaction so the
+                # session summary only takes the difference
+                if not conn.in_transaction:
+                    cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(
+                    "SELECT status, session_id, pnl, order_type, is_re_entry FROM trades "
+                    "WHERE trade_id = ? ORDER BY id DESC LIMIT 1",
+                    (trade.trade_id,)
+                )
+                previous = cursor.fetchone()
+            
+                cursor.execute("""
+                    INSERT OR REPLACE INTO trades (
+                        trade_id, symbol, entry_price, exit_price, sl_price, tp_price, lot_size, direction, 
+                        strategy, pnl, commission, swap, comment, status, open_time, close_time, 
+                        chain_id, chain_level, is_re_entry, order_type, profit_chain_id, profit_level, 
+                        session_id, sl_adjusted, original_sl_distance,
+                        logic_type, base_lot_size, final_lot_size, base_sl_pips, final_sl_pips,
+                        lot_multiplier, sl_multiplier
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    trade.trade_id, trade.symbol, trade.entry, close_price, trade.sl, 
+                    trade.tp, trade.lot_size, trade.direction, trade.strategy, trade.pnl, 
+                    getattr(trade, 'commission', 0.0), getattr(trade, 'swap', 0.0), getattr(trade, 'comment', None),
+                    trade.status, trade.open_time, trade.close_time, getattr(trade, 'chain_id', None), 
+                    getattr(trade, 'chain_level', 1), getattr(trade, 'is_re_entry', False), getattr(trade, 'order_type', None), 
+                    getattr(trade, 'profit_chain_id', None), getattr(trade, 'profit_level', 0), getattr(trade, 'session_id', None),
+                    getattr(trade, 'sl_adjusted', 0), getattr(trade, 'original_sl_distance', 0.0),
+                    logic_type, base_lot, final_lot, base_sl_pips, final_sl_pips, lot_mult, sl_mult
+                ))
+                self._update_session_summary(cursor, previous, trade)
         except Exception as e:
             print(f"Error saving trade: {e}")
 
-    def save_chain(self, chain: ReEntryChain):
-        cursor = self.conn.cursor()
+    def _update_session_summary(self, cursor, previous, trade: Trade):
+        """
+        Keep the session summary in step with a trade save (same transaction).
+        
+        Only the change is applied: a closed trade saved again with the same
+        values leaves the summary alone, a changed pnl replaces the old one.
+        """
+        old = None
+        if previous and previous[0] == "closed" and previous[1]:
+            old = (previous[1], previous[2] or 0.0, previous[3], bool(previous[4]))
+        new = None
+        if trade.status == "closed" and getattr(trade, 'session_id', None):
+            new = (trade.session_id, trade.pnl or 0.0, getattr(trade, 'order_type', None),
+                   bool(getattr(trade, 'is_re_entry', False)))
+        if old == new:
+            return
+        if old:
+            self._apply_to_session(cursor, *old, sign=-1)
+        if new:
+            new_chain = 0
+            if getattr(trade, 'profit_chain_id', None):
+                cursor.execute(
+                    "INSERT OR IGNORE INTO session_profit_chains (session_id, profit_chain_id) VALUES (?, ?)",
+                    (trade.session_id, trade.profit_chain_id)
+                )
+                new_chain = cursor.rowcount
+            self._apply_to_session(cursor, *new, sign=1, new_chain=new_chain)
+
+    def _apply_to_session(self, cursor, session_id: str, pnl: float, order_type, is_re_entry: bool,
+                          sign: int, new_chain: int = 0):
+        """Add (sign=1) or remove (sign=-1) one closed trade in a session's summary row"""
         cursor.execute('''
-            INSERT OR REPLACE INTO reentry_chains VALUES (?,?,?,?,?,?,?,?,?,?)
-        ''', (chain.chain_id, chain.symbol, chain.direction, 
-              chain.original_entry, chain.original_sl_distance,
-              chain.current_level, chain.total_profit, chain.status,
-              chain.created_at, datetime.now().isoformat() if chain.status == "completed" else None))
-        self.conn.commit()
+            UPDATE trading_sessions SET
+                total_trades = total_trades + ?,
+                total_pnl = total_pnl + ?,
+                wins = wins + ?,
+                losses = losses + ?,
+                total_profit = total_profit + ?,
+                total_loss = total_loss + ?,
+                dual_orders = dual_orders + ?,
+                profit_chains = profit_chains + ?,
+                reentries = reentries + ?
+            WHERE session_id = ?
+        ''', (
+            sign, sign * pnl, sign * int(pnl > 0), sign * int(pnl < 0),
+            sign * max(pnl, 0.0), sign * min(pnl, 0.0),
+            sign * int(order_type in self.DUAL_ORDER_TYPES), new_chain,
+            sign * int(is_re_entry), session_id
+        ))
+
+    @timed(DB_WRITE_LATENCY, operation="save_chain")
+    @traced("db.save_chain")
+    def save_chain(self, chain: ReEntryChain):
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO reentry_chains VALUES (?,?,?,?,?,?,?,?,?,?)
+            ''', (chain.chain_id, chain.symbol, chain.direction, 
+                  chain.original_entry, chain.original_sl_distance,
+                  chain.current_level, chain.total_profit, chain.status,
+                  chain.created_at, datetime.now().isoformat() if chain.status == "completed" else None))
 
+    @timed(DB_WRITE_LATENCY, operation="save_sl_event")
     def save_sl_event(self, trade_id: str, symbol: str, sl_price: float, 
                      original_entry: float, recovery_attempted: bool = False,
                      recovery_successful: bool = False):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO sl_events VALUES (?,?,?,?,?,?,?,?)
-        ''', (None, trade_id, symbol, sl_price, original_entry, 
-              datetime.now().isoformat(), recovery_attempted, recovery_successful))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO sl_events VALUES (?,?,?,?,?,?,?,?)
+            ''', (None, trade_id, symbol, sl_price, original_entry, 
+                  datetime.now().isoformat(), recovery_attempted, recovery_successful))
 
     def get_trade_history(self, days=30) -> List[Dict[str, Any]]:
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM trades 
-            WHERE close_time >= datetime('now', ?)
-            ORDER BY close_time DESC
-        ''', (f'-{days} days',))
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM trades 
+                WHERE close_time >= datetime('now', ?)
+                ORDER BY close_time DESC
+            ''', (f'-{days} days',))
         
-        columns = [description[0] for description in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     def get_chain_statistics(self) -> Dict[str, Any]:
-        cursor = self.conn.cursor()
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
         
-        # Get chain performance
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total_chains,
-                AVG(max_level_reached) as avg_max_level,
-                SUM(total_profit) as total_chain_profit,
-                COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_chains,
-                COUNT(CASE WHEN total_profit > 0 THEN 1 END) as profitable_chains
-            FROM reentry_chains
-        ''')
-        
-        result = cursor.fetchone()
-        columns = [description[0] for description in cursor.description]
-        
-        return dict(zip(columns, result))
+            # Get chain performance
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as total_chains,
+                    AVG(max_level_reached) as avg_max_level,
+                    SUM(total_profit) as total_chain_profit,
+                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_chains,
+                    COUNT(CASE WHEN total_profit > 0 THEN 1 END) as profitable_chains
+                FROM reentry_chains
+            ''')
+        
+            result = cursor.fetchone()
+            columns = [description[0] for description in cursor.description]
+        
+            return dict(zip(columns, result))
 
     def get_sl_recovery_stats(self) -> Dict[str, Any]:
-        cursor = self.conn.cursor()
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total_sl_hits,
-                COUNT(CASE WHEN recovery_attempted THEN 1 END) as recovery_attempts,
-                COUNT(CASE WHEN recovery_successful THEN 1 END) as successful_recoveries
-            FROM sl_events
-            WHERE hit_time >= datetime('now', '-30 days')
-        ''')
-        
-        result = cursor.fetchone()
-        columns = [description[0] for description in cursor.description]
-        
-        return dict(zip(columns, result))
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as total_sl_hits,
+                    COUNT(CASE WHEN recovery_attempted THEN 1 END) as recovery_attempts,
+                    COUNT(CASE WHEN recovery_successful THEN 1 END) as successful_recoveries
+                FROM sl_events
+                WHERE hit_time >= datetime('now', '-30 days')
+            ''')
+        
+            result = cursor.fetchone()
+            columns = [description[0] for description in cursor.description]
+        
+            return dict(zip(columns, result))
     
+    @timed(DB_WRITE_LATENCY, operation="clear_lifetime_losses")
     def clear_lifetime_losses(self):
         """Reset lifetime loss counter (database side)"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE system_state SET value = '0', updated_at = ? WHERE key = 'lifetime_loss'
-        ''', (datetime.now().isoformat(),))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE system_state SET value = '0', updated_at = ? WHERE key = 'lifetime_loss'
+            ''', (datetime.now().isoformat(),))
         
     def get_tp_reentry_stats(self) -> Dict[str, Any]:
         """Get TP re-entry statistics"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total_tp_reentries,
-                SUM(pnl) as total_tp_reentry_pnl,
-                AVG(pnl) as avg_tp_reentry_pnl,
-                COUNT(CASE WHEN pnl > 0 THEN 1 END) as profitable_tp_reentries
-            FROM tp_reentry_events
-            WHERE timestamp >= datetime('now', '-30 days')
-        ''')
-        result = cursor.fetchone()
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, result)) if result else {}
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as total_tp_reentries,
+                    SUM(pnl) as total_tp_reentry_pnl,
+                    AVG(pnl) as avg_tp_reentry_pnl,
+                    COUNT(CASE WHEN pnl > 0 THEN 1 END) as profitable_tp_reentries
+                FROM tp_reentry_events
+                WHERE timestamp >= datetime('now', '-30 days')
+            ''')
+            result = cursor.fetchone()
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, result)) if result else {}
     
     def get_sl_hunt_reentry_stats(self) -> Dict[str, Any]:
         """Get SL hunt re-entry statistics (from sl_events where recovery_successful=1)"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT 
-                COUNT(CASE WHEN recovery_successful THEN 1 END) as total_sl_hunt_reentries,
-                COUNT(CASE WHEN recovery_attempted THEN 1 END) as sl_hunt_attempts
-            FROM sl_events
-            WHERE hit_time >= datetime('now', '-30 days')
-        ''')
-        result = cursor.fetchone()
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, result)) if result else {}
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COUNT(CASE WHEN recovery_successful THEN 1 END) as total_sl_hunt_reentries,
+                    COUNT(CASE WHEN recovery_attempted THEN 1 END) as sl_hunt_attempts
+                FROM sl_events
+                WHERE hit_time >= datetime('now', '-30 days')
+            ''')
+            result = cursor.fetchone()
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, result)) if result else {}
     
     def get_trades_by_date(self, target_date: date) -> List[Dict[str, Any]]:
         """
@@ -392,15 +512,16 @@ class TradeDatabase:
         Returns: List of trade dictionaries with PnL
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM trades 
-                WHERE DATE(close_time) = DATE(?) AND status = 'closed'
-                ORDER BY close_time DESC
-            ''', (target_date.isoformat(),))
+            with self.db.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM trades 
+                    WHERE DATE(close_time) = DATE(?) AND status = 'closed'
+                    ORDER BY close_time DESC
+                ''', (target_date.isoformat(),))
             
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                columns = [description[0] for description in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
         except Exception as e:
             print(f"Error getting trades by date: {e}")
             return []
@@ -411,229 +532,297 @@ class TradeDatabase:
         Returns: True if connection is working, False otherwise
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT 1')
-            cursor.fetchone()
-            return True
+            with self.db.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+                return True
         except Exception:
             return False
     
+    @timed(DB_WRITE_LATENCY, operation="save_profit_chain")
+    @traced("db.save_profit_chain")
     def save_profit_chain(self, chain):
         """Save profit booking chain to database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO profit_booking_chains 
-            (chain_id, symbol, direction, base_lot, current_level, total_profit, status, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            chain.chain_id,
-            chain.symbol,
-            chain.direction,
-            chain.base_lot,
-            chain.current_level,
-            chain.total_profit,
-            chain.status,
-            chain.created_at,
-            chain.updated_at
-        ))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO profit_booking_chains 
+                (chain_id, symbol, direction, base_lot, current_level, total_profit, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                chain.chain_id,
+                chain.symbol,
+                chain.direction,
+                chain.base_lot,
+                chain.current_level,
+                chain.total_profit,
+                chain.status,
+                chain.created_at,
+                chain.updated_at
+            ))
     
     def get_active_profit_chains(self) -> List[Dict[str, Any]]:
         """Get all active profit booking chains from database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM profit_booking_chains
-            WHERE status = 'ACTIVE'
-        ''')
-        columns = [description[0] for description in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT * FROM profit_booking_chains
+                WHERE status = 'ACTIVE'
+            ''')
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    @timed(DB_WRITE_LATENCY, operation="save_profit_booking_order")
     def save_profit_booking_order(self, order_id: str, chain_id: str, level: int, 
                                   profit_target: float, sl_reduction: int, status: str):
         """Save profit booking order to database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO profit_booking_orders
-            (order_id, chain_id, level, profit_target, sl_reduction, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (order_id, chain_id, level, profit_target, sl_reduction, status, datetime.now().isoformat()))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO profit_booking_orders
+                (order_id, chain_id, level, profit_target, sl_reduction, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (order_id, chain_id, level, profit_target, sl_reduction, status, datetime.now().isoformat()))
     
+    @timed(DB_WRITE_LATENCY, operation="save_profit_booking_event")
     def save_profit_booking_event(self, chain_id: str, level: int, profit_booked: float,
                                   orders_closed: int, orders_placed: int):
         """Save profit booking event to database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO profit_booking_events
-            (chain_id, level, profit_booked, orders_closed, orders_placed, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (chain_id, level, profit_booked, orders_closed, orders_placed, datetime.now().isoformat()))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO profit_booking_events
+                (chain_id, level, profit_booked, orders_closed, orders_placed, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (chain_id, level, profit_booked, orders_closed, orders_placed, datetime.now().isoformat()))
     
     def get_profit_chain_stats(self) -> Dict[str, Any]:
         """Get profit booking chain statistics"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as total_chains,
-                COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END) as completed_chains,
-                COUNT(CASE WHEN status = 'ACTIVE' THEN 1 END) as active_chains,
-                AVG(current_level) as avg_level,
-                SUM(total_profit) as total_profit,
-                AVG(total_profit) as avg_profit_per_chain
-            FROM profit_booking_chains
-        ''')
-        result = cursor.fetchone()
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, result)) if result else {}
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as total_chains,
+                    COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END) as completed_chains,
+                    COUNT(CASE WHEN status = 'ACTIVE' THEN 1 END) as active_chains,
+                    AVG(current_level) as avg_level,
+                    SUM(total_profit) as total_profit,
+                    AVG(total_profit) as avg_profit_per_chain
+                FROM profit_booking_chains
+            ''')
+            result = cursor.fetchone()
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, result)) if result else {}
     
     # ==================== SESSION TRACKING METHODS ====================
     
+    @timed(DB_WRITE_LATENCY, operation="create_session")
+    @traced("db.create_session")
     def create_session(self, session_id: str, symbol: str, direction: str, entry_signal: str):
         """Create new trading session"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO trading_sessions 
-            (session_id, symbol, direction, entry_signal, start_time, status)
-            VALUES (?, ?, ?, ?, ?, 'ACTIVE')
-        ''', (session_id, symbol, direction, entry_signal, datetime.now().isoformat()))
-        self.conn.commit()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO trading_sessions 
+                (session_id, symbol, direction, entry_signal, start_time, status)
+                VALUES (?, ?, ?, ?, ?, 'ACTIVE')
+            ''', (session_id, symbol, direction, entry_signal, datetime.now().isoformat()))
     
-    def close_session(self, session_id: str, exit_reason: str):
-        """Close trading session"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE trading_sessions
-            SET status = 'COMPLETED', end_time = ?, exit_reason = ?
-            WHERE session_id = ?
-        ''', (datetime.now().isoformat(), exit_reason, session_id))
-        self.conn.commit()
+    @timed(DB_WRITE_LATENCY, operation="close_session")
+    def close_session(self, session_id: str, exit_reason: str) -> Dict[str, Any]:
+        """Close trading session and freeze its report; returns the report"""
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE trading_sessions
+                SET status = 'COMPLETED', end_time = ?, exit_reason = ?
+                WHERE session_id = ?
+            ''', (datetime.now().isoformat(), exit_reason, session_id))
+            report = self._freeze_session_report(cursor, session_id)
+            return report
     
+    def _freeze_session_report(self, cursor, session_id: str) -> Dict[str, Any]:
+        cursor.execute(
+            f"SELECT {self.SESSION_LIST_COLUMNS} FROM trading_sessions WHERE session_id = ?",
+            (session_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return {}
+        report = self._session_report(dict(zip([d[0] for d in cursor.description], row)))
+        cursor.execute(
+            "INSERT OR REPLACE INTO session_reports (session_id, report, created_at) VALUES (?, ?, ?)",
+            (session_id, json.dumps(report), datetime.now().isoformat())
+        )
+        return report
+    
+    @staticmethod
+    def _session_report(session: Dict[str, Any]) -> Dict[str, Any]:
+        """Report document of a summary row: the row plus its win/loss breakdown"""
+        trades = session.get('total_trades') or 0
+        session['breakdown'] = {
+            'wins': session.get('wins') or 0,
+            'losses': session.get('losses') or 0,
+            'total_profit': session.get('total_profit') or 0.0,
+            'total_loss': session.get('total_loss') or 0.0,
+            'dual_orders': session.get('dual_orders') or 0,
+            'profit_chains': session.get('profit_chains') or 0,
+            'reentries': session.get('reentries') or 0,
+            'win_rate': (session.get('wins') or 0) / trades * 100 if trades else 0.0
+        }
+        return session
+    
+    @timed(DB_WRITE_LATENCY, operation="update_session_stats")
+    @traced("db.update_session_stats")
     def update_session_stats(self, session_id: str):
-        """Recalculate session total_pnl and total_trades from trades table"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT COUNT(*), COALESCE(SUM(pnl), 0)
-            FROM trades
-            WHERE session_id = ? AND status = 'closed'
-        ''', (session_id,))
+        """
+        Rebuild a session's summary row from the trades table.
         
-        total_trades, total_pnl = cursor.fetchone()
+        Summaries are maintained as trades close; this is only needed to
+        repair sessions recorded before the summary columns existed.
+        """
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COUNT(*),
+                    COALESCE(SUM(pnl), 0),
+                    COUNT(CASE WHEN pnl > 0 THEN 1 END),
+                    COUNT(CASE WHEN pnl < 0 THEN 1 END),
+                    COALESCE(SUM(CASE WHEN pnl > 0 THEN pnl END), 0),
+                    COALESCE(SUM(CASE WHEN pnl < 0 THEN pnl END), 0),
+                    COUNT(CASE WHEN order_type IN (?, ?) THEN 1 END),
+                    COUNT(DISTINCT profit_chain_id),
+                    COUNT(CASE WHEN is_re_entry THEN 1 END)
+                FROM trades
+                WHERE session_id = ? AND status = 'closed'
+            ''', (*self.DUAL_ORDER_TYPES, session_id))
+            summary = cursor.fetchone()
         
-        cursor.execute('''
-            UPDATE trading_sessions
-            SET total_pnl = ?, total_trades = ?
-            WHERE session_id = ?
-        ''', (total_pnl, total_trades, session_id))
-        self.conn.commit()
+            cursor.execute('''
+                UPDATE trading_sessions
+                SET total_trades = ?, total_pnl = ?, wins = ?, losses = ?, total_profit = ?,
+                    total_loss = ?, dual_orders = ?, profit_chains = ?, reentries = ?
+                WHERE session_id = ?
+            ''', (*summary, session_id))
+            cursor.execute('''
+                INSERT OR IGNORE INTO session_profit_chains (session_id, profit_chain_id)
+                SELECT DISTINCT session_id, profit_chain_id FROM trades
+                WHERE session_id = ? AND status = 'closed' AND profit_chain_id IS NOT NULL
+            ''', (session_id,))
     
     def get_active_session(self, symbol: str = None) -> Dict[str, Any]:
         """Get active session for symbol (or any active session if symbol is None)"""
-        cursor = self.conn.cursor()
-        if symbol:
-            cursor.execute('''
-                SELECT * FROM trading_sessions
-                WHERE symbol = ? AND status = 'ACTIVE'
-                ORDER BY start_time DESC LIMIT 1
-            ''', (symbol,))
-        else:
-            cursor.execute('''
-                SELECT * FROM trading_sessions
-                WHERE status = 'ACTIVE'
-                ORDER BY start_time DESC LIMIT 1
-            ''')
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            if symbol:
+                cursor.execute('''
+                    SELECT * FROM trading_sessions
+                    WHERE symbol = ? AND status = 'ACTIVE'
+                    ORDER BY start_time DESC LIMIT 1
+                ''', (symbol,))
+            else:
+                cursor.execute('''
+                    SELECT * FROM trading_sessions
+                    WHERE status = 'ACTIVE'
+                    ORDER BY start_time DESC LIMIT 1
+                ''')
+        
+            row = cursor.fetchone()
+            if row:
+                columns = [desc[0] for desc in cursor.description]
+                return dict(zip(columns, row))
+            return {}
+    
+    def get_sessions_by_date(self, target_date: date) -> List[Dict[str, Any]]:
+        """Get the summary rows of all sessions started on a specific date"""
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {self.SESSION_LIST_COLUMNS} FROM trading_sessions
+                WHERE start_time >= ? AND start_time < ?
+                ORDER BY start_time DESC
+            ''', (target_date.isoformat(), (target_date + timedelta(days=1)).isoformat()))
         
-        row = cursor.fetchone()
-        if row:
             columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
-        return {}
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
-    def get_sessions_by_date(self, target_date: date) -> List[Dict[str, Any]]:
-        """Get all sessions for a specific date"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM trading_sessions
-            WHERE DATE(start_time) = DATE(?)
-            ORDER BY start_time DESC
-        ''', (target_date.isoformat(),))
+    def get_session_report(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get a session report by primary key.
         
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        Closed sessions return their frozen report; an active session is
+        reported from its live summary row.
+        """
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT report FROM session_reports WHERE session_id = ?', (session_id,))
+            row = cursor.fetchone()
+            if row:
+                return json.loads(row[0])
+        
+            cursor.execute(
+                f"SELECT {self.SESSION_LIST_COLUMNS} FROM trading_sessions WHERE session_id = ?",
+                (session_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return {}
+            session = dict(zip([desc[0] for desc in cursor.description], row))
+        if session['status'] == 'ACTIVE':
+            return self._session_report(session)
+        
+        # Closed before reports were frozen: rebuild once and freeze
+        self.update_session_stats(session_id)
+        with self.db.writer() as conn:
+            return self._freeze_session_report(conn.cursor(), session_id)
     
     def get_session_details(self, session_id: str) -> Dict[str, Any]:
         """Get detailed session report including breakdown"""
-        cursor = self.conn.cursor()
-        
-        # Get session info
-        cursor.execute('SELECT * FROM trading_sessions WHERE session_id = ?', (session_id,))
-        row = cursor.fetchone()
-        if not row:
-            return {}
-        
-        columns = [desc[0] for desc in cursor.description]
-        session = dict(zip(columns, row))
-        
-        # Get win/loss breakdown
-        cursor.execute('''
-            SELECT 
-                COUNT(CASE WHEN pnl > 0 THEN 1 END) as wins,
-                COUNT(CASE WHEN pnl < 0 THEN 1 END) as losses,
-                COALESCE(SUM(CASE WHEN pnl > 0 THEN pnl END), 0) as total_profit,
-                COALESCE(SUM(CASE WHEN pnl < 0 THEN pnl END), 0) as total_loss,
-                COUNT(DISTINCT CASE WHEN order_type = 'DUAL_A' OR order_type = 'DUAL_B' THEN 1 END) as dual_orders,
-                COUNT(DISTINCT profit_chain_id) as profit_chains,
-                COUNT(CASE WHEN is_re_entry THEN 1 END) as reentries
-            FROM trades
-            WHERE session_id = ? AND status = 'closed'
-        ''', (session_id,))
-        
-        breakdown = cursor.fetchone()
-        if breakdown:
-            cols = [desc[0] for desc in cursor.description]
-            session['breakdown'] = dict(zip(cols, breakdown))
-        
-        return session
+        return self.get_session_report(session_id)
     
     def create_indexes(self):
         """
         Create database indexes for query performance optimization
         As documented in 10_DATABASE_SCHEMA.md Section: Database Optimization
         """
-        cursor = self.conn.cursor()
+        with self.db.writer() as conn:
+            cursor = conn.cursor()
         
-        # Indexes for trades table (most frequently queried)
-        indexes = [
-            # Symbol index for symbol-based queries
-            ("idx_trades_symbol", "CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)"),
+            # Indexes for trades table (most frequently queried)
+            indexes = [
+                # Symbol index for symbol-based queries
+                ("idx_trades_symbol", "CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)"),
             
-            # Status index for filtering open/closed trades
-            ("idx_trades_status", "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)"),
+                # Status index for filtering open/closed trades
+                ("idx_trades_status", "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)"),
             
-            # Close time index for date-based queries
-            ("idx_trades_close_time", "CREATE INDEX IF NOT EXISTS idx_trades_close_time ON trades(close_time)"),
+                # Close time index for date-based queries
+                ("idx_trades_close_time", "CREATE INDEX IF NOT EXISTS idx_trades_close_time ON trades(close_time)"),
             
-            # Chain ID index for re-entry chain tracking
-            ("idx_trades_chain_id", "CREATE INDEX IF NOT EXISTS idx_trades_chain_id ON trades(chain_id)"),
+                # Chain ID index for re-entry chain tracking
+                ("idx_trades_chain_id", "CREATE INDEX IF NOT EXISTS idx_trades_chain_id ON trades(chain_id)"),
             
-            # Logic type index for plugin performance comparison
-            ("idx_trades_logic_type", "CREATE INDEX IF NOT EXISTS idx_trades_logic_type ON trades(logic_type)"),
+                # Logic type index for plugin performance comparison
+                ("idx_trades_logic_type", "CREATE INDEX IF NOT EXISTS idx_trades_logic_type ON trades(logic_type)"),
             
-            # Session ID index for session tracking
-            ("idx_trades_session_id", "CREATE INDEX IF NOT EXISTS idx_trades_session_id ON trades(session_id)"),
+                # Session ID index for session tracking
+                ("idx_trades_session_id", "CREATE INDEX IF NOT EXISTS idx_trades_session_id ON trades(session_id)"),
             
-            # Composite index for frequently combined queries (status + close_time)
-            ("idx_trades_status_close", "CREATE INDEX IF NOT EXISTS idx_trades_status_close ON trades(status, close_time)"),
+                # Composite index for frequently combined queries (status + close_time)
+                ("idx_trades_status_close", "CREATE INDEX IF NOT EXISTS idx_trades_status_close ON trades(status, close_time)"),
             
-            # Composite index for plugin analysis (logic_type + status)
-            ("idx_trades_logic_status", "CREATE INDEX IF NOT EXISTS idx_trades_logic_status ON trades(logic_type, status)"),
-        ]
-        
-        for index_name, index_sql in indexes:
-            try:
-                cursor.execute(index_sql)
-            except sqlite3.OperationalError as e:
-                # Index might already exist, skip
-                pass
+                # Composite index for plugin analysis (logic_type + status)
+                ("idx_trades_logic_status", "CREATE INDEX IF NOT EXISTS idx_trades_logic_status ON trades(logic_type, status)"),
+            
+                # Session start index for the daily session list
+                ("idx_sessions_start_time", "CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON trading_sessions(start_time)"),
+            ]
         
-        self.conn.commit()
\ No newline at end of file
+            for index_name, index_sql in indexes:
+                try:
+                    cursor.execute(index_sql)
+                except sqlite3.OperationalError as e:
+                    # Index might already exist, skip
+                    pass
@@ -13,10 +13,12 @@ Date: 2026-01-20
 """
 
 import sqlite3
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime, date, timedelta
 from collections import defaultdict
 
+from src.database.trade_export import TradeExporter, ExportRequest
+
 
 class AnalyticsQueries:
     """
@@ -549,26 +551,26 @@ class AnalyticsQueries:
     # ==================== EXPORT DATA PREPARATION ====================
     
     def prepare_trades_export(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Prepare trade data for CSV export"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT 
-                open_time, symbol, direction, logic_type,
-                entry_price, exit_price, pnl,
-                CAST((exit_price - entry_price) * 10000 AS INTEGER) as pips,
-                CAST((julianday(close_time) - julianday(open_time)) * 24 * 60 AS INTEGER) as duration_mins
-            FROM trades
-            WHERE status = 'closed' 
-              AND close_time >= DATE('now', ?)
-            ORDER BY close_time DESC
-        """, (f'-{days} days',))
-        
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        """Prepare trade data for CSV export (see iter_trades_export for large ranges)"""
+        return list(self.iter_trades_export(days))
+    
+    def iter_trades_export(self, days: int = 30, plugin: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream closed trades for export, one row at a time"""
+        request = ExportRequest.last_days(days, kind="trades", plugin=plugin)
+        return TradeExporter().iter_rows(request, self.conn)
     
     def prepare_daily_summary_export(self, days: int = 30) -> List[Dict[str, Any]]:
         """Prepare daily summary data for CSV export"""
-        return self.get_daily_summaries_last_n_days(days)
+        summaries = []
+        for row in self.iter_daily_summary_export(days):
+            row['date'] = date.fromisoformat(row['date'])
+            summaries.append(row)
+        return summaries
+    
+    def iter_daily_summary_export(self, days: int = 30, plugin: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream per-day totals (one GROUP BY query instead of one query per day)"""
+        request = ExportRequest.last_days(days - 1, kind="daily", plugin=plugin)
+        return TradeExporter().iter_rows(request, self.conn)
     
     # ==================== V6 SPECIFIC ANALYTICS ====================
     
@@ -0,0 +1,364 @@
+"""
+SQLite Connection Manager
+
+One owner for every SQLite handle the bot opens. Each database file gets a
+``ManagedDatabase`` with:
+
+- Consistent pragmas on every connection (WAL, synchronous=NORMAL,
+  in-memory temp store, busy timeout) plus per-database extras
+- A single writer connection guarded by a lock, so writes to one file
+  never contend inside the process
+- A bounded pool of reader connections (WAL readers do not block the writer)
+- An async API that runs statements on the manager's thread executor
+- Per-database query latency and lock-wait histograms
+
+Usage:
+    db = get_connection_manager().database("data/zepix_versions.db")
+    with db.writer() as conn:
+        conn.execute("INSERT ...")          # committed on exit
+    rows = db.fetchall("SELECT ...")
+    rows = await db.afetchall("SELECT ...")
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.monitoring.metrics_registry import DB_LOCK_WAIT, DB_QUERY_LATENCY
+
+logger = logging.getLogger(__name__)
+
+MEMORY = ":memory:"
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+}
+
+
+class ManagedDatabase:
+    """
+    Connections to one SQLite file: a locked writer and pooled readers.
+
+    Connections are opened lazily and reopened when the file is replaced or
+    deleted underneath them. ``close()`` only releases the handles; the next
+    use opens fresh ones, so owners sharing a file cannot break each other.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        max_readers: int = 4,
+        timeout: float = 30.0,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self.path = path
+        self.name = "memory" if path == MEMORY else os.path.basename(path)
+        self.pragmas = {**DEFAULT_PRAGMAS, "busy_timeout": int(timeout * 1000), **(pragmas or {})}
+        self.max_readers = max(1, max_readers)
+        self.timeout = timeout
+        self._executor = executor
+
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers = threading.Condition()
+        self._idle: List[sqlite3.Connection] = []
+        self._open_readers = 0
+        self._generation = 0
+        self._inode: Optional[int] = None
+
+        self.stats = {"reads": 0, "writes": 0, "rollbacks": 0, "connections_opened": 0, "reopens": 0}
+
+    # ==================== Connections ====================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != MEMORY:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        for pragma, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {pragma}={value}")
+            except sqlite3.Error as e:
+                logger.warning(f"[SQLite] PRAGMA {pragma} failed on {self.name}: {e}")
+        self.stats["connections_opened"] += 1
+        return conn
+
+    def _file_id(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_ino
+        except OSError:
+            return None
+
+    def _check_file(self):
+        """Drop every handle if the file was deleted or replaced since they were opened"""
+        if self.path == MEMORY or self._inode is None:
+            return
+        if self._file_id() != self._inode:
+            self.stats["reopens"] += 1
+            self.close()
+
+    def _get_writer(self) -> sqlite3.Connection:
+        self._check_file()
+        if self._writer is None:
+            self._writer = self._connect()
+            self._inode = self._file_id()
+        return self._writer
+
+    def dedicated_connection(self) -> sqlite3.Connection:
+        """
+        A new connection with this database's pragmas, owned by the caller.
+
+        For code that manages its own transactions: the manager never locks,
+        reopens or closes it, and it never shares a transaction with
+        ``writer()`` users.
+        """
+        return self._connect()
+
+    @contextmanager
+    def writer(self, row_factory: Optional[Callable] = None):
+        """
+        Exclusive use of the writer connection.
+
+        Commits when the block exits normally and rolls back on error.
+        """
+        start = time.perf_counter()
+        with self._write_lock:
+            acquired = time.perf_counter()
+            DB_LOCK_WAIT.labels(database=self.name, mode="write").observe(acquired - start)
+            conn = self._get_writer()
+            previous = conn.row_factory
+            conn.row_factory = row_factory
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                self.stats["rollbacks"] += 1
+                conn.rollback()
+                raise
+            finally:
+                conn.row_factory = previous
+                self.stats["writes"] += 1
+                DB_QUERY_LATENCY.labels(database=self.name, mode="write").observe(
+                    time.perf_counter() - acquired
+                )
+
+    @contextmanager
+    def reader(self, row_factory: Optional[Callable] = None):
+        """
+        A pooled reader connection; waits up to ``timeout`` when all are busy.
+
+        Raises:
+            TimeoutError: No reader became free in time
+        """
+        if self.path == MEMORY:
+            # Every in-memory connection is a separate database; read through the writer
+            with self.writer(row_factory) as conn:
+                yield conn
+            return
+
+        start = time.perf_counter()
+        conn, generation = self._acquire_reader()
+        acquired = time.perf_counter()
+        DB_LOCK_WAIT.labels(database=self.name, mode="read").observe(acquired - start)
+        conn.row_factory = row_factory
+        try:
+            yield conn
+        finally:
+            self.stats["reads"] += 1
+            DB_QUERY_LATENCY.labels(database=self.name, mode="read").observe(
+                time.perf_counter() - acquired
+            )
+            self._release_reader(conn, generation)
+
+    def _acquire_reader(self) -> Tuple[sqlite3.Connection, int]:
+        self._check_file()
+        deadline = time.monotonic() + self.timeout
+        with self._readers:
+            while not self._idle and self._open_readers >= self.max_readers:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._readers.wait(remaining):
+                    raise TimeoutError(f"No free SQLite reader for {self.name} after {self.timeout}s")
+            if self._idle:
+                return self._idle.pop(), self._generation
+            self._open_readers += 1
+            generation = self._generation
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._readers:
+                if generation == self._generation:
+                    self._open_readers -= 1
+                    self._readers.notify()
+            raise
+        if self._inode is None:
+            self._inode = self._file_id()
+        return conn, generation
+
+    def _release_reader(self, conn: sqlite3.Connection, generation: int):
+        if conn.in_transaction:
+            conn.rollback()
+        with self._readers:
+            if generation == self._generation:
+                self._idle.append(conn)
+                self._readers.notify()
+                return
+        conn.close()  # opened before the last close(); already uncounted
+
+    # ==================== Sync helpers ====================
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Run and commit one statement on the writer"""
+        with self.writer() as conn:
+            return conn.execute(sql, params)
+
+    def executemany(self, sql: str, rows: Sequence[Sequence]) -> int:
+        """Run one statement for many rows in a single transaction"""
+        with self.writer() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def executescript(self, script: str):
+        with self.writer() as conn:
+            conn.executescript(script)
+
+    def fetchall(self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None) -> List[Any]:
+        with self.reader(row_factory) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def fetchone(self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None) -> Any:
+        with self.reader(row_factory) as conn:
+            return conn.execute(sql, params).fetchone()
+
+    # ==================== Async helpers ====================
+
+    async def arun(self, func: Callable, *args) -> Any:
+        """Run ``func(*args)`` on the manager's thread executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def aexecute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        return await self.arun(self.execute, sql, params)
+
+    async def afetchall(self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None) -> List[Any]:
+        return await self.arun(self.fetchall, sql, params, row_factory)
+
+    async def afetchone(self, sql: str, params: Sequence = (), row_factory: Optional[Callable] = None) -> Any:
+        return await self.arun(self.fetchone, sql, params, row_factory)
+
+    # ==================== Lifecycle ====================
+
+    def close(self):
+        """Close idle handles; readers still in use are closed when returned"""
+        with self._write_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"[SQLite] Closing writer of {self.name} failed: {e}")
+                self._writer = None
+            with self._readers:
+                idle, self._idle = self._idle, []
+                self._open_readers = 0
+                self._generation += 1
+                self._inode = None
+                self._readers.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._readers:
+            return {
+                "path": self.path,
+                "writer_open": self._writer is not None,
+                "readers_open": self._open_readers,
+                "readers_idle": len(self._idle),
+                "max_readers": self.max_readers,
+                **self.stats
+            }
+
+
+class SQLiteConnectionManager:
+    """
+    Registry of ``ManagedDatabase`` objects keyed by absolute file path.
+
+    Every component asking for the same file shares its writer and reader
+    pool. ``:memory:`` databases are private to the caller.
+    """
+
+    def __init__(self, max_readers: int = 4, timeout: float = 30.0, max_workers: int = 4):
+        self.max_readers = max_readers
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sqlite")
+        self._databases: Dict[str, ManagedDatabase] = {}
+        self._lock = threading.Lock()
+
+    def database(
+        self,
+        path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        max_readers: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> ManagedDatabase:
+        """
+        The managed database for ``path`` (created on first request).
+
+        Args:
+            path: Database file; ``:memory:`` always returns a new database
+            pragmas: Extra pragmas, e.g. ``{"foreign_keys": "ON"}``; merged
+                into an existing database's set for its next connections
+            max_readers: Reader pool size on creation (manager default otherwise)
+            timeout: Busy and reader-wait timeout on creation (manager default otherwise)
+        """
+        args = (pragmas, max_readers or self.max_readers, timeout or self.timeout, self._executor)
+        if path == MEMORY:
+            return ManagedDatabase(path, *args)
+        key = os.path.abspath(path)
+        with self._lock:
+            db = self._databases.get(key)
+            if db is None:
+                db = ManagedDatabase(key, *args)
+                self._databases[key] = db
+            elif pragmas:
+                db.pragmas.update(pragmas)
+            return db
+
+    def close(self, path: Optional[str] = None):
+        """Release the handles of one database, or of all of them"""
+        with self._lock:
+            if path is None:
+                targets = list(self._databases.values())
+            else:
+                db = self._databases.get(os.path.abspath(path))
+                targets = [db] if db else []
+        for db in targets:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            databases = list(self._databases.values())
+        return {db.path: db.get_stats() for db in databases}
+
+
+# ==================== Singleton ====================
+
+_connection_manager: Optional[SQLiteConnectionManager] = None
+
+
+def get_connection_manager() -> SQLiteConnectionManager:
+    """Get the process-wide connection manager"""
+    global _connection_manager
+    if _connection_manager is None:
+        _connection_manager = SQLiteConnectionManager()
+    return _connection_manager
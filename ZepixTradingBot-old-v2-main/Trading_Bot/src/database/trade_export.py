@@ -0,0 +1,310 @@
+"""
+Trade Export - Streaming CSV/Parquet Exports of Trade History
+
+Streams query results from the trades table through generators into a
+temporary file, so exporting years of history never holds more than one
+chunk of rows in memory:
+- CSV (optionally gzip-compressed), written chunk by chunk
+- Parquet or Arrow IPC, written one record batch per chunk (needs pyarrow)
+
+Exports open their own read-only SQLite connection, so they can run in a
+worker thread (``export_async``) without blocking the event loop or the
+bot's shared write connection. Results can be filtered by close-date
+range and plugin (matched against ``logic_type``/``strategy``).
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Iterator, Tuple
+from dataclasses import dataclass
+from datetime import date, timedelta
+import asyncio
+import csv
+import gzip
+import os
+import sqlite3
+import tempfile
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DB_PATH = "data/trading_bot.db"
+DEFAULT_CHUNK_SIZE = 1000
+
+EXPORT_KINDS = ("trades", "daily")
+EXPORT_FORMATS = ("csv", "parquet", "arrow")
+
+TRADES_EXPORT_SQL = """
+    SELECT
+        open_time, close_time, symbol, direction, logic_type,
+        entry_price, exit_price, lot_size, pnl,
+        CAST((exit_price - entry_price) * 10000 AS INTEGER) as pips,
+        CAST((julianday(close_time) - julianday(open_time)) * 24 * 60 AS INTEGER) as duration_mins
+    FROM trades
+    WHERE status = 'closed' {filters}
+    ORDER BY close_time DESC
+"""
+
+DAILY_EXPORT_SQL = """
+    SELECT
+        DATE(close_time) as date,
+        COUNT(*) as trade_count,
+        SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
+        SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses,
+        ROUND(SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 2) as win_rate,
+        SUM(pnl) as pnl,
+        SUM(CASE WHEN LOWER(logic_type) LIKE 'v3%' THEN pnl ELSE 0 END) as v3_pnl,
+        SUM(CASE WHEN LOWER(logic_type) LIKE 'v6%' THEN pnl ELSE 0 END) as v6_pnl
+    FROM trades
+    WHERE status = 'closed' {filters}
+    GROUP BY DATE(close_time)
+    ORDER BY date DESC
+"""
+
+# Non-float columns of both exports (everything else is written as float64)
+ARROW_COLUMN_TYPES = {
+    "open_time": "string", "close_time": "string", "symbol": "string",
+    "direction": "string", "logic_type": "string", "date": "string",
+    "pips": "int", "duration_mins": "int",
+    "trade_count": "int", "wins": "int", "losses": "int",
+}
+
+
+# ==================== Data Classes ====================
+
+@dataclass
+class ExportRequest:
+    """What to export"""
+    kind: str = "trades"
+    fmt: str = "csv"
+    compress: bool = False
+    start: Optional[date] = None
+    end: Optional[date] = None
+    plugin: Optional[str] = None
+
+    @classmethod
+    def last_days(cls, days: int, **kwargs) -> "ExportRequest":
+        return cls(start=date.today() - timedelta(days=days), **kwargs)
+
+    def validate(self):
+        if self.kind not in EXPORT_KINDS:
+            raise ValueError(f"Unknown export kind '{self.kind}' (use {', '.join(EXPORT_KINDS)})")
+        if self.fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{self.fmt}' (use {', '.join(EXPORT_FORMATS)})")
+        if self.compress and self.fmt != "csv":
+            raise ValueError("gzip applies to CSV only; Parquet/Arrow are compressed internally")
+
+    @property
+    def filename(self) -> str:
+        parts = [self.kind]
+        if self.plugin:
+            parts.append(self.plugin)
+        if self.start:
+            parts.append(self.start.isoformat())
+        if self.end:
+            parts.append(self.end.isoformat())
+        suffix = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}[self.fmt]
+        return "_".join(parts) + suffix + (".gz" if self.compress else "")
+
+
+@dataclass
+class ExportResult:
+    """A finished export file"""
+    path: str
+    filename: str
+    rows: int
+    size_bytes: int
+    elapsed_seconds: float
+
+    def cleanup(self):
+        """Delete the temporary export file"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "rows": self.rows,
+            "size_bytes": self.size_bytes,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+# ==================== Exporter ====================
+
+class TradeExporter:
+    """
+    Streams trade history into export files.
+
+    Usage:
+        exporter = TradeExporter.from_connection(db.conn)
+        result = await exporter.export_async(ExportRequest.last_days(30, fmt="csv", compress=True))
+        ...
+        result.cleanup()
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        temp_dir: Optional[str] = None
+    ):
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+        self.temp_dir = temp_dir
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection, **kwargs) -> "TradeExporter":
+        """Build an exporter for the file behind an existing connection"""
+        row = conn.execute("PRAGMA database_list").fetchone()
+        db_path = row[2] if row and row[2] else DEFAULT_DB_PATH
+        return cls(db_path=db_path, **kwargs)
+
+    # -------------------- Streaming Queries --------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30.0)
+
+    @staticmethod
+    def _filters(request: ExportRequest) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if request.start:
+            clauses.append("close_time >= ?")
+            params.append(request.start.isoformat())
+        if request.end:
+            # Inclusive end date
+            clauses.append("close_time < ?")
+            params.append((request.end + timedelta(days=1)).isoformat())
+        if request.plugin:
+            clauses.append("(logic_type LIKE ? OR strategy LIKE ?)")
+            params.extend([f"%{request.plugin}%", f"%{request.plugin}%"])
+        return "".join(f" AND {c}" for c in clauses), params
+
+    def iter_chunks(
+        self,
+        request: ExportRequest,
+        conn: Optional[sqlite3.Connection] = None
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """Yield (columns, rows) chunks of at most ``chunk_size`` rows"""
+        template = TRADES_EXPORT_SQL if request.kind == "trades" else DAILY_EXPORT_SQL
+        filters, params = self._filters(request)
+        own_conn = conn is None
+        conn = conn or self._connect()
+        try:
+            cursor = conn.execute(template.format(filters=filters), params)
+            columns = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    return
+                yield columns, rows
+        finally:
+            if own_conn:
+                conn.close()
+
+    def iter_rows(self, request: ExportRequest, conn: Optional[sqlite3.Connection] = None) -> Iterator[Dict[str, Any]]:
+        """Yield export rows as dicts, one at a time"""
+        for columns, rows in self.iter_chunks(request, conn):
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    # -------------------- Writers --------------------
+
+    def export(self, request: ExportRequest) -> ExportResult:
+        """Write an export to a temporary file (blocking; see ``export_async``)"""
+        request.validate()
+        started = time.perf_counter()
+        fd, path = tempfile.mkstemp(
+            prefix="zepix_export_", suffix="_" + request.filename, dir=self.temp_dir
+        )
+        os.close(fd)
+        try:
+            if request.fmt == "csv":
+                rows = self._write_csv(request, path)
+            else:
+                rows = self._write_arrow(request, path)
+        except BaseException:
+            os.remove(path)
+            raise
+
+        result = ExportResult(
+            path=path,
+            filename=request.filename,
+            rows=rows,
+            size_bytes=os.path.getsize(path),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            f"[TradeExport] {result.filename}: {rows} rows, {result.size_bytes} bytes "
+            f"in {result.elapsed_seconds:.2f}s"
+        )
+        return result
+
+    async def export_async(self, request: ExportRequest) -> ExportResult:
+        """Run ``export`` in a worker thread"""
+        return await asyncio.to_thread(self.export, request)
+
+    def _write_csv(self, request: ExportRequest, path: str) -> int:
+        opener = gzip.open if request.compress else open
+        rows_written = 0
+        with opener(path, "wt", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            header_written = False
+            for columns, rows in self.iter_chunks(request):
+                if not header_written:
+                    writer.writerow(columns)
+                    header_written = True
+                writer.writerows(rows)
+                rows_written += len(rows)
+            if not header_written:
+                writer.writerow(self._columns(request))
+        return rows_written
+
+    def _write_arrow(self, request: ExportRequest, path: str) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(f"{request.fmt} export requires pyarrow") from e
+
+        # Fixed schema so a chunk of all-NULL values can't change column types
+        arrow_types = {"string": pa.string(), "int": pa.int64()}
+        schema = pa.schema([
+            (name, arrow_types.get(ARROW_COLUMN_TYPES.get(name), pa.float64()))
+            for name in self._columns(request)
+        ])
+        if request.fmt == "parquet":
+            writer = pq.ParquetWriter(path, schema, compression="snappy")
+        else:
+            writer = pa.ipc.new_file(path, schema)
+
+        rows_written = 0
+        try:
+            for columns, rows in self.iter_chunks(request):
+                batch = pa.RecordBatch.from_arrays(
+                    [pa.array([row[i] for row in rows], type=schema.field(name).type)
+                     for i, name in enumerate(columns)],
+                    schema=schema
+                )
+                if request.fmt == "parquet":
+                    writer.write_table(pa.Table.from_batches([batch]))
+                else:
+                    writer.write_batch(batch)
+                rows_written += len(rows)
+        finally:
+            writer.close()
+        return rows_written
+
+    def _columns(self, request: ExportRequest) -> List[str]:
+        """Column names for an empty result"""
+        template = TRADES_EXPORT_SQL if request.kind == "trades" else DAILY_EXPORT_SQL
+        conn = self._connect()
+        try:
+            cursor = conn.execute(template.format(filters=" AND 0"))
+            return [d[0] for d in cursor.description]
+        finally:
+            conn.close()
@@ -17,6 +17,7 @@ from src.core.trading_engine import TradingEngine
 from src.processors.alert_processor import AlertProcessor
 from src.managers.session_manager import SessionManager
 from src.database import TradeDatabase
+from src.telegram.render_cache import get_menu_render_cache
 
 # ============================================================================
 # ERROR HANDLING SYSTEM - DOCUMENT 09 IMPLEMENTATION
@@ -58,6 +59,7 @@ def main():
         # 1. Config
         logger.info("Loading Configuration...")
         config = Config()
+        get_menu_render_cache().attach(config)  # drop cached menus when settings change
         
         # 2. MT5 Client
         logger.info("Initializing MT5 Client...")
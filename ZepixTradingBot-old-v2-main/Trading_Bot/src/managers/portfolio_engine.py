@@ -0,0 +1,250 @@
+"""
+Portfolio Engine - Vectorized PnL and Exposure for Open Positions
+Computes live PnL per trade, per symbol and per profit chain
+
+Open trades are packed into NumPy column arrays (entry, lots, direction
+sign, pip size, pip value, symbol index, chain index). Prices are
+fetched once per symbol, not once per trade, and every figure is then
+derived in a single vectorized pass over the price vector. RiskManager,
+ProfitBookingManager and the Telegram dashboards read from here so all
+of them agree on the same numbers. Trades whose symbol has no
+``pip_value_per_std_lot`` cannot be priced; they are reported in
+``unpriced_symbols`` instead of silently dropping out of the totals.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Callable, Iterable, Tuple
+from dataclasses import dataclass, field
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PIP_SIZE = 0.0001
+BUY_DIRECTIONS = ("buy", "bullish", "long")
+
+
+# ==================== Data Classes ====================
+
+@dataclass
+class PortfolioBook:
+    """Open positions as column arrays (one row per priced trade)"""
+    trades: List[Any]
+    symbols: List[str]
+    chain_keys: List[Tuple[str, int]]
+    entry: np.ndarray
+    lots: np.ndarray
+    sign: np.ndarray
+    pip_size: np.ndarray
+    pip_value: np.ndarray
+    symbol_idx: np.ndarray
+    chain_idx: np.ndarray
+    skipped: List[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+    @property
+    def unpriced_symbols(self) -> List[str]:
+        """Symbols of skipped trades (no pip value configured)"""
+        return sorted({t.symbol for t in self.skipped})
+
+
+@dataclass
+class PortfolioSnapshot:
+    """Result of evaluating a book against one price vector"""
+    book: PortfolioBook
+    prices: np.ndarray
+    trade_pnl: np.ndarray
+    priced: np.ndarray
+    total_pnl: float
+    symbol_pnl: Dict[str, float]
+    chain_pnl: Dict[Tuple[str, int], float]
+    missing_prices: List[str]
+    unpriced_symbols: List[str]
+
+    def trade_details(self) -> List[Dict[str, Any]]:
+        """Per-trade rows in the format used by the dashboards"""
+        details = []
+        for i in np.flatnonzero(self.priced):
+            trade = self.book.trades[i]
+            details.append({
+                'symbol': trade.symbol,
+                'direction': trade.direction.upper(),
+                'live_pnl': float(self.trade_pnl[i]),
+                'entry_price': trade.entry,
+                'current_price': float(self.prices[self.book.symbol_idx[i]]),
+                'sl_price': trade.sl,
+                'tp_price': trade.tp,
+                'lot_size': trade.lot_size,
+                'trade_id': getattr(trade, 'trade_id', None)
+            })
+        return details
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_pnl": round(self.total_pnl, 2),
+            "trade_count": int(self.priced.sum()),
+            "symbol_pnl": {k: round(v, 2) for k, v in self.symbol_pnl.items()},
+            "chain_pnl": {f"{k[0]}:L{k[1]}": round(v, 2) for k, v in self.chain_pnl.items()},
+            "missing_prices": self.missing_prices,
+            "unpriced_symbols": self.unpriced_symbols,
+        }
+
+
+# ==================== Portfolio Engine ====================
+
+class PortfolioEngine:
+    """
+    Vectorized portfolio calculator.
+
+    Symbol specs (pip size, pip value per standard lot) come from
+    ``config["symbol_config"]``. Trades whose symbol has no pip value
+    configured are skipped, matching the per-trade calculators this
+    replaces; each such symbol is logged once and listed on the book and
+    snapshot.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.last_snapshot: Optional[PortfolioSnapshot] = None
+        self._warned_unpriced: set = set()
+
+    # -------------------- Building --------------------
+
+    def _symbol_spec(self, symbol: str) -> Optional[Tuple[float, float]]:
+        symbol_config = self.config.get("symbol_config", {}).get(symbol)
+        if not symbol_config or "pip_value_per_std_lot" not in symbol_config:
+            return None
+        return (
+            float(symbol_config.get("pip_size", DEFAULT_PIP_SIZE)),
+            float(symbol_config["pip_value_per_std_lot"]),
+        )
+
+    def build(self, trades: Iterable[Any]) -> PortfolioBook:
+        """Pack trades into column arrays"""
+        specs: Dict[str, Optional[Tuple[float, float]]] = {}
+        symbol_index: Dict[str, int] = {}
+        chain_index: Dict[Tuple[str, int], int] = {}
+        kept, skipped = [], []
+        rows = []
+
+        for trade in trades:
+            symbol = trade.symbol
+            if symbol not in specs:
+                specs[symbol] = self._symbol_spec(symbol)
+            spec = specs[symbol]
+            if spec is None:
+                skipped.append(trade)
+                continue
+
+            s_idx = symbol_index.setdefault(symbol, len(symbol_index))
+            chain_id = getattr(trade, 'profit_chain_id', None)
+            if chain_id:
+                c_idx = chain_index.setdefault(
+                    (chain_id, getattr(trade, 'profit_level', 0)), len(chain_index)
+                )
+            else:
+                c_idx = -1
+
+            sign = 1.0 if str(trade.direction).lower() in BUY_DIRECTIONS else -1.0
+            rows.append((trade.entry, trade.lot_size, sign, spec[0], spec[1], s_idx, c_idx))
+            kept.append(trade)
+
+        new_unpriced = sorted({t.symbol for t in skipped} - self._warned_unpriced)
+        if new_unpriced:
+            self._warned_unpriced.update(new_unpriced)
+            logger.warning(f"[Portfolio] No symbol_config pip_value_per_std_lot for {new_unpriced}; "
+                           f"their trades are excluded from PnL")
+
+        data = np.array(rows, dtype=float).reshape(-1, 7)
+        return PortfolioBook(
+            trades=kept,
+            symbols=list(symbol_index),
+            chain_keys=list(chain_index),
+            entry=data[:, 0],
+            lots=data[:, 1],
+            sign=data[:, 2],
+            pip_size=data[:, 3],
+            # Dollar value of one pip for this position's lot size
+            pip_value=data[:, 4] * data[:, 1],
+            symbol_idx=data[:, 5].astype(np.intp),
+            chain_idx=data[:, 6].astype(np.intp),
+            skipped=skipped,
+        )
+
+    # -------------------- Evaluation --------------------
+
+    def fetch_prices(self, book: PortfolioBook, price_source: Callable[[str], float]) -> np.ndarray:
+        """One price lookup per symbol; unavailable prices become NaN"""
+        prices = np.full(len(book.symbols), np.nan)
+        for i, symbol in enumerate(book.symbols):
+            try:
+                price = price_source(symbol)
+            except Exception as e:
+                logger.error(f"[Portfolio] Price lookup failed for {symbol}: {e}")
+                continue
+            if price:
+                prices[i] = price
+        return prices
+
+    def evaluate(self, book: PortfolioBook, prices) -> PortfolioSnapshot:
+        """
+        Compute every portfolio figure for one price vector.
+
+        Args:
+            book: Packed positions from ``build``
+            prices: Array aligned with ``book.symbols`` or a symbol->price dict
+        """
+        if isinstance(prices, dict):
+            prices = np.array([prices.get(s) or np.nan for s in book.symbols], dtype=float)
+        prices = np.asarray(prices, dtype=float)
+        n_symbols = len(book.symbols)
+
+        trade_price = prices[book.symbol_idx]
+        priced = ~np.isnan(trade_price)
+        pnl = np.where(
+            priced,
+            book.sign * (trade_price - book.entry) / book.pip_size * book.pip_value,
+            0.0
+        )
+
+        symbol_pnl = np.bincount(book.symbol_idx, weights=pnl, minlength=n_symbols)
+
+        in_chain = book.chain_idx >= 0
+        chain_pnl = np.bincount(book.chain_idx[in_chain], weights=pnl[in_chain],
+                                minlength=len(book.chain_keys))
+
+        snapshot = PortfolioSnapshot(
+            book=book,
+            prices=prices,
+            trade_pnl=pnl,
+            priced=priced,
+            total_pnl=float(pnl.sum()),
+            symbol_pnl=dict(zip(book.symbols, symbol_pnl.tolist())),
+            chain_pnl=dict(zip(book.chain_keys, chain_pnl.tolist())),
+            missing_prices=[s for s, p in zip(book.symbols, prices) if np.isnan(p)],
+            unpriced_symbols=book.unpriced_symbols,
+        )
+        return snapshot
+
+    def refresh(self, trades: Iterable[Any], price_source: Callable[[str], float]) -> PortfolioSnapshot:
+        """Build, price and evaluate; the result is kept as ``last_snapshot``"""
+        book = self.build(trades)
+        snapshot = self.evaluate(book, self.fetch_prices(book, price_source))
+        for symbol in snapshot.missing_prices:
+            logger.warning(f"Could not get current price for {symbol}")
+        self.last_snapshot = snapshot
+        return snapshot
+
+    def position_pnl(self, trade: Any, current_price: float) -> float:
+        """PnL of a single position (same formula as the vectorized pass)"""
+        spec = self._symbol_spec(trade.symbol)
+        if spec is None:
+            raise KeyError(trade.symbol)
+        pip_size, pip_value_std = spec
+        sign = 1.0 if str(trade.direction).lower() in BUY_DIRECTIONS else -1.0
+        return sign * (current_price - trade.entry) / pip_size * pip_value_std * trade.lot_size
@@ -6,6 +6,7 @@ from src.database import TradeDatabase
 from src.clients.mt5_client import MT5Client
 from src.utils.pip_calculator import PipCalculator
 from src.managers.risk_manager import RiskManager
+from src.managers.portfolio_engine import PortfolioEngine
 from src.utils.optimized_logger import logger
 import uuid
 import logging
@@ -29,6 +30,7 @@ class ProfitBookingManager:
         self.pip_calculator = pip_calculator
         self.risk_manager = risk_manager
         self.db = db
+        self.portfolio = PortfolioEngine(config)
         
         # Active profit booking chains
         self.active_chains: Dict[str, ProfitBookingChain] = {}
@@ -269,29 +271,9 @@ class ProfitBookingManager:
             if current_price == 0:
                 return 0.0
             
-            # Calculate PnL for each trade and sum
-            total_pnl = 0.0
-            
-            for trade in chain_trades:
-                symbol_config = self.config["symbol_config"][trade.symbol]
-                pip_size = symbol_config["pip_size"]
-                pip_value_per_std_lot = symbol_config["pip_value_per_std_lot"]
-                
-                # Calculate price difference in pips
-                if trade.direction == "buy":
-                    price_diff = current_price - trade.entry
-                else:
-                    price_diff = trade.entry - current_price
-                
-                pips_moved = price_diff / pip_size
-                
-                # Calculate PnL: pips × pip_value × lot_size
-                pip_value = pip_value_per_std_lot * trade.lot_size
-                trade_pnl = pips_moved * pip_value
-                
-                total_pnl += trade_pnl
-            
-            return total_pnl
+            # Single vectorized pass over the chain's orders
+            book = self.portfolio.build(chain_trades)
+            return self.portfolio.evaluate(book, {chain.symbol: current_price}).total_pnl
             
         except Exception as e:
             self.logger.error(f"Error calculating combined PnL: {str(e)}")
@@ -308,23 +290,7 @@ class ProfitBookingManager:
                 if current_price == 0:
                     return 0.0
             
-            symbol_config = self.config["symbol_config"][trade.symbol]
-            pip_size = symbol_config["pip_size"]
-            pip_value_per_std_lot = symbol_config["pip_value_per_std_lot"]
-            
-            # Calculate price difference in pips
-            if trade.direction == "buy":
-                price_diff = current_price - trade.entry
-            else:
-                price_diff = trade.entry - current_price
-            
-            pips_moved = price_diff / pip_size
-            
-            # Calculate PnL: pips × pip_value × lot_size
-            pip_value = pip_value_per_std_lot * trade.lot_size
-            trade_pnl = pips_moved * pip_value
-            
-            return trade_pnl
+            return self.portfolio.position_pnl(trade, current_price)
             
         except Exception as e:
             self.logger.error(f"Error calculating individual PnL for trade {trade.trade_id}: {str(e)}")
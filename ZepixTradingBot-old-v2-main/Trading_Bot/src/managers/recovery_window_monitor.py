@@ -598,6 +598,26 @@ Recovery attempt in progress...
         else:
             return 0.0001
     
+    def export_snapshot_state(self) -> Dict[int, Dict[str, Any]]:
+        """Active monitors for warm-restart snapshots (see src/core/state_snapshot.py)"""
+        return self.active_monitors
+    
+    def restore_snapshot_state(self, state: Dict[int, Dict[str, Any]]) -> None:
+        """
+        Resume monitors from a snapshot.
+        
+        Windows keep their original start_time, so a monitor whose window
+        passed while the bot was down times out on its first check.
+        """
+        for order_id, monitor_data in state.items():
+            if order_id in self.active_monitors:
+                continue
+            self.active_monitors[order_id] = monitor_data
+            self.monitor_tasks[order_id] = asyncio.create_task(self._monitor_loop(order_id))
+        
+        if state:
+            logger.info(f"♻️ Resumed {len(state)} recovery monitors from snapshot")
+    
     def get_active_monitors_count(self) -> int:
         """
         Get count of active monitors
@@ -302,6 +302,23 @@ class ReEntryManager:
                 chain.metadata["stop_reason"] = "Max recovery attempts exceeded"
                 print(f"🛑 HARD STOP: Chain {trade.chain_id} SL Hit → MAX RECOVERIES EXCEEDED → Chain Dead")
     
+    def export_snapshot_state(self) -> Dict[str, Any]:
+        """Chains and recent SL/TP events for warm-restart snapshots"""
+        return {
+            "active_chains": self.active_chains,
+            "recent_sl_hits": self.recent_sl_hits,
+            "completed_tps": self.completed_tps,
+        }
+    
+    def restore_snapshot_state(self, state: Dict[str, Any]):
+        """Restore chains and recent events from a snapshot (live state wins on conflict)"""
+        for chain_id, chain in state.get("active_chains", {}).items():
+            self.active_chains.setdefault(chain_id, chain)
+        for attr in ("recent_sl_hits", "completed_tps"):
+            events = getattr(self, attr)
+            for symbol, items in state.get(attr, {}).items():
+                events.setdefault(symbol, items)
+    
     def _clean_old_events(self, events: List[Dict]):
         """Remove events older than recovery window"""
         
@@ -0,0 +1,354 @@
+"""
+Risk Ledger - In-Memory Risk Counters with Append-Only Journal
+Keeps daily/lifetime loss, profit and trade counts for RiskManager
+
+Counters live in memory so risk checks are plain attribute reads. Every
+mutation is appended to a JSONL journal by a background writer thread
+that batches lines and fsyncs once per batch, so closing a burst of
+trades never waits on disk. The journal is periodically compacted into
+the ``stats.json`` snapshot; on startup the snapshot is loaded and the
+journal replayed on top of it to recover anything written after the
+last compaction.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+import threading
+import atexit
+import json
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SNAPSHOT_FILE = "data/stats.json"
+DEFAULT_JOURNAL_NAME = "risk_journal.jsonl"
+
+# Fields that may be overwritten through the "set" operation
+LEDGER_FIELDS = (
+    "daily_loss", "daily_profit", "lifetime_loss", "total_trades", "winning_trades"
+)
+
+
+# ==================== Data Classes ====================
+
+@dataclass
+class LedgerState:
+    """Current risk counters"""
+    date: str
+    daily_loss: float = 0.0
+    daily_profit: float = 0.0
+    lifetime_loss: float = 0.0
+    total_trades: int = 0
+    winning_trades: int = 0
+
+    def roll_to(self, day: str):
+        """Start a new trading day (daily counters reset, lifetime kept)"""
+        if day != self.date:
+            self.date = day
+            self.daily_loss = 0.0
+            self.daily_profit = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ==================== Risk Ledger ====================
+
+class RiskLedger:
+    """
+    In-memory risk counters persisted through a batched append-only journal.
+
+    Mutations are applied to memory immediately and queued for the writer
+    thread; ``flush()`` forces the queue to disk synchronously for the rare
+    callers (manual resets) that need the file to reflect memory right away.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str = DEFAULT_SNAPSHOT_FILE,
+        journal_path: Optional[str] = None,
+        flush_interval: float = 0.5,
+        compact_every: int = 500,
+        background: bool = True
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.join(
+            os.path.dirname(snapshot_path), DEFAULT_JOURNAL_NAME
+        )
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+        self.background = background
+
+        self.state = LedgerState(date=str(date.today()))
+        self._seq = 0
+        self._pending: List[str] = []
+        self._journal_entries = 0
+
+        self._lock = threading.Lock()      # guards state and pending queue
+        self._io_lock = threading.Lock()   # serialises journal/snapshot writes
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._atexit_registered = False
+
+        self.stats = {
+            "appended": 0,
+            "fsyncs": 0,
+            "compactions": 0,
+            "replayed": 0,
+            "write_errors": 0,
+        }
+
+        self.recover()
+
+    # -------------------- Mutations --------------------
+
+    def record_pnl(self, pnl: float):
+        """Record a closed trade's PnL (counts the trade, win or loss)"""
+        self._append("pnl", amount=float(pnl))
+
+    def record_loss(self, amount: float):
+        """Add a loss to daily and lifetime totals without counting a trade"""
+        self._append("loss", amount=abs(float(amount)))
+
+    def reset_daily(self, include_trades: bool = False):
+        """Clear daily loss/profit (and optionally the trade counters)"""
+        self._append("reset_daily", include_trades=include_trades)
+
+    def reset_lifetime(self):
+        """Clear the lifetime loss counter"""
+        self._append("reset_lifetime")
+
+    def set_values(self, **values):
+        """Overwrite counters directly (manual corrections and tests)"""
+        unknown = set(values) - set(LEDGER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown ledger fields: {sorted(unknown)}")
+        self._append("set", values=values)
+
+    def _append(self, op: str, **fields):
+        with self._lock:
+            self._seq += 1
+            entry = {"seq": self._seq, "op": op, "date": str(date.today()), **fields}
+            self._apply(entry)
+            self._pending.append(json.dumps(entry))
+            self.stats["appended"] += 1
+        self._ensure_writer()
+
+    def _apply(self, entry: Dict[str, Any]):
+        """Apply one journal entry to the in-memory state (live and replay)"""
+        state = self.state
+        state.roll_to(entry.get("date", state.date))
+        op = entry.get("op")
+
+        if op == "pnl":
+            pnl = entry["amount"]
+            state.total_trades += 1
+            if pnl > 0:
+                state.daily_profit += pnl
+                state.winning_trades += 1
+            else:
+                state.daily_loss += abs(pnl)
+                state.lifetime_loss += abs(pnl)
+        elif op == "loss":
+            state.daily_loss += entry["amount"]
+            state.lifetime_loss += entry["amount"]
+        elif op == "reset_daily":
+            state.daily_loss = 0.0
+            state.daily_profit = 0.0
+            if entry.get("include_trades"):
+                state.total_trades = 0
+                state.winning_trades = 0
+        elif op == "reset_lifetime":
+            state.lifetime_loss = 0.0
+        elif op == "set":
+            for key, value in entry.get("values", {}).items():
+                if key in LEDGER_FIELDS:
+                    setattr(state, key, value)
+        else:
+            logger.warning(f"[RiskLedger] Ignoring unknown journal op: {op}")
+
+    # -------------------- Persistence --------------------
+
+    def _ensure_writer(self):
+        if not self.background:
+            return
+        if self._writer is None or not self._writer.is_alive():
+            self._stopped.clear()
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="RiskLedgerWriter", daemon=True
+            )
+            self._writer.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+        self._wakeup.set()
+
+    def _writer_loop(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            # Let a burst of closes accumulate into one fsync
+            self._stopped.wait(self.flush_interval)
+            self.flush()
+
+    def request_flush(self):
+        """Ask the writer thread to persist pending entries soon"""
+        if self.background:
+            self._ensure_writer()
+        else:
+            self.flush()
+
+    def flush(self, compact: bool = False) -> bool:
+        """
+        Write pending entries to the journal and fsync.
+
+        Args:
+            compact: Also rewrite the snapshot and truncate the journal
+
+        Returns:
+            True if everything pending reached disk
+        """
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+
+            if lines:
+                try:
+                    self._ensure_dir(self.journal_path)
+                    with open(self.journal_path, "a", encoding="utf-8") as f:
+                        f.write("\n".join(lines) + "\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._journal_entries += len(lines)
+                    self.stats["fsyncs"] += 1
+                except Exception as e:
+                    self.stats["write_errors"] += 1
+                    logger.error(f"[RiskLedger] Journal write failed, will retry: {e}")
+                    with self._lock:
+                        self._pending = lines + self._pending
+                    return False
+
+            if compact or self._journal_entries >= self.compact_every:
+                return self._compact()
+            return True
+
+    def _compact(self) -> bool:
+        """Write the snapshot atomically and start a fresh journal"""
+        with self._lock:
+            snapshot = self.state.to_dict()
+            snapshot["journal_seq"] = self._seq
+            snapshot["updated_at"] = datetime.now().isoformat()
+
+        tmp_path = self.snapshot_path + ".tmp"
+        try:
+            self._ensure_dir(self.snapshot_path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            # Entries still pending carry seq > journal_seq and land in the new journal
+            with open(self.journal_path, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries = 0
+            self.stats["compactions"] += 1
+            return True
+        except Exception as e:
+            self.stats["write_errors"] += 1
+            logger.error(f"[RiskLedger] Snapshot compaction failed: {e}")
+            return False
+
+    def recover(self):
+        """Rebuild state from the snapshot plus journal replay"""
+        state = LedgerState(date=str(date.today()))
+        snapshot_seq = 0
+
+        if os.path.exists(self.snapshot_path) and os.path.getsize(self.snapshot_path) > 0:
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                state = LedgerState(
+                    date=data.get("date", state.date),
+                    daily_loss=data.get("daily_loss", 0.0),
+                    daily_profit=data.get("daily_profit", 0.0),
+                    lifetime_loss=data.get("lifetime_loss", 0.0),
+                    total_trades=data.get("total_trades", 0),
+                    winning_trades=data.get("winning_trades", 0),
+                )
+                snapshot_seq = data.get("journal_seq", 0)
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"[RiskLedger] Snapshot corrupted, replaying journal only: {e}")
+
+        entries = self._read_journal()
+        with self._lock:
+            self.state = state
+            self._seq = snapshot_seq
+            self._pending = []
+            replayed = 0
+            for entry in entries:
+                if entry.get("seq", 0) <= snapshot_seq:
+                    continue
+                self._apply(entry)
+                self._seq = entry["seq"]
+                replayed += 1
+            self.state.roll_to(str(date.today()))
+            self._journal_entries = len(entries)
+            self.stats["replayed"] = replayed
+
+        if replayed:
+            logger.info(
+                f"[RiskLedger] Replayed {replayed} journal entries "
+                f"(Daily Loss=${self.state.daily_loss:.2f}, Lifetime=${self.state.lifetime_loss:.2f})"
+            )
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.journal_path):
+            return []
+        entries = []
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    logger.warning(f"[RiskLedger] Skipping unreadable journal line {line_no}")
+        return entries
+
+    @staticmethod
+    def _ensure_dir(path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    # -------------------- Lifecycle --------------------
+
+    def close(self):
+        """Stop the writer thread and compact everything to disk"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join(timeout=5)
+        self._writer = None
+        self.flush(compact=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            **self.state.to_dict(),
+            "journal_seq": self._seq,
+            "pending": pending,
+            "journal_entries": self._journal_entries,
+            **self.stats,
+        }
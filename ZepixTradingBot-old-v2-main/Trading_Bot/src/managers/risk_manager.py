@@ -4,6 +4,8 @@ import logging
 from datetime import datetime, date
 from typing import Dict, Any, List
 from src.config import Config
+from src.managers.risk_ledger import RiskLedger
+from src.managers.portfolio_engine import PortfolioEngine
 
 logger = logging.getLogger(__name__)
 
@@ -11,63 +13,72 @@ class RiskManager:
     def __init__(self, config: Config):
         self.config = config
         self.stats_file = "data/stats.json"
-        self.daily_loss = 0.0
-        self.lifetime_loss = 0.0
-        self.daily_profit = 0.0
-        self.total_trades = 0
-        self.winning_trades = 0
+        self.ledger = RiskLedger(snapshot_path=self.stats_file)
+        self.portfolio = PortfolioEngine(config)
         self.open_trades = []
         self.mt5_client = None
-        self.load_stats()
-        
+
+    # Risk counters live in the ledger; these stay plain O(1) attribute reads
+    @property
+    def daily_loss(self) -> float:
+        return self.ledger.state.daily_loss
+
+    @daily_loss.setter
+    def daily_loss(self, value: float):
+        self.ledger.set_values(daily_loss=value)
+
+    @property
+    def daily_profit(self) -> float:
+        return self.ledger.state.daily_profit
+
+    @daily_profit.setter
+    def daily_profit(self, value: float):
+        self.ledger.set_values(daily_profit=value)
+
+    @property
+    def lifetime_loss(self) -> float:
+        return self.ledger.state.lifetime_loss
+
+    @lifetime_loss.setter
+    def lifetime_loss(self, value: float):
+        self.ledger.set_values(lifetime_loss=value)
+
+    @property
+    def total_trades(self) -> int:
+        return self.ledger.state.total_trades
+
+    @total_trades.setter
+    def total_trades(self, value: int):
+        self.ledger.set_values(total_trades=value)
+
+    @property
+    def winning_trades(self) -> int:
+        return self.ledger.state.winning_trades
+
+    @winning_trades.setter
+    def winning_trades(self, value: int):
+        self.ledger.set_values(winning_trades=value)
+
     def load_stats(self):
-        """Load statistics from file with error handling"""
-        try:
-            if os.path.exists(self.stats_file) and os.path.getsize(self.stats_file) > 0:
-                with open(self.stats_file, 'r') as f:
-                    stats = json.load(f)
-                    
-                if stats.get("date") != str(date.today()):
-                    self.daily_loss = 0.0
-                    self.daily_profit = 0.0
-                else:
-                    self.daily_loss = stats.get("daily_loss", 0.0)
-                    self.daily_profit = stats.get("daily_profit", 0.0)
-                    
-                self.lifetime_loss = stats.get("lifetime_loss", 0.0)
-                self.total_trades = stats.get("total_trades", 0)
-                self.winning_trades = stats.get("winning_trades", 0)
-            else:
-                # Initialize with default values if file doesn't exist or is empty
-                self.reset_daily_stats()
-                
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"WARNING: Stats file corrupted, resetting: {str(e)}")
-            self.reset_daily_stats()
+        """Reload statistics from the stats snapshot plus journal replay"""
+        self.ledger.recover()
     
     def reset_daily_stats(self):
         """Reset daily statistics"""
-        self.daily_loss = 0.0
-        self.daily_profit = 0.0
-        self.total_trades = 0
-        self.winning_trades = 0
-        self.save_stats()
+        self.ledger.reset_daily(include_trades=True)
     
     def reset_lifetime_loss(self):
         """Reset lifetime loss counter"""
-        self.lifetime_loss = 0.0
-        self.save_stats()
+        self.ledger.reset_lifetime()
     
     def reset_daily_loss(self):
         """Reset daily loss and profit counters (keeps lifetime loss)"""
         logger.info(f"[RESET_DAILY_LOSS] Clearing daily stats (Current: Loss=${self.daily_loss:.2f}, Profit=${self.daily_profit:.2f})")
         
-        # Explicitly set to zero
-        self.daily_loss = 0.0
-        self.daily_profit = 0.0
+        self.ledger.reset_daily()
         
-        # Save with verification
-        save_success = self.save_stats()
+        # Manual reset: write through so the stats file reflects it immediately
+        save_success = self.ledger.flush(compact=True)
         
         if save_success:
             logger.info(f"[RESET_DAILY_LOSS] ✅ Daily loss cleared successfully and verified in {self.stats_file}")
@@ -77,53 +88,9 @@ class RiskManager:
             return False
     
     def save_stats(self):
-        """Save statistics to file with verification and retry"""
-        stats = {
-            "date": str(date.today()),
-            "daily_loss": self.daily_loss,
-            "daily_profit": self.daily_profit,
-            "lifetime_loss": self.lifetime_loss,
-            "total_trades": self.total_trades,
-            "winning_trades": self.winning_trades
-        }
-        
-        # Try to save with retry logic
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
-                
-                # Write stats file
-                with open(self.stats_file, 'w') as f:
-                    json.dump(stats, f, indent=4)
-                
-                # CRITICAL FIX: Verify file was written correctly
-                with open(self.stats_file, 'r') as f:
-                    verify_data = json.load(f)
-                
-                # Check if daily_loss matches what we tried to save
-                if abs(verify_data.get("daily_loss", -999) - self.daily_loss) < 0.01:
-                    logger.info(f"✅ Stats saved successfully: Daily Loss=${self.daily_loss:.2f}, Lifetime=${self.lifetime_loss:.2f}")
-                    return True
-                else:
-                    raise ValueError(f"Verification failed: Expected daily_loss={self.daily_loss}, got {verify_data.get('daily_loss')}")
-                    
-            except Exception as e:
-                error_msg = f"ERROR: Stats save attempt {attempt + 1}/{max_retries} failed: {str(e)}"
-                print(error_msg)
-                logger.error(error_msg)
-                
-                if attempt < max_retries - 1:
-                    # Wait before retry
-                    import time
-                    time.sleep(1)
-                else:
-                    # Final attempt failed
-                    logger.error(f"CRITICAL: Failed to save stats after {max_retries} attempts. File: {self.stats_file}")
-                    return False
-        
-        return False
+        """Schedule persistence of pending ledger entries (non-blocking)"""
+        self.ledger.request_flush()
+        return True
     
     def get_fixed_lot_size(self, balance: float) -> float:
         """Get fixed lot size based on account balance or active tier"""
@@ -230,16 +197,7 @@ class RiskManager:
     
     def update_pnl(self, pnl: float):
         """Update PnL and risk statistics"""
-        self.total_trades += 1
-        
-        if pnl > 0:
-            self.daily_profit += pnl
-            self.winning_trades += 1
-        else:
-            self.daily_loss += abs(pnl)
-            self.lifetime_loss += abs(pnl)
-        
-        self.save_stats()
+        self.ledger.record_pnl(pnl)
     
     def add_open_trade(self, trade):
         """Add trade to open trades list"""
@@ -461,62 +419,25 @@ class RiskManager:
             logger.error(f"Error calculating today's performance: {e}")
             return {'profit': 0.0, 'loss': 0.0, 'net': 0.0, 'trade_count': 0}
     
-    def get_live_open_trades_pnl(self, trading_engine, mt5_client, pip_calculator) -> Dict[str, Any]:
+    def get_live_open_trades_pnl(self, trading_engine, mt5_client) -> Dict[str, Any]:
         """
         Calculate real-time PnL for all open trades
-        Returns: {"total_live_pnl": float, "trade_details": List[Dict]}
+        Returns: {"total_live_pnl": float, "trade_details": List[Dict],
+                  "unpriced_symbols": List[str]} - symbols left out for lack of a pip value
         """
         try:
-            open_trades = trading_engine.get_open_trades()
-            total_live_pnl = 0.0
-            trade_details = []
-            
-            for trade in open_trades:
-                try:
-                    # Get current price from MT5
-                    current_price = mt5_client.get_current_price(trade.symbol)
-                    if current_price is None or current_price == 0:
-                        logger.warning(f"Could not get current price for {trade.symbol}")
-                        continue
-                    
-                    # Get pip size and pip value
-                    pip_size = pip_calculator.get_pip_size(trade.symbol)
-                    pip_value = pip_calculator.get_pip_value(trade.symbol, trade.lot_size)
-                    
-                    # Calculate pips moved
-                    if trade.direction.lower() == 'buy':
-                        pips = (current_price - trade.entry) / pip_size
-                    else:  # sell
-                        pips = (trade.entry - current_price) / pip_size
-                    
-                    # Calculate live PnL
-                    live_pnl = pips * pip_value
-                    total_live_pnl += live_pnl
-                    
-                    trade_details.append({
-                        'symbol': trade.symbol,
-                        'direction': trade.direction.upper(),
-                        'live_pnl': live_pnl,
-                        'entry_price': trade.entry,
-                        'current_price': current_price,
-                        'sl_price': trade.sl,
-                        'tp_price': trade.tp,
-                        'lot_size': trade.lot_size,
-                        'trade_id': getattr(trade, 'trade_id', None)
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error calculating PnL for trade {getattr(trade, 'trade_id', 'unknown')}: {e}")
-                    continue
-            
+            snapshot = self.portfolio.refresh(
+                trading_engine.get_open_trades(), mt5_client.get_current_price
+            )
             return {
-                'total_live_pnl': total_live_pnl,
-                'trade_details': trade_details
+                'total_live_pnl': snapshot.total_pnl,
+                'trade_details': snapshot.trade_details(),
+                'unpriced_symbols': snapshot.unpriced_symbols
             }
             
         except Exception as e:
             logger.error(f"Error calculating live open trades PnL: {e}")
-            return {'total_live_pnl': 0.0, 'trade_details': []}
+            return {'total_live_pnl': 0.0, 'trade_details': [], 'unpriced_symbols': []}
     
     @staticmethod
     def format_pnl_value(pnl: float) -> str:
@@ -579,9 +500,7 @@ class RiskManager:
             symbol: Optional symbol for tracking
         """
         loss = abs(loss_amount)
-        self.daily_loss += loss
-        self.lifetime_loss += loss
-        self.save_stats()
+        self.ledger.record_loss(loss)
         logger.info(f"Loss recorded: ${loss:.2f} (Daily: ${self.daily_loss:.2f}, Lifetime: ${self.lifetime_loss:.2f})")
     
     def check_daily_limit(self, symbol: str = None) -> bool:
@@ -32,6 +32,8 @@ class SessionManager:
         self.db = db
         self.mt5_client = mt5_client
         self.active_session_id: Optional[str] = None
+        # Whether the active session has had trades (it ends once they are all closed)
+        self._active_session_traded = False
         
         # Session configuration
         self.session_config = config.get("session_manager", {})
@@ -57,6 +59,7 @@ class SessionManager:
         active = self.db.get_active_session()
         if active:
             self.active_session_id = active.get('session_id')
+            self._active_session_traded = bool(active.get('total_trades'))
             logger.info(f"Recovered active session: {self.active_session_id}")
             
         logger.info(f"Session Manager Initialized (Merged V5 Logic)")
@@ -87,6 +90,7 @@ class SessionManager:
             self.db.conn.commit()
             
             self.active_session_id = session_id
+            self._active_session_traded = False
             logger.info(f"📊 SESSION STARTED: {session_id} | {symbol} {direction} {logic}")
             return session_id
             
@@ -95,17 +99,16 @@ class SessionManager:
             return None
     
     def close_session(self, reason: str = "COMPLETE_EXIT"):
-        """Close active session and log stats"""
+        """Close active session and freeze its report (summary is already up to date)"""
         try:
             if not self.active_session_id:
                 return
             
-            self.db.update_session_stats(self.active_session_id)
-            self.db.close_session(self.active_session_id, reason)
-            details = self.db.get_session_details(self.active_session_id)
+            details = self.db.close_session(self.active_session_id, reason)
             
             logger.info(f"🏁 SESSION CLOSED: {self.active_session_id} | Reason: {reason} | PnL: ${details.get('total_pnl', 0):.2f}")
             self.active_session_id = None
+            self._active_session_traded = False
             return details
         except Exception as e:
             logger.error(f"Error closing session: {str(e)}")
@@ -115,9 +118,39 @@ class SessionManager:
         return self.active_session_id
 
     def update_session(self):
+        """Rebuild the active session's summary from its trades (repair only)"""
         if self.active_session_id:
             self.db.update_session_stats(self.active_session_id)
 
+    def check_session_end(self, open_trades: List) -> Optional[Dict[str, Any]]:
+        """
+        Close the active session once all of its trades have closed.
+        
+        Returns:
+            The frozen session report if the session was closed, else None
+        """
+        if not self.active_session_id:
+            return None
+        if any(getattr(t, 'session_id', None) == self.active_session_id and t.status != "closed"
+               for t in open_trades):
+            self._active_session_traded = True
+            return None
+        if not self._active_session_traded:
+            # Trades may have opened and closed between checks
+            summary = self.db.get_session_report(self.active_session_id)
+            self._active_session_traded = bool(summary.get('total_trades'))
+            if not self._active_session_traded:
+                return None
+        return self.close_session("COMPLETE_EXIT")
+
+    def get_session_report(self, session_id: str) -> Dict[str, Any]:
+        """Report of a session (frozen at close, live summary while active)"""
+        return self.db.get_session_report(session_id)
+
+    def get_today_sessions(self) -> List[Dict[str, Any]]:
+        """Summary rows of today's sessions"""
+        return self.db.get_sessions_by_date(datetime.now().date())
+
     def update_logic_stats(self, trade):
         """Update logic specific stats in session metadata"""
         if not self.active_session_id: return
@@ -2,6 +2,7 @@
 Command Executor - Executes commands from user context
 """
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from .parameter_validator import ParameterValidator
@@ -10,6 +11,9 @@ from .dynamic_handlers import DynamicHandlers
 
 logger = logging.getLogger(__name__)
 
+# Only the most recent executions are kept for the log and stats
+EXECUTION_LOG_LIMIT = 1000
+
 class CommandExecutor:
     """
     Executes commands with parameters from user context
@@ -19,7 +23,7 @@ class CommandExecutor:
         self.bot = telegram_bot
         self.validator = ParameterValidator()
         self.dynamic_handlers = DynamicHandlers(telegram_bot)
-        self.execution_log: List[Dict[str, Any]] = []  # Store execution history
+        self.execution_log: deque = deque(maxlen=EXECUTION_LOG_LIMIT)  # Recent execution history
         self.context_manager = context_manager  # Store reference to context manager
     
     def _create_message_dict(self, command: str, params: Dict[str, Any]) -> dict:
@@ -436,7 +440,7 @@ class CommandExecutor:
     
     def get_execution_log(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent execution log entries"""
-        return self.execution_log[-limit:] if len(self.execution_log) > limit else self.execution_log
+        return list(self.execution_log)[-limit:]
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics"""
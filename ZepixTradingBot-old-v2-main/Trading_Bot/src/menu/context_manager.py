@@ -3,32 +3,50 @@ User Context Manager for Menu System
 Stores user's current menu state and selected parameters
 """
 from typing import Dict, Any, Optional
+from collections import OrderedDict
 import time
 
+from src.utils.session_store import SessionStore
+
 class ContextManager:
     """
     Manages user context for multi-step command execution
     Stores current menu, pending command, and selected parameters
+    
+    Contexts live in a SessionStore: they expire ``expiration_minutes``
+    after the last update and at most ``max_contexts`` are kept in memory.
     """
     
-    def __init__(self, expiration_minutes: int = 30):
-        self.user_contexts: Dict[int, Dict[str, Any]] = {}
-        self.context_expiration: Dict[int, float] = {}  # user_id -> expiration timestamp
+    def __init__(self, expiration_minutes: int = 30, max_contexts: int = 10000,
+                 spill_path: Optional[str] = None):
         self.expiration_minutes = expiration_minutes
+        self.store = SessionStore(
+            "menu_context",
+            ttl_seconds=expiration_minutes * 60,
+            max_entries=max_contexts,
+            spill_path=spill_path,
+            on_evict=self._on_evict,
+        )
+        # Users whose context expired, until they are told (see _is_expired)
+        self._expired_users: "OrderedDict[int, None]" = OrderedDict()
+    
+    @property
+    def user_contexts(self) -> Dict[int, Dict[str, Any]]:
+        """Snapshot of live contexts"""
+        return dict(self.store.items())
     
     def get_context(self, user_id: int) -> Dict[str, Any]:
         """Get user's current context"""
-        # Check expiration
-        if self._is_expired(user_id):
-            self.clear_context(user_id)
-        
-        context = self.user_contexts.get(user_id, {
-            "current_menu": "menu_main",
-            "pending_command": None,
-            "params": {},
-            "menu_history": [],
-            "created_at": time.time()
-        })
+        context = self.store.get(user_id)
+        self._expired_users.pop(user_id, None)
+        if context is None:
+            context = {
+                "current_menu": "menu_main",
+                "pending_command": None,
+                "params": {},
+                "menu_history": [],
+                "created_at": time.time()
+            }
         
         # CRITICAL FIX: Ensure params always exists (never return None)
         if "params" not in context:
@@ -39,7 +57,7 @@ class ContextManager:
     def set_context(self, user_id: int, context: Dict[str, Any]):
         """Set user's context - preserves existing params unless explicitly cleared"""
         # Preserve existing params if not explicitly cleared
-        old_context = self.user_contexts.get(user_id)
+        old_context = self.store.get(user_id)
         if old_context and "params" in old_context and old_context["params"]:
             # Only preserve if new context doesn't have params or has empty params
             if "params" not in context or not context.get("params"):
@@ -52,8 +70,8 @@ class ContextManager:
         context["created_at"] = time.time()
         context.setdefault("last_updated", time.time())
         context["last_updated"] = time.time()
-        self.user_contexts[user_id] = context
-        self._update_expiration(user_id)
+        self._expired_users.pop(user_id, None)
+        self.store.set(user_id, context)
     
     def update_context(self, user_id: int, **updates):
         """Update specific fields in user's context - merges params instead of replacing"""
@@ -109,26 +127,25 @@ class ContextManager:
     
     def clear_context(self, user_id: int):
         """Clear all context for user"""
-        if user_id in self.user_contexts:
-            del self.user_contexts[user_id]
-        if user_id in self.context_expiration:
-            del self.context_expiration[user_id]
+        self.store.discard(user_id)
+        self._expired_users.pop(user_id, None)
     
-    def _update_expiration(self, user_id: int):
-        """Update expiration timestamp for user context"""
-        self.context_expiration[user_id] = time.time() + (self.expiration_minutes * 60)
+    def _on_evict(self, user_id: int, context: Dict[str, Any], reason: str):
+        """Remember expired users so the next interaction can report it"""
+        if reason != "expired":
+            return
+        self._expired_users[user_id] = None
+        while len(self._expired_users) > self.store.max_entries:
+            self._expired_users.popitem(last=False)
     
     def _is_expired(self, user_id: int) -> bool:
         """Check if user context has expired"""
-        if user_id not in self.context_expiration:
-            return False
-        return time.time() > self.context_expiration[user_id]
+        self.store.expire()
+        return user_id in self._expired_users
     
-    def cleanup_expired_contexts(self):
+    def cleanup_expired_contexts(self) -> int:
         """Clean up all expired contexts"""
-        expired_users = [uid for uid in self.context_expiration.keys() if self._is_expired(uid)]
-        for user_id in expired_users:
-            self.clear_context(user_id)
+        return self.store.expire()
     
     def recover_context(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Attempt to recover context from partial failure"""
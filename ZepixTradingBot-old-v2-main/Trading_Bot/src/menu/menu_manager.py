@@ -16,6 +16,7 @@ from .v6_control_menu_handler import V6ControlMenuHandler
 from .analytics_menu_handler import AnalyticsMenuHandler
 from .dual_order_menu_handler import DualOrderMenuHandler, ReentryMenuHandler
 from .notification_preferences_menu import NotificationPreferencesMenuHandler
+from src.telegram.render_cache import get_menu_render_cache
 from datetime import datetime
 import pytz # Will need to check if pytz is available or use standard timezone handling
 import logging
@@ -31,6 +32,7 @@ class MenuManager:
         self.bot = telegram_bot
         self.context = ContextManager()
         self.executor = CommandExecutor(telegram_bot, context_manager=self.context)
+        self.render_cache = get_menu_render_cache()
         
         # V6 Control Menu Handler (Telegram V5 Upgrade)
         self._v6_handler = V6ControlMenuHandler(telegram_bot)
@@ -228,6 +230,19 @@ class MenuManager:
     def show_orders_submenu(self, user_id: int, message_id: Optional[int] = None):
         """Display Orders & Re-entry submenu"""
         
+        menu = self.render_cache.get_or_render("orders", (), self._render_orders_submenu)
+        text, reply_markup = menu.text, menu.reply_markup
+        
+        # Update context
+        self.context.update_context(user_id, current_menu="menu_orders")
+        
+        if message_id:
+            return self.bot.edit_message(text, message_id, reply_markup)
+        else:
+            return self.bot.send_message(text, reply_markup)
+    
+    def _render_orders_submenu(self):
+        """Static Orders & Re-entry submenu (text, keyboard)"""
         text = (
             "💎 *ORDER MANAGEMENT & RE-ENTRY SYSTEM*\n"
             "━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
@@ -266,15 +281,7 @@ class MenuManager:
             {"text": "🔄 Refresh", "callback_data": "menu_orders"}
         ])
         
-        reply_markup = {"inline_keyboard": keyboard}
-        
-        # Update context
-        self.context.update_context(user_id, current_menu="menu_orders")
-        
-        if message_id:
-            return self.bot.edit_message(text, message_id, reply_markup)
-        else:
-            return self.bot.send_message(text, reply_markup)
+        return text, {"inline_keyboard": keyboard}
     
     def show_main_menu(self, user_id: int, message_id: Optional[int] = None):
         """Display main menu with categories and dynamic system status header"""
@@ -302,6 +309,22 @@ class MenuManager:
             "Use the buttons below to control the bot."
         )
         
+        reply_markup = self.render_cache.get_or_render(
+            "main", (), self._render_main_keyboard
+        ).reply_markup
+        
+        # Update context
+        self.context.update_context(user_id, current_menu="menu_main")
+        
+        if message_id:
+            # Edit existing message
+            return self.bot.edit_message(text, message_id, reply_markup)
+        else:
+            # Send new message
+            return self.bot.send_message_with_keyboard(text, reply_markup)
+
+    def _render_main_keyboard(self):
+        """Main menu keyboard (static; the header text is rebuilt per call)"""
         keyboard = []
         
         # Quick Actions Row 1
@@ -369,7 +392,19 @@ class MenuManager:
         # Main Categories - Row 8 (V6 Price Action - Telegram V5 Upgrade)
         cat_row8 = []
         cat_row8.append({"text": "📊 V6 Price Action", "callback_data": "menu_v6"})
+        cat_row8.append({"text": "📈 Analytics", "callback_data": "menu_analytics"})
+        keyboard.append(cat_row8)
+        
+        keyboard.append([])  # Empty row for spacing
         
+        # Help and Refresh
+        help_row = []
+        help_row.append({"text": "🆘 Help", "callback_data": "action_help"})
+        help_row.append({"text": "🔄 Refresh", "callback_data": "menu_main"})
+        keyboard.append(help_row)
+        
+        return None, {"inline_keyboard": keyboard}
+    
     def handle_menu_callback(self, callback_query, callback_data: str):
         """
         Handle menu callback queries and route to appropriate handler.
@@ -423,29 +458,7 @@ class MenuManager:
         # Default: unhandled
         logger.warning(f"[MenuManager] Unhandled callback: {callback_data}")
         return False
-        cat_row8.append({"text": "📈 Analytics", "callback_data": "menu_analytics"})
-        keyboard.append(cat_row8)
-        
-        keyboard.append([])  # Empty row for spacing
-        
-        # Help and Refresh
-        help_row = []
-        help_row.append({"text": "🆘 Help", "callback_data": "action_help"})
-        help_row.append({"text": "🔄 Refresh", "callback_data": "menu_main"})
-        keyboard.append(help_row)
-        
-        reply_markup = {"inline_keyboard": keyboard}
-        
-        # Update context
-        self.context.update_context(user_id, current_menu="menu_main")
-        
-        if message_id:
-            # Edit existing message
-            return self.bot.edit_message(text, message_id, reply_markup)
-        else:
-            # Send new message
-            return self.bot.send_message_with_keyboard(text, reply_markup)
-
+    
     def get_persistent_main_menu(self):
         return {
             "keyboard": [
@@ -470,6 +483,23 @@ class MenuManager:
         config = self.bot.config.get("timeframe_specific_config", {})
         enabled = config.get("enabled", False)
         
+        menu = self.render_cache.get_or_render(
+            "timeframe", (bool(enabled),),
+            lambda: self._render_timeframe_menu(enabled),
+            depends_on=("timeframe_specific_config",)
+        )
+        text, keyboard = menu.text, menu.reply_markup
+        
+        if message_id:
+            try:
+                self.bot.edit_message(text, message_id, keyboard, parse_mode="HTML")
+            except Exception:
+                self.bot.send_message_with_keyboard(text, keyboard)
+        else:
+            self.bot.send_message_with_keyboard(text, keyboard)
+    
+    def _render_timeframe_menu(self, enabled: bool):
+        """Timeframe configuration menu for one toggle state (text, keyboard)"""
         # Dynamic toggle button text
         toggle_text = f"{'✅' if enabled else '❌'} Toggle System"
         
@@ -497,19 +527,25 @@ class MenuManager:
             f"Use <b>Help</b> to learn how it works."
         )
         
-        if message_id:
-            try:
-                self.bot.edit_message(text, message_id, keyboard, parse_mode="HTML")
-            except Exception:
-                self.bot.send_message_with_keyboard(text, keyboard)
-        else:
-            self.bot.send_message_with_keyboard(text, keyboard)
+        return text, keyboard
     
     def show_category_menu(self, user_id: int, category: str, message_id: int):
         """Display category sub-menu"""
         if category not in COMMAND_CATEGORIES:
             return None
         
+        menu = self.render_cache.get_or_render(
+            "category", category, lambda: self._render_category_menu(category)
+        )
+        text, reply_markup = menu.text, menu.reply_markup
+        
+        # Update context
+        self.context.push_menu(user_id, f"menu_{category}")
+        
+        return self.bot.edit_message(text, message_id, reply_markup)
+    
+    def _render_category_menu(self, category: str):
+        """Category sub-menu (text, keyboard); COMMAND_CATEGORIES is static"""
         cat_info = COMMAND_CATEGORIES[category]
         cat_name = cat_info["name"]
         commands = cat_info["commands"]
@@ -552,12 +588,7 @@ class MenuManager:
         nav_row.append({"text": "🏠 Home", "callback_data": "menu_main"})
         keyboard.append(nav_row)
         
-        reply_markup = {"inline_keyboard": keyboard}
-        
-        # Update context
-        self.context.push_menu(user_id, f"menu_{category}")
-        
-        return self.bot.edit_message(text, message_id, reply_markup)
+        return text, {"inline_keyboard": keyboard}
     
     def show_parameter_selection(self, user_id: int, param_type: str, command: str, message_id: int, 
                                  custom_label: Optional[str] = None):
@@ -1,7 +1,9 @@
 """
 Monitoring Module - Plugin Health Monitoring System
 
-This module provides health monitoring for all V3 and V6 plugins.
+This module provides health monitoring for all V3 and V6 plugins and the
+unified metrics registry exposed on /metrics, plus per-alert tracing and the
+on-demand profiler.
 
 Version: 1.0.0
 Date: 2026-01-14
@@ -19,6 +21,55 @@ from .plugin_health_monitor import (
     HealthStatus
 )
 
+from .health_timeseries import (
+    HealthTimeSeriesStore,
+    point_from_snapshot
+)
+
+from .metrics_registry import (
+    MetricsRegistry,
+    MetricSample,
+    Counter,
+    Gauge,
+    Histogram,
+    InstrumentedMT5,
+    EventLoopLagMonitor,
+    get_lag_monitor,
+    get_metrics_registry,
+    timed,
+    webhook_latency_middleware,
+    DEFAULT_LATENCY_BUCKETS
+)
+
+from .metrics_collectors import (
+    routing_stats_collector,
+    service_api_collector,
+    rate_limiter_collector,
+    sync_health_collector,
+    plugin_health_collector
+)
+
+from .tracing import (
+    Tracer,
+    Trace,
+    Span,
+    get_tracer,
+    traced
+)
+
+from .profiler import (
+    ProfilerManager,
+    ProfileReport,
+    BlockingSection,
+    get_profiler
+)
+
+from .loop_watchdog import (
+    LoopStallWatchdog,
+    BlockingOffender,
+    get_loop_watchdog
+)
+
 __all__ = [
     'PluginHealthMonitor',
     'PluginAvailabilityMetrics',
@@ -28,5 +79,36 @@ __all__ = [
     'HealthSnapshot',
     'HealthAlert',
     'AlertLevel',
-    'HealthStatus'
+    'HealthStatus',
+    'HealthTimeSeriesStore',
+    'point_from_snapshot',
+    'MetricsRegistry',
+    'MetricSample',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'InstrumentedMT5',
+    'EventLoopLagMonitor',
+    'get_lag_monitor',
+    'get_metrics_registry',
+    'timed',
+    'webhook_latency_middleware',
+    'DEFAULT_LATENCY_BUCKETS',
+    'routing_stats_collector',
+    'service_api_collector',
+    'rate_limiter_collector',
+    'sync_health_collector',
+    'plugin_health_collector',
+    'Tracer',
+    'Trace',
+    'Span',
+    'get_tracer',
+    'traced',
+    'ProfilerManager',
+    'ProfileReport',
+    'BlockingSection',
+    'get_profiler',
+    'LoopStallWatchdog',
+    'BlockingOffender',
+    'get_loop_watchdog'
 ]
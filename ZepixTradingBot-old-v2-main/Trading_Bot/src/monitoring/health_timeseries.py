@@ -0,0 +1,429 @@
+"""
+Health Time-Series Store
+
+Stores plugin health snapshots at three resolutions instead of one row
+per plugin per check forever:
+
+- raw:  every snapshot (``plugin_health_snapshots`` table)
+- 1m:   1-minute rollups  (``plugin_health_rollups``, resolution '1m')
+- 1h:   1-hour rollups    (``plugin_health_rollups``, resolution '1h')
+
+Recent points of each resolution are kept in per-plugin ring buffers.
+Database writes are buffered and flushed in one transaction on the file's
+managed writer, and each resolution has its own retention window.
+Queries pick the resolution from the requested time span and are served
+from memory when the ring covers it.
+
+Every point, raw or rolled up, has the same keys (a raw point is a bucket
+of one sample), so callers do not care which resolution they got.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.database.connection_manager import get_connection_manager
+
+logger = logging.getLogger(__name__)
+
+RAW = "raw"
+MINUTE = "1m"
+HOUR = "1h"
+
+# Averaged over a bucket / peak over a bucket / last value of a bucket
+_AVG_FIELDS = ("avg_execution_time_ms", "memory_usage_mb", "cpu_usage_pct", "error_rate_pct")
+_PEAK_FIELDS = (("p95_execution_time_ms", "p95_execution_time_ms"),
+                ("max_memory_usage_mb", "memory_usage_mb"),
+                ("max_cpu_usage_pct", "cpu_usage_pct"))
+_LAST_FIELDS = ("total_errors",)
+
+POINT_FIELDS = ("samples", "healthy_pct") + _AVG_FIELDS + tuple(p for p, _ in _PEAK_FIELDS) + _LAST_FIELDS
+
+DEFAULT_CONFIG = {
+    "raw_points": 120,            # per plugin in memory (1h at a 30s check interval)
+    "minute_points": 1440,        # 24h of 1-minute rollups
+    "hour_points": 168,           # 7 days of 1-hour rollups
+    "raw_retention_hours": 48,
+    "minute_retention_days": 14,
+    "hour_retention_days": 180,
+    "batch_size": 200,            # pending rows that force a flush
+    "flush_interval_sec": 60,
+    "retention_interval_sec": 3600,
+}
+
+
+def point_from_snapshot(snapshot) -> Dict[str, Any]:
+    """Raw point of a HealthSnapshot (a single-sample bucket)"""
+    performance, resources = snapshot.performance, snapshot.resources
+    return {
+        "timestamp": snapshot.timestamp,
+        "health_status": snapshot.health_status.value,
+        "samples": 1,
+        "healthy_pct": 100.0 if snapshot.is_healthy else 0.0,
+        "avg_execution_time_ms": performance.avg_execution_time_ms,
+        "memory_usage_mb": resources.memory_usage_mb,
+        "cpu_usage_pct": resources.cpu_usage_pct,
+        "error_rate_pct": snapshot.errors.error_rate_pct,
+        "p95_execution_time_ms": performance.p95_execution_time_ms,
+        "max_memory_usage_mb": resources.memory_usage_mb,
+        "max_cpu_usage_pct": resources.cpu_usage_pct,
+        "total_errors": snapshot.errors.total_errors,
+    }
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    if resolution == MINUTE:
+        return timestamp.replace(second=0, microsecond=0)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+class _Bucket:
+    """Running aggregate of the points of one plugin in one bucket"""
+
+    __slots__ = ("start", "samples", "healthy", "sums", "peaks", "last")
+
+    def __init__(self, start: datetime):
+        self.start = start
+        self.samples = 0
+        self.healthy = 0.0
+        self.sums = dict.fromkeys(_AVG_FIELDS, 0.0)
+        self.peaks = dict.fromkeys((p for p, _ in _PEAK_FIELDS), 0.0)
+        self.last: Dict[str, Any] = dict.fromkeys(_LAST_FIELDS, 0)
+
+    def add(self, point: Dict[str, Any]):
+        weight = point["samples"]
+        self.samples += weight
+        self.healthy += point["healthy_pct"] * weight
+        for name in _AVG_FIELDS:
+            self.sums[name] += point[name] * weight
+        for name, _ in _PEAK_FIELDS:
+            if point[name] > self.peaks[name]:
+                self.peaks[name] = point[name]
+        for name in _LAST_FIELDS:
+            self.last[name] = point[name]
+
+    def to_point(self) -> Dict[str, Any]:
+        n = self.samples or 1
+        point = {"timestamp": self.start, "samples": self.samples, "healthy_pct": self.healthy / n}
+        for name in _AVG_FIELDS:
+            point[name] = self.sums[name] / n
+        point.update(self.peaks)
+        point.update(self.last)
+        return point
+
+
+class HealthTimeSeriesStore:
+    """
+    Ring-buffered, downsampled storage of plugin health points.
+
+    Usage:
+        store = HealthTimeSeriesStore("data/zepix_health.db")
+        store.record(plugin_id, point_from_snapshot(snapshot))
+        if store.flush_due():
+            store.flush()
+        store.query(plugin_id, since=datetime.now() - timedelta(hours=24))  # 1m points
+    """
+
+    def __init__(self, db_path: str, config: Optional[Dict[str, Any]] = None):
+        self.db_path = db_path
+        self.config = {**DEFAULT_CONFIG, **(config or {})}
+        self._lock = threading.RLock()
+        self._db = get_connection_manager().database(db_path)
+
+        self._rings: Dict[str, Dict[str, deque]] = {}  # plugin_id -> resolution -> points
+        self._open: Dict[str, Dict[str, _Bucket]] = {}  # plugin_id -> resolution -> open bucket
+        self._pending_raw: List[Tuple] = []
+        self._pending_rollups: List[Tuple] = []
+        self._last_flush = time.monotonic()
+        self._last_retention = 0.0
+
+        self.stats = {"points": 0, "rollups": 0, "flushes": 0, "rows_written": 0, "rows_expired": 0}
+        self._init_schema()
+
+    # ==================== Connection ====================
+
+    def fetchall(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run one query on a pooled reader"""
+        return self._db.fetchall(sql, params)
+
+    def execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """Run and commit one statement on the managed writer"""
+        return self._db.execute(sql, params)
+
+    def close(self):
+        """Flush pending rows and release the database handles"""
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+    def _init_schema(self):
+        try:
+            with self._lock, self._db.writer() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS plugin_health_snapshots (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        plugin_id TEXT NOT NULL,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        is_running BOOLEAN,
+                        is_responsive BOOLEAN,
+                        health_status TEXT,
+                        uptime_seconds INTEGER,
+                        avg_execution_time_ms REAL,
+                        p95_execution_time_ms REAL,
+                        signals_processed_1h INTEGER,
+                        win_rate_pct REAL,
+                        memory_usage_mb REAL,
+                        cpu_usage_pct REAL,
+                        db_connections_active INTEGER,
+                        total_errors INTEGER,
+                        error_rate_pct REAL
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_health_plugin_time
+                    ON plugin_health_snapshots (plugin_id, timestamp)
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS plugin_health_rollups (
+                        plugin_id TEXT NOT NULL,
+                        resolution TEXT NOT NULL,
+                        bucket_start DATETIME NOT NULL,
+                        samples INTEGER,
+                        healthy_pct REAL,
+                        avg_execution_time_ms REAL,
+                        memory_usage_mb REAL,
+                        cpu_usage_pct REAL,
+                        error_rate_pct REAL,
+                        p95_execution_time_ms REAL,
+                        max_memory_usage_mb REAL,
+                        max_cpu_usage_pct REAL,
+                        total_errors INTEGER,
+                        PRIMARY KEY (plugin_id, resolution, bucket_start)
+                    )
+                """)
+        except sqlite3.Error as e:
+            logger.error(f"[HealthTimeSeries] Schema init error: {e}")
+
+    # ==================== Recording ====================
+
+    def record(self, plugin_id: str, point: Dict[str, Any], raw_row: Optional[Tuple] = None):
+        """
+        Add a raw point and roll it up into the open 1m/1h buckets.
+
+        Args:
+            plugin_id: Plugin the point belongs to
+            point: Raw point (see ``point_from_snapshot``)
+            raw_row: Full ``plugin_health_snapshots`` row to persist; built
+                from the point when omitted
+        """
+        with self._lock:
+            rings = self._rings.get(plugin_id)
+            if rings is None:
+                rings = self._rings[plugin_id] = {
+                    RAW: deque(maxlen=self.config["raw_points"]),
+                    MINUTE: deque(maxlen=self.config["minute_points"]),
+                    HOUR: deque(maxlen=self.config["hour_points"]),
+                }
+                self._open[plugin_id] = {}
+            rings[RAW].append(point)
+            self._pending_raw.append(raw_row or self._raw_row(plugin_id, point))
+            self.stats["points"] += 1
+
+            for resolution in (MINUTE, HOUR):
+                start = bucket_start(point["timestamp"], resolution)
+                bucket = self._open[plugin_id].get(resolution)
+                if bucket is not None and bucket.start != start:
+                    self._close_bucket(plugin_id, resolution, bucket)
+                    bucket = None
+                if bucket is None:
+                    bucket = self._open[plugin_id][resolution] = _Bucket(start)
+                bucket.add(point)
+
+    def _close_bucket(self, plugin_id: str, resolution: str, bucket: _Bucket):
+        point = bucket.to_point()
+        self._rings[plugin_id][resolution].append(point)
+        self._pending_rollups.append(self._rollup_row(plugin_id, resolution, point))
+        self.stats["rollups"] += 1
+
+    @staticmethod
+    def _raw_row(plugin_id: str, point: Dict[str, Any]) -> Tuple:
+        return (
+            plugin_id, point["timestamp"].isoformat(), None, None, point.get("health_status"),
+            None, point["avg_execution_time_ms"], point["p95_execution_time_ms"], None, None,
+            point["memory_usage_mb"], point["cpu_usage_pct"], None, point["total_errors"],
+            point["error_rate_pct"]
+        )
+
+    @staticmethod
+    def _rollup_row(plugin_id: str, resolution: str, point: Dict[str, Any]) -> Tuple:
+        return (plugin_id, resolution, point["timestamp"].isoformat()) + tuple(point[f] for f in POINT_FIELDS)
+
+    # ==================== Flushing & Retention ====================
+
+    def flush_due(self) -> bool:
+        pending = len(self._pending_raw) + len(self._pending_rollups)
+        return pending >= self.config["batch_size"] or (
+            pending and time.monotonic() - self._last_flush >= self.config["flush_interval_sec"]
+        )
+
+    def flush(self) -> int:
+        """Write pending rows in one transaction; returns rows written"""
+        with self._lock:
+            raw, rollups = self._pending_raw, self._pending_rollups
+            self._pending_raw, self._pending_rollups = [], []
+            self._last_flush = time.monotonic()
+            if not raw and not rollups:
+                self._apply_retention_if_due()
+                return 0
+            try:
+                with self._db.writer() as conn:
+                    conn.executemany("""
+                        INSERT INTO plugin_health_snapshots (
+                            plugin_id, timestamp, is_running, is_responsive, health_status,
+                            uptime_seconds, avg_execution_time_ms, p95_execution_time_ms,
+                            signals_processed_1h, win_rate_pct, memory_usage_mb, cpu_usage_pct,
+                            db_connections_active, total_errors, error_rate_pct
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, raw)
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO plugin_health_rollups "
+                        f"(plugin_id, resolution, bucket_start, {', '.join(POINT_FIELDS)}) "
+                        f"VALUES ({', '.join('?' * (3 + len(POINT_FIELDS)))})",
+                        rollups
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"[HealthTimeSeries] Flush failed, {len(raw) + len(rollups)} rows dropped: {e}")
+                return 0
+            written = len(raw) + len(rollups)
+            self.stats["flushes"] += 1
+            self.stats["rows_written"] += written
+            self._apply_retention_if_due()
+            return written
+
+    def _apply_retention_if_due(self):
+        if time.monotonic() - self._last_retention < self.config["retention_interval_sec"]:
+            return
+        self._last_retention = time.monotonic()
+        self.apply_retention()
+
+    def apply_retention(self, now: Optional[datetime] = None) -> int:
+        """Delete rows older than each resolution's retention window"""
+        now = now or datetime.now()
+        cutoffs = [
+            ("DELETE FROM plugin_health_snapshots WHERE timestamp < ?",
+             (now - timedelta(hours=self.config["raw_retention_hours"])).isoformat()),
+            ("DELETE FROM plugin_health_rollups WHERE resolution = '1m' AND bucket_start < ?",
+             (now - timedelta(days=self.config["minute_retention_days"])).isoformat()),
+            ("DELETE FROM plugin_health_rollups WHERE resolution = '1h' AND bucket_start < ?",
+             (now - timedelta(days=self.config["hour_retention_days"])).isoformat()),
+        ]
+        deleted = 0
+        with self._lock:
+            try:
+                with self._db.writer() as conn:
+                    for sql, cutoff in cutoffs:
+                        deleted += conn.execute(sql, (cutoff,)).rowcount
+            except sqlite3.Error as e:
+                logger.error(f"[HealthTimeSeries] Retention failed: {e}")
+                return 0
+        self.stats["rows_expired"] += deleted
+        return deleted
+
+    # ==================== Queries ====================
+
+    @staticmethod
+    def resolution_for(span: timedelta) -> str:
+        """Finest resolution that keeps a span to a dashboard-sized point count"""
+        if span <= timedelta(hours=1):
+            return RAW
+        if span <= timedelta(hours=48):
+            return MINUTE
+        return HOUR
+
+    def query(
+        self,
+        plugin_id: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        resolution: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Points of ``plugin_id`` between ``since`` and ``until``.
+
+        Rollup queries include the still-open bucket as their last point.
+        Served from the ring buffers when they reach back to ``since``,
+        otherwise from the database.
+        """
+        until = until or datetime.now()
+        resolution = resolution or self.resolution_for(until - since)
+        with self._lock:
+            ring = self._rings.get(plugin_id, {}).get(resolution)
+            if ring and ring[0]["timestamp"] <= since:
+                points = [p for p in ring if since <= p["timestamp"] <= until]
+            else:
+                self.flush()
+                points = self._query_db(plugin_id, resolution, since, until)
+            if resolution != RAW:
+                bucket = self._open.get(plugin_id, {}).get(resolution)
+                if bucket is not None and since <= bucket.start <= until:
+                    points.append(bucket.to_point())
+        return points
+
+    def _query_db(self, plugin_id: str, resolution: str, since: datetime, until: datetime) -> List[Dict[str, Any]]:
+        try:
+            if resolution == RAW:
+                rows = self._db.fetchall("""
+                    SELECT timestamp, health_status, avg_execution_time_ms, memory_usage_mb,
+                           cpu_usage_pct, error_rate_pct, p95_execution_time_ms, total_errors
+                    FROM plugin_health_snapshots
+                    WHERE plugin_id = ? AND timestamp BETWEEN ? AND ?
+                    ORDER BY timestamp
+                """, (plugin_id, since.isoformat(), until.isoformat()))
+                return [{
+                    "timestamp": datetime.fromisoformat(ts), "health_status": status, "samples": 1,
+                    "healthy_pct": 100.0 if status == "HEALTHY" else 0.0,
+                    "avg_execution_time_ms": avg_ms or 0.0, "memory_usage_mb": mem or 0.0,
+                    "cpu_usage_pct": cpu or 0.0, "error_rate_pct": err or 0.0,
+                    "p95_execution_time_ms": p95 or 0.0, "max_memory_usage_mb": mem or 0.0,
+                    "max_cpu_usage_pct": cpu or 0.0, "total_errors": total or 0,
+                } for ts, status, avg_ms, mem, cpu, err, p95, total in rows]
+
+            rows = self._db.fetchall(f"""
+                SELECT bucket_start, {', '.join(POINT_FIELDS)}
+                FROM plugin_health_rollups
+                WHERE plugin_id = ? AND resolution = ? AND bucket_start BETWEEN ? AND ?
+                ORDER BY bucket_start
+            """, (plugin_id, resolution, since.isoformat(), until.isoformat()))
+            return [
+                {"timestamp": datetime.fromisoformat(row[0]), **dict(zip(POINT_FIELDS, row[1:]))}
+                for row in rows
+            ]
+        except sqlite3.Error as e:
+            logger.error(f"[HealthTimeSeries] Query failed: {e}")
+            return []
+
+    def summarize(self, plugin_id: str, window: timedelta) -> Optional[Dict[str, Any]]:
+        """Aggregate of the last ``window`` (None without data)"""
+        points = self.query(plugin_id, since=datetime.now() - window)
+        if not points:
+            return None
+        total = _Bucket(points[0]["timestamp"])
+        for point in points:
+            total.add(point)
+        return total.to_point()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "plugins": len(self._rings),
+                "pending_rows": len(self._pending_raw) + len(self._pending_rollups),
+                "buffered_points": sum(len(r) for rings in self._rings.values() for r in rings.values()),
+            }
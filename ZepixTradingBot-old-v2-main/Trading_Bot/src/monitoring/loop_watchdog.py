@@ -0,0 +1,275 @@
+"""
+Event Loop Watchdog - Continuous Stall Detection with Blocking Call Sites
+Names the synchronous call that blocked the event loop, while it is blocking
+
+The watchdog adds no task of its own to the loop: it reads the beat that
+``EventLoopLagMonitor`` stamps on every wake-up (``last_beat``). A helper
+thread checks the stamp; once it is older than the threshold plus the
+monitor's interval the loop is stalled, and the helper snapshots the loop thread's stack
+(``sys._current_frames()``) while the blocking call is still on it.
+When the loop beats again the stall is closed and charged to the call
+site seen most often during it:
+- call site: innermost frame inside the bot's own source tree (the line
+  that made the blocking call, e.g. ``mt5_client.py:83 initialize``)
+- leaf: innermost frame overall (``time.sleep``, ``sqlite3`` commit, ...)
+
+Offenders are aggregated by call site (count, total/max blocked time,
+example stack), exported as ``zepix_event_loop_stalls_total`` and
+``zepix_event_loop_stall_seconds_total`` and shown by ``/blocking``.
+Evicting an offender also drops its label series from both metrics.
+Unlike the on-demand profiler this runs all the time; the helper only
+walks a stack when the loop is actually stalled.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from collections import Counter
+from datetime import datetime
+import os
+import sys
+import threading
+import time
+import logging
+
+from src.monitoring.metrics_registry import (
+    EVENT_LOOP_STALLS, EVENT_LOOP_STALL_SECONDS, EventLoopLagMonitor, get_lag_monitor
+)
+from src.monitoring.profiler import _walk_stack, _frame_label
+
+logger = logging.getLogger(__name__)
+
+
+# Frames under this directory count as "our" code when picking the call site
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MAX_OFFENDERS = 200
+
+
+# ==================== Offender Stats ====================
+
+@dataclass
+class BlockingOffender:
+    """Aggregated stalls charged to one call site"""
+    call_site: str
+    leaf: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_seen: Optional[datetime] = None
+    stack: str = ""
+
+    def record(self, duration_ms: float, leaf: str, stack: str):
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms >= self.max_ms:
+            self.max_ms = duration_ms
+            self.leaf = leaf
+            self.stack = stack
+        self.last_seen = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "call_site": self.call_site,
+            "leaf": self.leaf,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "stack": self.stack,
+        }
+
+
+def _is_project_frame(frame) -> bool:
+    filename = frame.f_code.co_filename
+    return filename.startswith(PROJECT_ROOT) and "site-packages" not in filename
+
+
+def classify_stack(frame) -> Dict[str, str]:
+    """Call site, leaf and collapsed stack for the loop thread's current frame"""
+    frames = _walk_stack(frame)
+    leaf = _frame_label(frames[-1]) if frames else "?"
+    call_site = leaf
+    for f in reversed(frames):
+        if _is_project_frame(f) and f.f_code.co_filename != __file__:
+            call_site = f"{os.path.relpath(f.f_code.co_filename, PROJECT_ROOT)}:{f.f_lineno} {f.f_code.co_name}"
+            break
+    return {
+        "call_site": call_site,
+        "leaf": leaf,
+        "stack": ";".join(_frame_label(f) for f in frames[-12:]),
+    }
+
+
+# ==================== Watchdog ====================
+
+class LoopStallWatchdog:
+    """
+    Always-on event loop stall detector.
+
+    Usage:
+        watchdog = get_loop_watchdog()
+        watchdog.start()            # from the running loop (starts the lag monitor if needed)
+        watchdog.top_offenders(10)  # worst call sites by blocked time
+        await watchdog.stop()
+    """
+
+    def __init__(self, threshold_ms: float = 100.0,
+                 monitor: Optional[EventLoopLagMonitor] = None,
+                 poll_interval: Optional[float] = None):
+        """
+        Args:
+            threshold_ms: Beat delay that counts as a stall
+            monitor: Lag monitor whose beat is watched (defaults to the process-wide one)
+            poll_interval: Helper check interval (defaults to a quarter of the threshold)
+        """
+        self.threshold_ms = threshold_ms
+        self.monitor = monitor or get_lag_monitor()
+        self.poll_interval = poll_interval or max(threshold_ms / 4000, 0.005)
+        self.offenders: Dict[str, BlockingOffender] = {}
+        self.stall_count = 0
+        self.last_stall: Optional[Dict[str, Any]] = None
+        self._loop_thread_id: Optional[int] = None
+        self._owns_monitor = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the helper thread watching the lag monitor's beat"""
+        if self.is_running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._owns_monitor = not self.monitor.is_running
+        self.monitor.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="LoopStallWatchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"[Watchdog] Event loop stall watchdog started (threshold {self.threshold_ms:.0f}ms)")
+
+    async def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._owns_monitor:
+            await self.monitor.stop()
+            self._owns_monitor = False
+
+    # -------------------- Helper Thread --------------------
+
+    def _watch(self):
+        interval = self.monitor.interval
+        threshold = self.threshold_ms / 1000 + interval
+        stall_beat: Optional[float] = None
+        sites: Counter = Counter()
+        details: Dict[str, Dict[str, str]] = {}
+
+        while not self._stop.wait(self.poll_interval):
+            beat = self.monitor.last_beat
+            now = time.perf_counter()
+
+            if stall_beat is not None and beat != stall_beat:
+                # Loop is back: the stall lasted from the old beat to the new one
+                duration_ms = max((beat - stall_beat - interval) * 1000, 0.0)
+                self._close_stall(duration_ms, sites, details)
+                stall_beat = None
+                sites = Counter()
+                details = {}
+
+            if now - beat < threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            info = classify_stack(frame)
+            del frame
+            stall_beat = beat
+            sites[info["call_site"]] += 1
+            details.setdefault(info["call_site"], info)
+
+    def _close_stall(self, duration_ms: float, sites: Counter, details: Dict[str, Dict[str, str]]):
+        if not sites:
+            return
+        call_site, _ = sites.most_common(1)[0]
+        info = details[call_site]
+        evicted: Optional[str] = None
+        with self._lock:
+            offender = self.offenders.get(call_site)
+            if offender is None:
+                if len(self.offenders) >= MAX_OFFENDERS:
+                    # Evict the least significant site to bound memory and label cardinality
+                    smallest = min(self.offenders.values(), key=lambda o: o.total_ms)
+                    evicted = smallest.call_site
+                    del self.offenders[evicted]
+                offender = self.offenders[call_site] = BlockingOffender(call_site, info["leaf"])
+            offender.record(duration_ms, info["leaf"], info["stack"])
+            self.stall_count += 1
+            self.last_stall = {"call_site": call_site, "leaf": info["leaf"],
+                               "duration_ms": round(duration_ms, 1), "at": datetime.now().isoformat()}
+
+        if evicted is not None:
+            EVENT_LOOP_STALLS.remove(call_site=evicted)
+            EVENT_LOOP_STALL_SECONDS.remove(call_site=evicted)
+        EVENT_LOOP_STALLS.labels(call_site=call_site).inc()
+        EVENT_LOOP_STALL_SECONDS.labels(call_site=call_site).inc(duration_ms / 1000)
+        logger.warning(f"[Watchdog] Event loop blocked {duration_ms:.0f}ms at {call_site} ({info['leaf']})")
+
+    # -------------------- Reporting --------------------
+
+    def top_offenders(self, limit: int = 10, sort_by: str = "total_ms") -> List[BlockingOffender]:
+        with self._lock:
+            offenders = list(self.offenders.values())
+        return sorted(offenders, key=lambda o: getattr(o, sort_by), reverse=True)[:limit]
+
+    def reset(self):
+        with self._lock:
+            self.offenders.clear()
+            self.stall_count = 0
+            self.last_stall = None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "threshold_ms": self.threshold_ms,
+            "stalls": self.stall_count,
+            "last_stall": self.last_stall,
+            "top_offenders": [o.to_dict() for o in self.top_offenders(10)],
+        }
+
+    def format_report(self, limit: int = 8) -> str:
+        """Telegram (HTML) summary of the worst call sites"""
+        lines = [
+            f"🐢 <b>EVENT LOOP BLOCKING</b> (threshold {self.threshold_ms:.0f}ms)",
+            "",
+            f"Stalls recorded: {self.stall_count}",
+        ]
+        offenders = self.top_offenders(limit)
+        if not offenders:
+            lines.append("No blocking calls detected ✅")
+            return "\n".join(lines)
+        lines.append("")
+        for i, offender in enumerate(offenders, 1):
+            lines.append(
+                f"{i}. <code>{offender.call_site}</code>\n"
+                f"   {offender.count}× | total {offender.total_ms:.0f}ms | "
+                f"max {offender.max_ms:.0f}ms | in <code>{offender.leaf}</code>"
+            )
+        return "\n".join(lines)
+
+
+_watchdog: Optional[LoopStallWatchdog] = None
+
+
+def get_loop_watchdog() -> LoopStallWatchdog:
+    """Get the process-wide loop watchdog"""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = LoopStallWatchdog()
+    return _watchdog
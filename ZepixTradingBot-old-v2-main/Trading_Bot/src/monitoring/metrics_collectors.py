@@ -0,0 +1,130 @@
+"""
+Metrics Collectors - Adapters from Existing Stats to the Metrics Registry
+Turns the per-component stats dictionaries into scrape-time samples
+
+Each ``*_collector`` returns a zero-argument callable suitable for
+``MetricsRegistry.register_collector``. Components are held by reference
+and read only when ``/metrics`` is scraped. The router and ServiceAPI
+collectors are registered at startup (webhook_handler, app);
+TelegramRateLimiter, DatabaseSyncManager and PluginHealthMonitor register
+theirs when they are built.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import List, Callable, Iterable, Dict
+
+from src.monitoring.metrics_registry import MetricSample
+
+Collector = Callable[[], Iterable[MetricSample]]
+
+
+def routing_stats_collector(router) -> Collector:
+    """PluginRouter.get_routing_stats()"""
+    def collect() -> List[MetricSample]:
+        stats = router.get_routing_stats()
+        samples = [
+            MetricSample("zepix_router_signals_total", stats.get(key, 0), {"result": key},
+                         "counter", "Signals routed by PluginRouter")
+            for key in ("total_routed", "successful", "failed", "no_plugin_found")
+        ]
+        for strategy, count in stats.get("by_strategy", {}).items():
+            samples.append(MetricSample(
+                "zepix_router_signals_by_strategy_total", count, {"strategy": strategy},
+                "counter", "Signals routed per strategy"
+            ))
+        for plugin_id, outcome in stats.get("by_plugin", {}).items():
+            for result, count in outcome.items():
+                samples.append(MetricSample(
+                    "zepix_router_plugin_results_total", count,
+                    {"plugin_id": plugin_id, "result": result},
+                    "counter", "Plugin execution results from PluginRouter"
+                ))
+        return samples
+    return collect
+
+
+def service_api_collector(service_api) -> Collector:
+    """ServiceAPI.get_metrics()"""
+    def collect() -> List[MetricSample]:
+        samples = []
+        for service, metrics in service_api.get_metrics().items():
+            labels = {"service": service}
+            samples.append(MetricSample("zepix_service_calls_total", metrics.get("calls", 0),
+                                        labels, "counter", "ServiceAPI calls per service"))
+            samples.append(MetricSample("zepix_service_errors_total", metrics.get("errors", 0),
+                                        labels, "counter", "ServiceAPI errors per service"))
+            samples.append(MetricSample("zepix_service_avg_call_ms", metrics.get("avg_time_ms", 0.0),
+                                        labels, "gauge", "ServiceAPI average call time"))
+        return samples
+    return collect
+
+
+def rate_limiter_collector(limiters: Dict) -> Collector:
+    """TelegramRateLimiter.get_stats() for each bot (name -> limiter)"""
+    def collect() -> List[MetricSample]:
+        samples = []
+        for name, limiter in list(limiters.items()):
+            stats = limiter.get_stats()
+            for priority, depth in stats["queued"].items():
+                if priority == "total":
+                    continue
+                samples.append(MetricSample(
+                    "zepix_telegram_queue_depth_by_priority", depth,
+                    {"bot": name, "priority": priority},
+                    "gauge", "Queued Telegram messages per priority"
+                ))
+            for key in ("total_sent", "total_dropped", "total_rate_limited", "total_errors"):
+                samples.append(MetricSample(
+                    "zepix_telegram_messages_total", stats["stats"].get(key, 0),
+                    {"bot": name, "result": key.replace("total_", "")},
+                    "counter", "Telegram rate limiter message outcomes"
+                ))
+        return samples
+    return collect
+
+
+def sync_health_collector(sync_manager) -> Collector:
+    """DatabaseSyncManager.get_sync_health()"""
+    def collect() -> List[MetricSample]:
+        health = sync_manager.get_sync_health()
+        samples = [
+            MetricSample("zepix_db_sync_total", value, {"result": key},
+                         "counter", "Database sync statistics")
+            for key, value in health.get("statistics", {}).items()
+        ]
+        for plugin_id, info in health.get("plugins", {}).items():
+            samples.append(MetricSample(
+                "zepix_db_sync_consecutive_failures", info.get("consecutive_failures", 0),
+                {"plugin_id": plugin_id}, "gauge", "Consecutive sync failures per plugin"
+            ))
+            samples.append(MetricSample(
+                "zepix_db_sync_minutes_since_last", info.get("minutes_since_last_sync", 0),
+                {"plugin_id": plugin_id}, "gauge", "Minutes since the last successful sync"
+            ))
+        return samples
+    return collect
+
+
+def plugin_health_collector(health_monitor) -> Collector:
+    """PluginHealthMonitor latest snapshots"""
+    def collect() -> List[MetricSample]:
+        samples = []
+        for snapshot in health_monitor.get_latest_snapshots():
+            labels = {"plugin_id": snapshot.plugin_id}
+            samples.append(MetricSample("zepix_plugin_healthy", 1 if snapshot.is_healthy else 0,
+                                        labels, "gauge", "1 if the plugin is healthy"))
+            samples.append(MetricSample("zepix_plugin_uptime_seconds",
+                                        snapshot.availability.uptime_seconds,
+                                        labels, "gauge", "Plugin uptime"))
+            samples.append(MetricSample("zepix_plugin_p95_execution_ms",
+                                        snapshot.performance.p95_execution_time_ms,
+                                        labels, "gauge", "Plugin p95 execution time"))
+            samples.append(MetricSample("zepix_plugin_memory_mb",
+                                        snapshot.resources.memory_usage_mb,
+                                        labels, "gauge", "Plugin memory usage"))
+            samples.append(MetricSample("zepix_plugin_errors_total",
+                                        snapshot.errors.total_errors,
+                                        labels, "counter", "Plugin errors recorded"))
+        return samples
+    return collect
@@ -0,0 +1,654 @@
+"""
+Metrics Registry - Unified Counters, Gauges and Latency Histograms
+Single in-process registry rendered in Prometheus text exposition format
+
+Every stage of the alert path (webhook ack, plugin processing, MT5 calls,
+database writes, Telegram delivery, event-loop scheduling) records into the
+same registry so per-stage latency percentiles can be scraped from one
+``/metrics`` endpoint instead of being reassembled from ad-hoc stats dicts.
+
+Histograms use fixed buckets, so an observation is a bisect plus two
+integer increments under a lock - cheap enough for the hot path.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from bisect import bisect_left
+import asyncio
+import functools
+import threading
+import time
+import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Latency buckets in seconds: 0.5ms .. 10s
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+# ==================== Metric Types ====================
+
+def _format_value(value: float) -> str:
+    """Format a sample value per the Prometheus text format"""
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class for a labelled metric family"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _label_values(self, values, kwargs) -> Tuple[str, ...]:
+        if kwargs:
+            values = tuple(str(kwargs.get(n, "")) for n in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {values}")
+        return values
+
+    def labels(self, *values, **kwargs):
+        """Return the child series for the given label values"""
+        values = self._label_values(values, kwargs)
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self.labels()
+
+    def remove(self, *values, **kwargs):
+        """Drop the child series for the given label values (no-op if absent)"""
+        values = self._label_values(values, kwargs)
+        with self._lock:
+            self._children.pop(values, None)
+
+    def clear(self):
+        with self._lock:
+            self._children.clear()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for values, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, values))
+        return lines
+
+
+class _ValueChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def render(self, name, labelnames, values) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def set(self, value: float):
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default().dec(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self):
+        """Observe the wall-clock duration of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside the bucket"""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+        if total == 0:
+            return 0.0
+        rank = q * total
+        cumulative = 0
+        for i, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count > 0:
+                lower = self.upper_bounds[i - 1] if i > 0 else 0.0
+                if i >= len(self.upper_bounds):
+                    return lower
+                upper = self.upper_bounds[i]
+                return lower + (upper - lower) * ((rank - cumulative) / bucket_count)
+            cumulative += bucket_count
+        return self.upper_bounds[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": round(self.quantile(0.50), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "p99": round(self.quantile(0.99), 6),
+        }
+
+    def render(self, name, labelnames, values) -> List[str]:
+        with self._lock:
+            counts = list(self.counts)
+            total_sum = self.sum
+            total = self.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.upper_bounds + (math.inf,), counts):
+            cumulative += bucket_count
+            labels = _format_labels(labelnames, values, ("le", _format_value(bound)))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        plain = _format_labels(labelnames, values)
+        lines.append(f"{name}_sum{plain} {_format_value(total_sum)}")
+        lines.append(f"{name}_count{plain} {total}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram (values in seconds for latency metrics)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+
+# ==================== Collector Samples ====================
+
+@dataclass
+class MetricSample:
+    """Single sample produced by a scrape-time collector"""
+    name: str
+    value: float
+    labels: Dict[str, Any] = field(default_factory=dict)
+    kind: str = "gauge"
+    documentation: str = ""
+
+
+# ==================== Registry ====================
+
+class MetricsRegistry:
+    """
+    Holds all metric families plus scrape-time collectors.
+
+    Collectors adapt the existing stats dictionaries (routing stats,
+    ServiceAPI metrics, rate limiter stats, sync health, plugin health)
+    into samples when ``/metrics`` is scraped, so those components need
+    no changes to be visible in the unified output.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricSample]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls):
+                    raise ValueError(f"Metric {name} already registered as {existing.kind}")
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[MetricSample]]):
+        """Register (or replace) a scrape-time collector"""
+        self._collectors[name] = collector
+
+    def unregister_collector(self, name: str):
+        self._collectors.pop(name, None)
+
+    def _collect_samples(self) -> Dict[str, List[MetricSample]]:
+        grouped: Dict[str, List[MetricSample]] = {}
+        for collector_name, collector in list(self._collectors.items()):
+            try:
+                for sample in collector() or ():
+                    grouped.setdefault(sample.name, []).append(sample)
+            except Exception as e:
+                logger.warning(f"[Metrics] Collector {collector_name} failed: {e}")
+        return grouped
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+
+        for name, samples in sorted(self._collect_samples().items()):
+            if name in self._metrics:
+                continue
+            first = samples[0]
+            lines.append(f"# HELP {name} {first.documentation or name}")
+            lines.append(f"# TYPE {name} {first.kind}")
+            for sample in samples:
+                labelnames = sorted(sample.labels)
+                labels = _format_labels(labelnames, [sample.labels[n] for n in labelnames])
+                lines.append(f"{name}{labels} {_format_value(float(sample.value))}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view (histograms summarised as count/sum/p50/p95/p99)"""
+        result: Dict[str, Any] = {}
+        for name, metric in self._metrics.items():
+            series = {}
+            for values, child in metric._children.items():
+                key = ",".join(f"{n}={v}" for n, v in zip(metric.labelnames, values)) or "_"
+                series[key] = child.snapshot() if isinstance(child, _HistogramChild) else child.value
+            result[name] = series
+        return result
+
+    def reset(self):
+        """Clear all series (metric families and collectors stay registered)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+# ==================== Singleton ====================
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry"""
+    return _registry
+
+
+# ==================== Standard Pipeline Metrics ====================
+
+WEBHOOK_LATENCY = _registry.histogram(
+    "zepix_webhook_ack_seconds",
+    "Time from webhook receipt to HTTP acknowledgement",
+    ["endpoint", "status"]
+)
+PLUGIN_PROCESSING_LATENCY = _registry.histogram(
+    "zepix_plugin_processing_seconds",
+    "Time spent inside plugin signal processing",
+    ["plugin_id", "status"]
+)
+SERVICE_CALL_LATENCY = _registry.histogram(
+    "zepix_service_call_seconds",
+    "ServiceAPI.call_service latency per service method",
+    ["service", "method", "status"]
+)
+MT5_CALL_LATENCY = _registry.histogram(
+    "zepix_mt5_call_seconds",
+    "MetaTrader5 API call latency per method",
+    ["method"]
+)
+MT5_CALL_ERRORS = _registry.counter(
+    "zepix_mt5_call_errors_total",
+    "MetaTrader5 API calls that raised",
+    ["method"]
+)
+ORDER_LEG_LATENCY = _registry.histogram(
+    "zepix_order_leg_submit_seconds",
+    "Submit-to-fill latency of each leg of a batched order submission",
+    ["leg", "status"]
+)
+ORDER_LEG_GAP = _registry.histogram(
+    "zepix_order_leg_gap_seconds",
+    "Time between the first and last leg submission of an order batch",
+    (),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+DB_WRITE_LATENCY = _registry.histogram(
+    "zepix_db_write_seconds",
+    "SQLite write latency per operation",
+    ["operation"]
+)
+DB_QUERY_LATENCY = _registry.histogram(
+    "zepix_db_query_seconds",
+    "SQLite time spent holding a connection per database and mode (read, write)",
+    ["database", "mode"]
+)
+DB_LOCK_WAIT = _registry.histogram(
+    "zepix_db_lock_wait_seconds",
+    "Time spent waiting for the writer lock or a pooled reader per database",
+    ["database", "mode"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+)
+TELEGRAM_QUEUE_DEPTH = _registry.gauge(
+    "zepix_telegram_queue_depth",
+    "Messages waiting in the Telegram rate limiter queue",
+    ["bot"]
+)
+TELEGRAM_SEND_LATENCY = _registry.histogram(
+    "zepix_telegram_send_seconds",
+    "Telegram send callback latency",
+    ["bot", "status"]
+)
+TELEGRAM_DISPATCH_LATENCY = _registry.histogram(
+    "zepix_telegram_dispatch_seconds",
+    "Time to resolve a Telegram callback to its handler",
+    ["router"],
+    buckets=(1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3)
+)
+TELEGRAM_HANDLER_IMPORT_SECONDS = _registry.counter(
+    "zepix_telegram_handler_import_seconds_total",
+    "Time spent importing lazily loaded Telegram command handler modules"
+)
+TELEGRAM_VIEW_REFRESH = _registry.counter(
+    "zepix_telegram_view_refresh_total",
+    "Live menu refresh outcomes per tracked message (edited, unchanged, deferred, failed)",
+    ["result"]
+)
+EVENT_LOOP_LAG = _registry.histogram(
+    "zepix_event_loop_lag_seconds",
+    "Scheduling delay of the asyncio event loop",
+    (),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EVENT_LOOP_LAG_LAST = _registry.gauge(
+    "zepix_event_loop_lag_last_seconds",
+    "Most recent event loop scheduling delay"
+)
+EVENT_LOOP_STALLS = _registry.counter(
+    "zepix_event_loop_stalls_total",
+    "Event loop stalls above the watchdog threshold per blocking call site",
+    ["call_site"]
+)
+EVENT_LOOP_STALL_SECONDS = _registry.counter(
+    "zepix_event_loop_stall_seconds_total",
+    "Time the event loop spent blocked per blocking call site",
+    ["call_site"]
+)
+SESSION_STORE_ENTRIES = _registry.gauge(
+    "zepix_session_store_entries",
+    "In-memory entries per session store (menu contexts, conversations)",
+    ["store"]
+)
+SESSION_STORE_MEMORY_BYTES = _registry.gauge(
+    "zepix_session_store_memory_bytes",
+    "Approximate memory held by session store values",
+    ["store"]
+)
+SESSION_STORE_EVICTIONS = _registry.counter(
+    "zepix_session_store_evictions_total",
+    "Session store entries removed per reason (expired, lru, deleted)",
+    ["store", "reason"]
+)
+
+
+def timed(histogram: Histogram, **labels):
+    """
+    Decorator recording a function's duration into ``histogram``.
+
+    Works for both sync and async functions.
+    """
+    def decorator(func):
+        child = histogram.labels(**labels) if histogram.labelnames else histogram._default()
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    child.observe(time.perf_counter() - start)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# ==================== MT5 Instrumentation ====================
+
+class InstrumentedMT5:
+    """
+    Transparent proxy around a MetaTrader5 API provider.
+
+    Attribute reads (constants such as ``ORDER_TYPE_BUY``) pass straight
+    through; callables are wrapped once and cached so every API call is
+    timed into ``zepix_mt5_call_seconds{method=...}``.
+    """
+
+    def __init__(self, target):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_wrapped", {})
+
+    def __getattr__(self, name):
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        attr = getattr(self._target, name)
+        if not callable(attr) or isinstance(attr, type) or name.startswith("_"):
+            return attr
+
+        latency = MT5_CALL_LATENCY.labels(method=name)
+        errors = MT5_CALL_ERRORS.labels(method=name)
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                latency.observe(time.perf_counter() - start)
+
+        self._wrapped[name] = call
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+
+# ==================== Event Loop Lag ====================
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes a periodic sleeper.
+
+    Any lag beyond a few milliseconds means a coroutine is blocking the
+    loop (synchronous MT5 / SQLite / HTTP calls are the usual suspects).
+    Each wake-up also stamps ``last_beat`` (``time.perf_counter()``), the
+    heartbeat the stall watchdog reads from its helper thread.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_beat = time.perf_counter()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start sampling on the running loop"""
+        if self.is_running:
+            return
+        self.last_beat = time.perf_counter()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"[Metrics] Event loop lag monitor started ({self.interval}s interval)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sample_once(self) -> float:
+        """Sleep one interval and record how late the wake-up was"""
+        loop = asyncio.get_running_loop()
+        expected = loop.time() + self.interval
+        await asyncio.sleep(self.interval)
+        self.last_beat = time.perf_counter()
+        lag = max(0.0, loop.time() - expected)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+        return lag
+
+    async def _run(self):
+        while True:
+            await self.sample_once()
+
+
+# Sampled often enough that the watchdog's default 100ms threshold sees stalls
+_lag_monitor = EventLoopLagMonitor(interval=0.05)
+
+
+def get_lag_monitor() -> EventLoopLagMonitor:
+    """Get the process-wide event loop lag monitor"""
+    return _lag_monitor
+
+
+# ==================== HTTP Instrumentation ====================
+
+async def webhook_latency_middleware(request, call_next):
+    """
+    HTTP middleware timing webhook requests from receipt to acknowledgement.
+
+    Register with ``app.middleware("http")(webhook_latency_middleware)``.
+    """
+    path = request.url.path
+    if not path.startswith("/webhook"):
+        return await call_next(request)
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        WEBHOOK_LATENCY.labels(endpoint=path, status=status).observe(time.perf_counter() - start)
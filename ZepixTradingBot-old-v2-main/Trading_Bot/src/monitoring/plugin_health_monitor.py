@@ -17,7 +17,6 @@ Date: 2026-01-14
 
 import asyncio
 import logging
-import sqlite3
 import threading
 import time
 from collections import deque
@@ -26,6 +25,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable
 
+from src.monitoring.health_timeseries import HealthTimeSeriesStore, point_from_snapshot
+from src.monitoring.metrics_registry import get_metrics_registry
+from src.monitoring.metrics_collectors import plugin_health_collector
+
 logger = logging.getLogger(__name__)
 
 
@@ -201,7 +204,7 @@ class PluginHealthMonitor:
     - Collect health metrics every 30 seconds
     - Detect anomalies using thresholds
     - Trigger alerts (Telegram + logs)
-    - Store health history in database
+    - Store health history in database (batched, downsampled to 1m/1h rollups)
     - Auto-restart crashed plugins
     - Zombie plugin detection
     """
@@ -220,7 +223,8 @@ class PluginHealthMonitor:
             plugin_registry: PluginRegistry instance
             telegram_manager: MultiTelegramManager instance
             db_path: Path to health database
-            config: Configuration dict
+            config: Configuration dict ('timeseries' sub-dict configures
+                ring sizes, flush batching and retention of health history)
         """
         self.plugin_registry = plugin_registry
         self.telegram_manager = telegram_manager
@@ -263,44 +267,19 @@ class PluginHealthMonitor:
         # Initialize database
         self._init_database()
         
+        # Latest snapshots on /metrics
+        get_metrics_registry().register_collector("plugin_health", plugin_health_collector(self))
+        
         logger.info("[PluginHealthMonitor] Initialized")
     
     def _init_database(self):
         """Initialize health database schema"""
+        # Snapshot and rollup tables; all health writes go through its managed database
+        self._timeseries = HealthTimeSeriesStore(self.db_path, self.config.get('timeseries'))
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Plugin health snapshots table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS plugin_health_snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    plugin_id TEXT NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    is_running BOOLEAN,
-                    is_responsive BOOLEAN,
-                    health_status TEXT,
-                    uptime_seconds INTEGER,
-                    avg_execution_time_ms REAL,
-                    p95_execution_time_ms REAL,
-                    signals_processed_1h INTEGER,
-                    win_rate_pct REAL,
-                    memory_usage_mb REAL,
-                    cpu_usage_pct REAL,
-                    db_connections_active INTEGER,
-                    total_errors INTEGER,
-                    error_rate_pct REAL
-                )
-            """)
-            
-            # Create index for efficient queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_health_plugin_time 
-                ON plugin_health_snapshots (plugin_id, timestamp)
-            """)
-            
             # Health alerts table
-            cursor.execute("""
+            self._timeseries.execute("""
                 CREATE TABLE IF NOT EXISTS health_alerts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     plugin_id TEXT NOT NULL,
@@ -313,14 +292,11 @@ class PluginHealthMonitor:
             """)
             
             # Create index for alerts
-            cursor.execute("""
+            self._timeseries.execute("""
                 CREATE INDEX IF NOT EXISTS idx_alerts_plugin_time 
                 ON health_alerts (plugin_id, timestamp)
             """)
             
-            conn.commit()
-            conn.close()
-            
             logger.info("[PluginHealthMonitor] Database initialized")
             
         except Exception as e:
@@ -348,6 +324,7 @@ class PluginHealthMonitor:
             except asyncio.CancelledError:
                 pass
         
+        self._timeseries.close()
         logger.info("[PluginHealthMonitor] Stopped")
     
     async def _monitoring_loop(self):
@@ -401,6 +378,10 @@ class PluginHealthMonitor:
                 
             except Exception as e:
                 logger.error(f"[PluginHealthMonitor] Failed to collect metrics for {plugin_id}: {e}")
+        
+        # One batched write for many cycles, off the event loop
+        if self._timeseries.flush_due():
+            await asyncio.to_thread(self._timeseries.flush)
     
     async def _collect_availability_metrics(
         self,
@@ -573,19 +554,9 @@ class PluginHealthMonitor:
             self._health_snapshots[plugin_id].append(snapshot)
             self._latest_snapshots[plugin_id] = snapshot
         
-        # Store in database (async-safe)
+        # Queue for the next batched database flush and roll up
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO plugin_health_snapshots (
-                    plugin_id, timestamp, is_running, is_responsive, health_status,
-                    uptime_seconds, avg_execution_time_ms, p95_execution_time_ms,
-                    signals_processed_1h, win_rate_pct, memory_usage_mb, cpu_usage_pct,
-                    db_connections_active, total_errors, error_rate_pct
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            self._timeseries.record(plugin_id, point_from_snapshot(snapshot), (
                 plugin_id,
                 snapshot.timestamp.isoformat(),
                 snapshot.availability.is_running,
@@ -603,9 +574,6 @@ class PluginHealthMonitor:
                 snapshot.errors.error_rate_pct
             ))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             logger.error(f"[PluginHealthMonitor] Failed to store snapshot: {e}")
     
@@ -758,17 +726,11 @@ class PluginHealthMonitor:
         
         # Store in database
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
+            self._timeseries.execute("""
                 INSERT INTO health_alerts (plugin_id, alert_level, message, timestamp)
                 VALUES (?, ?, ?, ?)
             """, (plugin_id, level.value, message, datetime.now().isoformat()))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             logger.error(f"[PluginHealthMonitor] Failed to store alert: {e}")
         
@@ -827,6 +789,20 @@ class PluginHealthMonitor:
                 return snapshots[-limit:]
             return []
     
+    def get_plugin_timeseries(
+        self,
+        plugin_id: str,
+        window: timedelta = timedelta(hours=1),
+        resolution: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Health points of a plugin over the last ``window``.
+        
+        Resolution defaults to the span: raw up to 1h, 1-minute rollups up
+        to 48h, 1-hour rollups beyond.
+        """
+        return self._timeseries.query(plugin_id, since=datetime.now() - window, resolution=resolution)
+    
     def get_recent_alerts(self, limit: int = 10, plugin_id: str = None) -> List[HealthAlert]:
         """Get recent health alerts"""
         with self._lock:
@@ -853,18 +829,12 @@ class PluginHealthMonitor:
         
         # Update in database
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
+            self._timeseries.execute("""
                 UPDATE health_alerts 
                 SET resolved = TRUE, resolved_at = ?
                 WHERE id = ?
             """, (datetime.now().isoformat(), alert_id))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             logger.error(f"[PluginHealthMonitor] Failed to resolve alert: {e}")
     
@@ -918,6 +888,10 @@ class PluginHealthMonitor:
             text += f"├ Exec Time: {snapshot.performance.p95_execution_time_ms:.0f}ms (P95)\n"
             text += f"├ Memory: {snapshot.resources.memory_usage_mb:.1f}MB\n"
             text += f"├ CPU: {snapshot.resources.cpu_usage_pct:.1f}%\n"
+            
+            trend = self._timeseries.summarize(snapshot.plugin_id, timedelta(hours=24))
+            if trend:
+                text += f"├ 24h: {trend['healthy_pct']:.1f}% healthy, P95 peak {trend['p95_execution_time_ms']:.0f}ms\n"
             text += f"└ Error Rate: {snapshot.errors.error_rate_pct:.2f}%\n\n"
         
         # Recent alerts
@@ -0,0 +1,419 @@
+"""
+On-Demand Profiler - Time-Boxed Stack Sampling and cProfile Sessions
+Shows what the event loop is busy with during a slowdown without a restart
+
+Two modes:
+- ``sample``: a helper thread snapshots the event-loop thread's stack with
+  ``sys._current_frames()`` every few milliseconds. Produces hot functions,
+  hot coroutines, event-loop blocking sections above a threshold and a
+  collapsed-stack file ready for flamegraph.pl / speedscope.
+- ``cprofile``: deterministic cProfile of the event-loop thread for the
+  session, dumped as a ``.prof`` file plus a top-N text summary.
+
+Nothing runs while no session is active, so idle overhead is zero.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from dataclasses import dataclass, field
+from collections import Counter
+from datetime import datetime
+import asyncio
+import cProfile
+import inspect
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROFILE_DIR = "logs/profiles"
+MAX_DURATION_SECONDS = 300
+
+# Leaf frames that mean "event loop is idle, waiting for I/O"
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("windows_events.py", "select"),
+    ("windows_events.py", "_poll"),
+}
+
+
+# ==================== Report ====================
+
+@dataclass
+class BlockingSection:
+    """Contiguous stretch where the loop never returned to the selector"""
+    started_at: datetime
+    duration_ms: float
+    samples: int
+    top_stack: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 1),
+            "samples": self.samples,
+            "top_stack": self.top_stack,
+        }
+
+
+@dataclass
+class ProfileReport:
+    """Result of a finished profiling session"""
+    session_id: str
+    mode: str
+    started_at: datetime
+    duration_seconds: float
+    samples: int = 0
+    idle_samples: int = 0
+    top_functions: List[Tuple[str, int]] = field(default_factory=list)
+    top_coroutines: List[Tuple[str, int]] = field(default_factory=list)
+    blocking_sections: List[BlockingSection] = field(default_factory=list)
+    output_path: Optional[str] = None
+    summary_text: str = ""
+
+    @property
+    def busy_pct(self) -> float:
+        return (1 - self.idle_samples / self.samples) * 100 if self.samples else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "samples": self.samples,
+            "busy_pct": round(self.busy_pct, 1),
+            "top_functions": [{"frame": f, "samples": n} for f, n in self.top_functions],
+            "top_coroutines": [{"frame": f, "samples": n} for f, n in self.top_coroutines],
+            "blocking_sections": [b.to_dict() for b in self.blocking_sections],
+            "output_path": self.output_path,
+            "summary_text": self.summary_text,
+        }
+
+    def format_summary(self, limit: int = 5) -> str:
+        """Telegram (HTML) summary"""
+        lines = [
+            f"🔬 <b>PROFILE {self.session_id}</b> ({self.mode}, {self.duration_seconds:.1f}s)",
+            "",
+        ]
+        if self.mode == "sample":
+            lines.append(f"Samples: {self.samples} | Loop busy: {self.busy_pct:.0f}%")
+            if self.top_functions:
+                lines.append("")
+                lines.append("<b>Hot functions (self):</b>")
+                for frame, count in self.top_functions[:limit]:
+                    lines.append(f"• <code>{frame}</code> {count}")
+            if self.top_coroutines:
+                lines.append("")
+                lines.append("<b>Hot coroutines:</b>")
+                for frame, count in self.top_coroutines[:limit]:
+                    lines.append(f"• <code>{frame}</code> {count}")
+            lines.append("")
+            lines.append(f"<b>Blocking sections:</b> {len(self.blocking_sections)}")
+            for section in sorted(self.blocking_sections, key=lambda b: -b.duration_ms)[:limit]:
+                leaf = section.top_stack.rsplit(";", 1)[-1]
+                lines.append(f"• {section.duration_ms:.0f}ms in <code>{leaf}</code>")
+        else:
+            lines.append(f"<pre>{self.summary_text[:3000]}</pre>")
+        if self.output_path:
+            lines.append("")
+            lines.append(f"File: <code>{self.output_path}</code>")
+        return "\n".join(lines)
+
+
+# ==================== Stack Sampler ====================
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _walk_stack(frame) -> List[Any]:
+    """Frames from root to leaf"""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+class _StackSampler:
+    """Samples one thread's stack from a helper thread"""
+
+    def __init__(self, target_thread_id: int, interval: float, block_threshold_ms: float):
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.block_threshold_ms = block_threshold_ms
+        self.stacks: Counter = Counter()
+        self.self_counts: Counter = Counter()
+        self.coroutine_counts: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.blocking_sections: List[BlockingSection] = []
+        self._busy_since: Optional[float] = None
+        self._busy_wall: Optional[datetime] = None
+        self._busy_stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ProfilerSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        self._close_busy(time.perf_counter())
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is None or self.target_thread_id == own_id:
+                continue
+            self.sample(frame, time.perf_counter())
+
+    def sample(self, frame, now: float):
+        """Record one stack snapshot (root-most frame first)"""
+        frames = _walk_stack(frame)
+        if not frames:
+            return
+        self.samples += 1
+        leaf = frames[-1].f_code
+        if (os.path.basename(leaf.co_filename), leaf.co_name) in _IDLE_FRAMES:
+            self.idle_samples += 1
+            self._close_busy(now)
+            return
+
+        labels = [_frame_label(f) for f in frames]
+        stack = ";".join(labels)
+        self.stacks[stack] += 1
+        self.self_counts[labels[-1]] += 1
+        seen = set()
+        for f, label in zip(frames, labels):
+            if f.f_code.co_flags & inspect.CO_COROUTINE and label not in seen:
+                seen.add(label)
+                self.coroutine_counts[label] += 1
+
+        if self._busy_since is None:
+            self._busy_since = now
+            self._busy_wall = datetime.now()
+        self._busy_stacks[stack] += 1
+
+    def _close_busy(self, now: float):
+        if self._busy_since is None:
+            return
+        duration_ms = (now - self._busy_since) * 1000
+        if duration_ms >= self.block_threshold_ms and self._busy_stacks:
+            stack, _ = self._busy_stacks.most_common(1)[0]
+            self.blocking_sections.append(BlockingSection(
+                started_at=self._busy_wall,
+                duration_ms=duration_ms,
+                samples=sum(self._busy_stacks.values()),
+                top_stack=stack,
+            ))
+        self._busy_since = None
+        self._busy_wall = None
+        self._busy_stacks = Counter()
+
+
+# ==================== Profiler Manager ====================
+
+class ProfilerManager:
+    """
+    Runs at most one time-boxed profiling session at a time.
+
+    Sessions are started from the event-loop thread (FastAPI route or
+    Telegram command); that thread becomes the profiling target.
+    """
+
+    def __init__(self, output_dir: str = DEFAULT_PROFILE_DIR):
+        self.output_dir = output_dir
+        self.last_report: Optional[ProfileReport] = None
+        self._lock = threading.Lock()
+        self._active: Optional[Dict[str, Any]] = None
+        self._session_count = 0
+        self._callbacks: set = set()  # completion callbacks still running
+
+    @property
+    def is_running(self) -> bool:
+        return self._active is not None
+
+    def status(self) -> Dict[str, Any]:
+        if not self._active:
+            return {
+                "running": False,
+                "last_session": self.last_report.session_id if self.last_report else None,
+            }
+        elapsed = time.perf_counter() - self._active["start"]
+        return {
+            "running": True,
+            "session_id": self._active["session_id"],
+            "mode": self._active["mode"],
+            "elapsed_seconds": round(elapsed, 2),
+            "duration_seconds": self._active["duration"],
+        }
+
+    def start(
+        self,
+        duration: float = 10.0,
+        mode: str = "sample",
+        interval: float = 0.005,
+        block_threshold_ms: float = 100.0,
+        target_thread_id: Optional[int] = None
+    ) -> str:
+        """
+        Start a session. Call ``stop()`` (or use ``run()``) to collect it.
+
+        Raises:
+            RuntimeError: if a session is already running
+            ValueError: on an unknown mode
+        """
+        if mode not in ("sample", "cprofile"):
+            raise ValueError(f"Unknown profiler mode: {mode}")
+        duration = max(0.1, min(float(duration), MAX_DURATION_SECONDS))
+
+        with self._lock:
+            if self._active:
+                raise RuntimeError(f"Profiler session {self._active['session_id']} already running")
+            self._session_count += 1
+            session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self._session_count}"
+            active = {
+                "session_id": session_id,
+                "mode": mode,
+                "duration": duration,
+                "start": time.perf_counter(),
+                "started_at": datetime.now(),
+            }
+            if mode == "sample":
+                sampler = _StackSampler(
+                    target_thread_id or threading.get_ident(), interval, block_threshold_ms
+                )
+                sampler.start()
+                active["sampler"] = sampler
+            else:
+                profile = cProfile.Profile()
+                profile.enable()
+                active["profile"] = profile
+            self._active = active
+
+        logger.info(f"[Profiler] Session {session_id} started ({mode}, {duration}s)")
+        return session_id
+
+    def stop(self, session_id: Optional[str] = None) -> Optional[ProfileReport]:
+        """Stop the running session (only if it matches ``session_id`` when given)"""
+        with self._lock:
+            active = self._active
+            if active and session_id and active["session_id"] != session_id:
+                return None
+            self._active = None
+        if not active:
+            return None
+
+        elapsed = time.perf_counter() - active["start"]
+        report = ProfileReport(
+            session_id=active["session_id"],
+            mode=active["mode"],
+            started_at=active["started_at"],
+            duration_seconds=elapsed,
+        )
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        if active["mode"] == "sample":
+            sampler: _StackSampler = active["sampler"]
+            sampler.stop()
+            report.samples = sampler.samples
+            report.idle_samples = sampler.idle_samples
+            report.top_functions = sampler.self_counts.most_common(20)
+            report.top_coroutines = sampler.coroutine_counts.most_common(20)
+            report.blocking_sections = sampler.blocking_sections
+            path = os.path.join(self.output_dir, f"profile_{report.session_id}.collapsed")
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            report.output_path = path
+        else:
+            profile: cProfile.Profile = active["profile"]
+            profile.disable()
+            path = os.path.join(self.output_dir, f"profile_{report.session_id}.prof")
+            profile.dump_stats(path)
+            buffer = io.StringIO()
+            pstats.Stats(profile, stream=buffer).sort_stats("cumulative").print_stats(25)
+            report.summary_text = buffer.getvalue()
+            report.output_path = path
+
+        self.last_report = report
+        logger.info(
+            f"[Profiler] Session {report.session_id} finished: {report.samples} samples, "
+            f"{len(report.blocking_sections)} blocking sections -> {report.output_path}"
+        )
+        return report
+
+    async def run(self, duration: float = 10.0, mode: str = "sample", **kwargs) -> Optional[ProfileReport]:
+        """
+        Start a session, wait without blocking the loop, return the report.
+
+        Returns None if the session was stopped elsewhere in the meantime.
+        """
+        self.start(duration=duration, mode=mode, **kwargs)
+        try:
+            await asyncio.sleep(min(float(duration), MAX_DURATION_SECONDS))
+        finally:
+            report = self.stop()
+        return report
+
+    def start_timed(
+        self,
+        duration: float = 10.0,
+        mode: str = "sample",
+        on_complete: Optional[Callable[[Optional[ProfileReport]], Any]] = None,
+        **kwargs
+    ) -> str:
+        """
+        Start a session that stops itself after ``duration`` seconds.
+
+        ``on_complete`` (plain function or coroutine function) receives the
+        report when the timer fires, or None if the session was already
+        stopped elsewhere (``/profiler/stop``).
+        """
+        session_id = self.start(duration=duration, mode=mode, **kwargs)
+        loop = asyncio.get_running_loop()
+        loop.call_later(
+            min(float(duration), MAX_DURATION_SECONDS), self._finish_timed, loop, session_id, on_complete
+        )
+        return session_id
+
+    def _finish_timed(self, loop, session_id: str, on_complete):
+        report = self.stop(session_id)
+        if on_complete is None:
+            return
+        try:
+            result = on_complete(report)
+            if inspect.isawaitable(result):
+                task = loop.create_task(result)
+                self._callbacks.add(task)
+                task.add_done_callback(self._callbacks.discard)
+        except Exception as e:
+            logger.error(f"[Profiler] Completion callback for {session_id} failed: {e}")
+
+
+# ==================== Singleton ====================
+
+_profiler: Optional[ProfilerManager] = None
+
+
+def get_profiler() -> ProfilerManager:
+    """Get the process-wide profiler manager"""
+    global _profiler
+    if _profiler is None:
+        _profiler = ProfilerManager()
+    return _profiler
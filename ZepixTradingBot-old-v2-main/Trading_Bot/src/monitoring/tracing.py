@@ -0,0 +1,369 @@
+"""
+Alert Tracing - Per-Alert Trace IDs and Span Timing
+Follows one alert from webhook receipt to the last MT5/DB/Telegram call
+
+A trace is opened when an alert arrives (``webhook_endpoint`` or
+``TradingEngine.process_alert``) and propagated implicitly through
+``contextvars``, so every awaited call and every task spawned while
+handling the alert attaches its spans to the same trace without any
+signature changes. Finished traces land in an in-memory ring buffer and
+are appended to a JSONL file for offline analysis by a background writer
+thread, in batches, so the event loop never touches the file.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Iterator
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import deque
+from datetime import datetime
+import asyncio
+import atexit
+import functools
+import threading
+import json
+import os
+import time
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TRACE_FILE = "logs/traces.jsonl"
+
+
+# ==================== Data Classes ====================
+
+@dataclass
+class Span:
+    """Timed section inside a trace"""
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    offset_ms: float
+    duration_ms: float = 0.0
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "offset_ms": round(self.offset_ms, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+@dataclass
+class Trace:
+    """All spans recorded while handling one alert"""
+    trace_id: str
+    name: str
+    started_at: datetime
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    spans: List[Span] = field(default_factory=list)
+    duration_ms: float = 0.0
+    status: str = "ok"
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+    _next_id: int = field(default=0, repr=False)
+
+    def _new_span_id(self) -> str:
+        self._next_id += 1
+        return f"{self._next_id:x}"
+
+    def slowest_span(self) -> Optional[Span]:
+        return max(self.spans, key=lambda s: s.duration_ms) if self.spans else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+            "spans": [s.to_dict() for s in self.spans],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("zepix_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("zepix_span", default=None)
+
+
+# ==================== Tracer ====================
+
+class Tracer:
+    """
+    Records alert traces into a ring buffer and a JSONL file.
+
+    When no trace is active, ``span()`` is a no-op so background loops
+    (price monitor, sync jobs) pay only a ContextVar lookup. Finished traces
+    are serialized and queued; a writer thread appends the queue to the file
+    every ``flush_interval`` seconds (``background=False`` writes inline).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 500,
+        jsonl_path: Optional[str] = DEFAULT_TRACE_FILE,
+        enabled: bool = True,
+        flush_interval: float = 1.0,
+        background: bool = True
+    ):
+        self.enabled = enabled
+        self.jsonl_path = jsonl_path
+        self.flush_interval = flush_interval
+        self.background = background
+        self._traces: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()      # guards the ring buffer and pending queue
+        self._io_lock = threading.Lock()   # serialises file writes
+        self._pending: List[str] = []
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        self._write_errors = 0
+
+    # -------------------- Recording --------------------
+
+    @contextmanager
+    def start_trace(self, name: str, **attributes) -> Iterator[Optional[Trace]]:
+        """
+        Open a trace for one alert.
+
+        If a trace is already active (e.g. ``process_alert`` called from the
+        webhook), this records a span in that trace instead of a new one.
+        """
+        active = _current_trace.get()
+        if active is not None or not self.enabled:
+            with self.span(name, **attributes):
+                yield active
+            return
+
+        trace = Trace(
+            trace_id=uuid.uuid4().hex[:16],
+            name=name,
+            started_at=datetime.now(),
+            attributes=dict(attributes),
+        )
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(None)
+        try:
+            yield trace
+        except BaseException:
+            trace.status = "error"
+            raise
+        finally:
+            trace.duration_ms = (time.perf_counter() - trace._start) * 1000
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            self._finish(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """Time a section of the active trace (no-op without one)"""
+        trace = _current_trace.get()
+        if trace is None:
+            yield None
+            return
+
+        parent = _current_span.get()
+        start = time.perf_counter()
+        span = Span(
+            name=name,
+            span_id=trace._new_span_id(),
+            parent_id=parent.span_id if parent else None,
+            offset_ms=(start - trace._start) * 1000,
+            attributes=dict(attributes),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.attributes.setdefault("error", str(e)[:200])
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - start) * 1000
+            _current_span.reset(token)
+            trace.spans.append(span)
+
+    def annotate(self, **attributes):
+        """Attach attributes to the current span (or the trace itself)"""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+            return
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.attributes.update(attributes)
+
+    def tag_trace(self, **attributes):
+        """Attach attributes to the active trace (shown in slowest-alert reports)"""
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.attributes.update(attributes)
+
+    def _finish(self, trace: Trace):
+        line = json.dumps(trace.to_dict(), default=str) if self.jsonl_path else None
+        with self._lock:
+            self._traces.append(trace)
+            if line is not None:
+                self._pending.append(line)
+        if line is None:
+            return
+        if self.background:
+            self._ensure_writer()
+        else:
+            self.flush()
+
+    # -------------------- Persistence --------------------
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._stopped.clear()
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="TraceWriter", daemon=True
+            )
+            self._writer.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+        self._wakeup.set()
+
+    def _writer_loop(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            # Let a burst of alerts accumulate into one append
+            self._stopped.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Append queued traces to the JSONL file.
+
+        Traces are diagnostics: a batch that fails to write is dropped
+        (the first failure is logged) rather than retried.
+
+        Returns:
+            True if every queued trace was written
+        """
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+            if not lines or not self.jsonl_path:
+                return True
+            try:
+                directory = os.path.dirname(self.jsonl_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                return True
+            except Exception as e:
+                self._write_errors += 1
+                if self._write_errors == 1:
+                    logger.warning(f"[Tracer] Failed to write trace file {self.jsonl_path}: {e}")
+                return False
+
+    def close(self):
+        """Stop the writer thread and write everything still queued"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join(timeout=5)
+        self._writer = None
+        self.flush()
+
+    # -------------------- Queries --------------------
+
+    def current_trace_id(self) -> Optional[str]:
+        trace = _current_trace.get()
+        return trace.trace_id if trace else None
+
+    def get_recent(self, limit: int = 50) -> List[Trace]:
+        with self._lock:
+            return list(self._traces)[-limit:][::-1]
+
+    def get_trace(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            for trace in reversed(self._traces):
+                if trace.trace_id == trace_id:
+                    return trace
+        return None
+
+    def get_slowest(self, limit: int = 10, since_minutes: Optional[float] = None) -> List[Trace]:
+        """Slowest buffered traces, optionally limited to a recent window"""
+        with self._lock:
+            traces = list(self._traces)
+        if since_minutes is not None:
+            cutoff = datetime.now().timestamp() - since_minutes * 60
+            traces = [t for t in traces if t.started_at.timestamp() >= cutoff]
+        return sorted(traces, key=lambda t: t.duration_ms, reverse=True)[:limit]
+
+    def format_slowest(self, limit: int = 5) -> str:
+        """Telegram (HTML) summary of the slowest recent alerts"""
+        traces = self.get_slowest(limit)
+        if not traces:
+            return "🐢 <b>SLOWEST ALERTS</b>\n\nNo traces recorded yet."
+
+        lines = [f"🐢 <b>SLOWEST ALERTS</b> (last {len(self._traces)} traced)", ""]
+        for i, trace in enumerate(traces, 1):
+            label = trace.attributes.get("alert_type") or trace.name
+            symbol = trace.attributes.get("symbol", "")
+            lines.append(
+                f"{i}. <code>{trace.trace_id}</code> {label} {symbol} "
+                f"- <b>{trace.duration_ms:.0f}ms</b>"
+            )
+            top = sorted(trace.spans, key=lambda s: s.duration_ms, reverse=True)[:3]
+            for span in top:
+                lines.append(f"   └ {span.name}: {span.duration_ms:.0f}ms")
+        return "\n".join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._traces.clear()
+
+
+# ==================== Singleton / Helpers ====================
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide alert tracer"""
+    return _tracer
+
+
+def traced(name: str, root: bool = False):
+    """
+    Decorator recording a span around a sync or async function.
+
+    Args:
+        name: Span name
+        root: Open a new trace when none is active (alert entry points)
+    """
+    def decorator(func):
+        def scope():
+            return _tracer.start_trace(name) if root else _tracer.span(name)
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with scope():
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with scope():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
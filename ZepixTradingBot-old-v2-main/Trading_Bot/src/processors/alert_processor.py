@@ -236,6 +236,15 @@ class AlertProcessor:
         except Exception as e:
             print(f"WARNING: Error cleaning alerts: {str(e)}")
     
+    def export_snapshot_state(self) -> List[Alert]:
+        """Recent alerts for warm-restart snapshots (duplicate detection survives restarts)"""
+        return self.recent_alerts
+    
+    def restore_snapshot_state(self, state: List[Alert]):
+        """Restore recent alerts from a snapshot and drop those outside the window"""
+        self.recent_alerts = list(state) + self.recent_alerts
+        self.clean_old_alerts()
+    
     def get_recent_alerts(self, alert_type: Optional[str] = None, symbol: Optional[str] = None, tf: Optional[str] = None) -> List[Alert]:
         """Get recent alerts filtered by type, symbol, or timeframe"""
         filtered = self.recent_alerts
@@ -0,0 +1,105 @@
+"""
+Adaptive Monitor Cadence - Proximity-Based Polling for PriceMonitorService
+Version: 1.0.0
+Date: 2026-10-19
+
+Decides when each symbol with pending re-entry triggers is polled next:
+- Near a trigger (within ``near_trigger_pips``, or ``near_trigger_atr`` ATRs
+  when an ATR is known) -> poll every ``min_interval_seconds``
+- Farther away -> the interval doubles (``backoff_factor``) each cycle, up to
+  ``max_interval_seconds``
+- Price unavailable -> the service's base interval
+
+Symbols without pending triggers are not tracked at all.
+"""
+
+import time
+from typing import Callable, Dict, Optional, Set
+
+DEFAULT_CADENCE = {
+    "enabled": True,
+    "min_interval_seconds": 0.5,
+    "max_interval_seconds": 30.0,
+    "near_trigger_pips": 5.0,
+    "near_trigger_atr": 0.25,
+    "backoff_factor": 2.0,
+}
+
+
+class AdaptiveCadence:
+    """Per-symbol polling intervals from the distance to the nearest trigger"""
+
+    def __init__(self, base_interval: float, config: Optional[Dict] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.config = {**DEFAULT_CADENCE, **(config or {})}
+        self.base_interval = base_interval
+        self.min_interval = min(self.config["min_interval_seconds"], base_interval)
+        self.max_interval = max(self.config["max_interval_seconds"], base_interval)
+        self._clock = clock
+
+        self._next_due: Dict[str, float] = {}
+        self._interval: Dict[str, float] = {}
+        self._nearest: Dict[str, float] = {}  # symbol -> proximity observed this cycle
+        self.stats = {"polls": 0, "skipped": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config["enabled"])
+
+    def begin_cycle(self, symbols) -> Set[str]:
+        """Symbols to check this cycle (new symbols always are)"""
+        now = self._clock()
+        symbols = set(symbols)
+        due = {s for s in symbols if not self.enabled or now >= self._next_due.get(s, 0.0)}
+        self.stats["polls"] += len(due)
+        self.stats["skipped"] += len(symbols) - len(due)
+        return due
+
+    def observe(self, symbol: str, distance_pips: float, atr_pips: Optional[float] = None):
+        """
+        Record the distance from price to one pending trigger of ``symbol``.
+
+        Distances are normalised to "near" units (1.0 == at the near
+        threshold); the nearest trigger of the cycle sets the next interval.
+        """
+        if atr_pips:
+            proximity = distance_pips / (atr_pips * self.config["near_trigger_atr"])
+        else:
+            proximity = distance_pips / self.config["near_trigger_pips"]
+        self._nearest[symbol] = min(proximity, self._nearest.get(symbol, proximity))
+
+    def end_cycle(self, checked, pending) -> None:
+        """Schedule the checked symbols still pending and forget finished ones"""
+        now = self._clock()
+        pending = set(pending)
+        for symbol in list(self._next_due):
+            if symbol not in pending:
+                self._next_due.pop(symbol, None)
+                self._interval.pop(symbol, None)
+        for symbol in pending & set(checked):
+            proximity = self._nearest.get(symbol)
+            if proximity is None:
+                interval = self.base_interval  # no price this cycle
+            elif proximity <= 1.0:
+                interval = self.min_interval
+            else:
+                previous = self._interval.get(symbol, self.min_interval)
+                interval = min(self.max_interval, max(self.min_interval, previous * self.config["backoff_factor"]))
+            self._interval[symbol] = interval
+            self._next_due[symbol] = now + interval
+        self._nearest.clear()
+
+    def sleep_time(self, has_pending: bool) -> float:
+        """Seconds until the next symbol is due, capped by the base interval"""
+        if not self.enabled or not has_pending or not self._next_due:
+            return self.base_interval
+        wait = min(self._next_due.values()) - self._clock()
+        return max(self.min_interval, min(self.base_interval, wait))
+
+    def get_status(self) -> Dict[str, Dict[str, float]]:
+        now = self._clock()
+        return {
+            symbol: {"interval": round(self._interval.get(symbol, 0.0), 2),
+                     "due_in": round(max(0.0, due - now), 2)}
+            for symbol, due in self._next_due.items()
+        }
@@ -1,8 +1,10 @@
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set
 from src.models import Trade
 from src.config import Config
+from src.services.monitor_cadence import AdaptiveCadence
 from src.utils.optimized_logger import logger as opt_logger
 import logging
 
@@ -42,6 +44,18 @@ class PriceMonitorService:
         # Exit continuation tracking (Exit Appeared/Reversal signals)
         self.exit_continuation_pending = {}  # symbol -> {'exit_price': ..., 'direction': ..., 'exit_reason': ...}
         
+        # Proximity-based polling: symbols near a trigger are checked often,
+        # distant ones back off (re_entry_config.adaptive_monitor overrides defaults)
+        re_entry_config = config.get("re_entry_config", {})
+        self.cadence = AdaptiveCadence(
+            re_entry_config.get("price_monitor_interval_seconds", 30),
+            re_entry_config.get("adaptive_monitor")
+        )
+        self.atr_provider: Optional[Callable[[str], Optional[float]]] = None  # symbol -> ATR in pips
+        self._due_symbols: Optional[Set[str]] = None  # None outside a cycle: every symbol is due
+        self._cycle_prices: Optional[Dict[str, Optional[float]]] = None
+        self._next_global_check = 0.0
+        
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
@@ -71,9 +85,49 @@ class PriceMonitorService:
                 "monitor_interval": self.config["re_entry_config"].get("price_monitor_interval_seconds", 30),
                 "sl_hunt_offset_pips": self.config["re_entry_config"].get("sl_hunt_offset_pips", 1.0),
                 "tp_continuation_gap_pips": self.config["re_entry_config"].get("tp_continuation_price_gap_pips", 2.0)
+            },
+            "cadence": {
+                "enabled": self.cadence.enabled,
+                "symbols": self.cadence.get_status(),
+                **self.cadence.stats
             }
         }
     
+    def export_snapshot_state(self) -> Dict[str, Any]:
+        """Pending re-entries for warm-restart snapshots (see src/core/state_snapshot.py)"""
+        return {
+            "sl_hunt": self.sl_hunt_pending,
+            "tp_continuation": self.tp_continuation_pending,
+            "exit_continuation": self.exit_continuation_pending,
+            "monitored_symbols": self.monitored_symbols,
+        }
+    
+    def restore_snapshot_state(self, state: Dict[str, Any]):
+        """Merge pending re-entries from a snapshot, dropping expired windows"""
+        now = datetime.now()
+        
+        def live(item):
+            expires = item.get("expiration_time")
+            return expires is None or expires > now
+        
+        for attr, key in (("sl_hunt_pending", "sl_hunt"), ("tp_continuation_pending", "tp_continuation")):
+            pending = getattr(self, attr)
+            for symbol, items in state.get(key, {}).items():
+                items = [item for item in items if live(item)]
+                if items:
+                    pending.setdefault(symbol, []).extend(items)
+        for symbol, item in state.get("exit_continuation", {}).items():
+            if live(item):
+                self.exit_continuation_pending.setdefault(symbol, item)
+        
+        self.monitored_symbols.update(
+            set(self.sl_hunt_pending) | set(self.tp_continuation_pending) | set(self.exit_continuation_pending)
+        )
+        self.logger.info(
+            f"♻️ Restored pending re-entries - SL Hunt: {len(self.sl_hunt_pending)}, "
+            f"TP: {len(self.tp_continuation_pending)}, Exit: {len(self.exit_continuation_pending)}"
+        )
+    
     def log_service_status(self):
         """DIAGNOSTIC: Log comprehensive service status"""
         status = self.get_service_status()
@@ -161,7 +215,7 @@ class PriceMonitorService:
                         f"⚠️ Monitor cycle took {cycle_duration:.2f}s (longer than interval {interval}s)"
                     )
                 
-                await asyncio.sleep(interval)
+                await asyncio.sleep(self.cadence.sleep_time(bool(self._pending_symbols())))
                 self.monitor_error_count = 0  # Reset on success
                 
             except asyncio.CancelledError:
@@ -208,8 +262,37 @@ class PriceMonitorService:
         except Exception as e:
             self.logger.error(f"Failed to register exit continuation: {e}")
 
+    def set_atr_provider(self, provider: Optional[Callable[[str], Optional[float]]]):
+        """Measure trigger proximity in ATRs; ``provider(symbol)`` returns the ATR in pips"""
+        self.atr_provider = provider
+    
+    def _pending_symbols(self) -> Set[str]:
+        return set(self.sl_hunt_pending) | set(self.tp_continuation_pending) | set(self.exit_continuation_pending)
+    
+    def _is_due(self, symbol: str) -> bool:
+        return self._due_symbols is None or symbol in self._due_symbols
+    
+    def _observe_trigger(self, symbol: str, current_price: float, target_price: float):
+        """Feed the distance to one pending trigger into the cadence"""
+        try:
+            pip_size = self.config["symbol_config"][symbol]["pip_size"]
+        except (KeyError, TypeError):
+            return
+        atr_pips = None
+        if self.atr_provider:
+            try:
+                atr_pips = self.atr_provider(symbol)
+            except Exception as e:
+                self.logger.debug(f"[CADENCE] ATR unavailable for {symbol}: {e}")
+        self.cadence.observe(symbol, abs(current_price - target_price) / pip_size, atr_pips)
+    
     async def _check_all_opportunities(self):
-        """Check all pending re-entry opportunities"""
+        """
+        Check all pending re-entry opportunities
+        
+        Re-entry triggers are checked only for symbols the cadence marks due;
+        margin, profit booking and autonomous checks keep the base interval.
+        """
         
         # DEBUG: Log monitoring cycle start
         self.logger.debug(
@@ -219,23 +302,37 @@ class PriceMonitorService:
             f"Exit Continuation: {len(self.exit_continuation_pending)}"
         )
         
-        # 🆕 CRITICAL: Check margin health and auto-close risky positions if needed
-        await self._check_margin_health()
-        
-        # Check SL hunt re-entries
-        await self._check_sl_hunt_reentries()
-        
-        # Check TP continuation re-entries
-        await self._check_tp_continuation_reentries()
+        now = time.monotonic()
+        run_global = now >= self._next_global_check
+        if run_global:
+            self._next_global_check = now + self.cadence.base_interval
         
-        # Check Exit continuation re-entries (NEW)
-        await self._check_exit_continuation_reentries()
-        
-        # Check Profit Booking chains (NEW)
-        await self._check_profit_booking_chains()
-        
-        # Check Autonomous Opportunities
-        await self._check_autonomous_opportunities()
+        self._due_symbols = self.cadence.begin_cycle(self._pending_symbols())
+        self._cycle_prices = {}  # one quote per symbol per cycle
+        try:
+            # 🆕 CRITICAL: Check margin health and auto-close risky positions if needed
+            if run_global:
+                await self._check_margin_health()
+            
+            # Check SL hunt re-entries
+            await self._check_sl_hunt_reentries()
+            
+            # Check TP continuation re-entries
+            await self._check_tp_continuation_reentries()
+            
+            # Check Exit continuation re-entries (NEW)
+            await self._check_exit_continuation_reentries()
+            
+            if run_global:
+                # Check Profit Booking chains (NEW)
+                await self._check_profit_booking_chains()
+                
+                # Check Autonomous Opportunities
+                await self._check_autonomous_opportunities()
+        finally:
+            self.cadence.end_cycle(self._due_symbols, self._pending_symbols())
+            self._due_symbols = None
+            self._cycle_prices = None
 
     async def _check_profit_booking_chains(self):
         """Check for profit booking order recoveries"""
@@ -553,6 +650,9 @@ class PriceMonitorService:
             return
         
         for symbol in list(self.sl_hunt_pending.keys()):
+            if not self._is_due(symbol):
+                continue
+            
             # Handle list of pending items
             pending_items = self.sl_hunt_pending[symbol]
             
@@ -576,6 +676,7 @@ class PriceMonitorService:
                 direction = pending['direction']
                 chain_id = pending['chain_id']
                 sl_price = pending.get('sl_price', 0)
+                self._observe_trigger(symbol, current_price, target_price)
                 
                 # DEBUG: Log price comparison
                 self.logger.debug(
@@ -646,6 +747,9 @@ class PriceMonitorService:
             return
         
         for symbol in list(self.tp_continuation_pending.keys()):
+            if not self._is_due(symbol):
+                continue
+            
             # Handle list of pending items
             pending_items = self.tp_continuation_pending[symbol]
             active_items = []
@@ -672,6 +776,7 @@ class PriceMonitorService:
                     target_price = tp_price + (gap_pips * pip_size)
                 else:
                     target_price = tp_price - (gap_pips * pip_size)
+                self._observe_trigger(symbol, current_price, target_price)
                     
                 # DEBUG: Log price comparison
                 self.logger.debug(
@@ -741,6 +846,8 @@ class PriceMonitorService:
             return
         
         for symbol in list(self.exit_continuation_pending.keys()):
+            if not self._is_due(symbol):
+                continue
             pending = self.exit_continuation_pending[symbol]
             
             # Get current price from MT5
@@ -764,6 +871,7 @@ class PriceMonitorService:
                 target_price = exit_price + price_gap
             else:
                 target_price = exit_price - price_gap
+            self._observe_trigger(symbol, current_price, target_price)
             
             # DEBUG: Log price comparison
             self.logger.debug(
@@ -1072,14 +1180,19 @@ class PriceMonitorService:
     
     def _get_current_price(self, symbol: str, direction: str) -> Optional[float]:
         """Get current price from MT5 (or simulation) using mapped client"""
+        if self._cycle_prices is not None and symbol in self._cycle_prices:
+            return self._cycle_prices[symbol]
         try:
             # Use the robust client method which handles:
             # 1. Simulation mode check
             # 2. Symbol mapping (TradingView XAUUSD -> Broker GOLD)
             # 3. Connection health
-            return self.mt5_client.get_current_price(symbol)
+            price = self.mt5_client.get_current_price(symbol)
         except:
-            return None
+            price = None
+        if self._cycle_prices is not None:
+            self._cycle_prices[symbol] = price
+        return price
     
     def register_sl_hunt(self, trade: Trade, logic: str):
         """Register a trade for SL hunt monitoring"""
@@ -0,0 +1,51 @@
+"""
+Simulation Module - Offline replay and broker simulation
+
+Provides a virtual clock, an MT5Client-compatible simulated broker, a
+replay engine that drives recorded alerts and market data through the bot,
+and an in-process MetaTrader5 API emulator for load and soak testing.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+
+from .virtual_clock import VirtualClock, to_epoch
+from .simulated_broker import (
+    SimulatedBroker,
+    SimulatedPosition,
+    SimulatedDeal,
+    Tick
+)
+from .replay_engine import (
+    ReplayEngine,
+    ReplayAlert,
+    ReplayResult,
+    PluginPnL,
+    load_ticks,
+    load_alerts
+)
+from .mt5_emulator import (
+    MT5Emulator,
+    SymbolSpec,
+    LatencyModel,
+    ErrorInjection
+)
+
+__all__ = [
+    'VirtualClock',
+    'to_epoch',
+    'SimulatedBroker',
+    'SimulatedPosition',
+    'SimulatedDeal',
+    'Tick',
+    'ReplayEngine',
+    'ReplayAlert',
+    'ReplayResult',
+    'PluginPnL',
+    'load_ticks',
+    'load_alerts',
+    'MT5Emulator',
+    'SymbolSpec',
+    'LatencyModel',
+    'ErrorInjection'
+]
@@ -0,0 +1,676 @@
+"""
+MT5 Emulator
+In-process stand-in for the MetaTrader5 package for load and soak testing
+
+Mimics the subset of the ``MetaTrader5`` API surface that ``MT5Client`` uses
+(initialize/login/shutdown, symbol_info, symbol_info_tick, symbol_select,
+order_calc_margin, order_send, positions_get, history_deals_get, account_info,
+last_error and the trade constants) so the full bot can run on a plain Linux box:
+
+    emulator = MT5Emulator(seed=42, latency={'order_send': LatencyModel('lognormal', 0.02, 0.5)})
+    mt5_client = MT5Client(config, mt5_module=emulator)   # config["simulate_orders"] = False
+
+Features:
+- Random-walk tick generation (per-symbol volatility and spread)
+- SL/TP auto-fills whenever a symbol's price is updated
+- Configurable per-method latency distributions
+- Probabilistic and one-shot error injection
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from collections import namedtuple
+from dataclasses import dataclass, field
+import itertools
+import logging
+import math
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== MetaTrader5 Constants ====================
+
+ORDER_TYPE_BUY = 0
+ORDER_TYPE_SELL = 1
+POSITION_TYPE_BUY = 0
+POSITION_TYPE_SELL = 1
+
+TRADE_ACTION_DEAL = 1
+TRADE_ACTION_SLTP = 6
+
+ORDER_TIME_GTC = 0
+ORDER_FILLING_FOK = 0
+ORDER_FILLING_IOC = 1
+
+DEAL_ENTRY_IN = 0
+DEAL_ENTRY_OUT = 1
+
+DEAL_REASON_CLIENT = 0
+DEAL_REASON_SL = 4
+DEAL_REASON_TP = 5
+
+TRADE_RETCODE_REQUOTE = 10004
+TRADE_RETCODE_REJECT = 10006
+TRADE_RETCODE_DONE = 10009
+TRADE_RETCODE_INVALID = 10013
+TRADE_RETCODE_INVALID_VOLUME = 10014
+TRADE_RETCODE_INVALID_STOPS = 10016
+TRADE_RETCODE_NO_MONEY = 10019
+TRADE_RETCODE_PRICE_OFF = 10021
+TRADE_RETCODE_CONNECTION = 10031
+TRADE_RETCODE_POSITION_CLOSED = 10036
+
+RES_S_OK = 1
+RES_E_FAIL = -1
+RES_E_INTERNAL_FAIL = -10001
+
+# ==================== MetaTrader5 Result Types ====================
+
+Tick = namedtuple('Tick', 'time bid ask last volume time_msc flags volume_real')
+
+SymbolInfo = namedtuple(
+    'SymbolInfo',
+    'name visible select digits point spread trade_stops_level trade_contract_size '
+    'trade_tick_value trade_tick_size volume_min volume_max volume_step bid ask'
+)
+
+AccountInfo = namedtuple(
+    'AccountInfo',
+    'login server currency leverage balance equity profit margin margin_free margin_level'
+)
+
+TradePosition = namedtuple(
+    'TradePosition',
+    'ticket time type magic identifier symbol volume price_open sl tp price_current '
+    'swap profit comment'
+)
+
+TradeDeal = namedtuple(
+    'TradeDeal',
+    'ticket order time type entry reason magic position_id volume price commission '
+    'swap profit symbol comment'
+)
+
+OrderSendResult = namedtuple(
+    'OrderSendResult',
+    'retcode deal order volume price bid ask comment request_id retcode_external request'
+)
+
+
+# ==================== Configuration ====================
+
+@dataclass
+class SymbolSpec:
+    """Static symbol parameters and random-walk settings"""
+    name: str
+    start_price: float
+    digits: int
+    point: float
+    contract_size: float = 100000
+    tick_value: float = 1.0           # Account currency per point per lot
+    spread_points: int = 10
+    volatility: float = 0.0001        # Std-dev of price change per sqrt(second)
+    stops_level: int = 0
+
+    @property
+    def pip_size(self) -> float:
+        return self.point * 10
+
+
+DEFAULT_SYMBOLS: Dict[str, SymbolSpec] = {
+    'XAUUSD': SymbolSpec('XAUUSD', 2650.0, 2, 0.01, 100, 1.0, 30, 0.15),
+    'EURUSD': SymbolSpec('EURUSD', 1.0850, 5, 0.00001, 100000, 1.0, 12, 0.00004),
+    'GBPUSD': SymbolSpec('GBPUSD', 1.2650, 5, 0.00001, 100000, 1.0, 15, 0.00005),
+    'USDJPY': SymbolSpec('USDJPY', 149.50, 3, 0.001, 100000, 0.67, 15, 0.006),
+    'USDCAD': SymbolSpec('USDCAD', 1.3550, 5, 0.00001, 100000, 0.74, 18, 0.00004),
+    'AUDUSD': SymbolSpec('AUDUSD', 0.6550, 5, 0.00001, 100000, 1.0, 15, 0.00003),
+    'NZDUSD': SymbolSpec('NZDUSD', 0.6050, 5, 0.00001, 100000, 1.0, 18, 0.00003),
+    'EURJPY': SymbolSpec('EURJPY', 162.20, 3, 0.001, 100000, 0.67, 20, 0.007),
+    'GBPJPY': SymbolSpec('GBPJPY', 189.10, 3, 0.001, 100000, 0.67, 25, 0.009),
+    'AUDJPY': SymbolSpec('AUDJPY', 97.90, 3, 0.001, 100000, 0.67, 20, 0.005),
+}
+
+# Broker-specific aliases (XM names gold "GOLD")
+DEFAULT_ALIASES = {'GOLD': 'XAUUSD'}
+
+
+@dataclass
+class LatencyModel:
+    """
+    Latency distribution for an emulated API call (seconds).
+
+    kind:
+        'fixed'     -> a
+        'uniform'   -> uniform(a, b)
+        'normal'    -> max(0, normal(mean=a, sd=b))
+        'lognormal' -> median a, shape sigma b
+    """
+    kind: str = 'fixed'
+    a: float = 0.0
+    b: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'uniform':
+            return rng.uniform(self.a, self.b)
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(self.a, self.b))
+        if self.kind == 'lognormal':
+            return self.a * math.exp(rng.gauss(0.0, self.b)) if self.a > 0 else 0.0
+        return self.a
+
+
+@dataclass
+class ErrorInjection:
+    """Failure probability and the retcode/last_error reported on failure"""
+    rate: float = 0.0
+    retcode: int = TRADE_RETCODE_REJECT
+    message: str = "Injected failure"
+
+
+@dataclass
+class _SymbolState:
+    spec: SymbolSpec
+    bid: float
+    last_update: float
+    selected: bool = True
+
+
+@dataclass
+class _Position:
+    ticket: int
+    symbol: str
+    type: int
+    volume: float
+    price_open: float
+    sl: float
+    tp: float
+    magic: int
+    comment: str
+    time: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class MT5Emulator:
+    """
+    In-process MetaTrader5 API emulator.
+
+    Thread-safe: all state changes happen under a lock, so the emulator can be
+    shared between the asyncio loop and executor threads like the real module.
+    """
+
+    # Expose constants on instances so ``mt5_module.ORDER_TYPE_BUY`` works
+    ORDER_TYPE_BUY = ORDER_TYPE_BUY
+    ORDER_TYPE_SELL = ORDER_TYPE_SELL
+    POSITION_TYPE_BUY = POSITION_TYPE_BUY
+    POSITION_TYPE_SELL = POSITION_TYPE_SELL
+    TRADE_ACTION_DEAL = TRADE_ACTION_DEAL
+    TRADE_ACTION_SLTP = TRADE_ACTION_SLTP
+    ORDER_TIME_GTC = ORDER_TIME_GTC
+    ORDER_FILLING_FOK = ORDER_FILLING_FOK
+    ORDER_FILLING_IOC = ORDER_FILLING_IOC
+    DEAL_ENTRY_IN = DEAL_ENTRY_IN
+    DEAL_ENTRY_OUT = DEAL_ENTRY_OUT
+    TRADE_RETCODE_DONE = TRADE_RETCODE_DONE
+    TRADE_RETCODE_REQUOTE = TRADE_RETCODE_REQUOTE
+    TRADE_RETCODE_REJECT = TRADE_RETCODE_REJECT
+    TRADE_RETCODE_INVALID_VOLUME = TRADE_RETCODE_INVALID_VOLUME
+    TRADE_RETCODE_INVALID_STOPS = TRADE_RETCODE_INVALID_STOPS
+    TRADE_RETCODE_NO_MONEY = TRADE_RETCODE_NO_MONEY
+    TRADE_RETCODE_CONNECTION = TRADE_RETCODE_CONNECTION
+    TRADE_RETCODE_POSITION_CLOSED = TRADE_RETCODE_POSITION_CLOSED
+
+    def __init__(self,
+                 symbols: Optional[Dict[str, SymbolSpec]] = None,
+                 aliases: Optional[Dict[str, str]] = None,
+                 balance: float = 10000.0,
+                 leverage: int = 500,
+                 latency: Optional[Dict[str, LatencyModel]] = None,
+                 errors: Optional[Dict[str, ErrorInjection]] = None,
+                 seed: Optional[int] = None,
+                 clock: Optional[Callable[[], float]] = None,
+                 sleep: Optional[Callable[[float], None]] = None,
+                 login: int = 900001,
+                 server: str = "Emulator-Demo"):
+        """
+        Args:
+            symbols: Symbol specs (defaults to the bot's ten traded symbols)
+            aliases: Broker symbol aliases, e.g. {'GOLD': 'XAUUSD'}
+            balance: Starting account balance
+            leverage: Account leverage used for margin
+            latency: Per-method latency models; key 'default' applies to all
+            errors: Per-method error injection; key 'default' applies to all
+            seed: RNG seed for reproducible runs
+            clock: Time source (defaults to ``time.time``; pass a VirtualClock.time)
+            sleep: Latency sleeper (defaults to ``time.sleep``)
+        """
+        self._lock = threading.RLock()
+        self._rng = random.Random(seed)
+        self._clock = clock or time.time
+        self._sleep = sleep or time.sleep
+
+        self._symbols: Dict[str, _SymbolState] = {}
+        now = self._clock()
+        for name, spec in (symbols or DEFAULT_SYMBOLS).items():
+            self._symbols[name] = _SymbolState(spec, spec.start_price, now)
+        self._aliases = dict(DEFAULT_ALIASES if aliases is None else aliases)
+
+        self._login = login
+        self._server = server
+        self._leverage = leverage
+        self._balance = balance
+
+        self._positions: Dict[int, _Position] = {}
+        self._deals: List[TradeDeal] = []
+        self._tickets = itertools.count(5000001)
+
+        self._latency = dict(latency or {})
+        self._errors = dict(errors or {})
+        self._forced_failures: Dict[str, List[ErrorInjection]] = {}
+
+        self._connected = False
+        self._last_error: Tuple[int, str] = (RES_S_OK, 'Success')
+        self.call_counts: Dict[str, int] = {}
+
+    # ==================== Emulator Controls ====================
+
+    def set_latency(self, method: str, model: LatencyModel):
+        """Set the latency model for a method ('default' for all)"""
+        self._latency[method] = model
+
+    def set_error_rate(self, method: str, rate: float,
+                       retcode: int = TRADE_RETCODE_REJECT, message: str = "Injected failure"):
+        """Fail a fraction of calls to a method ('default' for all)"""
+        self._errors[method] = ErrorInjection(rate, retcode, message)
+
+    def fail_next(self, method: str, retcode: int = TRADE_RETCODE_REJECT,
+                  message: str = "Injected failure", count: int = 1):
+        """Deterministically fail the next ``count`` calls to a method"""
+        queue = self._forced_failures.setdefault(method, [])
+        queue.extend(ErrorInjection(1.0, retcode, message) for _ in range(count))
+
+    def set_price(self, symbol: str, bid: float) -> List[TradeDeal]:
+        """Force a symbol's bid (ask = bid + spread) and process SL/TP"""
+        with self._lock:
+            state = self._state(symbol)
+            state.bid = round(bid, state.spec.digits)
+            state.last_update = self._clock()
+            return self._check_stops(state)
+
+    def advance(self, seconds: float) -> List[TradeDeal]:
+        """Random-walk every symbol forward by ``seconds`` of emulated time"""
+        closed = []
+        with self._lock:
+            for state in self._symbols.values():
+                self._walk(state, seconds)
+                closed.extend(self._check_stops(state))
+        return closed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Emulator counters for load-test reporting"""
+        with self._lock:
+            return {
+                'open_positions': len(self._positions),
+                'deals': len(self._deals),
+                'balance': round(self._balance, 2),
+                'calls': dict(self.call_counts)
+            }
+
+    # ==================== Connection ====================
+
+    def initialize(self, *args, **kwargs) -> bool:
+        if self._intercept('initialize'):
+            return False
+        self._connected = True
+        return True
+
+    def login(self, login=None, password=None, server=None, **kwargs) -> bool:
+        if self._intercept('login'):
+            return False
+        if login:
+            self._login = int(login)
+        if server:
+            self._server = server
+        self._connected = True
+        return True
+
+    def shutdown(self):
+        self._connected = False
+        return True
+
+    def last_error(self) -> Tuple[int, str]:
+        return self._last_error
+
+    def terminal_info(self):
+        return namedtuple('TerminalInfo', 'connected trade_allowed name')(
+            self._connected, True, 'MT5Emulator')
+
+    # ==================== Market Data ====================
+
+    def symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        if self._intercept('symbol_info'):
+            return None
+        with self._lock:
+            state = self._lookup(symbol)
+            if state is None:
+                self._last_error = (RES_E_FAIL, f"Unknown symbol {symbol}")
+                return None
+            self._refresh(state)
+            spec = state.spec
+            return SymbolInfo(
+                name=symbol, visible=state.selected, select=state.selected,
+                digits=spec.digits, point=spec.point, spread=spec.spread_points,
+                trade_stops_level=spec.stops_level, trade_contract_size=spec.contract_size,
+                trade_tick_value=spec.tick_value, trade_tick_size=spec.point,
+                volume_min=0.01, volume_max=100.0, volume_step=0.01,
+                bid=state.bid, ask=self._ask(state)
+            )
+
+    def symbol_select(self, symbol: str, enable: bool = True) -> bool:
+        with self._lock:
+            state = self._lookup(symbol)
+            if state is None:
+                return False
+            state.selected = enable
+            return True
+
+    def symbol_info_tick(self, symbol: str) -> Optional[Tick]:
+        if self._intercept('symbol_info_tick'):
+            return None
+        with self._lock:
+            state = self._lookup(symbol)
+            if state is None:
+                self._last_error = (RES_E_FAIL, f"Unknown symbol {symbol}")
+                return None
+            self._refresh(state)
+            now = self._clock()
+            return Tick(int(now), state.bid, self._ask(state), state.bid, 0,
+                        int(now * 1000), 6, 0.0)
+
+    def order_calc_margin(self, action: int, symbol: str, volume: float, price: float) -> Optional[float]:
+        if self._intercept('order_calc_margin'):
+            return None
+        with self._lock:
+            state = self._lookup(symbol)
+            if state is None:
+                self._last_error = (RES_E_FAIL, f"Unknown symbol {symbol}")
+                return None
+            return self._margin_for(state, volume, price)
+
+    # ==================== Trading ====================
+
+    def order_send(self, request: Dict[str, Any]) -> OrderSendResult:
+        injected = self._intercept('order_send')
+        if injected:
+            return self._result(injected.retcode, request, comment=injected.message)
+
+        with self._lock:
+            action = request.get('action')
+            if action == TRADE_ACTION_SLTP:
+                return self._modify(request)
+            if action != TRADE_ACTION_DEAL:
+                return self._result(TRADE_RETCODE_INVALID, request, comment="Unsupported action")
+            if request.get('position'):
+                return self._close(request)
+            return self._open(request)
+
+    def _open(self, request: Dict[str, Any]) -> OrderSendResult:
+        state = self._lookup(request.get('symbol', ''))
+        if state is None:
+            return self._result(TRADE_RETCODE_INVALID, request, comment="Unknown symbol")
+        volume = float(request.get('volume', 0))
+        if volume <= 0:
+            return self._result(TRADE_RETCODE_INVALID_VOLUME, request, comment="Invalid volume")
+
+        self._refresh(state)
+        order_type = request.get('type', ORDER_TYPE_BUY)
+        price = self._ask(state) if order_type == ORDER_TYPE_BUY else state.bid
+
+        required = self._margin_for(state, volume, price)
+        if required > self._free_margin():
+            return self._result(TRADE_RETCODE_NO_MONEY, request, comment="No money")
+
+        ticket = next(self._tickets)
+        position = _Position(
+            ticket=ticket, symbol=state.spec.name, type=order_type, volume=volume,
+            price_open=price, sl=float(request.get('sl') or 0.0), tp=float(request.get('tp') or 0.0),
+            magic=int(request.get('magic', 0)), comment=request.get('comment', ''),
+            time=self._clock(), extra={'requested_symbol': request.get('symbol')}
+        )
+        self._positions[ticket] = position
+        self._record_deal(position, volume, price, DEAL_ENTRY_IN, DEAL_REASON_CLIENT, 0.0)
+        return self._result(TRADE_RETCODE_DONE, request, order=ticket, deal=ticket,
+                            volume=volume, price=price, state=state)
+
+    def _close(self, request: Dict[str, Any]) -> OrderSendResult:
+        position = self._positions.get(int(request['position']))
+        if position is None:
+            return self._result(TRADE_RETCODE_POSITION_CLOSED, request, comment="Position closed")
+        state = self._symbols[position.symbol]
+        self._refresh(state)
+        volume = min(float(request.get('volume', position.volume)), position.volume)
+        price = state.bid if position.type == ORDER_TYPE_BUY else self._ask(state)
+        deal = self._close_volume(position, volume, price, DEAL_REASON_CLIENT)
+        return self._result(TRADE_RETCODE_DONE, request, order=deal.order, deal=deal.ticket,
+                            volume=volume, price=price, state=state)
+
+    def _modify(self, request: Dict[str, Any]) -> OrderSendResult:
+        position = self._positions.get(int(request.get('position', 0)))
+        if position is None:
+            return self._result(TRADE_RETCODE_POSITION_CLOSED, request, comment="Position closed")
+        if request.get('sl') is not None:
+            position.sl = float(request['sl'])
+        if request.get('tp') is not None:
+            position.tp = float(request['tp'])
+        return self._result(TRADE_RETCODE_DONE, request, order=position.ticket)
+
+    # ==================== Positions & History ====================
+
+    def positions_get(self, symbol: Optional[str] = None, group: Optional[str] = None,
+                      ticket: Optional[int] = None):
+        if self._intercept('positions_get'):
+            return None
+        with self._lock:
+            wanted = self._canonical(symbol) if symbol else None
+            result = []
+            for position in self._positions.values():
+                if ticket is not None and position.ticket != ticket:
+                    continue
+                if wanted is not None and position.symbol != wanted:
+                    continue
+                state = self._symbols[position.symbol]
+                self._refresh(state)
+                result.append(self._to_trade_position(position, state))
+            return tuple(result)
+
+    def positions_total(self) -> int:
+        return len(self._positions)
+
+    def history_deals_get(self, date_from=None, date_to=None, position: Optional[int] = None,
+                          ticket: Optional[int] = None, group: Optional[str] = None):
+        if self._intercept('history_deals_get'):
+            return None
+        with self._lock:
+            deals = self._deals
+            if position is not None:
+                deals = [d for d in deals if d.position_id == position]
+            if ticket is not None:
+                deals = [d for d in deals if d.ticket == ticket]
+            if date_from is not None and position is None and ticket is None:
+                start = _to_ts(date_from)
+                end = _to_ts(date_to) if date_to is not None else float('inf')
+                deals = [d for d in deals if start <= d.time <= end]
+            return tuple(deals)
+
+    def account_info(self) -> Optional[AccountInfo]:
+        if self._intercept('account_info'):
+            return None
+        with self._lock:
+            profit = 0.0
+            for position in self._positions.values():
+                state = self._symbols[position.symbol]
+                self._refresh(state)
+                profit += self._floating(position, state)
+            margin = self._used_margin()
+            equity = self._balance + profit
+            return AccountInfo(
+                login=self._login, server=self._server, currency='USD',
+                leverage=self._leverage, balance=round(self._balance, 2),
+                equity=round(equity, 2), profit=round(profit, 2), margin=round(margin, 2),
+                margin_free=round(equity - margin, 2),
+                margin_level=round(equity / margin * 100, 2) if margin else 0.0
+            )
+
+    # ==================== Internals ====================
+
+    def _intercept(self, method: str) -> Optional[ErrorInjection]:
+        """Apply call accounting, latency and error injection for a method"""
+        self.call_counts[method] = self.call_counts.get(method, 0) + 1
+
+        model = self._latency.get(method) or self._latency.get('default')
+        if model:
+            delay = model.sample(self._rng)
+            if delay > 0:
+                self._sleep(delay)
+
+        failure = None
+        queue = self._forced_failures.get(method)
+        if queue:
+            failure = queue.pop(0)
+        else:
+            injection = self._errors.get(method) or self._errors.get('default')
+            if injection and injection.rate > 0 and self._rng.random() < injection.rate:
+                failure = injection
+
+        if failure:
+            self._last_error = (RES_E_INTERNAL_FAIL, failure.message)
+            logger.debug(f"[MT5Emulator] Injected failure on {method}: {failure.message}")
+            return failure
+        self._last_error = (RES_S_OK, 'Success')
+        return None
+
+    def _canonical(self, symbol: str) -> str:
+        return self._aliases.get(symbol, symbol)
+
+    def _lookup(self, symbol: str) -> Optional[_SymbolState]:
+        return self._symbols.get(self._canonical(symbol))
+
+    def _state(self, symbol: str) -> _SymbolState:
+        state = self._lookup(symbol)
+        if state is None:
+            raise KeyError(f"Unknown symbol {symbol}")
+        return state
+
+    def _ask(self, state: _SymbolState) -> float:
+        return round(state.bid + state.spec.spread_points * state.spec.point, state.spec.digits)
+
+    def _refresh(self, state: _SymbolState):
+        """Lazily random-walk a symbol up to the current clock"""
+        now = self._clock()
+        elapsed = now - state.last_update
+        if elapsed > 0:
+            self._walk(state, elapsed)
+            state.last_update = now
+            self._check_stops(state)
+
+    def _walk(self, state: _SymbolState, seconds: float):
+        if seconds <= 0:
+            return
+        shock = self._rng.gauss(0.0, state.spec.volatility * math.sqrt(seconds))
+        state.bid = round(max(state.spec.point, state.bid + shock), state.spec.digits)
+
+    def _check_stops(self, state: _SymbolState) -> List[TradeDeal]:
+        closed = []
+        ask = self._ask(state)
+        for position in [p for p in self._positions.values() if p.symbol == state.spec.name]:
+            if position.type == ORDER_TYPE_BUY:
+                if position.sl and state.bid <= position.sl:
+                    closed.append(self._close_volume(position, position.volume, position.sl, DEAL_REASON_SL))
+                elif position.tp and state.bid >= position.tp:
+                    closed.append(self._close_volume(position, position.volume, position.tp, DEAL_REASON_TP))
+            else:
+                if position.sl and ask >= position.sl:
+                    closed.append(self._close_volume(position, position.volume, position.sl, DEAL_REASON_SL))
+                elif position.tp and ask <= position.tp:
+                    closed.append(self._close_volume(position, position.volume, position.tp, DEAL_REASON_TP))
+        return closed
+
+    def _close_volume(self, position: _Position, volume: float, price: float, reason: int) -> TradeDeal:
+        profit = self._profit(position, volume, price)
+        self._balance += profit
+        deal = self._record_deal(position, volume, price, DEAL_ENTRY_OUT, reason, profit)
+        remaining = round(position.volume - volume, 2)
+        if remaining <= 0:
+            del self._positions[position.ticket]
+        else:
+            position.volume = remaining
+        return deal
+
+    def _record_deal(self, position: _Position, volume: float, price: float,
+                     entry: int, reason: int, profit: float) -> TradeDeal:
+        deal_ticket = next(self._tickets)
+        deal = TradeDeal(
+            ticket=deal_ticket, order=deal_ticket, time=int(self._clock()),
+            type=position.type if entry == DEAL_ENTRY_IN else 1 - position.type,
+            entry=entry, reason=reason, magic=position.magic, position_id=position.ticket,
+            volume=volume, price=price, commission=0.0, swap=0.0, profit=round(profit, 2),
+            symbol=position.symbol, comment=position.comment
+        )
+        self._deals.append(deal)
+        return deal
+
+    def _profit(self, position: _Position, volume: float, price: float) -> float:
+        spec = self._symbols[position.symbol].spec
+        sign = 1.0 if position.type == ORDER_TYPE_BUY else -1.0
+        points = (price - position.price_open) * sign / spec.point
+        return points * spec.tick_value * volume
+
+    def _floating(self, position: _Position, state: _SymbolState) -> float:
+        exit_price = state.bid if position.type == ORDER_TYPE_BUY else self._ask(state)
+        return self._profit(position, position.volume, exit_price)
+
+    def _margin_for(self, state: _SymbolState, volume: float, price: float) -> float:
+        return volume * state.spec.contract_size * price / self._leverage
+
+    def _used_margin(self) -> float:
+        return sum(
+            self._margin_for(self._symbols[p.symbol], p.volume, p.price_open)
+            for p in self._positions.values()
+        )
+
+    def _free_margin(self) -> float:
+        equity = self._balance + sum(
+            self._floating(p, self._symbols[p.symbol]) for p in self._positions.values()
+        )
+        return equity - self._used_margin()
+
+    def _to_trade_position(self, position: _Position, state: _SymbolState) -> TradePosition:
+        current = state.bid if position.type == ORDER_TYPE_BUY else self._ask(state)
+        return TradePosition(
+            ticket=position.ticket, time=int(position.time), type=position.type,
+            magic=position.magic, identifier=position.ticket,
+            symbol=position.extra.get('requested_symbol') or position.symbol,
+            volume=position.volume, price_open=position.price_open, sl=position.sl,
+            tp=position.tp, price_current=current, swap=0.0,
+            profit=round(self._floating(position, state), 2), comment=position.comment
+        )
+
+    def _result(self, retcode: int, request: Dict[str, Any], order: int = 0, deal: int = 0,
+                volume: float = 0.0, price: float = 0.0, comment: str = "Request executed",
+                state: Optional[_SymbolState] = None) -> OrderSendResult:
+        if retcode != TRADE_RETCODE_DONE and comment == "Request executed":
+            comment = "Request rejected"
+        return OrderSendResult(
+            retcode=retcode, deal=deal, order=order, volume=volume, price=price,
+            bid=state.bid if state else 0.0, ask=self._ask(state) if state else 0.0,
+            comment=comment, request_id=0, retcode_external=0, request=dict(request)
+        )
+
+
+def _to_ts(value) -> float:
+    if hasattr(value, 'timestamp'):
+        return value.timestamp()
+    return float(value)
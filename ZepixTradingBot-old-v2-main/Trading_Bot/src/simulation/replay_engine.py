@@ -0,0 +1,334 @@
+"""
+Replay Engine
+Offline tick/alert replay for high-speed plugin backtesting
+
+Feeds recorded webhook payloads and historical tick/bar data through the real
+``TradingEngine.process_alert`` or ``PluginRouter.route_signal`` entry points.
+Orders are filled by a ``SimulatedBroker`` against the tick stream and time is
+driven by a ``VirtualClock``, so a month of V3/V6 alerts replays in seconds.
+
+Usage:
+    clock = VirtualClock()
+    broker = SimulatedBroker(config, clock)
+    engine = TradingEngine(config, risk_manager, broker, telegram, alert_processor)
+    replay = ReplayEngine(engine, broker)
+    result = await replay.run(load_alerts("alerts.jsonl"), load_ticks("xauusd.csv"))
+    print(result.format_report())
+
+Tick files: CSV (or Parquet when pandas is installed) with either
+``timestamp,symbol,bid,ask`` tick columns or ``timestamp,symbol,open,high,low,close``
+bar columns (optional ``spread`` in price units).
+
+Alert files: JSON Lines, one recorded webhook per line, either
+``{"timestamp": ..., "payload": {...}}`` or the raw payload carrying a
+``timestamp``/``time`` field. String payloads (V6 pipe format) are passed through.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Union
+from dataclasses import dataclass, field
+import csv
+import heapq
+import json
+import logging
+import time
+
+from src.simulation.virtual_clock import VirtualClock, to_epoch
+from src.simulation.simulated_broker import SimulatedBroker, SimulatedDeal, Tick
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayAlert:
+    """A recorded webhook payload and the time it was received"""
+    timestamp: float
+    payload: Union[Dict[str, Any], str]
+
+
+@dataclass
+class PluginPnL:
+    """Per-plugin replay performance"""
+    plugin_id: str
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0
+    open_positions: int = 0
+    floating_pnl: float = 0.0
+
+    @property
+    def net_pnl(self) -> float:
+        return round(self.gross_profit + self.gross_loss, 2)
+
+    @property
+    def win_rate(self) -> float:
+        return (self.wins / self.trades * 100) if self.trades > 0 else 0.0
+
+    def add_deal(self, deal: SimulatedDeal):
+        self.trades += 1
+        if deal.profit >= 0:
+            self.wins += 1
+            self.gross_profit += deal.profit
+        else:
+            self.losses += 1
+            self.gross_loss += deal.profit
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'plugin_id': self.plugin_id,
+            'trades': self.trades,
+            'wins': self.wins,
+            'losses': self.losses,
+            'win_rate': round(self.win_rate, 2),
+            'gross_profit': round(self.gross_profit, 2),
+            'gross_loss': round(self.gross_loss, 2),
+            'net_pnl': self.net_pnl,
+            'open_positions': self.open_positions,
+            'floating_pnl': round(self.floating_pnl, 2)
+        }
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay run"""
+    alerts_processed: int = 0
+    alerts_failed: int = 0
+    ticks_processed: int = 0
+    simulated_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    starting_balance: float = 0.0
+    final_balance: float = 0.0
+    per_plugin: Dict[str, PluginPnL] = field(default_factory=dict)
+    deals: List[SimulatedDeal] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        """Simulated time / wall time"""
+        return self.simulated_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'alerts_processed': self.alerts_processed,
+            'alerts_failed': self.alerts_failed,
+            'ticks_processed': self.ticks_processed,
+            'simulated_seconds': round(self.simulated_seconds, 3),
+            'wall_seconds': round(self.wall_seconds, 3),
+            'speedup': round(self.speedup, 1),
+            'starting_balance': round(self.starting_balance, 2),
+            'final_balance': round(self.final_balance, 2),
+            'per_plugin': {pid: p.to_dict() for pid, p in self.per_plugin.items()},
+            'errors': self.errors[-20:]
+        }
+
+    def format_report(self) -> str:
+        lines = [
+            "=== REPLAY REPORT ===",
+            f"Alerts: {self.alerts_processed} ({self.alerts_failed} failed) | Ticks: {self.ticks_processed}",
+            f"Simulated: {self.simulated_seconds / 86400:.2f} days in {self.wall_seconds:.2f}s "
+            f"({self.speedup:,.0f}x real time)",
+            f"Balance: ${self.starting_balance:,.2f} -> ${self.final_balance:,.2f}",
+            "",
+            "=== PER-PLUGIN PnL ===",
+        ]
+        for pid in sorted(self.per_plugin):
+            p = self.per_plugin[pid]
+            lines.append(
+                f"{pid}: trades={p.trades} win={p.win_rate:.1f}% net=${p.net_pnl:,.2f} "
+                f"open={p.open_positions} floating=${p.floating_pnl:,.2f}"
+            )
+        return "\n".join(lines)
+
+
+# ==================== Data Loading ====================
+
+def load_ticks(path: str, symbol: Optional[str] = None) -> Iterator[Tick]:
+    """
+    Stream ticks from a CSV or Parquet file in file order (expected time-sorted).
+
+    Bar rows are expanded into four ticks (open, low/high, high/low, close)
+    ordered so the bar's extreme closest to the open is visited first.
+
+    Args:
+        path: .csv or .parquet file
+        symbol: Symbol to use when the file has no symbol column
+    """
+    for row in _iter_rows(path):
+        row_symbol = (row.get('symbol') or symbol or '').upper()
+        ts = to_epoch(row.get('timestamp') or row.get('time'))
+        if 'bid' in row and row.get('bid') not in (None, ''):
+            bid = float(row['bid'])
+            ask = float(row['ask']) if row.get('ask') not in (None, '') else bid
+            yield Tick(ts, row_symbol, bid, ask)
+            continue
+
+        spread = float(row.get('spread') or 0.0)
+        o, h, l, c = (float(row[k]) for k in ('open', 'high', 'low', 'close'))
+        path_prices = (o, l, h, c) if c >= o else (o, h, l, c)
+        for price in path_prices:
+            yield Tick(ts, row_symbol, price, price + spread)
+
+
+def _iter_rows(path: str) -> Iterator[Dict[str, Any]]:
+    if path.lower().endswith(('.parquet', '.pq')):
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("Parquet replay requires pandas with a parquet engine (pyarrow)") from e
+        frame = pd.read_parquet(path)
+        frame.columns = [str(c).lower() for c in frame.columns]
+        for record in frame.to_dict('records'):
+            yield record
+        return
+
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [name.strip().lower() for name in (reader.fieldnames or [])]
+        for row in reader:
+            yield row
+
+
+def load_alerts(path: str) -> List[ReplayAlert]:
+    """Load recorded webhook payloads from a JSON Lines file, sorted by time"""
+    alerts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"[Replay] Skipping invalid JSON on line {line_no}: {e}")
+                continue
+            alerts.append(_to_replay_alert(record))
+    alerts.sort(key=lambda a: a.timestamp)
+    return alerts
+
+
+def _to_replay_alert(record: Dict[str, Any]) -> ReplayAlert:
+    if 'payload' in record:
+        ts = record.get('timestamp') or record.get('received_at')
+        return ReplayAlert(to_epoch(ts), record['payload'])
+    ts = record.get('timestamp') or record.get('time')
+    return ReplayAlert(to_epoch(ts), record)
+
+
+# ==================== Replay Engine ====================
+
+class ReplayEngine:
+    """
+    Drives a target through a merged, time-ordered stream of ticks and alerts.
+
+    The target may be a ``TradingEngine`` (payloads go to ``process_alert``) or
+    a ``PluginRouter`` (payloads are parsed with ``SignalParser`` and sent to
+    ``route_signal``). The target must have been built with the replay's
+    ``SimulatedBroker`` as its MT5 client.
+    """
+
+    def __init__(self, target, broker: SimulatedBroker, clock: Optional[VirtualClock] = None):
+        self.target = target
+        self.broker = broker
+        self.clock = clock or broker.clock
+        self._use_router = not hasattr(target, 'process_alert') and hasattr(target, 'route_signal')
+
+    async def run(self, alerts: Iterable[ReplayAlert], ticks: Iterable[Tick],
+                  close_at_end: bool = False) -> ReplayResult:
+        """
+        Replay all events in timestamp order.
+
+        Ticks sharing a timestamp with an alert are applied first so the
+        alert sees the price that was current when it fired.
+
+        Args:
+            alerts: Recorded alerts (see ``load_alerts``)
+            ticks: Tick stream (see ``load_ticks``) - consumed lazily
+            close_at_end: Close all open positions at the last quote when done
+        """
+        result = ReplayResult(starting_balance=self.broker.balance)
+        deals_before = len(self.broker.get_deals())
+        wall_start = time.perf_counter()
+        first_ts = None
+
+        # (timestamp, kind, seq, event) - kind 0 = tick, 1 = alert
+        tick_events = ((t.timestamp, 0, i, t) for i, t in enumerate(ticks))
+        alert_events = ((a.timestamp, 1, i, a) for i, a in enumerate(alerts))
+
+        for ts, kind, _, event in heapq.merge(tick_events, alert_events, key=lambda e: e[:3]):
+            if first_ts is None:
+                first_ts = ts
+                self.clock.set(ts)
+            self.clock.advance_to(ts)
+
+            if kind == 0:
+                self.broker.on_tick(event)
+                result.ticks_processed += 1
+            else:
+                await self._dispatch(event, result)
+
+        if close_at_end:
+            for position in self.broker.get_open_positions():
+                self.broker.close_position(position.ticket)
+
+        result.wall_seconds = time.perf_counter() - wall_start
+        result.simulated_seconds = (self.clock.time() - first_ts) if first_ts is not None else 0.0
+        result.final_balance = self.broker.balance
+        result.deals = self.broker.get_deals()[deals_before:]
+        result.per_plugin = self._summarize(result.deals)
+        logger.info(
+            f"[Replay] Done: {result.alerts_processed} alerts, {result.ticks_processed} ticks, "
+            f"{len(result.deals)} deals in {result.wall_seconds:.2f}s"
+        )
+        return result
+
+    async def _dispatch(self, alert: ReplayAlert, result: ReplayResult):
+        payload = alert.payload
+        if isinstance(payload, dict):
+            payload = dict(payload)
+
+        signal = self._parse(payload)
+        # Orders without a plugin comment are attributed to the routed plugin
+        self.broker.default_owner = (signal or {}).get('plugin_hint') or 'core'
+        try:
+            if self._use_router:
+                if not signal:
+                    outcome = {'status': 'error', 'message': 'Invalid alert format'}
+                else:
+                    outcome = await self.target.route_signal(signal)
+            else:
+                outcome = await self.target.process_alert(payload)
+            result.alerts_processed += 1
+            if outcome is False or (isinstance(outcome, dict) and outcome.get('status') == 'error'):
+                result.alerts_failed += 1
+        except Exception as e:
+            result.alerts_processed += 1
+            result.alerts_failed += 1
+            result.errors.append(f"{alert.timestamp}: {e}")
+            logger.error(f"[Replay] Alert at {alert.timestamp} failed: {e}")
+        finally:
+            self.broker.default_owner = 'core'
+
+    @staticmethod
+    def _parse(payload) -> Optional[Dict[str, Any]]:
+        """Parse a payload with SignalParser (None for legacy/unparseable alerts)"""
+        if not isinstance(payload, dict):
+            return None
+        from src.utils.signal_parser import SignalParser
+
+        signal = SignalParser.parse(payload)
+        if signal and SignalParser.validate(signal):
+            return signal
+        return None
+
+    def _summarize(self, deals: List[SimulatedDeal]) -> Dict[str, PluginPnL]:
+        summary: Dict[str, PluginPnL] = {}
+        for deal in deals:
+            summary.setdefault(deal.owner, PluginPnL(deal.owner)).add_deal(deal)
+        for position in self.broker.get_open_positions():
+            pnl = summary.setdefault(position.owner, PluginPnL(position.owner))
+            pnl.open_positions += 1
+            pnl.floating_pnl += self.broker.get_position(position.ticket)['profit']
+        return summary
@@ -0,0 +1,404 @@
+"""
+Simulated Broker
+MT5Client-compatible broker that fills orders against a replayed tick stream
+
+Drop-in replacement for ``MT5Client`` during offline replay: market orders
+fill at the current bid/ask, SL/TP are triggered by incoming ticks, and every
+closed deal is attributed to the plugin that opened it.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional, List, Iterable
+from dataclasses import dataclass, field
+import itertools
+import logging
+
+from src.simulation.virtual_clock import VirtualClock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLUGIN_IDS = [
+    'v3_combined',
+    'v6_price_action_1m',
+    'v6_price_action_5m',
+    'v6_price_action_15m',
+    'v6_price_action_1h',
+]
+
+_DEFAULT_SYMBOL_SPEC = {'pip_size': 0.0001, 'pip_value_per_std_lot': 10.0, 'contract_size': 100000}
+
+
+@dataclass
+class Tick:
+    """Single bid/ask quote"""
+    timestamp: float
+    symbol: str
+    bid: float
+    ask: float
+
+    @property
+    def mid(self) -> float:
+        return (self.bid + self.ask) / 2
+
+
+@dataclass
+class SimulatedPosition:
+    """Open position held by the simulated broker"""
+    ticket: int
+    symbol: str
+    direction: str  # 'BUY' or 'SELL'
+    volume: float
+    price_open: float
+    sl: float
+    tp: float
+    comment: str
+    owner: str
+    open_time: float
+
+    @property
+    def type(self) -> int:
+        """MT5 position type (0 = buy, 1 = sell)"""
+        return 0 if self.direction == 'BUY' else 1
+
+    def to_dict(self, profit: float = 0.0) -> Dict[str, Any]:
+        """Same shape as ``MT5Client.get_positions`` entries"""
+        return {
+            'ticket': self.ticket,
+            'volume': self.volume,
+            'price_open': self.price_open,
+            'sl': self.sl,
+            'tp': self.tp,
+            'profit': profit,
+            'comment': self.comment,
+            'symbol': self.symbol,
+            'type': self.type
+        }
+
+
+@dataclass
+class SimulatedDeal:
+    """Closed (or partially closed) position record"""
+    ticket: int
+    symbol: str
+    direction: str
+    volume: float
+    price_open: float
+    price_close: float
+    profit: float
+    reason: str
+    owner: str
+    open_time: float
+    close_time: float
+    comment: str = ''
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class SimulatedBroker:
+    """
+    Offline broker exposing the ``MT5Client`` methods used by the engine,
+    services and managers.
+
+    Usage:
+        clock = VirtualClock()
+        broker = SimulatedBroker(config, clock, starting_balance=10000.0)
+        broker.on_tick(Tick(ts, 'XAUUSD', 2650.1, 2650.3))
+        ticket = broker.place_order('XAUUSD', 'BUY', 0.1, 0.0, sl=2645.0, tp=2660.0)
+    """
+
+    def __init__(self, config=None, clock: Optional[VirtualClock] = None,
+                 starting_balance: float = 10000.0,
+                 plugin_ids: Optional[Iterable[str]] = None):
+        self.config = config if config is not None else {}
+        self.clock = clock or VirtualClock()
+        self.initialized = True
+        self.telegram_bot = None
+
+        self.starting_balance = starting_balance
+        self.balance = starting_balance
+
+        self._ticks: Dict[str, Tick] = {}
+        self._positions: Dict[int, SimulatedPosition] = {}
+        self._deals: List[SimulatedDeal] = []
+        self._ticket_seq = itertools.count(100001)
+
+        # Longest ids first so 'v6_price_action_15m' wins over 'v6_price_action_1'
+        self._plugin_ids = sorted(plugin_ids or DEFAULT_PLUGIN_IDS, key=len, reverse=True)
+        self.default_owner = 'core'
+
+        # Broker symbol -> TradingView symbol (positions are keyed by TradingView names)
+        mapping = self.config.get("symbol_mapping", {}) if self.config else {}
+        self._reverse_mapping = {v: k for k, v in mapping.items()}
+
+    # ==================== Market Data ====================
+
+    def on_tick(self, tick: Tick) -> List[SimulatedDeal]:
+        """
+        Apply a market tick: update the quote and trigger SL/TP.
+
+        Returns:
+            Deals closed by this tick
+        """
+        self._ticks[tick.symbol] = tick
+        closed = []
+        for position in [p for p in self._positions.values() if p.symbol == tick.symbol]:
+            hit = self._check_stops(position, tick)
+            if hit:
+                price, reason = hit
+                closed.append(self._close(position, position.volume, price, reason))
+        return closed
+
+    def _check_stops(self, position: SimulatedPosition, tick: Tick):
+        """Return (fill_price, reason) if SL or TP is touched by the tick"""
+        if position.direction == 'BUY':
+            exit_price = tick.bid
+            if position.sl and exit_price <= position.sl:
+                return position.sl, 'SL_HIT'
+            if position.tp and exit_price >= position.tp:
+                return position.tp, 'TP_HIT'
+        else:
+            exit_price = tick.ask
+            if position.sl and exit_price >= position.sl:
+                return position.sl, 'SL_HIT'
+            if position.tp and exit_price <= position.tp:
+                return position.tp, 'TP_HIT'
+        return None
+
+    def get_tick(self, symbol: str) -> Optional[Tick]:
+        """Latest tick for a symbol"""
+        return self._ticks.get(self._symbol(symbol))
+
+    def get_current_price(self, symbol: str) -> Optional[float]:
+        tick = self.get_tick(symbol)
+        return tick.mid if tick else None
+
+    def get_symbol_tick(self, symbol: str) -> Optional[Dict[str, float]]:
+        tick = self.get_tick(symbol)
+        if not tick:
+            return None
+        return {'bid': tick.bid, 'ask': tick.ask, 'time': tick.timestamp}
+
+    def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
+        spec = self._spec(symbol)
+        tick = self.get_tick(symbol)
+        return {
+            'symbol': self._symbol(symbol),
+            'point': spec['pip_size'] / 10,
+            'pip_size': spec['pip_size'],
+            'contract_size': spec['contract_size'],
+            'spread': (tick.ask - tick.bid) if tick else 0.0,
+            'bid': tick.bid if tick else 0.0,
+            'ask': tick.ask if tick else 0.0,
+        }
+
+    # ==================== Connection ====================
+
+    def initialize(self) -> bool:
+        self.initialized = True
+        return True
+
+    def is_connected(self) -> bool:
+        return self.initialized
+
+    async def check_connection_health(self) -> bool:
+        return True
+
+    def shutdown(self):
+        self.initialized = False
+
+    # ==================== Orders ====================
+
+    def validate_order_parameters(self, symbol, order_type, price, sl_price, tp_price=None) -> tuple:
+        return True, "Validation passed (replay)"
+
+    def place_order(self, symbol: str, order_type: str, lot_size: float,
+                    price: float = 0.0, sl: float = 0.0, tp: float = None,
+                    comment: str = "") -> Optional[int]:
+        """Fill a market order at the current quote"""
+        symbol = self._symbol(symbol)
+        tick = self._ticks.get(symbol)
+        if tick is None:
+            logger.warning(f"[SimBroker] No quote for {symbol} - order rejected")
+            return None
+
+        direction = 'BUY' if str(order_type).upper() in ('BUY', '0') else 'SELL'
+        fill_price = tick.ask if direction == 'BUY' else tick.bid
+        ticket = next(self._ticket_seq)
+
+        self._positions[ticket] = SimulatedPosition(
+            ticket=ticket,
+            symbol=symbol,
+            direction=direction,
+            volume=float(lot_size),
+            price_open=fill_price,
+            sl=float(sl or 0.0),
+            tp=float(tp or 0.0),
+            comment=comment or '',
+            owner=self.resolve_owner(comment),
+            open_time=self.clock.time()
+        )
+        logger.debug(f"[SimBroker] FILL #{ticket} {direction} {lot_size} {symbol} @ {fill_price}")
+        return ticket
+
+    def close_position(self, position_id: int, percentage: float = 100) -> bool:
+        position = self._positions.get(position_id)
+        if position is None:
+            return True  # Already closed - same semantics as MT5Client
+        volume = position.volume if percentage >= 100 else round(position.volume * percentage / 100, 2)
+        self._close(position, volume, self._exit_price(position), 'MANUAL')
+        return True
+
+    def close_position_partial(self, position_id: int, volume: float) -> bool:
+        position = self._positions.get(position_id)
+        if position is None:
+            return False
+        self._close(position, min(volume, position.volume), self._exit_price(position), 'PARTIAL')
+        return True
+
+    def close_order(self, position_id: int, *args, **kwargs) -> bool:
+        return self.close_position(position_id)
+
+    def modify_position(self, ticket: int, sl: float = None, tp: float = None) -> bool:
+        position = self._positions.get(ticket)
+        if position is None:
+            return False
+        if sl is not None:
+            position.sl = float(sl)
+        if tp is not None:
+            position.tp = float(tp)
+        return True
+
+    def _exit_price(self, position: SimulatedPosition) -> float:
+        tick = self._ticks.get(position.symbol)
+        if tick is None:
+            return position.price_open
+        return tick.bid if position.direction == 'BUY' else tick.ask
+
+    def _close(self, position: SimulatedPosition, volume: float, price: float,
+               reason: str) -> SimulatedDeal:
+        profit = self.calculate_profit(position.symbol, position.direction,
+                                       volume, position.price_open, price)
+        self.balance += profit
+        deal = SimulatedDeal(
+            ticket=position.ticket,
+            symbol=position.symbol,
+            direction=position.direction,
+            volume=volume,
+            price_open=position.price_open,
+            price_close=price,
+            profit=profit,
+            reason=reason,
+            owner=position.owner,
+            open_time=position.open_time,
+            close_time=self.clock.time(),
+            comment=position.comment
+        )
+        self._deals.append(deal)
+
+        remaining = round(position.volume - volume, 2)
+        if remaining <= 0:
+            del self._positions[position.ticket]
+        else:
+            position.volume = remaining
+        return deal
+
+    # ==================== Positions & Account ====================
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        mapped = self._symbol(symbol) if symbol else None
+        return [
+            p.to_dict(self._floating(p))
+            for p in self._positions.values()
+            if mapped is None or p.symbol == mapped
+        ]
+
+    def get_position(self, ticket: int) -> Optional[Dict[str, Any]]:
+        position = self._positions.get(ticket)
+        return position.to_dict(self._floating(position)) if position else None
+
+    def get_open_positions(self) -> List[SimulatedPosition]:
+        return list(self._positions.values())
+
+    def get_closed_trade_profit(self, ticket_id: int) -> Optional[float]:
+        deals = [d.profit for d in self._deals if d.ticket == ticket_id]
+        return sum(deals) if deals else None
+
+    def get_deals(self) -> List[SimulatedDeal]:
+        return list(self._deals)
+
+    def get_account_balance(self) -> float:
+        return self.balance
+
+    def get_account_equity(self) -> float:
+        return self.balance + sum(self._floating(p) for p in self._positions.values())
+
+    def get_account_info_detailed(self) -> Dict[str, float]:
+        equity = self.get_account_equity()
+        margin = sum(p.volume * 1000 for p in self._positions.values())
+        return {
+            "balance": self.balance,
+            "equity": equity,
+            "free_margin": equity - margin,
+            "margin": margin,
+            "margin_level": (equity / margin * 100) if margin else 0.0
+        }
+
+    def get_free_margin(self) -> float:
+        return self.get_account_info_detailed()["free_margin"]
+
+    def get_account_free_margin(self) -> float:
+        return self.get_free_margin()
+
+    def get_margin_level(self) -> float:
+        return self.get_account_info_detailed()["margin_level"]
+
+    def get_account_margin_level(self) -> float:
+        return self.get_margin_level()
+
+    def is_margin_safe(self, min_margin_level: float = 100.0) -> bool:
+        info = self.get_account_info_detailed()
+        return info["margin"] == 0 or info["margin_level"] >= min_margin_level
+
+    def get_required_margin_for_order(self, symbol: str, lot_size: float) -> float:
+        return lot_size * 1000
+
+    # ==================== Helpers ====================
+
+    def calculate_profit(self, symbol: str, direction: str, volume: float,
+                         price_open: float, price_close: float) -> float:
+        """PnL in account currency using the configured pip value per standard lot"""
+        spec = self._spec(symbol)
+        sign = 1.0 if direction == 'BUY' else -1.0
+        pips = (price_close - price_open) * sign / spec['pip_size']
+        return round(pips * spec['pip_value_per_std_lot'] * volume, 2)
+
+    def _floating(self, position: SimulatedPosition) -> float:
+        return self.calculate_profit(position.symbol, position.direction, position.volume,
+                                     position.price_open, self._exit_price(position))
+
+    def resolve_owner(self, comment: str) -> str:
+        """
+        Attribute an order to a plugin from its comment.
+
+        Handles ServiceAPI ("v3_combined|...") and OrderExecutionService
+        ("V3_A_v3_combined_LOGIC1") formats, falling back to ``default_owner``.
+        """
+        if comment:
+            lowered = comment.lower()
+            for plugin_id in self._plugin_ids:
+                if plugin_id in lowered:
+                    return plugin_id
+            if '|' in comment:
+                return comment.split('|', 1)[0]
+        return self.default_owner
+
+    def _symbol(self, symbol: str) -> str:
+        return self._reverse_mapping.get(symbol, symbol)
+
+    def _spec(self, symbol: str) -> Dict[str, float]:
+        symbol_config = self.config.get("symbol_config", {}) if self.config else {}
+        spec = dict(_DEFAULT_SYMBOL_SPEC)
+        spec.update(symbol_config.get(self._symbol(symbol), {}))
+        if 'pip_value_per_std_lot' not in symbol_config.get(self._symbol(symbol), {}):
+            spec['pip_value_per_std_lot'] = spec.get('pip_value', spec['pip_value_per_std_lot'])
+        return spec
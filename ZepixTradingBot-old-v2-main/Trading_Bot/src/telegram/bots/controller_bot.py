@@ -21,10 +21,12 @@ from .base_bot import BaseIndependentBot
 from src.telegram.core.callback_router import CallbackRouter
 from src.telegram.headers.sticky_header_builder import StickyHeaderBuilder
 from src.telegram.headers.header_refresh_manager import HeaderRefreshManager
+from src.telegram.headers.view_state_store import compose_message
 from src.telegram.core.conversation_state_manager import state_manager
 from src.telegram.interceptors.command_interceptor import CommandInterceptor
 from src.telegram.plugins.plugin_context_manager import PluginContextManager
 from src.telegram.core.command_registry import CommandRegistry
+from src.telegram.core.lazy_handlers import LazyHandlerRegistry
 from src.telegram.core.callback_safety_manager import CallbackSafetyManager
 from src.telegram.utils.message_utils import safe_edit_message
 
@@ -47,123 +49,9 @@ from src.telegram.menus.settings_menu import SettingsMenu
 from src.telegram.flows.trading_flow import TradingFlow
 from src.telegram.flows.risk_flow import RiskFlow
 
-# --- IMPORT HANDLERS (V5 STRUCTURE) ---
-# System
-from src.telegram.commands.system.start_handler import StartHandler
-from src.telegram.commands.system.status_handler import StatusHandler
-from src.telegram.commands.system.help_handler import HelpHandler
-from src.telegram.commands.system.pause_handler import PauseHandler
-from src.telegram.commands.system.resume_handler import ResumeHandler
-from src.telegram.commands.system.restart_handler import RestartHandler
-from src.telegram.commands.system.shutdown_handler import ShutdownHandler
-from src.telegram.commands.system.config_handler import ConfigHandler
-from src.telegram.commands.system.health_handler import HealthHandler
-from src.telegram.commands.system.version_handler import VersionHandler
-
-# Trading
-from src.telegram.commands.trading.buy_handler import BuyHandler
-from src.telegram.commands.trading.sell_handler import SellHandler
-from src.telegram.commands.trading.close_handler import CloseHandler
-from src.telegram.commands.trading.closeall_handler import CloseallHandler
-from src.telegram.commands.trading.orders_handler import OrdersHandler
-from src.telegram.commands.trading.positions_handler import PositionsHandler
-from src.telegram.commands.trading.history_handler import HistoryHandler
-from src.telegram.commands.trading.pnl_handler import PnLHandler
-from src.telegram.commands.trading.balance_handler import BalanceHandler
-from src.telegram.commands.trading.equity_handler import EquityHandler
-from src.telegram.commands.trading.margin_handler import MarginHandler
-from src.telegram.commands.trading.symbols_handler import SymbolsHandler
-from src.telegram.commands.trading.trades_handler import TradesHandler
-from src.telegram.commands.trading.price_handler import PriceHandler
-from src.telegram.commands.trading.spread_handler import SpreadHandler
-from src.telegram.commands.trading.signals_handler import SignalsHandler
-from src.telegram.commands.trading.filters_handler import FiltersHandler
-from src.telegram.commands.trading.partial_handler import PartialHandler
-
-# Risk
-from src.telegram.commands.risk.set_sl_handler import SetSLHandler
-from src.telegram.commands.risk.set_tp_handler import SetTPHandler
-from src.telegram.commands.risk.setlot_handler import SetLotHandler
-from src.telegram.commands.risk.dailylimit_handler import DailylimitHandler
-from src.telegram.commands.risk.maxloss_handler import MaxlossHandler
-from src.telegram.commands.risk.maxprofit_handler import MaxprofitHandler
-from src.telegram.commands.risk.risktier_handler import RisktierHandler
-from src.telegram.commands.risk.slsystem_handler import SlsystemHandler
-from src.telegram.commands.risk.trailsl_handler import TrailslHandler
-from src.telegram.commands.risk.breakeven_handler import BreakevenHandler
-from src.telegram.commands.risk.protection_handler import ProtectionHandler
-from src.telegram.commands.risk.multiplier_handler import MultiplierHandler
-from src.telegram.commands.risk.maxtrades_handler import MaxtradesHandler
-from src.telegram.commands.risk.drawdown_handler import DrawdownHandler
-from src.telegram.commands.risk.risk_handler import RiskHandler
-
-# V3 Strategy
-from src.telegram.commands.v3.logic1_handler import Logic1Handler
-from src.telegram.commands.v3.logic2_handler import Logic2Handler
-from src.telegram.commands.v3.logic3_handler import Logic3Handler
-from src.telegram.commands.v3.logic1_on_handler import Logic1OnHandler
-from src.telegram.commands.v3.logic1_off_handler import Logic1OffHandler
-from src.telegram.commands.v3.logic2_on_handler import Logic2OnHandler
-from src.telegram.commands.v3.logic2_off_handler import Logic2OffHandler
-from src.telegram.commands.v3.logic3_on_handler import Logic3OnHandler
-from src.telegram.commands.v3.logic3_off_handler import Logic3OffHandler
-from src.telegram.commands.v3.logic1_config_handler import Logic1ConfigHandler
-from src.telegram.commands.v3.logic2_config_handler import Logic2ConfigHandler
-from src.telegram.commands.v3.logic3_config_handler import Logic3ConfigHandler
-
-# V6 Timeframes
-from src.telegram.commands.v6.v6_status_handler import V6StatusHandler
-from src.telegram.commands.v6.v6_control_handler import V6ControlHandler
-from src.telegram.commands.v6.v6_config_handler import V6ConfigHandler
-from src.telegram.commands.v6.v6_menu_handler import V6MenuHandler
-# (Shortening imports for brevity, assume script generated correct files for tf1m...tf1d)
-from src.telegram.commands.v6.tf1m_handler import Tf1mHandler
-from src.telegram.commands.v6.tf5m_handler import Tf5mHandler
-from src.telegram.commands.v6.tf15m_handler import Tf15mHandler
-from src.telegram.commands.v6.tf30m_handler import Tf30mHandler
-from src.telegram.commands.v6.tf1h_handler import Tf1hHandler
-from src.telegram.commands.v6.tf4h_handler import Tf4hHandler
-from src.telegram.commands.v6.tf1d_handler import Tf1dHandler
-from src.telegram.commands.v6.v6_performance_handler import V6PerformanceHandler
-
-# Analytics
-from src.telegram.commands.analytics.daily_handler import DailyHandler
-from src.telegram.commands.analytics.weekly_handler import WeeklyHandler
-from src.telegram.commands.analytics.monthly_handler import MonthlyHandler
-from src.telegram.commands.analytics.compare_handler import CompareHandler
-from src.telegram.commands.analytics.pairreport_handler import PairreportHandler
-from src.telegram.commands.analytics.strategyreport_handler import StrategyreportHandler
-from src.telegram.commands.analytics.tpreport_handler import TpreportHandler
-from src.telegram.commands.analytics.stats_handler import StatsHandler
-from src.telegram.commands.analytics.winrate_handler import WinrateHandler
-from src.telegram.commands.analytics.drawdown_handler import DrawdownHandler as AnalyticsDrawdownHandler
-from src.telegram.commands.analytics.profit_stats_handler import ProfitStatsHandler
-from src.telegram.commands.analytics.performance_handler import PerformanceHandler
-from src.telegram.commands.analytics.dashboard_handler import DashboardHandler
-from src.telegram.commands.analytics.export_handler import ExportHandler
-from src.telegram.commands.analytics.trends_handler import TrendsHandler
-
-# Re-Entry
-from src.telegram.commands.reentry.reentry_handler import ReentryHandler
-from src.telegram.commands.reentry.slhunt_handler import SlhuntHandler
-from src.telegram.commands.reentry.tpcontinue_handler import TpcontinueHandler
-from src.telegram.commands.reentry.recovery_handler import RecoveryHandler
-from src.telegram.commands.reentry.cooldown_handler import CooldownHandler
-from src.telegram.commands.reentry.chains_handler import ChainsHandler
-from src.telegram.commands.reentry.autonomous_handler import AutonomousHandler
-from src.telegram.commands.reentry.chainlimit_handler import ChainlimitHandler
-from src.telegram.commands.reentry.reentry_config_handler import ReentryConfigHandler
-from src.telegram.commands.reentry.autonomous_control_handler import AutonomousControlHandler
-from src.telegram.commands.reentry.sl_hunt_stats_handler import SlHuntStatsHandler
-
-# Profit
-from src.telegram.commands.profit.profit_handler import ProfitHandler
-from src.telegram.commands.profit.booking_handler import BookingHandler
-from src.telegram.commands.profit.levels_handler import LevelsHandler
-from src.telegram.commands.profit.orderb_handler import OrderbHandler
-from src.telegram.commands.profit.dualorder_handler import DualorderHandler
-from src.telegram.commands.profit.dual_status_handler import DualStatusHandler
-from src.telegram.commands.profit.profit_config_handler import ProfitConfigHandler
+# --- HANDLERS (V5 STRUCTURE) ---
+# Command handler modules are listed in src/telegram/core/lazy_handlers.py
+# (HANDLER_MANIFEST) and imported on first use
 
 logger = logging.getLogger(__name__)
 
@@ -206,74 +94,9 @@ class ControllerBot(BaseIndependentBot):
         self.v6_menu_builder = None
         
     def _init_all_handlers(self):
-        # System
-        self.start_handler = StartHandler(self)
-        self.status_handler = StatusHandler(self)
-        self.help_handler = HelpHandler(self)
-        self.pause_handler = PauseHandler(self)
-        self.resume_handler = ResumeHandler(self)
-        self.restart_handler = RestartHandler(self)
-        self.shutdown_handler = ShutdownHandler(self)
-        self.config_handler = ConfigHandler(self)
-        self.health_handler = HealthHandler(self)
-        self.version_handler = VersionHandler(self)
-
-        # Trading
-        self.buy_handler = BuyHandler(self)
-        self.sell_handler = SellHandler(self)
-        self.close_handler = CloseHandler(self)
-        self.closeall_handler = CloseallHandler(self)
-        self.orders_handler = OrdersHandler(self)
-        self.positions_handler = PositionsHandler(self)
-        self.history_handler = HistoryHandler(self)
-        self.pnl_handler = PnLHandler(self)
-        self.balance_handler = BalanceHandler(self)
-        self.equity_handler = EquityHandler(self)
-        self.margin_handler = MarginHandler(self)
-        self.symbols_handler = SymbolsHandler(self)
-        self.trades_handler = TradesHandler(self)
-        self.price_handler = PriceHandler(self)
-        self.spread_handler = SpreadHandler(self)
-        self.signals_handler = SignalsHandler(self)
-        self.filters_handler = FiltersHandler(self)
-        self.partial_handler = PartialHandler(self)
-
-        # Risk
-        self.setsl_handler = SetSLHandler(self)
-        self.settp_handler = SetTPHandler(self)
-        self.setlot_handler = SetLotHandler(self)
-        self.dailylimit_handler = DailylimitHandler(self)
-        self.maxloss_handler = MaxlossHandler(self)
-        self.maxprofit_handler = MaxprofitHandler(self)
-        self.risktier_handler = RisktierHandler(self)
-        self.slsystem_handler = SlsystemHandler(self)
-        self.trailsl_handler = TrailslHandler(self)
-        self.breakeven_handler = BreakevenHandler(self)
-        self.protection_handler = ProtectionHandler(self)
-        self.multiplier_handler = MultiplierHandler(self)
-        self.maxtrades_handler = MaxtradesHandler(self)
-        self.drawdown_handler = DrawdownHandler(self)
-        self.risk_handler = RiskHandler(self)
-
-        # V3
-        self.logic1_handler = Logic1Handler(self)
-        self.logic2_handler = Logic2Handler(self)
-        # ... (Instantiate others as needed, keeping it concise for V3 basic)
-        
-        # V6
-        self.v6_status_handler = V6StatusHandler(self)
-        self.tf1m_handler = Tf1mHandler(self)
-        # ... 
-
-        # Analytics
-        self.daily_handler = DailyHandler(self)
-        self.dashboard_handler = DashboardHandler(self)
-        
-        # Re-Entry
-        self.reentry_handler = ReentryHandler(self)
-        
-        # Profit
-        self.profit_handler = ProfitHandler(self)
+        # Command handlers: stand-ins now, module import on first use
+        self.lazy_handlers = LazyHandlerRegistry(self)
+        self.lazy_handlers.install()
 
         # Flows
         self.trading_flow = TradingFlow(self)
@@ -325,6 +148,9 @@ class ControllerBot(BaseIndependentBot):
         self.app.add_handler(CommandHandler("status", self.status_handler.handle))
         self.app.add_handler(CommandHandler("config", self.config_handler.handle))
         self.app.add_handler(CommandHandler("version", self.version_handler.handle))
+        self.app.add_handler(CommandHandler("traces", self.traces_handler.handle))
+        self.app.add_handler(CommandHandler("profile", self.profile_handler.handle))
+        self.app.add_handler(CommandHandler("blocking", self.blocking_handler.handle))
 
         # Trading
         self.app.add_handler(CommandHandler("buy", self.buy_handler.handle))
@@ -360,6 +186,14 @@ class ControllerBot(BaseIndependentBot):
         else:
             logger.info("✅ Core handlers verification passed")
 
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """Lazy handler import savings and callback dispatch cost"""
+        return {
+            "handlers": self.lazy_handlers.get_stats(),
+            "callback_router": self.callback_router.dispatch_table.get_stats(),
+            "header_refresh": self.header_refresh_manager.get_stats(),
+        }
+
     async def handle_callback(self, update, context):
         await self.safety_manager.wrap_callback(self._inner_handle_callback, update, context)
 
@@ -379,11 +213,24 @@ class ControllerBot(BaseIndependentBot):
         await self.callback_router.handle_callback(update, context)
 
     # ... Utils (edit_message_with_header, etc from original) ...
-    async def edit_message_with_header(self, update: Update, text: str, reply_markup: InlineKeyboardMarkup):
-        query = update.callback_query
-        header = self.sticky_header.build_header(
+    def _build_menu_header(self) -> str:
+        return self.sticky_header.build_header(
             bot_status="🟢 Active" if not self.is_paused else "🔴 Paused",
             account_info="Risk: --%"
         )
-        full_text = f"{header}\\n{text}"
+
+    async def edit_message_with_header(self, update: Update, text: str, reply_markup: InlineKeyboardMarkup):
+        query = update.callback_query
+        header = self._build_menu_header()
+        full_text = compose_message(header, text)
         await safe_edit_message(update, full_text, reply_markup, parse_mode="HTML")
+
+        # Keep the view so the header refresh loop can re-render it
+        if query and query.message and self.header_refresh_manager:
+            self.header_refresh_manager.track_view(
+                update.effective_chat.id, query.message.message_id, text,
+                reply_markup=reply_markup,
+                header_text=header,
+                header=self._build_menu_header,
+                header_key="controller",
+            )
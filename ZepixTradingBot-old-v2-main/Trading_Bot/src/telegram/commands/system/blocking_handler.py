@@ -0,0 +1,36 @@
+"""
+BlockingHandler Handler
+Implements /blocking command following V5 Architecture.
+
+Shows the call sites the loop watchdog caught blocking the event loop.
+"""
+from telegram import Update
+from telegram.ext import ContextTypes
+from ..base_command_handler import BaseCommandHandler
+from src.monitoring.loop_watchdog import get_loop_watchdog
+
+class BlockingHandler(BaseCommandHandler):
+    """Handle /blocking command"""
+    
+    def get_command_name(self) -> str:
+        return "/blocking"
+    
+    def requires_plugin_selection(self) -> bool:
+        return False
+    
+    async def execute(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        plugin_context: str = None
+    ):
+        """Execute blocking logic (/blocking [reset])"""
+        args = list(getattr(context, "args", None) or []) if context is not None else []
+        watchdog = get_loop_watchdog()
+
+        if args and args[0].lower() == "reset":
+            watchdog.reset()
+            await update.message.reply_text("🧹 Blocking call statistics cleared.")
+            return
+
+        await update.message.reply_text(watchdog.format_report(), parse_mode="HTML")
@@ -0,0 +1,69 @@
+"""
+ProfileHandler Handler
+Implements /profile command following V5 Architecture.
+
+Starts a time-boxed profiling session on the event loop and returns at
+once; when the session ends it replies with the hot-path summary plus
+the collapsed-stack (or .prof) file.
+"""
+import os
+from telegram import Update
+from telegram.ext import ContextTypes
+from ..base_command_handler import BaseCommandHandler
+from src.monitoring.profiler import get_profiler, MAX_DURATION_SECONDS
+
+class ProfileHandler(BaseCommandHandler):
+    """Handle /profile command"""
+    
+    def get_command_name(self) -> str:
+        return "/profile"
+    
+    def requires_plugin_selection(self) -> bool:
+        return False
+    
+    async def execute(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        plugin_context: str = None
+    ):
+        """Execute profile logic (/profile [seconds] [sample|cprofile])"""
+        args = list(getattr(context, "args", None) or []) if context is not None else []
+        duration = 10.0
+        mode = "sample"
+        for arg in args:
+            if arg in ("sample", "cprofile"):
+                mode = arg
+            else:
+                try:
+                    duration = max(1.0, min(float(arg), MAX_DURATION_SECONDS))
+                except ValueError:
+                    pass
+
+        profiler = get_profiler()
+        try:
+            profiler.start_timed(
+                duration=duration, mode=mode,
+                on_complete=lambda report: self._send_report(update, report)
+            )
+        except RuntimeError:
+            await update.message.reply_text("⚠️ A profiling session is already running.")
+            return
+
+        await update.message.reply_text(f"🔬 Profiling event loop for {duration:.0f}s ({mode})...")
+
+    async def _send_report(self, update: Update, report):
+        """Reply with a finished session's summary and file"""
+        if report is None:
+            await update.message.reply_text(
+                "⚠️ The profiling session was stopped elsewhere; its report is at /profiler/report."
+            )
+            return
+
+        await update.message.reply_text(report.format_summary(), parse_mode="HTML")
+        if report.output_path and os.path.exists(report.output_path):
+            with open(report.output_path, "rb") as f:
+                await update.message.reply_document(
+                    document=f,
+                    filename=os.path.basename(report.output_path)
+                )
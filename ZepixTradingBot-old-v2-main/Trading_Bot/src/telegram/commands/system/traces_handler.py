@@ -0,0 +1,38 @@
+"""
+TracesHandler Handler
+Implements /traces command following V5 Architecture.
+
+Shows the slowest recently traced alerts with their top spans.
+"""
+from telegram import Update
+from telegram.ext import ContextTypes
+from ..base_command_handler import BaseCommandHandler
+from src.monitoring.tracing import get_tracer
+
+class TracesHandler(BaseCommandHandler):
+    """Handle /traces command"""
+    
+    def get_command_name(self) -> str:
+        return "/traces"
+    
+    def requires_plugin_selection(self) -> bool:
+        return False
+    
+    async def execute(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        plugin_context: str = None
+    ):
+        """Execute traces logic (/traces [limit])"""
+        limit = 5
+        if context is not None and getattr(context, "args", None):
+            try:
+                limit = max(1, min(20, int(context.args[0])))
+            except ValueError:
+                pass
+
+        await update.message.reply_text(
+            get_tracer().format_slowest(limit),
+            parse_mode="HTML"
+        )
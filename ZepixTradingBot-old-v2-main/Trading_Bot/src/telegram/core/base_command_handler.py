@@ -10,11 +10,13 @@ from abc import ABC, abstractmethod
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from typing import Optional, Dict, Any
+from functools import partial
 import logging
 
 from ..interceptors.plugin_context_manager import PluginContextManager
 from .conversation_state_manager import state_manager
 from .sticky_header_builder import StickyHeaderBuilder
+from ..headers.view_state_store import compose_message
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +107,7 @@ class BaseCommandHandler(ABC):
     async def send_message_with_header(self, chat_id: int, content: str, keyboard=None, header_style='full'):
         """Send message with sticky header and register for updates"""
         header = self.sticky_header.build_header(style=header_style)
-        full_text = f"{header}\n{content}"
+        full_text = compose_message(header, content)
 
         reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
 
@@ -118,12 +120,12 @@ class BaseCommandHandler(ABC):
 
         # Register for refresh if manager exists
         if msg and hasattr(self.bot, 'header_refresh_manager'):
-            self.bot.header_refresh_manager.register_message(chat_id, msg.message_id)
+            self._track_view(chat_id, msg.message_id, content, reply_markup, header, header_style)
 
     async def edit_message_with_header(self, update: Update, content: str, keyboard=None, header_style='compact'):
         """Edit existing message with header"""
         header = self.sticky_header.build_header(style=header_style)
-        full_text = f"{header}\n{content}"
+        full_text = compose_message(header, content)
         reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
 
         if update.callback_query:
@@ -135,9 +137,10 @@ class BaseCommandHandler(ABC):
                 )
                 # Register for refresh
                 if hasattr(self.bot, 'header_refresh_manager'):
-                    self.bot.header_refresh_manager.register_message(
+                    self._track_view(
                         update.effective_chat.id,
-                        update.callback_query.message.message_id
+                        update.callback_query.message.message_id,
+                        content, reply_markup, header, header_style
                     )
             except Exception as e:
                  logger.warning(f"Edit failed, sending new: {e}")
@@ -149,6 +152,18 @@ class BaseCommandHandler(ABC):
                 update.effective_chat.id, content, keyboard, header_style
             )
 
+    def _track_view(self, chat_id: int, message_id: int, content: str, reply_markup,
+                    header: str, header_style: str):
+        """Hand the sent view to the header refresh loop"""
+        self.bot.header_refresh_manager.track_view(
+            chat_id, message_id, content,
+            reply_markup=reply_markup,
+            header_text=header,
+            header=partial(self.sticky_header.build_header, style=header_style),
+            header_key=f"style:{header_style}",
+            parse_mode='Markdown',
+        )
+
     async def send_error_message(self, update: Update, error_text: str):
         """Send standardized error message"""
         text = f"🚨 **ERROR**\n\n{error_text}\n\nPlease try again."
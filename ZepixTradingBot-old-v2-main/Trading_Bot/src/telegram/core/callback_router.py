@@ -2,6 +2,8 @@
 Callback Router - Central Dispatcher for Button Clicks
 
 Routes callback queries to appropriate handlers based on prefix conventions.
+Prefixes are compiled into a CallbackDispatchTable (prefix trie) so each
+update resolves in one walk over its callback_data.
 Prevents "Unknown Callback" errors.
 
 Version: 1.2.0 (V5 Menu System Complete)
@@ -13,6 +15,8 @@ import logging
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from .dispatch_table import CallbackDispatchTable
+
 logger = logging.getLogger(__name__)
 
 class CallbackRouter:
@@ -22,6 +26,7 @@ class CallbackRouter:
         self.bot = bot_instance
         self.handlers = {} # Map prefix -> handler function
         self.menus = {}    # Map name -> Menu Instance
+        self.dispatch_table = CallbackDispatchTable("callback_router")
 
         # Register standard prefixes
         self._register_default_handlers()
@@ -55,6 +60,8 @@ class CallbackRouter:
     def register_handler(self, prefix: str, handler_func):
         """Register a handler for a callback prefix"""
         self.handlers[prefix] = handler_func
+        # "<prefix>_" matches exactly the data whose first '_' part is prefix
+        self.dispatch_table.add_prefix(f"{prefix}_", handler_func)
 
     def register_menu(self, name: str, menu_instance):
         """Register a menu instance for routing"""
@@ -68,28 +75,23 @@ class CallbackRouter:
         """
         query = update.callback_query
         data = query.data
-        parts = data.split('_')
 
-        if len(parts) < 2:
+        handler = self.dispatch_table.resolve(data)
+        if handler is None:
             return False
 
-        prefix = parts[0]
-
-        if prefix in self.handlers:
+        try:
+            # Always answer first
             try:
-                # Always answer first
-                try:
-                    await query.answer()
-                except:
-                    pass
-
-                await self.handlers[prefix](update, context)
-                return True
-            except Exception as e:
-                logger.error(f"Error handling callback {data}: {e}", exc_info=True)
-                return True
-
-        return False
+                await query.answer()
+            except:
+                pass
+
+            await handler(update, context)
+            return True
+        except Exception as e:
+            logger.error(f"Error handling callback {data}: {e}", exc_info=True)
+            return True
 
     # --- Routing Logic ---
 
@@ -215,4 +215,9 @@ class CommandRegistry:
 
         # Total check: 10 + 15 + 12 + 20 + 8 + 8 + 4 + 6 + 15 + 6 + 8 + 7 + 4 + 1 + 5 + 15 = 144
 
+        # 17. Diagnostics
+        self.register("traces", self.bot.traces_handler.handle, "Slowest Alerts")
+        self.register("profile", self.bot.profile_handler.handle, "Profile Event Loop")
+        self.register("blocking", self.bot.blocking_handler.handle, "Blocking Calls")
+
         logger.info(f"[CommandRegistry] Registered {len(self.commands)} commands")
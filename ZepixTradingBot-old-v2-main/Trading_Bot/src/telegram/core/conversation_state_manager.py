@@ -4,15 +4,24 @@ Conversation State Manager - Multi-Step Flow Tracking
 Manages user state for multi-step wizards (e.g., Buy, SetLot).
 Stores temporary data (e.g., selected symbol, lot size) until execution.
 Includes Thread-Safe Locking.
+States expire after 30 minutes without activity and are capped in number;
+per-chat locks are reclaimed with their state, and locks of chats without
+one are swept by the store as it is used.
 Part of V5 Zero-Typing System.
 
-Version: 1.1.0 (Async Locking)
+Version: 1.2.0 (Bounded Session Store)
 Created: 2026-01-21
 """
 
 from typing import Dict, Any, Optional, List, Callable
 import asyncio
 
+from src.utils.session_store import SessionStore
+
+# Abandoned wizards expire after this long without activity
+CONVERSATION_TTL_SECONDS = 1800
+MAX_CONVERSATIONS = 5000
+
 class ConversationState:
     """Stores state for a single user's conversation flow"""
 
@@ -43,14 +52,17 @@ class ConversationStateManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ConversationStateManager, cls).__new__(cls)
-            cls._instance.states = {}  # {chat_id: ConversationState}
-            cls._instance.locks = {}   # {chat_id: asyncio.Lock}
+            # {chat_id: ConversationState}, also owns the per-chat locks
+            cls._instance.states = SessionStore(
+                "conversation",
+                ttl_seconds=CONVERSATION_TTL_SECONDS,
+                max_entries=MAX_CONVERSATIONS,
+                sliding=True,
+            )
         return cls._instance
 
     def _get_lock(self, chat_id: int) -> asyncio.Lock:
-        if chat_id not in self.locks:
-            self.locks[chat_id] = asyncio.Lock()
-        return self.locks[chat_id]
+        return self.states.get_lock(chat_id)
 
     async def update_state(self, chat_id: int, updater_func: Callable[[ConversationState], None]):
         """Thread-safe state update"""
@@ -63,7 +75,7 @@ class ConversationStateManager:
     def start_flow(self, chat_id: int, command: str) -> ConversationState:
         """Start a new flow (Not locked, usually entry point)"""
         state = ConversationState(command)
-        self.states[chat_id] = state
+        self.states.set(chat_id, state)
         return state
 
     def get_state(self, chat_id: int) -> Optional[ConversationState]:
@@ -72,10 +84,8 @@ class ConversationStateManager:
 
     def clear_state(self, chat_id: int):
         """Clear state after completion or cancel"""
-        if chat_id in self.states:
-            del self.states[chat_id]
-        # Clean up lock if exists? Usually keep lock object to avoid churn
-        # but could remove if memory constraint.
+        # Also reclaims the chat's lock unless an update holds it
+        self.states.discard(chat_id)
 
 # Global instance
 state_manager = ConversationStateManager()
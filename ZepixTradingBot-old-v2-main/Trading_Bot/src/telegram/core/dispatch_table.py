@@ -0,0 +1,97 @@
+"""
+Dispatch Table - Precompiled Callback Resolution
+
+Resolves callback_data to a target with one dict lookup for exact keys
+and a character trie walk for prefixes (longest registered prefix wins),
+instead of re-running ``elif data == ...`` / ``startswith`` chains on
+every button press. Tables are built once when the router is created.
+
+Every resolve is timed; the cost per update is exported as
+``zepix_telegram_dispatch_seconds{router}`` and kept in ``stats``.
+
+Version: 1.0.0
+Created: 2026-10-19
+Part of: TELEGRAM_V5_CORE
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import logging
+import time
+
+from src.monitoring.metrics_registry import TELEGRAM_DISPATCH_LATENCY
+
+logger = logging.getLogger(__name__)
+
+# Trie node key holding (prefix, target) for a registered prefix
+_TERMINAL = "\0"
+
+
+class CallbackDispatchTable:
+    """Exact-match dict plus prefix trie for callback_data"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._exact: Dict[str, Any] = {}
+        self._trie: Dict[str, Any] = {}
+        self._latency = TELEGRAM_DISPATCH_LATENCY.labels(router=name)
+        self.stats = {"dispatches": 0, "misses": 0, "total_ns": 0, "max_ns": 0}
+
+    def add_exact(self, key: str, target: Any):
+        self._exact[key] = target
+
+    def add_prefix(self, prefix: str, target: Any):
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = (prefix, target)
+
+    def __len__(self) -> int:
+        return len(self._exact) + self._count_prefixes(self._trie)
+
+    def _count_prefixes(self, node: Dict[str, Any]) -> int:
+        return sum(1 if key == _TERMINAL else self._count_prefixes(child)
+                   for key, child in node.items())
+
+    def match(self, data: str) -> Optional[Tuple[str, Any]]:
+        """(matched key or prefix, target) for ``data``, or None"""
+        target = self._exact.get(data)
+        if target is not None:
+            return data, target
+
+        best = None
+        node = self._trie
+        for char in data:
+            node = node.get(char)
+            if node is None:
+                break
+            terminal = node.get(_TERMINAL)
+            if terminal is not None:
+                best = terminal
+        return best
+
+    def resolve(self, data: str) -> Optional[Any]:
+        """Target for ``data`` (None if unrouted); records dispatch cost"""
+        start = time.perf_counter_ns()
+        matched = self.match(data)
+        elapsed = time.perf_counter_ns() - start
+
+        stats = self.stats
+        stats["dispatches"] += 1
+        stats["total_ns"] += elapsed
+        if elapsed > stats["max_ns"]:
+            stats["max_ns"] = elapsed
+        if matched is None:
+            stats["misses"] += 1
+        self._latency.observe(elapsed / 1e9)
+        return matched[1] if matched is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        dispatches = self.stats["dispatches"]
+        return {
+            "router": self.name,
+            "routes": len(self),
+            "dispatches": dispatches,
+            "misses": self.stats["misses"],
+            "avg_us": round(self.stats["total_ns"] / dispatches / 1000, 2) if dispatches else 0.0,
+            "max_us": round(self.stats["max_ns"] / 1000, 2),
+        }
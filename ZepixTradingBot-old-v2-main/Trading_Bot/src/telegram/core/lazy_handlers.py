@@ -0,0 +1,199 @@
+"""
+Lazy Handlers - Manifest-Driven Command Handler Loading
+
+The controller bot used to import every module under
+``src/telegram/commands`` at boot and instantiate its core handlers. ``HANDLER_MANIFEST`` maps each bot
+attribute (``bot.positions_handler``) to "module:Class"; installing the
+manifest puts a ``LazyHandler`` stand-in on the bot, and the module is
+imported and the handler built the first time it is used. Commands
+nobody sends never cost an import.
+
+``LazyHandlerRegistry.get_stats()`` reports how many modules were
+deferred at boot, what each lazy import cost, and an estimate of the
+import time still avoided.
+
+Version: 1.0.0
+Created: 2026-10-19
+Part of: TELEGRAM_V5_CORE
+"""
+
+from typing import Any, Dict, Iterable, Optional
+import importlib
+import logging
+import sys
+import time
+
+from src.monitoring.metrics_registry import TELEGRAM_HANDLER_IMPORT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+# bot attribute -> "module:Class"
+# Only the handlers ControllerBot has always built; the other modules under
+# telegram/commands are not bound to the bot (listing one here makes it
+# reachable through bot attributes, e.g. CommandRegistry bindings)
+HANDLER_MANIFEST: Dict[str, str] = {
+    # System
+    "start_handler": "src.telegram.commands.system.start_handler:StartHandler",
+    "status_handler": "src.telegram.commands.system.status_handler:StatusHandler",
+    "help_handler": "src.telegram.commands.system.help_handler:HelpHandler",
+    "pause_handler": "src.telegram.commands.system.pause_handler:PauseHandler",
+    "resume_handler": "src.telegram.commands.system.resume_handler:ResumeHandler",
+    "restart_handler": "src.telegram.commands.system.restart_handler:RestartHandler",
+    "shutdown_handler": "src.telegram.commands.system.shutdown_handler:ShutdownHandler",
+    "config_handler": "src.telegram.commands.system.config_handler:ConfigHandler",
+    "health_handler": "src.telegram.commands.system.health_handler:HealthHandler",
+    "version_handler": "src.telegram.commands.system.version_handler:VersionHandler",
+    "traces_handler": "src.telegram.commands.system.traces_handler:TracesHandler",
+    "profile_handler": "src.telegram.commands.system.profile_handler:ProfileHandler",
+    "blocking_handler": "src.telegram.commands.system.blocking_handler:BlockingHandler",
+
+    # Trading
+    "buy_handler": "src.telegram.commands.trading.buy_handler:BuyHandler",
+    "sell_handler": "src.telegram.commands.trading.sell_handler:SellHandler",
+    "close_handler": "src.telegram.commands.trading.close_handler:CloseHandler",
+    "closeall_handler": "src.telegram.commands.trading.closeall_handler:CloseallHandler",
+    "orders_handler": "src.telegram.commands.trading.orders_handler:OrdersHandler",
+    "positions_handler": "src.telegram.commands.trading.positions_handler:PositionsHandler",
+    "history_handler": "src.telegram.commands.trading.history_handler:HistoryHandler",
+    "pnl_handler": "src.telegram.commands.trading.pnl_handler:PnLHandler",
+    "balance_handler": "src.telegram.commands.trading.balance_handler:BalanceHandler",
+    "equity_handler": "src.telegram.commands.trading.equity_handler:EquityHandler",
+    "margin_handler": "src.telegram.commands.trading.margin_handler:MarginHandler",
+    "symbols_handler": "src.telegram.commands.trading.symbols_handler:SymbolsHandler",
+    "trades_handler": "src.telegram.commands.trading.trades_handler:TradesHandler",
+    "price_handler": "src.telegram.commands.trading.price_handler:PriceHandler",
+    "spread_handler": "src.telegram.commands.trading.spread_handler:SpreadHandler",
+    "signals_handler": "src.telegram.commands.trading.signals_handler:SignalsHandler",
+    "filters_handler": "src.telegram.commands.trading.filters_handler:FiltersHandler",
+    "partial_handler": "src.telegram.commands.trading.partial_handler:PartialHandler",
+
+    # Risk
+    "setsl_handler": "src.telegram.commands.risk.set_sl_handler:SetSLHandler",
+    "settp_handler": "src.telegram.commands.risk.set_tp_handler:SetTPHandler",
+    "setlot_handler": "src.telegram.commands.risk.setlot_handler:SetLotHandler",
+    "dailylimit_handler": "src.telegram.commands.risk.dailylimit_handler:DailylimitHandler",
+    "maxloss_handler": "src.telegram.commands.risk.maxloss_handler:MaxlossHandler",
+    "maxprofit_handler": "src.telegram.commands.risk.maxprofit_handler:MaxprofitHandler",
+    "risktier_handler": "src.telegram.commands.risk.risktier_handler:RisktierHandler",
+    "slsystem_handler": "src.telegram.commands.risk.slsystem_handler:SlsystemHandler",
+    "trailsl_handler": "src.telegram.commands.risk.trailsl_handler:TrailslHandler",
+    "breakeven_handler": "src.telegram.commands.risk.breakeven_handler:BreakevenHandler",
+    "protection_handler": "src.telegram.commands.risk.protection_handler:ProtectionHandler",
+    "multiplier_handler": "src.telegram.commands.risk.multiplier_handler:MultiplierHandler",
+    "maxtrades_handler": "src.telegram.commands.risk.maxtrades_handler:MaxtradesHandler",
+    "drawdown_handler": "src.telegram.commands.risk.drawdown_handler:DrawdownHandler",
+    "risk_handler": "src.telegram.commands.risk.risk_handler:RiskHandler",
+
+    # V3 Strategy
+    "logic1_handler": "src.telegram.commands.v3.logic1_handler:Logic1Handler",
+    "logic2_handler": "src.telegram.commands.v3.logic2_handler:Logic2Handler",
+
+    # V6 Timeframes
+    "v6_status_handler": "src.telegram.commands.v6.v6_status_handler:V6StatusHandler",
+    "tf1m_handler": "src.telegram.commands.v6.tf1m_handler:Tf1mHandler",
+
+    # Analytics
+    "daily_handler": "src.telegram.commands.analytics.daily_handler:DailyHandler",
+    "dashboard_handler": "src.telegram.commands.analytics.dashboard_handler:DashboardHandler",
+
+    # Re-Entry
+    "reentry_handler": "src.telegram.commands.reentry.reentry_handler:ReentryHandler",
+
+    # Profit
+    "profit_handler": "src.telegram.commands.profit.profit_handler:ProfitHandler",
+}
+
+
+class LazyHandler:
+    """Stand-in for a command handler; imports and builds it on first use"""
+
+    def __init__(self, registry: "LazyHandlerRegistry", attr: str, target: str):
+        self._registry = registry
+        self._attr = attr
+        self._target = target
+        self._instance = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def resolve(self):
+        if self._instance is None:
+            self._instance = self._registry.load(self._attr)
+        return self._instance
+
+    async def handle(self, update, context):
+        # Bound as the telegram callback at registration without importing anything
+        return await self.resolve().handle(update, context)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "deferred"
+        return f"<LazyHandler {self._attr} -> {self._target} ({state})>"
+
+
+class LazyHandlerRegistry:
+    """Installs ``LazyHandler`` stand-ins on a bot and tracks import cost"""
+
+    def __init__(self, bot, manifest: Optional[Dict[str, str]] = None):
+        self.bot = bot
+        self.manifest = dict(HANDLER_MANIFEST if manifest is None else manifest)
+        self.handlers: Dict[str, LazyHandler] = {}
+        self.import_ms: Dict[str, float] = {}
+        self.deferred_at_boot = 0
+        self.install_ms = 0.0
+
+    def install(self) -> Dict[str, LazyHandler]:
+        """Put a stand-in on the bot for every manifest entry"""
+        start = time.perf_counter()
+        for attr, target in self.manifest.items():
+            handler = LazyHandler(self, attr, target)
+            self.handlers[attr] = handler
+            setattr(self.bot, attr, handler)
+
+        modules = {target.split(":", 1)[0] for target in self.manifest.values()}
+        self.deferred_at_boot = sum(1 for module in modules if module not in sys.modules)
+        self.install_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"[LazyHandlers] {len(self.handlers)} handlers registered in {self.install_ms:.1f}ms, "
+            f"{self.deferred_at_boot}/{len(modules)} modules deferred until first use"
+        )
+        return self.handlers
+
+    def load(self, attr: str):
+        """Import the handler's module (timed) and build the handler"""
+        module_name, class_name = self.manifest[attr].split(":", 1)
+        start = time.perf_counter()
+        was_imported = module_name in sys.modules
+        module = importlib.import_module(module_name)
+        elapsed = time.perf_counter() - start
+        if not was_imported:
+            self.import_ms[module_name] = elapsed * 1000
+            TELEGRAM_HANDLER_IMPORT_SECONDS.inc(elapsed)
+            logger.debug(f"[LazyHandlers] Imported {module_name} in {elapsed * 1000:.1f}ms")
+        return getattr(module, class_name)(self.bot)
+
+    def preload(self, attrs: Iterable[str]):
+        """Build handlers ahead of first use (e.g. /start)"""
+        for attr in attrs:
+            self.handlers[attr].resolve()
+
+    def get_stats(self) -> Dict[str, Any]:
+        loaded = sum(1 for h in self.handlers.values() if h.loaded)
+        paid_ms = sum(self.import_ms.values())
+        avg_ms = paid_ms / len(self.import_ms) if self.import_ms else 0.0
+        still_deferred = max(self.deferred_at_boot - len(self.import_ms), 0)
+        return {
+            "handlers": len(self.handlers),
+            "loaded": loaded,
+            "deferred_at_boot": self.deferred_at_boot,
+            "modules_imported": len(self.import_ms),
+            "import_ms_paid": round(paid_ms, 1),
+            "import_ms_avoided_estimate": round(avg_ms * still_deferred, 1),
+            "install_ms": round(self.install_ms, 2),
+        }
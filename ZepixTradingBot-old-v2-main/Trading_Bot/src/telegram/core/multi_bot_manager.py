@@ -16,6 +16,7 @@ from ..bots.notification_bot import NotificationBot
 from ..bots.analytics_bot import AnalyticsBot
 from .token_manager import TokenManager
 from .message_router import MessageRouter
+from ..render_cache import get_menu_render_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class MultiBotManager:
         # Create a Config-like object for menu handlers
         from src.config import Config
         self.config = Config()  # This will load from config.json
+        get_menu_render_cache().attach(self.config)  # menu handlers change settings here
         
         self.token_manager = TokenManager(config)
         self.chat_id = config.get("telegram", {}).get("chat_id")
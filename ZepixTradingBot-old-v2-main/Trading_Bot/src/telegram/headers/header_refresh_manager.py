@@ -5,29 +5,58 @@ Manages background tasks to refresh message headers every 30s.
 Handles MessageNotModified exceptions gracefully.
 Part of V5 Sticky Header System.
 
-Version: 1.0.0
+Each tick re-renders the header once per header style, reuses the body
+kept by ViewStateStore (menu bodies are static text), and compares the
+result with the hash of what was last sent. Only
+messages whose text or keyboard really changed are edited, and edits
+draw from a token bucket sized to Telegram's per-minute budget; edits
+that do not fit stay dirty and go out on a later tick.
+
+Version: 1.1.0 (View State Refresh)
 Created: 2026-01-21
 """
 
 import asyncio
+import inspect
 import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
 from telegram.error import BadRequest
 
+from src.monitoring.metrics_registry import TELEGRAM_VIEW_REFRESH
+from src.telegram.rate_limiter import TokenBucket
+from .view_state_store import ViewState, ViewStateStore, compose_message, content_hash
+
 logger = logging.getLogger(__name__)
 
 class HeaderRefreshManager:
     """Manages auto-refresh of sticky headers"""
 
-    def __init__(self, bot_instance):
+    def __init__(self, bot_instance, refresh_interval: int = 30, max_edits_per_minute: int = 20):
         self.bot = bot_instance
-        self.active_messages = {} # (chat_id, message_id) -> task
-        self.refresh_interval = 30 # Seconds
+        self.active_messages = {} # (chat_id, message_id) -> True
+        self.refresh_interval = refresh_interval # Seconds
+        self.view_store = ViewStateStore()
+        self.edit_bucket = TokenBucket(
+            capacity=max_edits_per_minute,
+            refill_rate=max_edits_per_minute / 60.0,
+            refill_interval=1.0
+        )
+        self.stats = {"ticks": 0, "edited": 0, "unchanged": 0, "deferred": 0, "failed": 0}
+        self._task: Optional[asyncio.Task] = None
 
     def start(self):
         """Start the global refresh loop (if needed)"""
-        # In this design, we spawn individual tasks per message or a global loop
-        # Global loop is more efficient
-        asyncio.create_task(self._global_refresh_loop())
+        # Global loop is more efficient than a task per message
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._global_refresh_loop())
+
+    def stop(self):
+        """Stop the global refresh loop"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
 
     def register_message(self, chat_id, message_id):
         """Register a message to be auto-refreshed"""
@@ -36,10 +65,33 @@ class HeaderRefreshManager:
         keys_to_remove = [k for k in self.active_messages if k[0] == chat_id]
         for k in keys_to_remove:
             del self.active_messages[k]
+        self.view_store.discard(chat_id)
 
         self.active_messages[(chat_id, message_id)] = True
         logger.debug(f"Registered message {message_id} in chat {chat_id} for refresh")
 
+    def track_view(
+        self,
+        chat_id: int,
+        message_id: int,
+        body_text: str,
+        reply_markup: Any = None,
+        header_text: Optional[str] = None,
+        header: Optional[Callable[[], str]] = None,
+        header_key: str = "",
+        parse_mode: str = "HTML",
+    ) -> ViewState:
+        """Register a sent menu message together with the state to re-render it"""
+        self.register_message(chat_id, message_id)
+        return self.view_store.record(
+            chat_id, message_id, body_text,
+            reply_markup=reply_markup,
+            header_text=header_text,
+            header=header,
+            header_key=header_key,
+            parse_mode=parse_mode,
+        )
+
     async def _global_refresh_loop(self):
         """Loop to update all registered messages"""
         logger.info("[HeaderRefresh] Started global refresh loop")
@@ -49,41 +101,102 @@ class HeaderRefreshManager:
             if not self.active_messages:
                 continue
 
-            # Create tasks for all updates
-            tasks = []
-            keys = list(self.active_messages.keys())
+            try:
+                await self.refresh_tick()
+            except Exception as e:
+                logger.error(f"[HeaderRefresh] Refresh tick failed: {e}")
 
-            for chat_id, message_id in keys:
-                tasks.append(self._refresh_message(chat_id, message_id))
+    async def refresh_tick(self) -> Dict[str, int]:
+        """Re-render every tracked view and edit the ones that changed"""
+        tick = {"edited": 0, "unchanged": 0, "deferred": 0, "failed": 0}
+        headers: Dict[str, str] = {}
+        changed = []
 
-            await asyncio.gather(*tasks, return_exceptions=True)
+        for view in self.view_store.views():
+            if (view.chat_id, view.message_id) not in self.active_messages:
+                self.view_store.discard(view.chat_id, view.message_id)
+                continue
+            try:
+                text, reply_markup = await self._render(view, headers)
+            except Exception as e:
+                logger.error(f"Render failed for {view.chat_id}/{view.message_id}: {e}")
+                tick["failed"] += 1
+                continue
 
-    async def _refresh_message(self, chat_id, message_id):
-        """Update a single message header"""
+            digest = content_hash(text, reply_markup)
+            if digest == view.content_hash:
+                view.unchanged += 1
+                tick["unchanged"] += 1
+                continue
+            changed.append((view, text, reply_markup, digest))
+
+        batch = []
+        for item in changed:
+            if not self.edit_bucket.consume():
+                tick["deferred"] = len(changed) - len(batch)
+                break
+            batch.append(item)
+
+        results = await asyncio.gather(
+            *(self._refresh_message(*item) for item in batch), return_exceptions=True
+        )
+        for result in results:
+            tick[result if isinstance(result, str) else "failed"] += 1
+
+        self.stats["ticks"] += 1
+        for result, count in tick.items():
+            if count:
+                self.stats[result] += count
+                TELEGRAM_VIEW_REFRESH.labels(result=result).inc(count)
+        return tick
+
+    async def _render(self, view: ViewState, headers: Dict[str, str]):
+        """Full text and keyboard of ``view`` now (headers are rendered once per key per tick)"""
+        header_text = None
+        if view.header is not None:
+            header_text = headers.get(view.header_key)
+            if header_text is None:
+                header_text = view.header()
+                if inspect.isawaitable(header_text):
+                    header_text = await header_text
+                headers[view.header_key] = header_text
+        return compose_message(header_text, view.body_text), view.reply_markup
+
+    async def _refresh_message(self, view: ViewState, text: str, reply_markup: Any, digest: str) -> str:
+        """Update a single message; returns the refresh result"""
+        chat_id, message_id = view.chat_id, view.message_id
         try:
-            # 1. Rebuild Header
-            # We need the current menu state to know WHAT content to put below header
-            # Limitations: We can't easily fetch old text content cleanly.
-            # Strategy: Just update the header part if possible?
-            # Telegram doesn't support partial edit.
-
-            # WORKAROUND: For V5, we might need to store the 'current view' generator
-            # For now, we will skip implementation of content re-generation
-            # and assume the MenuBuilder can be triggered again?
-
-            # Alternative: Since we can't reconstruct the body without state,
-            # We simply log that refresh triggered.
-            # A true implementation requires View State Management.
-
-            # Implementation for TASK 003:
-            # We will rely on user interaction to refresh mostly,
-            # BUT if we store the 'last_menu_builder' and 'last_context' we could redo it.
-
-            pass
-
-        except Exception as e:
+            await self.bot.bot.edit_message_text(
+                chat_id=chat_id,
+                message_id=message_id,
+                text=text,
+                parse_mode=view.parse_mode,
+                reply_markup=reply_markup
+            )
+        except BadRequest as e:
+            error = str(e).lower()
+            if "message is not modified" in error:
+                view.content_hash = digest
+                view.unchanged += 1
+                return "unchanged"
             logger.error(f"Refresh failed for {chat_id}/{message_id}: {e}")
-            if "message to edit not found" in str(e).lower():
+            if "message to edit not found" in error:
                 # Clean up dead message
-                if (chat_id, message_id) in self.active_messages:
-                    del self.active_messages[(chat_id, message_id)]
+                self.active_messages.pop((chat_id, message_id), None)
+                self.view_store.discard(chat_id, message_id)
+            return "failed"
+        except Exception as e:
+            logger.error(f"Refresh failed for {chat_id}/{message_id}: {e}")
+            return "failed"
+
+        view.content_hash = digest
+        view.edits += 1
+        view.updated_at = time.time()
+        return "edited"
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "active_messages": len(self.active_messages),
+            "store": self.view_store.get_stats(),
+        }
@@ -0,0 +1,131 @@
+"""
+View State Store - Last Rendered Menu Per Chat
+
+Keeps what is needed to rebuild the live menu message of each chat:
+the body text and keyboard that were sent and the header callable that
+produced the sticky header. With that state a refresh tick can re-render
+the header without the original message, and compare the result against
+the hash of what was last sent.
+Part of V5 Sticky Header System.
+
+Version: 1.0.0
+Created: 2026-10-19
+Part of: TELEGRAM_V5_STICKY_HEADER
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+def compose_message(header: Optional[str], body: str) -> str:
+    """Join sticky header and body exactly as the menus send them"""
+    return f"{header}\n{body}" if header else body
+
+
+def content_hash(text: str, reply_markup: Any = None) -> str:
+    """Digest of message text plus keyboard, used to skip no-op edits"""
+    if reply_markup is None:
+        markup = ""
+    elif hasattr(reply_markup, "to_json"):
+        markup = reply_markup.to_json()
+    else:
+        markup = json.dumps(reply_markup, sort_keys=True, default=str)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(text.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(markup.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class ViewState:
+    """Last rendered menu message of one chat"""
+    chat_id: int
+    message_id: int
+    body_text: str
+    reply_markup: Any = None
+    header: Optional[Callable[[], str]] = None
+    header_key: str = ""
+    parse_mode: str = "HTML"
+    content_hash: str = ""
+    edits: int = 0
+    unchanged: int = 0
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "header_key": self.header_key,
+            "edits": self.edits,
+            "unchanged": self.unchanged,
+            "updated_at": self.updated_at,
+        }
+
+
+class ViewStateStore:
+    """One ViewState per chat (only the latest menu message is kept live)"""
+
+    def __init__(self):
+        self._views: Dict[int, ViewState] = {}
+
+    def record(
+        self,
+        chat_id: int,
+        message_id: int,
+        body_text: str,
+        reply_markup: Any = None,
+        header_text: Optional[str] = None,
+        header: Optional[Callable[[], str]] = None,
+        header_key: str = "",
+        parse_mode: str = "HTML",
+    ) -> ViewState:
+        """
+        Store the view that was just sent to ``chat_id``.
+
+        Args:
+            body_text: Menu text below the header
+            reply_markup: Keyboard sent with the message
+            header_text: Header as it was sent (hashed with the body)
+            header: Rebuilds the header on refresh
+            header_key: Views with the same key share one header render per tick
+        """
+        view = ViewState(
+            chat_id=chat_id,
+            message_id=message_id,
+            body_text=body_text,
+            reply_markup=reply_markup,
+            header=header,
+            header_key=header_key,
+            parse_mode=parse_mode,
+            content_hash=content_hash(compose_message(header_text, body_text), reply_markup),
+        )
+        self._views[chat_id] = view
+        return view
+
+    def get(self, chat_id: int) -> Optional[ViewState]:
+        return self._views.get(chat_id)
+
+    def discard(self, chat_id: int, message_id: Optional[int] = None):
+        """Forget the view of ``chat_id`` (only if it is ``message_id`` when given)"""
+        view = self._views.get(chat_id)
+        if view is not None and (message_id is None or view.message_id == message_id):
+            del self._views[chat_id]
+
+    def views(self) -> List[ViewState]:
+        """Snapshot safe to iterate while views are recorded or discarded"""
+        return list(self._views.values())
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def get_stats(self) -> Dict[str, Any]:
+        views = self.views()
+        return {
+            "views": len(views),
+            "edits": sum(v.edits for v in views),
+            "unchanged": sum(v.unchanged for v in views),
+        }
@@ -16,9 +16,18 @@ import logging
 from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 
+from src.telegram.render_cache import get_menu_render_cache
+
 logger = logging.getLogger(__name__)
 
 
+def _cached_markup(menu_id: str, fingerprint, build: Callable[[], Dict]) -> Dict:
+    """Keyboard of a static menu from the render cache (shared - do not mutate)"""
+    return get_menu_render_cache().get_or_render(
+        menu_id, fingerprint, lambda: (None, build())
+    ).reply_markup
+
+
 class MenuType(Enum):
     """Types of menus"""
     MAIN = "main"
@@ -413,6 +422,9 @@ class MenuBuilder:
         Returns:
             Telegram InlineKeyboardMarkup dict
         """
+        return _cached_markup("quick_actions", (), self._render_quick_actions_menu)
+    
+    def _render_quick_actions_menu(self) -> Dict:
         return {
             "inline_keyboard": [
                 [
@@ -440,6 +452,9 @@ class MenuBuilder:
         Returns:
             Telegram InlineKeyboardMarkup dict
         """
+        return _cached_markup("settings", (), self._render_settings_menu)
+    
+    def _render_settings_menu(self) -> Dict:
         return {
             "inline_keyboard": [
                 [
@@ -524,6 +539,10 @@ class MenuFactory:
     @staticmethod
     def create_main_menu() -> Dict:
         """Create main menu"""
+        return _cached_markup("factory_main", (), MenuFactory._build_main_menu)
+    
+    @staticmethod
+    def _build_main_menu() -> Dict:
         builder = MenuBuilder()
         return builder.build_inline_keyboard(
             buttons=[
@@ -553,6 +572,10 @@ class MenuFactory:
     @staticmethod
     def create_panic_menu() -> Dict:
         """Create PANIC CLOSE confirmation menu"""
+        return _cached_markup("factory_panic", (), MenuFactory._build_panic_menu)
+    
+    @staticmethod
+    def _build_panic_menu() -> Dict:
         builder = MenuBuilder()
         return builder.build_confirmation_menu(
             action="panic_close",
@@ -565,17 +588,17 @@ class MenuFactory:
     @staticmethod
     def create_back_only_menu(back_callback: str = "nav_back") -> Dict:
         """Create menu with only back button"""
-        return {
+        return _cached_markup("factory_back_only", back_callback, lambda: {
             "inline_keyboard": [
                 [{"text": "🔙 Back", "callback_data": back_callback}]
             ]
-        }
+        })
     
     @staticmethod
     def create_home_only_menu() -> Dict:
         """Create menu with only home button"""
-        return {
+        return _cached_markup("factory_home_only", (), lambda: {
             "inline_keyboard": [
                 [{"text": "🏠 Main Menu", "callback_data": "menu_main"}]
             ]
-        }
+        })
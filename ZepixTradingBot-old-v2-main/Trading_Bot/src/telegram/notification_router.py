@@ -16,6 +16,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any, Callable, List, Set
 from enum import Enum
 from dataclasses import dataclass, field
+from src.monitoring.tracing import traced
+from src.telegram.template_engine import compile_template, when
 
 logger = logging.getLogger(__name__)
 
@@ -438,6 +440,7 @@ class NotificationRouter:
         # Check specific type mute
         return notification_type in self.muted_types
     
+    @traced("notify.router.send")
     def send(
         self,
         notification_type: NotificationType,
@@ -593,1013 +596,711 @@ class NotificationRouter:
         return [t.value for t in self.muted_types]
 
 
+_RULE = "=" * 24
+_TIME_LINE = "<b>Time:</b> {time}"
+_TF_BADGES = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
+
+
+def _tf_badge(timeframe):
+    """V6 timeframe badge ("1h" -> "1H")"""
+    return _TF_BADGES.get(timeframe.lower(), timeframe.upper())
+
+
+def _tf_badge_or_v6(timeframe):
+    return _tf_badge(timeframe) if timeframe else "V6"
+
+
+def _status(enabled):
+    return "ENABLED" if enabled else "DISABLED"
+
+
+def _on_off(flag):
+    return "ON" if flag else "OFF"
+
+
+def _v6_pnl(data):
+    return data.get("pnl", data.get("profit", 0))
+
+
 class NotificationFormatter:
     """
     Provides standard formatters for different notification types.
+
+    Formatters are templates compiled once at import (see template_engine);
+    each is called as ``formatter(data) -> str`` like a plain function.
     """
-    
-    @staticmethod
-    def format_entry(data: Dict) -> str:
-        """Format entry notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry_price = data.get("entry_price", 0)
-        
-        message = (
-            f"<b>ENTRY ALERT</b> | {plugin_name}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Entry Price:</b> {entry_price}\n"
-        )
-        
-        if data.get("order_a_lot"):
-            message += (
-                f"\n<b>Order A:</b> {data.get('order_a_lot')} lots\n"
-                f"  SL: {data.get('order_a_sl', 'N/A')}\n"
-                f"  TP: {data.get('order_a_tp', 'N/A')}\n"
-            )
-        
-        if data.get("order_b_lot"):
-            message += (
-                f"\n<b>Order B:</b> {data.get('order_b_lot')} lots\n"
-                f"  SL: {data.get('order_b_sl', 'N/A')}\n"
-                f"  TP: {data.get('order_b_tp', 'N/A')}\n"
-            )
-        
-        message += f"\n<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_exit(data: Dict) -> str:
-        """Format exit notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        profit = data.get("profit", 0)
-        
-        emoji = "" if profit >= 0 else ""
-        
-        message = (
-            f"{emoji} <b>EXIT ALERT</b> | {plugin_name}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction} -> CLOSED\n\n"
-            f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
-            f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
-            f"<b>Hold Time:</b> {data.get('hold_time', 'N/A')}\n\n"
-            f"<b>P&L:</b> ${profit:+.2f}\n"
-            f"<b>Reason:</b> {data.get('reason', 'N/A')}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_tp_hit(data: Dict) -> str:
-        """Format TP_HIT notification"""
-        symbol = data.get("symbol", "UNKNOWN")
-        profit = data.get("profit", 0.0)
-        tp_level = data.get("tp_level", 1)
-        entry_price = data.get("entry_price", 0.0)
-        exit_price = data.get("exit_price", 0.0)
-        
-        return (
-            f"<b>TAKE PROFIT HIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"  Symbol: {symbol}\n"
-            f"  TP Level: {tp_level}\n"
-            f"  Entry: {entry_price}\n"
-            f"  Exit: {exit_price}\n"
-            f"  Profit: ${profit:.2f}\n"
-        )
-    
-    @staticmethod
-    def format_sl_hit(data: Dict) -> str:
-        """Format SL_HIT notification"""
-        symbol = data.get("symbol", "UNKNOWN")
-        loss = data.get("loss", 0.0)
-        entry_price = data.get("entry_price", 0.0)
-        exit_price = data.get("exit_price", 0.0)
-        
-        return (
-            f"<b>STOP LOSS HIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"  Symbol: {symbol}\n"
-            f"  Entry: {entry_price}\n"
-            f"  Exit: {exit_price}\n"
-            f"  Loss: ${abs(loss):.2f}\n"
-        )
-    
-    @staticmethod
-    def format_daily_summary(data: Dict) -> str:
-        """Format daily summary notification"""
-        date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        total_trades = data.get("total_trades", 0)
-        winners = data.get("winners", 0)
-        losers = data.get("losers", 0)
-        win_rate = data.get("win_rate", 0)
-        net_pnl = data.get("net_pnl", 0)
-        
-        emoji = "" if net_pnl >= 0 else ""
-        
-        message = (
-            f"<b>DAILY SUMMARY</b> | {date}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Performance:</b>\n"
-            f"  Total Trades: {total_trades}\n"
-            f"  Winners: {winners} ({win_rate:.1f}%)\n"
-            f"  Losers: {losers}\n\n"
-            f"<b>P&L:</b>\n"
-            f"  Gross Profit: +${data.get('gross_profit', 0):.2f}\n"
-            f"  Gross Loss: -${data.get('gross_loss', 0):.2f}\n"
-            f"  {emoji} Net P&L: ${net_pnl:+.2f}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_emergency(data: Dict) -> str:
-        """Format emergency notification"""
-        reason = data.get("reason", "Unknown")
-        details = data.get("details", "No details available")
-        
-        message = (
-            f"<b>EMERGENCY ALERT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Details:</b> {details}\n\n"
-            f"<b>Action Required:</b> Immediate attention needed\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_error(data: Dict) -> str:
-        """Format error notification"""
-        error_type = data.get("error_type", "Unknown")
-        severity = data.get("severity", "MEDIUM")
-        details = data.get("details", "No details available")
-        
-        severity_emoji = "" if severity == "HIGH" else ("" if severity == "MEDIUM" else "")
-        
-        message = (
-            f"<b>ERROR ALERT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Error Type:</b> {error_type}\n"
-            f"<b>Severity:</b> {severity_emoji} {severity}\n"
-            f"<b>Details:</b> {details}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
+
+    format_entry = staticmethod(compile_template(
+        "<b>ENTRY ALERT</b> | {plugin_name}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction}\n"
+        "<b>Entry Price:</b> {entry_price}\n"
+        "{order_a}{order_b}"
+        f"\n{_TIME_LINE}",
+        fields={"plugin_name": "Unknown", "symbol": "N/A", "direction": "N/A", "entry_price": 0},
+        computed={
+            "order_a": when(
+                "order_a_lot",
+                "\n<b>Order A:</b> {order_a_lot} lots\n  SL: {order_a_sl}\n  TP: {order_a_tp}\n",
+                fields={"order_a_sl": "N/A", "order_a_tp": "N/A"},
+            ),
+            "order_b": when(
+                "order_b_lot",
+                "\n<b>Order B:</b> {order_b_lot} lots\n  SL: {order_b_sl}\n  TP: {order_b_tp}\n",
+                fields={"order_b_sl": "N/A", "order_b_tp": "N/A"},
+            ),
+        },
+        name="entry",
+    ))
+
+    format_exit = staticmethod(compile_template(
+        " <b>EXIT ALERT</b> | {plugin_name}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction} -> CLOSED\n\n"
+        "<b>Entry:</b> {entry_price}\n"
+        "<b>Exit:</b> {exit_price}\n"
+        "<b>Hold Time:</b> {hold_time}\n\n"
+        "<b>P&L:</b> ${profit:+.2f}\n"
+        "<b>Reason:</b> {reason}\n"
+        f"{_TIME_LINE}",
+        fields={
+            "plugin_name": "Unknown", "symbol": "N/A", "direction": "N/A", "profit": 0,
+            "entry_price": "N/A", "exit_price": "N/A", "hold_time": "N/A", "reason": "N/A",
+        },
+        name="exit",
+    ))
+
+    format_tp_hit = staticmethod(compile_template(
+        "<b>TAKE PROFIT HIT</b>\n"
+        f"{_RULE}\n\n"
+        "  Symbol: {symbol}\n"
+        "  TP Level: {tp_level}\n"
+        "  Entry: {entry_price}\n"
+        "  Exit: {exit_price}\n"
+        "  Profit: ${profit:.2f}\n",
+        fields={"symbol": "UNKNOWN", "profit": 0.0, "tp_level": 1, "entry_price": 0.0, "exit_price": 0.0},
+        name="tp_hit",
+    ))
+
+    format_sl_hit = staticmethod(compile_template(
+        "<b>STOP LOSS HIT</b>\n"
+        f"{_RULE}\n\n"
+        "  Symbol: {symbol}\n"
+        "  Entry: {entry_price}\n"
+        "  Exit: {exit_price}\n"
+        "  Loss: ${abs_loss:.2f}\n",
+        fields={"symbol": "UNKNOWN", "loss": 0.0, "entry_price": 0.0, "exit_price": 0.0},
+        computed={"abs_loss": lambda loss: abs(loss)},
+        name="sl_hit",
+    ))
+
+    format_daily_summary = staticmethod(compile_template(
+        "<b>DAILY SUMMARY</b> | {date}\n"
+        f"{_RULE}\n\n"
+        "<b>Performance:</b>\n"
+        "  Total Trades: {total_trades}\n"
+        "  Winners: {winners} ({win_rate:.1f}%)\n"
+        "  Losers: {losers}\n\n"
+        "<b>P&L:</b>\n"
+        "  Gross Profit: +${gross_profit:.2f}\n"
+        "  Gross Loss: -${gross_loss:.2f}\n"
+        "   Net P&L: ${net_pnl:+.2f}",
+        fields={
+            "total_trades": 0, "winners": 0, "losers": 0, "win_rate": 0, "net_pnl": 0,
+            "gross_profit": 0, "gross_loss": 0,
+        },
+        computed={"date": lambda data: data["date"] if "date" in data else datetime.now().strftime("%Y-%m-%d")},
+        name="daily_summary",
+    ))
+
+    format_emergency = staticmethod(compile_template(
+        "<b>EMERGENCY ALERT</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Reason:</b> {reason}\n"
+        "<b>Details:</b> {details}\n\n"
+        "<b>Action Required:</b> Immediate attention needed\n"
+        f"{_TIME_LINE}",
+        fields={"reason": "Unknown", "details": "No details available"},
+        name="emergency",
+    ))
+
+    format_error = staticmethod(compile_template(
+        "<b>ERROR ALERT</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Error Type:</b> {error_type}\n"
+        "<b>Severity:</b>  {severity}\n"
+        "<b>Details:</b> {details}\n"
+        f"{_TIME_LINE}",
+        fields={"error_type": "Unknown", "severity": "MEDIUM", "details": "No details available"},
+        name="error",
+    ))
+
     # ========================================
     # V6 Price Action Formatters (NEW - Telegram V5 Upgrade)
     # ========================================
-    
-    @staticmethod
-    def format_v6_entry(data: Dict) -> str:
-        """Format V6 Price Action entry notification with timeframe badge"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry_price = data.get("entry_price", 0)
-        
-        # Timeframe-specific badges
-        tf_badges = {
-            "15m": "15M",
-            "30m": "30M",
-            "1h": "1H",
-            "4h": "4H",
-        }
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper())
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>V6 ENTRY</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Entry Price:</b> {entry_price}\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-        )
-        
-        if data.get("sl"):
-            message += f"<b>Stop Loss:</b> {data.get('sl')}\n"
-        if data.get("tp"):
-            message += f"<b>Take Profit:</b> {data.get('tp')}\n"
-        if data.get("lot_size"):
-            message += f"<b>Lot Size:</b> {data.get('lot_size')}\n"
-        if data.get("pattern"):
-            message += f"<b>Pattern:</b> {data.get('pattern')}\n"
-        
-        message += f"\n<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_v6_exit(data: Dict) -> str:
-        """Format V6 Price Action exit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        profit = data.get("pnl", data.get("profit", 0))
-        exit_reason = data.get("exit_reason", "N/A")
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        result_emoji = "" if profit >= 0 else ""
-        
-        message = (
-            f"{result_emoji} <b>V6 EXIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction} -> CLOSED\n\n"
-            f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
-            f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
-            f"<b>Hold Time:</b> {data.get('duration', data.get('hold_time', 'N/A'))}\n\n"
-            f"<b>P&L:</b> ${profit:+.2f}"
-        )
-        
-        if data.get("pips"):
-            message += f" ({data.get('pips'):+.1f} pips)"
-        
-        message += (
-            f"\n<b>Reason:</b> {exit_reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_v6_tp_hit(data: Dict) -> str:
-        """Format V6 take profit hit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("pnl", data.get("profit", 0))
-        tp_level = data.get("tp_level", 1)
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        message = (
-            f" <b>V6 TP{tp_level} HIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>TP Level:</b> {tp_level}\n"
-            f"<b>Profit:</b> ${profit:+.2f}\n"
-        )
-        
-        if data.get("pips"):
-            message += f"<b>Pips:</b> {data.get('pips'):+.1f}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_v6_sl_hit(data: Dict) -> str:
-        """Format V6 stop loss hit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        loss = data.get("pnl", data.get("loss", 0))
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        message = (
-            f" <b>V6 SL HIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Loss:</b> ${loss:.2f}\n"
-        )
-        
-        if data.get("pips"):
-            message += f"<b>Pips:</b> {data.get('pips'):.1f}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_v6_timeframe_toggle(data: Dict) -> str:
-        """Format V6 timeframe enabled/disabled notification"""
-        timeframe = data.get("timeframe", "N/A")
-        enabled = data.get("enabled", False)
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else timeframe
-        
-        status_emoji = "" if enabled else ""
-        action = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"{status_emoji} <b>V6 {tf_badge} {action}</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-            f"<b>Status:</b> {action}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
+
+    format_v6_entry = staticmethod(compile_template(
+        " <b>V6 ENTRY</b> | {tf_badge}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction}\n"
+        "<b>Entry Price:</b> {entry_price}\n"
+        "<b>Timeframe:</b> {tf_badge}\n"
+        "{sl_line}{tp_line}{lot_line}{pattern_line}"
+        f"\n{_TIME_LINE}",
+        fields={"timeframe": "N/A", "symbol": "N/A", "direction": "N/A", "entry_price": 0},
+        computed={
+            "tf_badge": _tf_badge,
+            "sl_line": when("sl", "<b>Stop Loss:</b> {sl}\n"),
+            "tp_line": when("tp", "<b>Take Profit:</b> {tp}\n"),
+            "lot_line": when("lot_size", "<b>Lot Size:</b> {lot_size}\n"),
+            "pattern_line": when("pattern", "<b>Pattern:</b> {pattern}\n"),
+        },
+        name="v6_entry",
+    ))
+
+    format_v6_exit = staticmethod(compile_template(
+        " <b>V6 EXIT</b> | {tf_badge}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction} -> CLOSED\n\n"
+        "<b>Entry:</b> {entry_price}\n"
+        "<b>Exit:</b> {exit_price}\n"
+        "<b>Hold Time:</b> {hold_time}\n\n"
+        "<b>P&L:</b> ${profit:+.2f}{pips_note}\n"
+        "<b>Reason:</b> {exit_reason}\n"
+        f"{_TIME_LINE}",
+        fields={
+            "timeframe": "N/A", "symbol": "N/A", "direction": "N/A", "exit_reason": "N/A",
+            "entry_price": "N/A", "exit_price": "N/A",
+        },
+        computed={
+            "tf_badge": _tf_badge_or_v6,
+            "profit": _v6_pnl,
+            "hold_time": lambda data: data.get("duration", data.get("hold_time", "N/A")),
+            "pips_note": when("pips", " ({pips:+.1f} pips)"),
+        },
+        name="v6_exit",
+    ))
+
+    format_v6_tp_hit = staticmethod(compile_template(
+        " <b>V6 TP{tp_level} HIT</b> | {tf_badge}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>TP Level:</b> {tp_level}\n"
+        "<b>Profit:</b> ${profit:+.2f}\n"
+        "{pips_line}"
+        f"{_TIME_LINE}",
+        fields={"timeframe": "N/A", "symbol": "N/A", "tp_level": 1},
+        computed={
+            "tf_badge": _tf_badge_or_v6,
+            "profit": _v6_pnl,
+            "pips_line": when("pips", "<b>Pips:</b> {pips:+.1f}\n"),
+        },
+        name="v6_tp_hit",
+    ))
+
+    format_v6_sl_hit = staticmethod(compile_template(
+        " <b>V6 SL HIT</b> | {tf_badge}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Loss:</b> ${loss:.2f}\n"
+        "{pips_line}"
+        f"{_TIME_LINE}",
+        fields={"timeframe": "N/A", "symbol": "N/A"},
+        computed={
+            "tf_badge": _tf_badge_or_v6,
+            "loss": lambda data: data.get("pnl", data.get("loss", 0)),
+            "pips_line": when("pips", "<b>Pips:</b> {pips:.1f}\n"),
+        },
+        name="v6_sl_hit",
+    ))
+
+    format_v6_timeframe_toggle = staticmethod(compile_template(
+        " <b>V6 {tf_badge} {action}</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Timeframe:</b> {tf_badge}\n"
+        "<b>Status:</b> {action}\n"
+        f"{_TIME_LINE}",
+        fields={"timeframe": "N/A", "enabled": False},
+        computed={
+            "tf_badge": lambda timeframe: _tf_badge(timeframe) if timeframe else timeframe,
+            "action": _status,
+        },
+        name="v6_timeframe_toggle",
+    ))
+
     @staticmethod
     def format_v6_daily_summary(data: Dict) -> str:
         """Format V6 daily summary notification"""
         date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        
+
         message = (
             f" <b>V6 DAILY SUMMARY</b> | {date}\n"
             f"{'=' * 24}\n\n"
             f"<b>By Timeframe:</b>\n"
         )
-        
+
         # Per-timeframe stats
         for tf in ["15m", "30m", "1h", "4h"]:
             tf_data = data.get(tf, {})
             trades = tf_data.get("trades", 0)
             pnl = tf_data.get("pnl", 0)
             win_rate = tf_data.get("win_rate", 0)
-            
+
             if trades > 0:
                 emoji = "" if pnl >= 0 else ""
                 message += f"  {tf.upper()}: {trades} trades, {emoji}${pnl:+.2f} ({win_rate:.0f}% WR)\n"
             else:
                 message += f"  {tf.upper()}: No trades\n"
-        
+
         # Totals
         total_trades = data.get("total_trades", 0)
         total_pnl = data.get("total_pnl", 0)
         total_win_rate = data.get("total_win_rate", 0)
-        
+
         total_emoji = "" if total_pnl >= 0 else ""
-        
+
         message += (
             f"\n<b>V6 Total:</b>\n"
             f"  Trades: {total_trades}\n"
             f"  {total_emoji} P&L: ${total_pnl:+.2f}\n"
             f"  Win Rate: {total_win_rate:.1f}%"
         )
-        
-        return message
-    
-    @staticmethod
-    def format_v6_signal(data: Dict) -> str:
-        """Format V6 signal received notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        pattern = data.get("pattern", "N/A")
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f" <b>V6 SIGNAL</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction_emoji} {direction}\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-            f"<b>Pattern:</b> {pattern}\n"
-        )
-        
-        if data.get("entry"):
-            message += f"<b>Entry:</b> {data.get('entry')}\n"
-        if data.get("sl"):
-            message += f"<b>SL:</b> {data.get('sl')}\n"
-        if data.get("tp"):
-            message += f"<b>TP:</b> {data.get('tp')}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
+
         return message
-    
+
+    format_v6_signal = staticmethod(compile_template(
+        " <b>V6 SIGNAL</b> | {tf_badge}\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b>  {direction}\n"
+        "<b>Timeframe:</b> {tf_badge}\n"
+        "<b>Pattern:</b> {pattern}\n"
+        "{entry_line}{sl_line}{tp_line}"
+        f"{_TIME_LINE}",
+        fields={"timeframe": "N/A", "symbol": "N/A", "direction": "N/A", "pattern": "N/A"},
+        computed={
+            "tf_badge": _tf_badge_or_v6,
+            "entry_line": when("entry", "<b>Entry:</b> {entry}\n"),
+            "sl_line": when("sl", "<b>SL:</b> {sl}\n"),
+            "tp_line": when("tp", "<b>TP:</b> {tp}\n"),
+        },
+        name="v6_signal",
+    ))
+
     # ==================== NEW FORMATTERS (34 total) ====================
-    
+
     # Autonomous System Formatters (5)
-    @staticmethod
-    def format_tp_continuation(data: Dict) -> str:
-        """Format TP continuation notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        level = data.get("level", 1)
-        next_level = data.get("next_level", level + 1)
-        entry = data.get("entry", "N/A")
-        total_profit = data.get("total_profit", 0)
-        
-        message = (
-            f"<b>AUTONOMOUS RE-ENTRY</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol} ({direction})\n"
-            f"<b>Type:</b> TP Continuation\n"
-            f"<b>Progress:</b> Level {level} -> Level {next_level}\n\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
-            f"<b>Status:</b> ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_sl_hunt_activated(data: Dict) -> str:
-        """Format SL Hunt activated notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        sl_price = data.get("sl_price", "N/A")
-        recovery_entry = data.get("recovery_entry", "N/A")
-        attempt = data.get("attempt", 1)
-        
-        message = (
-            f"<b>SL HUNT ACTIVATED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol} ({direction})\n"
-            f"<b>Type:</b> Recovery Entry\n"
-            f"<b>Attempt:</b> {attempt}/1\n\n"
-            f"<b>SL Hit:</b> {sl_price}\n"
-            f"<b>Recovery Entry:</b> {recovery_entry}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_recovery_success(data: Dict) -> str:
-        """Format recovery success notification"""
-        chain_id = data.get("chain_id", "N/A")
-        level = data.get("level", 1)
-        
-        message = (
-            f"<b>RECOVERY SUCCESS</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Resumed to Level:</b> {level}\n"
-            f"<b>Status:</b> ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_recovery_failed(data: Dict) -> str:
-        """Format recovery failed notification"""
-        chain_id = data.get("chain_id", "N/A")
-        reason = data.get("reason", "No more recovery attempts allowed")
-        
-        message = (
-            f"<b>RECOVERY FAILED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Status:</b> STOPPED\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_profit_order_protection(data: Dict) -> str:
-        """Format profit order protection notification"""
-        chain_id = data.get("chain_id", "N/A")
-        level = data.get("level", 1)
-        order_id = data.get("order_id", "N/A")
-        sl_price = data.get("sl_price", "N/A")
-        current_price = data.get("current_price", "N/A")
-        
-        message = (
-            f"<b>PROFIT ORDER PROTECTION</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> #{chain_id}\n"
-            f"<b>Level:</b> {level}\n"
-            f"<b>Order ID:</b> #{order_id}\n"
-            f"<b>SL Price:</b> {sl_price}\n"
-            f"<b>Current Price:</b> {current_price}\n"
-            f"<b>Status:</b> MONITORING ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_tp_continuation = staticmethod(compile_template(
+        "<b>AUTONOMOUS RE-ENTRY</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol} ({direction})\n"
+        "<b>Type:</b> TP Continuation\n"
+        "<b>Progress:</b> Level {level} -> Level {next_level}\n\n"
+        "<b>Entry:</b> {entry}\n"
+        "<b>Total Profit:</b> ${total_profit:+.2f}\n"
+        "<b>Status:</b> ACTIVE\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "direction": "N/A", "level": 1, "entry": "N/A", "total_profit": 0},
+        computed={"next_level": lambda data, level: data.get("next_level", level + 1)},
+        name="tp_continuation",
+    ))
+
+    format_sl_hunt_activated = staticmethod(compile_template(
+        "<b>SL HUNT ACTIVATED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol} ({direction})\n"
+        "<b>Type:</b> Recovery Entry\n"
+        "<b>Attempt:</b> {attempt}/1\n\n"
+        "<b>SL Hit:</b> {sl_price}\n"
+        "<b>Recovery Entry:</b> {recovery_entry}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "direction": "N/A", "sl_price": "N/A", "recovery_entry": "N/A", "attempt": 1},
+        name="sl_hunt_activated",
+    ))
+
+    format_recovery_success = staticmethod(compile_template(
+        "<b>RECOVERY SUCCESS</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Chain:</b> {chain_id}\n"
+        "<b>Resumed to Level:</b> {level}\n"
+        "<b>Status:</b> ACTIVE\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "level": 1},
+        name="recovery_success",
+    ))
+
+    format_recovery_failed = staticmethod(compile_template(
+        "<b>RECOVERY FAILED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Chain:</b> {chain_id}\n"
+        "<b>Status:</b> STOPPED\n"
+        "<b>Reason:</b> {reason}\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "reason": "No more recovery attempts allowed"},
+        name="recovery_failed",
+    ))
+
+    format_profit_order_protection = staticmethod(compile_template(
+        "<b>PROFIT ORDER PROTECTION</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Chain:</b> #{chain_id}\n"
+        "<b>Level:</b> {level}\n"
+        "<b>Order ID:</b> #{order_id}\n"
+        "<b>SL Price:</b> {sl_price}\n"
+        "<b>Current Price:</b> {current_price}\n"
+        "<b>Status:</b> MONITORING ACTIVE\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "level": 1, "order_id": "N/A", "sl_price": "N/A", "current_price": "N/A"},
+        name="profit_order_protection",
+    ))
+
     # Re-entry System Formatters (5)
-    @staticmethod
-    def format_tp_reentry_started(data: Dict) -> str:
-        """Format TP re-entry started notification"""
-        symbol = data.get("symbol", "N/A")
-        level = data.get("level", 1)
-        next_level = data.get("next_level", level + 1)
-        mode = data.get("mode", "Autonomous")
-        
-        message = (
-            f"<b>TP RE-ENTRY</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Level:</b> {level} -> {next_level}\n"
-            f"<b>Mode:</b> {mode}\n"
-            f"<b>Trend Aligned:</b> Yes\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_tp_reentry_executed(data: Dict) -> str:
-        """Format TP re-entry executed notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry = data.get("entry", "N/A")
-        sl = data.get("sl", "N/A")
-        tp = data.get("tp", "N/A")
-        level = data.get("level", 1)
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>TP RE-ENTRY EXECUTED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Level:</b> {level}\n\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>SL:</b> {sl}\n"
-            f"<b>TP:</b> {tp}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_tp_reentry_completed(data: Dict) -> str:
-        """Format TP re-entry chain completed notification"""
-        chain_id = data.get("chain_id", "N/A")
-        total_profit = data.get("total_profit", 0)
-        levels_completed = data.get("levels_completed", 0)
-        max_levels = data.get("max_levels", 5)
-        
-        message = (
-            f"<b>PROFIT CHAIN COMPLETE!</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> #{chain_id}\n"
-            f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
-            f"<b>Levels:</b> {levels_completed}/{max_levels}\n"
-            f"<b>Success Rate:</b> 100%\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_sl_hunt_recovery(data: Dict) -> str:
-        """Format SL Hunt recovery order placed notification"""
-        recovery_for = data.get("recovery_for", "N/A")
-        new_order = data.get("new_order", "N/A")
-        entry = data.get("entry", "N/A")
-        sl = data.get("sl", "N/A")
-        tp = data.get("tp", "N/A")
-        lot = data.get("lot", "N/A")
-        
-        message = (
-            f"<b>SL HUNT RECOVERY ORDER PLACED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Recovery For:</b> #{recovery_for}\n"
-            f"<b>New Order:</b> #{new_order}\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>SL:</b> {sl} (Tight)\n"
-            f"<b>TP:</b> {tp}\n"
-            f"<b>Lot:</b> {lot}\n"
-            f"<b>Status:</b> Recovery attempt in progress...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_exit_continuation(data: Dict) -> str:
-        """Format exit continuation notification"""
-        symbol = data.get("symbol", "N/A")
-        old_direction = data.get("old_direction", "N/A")
-        new_direction = data.get("new_direction", "N/A")
-        pnl = data.get("pnl", 0)
-        closed_id = data.get("closed_id", "N/A")
-        
-        message = (
-            f"<b>REVERSAL EXIT TRIGGERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Closed:</b> #{closed_id}\n"
-            f"<b>Status:</b> Monitoring for continuation...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_tp_reentry_started = staticmethod(compile_template(
+        "<b>TP RE-ENTRY</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Level:</b> {level} -> {next_level}\n"
+        "<b>Mode:</b> {mode}\n"
+        "<b>Trend Aligned:</b> Yes\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "level": 1, "mode": "Autonomous"},
+        computed={"next_level": lambda data, level: data.get("next_level", level + 1)},
+        name="tp_reentry_started",
+    ))
+
+    format_tp_reentry_executed = staticmethod(compile_template(
+        " <b>TP RE-ENTRY EXECUTED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction}\n"
+        "<b>Level:</b> {level}\n\n"
+        "<b>Entry:</b> {entry}\n"
+        "<b>SL:</b> {sl}\n"
+        "<b>TP:</b> {tp}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "direction": "N/A", "entry": "N/A", "sl": "N/A", "tp": "N/A", "level": 1},
+        name="tp_reentry_executed",
+    ))
+
+    format_tp_reentry_completed = staticmethod(compile_template(
+        "<b>PROFIT CHAIN COMPLETE!</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Chain:</b> #{chain_id}\n"
+        "<b>Total Profit:</b> ${total_profit:+.2f}\n"
+        "<b>Levels:</b> {levels_completed}/{max_levels}\n"
+        "<b>Success Rate:</b> 100%\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "total_profit": 0, "levels_completed": 0, "max_levels": 5},
+        name="tp_reentry_completed",
+    ))
+
+    format_sl_hunt_recovery = staticmethod(compile_template(
+        "<b>SL HUNT RECOVERY ORDER PLACED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Recovery For:</b> #{recovery_for}\n"
+        "<b>New Order:</b> #{new_order}\n"
+        "<b>Entry:</b> {entry}\n"
+        "<b>SL:</b> {sl} (Tight)\n"
+        "<b>TP:</b> {tp}\n"
+        "<b>Lot:</b> {lot}\n"
+        "<b>Status:</b> Recovery attempt in progress...\n"
+        f"{_TIME_LINE}",
+        fields={"recovery_for": "N/A", "new_order": "N/A", "entry": "N/A", "sl": "N/A", "tp": "N/A", "lot": "N/A"},
+        name="sl_hunt_recovery",
+    ))
+
+    format_exit_continuation = staticmethod(compile_template(
+        "<b>REVERSAL EXIT TRIGGERED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
+        "<b>P&L:</b> ${pnl:+.2f}\n"
+        "<b>Closed:</b> #{closed_id}\n"
+        "<b>Status:</b> Monitoring for continuation...\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "old_direction": "N/A", "new_direction": "N/A", "pnl": 0, "closed_id": "N/A"},
+        name="exit_continuation",
+    ))
+
     # Signal Event Formatters (4)
-    @staticmethod
-    def format_signal_received(data: Dict) -> str:
-        """Format signal received notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        strategy = data.get("strategy", "N/A")
-        entry = data.get("entry", "N/A")
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>SIGNAL RECEIVED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Strategy:</b> {strategy}\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_signal_ignored(data: Dict) -> str:
-        """Format signal ignored notification"""
-        symbol = data.get("symbol", "N/A")
-        reason = data.get("reason", "N/A")
-        
-        message = (
-            f"<b>SIGNAL IGNORED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_signal_filtered(data: Dict) -> str:
-        """Format signal filtered notification"""
-        symbol = data.get("symbol", "N/A")
-        filter_type = data.get("filter_type", "Duplicate")
-        
-        message = (
-            f"<b>SIGNAL FILTERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Filter:</b> {filter_type}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_trend_changed(data: Dict) -> str:
-        """Format trend changed notification"""
-        symbol = data.get("symbol", "N/A")
-        timeframe = data.get("timeframe", "N/A")
-        old_trend = data.get("old_trend", "NEUTRAL")
-        new_trend = data.get("new_trend", "N/A")
-        mode = data.get("mode", "AUTO")
-        
-        trend_emoji = "" if new_trend.upper() == "BULLISH" else ("" if new_trend.upper() == "BEARISH" else "")
-        
-        message = (
-            f"<b>TREND UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Timeframe:</b> {timeframe}\n"
-            f"<b>Old:</b> {old_trend}\n"
-            f"<b>New:</b> {trend_emoji} {new_trend}\n"
-            f"<b>Mode:</b> {mode}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_signal_received = staticmethod(compile_template(
+        " <b>SIGNAL RECEIVED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction}\n"
+        "<b>Strategy:</b> {strategy}\n"
+        "<b>Entry:</b> {entry}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "direction": "N/A", "strategy": "N/A", "entry": "N/A"},
+        name="signal_received",
+    ))
+
+    format_signal_ignored = staticmethod(compile_template(
+        "<b>SIGNAL IGNORED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Reason:</b> {reason}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "reason": "N/A"},
+        name="signal_ignored",
+    ))
+
+    format_signal_filtered = staticmethod(compile_template(
+        "<b>SIGNAL FILTERED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Filter:</b> {filter_type}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "filter_type": "Duplicate"},
+        name="signal_filtered",
+    ))
+
+    format_trend_changed = staticmethod(compile_template(
+        "<b>TREND UPDATE</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Timeframe:</b> {timeframe}\n"
+        "<b>Old:</b> {old_trend}\n"
+        "<b>New:</b>  {new_trend}\n"
+        "<b>Mode:</b> {mode}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "timeframe": "N/A", "old_trend": "NEUTRAL", "new_trend": "N/A", "mode": "AUTO"},
+        name="trend_changed",
+    ))
+
     # Trade Event Formatters (3)
-    @staticmethod
-    def format_partial_close(data: Dict) -> str:
-        """Format partial close notification"""
-        symbol = data.get("symbol", "N/A")
-        closed_lots = data.get("closed_lots", 0)
-        remaining_lots = data.get("remaining_lots", 0)
-        pnl = data.get("pnl", 0)
-        
-        message = (
-            f"<b>PARTIAL CLOSE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Closed:</b> {closed_lots} lots\n"
-            f"<b>Remaining:</b> {remaining_lots} lots\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_manual_exit(data: Dict) -> str:
-        """Format manual exit notification"""
-        symbol = data.get("symbol", "N/A")
-        pnl = data.get("pnl", 0)
-        exit_price = data.get("exit_price", "N/A")
-        trade_id = data.get("trade_id", "N/A")
-        
-        emoji = "" if pnl >= 0 else ""
-        
-        message = (
-            f"{emoji} <b>MANUAL EXIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Exit Price:</b> {exit_price}\n"
-            f"<b>Reason:</b> Manual close\n"
-            f"<b>Trade #:</b> {trade_id}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_reversal_exit(data: Dict) -> str:
-        """Format reversal exit notification"""
-        symbol = data.get("symbol", "N/A")
-        old_direction = data.get("old_direction", "N/A")
-        new_direction = data.get("new_direction", "N/A")
-        pnl = data.get("pnl", 0)
-        closed_id = data.get("closed_id", "N/A")
-        
-        message = (
-            f"<b>REVERSAL EXIT TRIGGERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Closed:</b> #{closed_id}\n"
-            f"<b>Status:</b> Monitoring for continuation...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_partial_close = staticmethod(compile_template(
+        "<b>PARTIAL CLOSE</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Closed:</b> {closed_lots} lots\n"
+        "<b>Remaining:</b> {remaining_lots} lots\n"
+        "<b>P&L:</b> ${pnl:+.2f}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "closed_lots": 0, "remaining_lots": 0, "pnl": 0},
+        name="partial_close",
+    ))
+
+    format_manual_exit = staticmethod(compile_template(
+        " <b>MANUAL EXIT</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>P&L:</b> ${pnl:+.2f}\n"
+        "<b>Exit Price:</b> {exit_price}\n"
+        "<b>Reason:</b> Manual close\n"
+        "<b>Trade #:</b> {trade_id}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "pnl": 0, "exit_price": "N/A", "trade_id": "N/A"},
+        name="manual_exit",
+    ))
+
+    format_reversal_exit = staticmethod(compile_template(
+        "<b>REVERSAL EXIT TRIGGERED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
+        "<b>P&L:</b> ${pnl:+.2f}\n"
+        "<b>Closed:</b> #{closed_id}\n"
+        "<b>Status:</b> Monitoring for continuation...\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "old_direction": "N/A", "new_direction": "N/A", "pnl": 0, "closed_id": "N/A"},
+        name="reversal_exit",
+    ))
+
     # System Event Formatters (6)
-    @staticmethod
-    def format_mt5_connected(data: Dict) -> str:
-        """Format MT5 connected notification"""
-        account = data.get("account", "N/A")
-        server = data.get("server", "N/A")
-        
-        message = (
-            f"<b>MT5 CONNECTED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Account:</b> {account}\n"
-            f"<b>Server:</b> {server}\n"
-            f"<b>Status:</b> Connected\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_lifetime_loss_limit(data: Dict) -> str:
-        """Format lifetime loss limit notification"""
-        total_loss = data.get("total_loss", 0)
-        limit = data.get("limit", 0)
-        
-        message = (
-            f"<b>LIFETIME LOSS LIMIT REACHED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Total Loss:</b> ${total_loss:.2f}\n"
-            f"<b>Limit:</b> ${limit:.2f}\n"
-            f"<b>Status:</b> TRADING STOPPED\n"
-            f"<b>Action:</b> Manual intervention required\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_daily_loss_warning(data: Dict) -> str:
-        """Format daily loss warning notification"""
-        current_loss = data.get("current_loss", 0)
-        daily_limit = data.get("daily_limit", 0)
-        remaining = data.get("remaining", 0)
-        percentage = data.get("percentage", 0)
-        
-        message = (
-            f"<b>DAILY LOSS APPROACHING LIMIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Current Loss:</b> ${current_loss:.2f}\n"
-            f"<b>Daily Limit:</b> ${daily_limit:.2f}\n"
-            f"<b>Remaining:</b> ${remaining:.2f} ({percentage:.0f}%)\n"
-            f"<b>Warning:</b> Trade cautiously!\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_config_error(data: Dict) -> str:
-        """Format config error notification"""
-        error = data.get("error", "Unknown error")
-        details = data.get("details", "No details available")
-        
-        message = (
-            f"<b>CONFIGURATION ERROR</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Error:</b> {error}\n"
-            f"<b>Details:</b> {details}\n"
-            f"<b>Action:</b> Please check config.json and restart\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_database_error(data: Dict) -> str:
-        """Format database error notification"""
-        operation = data.get("operation", "Unknown")
-        error = data.get("error", "Unknown error")
-        
-        message = (
-            f"<b>DATABASE ERROR</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Operation:</b> {operation}\n"
-            f"<b>Error:</b> {error}\n"
-            f"<b>Action:</b> Check logs for details\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_order_failed(data: Dict) -> str:
-        """Format order failed notification"""
-        symbol = data.get("symbol", "N/A")
-        reason = data.get("reason", "Unknown")
-        
-        message = (
-            f"<b>ORDER PLACEMENT FAILED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Action:</b> Trade cancelled\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_mt5_connected = staticmethod(compile_template(
+        "<b>MT5 CONNECTED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Account:</b> {account}\n"
+        "<b>Server:</b> {server}\n"
+        "<b>Status:</b> Connected\n"
+        f"{_TIME_LINE}",
+        fields={"account": "N/A", "server": "N/A"},
+        name="mt5_connected",
+    ))
+
+    format_lifetime_loss_limit = staticmethod(compile_template(
+        "<b>LIFETIME LOSS LIMIT REACHED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Total Loss:</b> ${total_loss:.2f}\n"
+        "<b>Limit:</b> ${limit:.2f}\n"
+        "<b>Status:</b> TRADING STOPPED\n"
+        "<b>Action:</b> Manual intervention required\n"
+        f"{_TIME_LINE}",
+        fields={"total_loss": 0, "limit": 0},
+        name="lifetime_loss_limit",
+    ))
+
+    format_daily_loss_warning = staticmethod(compile_template(
+        "<b>DAILY LOSS APPROACHING LIMIT</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Current Loss:</b> ${current_loss:.2f}\n"
+        "<b>Daily Limit:</b> ${daily_limit:.2f}\n"
+        "<b>Remaining:</b> ${remaining:.2f} ({percentage:.0f}%)\n"
+        "<b>Warning:</b> Trade cautiously!\n"
+        f"{_TIME_LINE}",
+        fields={"current_loss": 0, "daily_limit": 0, "remaining": 0, "percentage": 0},
+        name="daily_loss_warning",
+    ))
+
+    format_config_error = staticmethod(compile_template(
+        "<b>CONFIGURATION ERROR</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Error:</b> {error}\n"
+        "<b>Details:</b> {details}\n"
+        "<b>Action:</b> Please check config.json and restart\n"
+        f"{_TIME_LINE}",
+        fields={"error": "Unknown error", "details": "No details available"},
+        name="config_error",
+    ))
+
+    format_database_error = staticmethod(compile_template(
+        "<b>DATABASE ERROR</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Operation:</b> {operation}\n"
+        "<b>Error:</b> {error}\n"
+        "<b>Action:</b> Check logs for details\n"
+        f"{_TIME_LINE}",
+        fields={"operation": "Unknown", "error": "Unknown error"},
+        name="database_error",
+    ))
+
+    format_order_failed = staticmethod(compile_template(
+        "<b>ORDER PLACEMENT FAILED</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Reason:</b> {reason}\n"
+        "<b>Action:</b> Trade cancelled\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "reason": "Unknown"},
+        name="order_failed",
+    ))
+
     # Session Event Formatters (4)
-    @staticmethod
-    def format_session_toggle(data: Dict) -> str:
-        """Format session toggle notification"""
-        session = data.get("session", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>SESSION UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_symbol_toggle(data: Dict) -> str:
-        """Format symbol toggle notification"""
-        session = data.get("session", "N/A")
-        symbol = data.get("symbol", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>SYMBOL UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_time_adjustment(data: Dict) -> str:
-        """Format time adjustment notification"""
-        session = data.get("session", "N/A")
-        adjustment_type = data.get("type", "Start")
-        adjustment = data.get("adjustment", "+30")
-        new_time = data.get("new_time", "N/A")
-        
-        message = (
-            f"<b>TIME ADJUSTMENT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>{adjustment_type} Time:</b> {adjustment} minutes\n"
-            f"<b>New Time:</b> {new_time} UTC\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_force_close_toggle(data: Dict) -> str:
-        """Format force close toggle notification"""
-        session = data.get("session", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>FORCE CLOSE UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Force Close:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
+    format_session_toggle = staticmethod(compile_template(
+        "<b>SESSION UPDATE</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Session:</b> {session}\n"
+        "<b>Status:</b> {status}\n"
+        f"{_TIME_LINE}",
+        fields={"session": "N/A", "enabled": False},
+        computed={"status": _status},
+        name="session_toggle",
+    ))
+
+    format_symbol_toggle = staticmethod(compile_template(
+        "<b>SYMBOL UPDATE</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Session:</b> {session}\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Status:</b> {status}\n"
+        f"{_TIME_LINE}",
+        fields={"session": "N/A", "symbol": "N/A", "enabled": False},
+        computed={"status": _status},
+        name="symbol_toggle",
+    ))
+
+    format_time_adjustment = staticmethod(compile_template(
+        "<b>TIME ADJUSTMENT</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Session:</b> {session}\n"
+        "<b>{type} Time:</b> {adjustment} minutes\n"
+        "<b>New Time:</b> {new_time} UTC\n"
+        f"{_TIME_LINE}",
+        fields={"session": "N/A", "type": "Start", "adjustment": "+30", "new_time": "N/A"},
+        name="time_adjustment",
+    ))
+
+    format_force_close_toggle = staticmethod(compile_template(
+        "<b>FORCE CLOSE UPDATE</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Session:</b> {session}\n"
+        "<b>Force Close:</b> {status}\n"
+        f"{_TIME_LINE}",
+        fields={"session": "N/A", "enabled": False},
+        computed={"status": _status},
+        name="force_close_toggle",
+    ))
+
     # Voice Alert Formatters (5)
-    @staticmethod
-    def format_voice_trade_entry(data: Dict) -> str:
-        """Format voice trade entry notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        price = data.get("price", "N/A")
-        
-        message = f"New trade opened. {symbol} {direction} at {price}"
-        return message
-    
-    @staticmethod
-    def format_voice_tp_hit(data: Dict) -> str:
-        """Format voice TP hit notification"""
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("profit", 0)
-        
-        message = f"Take profit hit. {symbol} profit {profit:.2f} dollars"
-        return message
-    
-    @staticmethod
-    def format_voice_sl_hit(data: Dict) -> str:
-        """Format voice SL hit notification"""
-        symbol = data.get("symbol", "N/A")
-        loss = data.get("loss", 0)
-        
-        message = f"Stop loss hit. {symbol} loss {abs(loss):.2f} dollars"
-        return message
-    
-    @staticmethod
-    def format_voice_risk_limit(data: Dict) -> str:
-        """Format voice risk limit notification"""
-        limit_type = data.get("limit_type", "Daily")
-        
-        message = f"Warning. {limit_type} loss limit reached. Trading paused."
-        return message
-    
-    @staticmethod
-    def format_voice_recovery(data: Dict) -> str:
-        """Format voice recovery notification"""
-        symbol = data.get("symbol", "N/A")
-        
-        message = f"Recovery attempt started for {symbol}"
-        return message
-    
+    format_voice_trade_entry = staticmethod(compile_template(
+        "New trade opened. {symbol} {direction} at {price}",
+        fields={"symbol": "N/A", "direction": "N/A", "price": "N/A"},
+        name="voice_trade_entry",
+    ))
+
+    format_voice_tp_hit = staticmethod(compile_template(
+        "Take profit hit. {symbol} profit {profit:.2f} dollars",
+        fields={"symbol": "N/A", "profit": 0},
+        name="voice_tp_hit",
+    ))
+
+    format_voice_sl_hit = staticmethod(compile_template(
+        "Stop loss hit. {symbol} loss {abs_loss:.2f} dollars",
+        fields={"symbol": "N/A", "loss": 0},
+        computed={"abs_loss": lambda loss: abs(loss)},
+        name="voice_sl_hit",
+    ))
+
+    format_voice_risk_limit = staticmethod(compile_template(
+        "Warning. {limit_type} loss limit reached. Trading paused.",
+        fields={"limit_type": "Daily"},
+        name="voice_risk_limit",
+    ))
+
+    format_voice_recovery = staticmethod(compile_template(
+        "Recovery attempt started for {symbol}",
+        fields={"symbol": "N/A"},
+        name="voice_recovery",
+    ))
+
     # Dashboard Formatters (2)
-    @staticmethod
-    def format_dashboard_update(data: Dict) -> str:
-        """Format dashboard update notification"""
-        balance = data.get("balance", 0)
-        open_trades = data.get("open_trades", 0)
-        live_pnl = data.get("live_pnl", 0)
-        today_pnl = data.get("today_pnl", 0)
-        trades_today = data.get("trades_today", 0)
-        
-        pnl_emoji = "" if live_pnl >= 0 else ""
-        
-        message = (
-            f"<b>ZEPIX TRADING BOT DASHBOARD</b>\n"
-            f"{'=' * 30}\n\n"
-            f"<b>LIVE STATUS</b>\n"
-            f"  Bot: RUNNING\n"
-            f"  Balance: ${balance:,.2f}\n"
-            f"  Open Trades: {open_trades}\n"
-            f"  Live PnL: {pnl_emoji}${live_pnl:+.2f}\n\n"
-            f"<b>TODAY'S PERFORMANCE</b>\n"
-            f"  Net PnL: ${today_pnl:+.2f}\n"
-            f"  Trades Today: {trades_today}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_autonomous_dashboard(data: Dict) -> str:
-        """Format autonomous dashboard notification"""
-        status = data.get("status", "RUNNING")
-        daily_recoveries = data.get("daily_recoveries", 0)
-        max_recoveries = data.get("max_recoveries", 10)
-        active_monitors = data.get("active_monitors", 0)
-        tp_continuation = data.get("tp_continuation", True)
-        sl_hunt_recovery = data.get("sl_hunt_recovery", True)
-        exit_continuation = data.get("exit_continuation", True)
-        
-        message = (
-            f"<b>AUTONOMOUS DASHBOARD</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Daily Recoveries:</b> {daily_recoveries}/{max_recoveries}\n"
-            f"<b>Active Monitors:</b> {active_monitors}\n\n"
-            f"<b>Sub-Systems:</b>\n"
-            f"  Profit Protection: Active\n"
-            f"  SL Optimizer: Active\n"
-            f"  Recovery Windows: Active\n\n"
-            f"<b>Active Configuration:</b>\n"
-            f"  TP Continuation: {'ON' if tp_continuation else 'OFF'}\n"
-            f"  SL Hunt Recovery: {'ON' if sl_hunt_recovery else 'OFF'}\n"
-            f"  Exit Continuation: {'ON' if exit_continuation else 'OFF'}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    format_dashboard_update = staticmethod(compile_template(
+        "<b>ZEPIX TRADING BOT DASHBOARD</b>\n"
+        f"{'=' * 30}\n\n"
+        "<b>LIVE STATUS</b>\n"
+        "  Bot: RUNNING\n"
+        "  Balance: ${balance:,.2f}\n"
+        "  Open Trades: {open_trades}\n"
+        "  Live PnL: ${live_pnl:+.2f}\n\n"
+        "<b>TODAY'S PERFORMANCE</b>\n"
+        "  Net PnL: ${today_pnl:+.2f}\n"
+        "  Trades Today: {trades_today}\n"
+        f"{_TIME_LINE}",
+        fields={"balance": 0, "open_trades": 0, "live_pnl": 0, "today_pnl": 0, "trades_today": 0},
+        name="dashboard_update",
+    ))
+
+    format_autonomous_dashboard = staticmethod(compile_template(
+        "<b>AUTONOMOUS DASHBOARD</b>\n"
+        f"{_RULE}\n\n"
+        "<b>Status:</b> {status}\n"
+        "<b>Daily Recoveries:</b> {daily_recoveries}/{max_recoveries}\n"
+        "<b>Active Monitors:</b> {active_monitors}\n\n"
+        "<b>Sub-Systems:</b>\n"
+        "  Profit Protection: Active\n"
+        "  SL Optimizer: Active\n"
+        "  Recovery Windows: Active\n\n"
+        "<b>Active Configuration:</b>\n"
+        "  TP Continuation: {tp_continuation_state}\n"
+        "  SL Hunt Recovery: {sl_hunt_recovery_state}\n"
+        "  Exit Continuation: {exit_continuation_state}\n"
+        f"{_TIME_LINE}",
+        fields={
+            "status": "RUNNING", "daily_recoveries": 0, "max_recoveries": 10, "active_monitors": 0,
+            "tp_continuation": True, "sl_hunt_recovery": True, "exit_continuation": True,
+        },
+        computed={
+            "tp_continuation_state": lambda tp_continuation: _on_off(tp_continuation),
+            "sl_hunt_recovery_state": lambda sl_hunt_recovery: _on_off(sl_hunt_recovery),
+            "exit_continuation_state": lambda exit_continuation: _on_off(exit_continuation),
+        },
+        name="autonomous_dashboard",
+    ))
 
 
 def create_default_router(
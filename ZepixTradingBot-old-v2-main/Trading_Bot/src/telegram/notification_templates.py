@@ -14,6 +14,8 @@ Date: 2026-01-20
 from typing import Dict, Any
 from datetime import datetime
 
+from src.telegram.template_engine import get_compiled
+
 
 def create_progress_bar(current: float, target: float, width: int = 10) -> str:
     """Create visual progress bar using Unicode characters"""
@@ -527,7 +529,13 @@ class NotificationTemplates:
             data["plugin_badge"] = ""
         
         try:
-            return template.format(**data)
+            render = get_compiled(template).render
+        except ValueError:
+            # Placeholder syntax the template engine does not compile
+            render = lambda values: template.format(**values)
+        
+        try:
+            return render(data)
         except KeyError as e:
             # Missing key, return template with error note
             return f"{template}\n\n⚠️ <i>Missing data: {e}</i>"
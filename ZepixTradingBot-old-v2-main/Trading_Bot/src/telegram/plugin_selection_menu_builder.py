@@ -12,6 +12,8 @@ Part of: TELEGRAM_V5_PLUGIN_SELECTION_UPGRADE
 import logging
 from typing import Dict, List, Optional
 
+from src.telegram.render_cache import get_menu_render_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,6 +140,14 @@ class PluginSelectionMenuBuilder:
         # Remove leading slash from command
         cmd_clean = command[1:] if command.startswith('/') else command
         
+        return get_menu_render_cache().get_or_render(
+            "plugin_selection", (cmd_clean, include_both, include_cancel),
+            lambda: (None, cls._render_selection_keyboard(cmd_clean, include_both, include_cancel))
+        ).reply_markup
+    
+    @classmethod
+    def _render_selection_keyboard(cls, cmd_clean: str, include_both: bool, include_cancel: bool) -> Dict:
+        """Selection keyboard for one command (cached by build_selection_keyboard)"""
         # Build button rows
         buttons = []
         
@@ -25,6 +25,9 @@ from typing import Optional, Dict, List, Callable, Any
 from enum import Enum
 from dataclasses import dataclass, field
 
+from src.monitoring.metrics_registry import TELEGRAM_QUEUE_DEPTH, TELEGRAM_SEND_LATENCY, get_metrics_registry
+from src.monitoring.metrics_collectors import rate_limiter_collector
+
 logger = logging.getLogger(__name__)
 
 
@@ -202,6 +205,12 @@ class TelegramRateLimiter:
             "by_priority": {p.name: 0 for p in MessagePriority}
         }
         
+        # Unified metrics (exposed on /metrics)
+        self._queue_depth_gauge = TELEGRAM_QUEUE_DEPTH.labels(bot=bot_name)
+        get_metrics_registry().register_collector(
+            f"telegram_rate_limiter:{bot_name}", rate_limiter_collector({bot_name: self})
+        )
+        
         # Control
         self._running = False
         self._processor_thread: Optional[threading.Thread] = None
@@ -287,6 +296,7 @@ class TelegramRateLimiter:
             self.queues[message.priority].append(message)
             self.stats["total_queued"] += 1
             self.stats["by_priority"][message.priority.name] += 1
+            self._queue_depth_gauge.set(self._get_total_queued())
             
             return True
     
@@ -337,7 +347,9 @@ class TelegramRateLimiter:
                 MessagePriority.LOW
             ]:
                 if len(self.queues[priority]) > 0:
-                    return self.queues[priority].popleft()
+                    message = self.queues[priority].popleft()
+                    self._queue_depth_gauge.set(self._get_total_queued())
+                    return message
             return None
     
     def _send_message(self, message: ThrottledMessage) -> bool:
@@ -361,12 +373,16 @@ class TelegramRateLimiter:
                 return False
             
             # Send via callback
+            start = time.perf_counter()
             result = self.send_callback(
                 chat_id=message.chat_id,
                 text=message.text,
                 parse_mode=message.parse_mode,
                 reply_markup=message.reply_markup
             )
+            TELEGRAM_SEND_LATENCY.labels(
+                bot=self.bot_name, status='success' if result else 'error'
+            ).observe(time.perf_counter() - start)
             
             if result:
                 self.stats["total_sent"] += 1
@@ -412,6 +428,7 @@ class TelegramRateLimiter:
                     message.retries += 1
                     with self._lock:
                         self.queues[message.priority].appendleft(message)
+                        self._queue_depth_gauge.set(self._get_total_queued())
                     self._stop_event.wait(0.5)  # Wait before retry
                 
                 # Small delay to spread out messages
@@ -460,6 +477,7 @@ class TelegramRateLimiter:
                 for q in self.queues.values():
                     q.clear()
                 logger.info(f"{self.bot_name}: Cleared all {total} messages")
+            self._queue_depth_gauge.set(self._get_total_queued())
 
 
 class MultiRateLimiter:
@@ -0,0 +1,186 @@
+"""
+Menu Render Cache - Memoized Menu Text and Keyboards
+
+Most menus are static or depend on a handful of toggles, yet every button
+press rebuilt the nested keyboard dicts (and the bot re-serialised them).
+This cache stores rendered menus keyed by (menu id, state fingerprint):
+
+- The fingerprint is the small piece of state a menu actually shows
+  (a toggle, a command name, a config section), so a changed toggle is a
+  different key and can never serve a stale menu
+- Dict keyboards are stored as ``RenderedMarkup`` - a plain dict that
+  also carries its JSON form, which the Telegram client sends as is
+- Menus declare the config keys they read (``depends_on``); with the
+  bot's ``Config`` (or a ``ConfigManager``) attached, observed changes
+  drop those entries so superseded renders do not linger until evicted
+- Entries are LRU-bounded
+
+Cached text and keyboards are shared between callers and must be treated
+as read-only.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class RenderedMarkup(dict):
+    """Inline keyboard dict with its JSON serialisation precomputed"""
+
+    def __init__(self, markup: Dict[str, Any]):
+        super().__init__(markup)
+        self.serialized = json.dumps(markup, ensure_ascii=False, separators=(",", ":"))
+
+
+def serialize_markup(reply_markup: Any) -> Any:
+    """Value to put in an API payload: the precomputed JSON when available"""
+    return getattr(reply_markup, "serialized", reply_markup)
+
+
+@dataclass
+class RenderedMenu:
+    """One cached render"""
+    text: Optional[str]
+    reply_markup: Any
+    depends_on: Tuple[str, ...] = ()
+
+
+class MenuRenderCache:
+    """
+    LRU cache of rendered menus.
+
+    Usage:
+        menu = cache.get_or_render(
+            "timeframe", (enabled,), render_timeframe_menu,
+            depends_on=("timeframe_specific_config",)
+        )
+        bot.edit_message(menu.text, message_id, menu.reply_markup)
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], RenderedMenu]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._config_managers: List[Any] = []
+        self.stats = {"hits": 0, "misses": 0, "invalidated": 0, "evicted": 0}
+
+    def get_or_render(
+        self,
+        menu_id: str,
+        fingerprint: Hashable,
+        render: Callable[[], Tuple[Optional[str], Any]],
+        depends_on: Iterable[str] = ()
+    ) -> RenderedMenu:
+        """
+        Cached render of ``menu_id`` for ``fingerprint``, rendering on a miss.
+
+        Args:
+            menu_id: Menu identifier
+            fingerprint: Hashable summary of every state the menu shows
+            render: Returns (text, reply_markup); dict keyboards are frozen
+                into RenderedMarkup
+            depends_on: Config keys (dotted) the menu reads
+        """
+        key = (menu_id, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry
+
+        text, reply_markup = render()
+        if isinstance(reply_markup, dict) and not isinstance(reply_markup, RenderedMarkup):
+            reply_markup = RenderedMarkup(reply_markup)
+        entry = RenderedMenu(text, reply_markup, tuple(depends_on))
+
+        with self._lock:
+            self.stats["misses"] += 1
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evicted"] += 1
+        return entry
+
+    # -------------------- Invalidation --------------------
+
+    def invalidate(self, menu_id: Optional[str] = None) -> int:
+        """Drop every entry of ``menu_id`` (all entries when None)"""
+        with self._lock:
+            keys = [k for k in self._entries if menu_id is None or k[0] == menu_id]
+            for key in keys:
+                del self._entries[key]
+            self.stats["invalidated"] += len(keys)
+        return len(keys)
+
+    def invalidate_config_keys(self, keys: Iterable[str]) -> int:
+        """Drop entries that depend on any of the dotted config ``keys``"""
+        changed = list(keys)
+        with self._lock:
+            stale = [
+                cache_key for cache_key, entry in self._entries.items()
+                if any(_keys_overlap(dep, key) for dep in entry.depends_on for key in changed)
+            ]
+            for cache_key in stale:
+                del self._entries[cache_key]
+            self.stats["invalidated"] += len(stale)
+        if stale:
+            logger.debug(f"[MenuRenderCache] {len(stale)} menus invalidated by config change")
+        return len(stale)
+
+    def on_config_change(self, changes: List[Any]):
+        """Config / ConfigManager observer"""
+        self.invalidate_config_keys(change.key for change in changes)
+
+    def attach(self, config_manager) -> None:
+        """Invalidate on changes observed by ``config_manager`` (a Config or ConfigManager)"""
+        if config_manager in self._config_managers:
+            return
+        config_manager.register_observer(self.on_config_change)
+        self._config_managers.append(config_manager)
+        logger.info("[MenuRenderCache] Attached to ConfigManager")
+
+    def detach(self, config_manager) -> None:
+        if config_manager in self._config_managers:
+            config_manager.unregister_observer(self.on_config_change)
+            self._config_managers.remove(config_manager)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": round(self.stats["hits"] / lookups * 100, 1) if lookups else 0.0,
+        }
+
+
+def _keys_overlap(dependency: str, changed: str) -> bool:
+    """True when one dotted config key is the other or nested under it"""
+    return (
+        dependency == changed
+        or changed.startswith(dependency + ".")
+        or dependency.startswith(changed + ".")
+    )
+
+
+# ==================== Singleton ====================
+
+_cache: Optional[MenuRenderCache] = None
+
+
+def get_menu_render_cache() -> MenuRenderCache:
+    """Get the process-wide menu render cache"""
+    global _cache
+    if _cache is None:
+        _cache = MenuRenderCache()
+    return _cache
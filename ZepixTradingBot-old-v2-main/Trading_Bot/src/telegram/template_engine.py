@@ -0,0 +1,236 @@
+"""
+Template Engine - Precompiled Notification Templates
+
+Notification formatters used to be long f-string functions that repeat
+the same ``data.get(...)`` lookups on every call. Templates here are
+written once as ``str.format`` sources with a declared field list and
+compiled into a single generated render function:
+
+- ``fields`` maps every data key the template reads to its default;
+  placeholders that are not declared fail at compile time, not at send
+- ``computed`` values (emojis, badges, ``abs(loss)`` ...) are callables
+  whose parameter names are the fields they need (``data`` = raw dict)
+- ``when(key, source)`` renders an optional block only if ``data[key]``
+  is truthy (the ``if data.get("sl"): message += ...`` pattern)
+- ``{time}`` is always available (local ``HH:MM:SS`` at render time)
+
+The generated function performs one dict lookup per field and builds the
+text with a single f-string, so a compiled template is a drop-in
+``formatter(data) -> str``.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+from string import Formatter
+import inspect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Marks a field without default: a missing key raises KeyError (str.format semantics)
+REQUIRED = object()
+
+_clock = {"second": None, "text": ""}
+
+
+def _time_hms() -> str:
+    """Local ``HH:MM:SS``, formatted at most once per second"""
+    now = time.time()
+    second = int(now)
+    if second != _clock["second"]:
+        _clock["text"] = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+        _clock["second"] = second
+    return _clock["text"]
+
+
+_BUILTINS: Dict[str, Callable[[], Any]] = {
+    "time": _time_hms,
+}
+
+_FORBIDDEN_SPEC_CHARS = set("{}\\'\"")
+
+
+class CompiledTemplate:
+    """
+    A template compiled into one render function.
+
+    Usage:
+        tp_hit = compile_template(
+            "<b>TP HIT</b> {symbol}\\n  Profit: ${profit:.2f}",
+            fields={"symbol": "UNKNOWN", "profit": 0.0},
+        )
+        tp_hit({"symbol": "XAUUSD", "profit": 12.5})
+    """
+
+    __slots__ = ("name", "source", "fields", "computed", "placeholders", "render")
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        fields: Tuple[str, ...],
+        computed: Tuple[str, ...],
+        placeholders: Tuple[str, ...],
+        render: Callable[[Dict[str, Any]], str],
+    ):
+        self.name = name
+        self.source = source
+        self.fields = fields
+        self.computed = computed
+        self.placeholders = placeholders
+        self.render = render
+
+    def __call__(self, data: Dict[str, Any]) -> str:
+        return self.render(data)
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.name!r}, fields={self.fields})"
+
+
+def compile_template(
+    source: str,
+    fields: Optional[Dict[str, Any]] = None,
+    computed: Optional[Dict[str, Callable[..., Any]]] = None,
+    name: str = "template",
+) -> CompiledTemplate:
+    """
+    Compile ``source`` into a render function.
+
+    Args:
+        source: ``str.format`` template; placeholders are plain names with
+            optional conversion and format spec (``{pnl!s:>8}``, ``{pnl:+.2f}``)
+        fields: data key -> default (``REQUIRED`` for no default)
+        computed: derived name -> callable; parameters name the fields,
+            earlier computed values or builtins it needs (``data`` = raw dict)
+        name: Template name used in errors and the generated code
+
+    Raises:
+        ValueError: Undeclared placeholder or dependency, unsupported syntax
+    """
+    fields = dict(fields or {})
+    computed = dict(computed or {})
+    namespace: Dict[str, Any] = {"_REQUIRED": REQUIRED}
+    known = set(fields)
+    body: List[str] = []
+    used_builtins = []
+
+    def need(dependency: str, where: str):
+        if dependency in known or dependency == "data":
+            return
+        if dependency in _BUILTINS:
+            if dependency not in used_builtins:
+                used_builtins.append(dependency)
+            return
+        raise ValueError(f"Template {name!r}: {where} uses undeclared field {dependency!r}")
+
+    overlap = set(fields) & set(computed)
+    if overlap:
+        raise ValueError(f"Template {name!r}: {sorted(overlap)} declared as field and computed")
+
+    lines = ["def render(data):", "    _get = data.get"]
+    for index, (field_name, default) in enumerate(fields.items()):
+        if not field_name.isidentifier():
+            raise ValueError(f"Template {name!r}: field {field_name!r} is not an identifier")
+        if default is REQUIRED:
+            lines.append(f"    f_{field_name} = data[{field_name!r}]")
+        else:
+            namespace[f"_d{index}"] = default
+            lines.append(f"    f_{field_name} = _get({field_name!r}, _d{index})")
+
+    computed_lines = []
+    for index, (value_name, fn) in enumerate(computed.items()):
+        params = list(inspect.signature(fn).parameters)
+        for param in params:
+            need(param, f"computed {value_name!r}")
+        namespace[f"_c{index}"] = fn
+        args = ", ".join("data" if p == "data" else f"f_{p}" for p in params)
+        computed_lines.append(f"    f_{value_name} = _c{index}({args})")
+        known.add(value_name)
+
+    placeholders = []
+    for literal, field_name, spec, conversion in Formatter().parse(source):
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if not field_name.isidentifier():
+            raise ValueError(f"Template {name!r}: unsupported placeholder {{{field_name}}}")
+        if spec and (_FORBIDDEN_SPEC_CHARS & set(spec)):
+            raise ValueError(f"Template {name!r}: unsupported format spec {spec!r}")
+        need(field_name, "placeholder")
+        placeholders.append(field_name)
+        body.append(
+            "{f_" + field_name
+            + (f"!{conversion}" if conversion else "")
+            + (f":{spec}" if spec else "") + "}"
+        )
+
+    for builtin in used_builtins:
+        namespace[f"_b_{builtin}"] = _BUILTINS[builtin]
+        lines.append(f"    f_{builtin} = _b_{builtin}()")
+    lines.extend(computed_lines)
+    lines.append("    return f" + repr("".join(body)))
+
+    code = "\n".join(lines)
+    try:
+        exec(compile(code, f"<template {name}>", "exec"), namespace)
+    except SyntaxError as e:
+        raise ValueError(f"Template {name!r} failed to compile: {e}") from e
+
+    return CompiledTemplate(
+        name=name,
+        source=source,
+        fields=tuple(fields),
+        computed=tuple(computed),
+        placeholders=tuple(placeholders),
+        render=namespace["render"],
+    )
+
+
+def when(key: str, source: str, fields: Optional[Dict[str, Any]] = None,
+         computed: Optional[Dict[str, Callable[..., Any]]] = None) -> Callable[[Dict[str, Any]], str]:
+    """
+    Computed value that renders ``source`` only when ``data[key]`` is truthy.
+
+    ``key`` is declared as a field of the block automatically (no default).
+    """
+    block_fields = {key: None, **(fields or {})}
+    block = compile_template(source, block_fields, computed, name=f"when:{key}")
+
+    def optional_block(data):
+        return block.render(data) if data.get(key) else ""
+
+    return optional_block
+
+
+# ==================== Ad-hoc Templates ====================
+
+_format_cache: Dict[str, CompiledTemplate] = {}
+_format_lock = threading.Lock()
+
+
+def get_compiled(source: str) -> CompiledTemplate:
+    """
+    Compiled form of a plain ``str.format`` template, memoized by source.
+
+    Every placeholder becomes a required field, so rendering behaves like
+    ``source.format(**data)`` (KeyError on a missing key).
+    """
+    template = _format_cache.get(source)
+    if template is None:
+        names = _placeholder_names(source)
+        template = compile_template(source, dict.fromkeys(names, REQUIRED), name="adhoc")
+        with _format_lock:
+            _format_cache[source] = template
+    return template
+
+
+def _placeholder_names(source: str) -> Iterable[str]:
+    seen = {}
+    for _, field_name, _, _ in Formatter().parse(source):
+        if field_name is not None:
+            seen.setdefault(field_name, None)
+    return list(seen)
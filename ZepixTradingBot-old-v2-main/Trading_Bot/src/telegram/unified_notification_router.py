@@ -21,9 +21,14 @@ from typing import Dict, Any, Optional, Set, Callable
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
+from src.monitoring.tracing import traced
+from src.telegram.template_engine import compile_template
 
 logger = logging.getLogger(__name__)
 
+_RULE = "━" * 24
+_TIME_LINE = "<b>Time:</b> {time}"
+
 
 class NotificationPriority(Enum):
     """Priority levels for notifications"""
@@ -196,6 +201,7 @@ class UnifiedNotificationRouter:
         """Set default chat ID"""
         self._chat_id = chat_id
     
+    @traced("notify.unified.send")
     def send(
         self,
         notification_type: str,
@@ -277,289 +283,215 @@ class UnifiedNotificationRouter:
         Returns:
             Formatted message string
         """
-        formatters = {
-            "trade_entry": self._format_trade_entry,
-            "trade_exit": self._format_trade_exit,
-            "tp_hit": self._format_tp_hit,
-            "sl_hit": self._format_sl_hit,
-            "profit_booking": self._format_profit_booking,
-            "tp_continuation": self._format_tp_continuation,
-            "sl_hunt_activated": self._format_sl_hunt_activated,
-            "recovery_success": self._format_recovery_success,
-            "recovery_failed": self._format_recovery_failed,
-            "daily_limit_warning": self._format_daily_limit_warning,
-            "daily_limit_hit": self._format_daily_limit_hit,
-            "lifetime_limit_hit": self._format_lifetime_limit_hit,
-            "bot_startup": self._format_bot_startup,
-            "error_alert": self._format_error_alert,
-            "plugin_enabled": self._format_plugin_enabled,
-            "plugin_disabled": self._format_plugin_disabled,
-            "config_changed": self._format_config_changed,
-        }
-        
-        formatter = formatters.get(notification_type, self._format_generic)
+        formatter = self._FORMATTERS.get(notification_type, self._format_generic)
         return formatter(data)
     
     # ========================================
     # Notification Formatters
     # ========================================
-    
-    def _format_generic(self, data: Dict[str, Any]) -> str:
-        """Generic notification formatter"""
-        title = data.get("title", "Notification")
-        message = data.get("message", "")
-        
-        return (
-            f"📢 <b>{title}</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"{message}\n\n"
-            f"<i>Time: {datetime.now().strftime('%H:%M:%S')}</i>"
-        )
-    
-    def _format_trade_entry(self, data: Dict[str, Any]) -> str:
-        """Format trade entry notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry_price = data.get("entry_price", 0)
-        plugin = data.get("plugin_name", "Unknown")
-        
-        return (
-            f"🟢 <b>ENTRY ALERT</b> | {plugin}\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Entry:</b> {entry_price}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_trade_exit(self, data: Dict[str, Any]) -> str:
-        """Format trade exit notification"""
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("profit", 0)
-        reason = data.get("reason", "N/A")
-        
-        emoji = "🟢" if profit >= 0 else "🔴"
-        
-        return (
-            f"{emoji} <b>EXIT ALERT</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>P&L:</b> ${profit:+.2f}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_tp_hit(self, data: Dict[str, Any]) -> str:
-        """Format TP hit notification"""
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("profit", 0)
-        
-        return (
-            f"🎯 <b>TAKE PROFIT HIT!</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Profit:</b> +${profit:.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_sl_hit(self, data: Dict[str, Any]) -> str:
-        """Format SL hit notification"""
-        symbol = data.get("symbol", "N/A")
-        loss = data.get("loss", 0)
-        
-        return (
-            f"🛑 <b>STOP LOSS HIT</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Loss:</b> -${abs(loss):.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_profit_booking(self, data: Dict[str, Any]) -> str:
-        """Format profit booking notification"""
-        symbol = data.get("symbol", "N/A")
-        level = data.get("level", 0)
-        profit = data.get("profit", 0)
-        
-        return (
-            f"💰 <b>PROFIT BOOKED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Level:</b> {level}\n"
-            f"<b>Profit:</b> +${profit:.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_tp_continuation(self, data: Dict[str, Any]) -> str:
-        """Format TP continuation notification"""
-        symbol = data.get("symbol", "N/A")
-        level = data.get("level", 0)
-        direction = data.get("direction", "N/A")
-        
-        return (
-            f"🚀 <b>AUTONOMOUS RE-ENTRY</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol} ({direction})\n"
-            f"<b>Type:</b> TP Continuation\n"
-            f"<b>Level:</b> {level}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_sl_hunt_activated(self, data: Dict[str, Any]) -> str:
-        """Format SL hunt activation notification"""
-        symbol = data.get("symbol", "N/A")
-        sl_price = data.get("sl_price", 0)
-        
-        return (
-            f"🛡️ <b>SL HUNT ACTIVATED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>SL Price:</b> {sl_price}\n"
-            f"<b>Status:</b> Monitoring...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_recovery_success(self, data: Dict[str, Any]) -> str:
-        """Format recovery success notification"""
-        chain_id = data.get("chain_id", "N/A")
-        level = data.get("level", 0)
-        
-        return (
-            f"🎉 <b>RECOVERY SUCCESS</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Resumed to Level:</b> {level}\n"
-            f"<b>Status:</b> ACTIVE ✅\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_recovery_failed(self, data: Dict[str, Any]) -> str:
-        """Format recovery failed notification"""
-        chain_id = data.get("chain_id", "N/A")
-        reason = data.get("reason", "Unknown")
-        
-        return (
-            f"💀 <b>RECOVERY FAILED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Status:</b> STOPPED ❌\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_daily_limit_warning(self, data: Dict[str, Any]) -> str:
-        """Format daily limit warning notification"""
-        current_loss = data.get("current_loss", 0)
-        limit = data.get("limit", 0)
-        remaining = data.get("remaining", 0)
-        
-        return (
-            f"⚠️ <b>DAILY LOSS WARNING</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Current Loss:</b> ${current_loss:.2f}\n"
-            f"<b>Daily Limit:</b> ${limit:.2f}\n"
-            f"<b>Remaining:</b> ${remaining:.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}\n\n"
-            f"⚠️ <i>Trade cautiously!</i>"
-        )
-    
-    def _format_daily_limit_hit(self, data: Dict[str, Any]) -> str:
-        """Format daily limit hit notification"""
-        loss = data.get("loss", 0)
-        limit = data.get("limit", 0)
-        
-        return (
-            f"🛑 <b>DAILY LOSS LIMIT REACHED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Loss Today:</b> ${loss:.2f}\n"
-            f"<b>Limit:</b> ${limit:.2f}\n\n"
-            f"✋ <b>TRADING PAUSED AUTOMATICALLY</b>\n"
-            f"<b>Reset Time:</b> 03:35 UTC"
-        )
-    
-    def _format_lifetime_limit_hit(self, data: Dict[str, Any]) -> str:
-        """Format lifetime limit hit notification"""
-        loss = data.get("loss", 0)
-        limit = data.get("limit", 0)
-        
-        return (
-            f"🚨 <b>LIFETIME LOSS LIMIT REACHED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Total Loss:</b> ${loss:.2f}\n"
-            f"<b>Limit:</b> ${limit:.2f}\n\n"
-            f"🛑 <b>TRADING STOPPED</b>\n"
-            f"<i>Manual intervention required</i>"
-        )
-    
-    def _format_bot_startup(self, data: Dict[str, Any]) -> str:
-        """Format bot startup notification"""
-        mode = data.get("mode", "UNKNOWN")
-        version = data.get("version", "2.0")
-        
-        return (
-            f"🤖 <b>ZEPIX BOT STARTED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Version:</b> {version}\n"
-            f"<b>Mode:</b> {mode}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}\n\n"
-            f"🚀 <b>Bot is ready to trade!</b>"
-        )
-    
-    def _format_error_alert(self, data: Dict[str, Any]) -> str:
-        """Format error alert notification"""
-        error_type = data.get("error_type", "Unknown")
-        details = data.get("details", "No details")
-        severity = data.get("severity", "MEDIUM")
-        
-        severity_emoji = "🔴" if severity == "HIGH" else ("🟡" if severity == "MEDIUM" else "🟢")
-        
-        return (
-            f"❌ <b>ERROR ALERT</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Type:</b> {error_type}\n"
-            f"<b>Severity:</b> {severity_emoji} {severity}\n"
-            f"<b>Details:</b> {details}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_plugin_enabled(self, data: Dict[str, Any]) -> str:
-        """Format plugin enabled notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        
-        return (
-            f"✅ <b>PLUGIN ENABLED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Plugin:</b> {plugin_name}\n"
-            f"<b>Status:</b> ACTIVE 🟢\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_plugin_disabled(self, data: Dict[str, Any]) -> str:
-        """Format plugin disabled notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        
-        return (
-            f"🔴 <b>PLUGIN DISABLED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Plugin:</b> {plugin_name}\n"
-            f"<b>Status:</b> INACTIVE 🔴\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-    
-    def _format_config_changed(self, data: Dict[str, Any]) -> str:
-        """Format config changed notification"""
-        setting = data.get("setting", "Unknown")
-        old_value = data.get("old_value", "N/A")
-        new_value = data.get("new_value", "N/A")
-        
-        return (
-            f"⚙️ <b>CONFIG CHANGED</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Setting:</b> {setting}\n"
-            f"<b>Old:</b> {old_value}\n"
-            f"<b>New:</b> {new_value}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
+    # Compiled once at import (see template_engine); called as formatter(data)
+    
+    _format_generic = staticmethod(compile_template(
+        f"📢 <b>{{title}}</b>\n{_RULE}\n\n"
+        "{message}\n\n"
+        "<i>Time: {time}</i>",
+        fields={"title": "Notification", "message": ""},
+        name="generic",
+    ))
+    
+    _format_trade_entry = staticmethod(compile_template(
+        f"🟢 <b>ENTRY ALERT</b> | {{plugin_name}}\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Direction:</b> {direction}\n"
+        "<b>Entry:</b> {entry_price}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "direction": "N/A", "entry_price": 0, "plugin_name": "Unknown"},
+        name="trade_entry",
+    ))
+    
+    _format_trade_exit = staticmethod(compile_template(
+        f"{{emoji}} <b>EXIT ALERT</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>P&L:</b> ${profit:+.2f}\n"
+        "<b>Reason:</b> {reason}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "profit": 0, "reason": "N/A"},
+        computed={"emoji": lambda profit: "🟢" if profit >= 0 else "🔴"},
+        name="trade_exit",
+    ))
+    
+    _format_tp_hit = staticmethod(compile_template(
+        f"🎯 <b>TAKE PROFIT HIT!</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Profit:</b> +${profit:.2f}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "profit": 0},
+        name="tp_hit",
+    ))
+    
+    _format_sl_hit = staticmethod(compile_template(
+        f"🛑 <b>STOP LOSS HIT</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Loss:</b> -${abs_loss:.2f}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "loss": 0},
+        computed={"abs_loss": lambda loss: abs(loss)},
+        name="sl_hit",
+    ))
+    
+    _format_profit_booking = staticmethod(compile_template(
+        f"💰 <b>PROFIT BOOKED</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>Level:</b> {level}\n"
+        "<b>Profit:</b> +${profit:.2f}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "level": 0, "profit": 0},
+        name="profit_booking",
+    ))
+    
+    _format_tp_continuation = staticmethod(compile_template(
+        f"🚀 <b>AUTONOMOUS RE-ENTRY</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol} ({direction})\n"
+        "<b>Type:</b> TP Continuation\n"
+        "<b>Level:</b> {level}\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "level": 0, "direction": "N/A"},
+        name="tp_continuation",
+    ))
+    
+    _format_sl_hunt_activated = staticmethod(compile_template(
+        f"🛡️ <b>SL HUNT ACTIVATED</b>\n{_RULE}\n\n"
+        "<b>Symbol:</b> {symbol}\n"
+        "<b>SL Price:</b> {sl_price}\n"
+        "<b>Status:</b> Monitoring...\n"
+        f"{_TIME_LINE}",
+        fields={"symbol": "N/A", "sl_price": 0},
+        name="sl_hunt_activated",
+    ))
+    
+    _format_recovery_success = staticmethod(compile_template(
+        f"🎉 <b>RECOVERY SUCCESS</b>\n{_RULE}\n\n"
+        "<b>Chain:</b> {chain_id}\n"
+        "<b>Resumed to Level:</b> {level}\n"
+        "<b>Status:</b> ACTIVE ✅\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "level": 0},
+        name="recovery_success",
+    ))
+    
+    _format_recovery_failed = staticmethod(compile_template(
+        f"💀 <b>RECOVERY FAILED</b>\n{_RULE}\n\n"
+        "<b>Chain:</b> {chain_id}\n"
+        "<b>Reason:</b> {reason}\n"
+        "<b>Status:</b> STOPPED ❌\n"
+        f"{_TIME_LINE}",
+        fields={"chain_id": "N/A", "reason": "Unknown"},
+        name="recovery_failed",
+    ))
+    
+    _format_daily_limit_warning = staticmethod(compile_template(
+        f"⚠️ <b>DAILY LOSS WARNING</b>\n{_RULE}\n\n"
+        "<b>Current Loss:</b> ${current_loss:.2f}\n"
+        "<b>Daily Limit:</b> ${limit:.2f}\n"
+        "<b>Remaining:</b> ${remaining:.2f}\n"
+        f"{_TIME_LINE}\n\n"
+        "⚠️ <i>Trade cautiously!</i>",
+        fields={"current_loss": 0, "limit": 0, "remaining": 0},
+        name="daily_limit_warning",
+    ))
+    
+    _format_daily_limit_hit = staticmethod(compile_template(
+        f"🛑 <b>DAILY LOSS LIMIT REACHED</b>\n{_RULE}\n\n"
+        "<b>Loss Today:</b> ${loss:.2f}\n"
+        "<b>Limit:</b> ${limit:.2f}\n\n"
+        "✋ <b>TRADING PAUSED AUTOMATICALLY</b>\n"
+        "<b>Reset Time:</b> 03:35 UTC",
+        fields={"loss": 0, "limit": 0},
+        name="daily_limit_hit",
+    ))
+    
+    _format_lifetime_limit_hit = staticmethod(compile_template(
+        f"🚨 <b>LIFETIME LOSS LIMIT REACHED</b>\n{_RULE}\n\n"
+        "<b>Total Loss:</b> ${loss:.2f}\n"
+        "<b>Limit:</b> ${limit:.2f}\n\n"
+        "🛑 <b>TRADING STOPPED</b>\n"
+        "<i>Manual intervention required</i>",
+        fields={"loss": 0, "limit": 0},
+        name="lifetime_limit_hit",
+    ))
+    
+    _format_bot_startup = staticmethod(compile_template(
+        f"🤖 <b>ZEPIX BOT STARTED</b>\n{_RULE}\n\n"
+        "<b>Version:</b> {version}\n"
+        "<b>Mode:</b> {mode}\n"
+        f"{_TIME_LINE}\n\n"
+        "🚀 <b>Bot is ready to trade!</b>",
+        fields={"mode": "UNKNOWN", "version": "2.0"},
+        name="bot_startup",
+    ))
+    
+    _format_error_alert = staticmethod(compile_template(
+        f"❌ <b>ERROR ALERT</b>\n{_RULE}\n\n"
+        "<b>Type:</b> {error_type}\n"
+        "<b>Severity:</b> {severity_emoji} {severity}\n"
+        "<b>Details:</b> {details}\n"
+        f"{_TIME_LINE}",
+        fields={"error_type": "Unknown", "details": "No details", "severity": "MEDIUM"},
+        computed={
+            "severity_emoji": lambda severity: (
+                "🔴" if severity == "HIGH" else ("🟡" if severity == "MEDIUM" else "🟢")
+            ),
+        },
+        name="error_alert",
+    ))
+    
+    _format_plugin_enabled = staticmethod(compile_template(
+        f"✅ <b>PLUGIN ENABLED</b>\n{_RULE}\n\n"
+        "<b>Plugin:</b> {plugin_name}\n"
+        "<b>Status:</b> ACTIVE 🟢\n"
+        f"{_TIME_LINE}",
+        fields={"plugin_name": "Unknown"},
+        name="plugin_enabled",
+    ))
+    
+    _format_plugin_disabled = staticmethod(compile_template(
+        f"🔴 <b>PLUGIN DISABLED</b>\n{_RULE}\n\n"
+        "<b>Plugin:</b> {plugin_name}\n"
+        "<b>Status:</b> INACTIVE 🔴\n"
+        f"{_TIME_LINE}",
+        fields={"plugin_name": "Unknown"},
+        name="plugin_disabled",
+    ))
+    
+    _format_config_changed = staticmethod(compile_template(
+        f"⚙️ <b>CONFIG CHANGED</b>\n{_RULE}\n\n"
+        "<b>Setting:</b> {setting}\n"
+        "<b>Old:</b> {old_value}\n"
+        "<b>New:</b> {new_value}\n"
+        f"{_TIME_LINE}",
+        fields={"setting": "Unknown", "old_value": "N/A", "new_value": "N/A"},
+        name="config_changed",
+    ))
+    
+    _FORMATTERS = {
+        "trade_entry": _format_trade_entry,
+        "trade_exit": _format_trade_exit,
+        "tp_hit": _format_tp_hit,
+        "sl_hit": _format_sl_hit,
+        "profit_booking": _format_profit_booking,
+        "tp_continuation": _format_tp_continuation,
+        "sl_hunt_activated": _format_sl_hunt_activated,
+        "recovery_success": _format_recovery_success,
+        "recovery_failed": _format_recovery_failed,
+        "daily_limit_warning": _format_daily_limit_warning,
+        "daily_limit_hit": _format_daily_limit_hit,
+        "lifetime_limit_hit": _format_lifetime_limit_hit,
+        "bot_startup": _format_bot_startup,
+        "error_alert": _format_error_alert,
+        "plugin_enabled": _format_plugin_enabled,
+        "plugin_disabled": _format_plugin_disabled,
+        "config_changed": _format_config_changed,
+    }
     
     # ========================================
     # Mute/Unmute Methods
@@ -11,6 +11,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+from src.telegram.render_cache import get_menu_render_cache
+
 logger = logging.getLogger(__name__)
 
 class V6TimeframeMenuBuilder:
@@ -29,6 +31,7 @@ class V6TimeframeMenuBuilder:
         self.trading_engine = None
         self.plugin_manager = None
         self.db = None
+        self.render_cache = get_menu_render_cache()
         
     def set_dependencies(self, trading_engine):
         """Inject trading engine dependencies"""
@@ -59,9 +62,6 @@ class V6TimeframeMenuBuilder:
         text += "⏱️ **TIMEFRAME CONTROLS**\n"
         text += "━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
         
-        # Build keyboard
-        keyboard = []
-        
         # Individual timeframe rows
         for tf in self.V6_TIMEFRAMES:
             status = timeframe_status.get(tf, {})
@@ -74,8 +74,30 @@ class V6TimeframeMenuBuilder:
             tf_name = self.TIMEFRAME_NAMES[tf]
             text += f"{status_icon} **{tf_name} ({tf})**\n"
             text += f"   Trades: {trades} | Win: {win_rate:.0f}%\n"
-            
-            # Buttons for this timeframe
+        
+        text += "\n"
+        
+        # Keyboard only depends on the enable toggles
+        enabled_flags = tuple(
+            bool(timeframe_status.get(tf, {}).get('enabled', False)) for tf in self.V6_TIMEFRAMES
+        )
+        reply_markup = self.render_cache.get_or_render(
+            "v6_submenu", enabled_flags,
+            lambda: (None, self._build_v6_submenu_keyboard(enabled_flags))
+        ).reply_markup
+        
+        return {
+            "text": text,
+            "reply_markup": reply_markup,
+            "parse_mode": "Markdown"
+        }
+    
+    def _build_v6_submenu_keyboard(self, enabled_flags: tuple) -> InlineKeyboardMarkup:
+        """V6 overview keyboard for one set of enable toggles"""
+        keyboard = []
+        
+        # Individual timeframe rows
+        for tf, enabled in zip(self.V6_TIMEFRAMES, enabled_flags):
             toggle_text = "🔴 Disable" if enabled else "🟢 Enable"
             toggle_callback = f"v6_disable_{tf}" if enabled else f"v6_enable_{tf}"
             
@@ -84,8 +106,6 @@ class V6TimeframeMenuBuilder:
                 InlineKeyboardButton(toggle_text, callback_data=toggle_callback)
             ])
         
-        text += "\n"
-        
         # Bulk action buttons
         keyboard.append([
             InlineKeyboardButton("✅ Enable All", callback_data="v6_enable_all"),
@@ -101,11 +121,7 @@ class V6TimeframeMenuBuilder:
             InlineKeyboardButton("« Back to Main Menu", callback_data="main_menu")
         ])
         
-        return {
-            "text": text,
-            "reply_markup": InlineKeyboardMarkup(keyboard),
-            "parse_mode": "Markdown"
-        }
+        return InlineKeyboardMarkup(keyboard)
     
     def build_timeframe_config_menu(self, timeframe: str) -> Dict:
         """
@@ -149,7 +165,25 @@ class V6TimeframeMenuBuilder:
         text += f"├─ Trend Pulse Alerts: {'✅' if config['pulse_alerts'] else '❌'}\n"
         text += f"└─ Pattern Alerts: {'✅' if config['pattern_alerts'] else '❌'}\n"
         
-        # Build keyboard
+        # Keyboard only shows the adjustable settings
+        fingerprint = (
+            timeframe, config['pulse_threshold'], config['lot_size'],
+            bool(config['entry_alerts']), bool(config['pulse_alerts'])
+        )
+        reply_markup = self.render_cache.get_or_render(
+            "v6_timeframe_config", fingerprint,
+            lambda: (None, self._build_timeframe_config_keyboard(timeframe, config)),
+            depends_on=(f"v6_{timeframe}",)
+        ).reply_markup
+        
+        return {
+            "text": text,
+            "reply_markup": reply_markup,
+            "parse_mode": "Markdown"
+        }
+    
+    def _build_timeframe_config_keyboard(self, timeframe: str, config: Dict) -> InlineKeyboardMarkup:
+        """Config keyboard for one timeframe's current settings"""
         keyboard = []
         
         # Trend Pulse controls
@@ -196,11 +230,7 @@ class V6TimeframeMenuBuilder:
             InlineKeyboardButton("« Back to V6 Menu", callback_data="v6_menu")
         ])
         
-        return {
-            "text": text,
-            "reply_markup": InlineKeyboardMarkup(keyboard),
-            "parse_mode": "Markdown"
-        }
+        return InlineKeyboardMarkup(keyboard)
     
     def build_performance_comparison(self, days: int = 7) -> Dict:
         """
@@ -10,6 +10,7 @@ Features:
 - Perform integrity checks after migration
 - Support dry-run mode for validation
 - Rollback capability for failed migrations
+- Streaming, chunked and resumable copying (see streaming_migration)
 
 Version: 1.0.0
 """
@@ -19,12 +20,15 @@ import os
 import json
 import hashlib
 import logging
-import shutil
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from src.utils.streaming_migration import (
+    DEFAULT_CHUNK_SIZE, CHECKPOINT_TABLE_SQL, StreamStats, online_backup, stream_copy
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +57,9 @@ class MigrationResult:
     source_total_pnl: float = 0.0
     target_total_pnl: float = 0.0
     pnl_difference: float = 0.0
+    chunks: int = 0
+    resumed_from: int = 0
+    rows_per_second: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -69,7 +76,10 @@ class MigrationResult:
             "integrity_check_passed": self.integrity_check_passed,
             "source_total_pnl": self.source_total_pnl,
             "target_total_pnl": self.target_total_pnl,
-            "pnl_difference": self.pnl_difference
+            "pnl_difference": self.pnl_difference,
+            "chunks": self.chunks,
+            "resumed_from": self.resumed_from,
+            "rows_per_second": self.rows_per_second
         }
 
 
@@ -172,6 +182,9 @@ class DataMigrationTool:
         """
         Create backup of database before migration.
         
+        Uses SQLite's online backup API, so the copy is consistent even
+        if the database is being written to.
+        
         Args:
             db_path: Path to database to backup
             
@@ -185,7 +198,7 @@ class DataMigrationTool:
         db_name = os.path.basename(db_path)
         backup_path = os.path.join(self.backup_dir, f"{db_name}.{timestamp}.backup")
         
-        shutil.copy2(db_path, backup_path)
+        online_backup(db_path, backup_path)
         logger.info(f"Created backup: {backup_path}")
         
         return backup_path
@@ -430,19 +443,34 @@ class DataMigrationTool:
         conn.close()
         return summary
     
+    def _migration_job(self, plugin_id: str, strategy_filter: Optional[str]) -> str:
+        """Checkpoint name for a source/target/filter combination."""
+        job = f"v4_to_{plugin_id}"
+        return f"{job}:{strategy_filter}" if strategy_filter else job
+    
     def migrate_to_plugin(
         self,
         plugin_id: str,
         strategy_filter: Optional[str] = None,
-        dry_run: bool = True
+        dry_run: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        progress: Optional[Callable[[StreamStats], None]] = None
     ) -> MigrationResult:
         """
         Migrate trades from V4 to a specific plugin database.
         
+        Rows are streamed in chunks of ``chunk_size`` and committed together
+        with a checkpoint, so an interrupted migration continues from the
+        last committed chunk on the next call.
+        
         Args:
             plugin_id: Target plugin ID (e.g., 'combined_v3', 'price_action_1m')
             strategy_filter: Optional filter to migrate only specific strategies
             dry_run: If True, simulate migration without writing
+            chunk_size: Rows read, transformed and written per transaction
+            resume: Continue an interrupted migration instead of restarting
+            progress: Optional callback receiving StreamStats after each chunk
             
         Returns:
             MigrationResult with migration details
@@ -454,27 +482,25 @@ class DataMigrationTool:
             started_at=datetime.now()
         )
         
+        where = ""
+        params: List[Any] = []
+        if strategy_filter:
+            where = "strategy LIKE ? OR logic_type LIKE ?"
+            params.extend([f"%{strategy_filter}%", f"%{strategy_filter}%"])
+        
         try:
             source_conn = self._connect_source()
             source_cursor = source_conn.cursor()
             
-            query = "SELECT * FROM trades"
-            params = []
-            
-            if strategy_filter:
-                query += " WHERE strategy LIKE ? OR logic_type LIKE ?"
-                params.extend([f"%{strategy_filter}%", f"%{strategy_filter}%"])
-            
-            source_cursor.execute(query, params)
-            v4_trades = source_cursor.fetchall()
-            
             source_cursor.execute("SELECT SUM(COALESCE(pnl, 0)) as total FROM trades")
             pnl_row = source_cursor.fetchone()
             result.source_total_pnl = pnl_row["total"] if pnl_row and pnl_row["total"] else 0.0
             
             if dry_run:
-                logger.info(f"[DRY RUN] Would migrate {len(v4_trades)} trades to {plugin_id}")
-                result.records_migrated = len(v4_trades)
+                count_query = "SELECT COUNT(*) FROM trades" + (f" WHERE {where}" if where else "")
+                count = source_cursor.execute(count_query, params).fetchone()[0]
+                logger.info(f"[DRY RUN] Would migrate {count} trades to {plugin_id}")
+                result.records_migrated = count
                 result.status = MigrationStatus.COMPLETED
                 result.completed_at = datetime.now()
                 source_conn.close()
@@ -487,34 +513,41 @@ class DataMigrationTool:
             self._ensure_v5_schema(target_conn, plugin_id)
             target_cursor = target_conn.cursor()
             
-            for v4_row in v4_trades:
-                try:
-                    v5_data = self._map_v4_to_v5(v4_row)
-                    v5_data["migrated_from"] = "v4"
-                    v5_data["migration_timestamp"] = datetime.now().isoformat()
-                    
-                    columns = list(v5_data.keys())
-                    placeholders = ", ".join(["?" for _ in columns])
-                    column_names = ", ".join(columns)
-                    
-                    target_cursor.execute(
-                        f"INSERT OR IGNORE INTO trades ({column_names}) VALUES ({placeholders})",
-                        list(v5_data.values())
-                    )
-                    
-                    if target_cursor.rowcount > 0:
-                        result.records_migrated += 1
-                    else:
-                        result.records_skipped += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to migrate trade: {e}")
-                    result.records_failed += 1
+            mapped_columns = [m.v5_column for m in self.V4_TO_V5_COLUMN_MAPPING] + ["signal_data"]
+            columns = mapped_columns + ["migrated_from", "migration_timestamp"]
+            insert_sql = (
+                f"INSERT OR IGNORE INTO trades ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            migration_timestamp = datetime.now().isoformat()
+            
+            def transform(v4_row: Dict[str, Any]) -> List[Any]:
+                v5_data = self._map_v4_to_v5(v4_row)
+                return [v5_data[c] for c in mapped_columns] + ["v4", migration_timestamp]
+            
+            stats = stream_copy(
+                source_conn, target_conn,
+                job=self._migration_job(plugin_id, strategy_filter),
+                table="trades",
+                insert_sql=insert_sql,
+                transform=transform,
+                where=where,
+                params=params,
+                chunk_size=chunk_size,
+                resume=resume,
+                progress=progress
+            )
+            result.records_migrated = stats.rows_written
+            result.records_failed = stats.rows_failed
+            result.records_skipped = stats.rows_skipped
+            result.chunks = stats.chunks
+            result.resumed_from = stats.resumed_from
+            result.rows_per_second = stats.rows_per_second
             
             target_cursor.execute("""
                 INSERT INTO migration_log 
-                (source_db, migration_type, records_migrated, records_failed, started_at, completed_at, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (source_db, migration_type, records_migrated, records_failed, started_at, completed_at, status, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 self.source_db,
                 f"v4_to_{plugin_id}",
@@ -522,7 +555,8 @@ class DataMigrationTool:
                 result.records_failed,
                 result.started_at.isoformat(),
                 datetime.now().isoformat(),
-                "COMPLETED"
+                "COMPLETED",
+                f"{stats.rows_read} rows in {stats.chunks} chunks, {stats.rows_per_second:.0f} rows/sec"
             ))
             
             target_conn.commit()
@@ -542,7 +576,8 @@ class DataMigrationTool:
             
             logger.info(
                 f"Migration completed: {result.records_migrated} migrated, "
-                f"{result.records_failed} failed, {result.records_skipped} skipped"
+                f"{result.records_failed} failed, {result.records_skipped} skipped "
+                f"({result.rows_per_second:.0f} rows/sec)"
             )
             
         except Exception as e:
@@ -703,6 +738,14 @@ class DataMigrationTool:
             cursor.execute("DELETE FROM trades WHERE migrated_from = 'v4'")
             target_conn.commit()
             
+            # A rolled-back migration must start from the beginning next time
+            cursor.execute(CHECKPOINT_TABLE_SQL)
+            cursor.execute(
+                "DELETE FROM migration_checkpoint WHERE job = ? OR job LIKE ?",
+                (f"v4_to_{plugin_id}", f"v4_to_{plugin_id}:%")
+            )
+            target_conn.commit()
+            
             cursor.execute("""
                 INSERT INTO migration_log 
                 (source_db, migration_type, records_migrated, started_at, completed_at, status, notes)
@@ -769,6 +812,11 @@ Integrity Check:
   - Difference: ${result.pnl_difference:.2f}
   - Passed: {'Yes' if result.integrity_check_passed else 'No'}
 
+Throughput:
+  - Chunks: {result.chunks}
+  - Rows/sec: {result.rows_per_second:.0f}
+  - Resumed after key: {result.resumed_from}
+
 Timing:
   - Started: {result.started_at.isoformat() if result.started_at else 'N/A'}
   - Completed: {result.completed_at.isoformat() if result.completed_at else 'N/A'}
@@ -9,6 +9,7 @@ Features:
 - Verification after migration
 - Rollback support
 - Detailed logging
+- Chunked, resumable streaming copy with throughput reporting
 
 Version: 1.0.0
 Date: 2026-01-15
@@ -22,6 +23,7 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 from src.core.plugin_system.database_interface import MigrationResult
+from src.utils.streaming_migration import DEFAULT_CHUNK_SIZE, online_backup, stream_copy
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,13 @@ class MigrationStats:
     migrated_count: int = 0
     failed_count: int = 0
     errors: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.migrated_count + self.failed_count) / self.elapsed_seconds
 
 
 class DatabaseMigration:
@@ -48,14 +57,19 @@ class DatabaseMigration:
     CRITICAL: NO DATA LOSS PERMITTED
     """
     
-    def __init__(self, base_path: str = '.'):
+    V3_FILTER = "strategy = 'V3_COMBINED' OR strategy LIKE '%V3%'"
+    V6_FILTER = "strategy LIKE 'V6_%' OR strategy LIKE '%PRICE_ACTION%'"
+    
+    def __init__(self, base_path: str = '.', chunk_size: int = DEFAULT_CHUNK_SIZE):
         """
         Initialize migration tool.
         
         Args:
             base_path: Base path for database files
+            chunk_size: Rows copied per transaction (each chunk is checkpointed)
         """
         self.base_path = Path(base_path)
+        self.chunk_size = chunk_size
         self.shared_db = self.base_path / 'data' / 'zepix_trading.db'
         self.v3_db = self.base_path / 'data' / 'zepix_combined_v3.db'
         self.v6_db = self.base_path / 'data' / 'zepix_price_action.db'
@@ -87,7 +101,7 @@ class DatabaseMigration:
         backup_path = self.backup_dir / f"{db_path.stem}_{timestamp}.db"
         
         try:
-            shutil.copy2(db_path, backup_path)
+            online_backup(db_path, backup_path)
             logger.info(f"[Migration] Backup created: {backup_path}")
             return backup_path
         except Exception as e:
@@ -275,6 +289,63 @@ class DatabaseMigration:
         
         return total
     
+    def _count_where(self, conn: sqlite3.Connection, table: str, where: str) -> int:
+        """Count source rows matching a filter (0 if the table is missing)"""
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"[Migration] No {table} table or matching rows: {e}")
+            return 0
+    
+    def _stream_table(
+        self,
+        shared_conn: sqlite3.Connection,
+        target_db: Path,
+        job: str,
+        table: str,
+        where: str,
+        target_table: str,
+        mapper,
+        stats: MigrationStats
+    ) -> int:
+        """
+        Stream matching rows from the shared database into a target table.
+        
+        Rows are copied in checkpointed chunks with executemany; rerunning
+        after an interruption continues after the last committed chunk.
+        
+        Returns:
+            Number of rows written
+        """
+        columns = list(mapper({}).keys())
+        insert_sql = (
+            f"INSERT INTO {target_table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        
+        target_conn = sqlite3.connect(target_db)
+        try:
+            result = stream_copy(
+                shared_conn, target_conn,
+                job=job,
+                table=table,
+                insert_sql=insert_sql,
+                transform=lambda row: tuple(mapper(row).values()),
+                where=where,
+                chunk_size=self.chunk_size
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"[Migration] No {table} table or matching rows: {e}")
+            return 0
+        finally:
+            target_conn.close()
+        
+        stats.failed_count += result.rows_failed
+        stats.elapsed_seconds += result.elapsed_seconds
+        if result.rows_failed:
+            stats.errors.append(f"{job}: {result.rows_failed} rows failed to migrate")
+        return result.rows_written
+    
     def _migrate_v3_data(self, shared_conn: sqlite3.Connection, dry_run: bool) -> MigrationStats:
         """
         Migrate V3 data to isolated database.
@@ -287,63 +358,33 @@ class DatabaseMigration:
             MigrationStats with results
         """
         stats = MigrationStats(table='v3')
-        
-        # Get V3 trades
-        try:
-            cursor = shared_conn.execute(
-                "SELECT * FROM trades WHERE strategy = 'V3_COMBINED' OR strategy LIKE '%V3%'"
-            )
-            v3_trades = cursor.fetchall()
-            stats.source_count = len(v3_trades)
-        except Exception as e:
-            logger.warning(f"[Migration] No trades table or V3 trades: {e}")
-            v3_trades = []
+        v3_trades = self._count_where(shared_conn, 'trades', self.V3_FILTER)
+        v3_signals = self._count_where(shared_conn, 'signals', self.V3_FILTER)
+        stats.source_count = v3_trades
         
         if dry_run:
-            stats.migrated_count = len(v3_trades)
-            logger.info(f"[Migration] DRY RUN: Would migrate {len(v3_trades)} V3 trades")
-        else:
-            # Actually migrate
-            if v3_trades:
-                v3_conn = sqlite3.connect(self.v3_db)
-                for trade in v3_trades:
-                    try:
-                        self._insert_v3_trade(v3_conn, dict(trade))
-                        stats.migrated_count += 1
-                    except Exception as e:
-                        stats.failed_count += 1
-                        stats.errors.append(f"Trade migration failed: {e}")
-                v3_conn.commit()
-                v3_conn.close()
-                logger.info(f"[Migration] Migrated {stats.migrated_count} V3 trades")
-        
-        # Get V3 signals
-        try:
-            cursor = shared_conn.execute(
-                "SELECT * FROM signals WHERE strategy = 'V3_COMBINED' OR strategy LIKE '%V3%'"
+            stats.migrated_count = v3_trades + v3_signals
+            logger.info(f"[Migration] DRY RUN: Would migrate {v3_trades} V3 trades")
+            logger.info(f"[Migration] DRY RUN: Would migrate {v3_signals} V3 signals")
+            return stats
+        
+        if v3_trades:
+            migrated = self._stream_table(
+                shared_conn, self.v3_db, 'shared_to_v3:trades', 'trades',
+                self.V3_FILTER, 'combined_v3_trades', self._map_v3_trade, stats
             )
-            v3_signals = cursor.fetchall()
-        except Exception as e:
-            logger.warning(f"[Migration] No signals table or V3 signals: {e}")
-            v3_signals = []
+            stats.migrated_count += migrated
+            logger.info(f"[Migration] Migrated {migrated} V3 trades")
         
-        if dry_run:
-            stats.migrated_count += len(v3_signals)
-            logger.info(f"[Migration] DRY RUN: Would migrate {len(v3_signals)} V3 signals")
-        else:
-            if v3_signals:
-                v3_conn = sqlite3.connect(self.v3_db)
-                for signal in v3_signals:
-                    try:
-                        self._insert_v3_signal(v3_conn, dict(signal))
-                        stats.migrated_count += 1
-                    except Exception as e:
-                        stats.failed_count += 1
-                        stats.errors.append(f"Signal migration failed: {e}")
-                v3_conn.commit()
-                v3_conn.close()
-                logger.info(f"[Migration] Migrated {len(v3_signals)} V3 signals")
+        if v3_signals:
+            migrated = self._stream_table(
+                shared_conn, self.v3_db, 'shared_to_v3:signals', 'signals',
+                self.V3_FILTER, 'v3_signals_log', self._map_v3_signal, stats
+            )
+            stats.migrated_count += migrated
+            logger.info(f"[Migration] Migrated {migrated} V3 signals")
         
+        logger.info(f"[Migration] V3 throughput: {stats.rows_per_second:.0f} rows/sec")
         return stats
     
     def _migrate_v6_data(self, shared_conn: sqlite3.Connection, dry_run: bool) -> MigrationStats:
@@ -358,73 +399,48 @@ class DatabaseMigration:
             MigrationStats with results
         """
         stats = MigrationStats(table='v6')
-        
-        # Get V6 trades
-        try:
-            cursor = shared_conn.execute(
-                "SELECT * FROM trades WHERE strategy LIKE 'V6_%' OR strategy LIKE '%PRICE_ACTION%'"
-            )
-            v6_trades = cursor.fetchall()
-            stats.source_count = len(v6_trades)
-        except Exception as e:
-            logger.warning(f"[Migration] No trades table or V6 trades: {e}")
-            v6_trades = []
+        v6_trades = self._count_where(shared_conn, 'trades', self.V6_FILTER)
+        stats.source_count = v6_trades
         
         if dry_run:
-            stats.migrated_count = len(v6_trades)
-            logger.info(f"[Migration] DRY RUN: Would migrate {len(v6_trades)} V6 trades")
-        else:
-            if v6_trades:
-                v6_conn = sqlite3.connect(self.v6_db)
-                for trade in v6_trades:
-                    try:
-                        self._insert_v6_trade(v6_conn, dict(trade))
-                        stats.migrated_count += 1
-                    except Exception as e:
-                        stats.failed_count += 1
-                        stats.errors.append(f"Trade migration failed: {e}")
-                v6_conn.commit()
-                v6_conn.close()
-                logger.info(f"[Migration] Migrated {stats.migrated_count} V6 trades")
+            stats.migrated_count = v6_trades
+            logger.info(f"[Migration] DRY RUN: Would migrate {v6_trades} V6 trades")
+            return stats
+        
+        if v6_trades:
+            stats.migrated_count = self._stream_table(
+                shared_conn, self.v6_db, 'shared_to_v6:trades', 'trades',
+                self.V6_FILTER, 'trades', self._map_v6_trade, stats
+            )
+            logger.info(
+                f"[Migration] Migrated {stats.migrated_count} V6 trades "
+                f"({stats.rows_per_second:.0f} rows/sec)"
+            )
         
         return stats
     
-    def _insert_v3_trade(self, conn: sqlite3.Connection, trade: Dict[str, Any]):
-        """Insert a V3 trade record"""
-        # Map old schema to new V3 schema
-        data = {
+    def _map_v3_trade(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a shared trade row to the V3 schema"""
+        return {
             'symbol': trade.get('symbol', ''),
             'direction': trade.get('direction', 'BUY'),
             'entry_price': trade.get('entry_price', 0),
             'signal_type': trade.get('signal_type', 'Unknown'),
             'status': 'CLOSED' if trade.get('exit_price') else 'OPEN',
         }
-        
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        query = f"INSERT INTO combined_v3_trades ({columns}) VALUES ({placeholders})"
-        
-        conn.execute(query, tuple(data.values()))
     
-    def _insert_v3_signal(self, conn: sqlite3.Connection, signal: Dict[str, Any]):
-        """Insert a V3 signal record"""
-        data = {
+    def _map_v3_signal(self, signal: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a shared signal row to the V3 signals log"""
+        return {
             'signal_type': signal.get('signal_type', 'Unknown'),
             'symbol': signal.get('symbol', ''),
             'direction': signal.get('direction', ''),
             'processed': signal.get('processed', 0),
         }
-        
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        query = f"INSERT INTO v3_signals_log ({columns}) VALUES ({placeholders})"
-        
-        conn.execute(query, tuple(data.values()))
     
-    def _insert_v6_trade(self, conn: sqlite3.Connection, trade: Dict[str, Any]):
-        """Insert a V6 trade record"""
-        # Map old schema to new V6 schema
-        data = {
+    def _map_v6_trade(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a shared trade row to the V6 schema"""
+        return {
             'trade_id': trade.get('id', ''),
             'plugin_id': 'price_action',
             'symbol': trade.get('symbol', ''),
@@ -434,12 +450,6 @@ class DatabaseMigration:
             'lot_size': trade.get('lot_size', 0.01),
             'status': 'closed' if trade.get('exit_price') else 'open',
         }
-        
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        query = f"INSERT INTO trades ({columns}) VALUES ({placeholders})"
-        
-        conn.execute(query, tuple(data.values()))
     
     def verify_migration(self) -> MigrationResult:
         """
@@ -0,0 +1,260 @@
+"""
+Fast Signal Parser - Compiled Fast Path for Webhook Alerts
+Raw-bytes decoding and table-driven parsing
+
+Drop-in fast path for the webhook hot loop, output-compatible with the
+reference implementations it mirrors:
+- decode_alert: request body bytes -> dict with orjson (json fallback)
+- FastSignalParser.parse: same result as SignalParser.parse, using
+  frozenset/dict lookups instead of list scans and if/elif chains
+- parse_v6_payload_fast: single-pass V6 pipe tokenizer driven by a
+  static field table, same result as parse_v6_payload
+
+Run tests/benchmark_signal_parsing.py for before/after timings.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, Optional
+from datetime import datetime
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from src.utils.signal_parser import SignalParser
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== Body Decoding ====================
+
+def decode_alert(body: bytes) -> Dict[str, Any]:
+    """
+    Decode a webhook body straight from bytes.
+
+    Raises:
+        json.JSONDecodeError: Malformed JSON or a body that is not an object
+            (orjson's error type subclasses it)
+    """
+    data = orjson.loads(body) if orjson is not None else json.loads(body)
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("Alert body must be a JSON object", str(body[:64]), 0)
+    return data
+
+
+def encode_alert(alert: Dict[str, Any]) -> bytes:
+    """Encode an alert dict back to bytes (for endpoints that rewrite the body)"""
+    if orjson is not None:
+        return orjson.dumps(alert)
+    return json.dumps(alert).encode()
+
+
+# ==================== Signal Parsing ====================
+
+V3_SIGNALS = frozenset(SignalParser.V3_SIGNALS)
+V3_LOGICS = frozenset(SignalParser.V3_LOGICS)
+V3_ALERT_TYPES = frozenset(SignalParser.V3_ALERT_TYPES)
+V6_SIGNALS = frozenset(SignalParser.V6_SIGNALS)
+V6_ALERT_TYPES = frozenset(SignalParser.V6_ALERT_TYPES)
+
+V6_TIMEFRAME_ALIASES = {
+    '1': '1m', '1min': '1m',
+    '5': '5m', '5min': '5m',
+    '15': '15m', '15min': '15m',
+    '60': '1h', '1hour': '1h', '1hr': '1h',
+}
+
+ROUTING_REQUIRED_FIELDS = ('strategy', 'signal_type', 'symbol', 'timeframe')
+
+
+class FastSignalParser:
+    """Table-driven equivalent of SignalParser"""
+
+    @classmethod
+    def parse(cls, raw_alert: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse raw alert into the standardized signal format (None if invalid)"""
+        try:
+            strategy = cls.detect_strategy(raw_alert)
+            if strategy == 'V3_COMBINED':
+                return cls._parse_v3(raw_alert)
+            if strategy == 'V6_PRICE_ACTION':
+                return cls._parse_v6(raw_alert)
+            if strategy is None:
+                logger.warning(f"Could not detect strategy from alert: {raw_alert}")
+            else:
+                logger.warning(f"Unknown strategy: {strategy}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to parse alert: {e}")
+            return None
+
+    @staticmethod
+    def detect_strategy(alert: Dict[str, Any]) -> Optional[str]:
+        """Same precedence as SignalParser._detect_strategy"""
+        alert_type = alert.get('type', '').lower()
+        if alert_type in V3_ALERT_TYPES or 'v3' in alert_type:
+            return 'V3_COMBINED'
+        if alert_type in V6_ALERT_TYPES or 'v6' in alert_type:
+            return 'V6_PRICE_ACTION'
+
+        if 'strategy' in alert:
+            strategy = alert['strategy'].upper()
+            if 'V3' in strategy or 'COMBINED' in strategy:
+                return 'V3_COMBINED'
+            if 'V6' in strategy or 'PRICE_ACTION' in strategy:
+                return 'V6_PRICE_ACTION'
+            return strategy
+
+        signal = alert.get('signal', '').upper()
+        if signal in V3_SIGNALS:
+            return 'V3_COMBINED'
+        if signal in V6_SIGNALS:
+            return 'V6_PRICE_ACTION'
+
+        if alert.get('logic') in V3_LOGICS:
+            return 'V3_COMBINED'
+        if 'trend_pulse' in alert:
+            return 'V6_PRICE_ACTION'
+        if 'consensus_score' in alert:
+            return 'V3_COMBINED'
+
+        signal_type = alert.get('signal_type', '').upper()
+        if signal_type in V3_SIGNALS:
+            return 'V3_COMBINED'
+        if signal_type in V6_SIGNALS:
+            return 'V6_PRICE_ACTION'
+        return None
+
+    @staticmethod
+    def _timestamp(alert: Dict[str, Any]) -> Any:
+        # Only format the current time when the alert carries none
+        return alert['timestamp'] if 'timestamp' in alert else datetime.now().isoformat()
+
+    @classmethod
+    def _parse_v3(cls, alert: Dict[str, Any]) -> Dict[str, Any]:
+        get = alert.get
+        logic = get('logic', 'LOGIC1')
+        price = get('price')
+        sl_pips = get('sl_pips')
+        trend = get('trend')
+        consensus = get('consensus_score')
+        return {
+            'strategy': 'V3_COMBINED',
+            'signal_type': (get('signal_type') or get('signal') or get('direction') or 'BUY').upper(),
+            'symbol': get('symbol', '').upper(),
+            'timeframe': SignalParser.V3_TIMEFRAMES.get(logic, get('timeframe', '5m')),
+            'logic': logic,
+            'price': float(price) if price else 0,
+            'sl_pips': int(sl_pips) if sl_pips else 15,
+            'trend': trend.upper() if trend else 'NEUTRAL',
+            'consensus_score': int(consensus) if consensus else 0,
+            'mtf_trends': get('mtf_trends', ''),
+            'type': get('type', 'entry_v3'),
+            'timestamp': cls._timestamp(alert),
+            'raw_alert': alert,
+            'plugin_hint': 'v3_combined',
+            'requires_dual_order': True,
+            'requires_reentry': True,
+        }
+
+    @classmethod
+    def _parse_v6(cls, alert: Dict[str, Any]) -> Dict[str, Any]:
+        get = alert.get
+        timeframe = get('timeframe', get('tf', '5m'))
+        if isinstance(timeframe, str):
+            timeframe = V6_TIMEFRAME_ALIASES.get(timeframe, timeframe)
+        price = get('price')
+        return {
+            'strategy': 'V6_PRICE_ACTION',
+            'signal_type': (get('signal_type') or get('signal') or 'PRICE_ACTION_ENTRY').upper(),
+            'symbol': get('symbol', '').upper(),
+            'timeframe': timeframe,
+            'trend_pulse': get('trend_pulse', 'NEUTRAL'),
+            'conditions': get('conditions', {}),
+            'price': float(price) if price else 0,
+            'type': get('type', 'entry_v6'),
+            'timestamp': cls._timestamp(alert),
+            'raw_alert': alert,
+            'plugin_hint': f'v6_price_action_{timeframe}',
+            'requires_dual_order': False,
+            'requires_reentry': False,
+        }
+
+    @staticmethod
+    def validate(signal: Dict[str, Any]) -> bool:
+        """Routing check: required fields present and non-empty (as SignalParser.validate)"""
+        for field in ROUTING_REQUIRED_FIELDS:
+            if not signal.get(field):
+                logger.warning(f"Signal missing required field: {field}")
+                return False
+        return True
+
+
+# ==================== V6 Pipe Payloads ====================
+
+_NA_TOKENS = frozenset(('', 'NA', 'Na', 'nA', 'na'))
+
+# TYPE|SYMBOL|TF|PRICE|DIRECTION|CONF_LEVEL|CONF_SCORE|ADX|ADX_STRENGTH|SL|TP1|TP2|TP3|ALIGNMENT|TL_STATUS
+# is ZepixV6Alert's positional field order, so tokens are passed straight through;
+# only the numeric slots below are converted: (index, caster, default)
+V6_FIELD_COUNT = 15
+V6_NUMERIC_FIELDS = (
+    (3, float, 0.0),     # price
+    (6, int, 50),        # conf_score
+    (7, float, None),    # adx
+    (9, float, None),    # sl
+    (10, float, None),   # tp1
+    (11, float, None),   # tp2
+    (12, float, None),   # tp3
+)
+
+_v6_alert_cls = None
+
+
+def _alert_class():
+    # Resolved on first use: src.core imports this module for its factory
+    global _v6_alert_cls
+    if _v6_alert_cls is None:
+        from src.core.zepix_v6_alert import ZepixV6Alert
+        _v6_alert_cls = ZepixV6Alert
+    return _v6_alert_cls
+
+
+def parse_v6_payload_fast(payload: str):
+    """
+    Single-pass equivalent of parse_v6_payload.
+
+    The payload is split once; string tokens are passed through as
+    positional fields and only the numeric slots are converted. Fields
+    missing from short payloads fall back to ZepixV6Alert's defaults.
+    """
+    alert_cls = _alert_class()
+    try:
+        values = payload.strip().split('|', V6_FIELD_COUNT)[:V6_FIELD_COUNT]
+        count = len(values)
+        if count < 5:
+            logger.warning(f"[V6_PARSE] Insufficient fields in payload: {count}")
+            return alert_cls(type="UNKNOWN", ticker="UNKNOWN", tf="15", price=0.0,
+                             direction="BUY", raw_payload=payload)
+
+        for index, caster, default in V6_NUMERIC_FIELDS:
+            if index >= count:
+                break
+            token = values[index]
+            if token in _NA_TOKENS:
+                values[index] = default
+            else:
+                try:
+                    values[index] = caster(token)
+                except ValueError:
+                    values[index] = default
+        return alert_cls(*values, raw_payload=payload)
+
+    except Exception as e:
+        logger.error(f"[V6_PARSE] Error parsing payload: {e}")
+        return alert_cls(type="UNKNOWN", ticker="UNKNOWN", tf="15", price=0.0,
+                         direction="BUY", raw_payload=payload)
@@ -0,0 +1,484 @@
+"""
+Session Store - Bounded Per-Chat State With TTL Expiry
+Shared store for menu contexts, conversation flows and per-chat locks
+
+Per-chat state used to live in plain dicts that only shrank when someone
+remembered to call a cleanup method. ``SessionStore`` bounds it:
+
+- TTL expiry driven by a hashed timer wheel: each entry sits in the slot
+  of its expiry tick, and every operation advances the wheel to "now",
+  so expiring costs O(expired entries) instead of a full scan
+- ``max_entries`` LRU cap; the least recently used entry is evicted first
+- Per-key ``asyncio.Lock`` objects are reclaimed with their entry (or on
+  the next sweep if they were held at the time, or never had an entry);
+  the sweep runs from the wheel every ``sweep_interval`` seconds
+- Optional SQLite spill: LRU-evicted entries are written to disk instead
+  of dropped and promoted back on access, and live entries are flushed
+  write-behind so state survives a restart
+- Entry count, approximate memory and evictions are exported as gauges
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+from collections import OrderedDict
+import asyncio
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+from src.monitoring.metrics_registry import (
+    SESSION_STORE_ENTRIES, SESSION_STORE_MEMORY_BYTES, SESSION_STORE_EVICTIONS
+)
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def approx_size(obj: Any, depth: int = 4) -> int:
+    """Approximate deep size in bytes (containers and object __dict__, bounded depth)"""
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approx_size(key, depth - 1) + approx_size(value, depth - 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += approx_size(item, depth - 1)
+    elif hasattr(obj, "__dict__"):
+        size += approx_size(vars(obj), depth - 1)
+    return size
+
+
+# ==================== Timer Wheel ====================
+
+class TimerWheel:
+    """
+    Hashed timing wheel of keys by expiry tick.
+
+    A key scheduled beyond one revolution simply stays in its slot until
+    the wheel passes it on the right round; ``advance`` returns the keys
+    of every slot passed, and the caller checks their real deadline.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 512, now: float = 0.0):
+        self.tick_seconds = tick_seconds
+        self.slots: List[Set[Hashable]] = [set() for _ in range(slots)]
+        self._position = int(now / tick_seconds)  # last tick processed
+
+    def schedule(self, key: Hashable, expires_at: float, previous_slot: Optional[int] = None) -> int:
+        """Place ``key`` in the slot of ``expires_at``; returns the slot index"""
+        if previous_slot is not None:
+            self.slots[previous_slot].discard(key)
+        tick = max(int(expires_at / self.tick_seconds), self._position + 1)
+        slot = tick % len(self.slots)
+        self.slots[slot].add(key)
+        return slot
+
+    def cancel(self, key: Hashable, slot: int):
+        self.slots[slot].discard(key)
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move to ``now``; returns the candidate keys of every slot passed"""
+        target = int(now / self.tick_seconds)
+        if target <= self._position:
+            return []
+        steps = min(target - self._position, len(self.slots))
+        candidates: List[Hashable] = []
+        for tick in range(self._position + 1, self._position + 1 + steps):
+            candidates.extend(self.slots[tick % len(self.slots)])
+        self._position = target
+        return candidates
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "slot", "size")
+
+    def __init__(self, value: Any, expires_at: float, slot: int, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.slot = slot
+        self.size = size
+
+
+# ==================== Session Store ====================
+
+class SessionStore:
+    """
+    TTL + LRU bounded key/value store for per-chat session state.
+
+    Usage:
+        store = SessionStore("menu_context", ttl_seconds=1800, max_entries=10000)
+        store.set(chat_id, context)
+        context = store.get(chat_id)           # None once expired or evicted
+        async with store.get_lock(chat_id):    # reclaimed with the entry
+            ...
+
+    Values are stored by reference (mutations are visible without ``set``,
+    but only ``set``/``touch`` extend the TTL unless ``sliding`` is on).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = 1800.0,
+        max_entries: int = 10000,
+        sliding: bool = False,
+        spill_path: Optional[str] = None,
+        flush_interval: float = 30.0,
+        sweep_interval: float = 60.0,
+        tick_seconds: float = 1.0,
+        wheel_slots: int = 512,
+        on_evict: Optional[Callable[[Hashable, Any, str], None]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            name: Store name (metrics label and spill table key)
+            ttl_seconds: Default time to live of an entry
+            max_entries: LRU cap on in-memory entries
+            sliding: Reading an entry also extends its TTL
+            spill_path: SQLite file for LRU spill and restart recovery
+            flush_interval: Seconds between write-behind flushes to the spill
+            sweep_interval: Seconds between sweeps of locks left without an entry
+            on_evict: Called with (key, value, reason) when an entry leaves
+                memory; reason is "expired", "lru" or "deleted"
+            clock: Wall-clock source (spilled deadlines survive restarts)
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.sliding = sliding
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+        self.on_evict = on_evict
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._wheel = TimerWheel(tick_seconds, wheel_slots, now=clock())
+        self._mutex = threading.RLock()
+        self._memory_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "lru": 0, "deleted": 0,
+                      "locks_reclaimed": 0, "spilled": 0, "promoted": 0, "restored": 0}
+
+        self._spill: Optional[sqlite3.Connection] = None
+        self._dirty: Set[Hashable] = set()
+        self._last_flush = clock()
+        self._last_sweep = clock()
+        if spill_path:
+            self._open_spill(spill_path)
+            self.restore()
+
+        self._labels = {"store": name}
+        self._publish()
+
+    # -------------------- Access --------------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Value of ``key`` (``default`` if missing, expired or evicted without spill)"""
+        with self._mutex:
+            now = self._tick()
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._evict(key, "expired")
+                entry = None
+            if entry is None and self._spill is not None:
+                entry = self._promote(key, now)
+            if entry is None:
+                self.stats["misses"] += 1
+                return default
+
+            self.stats["hits"] += 1
+            self._entries.move_to_end(key)
+            if self.sliding:
+                self._reschedule(key, entry, now + self.ttl_seconds)
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store ``value`` for ``ttl`` seconds (default TTL when None)"""
+        with self._mutex:
+            now = self._tick()
+            expires_at = now + (self.ttl_seconds if ttl is None else ttl)
+            size = approx_size(value)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(value, expires_at, self._wheel.schedule(key, expires_at), size)
+                self._entries[key] = entry
+                self._memory_bytes += size
+            else:
+                self._memory_bytes += size - entry.size
+                entry.value, entry.size = value, size
+                self._reschedule(key, entry, expires_at)
+                self._entries.move_to_end(key)
+            if self._spill is not None:
+                self._dirty.add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._evict(oldest, "lru")
+            self._publish()
+
+    def touch(self, key: Hashable, ttl: Optional[float] = None) -> bool:
+        """Extend the TTL of ``key``; False if it is not in memory"""
+        with self._mutex:
+            now = self._tick()
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                return False
+            self._reschedule(key, entry, now + (self.ttl_seconds if ttl is None else ttl))
+            self._entries.move_to_end(key)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` (memory and spill) and return its value"""
+        with self._mutex:
+            entry = self._entries.get(key)
+            value = default if entry is None or entry.expires_at <= self._clock() else entry.value
+            if entry is not None:
+                self._evict(key, "deleted")
+            else:
+                self._reclaim_lock(key)
+            if self._spill is not None:
+                self._dirty.discard(key)
+                self._spill_delete([key])
+            self._publish()
+            return value
+
+    def discard(self, key: Hashable):
+        self.pop(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._mutex:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[Hashable]:
+        return [key for key, _ in self.items()]
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of live in-memory entries"""
+        with self._mutex:
+            now = self._clock()
+            return [(k, e.value) for k, e in self._entries.items() if e.expires_at > now]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    # -------------------- Locks --------------------
+
+    def get_lock(self, key: Hashable) -> asyncio.Lock:
+        """Per-key lock, dropped when its entry leaves the store"""
+        with self._mutex:
+            self._tick()
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = asyncio.Lock()
+            return lock
+
+    def _reclaim_lock(self, key: Hashable):
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._locks[key]
+            self.stats["locks_reclaimed"] += 1
+
+    # -------------------- Expiry --------------------
+
+    def expire(self) -> int:
+        """Evict everything past its deadline now; returns the number evicted"""
+        with self._mutex:
+            before = self.stats["expired"]
+            self._tick()
+            self._sweep_locks(self._clock())
+            if self._spill is not None:
+                self._spill_purge_expired()
+            return self.stats["expired"] - before
+
+    def _tick(self) -> float:
+        """Advance the wheel to now, evicting expired entries; returns now"""
+        now = self._clock()
+        candidates = self._wheel.advance(now)
+        if candidates:
+            for key in candidates:
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at <= now:
+                    self._evict(key, "expired")
+            self._publish()
+        if self._dirty and now - self._last_flush >= self.flush_interval:
+            self.flush()
+        if now - self._last_sweep >= self.sweep_interval:
+            self._sweep_locks(now)
+        return now
+
+    def _sweep_locks(self, now: float):
+        """Reclaim locks that were held when their entry left, or never had one"""
+        self._last_sweep = now
+        for key in [k for k in self._locks if k not in self._entries]:
+            self._reclaim_lock(key)
+
+    def _reschedule(self, key: Hashable, entry: _Entry, expires_at: float):
+        entry.expires_at = expires_at
+        entry.slot = self._wheel.schedule(key, expires_at, previous_slot=entry.slot)
+
+    def _evict(self, key: Hashable, reason: str):
+        entry = self._entries.pop(key)
+        self._wheel.cancel(key, entry.slot)
+        self._memory_bytes -= entry.size
+        self.stats[reason] += 1
+        SESSION_STORE_EVICTIONS.labels(store=self.name, reason=reason).inc()
+
+        if self._spill is not None:
+            if reason == "lru":
+                self._spill_write([(key, entry)])
+                self.stats["spilled"] += 1
+            else:
+                self._spill_delete([key])
+            self._dirty.discard(key)
+        # A spilled entry can come back on access; its lock is left to the sweep
+        if reason != "lru" or self._spill is None:
+            self._reclaim_lock(key)
+
+        if self.on_evict is not None:
+            try:
+                self.on_evict(key, entry.value, reason)
+            except Exception as e:
+                logger.warning(f"[SessionStore:{self.name}] on_evict failed for {key!r}: {e}")
+
+    # -------------------- Spill --------------------
+
+    def _open_spill(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._spill = sqlite3.connect(path, check_same_thread=False)
+        self._spill.execute(
+            "CREATE TABLE IF NOT EXISTS session_store ("
+            "store TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, PRIMARY KEY (store, key))"
+        )
+        self._spill.commit()
+
+    def _spill_write(self, items: List[Tuple[Hashable, _Entry]]):
+        rows = []
+        for key, entry in items:
+            try:
+                rows.append((self.name, pickle.dumps(key), pickle.dumps(entry.value), entry.expires_at))
+            except Exception as e:
+                logger.warning(f"[SessionStore:{self.name}] Cannot spill {key!r}: {e}")
+        try:
+            self._spill.executemany("INSERT OR REPLACE INTO session_store VALUES (?, ?, ?, ?)", rows)
+            self._spill.commit()
+        except sqlite3.Error as e:
+            logger.error(f"[SessionStore:{self.name}] Spill write failed: {e}")
+
+    def _spill_delete(self, keys: List[Hashable]):
+        try:
+            self._spill.executemany(
+                "DELETE FROM session_store WHERE store = ? AND key = ?",
+                [(self.name, pickle.dumps(key)) for key in keys]
+            )
+            self._spill.commit()
+        except (sqlite3.Error, pickle.PicklingError) as e:
+            logger.error(f"[SessionStore:{self.name}] Spill delete failed: {e}")
+
+    def _spill_purge_expired(self):
+        try:
+            self._spill.execute(
+                "DELETE FROM session_store WHERE store = ? AND expires_at <= ?",
+                (self.name, self._clock())
+            )
+            self._spill.commit()
+        except sqlite3.Error as e:
+            logger.error(f"[SessionStore:{self.name}] Spill purge failed: {e}")
+
+    def _promote(self, key: Hashable, now: float) -> Optional[_Entry]:
+        """Load a spilled entry back into memory"""
+        try:
+            row = self._spill.execute(
+                "SELECT value, expires_at FROM session_store WHERE store = ? AND key = ?",
+                (self.name, pickle.dumps(key))
+            ).fetchone()
+        except (sqlite3.Error, pickle.PicklingError) as e:
+            logger.error(f"[SessionStore:{self.name}] Spill read failed: {e}")
+            return None
+        if row is None:
+            return None
+        if row[1] <= now:
+            self._spill_delete([key])
+            return None
+        value = pickle.loads(row[0])
+        self.set(key, value, ttl=row[1] - now)
+        self.stats["promoted"] += 1
+        return self._entries.get(key)
+
+    def flush(self) -> int:
+        """Write entries changed since the last flush to the spill"""
+        with self._mutex:
+            self._last_flush = self._clock()
+            if self._spill is None or not self._dirty:
+                return 0
+            items = [(k, self._entries[k]) for k in self._dirty if k in self._entries]
+            self._dirty.clear()
+            self._spill_write(items)
+            return len(items)
+
+    def restore(self) -> int:
+        """Load unexpired spilled entries (most recent deadlines first, up to the cap)"""
+        if self._spill is None:
+            return 0
+        now = self._clock()
+        self._spill_purge_expired()
+        rows = self._spill.execute(
+            "SELECT key, value, expires_at FROM session_store WHERE store = ? "
+            "ORDER BY expires_at DESC LIMIT ?",
+            (self.name, self.max_entries)
+        ).fetchall()
+        restored = 0
+        with self._mutex:
+            for key_blob, value_blob, expires_at in reversed(rows):
+                try:
+                    key, value = pickle.loads(key_blob), pickle.loads(value_blob)
+                except Exception as e:
+                    logger.warning(f"[SessionStore:{self.name}] Unreadable spilled entry: {e}")
+                    continue
+                size = approx_size(value)
+                self._entries[key] = _Entry(value, expires_at, self._wheel.schedule(key, expires_at), size)
+                self._memory_bytes += size
+                restored += 1
+        self.stats["restored"] += restored
+        if restored:
+            logger.info(f"[SessionStore:{self.name}] Restored {restored} entries from spill")
+        return restored
+
+    def close(self):
+        """Flush and close the spill"""
+        if self._spill is not None:
+            self.flush()
+            self._spill.close()
+            self._spill = None
+
+    # -------------------- Stats --------------------
+
+    def _publish(self):
+        SESSION_STORE_ENTRIES.labels(**self._labels).set(len(self._entries))
+        SESSION_STORE_MEMORY_BYTES.labels(**self._labels).set(self._memory_bytes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "name": self.name,
+            "entries": len(self._entries),
+            "memory_bytes": self._memory_bytes,
+            "locks": len(self._locks),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "spill": self._spill is not None,
+        }
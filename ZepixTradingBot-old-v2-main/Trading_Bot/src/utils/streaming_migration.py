@@ -0,0 +1,267 @@
+"""
+Streaming Migration - Chunked, Resumable SQLite Row Copying
+Shared pipeline for DataMigrationTool and DatabaseMigration
+
+Source rows are read in keyset-paginated chunks (``rowid > last_key``),
+transformed a batch at a time and written with ``executemany`` inside
+one transaction per chunk. The last migrated key is stored in a
+``migration_checkpoint`` table in the target database, in the same
+transaction as the chunk it describes, so an interrupted run resumes
+exactly where it stopped. Backups use SQLite's online backup API, which
+is consistent even while the bot holds the database open.
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from typing import Dict, Any, List, Optional, Callable, Sequence, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+import sqlite3
+import time
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+CHECKPOINT_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS migration_checkpoint (
+        job TEXT PRIMARY KEY,
+        last_key INTEGER NOT NULL,
+        rows_done INTEGER DEFAULT 0,
+        updated_at TIMESTAMP
+    )
+"""
+
+
+# ==================== Data Classes ====================
+
+@dataclass
+class StreamStats:
+    """Counters for one streaming copy"""
+    job: str
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_skipped: int = 0
+    rows_failed: int = 0
+    chunks: int = 0
+    resumed_from: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_read / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job": self.job,
+            "rows_read": self.rows_read,
+            "rows_written": self.rows_written,
+            "rows_skipped": self.rows_skipped,
+            "rows_failed": self.rows_failed,
+            "chunks": self.chunks,
+            "resumed_from": self.resumed_from,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+# ==================== Backups ====================
+
+def online_backup(source_path: str, backup_path: str, pages_per_step: int = 1024) -> str:
+    """
+    Copy a live SQLite database with the online backup API.
+
+    Args:
+        source_path: Database to back up
+        backup_path: Destination file (parent directory is created)
+        pages_per_step: Pages copied per step; other connections can write between steps
+
+    Returns:
+        The backup path
+    """
+    directory = os.path.dirname(str(backup_path))
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    source = sqlite3.connect(str(source_path))
+    target = sqlite3.connect(str(backup_path))
+    try:
+        source.backup(target, pages=pages_per_step)
+    finally:
+        target.close()
+        source.close()
+    return str(backup_path)
+
+
+# ==================== Checkpoints ====================
+
+def load_checkpoint(conn: sqlite3.Connection, job: str) -> Tuple[int, int]:
+    """Return (last_key, rows_done) for a job, or (0, 0) if it has not started"""
+    conn.execute(CHECKPOINT_TABLE_SQL)
+    row = conn.execute(
+        "SELECT last_key, rows_done FROM migration_checkpoint WHERE job = ?", (job,)
+    ).fetchone()
+    return (row[0], row[1]) if row else (0, 0)
+
+
+def clear_checkpoint(conn: sqlite3.Connection, job: str):
+    """Forget a job's progress (after completion or rollback)"""
+    conn.execute(CHECKPOINT_TABLE_SQL)
+    conn.execute("DELETE FROM migration_checkpoint WHERE job = ?", (job,))
+    conn.commit()
+
+
+def _save_checkpoint(conn: sqlite3.Connection, job: str, last_key: int, rows_done: int):
+    conn.execute(
+        "INSERT OR REPLACE INTO migration_checkpoint (job, last_key, rows_done, updated_at) "
+        "VALUES (?, ?, ?, ?)",
+        (job, last_key, rows_done, datetime.now().isoformat())
+    )
+
+
+# ==================== Streaming Copy ====================
+
+def iter_chunks(
+    conn: sqlite3.Connection,
+    table: str,
+    where: str = "",
+    params: Sequence[Any] = (),
+    after_key: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """
+    Yield lists of rows ordered by rowid, ``chunk_size`` at a time.
+
+    Each row is a ``sqlite3.Row`` carrying its key as ``_key``; keyset
+    pagination keeps every query an index range scan no matter how deep
+    into the table it is. Rows come from a cursor of their own, so the
+    caller's ``conn.row_factory`` is left untouched.
+    """
+    condition = f"({where}) AND " if where else ""
+    query = (
+        f"SELECT rowid AS _key, * FROM {table} "
+        f"WHERE {condition}rowid > ? ORDER BY rowid LIMIT ?"
+    )
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    last_key = after_key
+    while True:
+        rows = cursor.execute(query, (*params, last_key, chunk_size)).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_key = rows[-1]["_key"]
+
+
+def stream_copy(
+    source_conn: sqlite3.Connection,
+    target_conn: sqlite3.Connection,
+    job: str,
+    table: str,
+    insert_sql: str,
+    transform: Callable[[Dict[str, Any]], Sequence[Any]],
+    where: str = "",
+    params: Sequence[Any] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    progress: Optional[Callable[[StreamStats], None]] = None
+) -> StreamStats:
+    """
+    Copy rows from ``source_conn.table`` into ``target_conn`` in chunks.
+
+    Args:
+        job: Checkpoint name (unique per source/target/filter)
+        insert_sql: Parameterised INSERT executed with ``executemany``
+        transform: Maps one source row dict to the INSERT parameters
+        resume: Continue after the stored checkpoint instead of from the start
+        progress: Called after every committed chunk
+
+    Returns:
+        StreamStats (the checkpoint is cleared once the copy completes)
+    """
+    last_key, rows_done = load_checkpoint(target_conn, job) if resume else (0, 0)
+    if not resume:
+        clear_checkpoint(target_conn, job)
+    stats = StreamStats(job=job, resumed_from=last_key)
+    if last_key:
+        logger.info(f"[Migration] Resuming {job} after key {last_key} ({rows_done} rows already done)")
+
+    started = time.perf_counter()
+    for rows in iter_chunks(source_conn, table, where, params, last_key, chunk_size):
+        batch = []
+        for row in rows:
+            try:
+                batch.append(tuple(transform(dict(row))))
+            except Exception as e:
+                stats.rows_failed += 1
+                logger.error(f"[Migration] {job}: transform failed for key {row['_key']}: {e}")
+
+        # Chunk rows and checkpoint commit together
+        if not target_conn.in_transaction:
+            target_conn.execute("BEGIN")
+        written, failed = _write_chunk(target_conn, insert_sql, batch, job)
+        stats.rows_read += len(rows)
+        stats.rows_written += written
+        stats.rows_failed += failed
+        stats.rows_skipped += len(batch) - written - failed
+        stats.chunks += 1
+        rows_done += len(rows)
+
+        _save_checkpoint(target_conn, job, rows[-1]["_key"], rows_done)
+        target_conn.commit()
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        if progress:
+            progress(stats)
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    clear_checkpoint(target_conn, job)
+    logger.info(
+        f"[Migration] {job}: {stats.rows_written} written, {stats.rows_skipped} skipped, "
+        f"{stats.rows_failed} failed in {stats.elapsed_seconds:.2f}s "
+        f"({stats.rows_per_second:.0f} rows/sec)"
+    )
+    return stats
+
+
+def _write_chunk(
+    conn: sqlite3.Connection,
+    insert_sql: str,
+    batch: List[Tuple[Any, ...]],
+    job: str
+) -> Tuple[int, int]:
+    """
+    Insert one chunk with executemany; on error, retry row by row so only
+    the offending rows are counted as failed.
+
+    Returns:
+        (rows written, rows failed); ignored duplicates are neither
+    """
+    if not batch:
+        return 0, 0
+    savepoint_open = False
+    try:
+        conn.execute("SAVEPOINT migration_chunk")
+        savepoint_open = True
+        cursor = conn.executemany(insert_sql, batch)
+        conn.execute("RELEASE migration_chunk")
+        return max(cursor.rowcount, 0), 0
+    except sqlite3.Error as e:
+        if savepoint_open:
+            conn.execute("ROLLBACK TO migration_chunk")
+            conn.execute("RELEASE migration_chunk")
+        logger.warning(f"[Migration] {job}: batch insert failed ({e}), retrying row by row")
+
+    written = failed = 0
+    for params in batch:
+        try:
+            written += max(conn.execute(insert_sql, params).rowcount, 0)
+        except sqlite3.Error as e:
+            failed += 1
+            logger.error(f"[Migration] {job}: row insert failed: {e}")
+    return written, failed
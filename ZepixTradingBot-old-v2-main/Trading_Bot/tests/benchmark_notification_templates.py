@@ -0,0 +1,89 @@
+"""
+Notification Formatting Benchmark
+Per-notification cost of every registered NotificationType format
+
+Measured per format:
+- render:     one formatter call (compiled template or plain function)
+- per-target: CRITICAL broadcast to 3 bots + voice, each formatting
+              the notification itself
+- send:       the same broadcast through NotificationRouter.send,
+              which formats once and delivers the text to every target
+
+Usage:
+    python tests/benchmark_notification_templates.py [iterations]
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.telegram.notification_router import (
+    NotificationPriority, create_default_router
+)
+from src.telegram.template_engine import CompiledTemplate
+
+logging.basicConfig(level=logging.CRITICAL)
+
+SAMPLE = {
+    "plugin_name": "v3_combined", "symbol": "XAUUSD", "direction": "BUY", "entry_price": 2030.55,
+    "exit_price": 2041.10, "order_a_lot": 0.10, "order_a_sl": 2020.0, "order_a_tp": 2045.0,
+    "order_b_lot": 0.20, "order_b_sl": 2022.0, "order_b_tp": 2060.0, "profit": 42.5, "loss": -18.2,
+    "pnl": 12.75, "pips": 10.5, "timeframe": "15m", "sl": 2020.0, "tp": 2045.0, "lot_size": 0.1,
+    "pattern": "breakout", "tp_level": 2, "level": 2, "chain_id": "PC-17", "enabled": True,
+    "reason": "Trailing stop", "hold_time": "1h 12m", "total_trades": 12, "winners": 8, "losers": 4,
+    "win_rate": 66.7, "net_pnl": 120.4, "gross_profit": 180.0, "gross_loss": 59.6, "balance": 10250.0,
+}
+
+TARGETS = 4  # CRITICAL broadcast: controller, notification, analytics bots + voice
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6  # microseconds
+
+
+def run_formats(router, iterations):
+    print(f"[{'BENCHMARK':<12}] Notification formats, 3 bots + voice ({iterations} iterations)")
+    print(f"  {'type':<26}{'render (us)':>12}{'per-target (us)':>17}{'send (us)':>13}")
+    results = {}
+    for notification_type, formatter in sorted(router.formatters.items(), key=lambda kv: kv[0].value):
+        def render():
+            formatter(SAMPLE)
+
+        def per_target():
+            # Each bot and the voice alert formatting the notification itself
+            for _ in range(TARGETS):
+                formatter(SAMPLE)
+
+        def send():
+            router.send(notification_type, "", SAMPLE, priority=NotificationPriority.CRITICAL)
+
+        _time(per_target, 200)  # warm-up
+        t_render = _time(render, iterations)
+        t_before = _time(per_target, iterations)
+        t_after = _time(send, iterations)
+        results[notification_type.value] = (t_render, t_before, t_after)
+        print(f"  {notification_type.value:<26}{t_render:>12.2f}{t_before:>17.2f}{t_after:>13.2f}")
+    compiled = sum(isinstance(f, CompiledTemplate) for f in router.formatters.values())
+    print(f"  {len(results)} formats ({compiled} compiled templates)")
+    print("-" * 68)
+    return results
+
+
+def _noop(*args):
+    return True
+
+
+def run(iterations=20000):
+    return run_formats(create_default_router(_noop, _noop, _noop, _noop), iterations)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,83 @@
+"""
+Webhook Parse + Validate Benchmark
+Per-alert cost of the reference path vs the fast path
+
+Before: json.loads -> SignalParser.parse -> SignalParser.validate,
+        parse_v6_payload for pipe payloads
+After:  orjson decode_alert -> FastSignalParser.parse -> FastSignalParser.validate,
+        parse_v6_payload_fast for pipe payloads
+
+Usage:
+    python tests/benchmark_signal_parsing.py [iterations]
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.signal_parser import SignalParser
+from src.utils.fast_signal_parser import FastSignalParser, decode_alert, parse_v6_payload_fast
+from src.core.zepix_v6_alert import parse_v6_payload
+
+logging.basicConfig(level=logging.CRITICAL)
+
+V3_BODY = json.dumps({
+    "type": "entry_v3", "signal_type": "BUY", "symbol": "XAUUSD", "logic": "LOGIC2",
+    "price": 2030.55, "sl_pips": 25, "trend": "bullish", "consensus_score": 7,
+    "mtf_trends": "1,1,1,0,1,1", "timestamp": "2026-10-19T10:15:00"
+}).encode()
+
+V6_BODY = json.dumps({
+    "type": "entry_v6", "signal": "trendline_break", "symbol": "EURUSD", "tf": "15",
+    "price": 1.0845, "trend_pulse": "BULLISH", "conditions": {"adx": 27.5, "tl": "broken"}
+}).encode()
+
+V6_PIPE = "BULLISH_ENTRY|XAUUSD|5|2030.50|BUY|HIGH|85|25.5|STRONG|2028.00|2032.00|2035.00|2038.00|5/1|TL_OK"
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6  # microseconds
+
+
+def before_json(body):
+    signal = SignalParser.parse(json.loads(body))
+    return SignalParser.validate(signal)
+
+
+def after_json(body):
+    signal = FastSignalParser.parse(decode_alert(body))
+    return FastSignalParser.validate(signal)
+
+
+def run(iterations=20000):
+    cases = [
+        ("V3 JSON alert", lambda: before_json(V3_BODY), lambda: after_json(V3_BODY)),
+        ("V6 JSON alert", lambda: before_json(V6_BODY), lambda: after_json(V6_BODY)),
+        ("V6 pipe payload", lambda: parse_v6_payload(V6_PIPE), lambda: parse_v6_payload_fast(V6_PIPE)),
+    ]
+
+    print(f"[{'BENCHMARK':<12}] Webhook parse + validate ({iterations} iterations)")
+    print(f"  {'case':<18}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    results = {}
+    for name, before, after in cases:
+        _time(before, 1000)  # warm-up
+        _time(after, 1000)
+        t_before = _time(before, iterations)
+        t_after = _time(after, iterations)
+        results[name] = (t_before, t_after)
+        print(f"  {name:<18}{t_before:>14.2f}{t_after:>14.2f}{t_before / t_after:>9.2f}x")
+    print("-" * 56)
+    return results
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,145 @@
+"""
+Tests for Multi-Account Sharding
+Order fan-out to account worker processes backed by MT5Emulator
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+
+pytest.importorskip("pydantic")
+
+from src.clients.mt5_client import MT5Client
+from src.clients.account_shards import AccountSpec, ShardedMT5Client
+from src.simulation.mt5_emulator import MT5Emulator
+
+BASE_CONFIG = {
+    "simulate_orders": False, "mt5_retries": 1, "mt5_wait": 0,
+    "mt5_login": 1, "mt5_password": "x", "mt5_server": "Emulator",
+    "symbol_mapping": {},
+}
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    def build(*accounts, primary_emulator=None, primary=None):
+        if primary is None:
+            primary = MT5Client(dict(BASE_CONFIG), mt5_module=primary_emulator or MT5Emulator(seed=1))
+            assert primary.initialize()
+        client = ShardedMT5Client(primary, dict(BASE_CONFIG), accounts=list(accounts), call_timeout=20,
+                                  mirrors_path=str(tmp_path / "account_mirrors.json"))
+        client.start()
+        created.append(client)
+        return client
+
+    created = []
+    yield build
+    for client in created:
+        client.shutdown()
+
+
+def emulated(account_id, **kwargs):
+    return AccountSpec(account_id=account_id, emulator={"seed": 2, "balance": 5000.0}, **kwargs)
+
+
+def buy_xau(client, lot=0.2):
+    price = client.get_current_price("XAUUSD")
+    return client.place_order("XAUUSD", "buy", lot, price, sl=price - 20, tp=price + 20)
+
+
+class TestAccountSpec:
+    """Test per-account lot scaling"""
+
+    def test_multiplier_rounds_down_to_step(self):
+        assert AccountSpec("a", lot_multiplier=0.5).scale_lot(0.15) == 0.07
+        assert AccountSpec("a", lot_multiplier=2.0).scale_lot(0.1) == 0.2
+
+    def test_min_and_max_lot(self):
+        assert AccountSpec("a", lot_multiplier=0.01).scale_lot(0.1) == 0.01
+        assert AccountSpec("a", max_lot=0.05).scale_lot(1.0) == 0.05
+
+    def test_balance_ratio(self):
+        spec = AccountSpec("a", lot_mode="balance_ratio")
+        assert spec.scale_lot(0.2, balance_ratio=0.5) == 0.1
+        assert AccountSpec("a").scale_lot(0.2, balance_ratio=0.5) == 0.2
+
+    def test_password_is_masked(self):
+        assert AccountSpec("a", password="secret").to_dict()["password"] == "***"
+
+
+class TestShardedMT5Client:
+    """Test fan-out, mirroring and reporting across account workers"""
+
+    def test_order_is_mirrored_modified_and_closed(self, sharded):
+        client = sharded(emulated("half", lot_multiplier=0.5), emulated("capped", max_lot=0.05))
+        ticket = buy_xau(client)
+        assert ticket is not None
+        assert set(client.mirrors[ticket]) == {"half", "capped"}
+
+        volumes = {
+            aid: client.shards[aid].call_sync("get_positions")[0]["volume"]
+            for aid in ("half", "capped")
+        }
+        assert volumes == {"half": 0.1, "capped": 0.05}
+
+        price = client.get_current_price("XAUUSD")
+        assert client.modify_position(ticket, sl=price - 10, tp=price + 30)
+        assert client.shards["half"].call_sync("get_positions")[0]["tp"] == pytest.approx(price + 30, abs=0.01)
+
+        assert client.close_position(ticket)
+        assert ticket not in client.mirrors
+        assert client.shards["half"].call_sync("get_positions") == []
+        assert client.shards["capped"].call_sync("get_positions") == []
+
+    def test_per_account_risk_blocks_only_that_account(self, sharded):
+        client = sharded(emulated("limited", max_open_positions=1), emulated("open"))
+        first = buy_xau(client)
+        second = buy_xau(client)
+        assert set(client.mirrors[first]) == {"limited", "open"}
+        assert set(client.mirrors[second]) == {"open"}
+
+        report = client.get_accounts_report()
+        by_id = {a["account_id"]: a for a in report["accounts"]}
+        assert by_id["limited"]["risk_blocked"] == 1
+        assert by_id["limited"]["open_positions"] == 1
+        assert by_id["open"]["open_positions"] == 2
+        assert report["totals"]["open_positions"] == 5
+        assert report["totals"]["balance"] == pytest.approx(
+            sum(a["balance"] for a in report["accounts"])
+        )
+
+    def test_primary_failure_rolls_back_mirrors(self, sharded):
+        emulator = MT5Emulator(seed=1)
+        client = sharded(emulated("mirror"), primary_emulator=emulator)
+        emulator.fail_next("order_send")
+        assert buy_xau(client) is None
+        assert client.mirrors == {}
+        assert client.shards["mirror"].call_sync("get_positions") == []
+
+    def test_dead_worker_is_restarted(self, sharded):
+        client = sharded(emulated("flaky"))
+        shard = client.shards["flaky"]
+        shard.process.kill()
+        shard.process.join(5)
+
+        ticket = buy_xau(client)
+        assert shard.restarts == 1
+        assert "flaky" in client.mirrors[ticket]
+
+    def test_attributes_reach_primary(self, sharded):
+        client = sharded(emulated("any"))
+        client.telegram_bot = "bot"
+        assert client.primary.telegram_bot == "bot"
+        assert client.get_account_balance() == client.primary.get_account_balance()
+
+    def test_mirror_map_survives_restart(self, sharded):
+        client = sharded(emulated("mirror"))
+        kept, closed = buy_xau(client), buy_xau(client)
+        mirrored = client.mirrors[kept]
+        client.primary.close_position(closed)  # e.g. SL hit while the bot is down
+        for shard in client.shards.values():
+            shard.stop()
+
+        restarted = sharded(emulated("mirror"), primary=client.primary)
+        assert restarted.mirrors == {kept: mirrored}
+
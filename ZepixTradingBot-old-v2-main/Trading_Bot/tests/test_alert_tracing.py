@@ -0,0 +1,184 @@
+"""
+Tests for Per-Alert Tracing
+Verifies trace/span recording, context propagation, ring buffer, JSONL output and reporting
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+from src.monitoring.tracing import Tracer, get_tracer, traced
+
+
+@pytest.fixture
+def tracer():
+    with tempfile.TemporaryDirectory() as tmp:
+        tracer = Tracer(capacity=3, jsonl_path=os.path.join(tmp, "traces.jsonl"), flush_interval=0.05)
+        yield tracer
+        tracer.close()
+
+
+# ============================================================================
+# Recording
+# ============================================================================
+
+class TestTraceRecording:
+    """Test traces and spans"""
+
+    def test_nested_spans_have_parents(self, tracer):
+        with tracer.start_trace("webhook", endpoint="/webhook") as trace:
+            with tracer.span("plugin") as outer:
+                with tracer.span("mt5.place_order") as inner:
+                    pass
+
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert [s.name for s in trace.spans] == ["mt5.place_order", "plugin"]
+        assert trace.duration_ms >= outer.duration_ms >= inner.duration_ms
+
+    def test_span_without_trace_is_noop(self, tracer):
+        with tracer.span("background") as span:
+            assert span is None
+        assert tracer.get_recent() == []
+
+    def test_nested_start_trace_becomes_span(self, tracer):
+        with tracer.start_trace("webhook") as outer:
+            with tracer.start_trace("process_alert") as inner:
+                assert inner is outer
+        assert len(tracer.get_recent()) == 1
+        assert outer.spans[0].name == "process_alert"
+
+    def test_error_marks_span_and_trace(self, tracer):
+        with pytest.raises(ValueError):
+            with tracer.start_trace("webhook") as trace:
+                with tracer.span("db.save_trade"):
+                    raise ValueError("locked")
+        assert trace.status == "error"
+        assert trace.spans[0].status == "error"
+        assert trace.spans[0].attributes["error"] == "locked"
+
+    def test_context_propagates_into_tasks(self, tracer):
+        async def child():
+            with tracer.span("telegram.send"):
+                await asyncio.sleep(0)
+
+        async def handle():
+            with tracer.start_trace("webhook") as trace:
+                await asyncio.gather(child(), child())
+            return trace
+
+        trace = asyncio.run(handle())
+        assert [s.name for s in trace.spans] == ["telegram.send", "telegram.send"]
+
+
+# ============================================================================
+# Storage and Reporting
+# ============================================================================
+
+class TestTraceStorage:
+    """Test ring buffer, JSONL file and slowest report"""
+
+    def test_ring_buffer_and_jsonl(self, tracer):
+        for i in range(5):
+            with tracer.start_trace("webhook", alert_type=f"entry_{i}"):
+                pass
+        assert len(tracer.get_recent()) == 3
+
+        tracer.flush()
+        with open(tracer.jsonl_path) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 5
+        assert lines[-1]["attributes"]["alert_type"] == "entry_4"
+
+    def test_jsonl_written_by_background_thread(self, tracer):
+        import time
+        tracer.flush_interval = 0.3
+        with tracer.start_trace("webhook"):
+            pass
+        assert len(tracer._pending) == 1 and not os.path.exists(tracer.jsonl_path)
+
+        deadline = time.monotonic() + 2
+        while tracer._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        tracer.close()
+        with open(tracer.jsonl_path) as f:
+            assert [json.loads(line)["name"] for line in f] == ["webhook"]
+
+    def test_slowest_and_lookup(self, tracer):
+        import time
+        with tracer.start_trace("fast"):
+            pass
+        with tracer.start_trace("slow", alert_type="entry_v3", symbol="XAUUSD") as slow:
+            with tracer.span("mt5.place_order"):
+                time.sleep(0.02)
+
+        assert tracer.get_slowest(1)[0] is slow
+        assert tracer.get_trace(slow.trace_id) is slow
+        report = tracer.format_slowest()
+        assert slow.trace_id in report
+        assert "mt5.place_order" in report
+
+    def test_traced_decorator(self, tracer, monkeypatch):
+        import src.monitoring.tracing as tracing
+        monkeypatch.setattr(tracing, "_tracer", tracer)
+
+        @traced("process_alert", root=True)
+        async def process_alert():
+            return await place()
+
+        @traced("mt5.place_order")
+        def place_sync():
+            return 42
+
+        async def place():
+            return place_sync()
+
+        assert asyncio.run(process_alert()) == 42
+        trace = tracer.get_recent()[0]
+        assert trace.name == "process_alert"
+        assert trace.spans[0].name == "mt5.place_order"
+
+
+# ============================================================================
+# Pipeline Integration
+# ============================================================================
+
+class TestPipelineTracing:
+    """Test that the webhook handler opens a trace and the router adds spans"""
+
+    def test_webhook_trace_covers_routing(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.api import webhook_handler
+
+        plugin = MagicMock()
+        plugin.plugin_id = "v3_combined"
+
+        async def process_signal(signal):
+            return {"status": "success"}
+
+        plugin.process_signal = process_signal
+        registry = MagicMock()
+        registry.get_plugin.return_value = plugin
+
+        from src.core.plugin_router import PluginRouter
+        monkeypatch.setattr(webhook_handler, "_plugin_router", PluginRouter(registry))
+        monkeypatch.setattr(get_tracer(), "jsonl_path", None)
+
+        client = TestClient(webhook_handler.app)
+        response = client.post("/webhook", json={
+            "type": "entry_v3", "symbol": "XAUUSD", "direction": "buy", "tf": "15",
+            "price": 2650.0, "signal_type": "Institutional_Launchpad"
+        })
+        trace_id = response.headers.get("X-Trace-Id")
+        assert trace_id
+
+        trace = get_tracer().get_trace(trace_id)
+        names = [s.name for s in trace.spans]
+        assert "signal.parse" in names
+        assert "plugin_router.execute_plugin" in names
+        assert trace.attributes["symbol"] == "XAUUSD"
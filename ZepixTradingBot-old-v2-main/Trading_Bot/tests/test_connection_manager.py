@@ -0,0 +1,191 @@
+"""
+Tests for SQLite Connection Manager
+Verifies the single writer, reader pool, pragmas, async API and migrated stores
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from src.database.connection_manager import SQLiteConnectionManager, get_connection_manager
+from src.database import TradeDatabase
+from src.core.plugin_database import ConnectionPoolExhausted, PluginDatabase
+from src.core.services.database_service import DatabaseService
+from src.core.database_sync_manager import DatabaseSyncManager, SyncStatus
+from src.monitoring.metrics_registry import DB_LOCK_WAIT, DB_QUERY_LATENCY
+
+
+@pytest.fixture
+def manager():
+    manager = SQLiteConnectionManager(max_readers=2, timeout=0.2)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def db(manager, tmp_path):
+    db = manager.database(str(tmp_path / "cm.db"))
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    return db
+
+
+class TestManagedDatabase:
+    """Test writer transactions, reader pooling and pragmas"""
+
+    def test_one_database_per_file(self, manager, tmp_path):
+        path = str(tmp_path / "shared.db")
+        assert manager.database(path) is manager.database(os.path.relpath(path))
+        assert manager.database(":memory:") is not manager.database(":memory:")
+
+    def test_pragmas_applied_to_every_connection(self, manager, tmp_path):
+        db = manager.database(str(tmp_path / "p.db"), pragmas={"foreign_keys": "ON"})
+        with db.writer() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
+        with db.reader() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone() == (200,)
+
+    def test_writer_commits_or_rolls_back(self, db):
+        with db.writer() as conn:
+            conn.execute("INSERT INTO t (v) VALUES ('a')")
+        with pytest.raises(ValueError):
+            with db.writer() as conn:
+                conn.execute("INSERT INTO t (v) VALUES ('b')")
+                raise ValueError("boom")
+
+        assert db.fetchall("SELECT v FROM t") == [("a",)]
+        assert db.get_stats()["rollbacks"] == 1
+
+    def test_reader_pool_is_bounded(self, db):
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_reader():
+            with db.reader():
+                held.set()
+                release.wait(1)
+
+        threads = [threading.Thread(target=hold_reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+            held.wait(1)
+            held.clear()
+        with pytest.raises(TimeoutError):
+            with db.reader():
+                pass
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert db.fetchone("SELECT COUNT(*) FROM t") == (0,)
+        assert db.get_stats()["readers_open"] == 2
+
+    def test_replaced_file_is_reopened(self, db):
+        db.execute("INSERT INTO t (v) VALUES ('old')")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db.path + suffix):
+                os.remove(db.path + suffix)
+
+        db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        assert db.fetchall("SELECT v FROM t") == []
+        assert db.get_stats()["reopens"] == 1
+
+    def test_metrics_recorded_per_database(self, db):
+        db.fetchall("SELECT * FROM t")
+        assert DB_QUERY_LATENCY.labels(database="cm.db", mode="read").count >= 1
+        assert DB_LOCK_WAIT.labels(database="cm.db", mode="write").count >= 1
+
+    async def test_async_api_runs_on_executor(self, db):
+        cursor = await db.aexecute("INSERT INTO t (v) VALUES (?)", ("x",))
+        assert cursor.lastrowid == 1
+        assert await db.afetchall("SELECT v FROM t") == [("x",)]
+        assert await db.arun(lambda: threading.current_thread().name) != threading.current_thread().name
+
+    def test_memory_database_reads_through_writer(self, manager):
+        db = manager.database(":memory:")
+        db.execute("CREATE TABLE m (x)")
+        db.execute("INSERT INTO m VALUES (1)")
+        assert db.fetchall("SELECT x FROM m") == [(1,)]
+
+
+class TestMigratedStores:
+    """Test the bot's stores share managed databases"""
+
+    def test_trade_database_owns_its_connection(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        first, second = TradeDatabase(), TradeDatabase()
+        assert first.conn is not second.conn
+
+        first.conn.execute("INSERT INTO trades (trade_id) VALUES ('T1')")  # uncommitted
+        with pytest.raises(ValueError):
+            with first.db.writer():
+                raise ValueError("other owner fails")
+        get_connection_manager().close(first.db.path)
+        first.conn.commit()
+
+        assert second.conn.execute("SELECT trade_id FROM trades").fetchall() == [("T1",)]
+        first.conn.close()
+        second.conn.close()
+
+    def test_trade_database_queries_use_writer_and_readers(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        trade_db = TradeDatabase()
+        writes = DB_QUERY_LATENCY.labels(database="trading_bot.db", mode="write").count
+        before = dict(trade_db.db.stats)
+
+        trade_db.create_session("SES_CM", "EURUSD", "BUY", "test")
+        assert trade_db.get_active_session("EURUSD")["session_id"] == "SES_CM"
+
+        assert trade_db.db.stats["writes"] == before["writes"] + 1
+        assert trade_db.db.stats["reads"] == before["reads"] + 1
+        assert DB_QUERY_LATENCY.labels(database="trading_bot.db", mode="write").count == writes + 1
+        trade_db.conn.close()
+        get_connection_manager().close(trade_db.db.path)
+
+    def test_plugin_database_uses_manager(self, tmp_path):
+        plugin_db = PluginDatabase(plugin_id="cm_plugin", db_dir=str(tmp_path), pool_size=1, timeout=0.1)
+        managed = get_connection_manager().database(plugin_db.db_path)
+        trade_id = plugin_db.save_trade({"ticket": 1, "symbol": "EURUSD", "direction": "BUY",
+                                         "lot_size": 0.1, "entry_price": 1.1})
+
+        assert plugin_db.get_trade(trade_id)["symbol"] == "EURUSD"
+        with plugin_db.get_connection():
+            with pytest.raises(ConnectionPoolExhausted):
+                with plugin_db.get_connection():
+                    pass
+        assert managed.get_stats()["writes"] >= 2
+        plugin_db.close()
+
+    async def test_database_service_shares_files(self, tmp_path):
+        service = DatabaseService(base_path=str(tmp_path))
+        await service.initialize_database("v6_price_action_1m", "CREATE TABLE trades (id INTEGER PRIMARY KEY, s TEXT);")
+        await service.insert_record("v6_price_action_5m", "trades", {"s": "GBPUSD"})
+
+        assert service._connections["v6_price_action_1m"] is service._connections["v6_price_action_5m"]
+        managed = await service.get_connection("v6_price_action_1m")
+        assert managed is service._connections["v6_price_action_1m"]
+        assert await service.execute_query("v6_price_action_1m", "SELECT s FROM trades") == [{"s": "GBPUSD"}]
+        await service.close_all()
+        assert await service.count_records("v6_price_action_15m", "trades") == 1
+
+    async def test_sync_manager_copies_new_records(self, tmp_path):
+        plugin_db = PluginDatabase(plugin_id="combined_v3", db_dir=str(tmp_path))
+        plugin_db.save_trade({"ticket": 7, "symbol": "XAUUSD", "direction": "SELL",
+                              "lot_size": 0.2, "entry_price": 2000.0})
+        sync = DatabaseSyncManager(v3_db_path=plugin_db.db_path,
+                                   central_db_path=str(tmp_path / "central.db"))
+
+        first = await sync._sync_plugin("combined_v3", plugin_db.db_path)
+        second = await sync._sync_plugin("combined_v3", plugin_db.db_path)
+
+        assert (first.status, first.records_synced) == (SyncStatus.SUCCESS, 1)
+        assert second.status == SyncStatus.SKIPPED
+        conn = sqlite3.connect(str(tmp_path / "central.db"))
+        assert conn.execute("SELECT symbol FROM aggregated_trades").fetchall() == [("XAUUSD",)]
+        conn.close()
+        plugin_db.close()
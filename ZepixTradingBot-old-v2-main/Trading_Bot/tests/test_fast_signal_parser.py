@@ -0,0 +1,93 @@
+"""
+Tests for Fast Signal Parser
+Verifies the fast path matches SignalParser and parse_v6_payload
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import json
+from dataclasses import asdict
+
+from src.utils.signal_parser import SignalParser
+from src.utils.fast_signal_parser import (
+    FastSignalParser, decode_alert, encode_alert, parse_v6_payload_fast
+)
+from src.core.zepix_v6_alert import parse_v6_payload
+
+
+ALERTS = [
+    {"type": "entry_v3", "signal_type": "buy", "symbol": "xauusd", "logic": "LOGIC2",
+     "price": "2030.5", "sl_pips": 25, "trend": "bullish", "consensus_score": 7},
+    {"type": "exit_v3", "signal": "close", "symbol": "EURUSD", "timestamp": None},
+    {"strategy": "combined", "direction": "sell", "symbol": "GBPUSD", "timeframe": "4h", "logic": "LOGIC9"},
+    {"type": "entry_v6", "signal": "trendline_break", "symbol": "eurusd", "tf": "15", "price": 1.08},
+    {"strategy": "price_action", "timeframe": "60", "trend_pulse": "BULLISH", "symbol": "USDJPY"},
+    {"signal": "MOMENTUM_SHIFT", "symbol": "AUDUSD", "timeframe": 5},
+    {"logic": "LOGIC3", "symbol": "XAUUSD", "price": 0},
+    {"trend_pulse": "BEARISH", "symbol": "XAUUSD", "timeframe": "1min"},
+    {"consensus_score": "9", "symbol": "NZDUSD"},
+    {"signal_type": "CONDITIONAL", "symbol": "XAGUSD", "timestamp": "2026-10-19T10:00:00"},
+    {"strategy": "custom_bot", "symbol": "XAUUSD"},
+    {"symbol": "XAUUSD"},
+    {"type": None, "symbol": "XAUUSD"},
+    {"type": "entry_v3", "price": "not-a-number"},
+]
+
+V6_PAYLOADS = [
+    "BULLISH_ENTRY|XAUUSD|5|2030.50|BUY|HIGH|85|25.5|STRONG|2028.00|2032.00|2035.00|2038.00|5/1|TL_OK",
+    "BEARISH_ENTRY|EURUSD|15|1.0850|sell|LOW|40|NA|NONE|1.0870|1.0830||na|1/5|TL_BROKEN",
+    "EXIT_BULLISH|GBPUSD|60|1.27|BUY|MODERATE|abc|18.2",
+    "TREND_PULSE|XAUUSD|1|bad|BUY",
+    "BULLISH_ENTRY|XAUUSD|5|2030.50|BUY|HIGH|85|25.5|STRONG|1|2|3|4|5/1|TL_OK|EXTRA|FIELDS",
+    "TOO|SHORT",
+    "  BULLISH_ENTRY|XAUUSD|5|2030.50|buy  ",
+]
+
+
+def _strip_generated_timestamp(alert, signal):
+    if signal is not None and "timestamp" not in alert:
+        signal = dict(signal, timestamp=None)
+    return signal
+
+
+class TestFastSignalParser:
+    """Test output equivalence with the reference implementations"""
+
+    @pytest.mark.parametrize("alert", ALERTS)
+    def test_parse_matches_signal_parser(self, alert):
+        expected = _strip_generated_timestamp(alert, SignalParser.parse(dict(alert)))
+        actual = _strip_generated_timestamp(alert, FastSignalParser.parse(dict(alert)))
+        assert actual == expected
+        if expected is not None:
+            assert FastSignalParser.validate(actual) == SignalParser.validate(expected)
+
+    @pytest.mark.parametrize("payload", V6_PAYLOADS)
+    def test_v6_tokenizer_matches_parse_v6_payload(self, payload):
+        expected = asdict(parse_v6_payload(payload))
+        actual = asdict(parse_v6_payload_fast(payload))
+        expected.pop("timestamp")
+        actual.pop("timestamp")
+        assert actual == expected
+
+    def test_decode_alert(self):
+        alert = {"type": "entry_v3", "symbol": "XAUUSD", "price": 2030.5}
+        assert decode_alert(encode_alert(alert)) == alert
+        with pytest.raises(json.JSONDecodeError):
+            decode_alert(b"{not json")
+        with pytest.raises(json.JSONDecodeError):
+            decode_alert(b"[1, 2]")
+
+
+class TestWebhookFastPath:
+    """Test the webhook endpoint decodes raw bytes"""
+
+    def test_invalid_json_is_400(self):
+        from fastapi.testclient import TestClient
+        from src.api import webhook_handler
+
+        client = TestClient(webhook_handler.app)
+        response = client.post("/webhook", content=b"{broken",
+                               headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+        assert response.json()["message"] == "Invalid JSON format"
@@ -0,0 +1,130 @@
+"""
+Tests for Health Time-Series Store
+Verifies ring buffers, rollups, batched flushes, retention and queries
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.monitoring.health_timeseries import HOUR, MINUTE, RAW, HealthTimeSeriesStore
+from src.monitoring.plugin_health_monitor import (
+    AlertLevel, HealthSnapshot, PluginAvailabilityMetrics, PluginErrorMetrics, PluginHealthMonitor,
+    PluginPerformanceMetrics, PluginResourceMetrics
+)
+
+START = datetime(2026, 10, 19, 10, 0, 0)
+
+
+def make_point(timestamp, p95=100.0, healthy=True, memory=50.0):
+    return {
+        "timestamp": timestamp, "health_status": "HEALTHY" if healthy else "HUNG", "samples": 1,
+        "healthy_pct": 100.0 if healthy else 0.0, "avg_execution_time_ms": p95 / 2,
+        "memory_usage_mb": memory, "cpu_usage_pct": 10.0, "error_rate_pct": 0.0,
+        "p95_execution_time_ms": p95, "max_memory_usage_mb": memory, "max_cpu_usage_pct": 10.0,
+        "total_errors": 0,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HealthTimeSeriesStore(str(tmp_path / "health.db"), {"raw_points": 10, "batch_size": 1000})
+    yield store
+    store.close()
+
+
+def rows(store, sql):
+    return store.fetchall(sql)
+
+
+class TestRollups:
+    """Test points roll up into 1-minute and 1-hour buckets"""
+
+    def test_minute_buckets_aggregate_points(self, store):
+        for i in range(4):  # two points per minute
+            store.record("v3", make_point(START + timedelta(seconds=30 * i), p95=100 + 100 * i,
+                                          healthy=i != 1))
+        minutes = store.query("v3", since=START, until=START + timedelta(hours=2), resolution=MINUTE)
+
+        assert [p["samples"] for p in minutes] == [2, 2]  # closed bucket + open bucket
+        assert minutes[0]["healthy_pct"] == 50.0
+        assert minutes[0]["p95_execution_time_ms"] == 200.0
+        assert minutes[1]["avg_execution_time_ms"] == 175.0
+
+    def test_raw_ring_is_bounded(self, store):
+        for i in range(25):
+            store.record("v3", make_point(START + timedelta(seconds=30 * i)))
+        assert len(store._rings["v3"][RAW]) == 10
+        assert store.get_stats()["pending_rows"] == 25 + 12  # raw rows + closed 1m buckets
+
+    def test_resolution_follows_span(self):
+        assert HealthTimeSeriesStore.resolution_for(timedelta(minutes=30)) == RAW
+        assert HealthTimeSeriesStore.resolution_for(timedelta(hours=24)) == MINUTE
+        assert HealthTimeSeriesStore.resolution_for(timedelta(days=7)) == HOUR
+
+
+class TestPersistence:
+    """Test batched flushes, retention and database-backed queries"""
+
+    def test_flush_writes_one_batch(self, store):
+        for i in range(130):
+            store.record("v3", make_point(START + timedelta(seconds=30 * i)))
+        assert rows(store, "SELECT COUNT(*) FROM plugin_health_snapshots") == [(0,)]
+
+        written = store.flush()
+        assert written == 130 + 64 + 1  # raw, closed minute buckets, closed hour bucket
+        assert rows(store, "SELECT COUNT(*) FROM plugin_health_rollups WHERE resolution = '1h'") == [(1,)]
+        assert store.get_stats()["flushes"] == 1
+
+    def test_query_falls_back_to_database(self, store):
+        for i in range(30):
+            store.record("v3", make_point(START + timedelta(seconds=30 * i), p95=float(i)))
+        raw = store.query("v3", since=START, until=START + timedelta(minutes=30), resolution=RAW)
+
+        assert len(raw) == 30  # the ring only holds the last 10
+        assert raw[0]["p95_execution_time_ms"] == 0.0
+        assert raw[-1]["timestamp"] == START + timedelta(seconds=30 * 29)
+
+    def test_retention_per_resolution(self, store):
+        old = datetime.now() - timedelta(days=30)
+        for i in range(3):
+            store.record("v3", make_point(old + timedelta(minutes=i)))
+        store.record("v3", make_point(datetime.now()))
+        store.flush()
+
+        store.apply_retention()
+        assert rows(store, "SELECT COUNT(*) FROM plugin_health_snapshots") == [(1,)]
+        assert rows(store, "SELECT resolution, COUNT(*) FROM plugin_health_rollups GROUP BY resolution") == [
+            ("1h", 1)
+        ]
+
+
+class TestMonitorIntegration:
+    """Test the monitor records through one persistent connection"""
+
+    async def test_snapshots_and_alerts_share_the_store(self, tmp_path):
+        db_path = str(tmp_path / "health.db")
+        monitor = PluginHealthMonitor(db_path=db_path)
+        snapshot = HealthSnapshot(
+            plugin_id="v3", timestamp=datetime.now(),
+            availability=PluginAvailabilityMetrics(plugin_id="v3", is_running=True, is_responsive=True),
+            performance=PluginPerformanceMetrics(plugin_id="v3"),
+            resources=PluginResourceMetrics(plugin_id="v3"),
+            errors=PluginErrorMetrics(plugin_id="v3"),
+        )
+        monitor._store_snapshot(snapshot)
+        await monitor._trigger_alert("v3", AlertLevel.WARNING, "slow")
+
+        assert len(monitor.get_plugin_timeseries("v3")) == 1
+        assert "├ 24h: 100.0% healthy" in monitor.format_health_dashboard()
+
+        monitor._timeseries.close()
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT plugin_id, health_status FROM plugin_health_snapshots").fetchall() == [
+            ("v3", "HEALTHY")
+        ]
+        assert conn.execute("SELECT message FROM health_alerts").fetchall() == [("slow",)]
+        conn.close()
@@ -0,0 +1,186 @@
+"""
+Tests for Event Loop Watchdog
+Verifies stall detection, call-site attribution, offender aggregation and the /blocking command
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import time
+from collections import Counter
+from unittest.mock import MagicMock, AsyncMock
+
+from src.monitoring import loop_watchdog
+from src.monitoring.loop_watchdog import LoopStallWatchdog, BlockingOffender
+from src.monitoring.metrics_registry import get_metrics_registry, EventLoopLagMonitor
+
+
+def _blocking_sync_call(seconds: float):
+    time.sleep(seconds)
+
+
+async def _run_with_watchdog(watchdog: LoopStallWatchdog, body):
+    watchdog.start()
+    await asyncio.sleep(0.05)
+    try:
+        await body()
+        # Let the loop beat again so the helper closes the stall
+        await asyncio.sleep(0.1)
+    finally:
+        await watchdog.stop()
+
+
+class TestStallDetection:
+    """Test the lag monitor beat / helper thread pair"""
+
+    def test_blocking_call_is_charged_to_its_call_site(self):
+        watchdog = LoopStallWatchdog(threshold_ms=50, monitor=EventLoopLagMonitor(interval=0.01))
+
+        async def body():
+            _blocking_sync_call(0.25)
+
+        asyncio.run(_run_with_watchdog(watchdog, body))
+
+        assert watchdog.stall_count == 1
+        offender = watchdog.top_offenders(1)[0]
+        assert offender.call_site.startswith("tests/test_loop_watchdog.py:")
+        assert offender.call_site.endswith("_blocking_sync_call")
+        assert "sleep" in offender.leaf or "_blocking_sync_call" in offender.leaf
+        assert 150 <= offender.max_ms <= 400
+        assert watchdog.last_stall["call_site"] == offender.call_site
+
+    def test_idle_loop_records_nothing(self):
+        watchdog = LoopStallWatchdog(threshold_ms=50, monitor=EventLoopLagMonitor(interval=0.01))
+
+        async def body():
+            await asyncio.sleep(0.3)
+
+        asyncio.run(_run_with_watchdog(watchdog, body))
+        assert watchdog.stall_count == 0
+        assert watchdog.offenders == {}
+
+    def test_stop_joins_helper_thread(self):
+        watchdog = LoopStallWatchdog(threshold_ms=50, monitor=EventLoopLagMonitor(interval=0.01))
+
+        async def body():
+            assert watchdog.is_running
+
+        asyncio.run(_run_with_watchdog(watchdog, body))
+        assert not watchdog.is_running
+        assert not watchdog.monitor.is_running
+
+    def test_watchdog_reuses_running_lag_monitor(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        watchdog = LoopStallWatchdog(threshold_ms=50, monitor=monitor)
+
+        async def main():
+            monitor.start()
+            tasks_before = len(asyncio.all_tasks())
+            watchdog.start()
+            assert len(asyncio.all_tasks()) == tasks_before
+            _blocking_sync_call(0.2)
+            await asyncio.sleep(0.1)
+            await watchdog.stop()
+            # The monitor belongs to its owner, not the watchdog
+            assert monitor.is_running
+            await monitor.stop()
+
+        asyncio.run(main())
+        assert watchdog.stall_count == 1
+
+
+class TestOffenderAggregation:
+    """Test offender stats, eviction and metrics"""
+
+    def test_repeat_stalls_aggregate(self):
+        watchdog = LoopStallWatchdog()
+        info = {"call_site": "src/x.py:10 f", "leaf": "time.sleep", "stack": "a;b"}
+        watchdog._close_stall(120.0, Counter({info["call_site"]: 2}), {info["call_site"]: info})
+        watchdog._close_stall(300.0, Counter({info["call_site"]: 5}), {info["call_site"]: info})
+
+        offender = watchdog.offenders["src/x.py:10 f"]
+        assert offender.count == 2
+        assert offender.total_ms == pytest.approx(420.0)
+        assert offender.max_ms == pytest.approx(300.0)
+        assert offender.to_dict()["avg_ms"] == pytest.approx(210.0)
+
+        text = get_metrics_registry().render()
+        assert 'zepix_event_loop_stalls_total{call_site="src/x.py:10 f"}' in text
+        assert 'zepix_event_loop_stall_seconds_total{call_site="src/x.py:10 f"}' in text
+
+    def test_eviction_drops_smallest_site(self, monkeypatch):
+        monkeypatch.setattr(loop_watchdog, "MAX_OFFENDERS", 2)
+        watchdog = LoopStallWatchdog()
+        watchdog.offenders = {
+            "big": BlockingOffender("big", "x", count=1, total_ms=500.0),
+            "small": BlockingOffender("small", "x", count=1, total_ms=110.0),
+        }
+        info = {"call_site": "new", "leaf": "y", "stack": ""}
+        watchdog._close_stall(200.0, Counter({"new": 1}), {"new": info})
+
+        assert set(watchdog.offenders) == {"big", "new"}
+
+    def test_eviction_removes_label_series(self, monkeypatch):
+        monkeypatch.setattr(loop_watchdog, "MAX_OFFENDERS", 1)
+        watchdog = LoopStallWatchdog()
+        old = {"call_site": "src/old.py:1 f", "leaf": "x", "stack": ""}
+        new = {"call_site": "src/new.py:2 g", "leaf": "y", "stack": ""}
+        watchdog._close_stall(150.0, Counter({old["call_site"]: 1}), {old["call_site"]: old})
+        watchdog._close_stall(200.0, Counter({new["call_site"]: 1}), {new["call_site"]: new})
+
+        text = get_metrics_registry().render()
+        assert 'call_site="src/old.py:1 f"' not in text
+        assert 'zepix_event_loop_stalls_total{call_site="src/new.py:2 g"}' in text
+        assert 'zepix_event_loop_stall_seconds_total{call_site="src/new.py:2 g"}' in text
+
+    def test_reset_and_report(self):
+        watchdog = LoopStallWatchdog()
+        watchdog.offenders["src/a.py:1 g"] = BlockingOffender("src/a.py:1 g", "sqlite3.commit",
+                                                              count=3, total_ms=900.0, max_ms=400.0)
+        watchdog.stall_count = 3
+
+        report = watchdog.format_report()
+        assert "src/a.py:1 g" in report
+        assert "sqlite3.commit" in report
+
+        watchdog.reset()
+        assert watchdog.offenders == {}
+        assert "No blocking calls detected" in watchdog.format_report()
+
+
+class TestBlockingCommand:
+    """Test the controller bot /blocking handler"""
+
+    def _handler(self, monkeypatch, watchdog):
+        pytest.importorskip("telegram")
+        from src.telegram.commands.system import blocking_handler
+
+        monkeypatch.setattr(blocking_handler, "get_loop_watchdog", lambda: watchdog)
+        handler = blocking_handler.BlockingHandler(MagicMock())
+        update = MagicMock()
+        update.message.reply_text = AsyncMock()
+        return handler, update
+
+    def test_blocking_command_replies_with_report(self, monkeypatch):
+        watchdog = LoopStallWatchdog()
+        watchdog.offenders["src/a.py:1 g"] = BlockingOffender("src/a.py:1 g", "leaf", count=1, total_ms=150.0)
+        handler, update = self._handler(monkeypatch, watchdog)
+        context = MagicMock()
+        context.args = []
+
+        asyncio.run(handler.execute(update, context))
+
+        text = update.message.reply_text.call_args.args[0]
+        assert "EVENT LOOP BLOCKING" in text
+        assert "src/a.py:1 g" in text
+
+    def test_blocking_reset_clears_stats(self, monkeypatch):
+        watchdog = LoopStallWatchdog()
+        watchdog.offenders["s"] = BlockingOffender("s", "leaf", count=1, total_ms=150.0)
+        handler, update = self._handler(monkeypatch, watchdog)
+        context = MagicMock()
+        context.args = ["reset"]
+
+        asyncio.run(handler.execute(update, context))
+        assert watchdog.offenders == {}
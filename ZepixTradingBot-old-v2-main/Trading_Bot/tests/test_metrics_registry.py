@@ -0,0 +1,231 @@
+"""
+Tests for Unified Metrics Registry
+Verifies counters, gauges, fixed-bucket histograms, collectors and pipeline instrumentation
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+from unittest.mock import MagicMock
+
+from src.monitoring.metrics_registry import (
+    MetricsRegistry, MetricSample, InstrumentedMT5, EventLoopLagMonitor,
+    get_metrics_registry, timed,
+    MT5_CALL_LATENCY, MT5_CALL_ERRORS, PLUGIN_PROCESSING_LATENCY,
+    TELEGRAM_QUEUE_DEPTH, TELEGRAM_SEND_LATENCY, EVENT_LOOP_LAG
+)
+from src.monitoring.metrics_collectors import routing_stats_collector, rate_limiter_collector
+
+
+# ============================================================================
+# Registry Primitives
+# ============================================================================
+
+class TestRegistryPrimitives:
+    """Test counter, gauge and histogram behaviour"""
+
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_events_total", "Events", ["kind"])
+        counter.labels(kind="a").inc()
+        counter.labels(kind="a").inc(2)
+        gauge = registry.gauge("test_depth", "Depth")
+        gauge.set(7)
+
+        text = registry.render()
+        assert "# TYPE test_events_total counter" in text
+        assert 'test_events_total{kind="a"} 3' in text
+        assert "test_depth 7" in text
+
+    def test_get_or_create_is_idempotent(self):
+        registry = MetricsRegistry()
+        first = registry.histogram("test_latency_seconds", "Latency")
+        assert registry.histogram("test_latency_seconds", "Latency") is first
+        with pytest.raises(ValueError):
+            registry.counter("test_latency_seconds", "Clash")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_stage_seconds", "Stage", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            hist.observe(value)
+
+        text = registry.render()
+        assert 'test_stage_seconds_bucket{le="0.1"} 1' in text
+        assert 'test_stage_seconds_bucket{le="1"} 3' in text
+        assert 'test_stage_seconds_bucket{le="+Inf"} 4' in text
+        assert "test_stage_seconds_count 4" in text
+        assert "test_stage_seconds_sum 6.05" in text
+
+    def test_histogram_quantile_estimate(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_q_seconds", "Q", buckets=(0.01, 0.1, 1.0))
+        for _ in range(90):
+            hist.observe(0.005)
+        for _ in range(10):
+            hist.observe(0.5)
+        snapshot = registry.snapshot()["test_q_seconds"]["_"]
+        assert snapshot["count"] == 100
+        assert snapshot["p50"] <= 0.01
+        assert 0.1 < snapshot["p99"] <= 1.0
+
+    def test_label_mismatch_raises(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_labelled_total", "L", ["a", "b"])
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_remove_drops_label_series(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_removable_total", "R", ["site"])
+        counter.labels(site="a").inc()
+        counter.labels(site="b").inc()
+        counter.remove(site="a")
+        counter.remove(site="missing")
+
+        text = registry.render()
+        assert 'test_removable_total{site="a"}' not in text
+        assert 'test_removable_total{site="b"} 1' in text
+
+    def test_timed_decorator_sync_and_async(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_timed_seconds", "T", ["op"])
+
+        @timed(hist, op="sync")
+        def work():
+            return 1
+
+        @timed(hist, op="async")
+        async def async_work():
+            return 2
+
+        assert work() == 1
+        assert asyncio.run(async_work()) == 2
+        assert hist.labels(op="sync").count == 1
+        assert hist.labels(op="async").count == 1
+
+
+# ============================================================================
+# Collectors
+# ============================================================================
+
+class TestCollectors:
+    """Test scrape-time collectors"""
+
+    def test_routing_stats_collector(self):
+        registry = MetricsRegistry()
+        router = MagicMock()
+        router.get_routing_stats.return_value = {
+            'total_routed': 5, 'successful': 4, 'failed': 1, 'no_plugin_found': 0,
+            'by_strategy': {'V3_COMBINED': 5},
+            'by_plugin': {'v3_combined': {'success': 4, 'failed': 1}}
+        }
+        registry.register_collector("router", routing_stats_collector(router))
+
+        text = registry.render()
+        assert 'zepix_router_signals_total{result="successful"} 4' in text
+        assert 'zepix_router_plugin_results_total{plugin_id="v3_combined",result="failed"} 1' in text
+
+    def test_failing_collector_does_not_break_scrape(self):
+        registry = MetricsRegistry()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.register_collector("broken", broken)
+        registry.register_collector("ok", lambda: [MetricSample("test_ok", 1)])
+        assert "test_ok 1" in registry.render()
+
+    def test_rate_limiter_queue_depth(self):
+        from src.telegram.rate_limiter import TelegramRateLimiter, ThrottledMessage
+
+        limiter = TelegramRateLimiter("metrics_test_bot", send_callback=lambda **kw: True)
+        limiter.enqueue(ThrottledMessage(chat_id="1", text="hello"))
+        limiter.enqueue(ThrottledMessage(chat_id="1", text="world"))
+        assert TELEGRAM_QUEUE_DEPTH.labels(bot="metrics_test_bot").value == 2
+
+        message = limiter._get_next_message()
+        assert limiter._send_message(message)
+        assert TELEGRAM_QUEUE_DEPTH.labels(bot="metrics_test_bot").value == 1
+        assert TELEGRAM_SEND_LATENCY.labels(bot="metrics_test_bot", status="success").count == 1
+
+        registry = MetricsRegistry()
+        registry.register_collector("telegram", rate_limiter_collector({"metrics_test_bot": limiter}))
+        assert 'zepix_telegram_messages_total{bot="metrics_test_bot",result="sent"} 1' in registry.render()
+
+    def test_components_register_their_collectors(self, tmp_path):
+        from src.telegram.rate_limiter import TelegramRateLimiter
+        from src.core.database_sync_manager import DatabaseSyncManager
+        from src.monitoring.plugin_health_monitor import PluginHealthMonitor
+
+        TelegramRateLimiter("collector_test_bot")
+        DatabaseSyncManager(central_db_path=str(tmp_path / "central.db"))
+        PluginHealthMonitor(db_path=str(tmp_path / "health.db"))
+
+        text = get_metrics_registry().render()
+        assert 'zepix_telegram_messages_total{bot="collector_test_bot",result="sent"} 0' in text
+        assert 'zepix_db_sync_total{result="total_syncs"} 0' in text
+        for name in ("telegram_rate_limiter:collector_test_bot", "database_sync", "plugin_health"):
+            assert name in get_metrics_registry()._collectors
+
+
+# ============================================================================
+# Pipeline Instrumentation
+# ============================================================================
+
+class TestPipelineInstrumentation:
+    """Test MT5, plugin and event-loop instrumentation"""
+
+    def test_instrumented_mt5_times_calls_and_passes_constants(self):
+        target = MagicMock()
+        target.ORDER_TYPE_BUY = 0
+        target.symbol_info_tick.return_value = "tick"
+        target.order_send.side_effect = RuntimeError("terminal gone")
+        proxy = InstrumentedMT5(target)
+
+        before = MT5_CALL_LATENCY.labels(method="symbol_info_tick").count
+        assert proxy.ORDER_TYPE_BUY == 0
+        assert proxy.symbol_info_tick("XAUUSD") == "tick"
+        assert MT5_CALL_LATENCY.labels(method="symbol_info_tick").count == before + 1
+
+        errors_before = MT5_CALL_ERRORS.labels(method="order_send").value
+        with pytest.raises(RuntimeError):
+            proxy.order_send({})
+        assert MT5_CALL_ERRORS.labels(method="order_send").value == errors_before + 1
+
+    def test_plugin_router_records_processing_latency(self):
+        from src.core.plugin_router import PluginRouter
+
+        plugin = MagicMock()
+        plugin.plugin_id = "metrics_plugin"
+
+        async def process_signal(signal):
+            return {"status": "success"}
+
+        plugin.process_signal = process_signal
+        router = PluginRouter(MagicMock())
+        asyncio.run(router._execute_plugin(plugin, {"type": "entry_v3"}))
+        child = PLUGIN_PROCESSING_LATENCY.labels(plugin_id="metrics_plugin", status="success")
+        assert child.count == 1
+
+    def test_event_loop_lag_sample(self):
+        before = EVENT_LOOP_LAG._default().count
+        lag = asyncio.run(EventLoopLagMonitor(interval=0.01).sample_once())
+        assert lag >= 0.0
+        assert EVENT_LOOP_LAG._default().count == before + 1
+
+    def test_lag_sample_stamps_beat(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        before = monitor.last_beat
+        asyncio.run(monitor.sample_once())
+        assert monitor.last_beat > before
+
+    def test_global_registry_exposes_pipeline_metrics(self):
+        text = get_metrics_registry().render()
+        for name in ("zepix_webhook_ack_seconds", "zepix_mt5_call_seconds",
+                     "zepix_db_write_seconds", "zepix_telegram_queue_depth",
+                     "zepix_event_loop_lag_seconds"):
+            assert f"# TYPE {name}" in text
@@ -0,0 +1,154 @@
+"""
+Tests for Adaptive Monitor Cadence
+Verifies proximity-based polling intervals and their use in PriceMonitorService
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.monitor_cadence import AdaptiveCadence
+from src.services.price_monitor_service import PriceMonitorService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cadence(clock):
+    return AdaptiveCadence(2.0, {"min_interval_seconds": 0.5, "max_interval_seconds": 8.0}, clock=clock)
+
+
+def run_cycle(cadence, observations, pending=None):
+    due = cadence.begin_cycle(pending or observations)
+    for symbol in due:
+        if symbol in observations:
+            cadence.observe(symbol, *observations[symbol])
+    cadence.end_cycle(due, pending or observations)
+    return due
+
+
+class TestAdaptiveCadence:
+    """Test intervals follow the distance to the nearest trigger"""
+
+    def test_near_symbol_polled_at_min_interval(self, cadence):
+        run_cycle(cadence, {"EURUSD": (3.0,)})
+        assert cadence.get_status()["EURUSD"]["interval"] == 0.5
+
+    def test_distant_symbol_backs_off_to_cap(self, cadence, clock):
+        intervals = []
+        for _ in range(5):
+            run_cycle(cadence, {"EURUSD": (50.0,)})
+            intervals.append(cadence.get_status()["EURUSD"]["interval"])
+            clock.now += intervals[-1]
+        assert intervals == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+        run_cycle(cadence, {"EURUSD": (1.0,)})  # price approaches the trigger
+        assert cadence.get_status()["EURUSD"]["interval"] == 0.5
+
+    def test_atr_normalises_distance(self, cadence):
+        run_cycle(cadence, {"XAUUSD": (20.0, 100.0), "EURUSD": (20.0, 40.0)})
+        status = cadence.get_status()
+        assert status["XAUUSD"]["interval"] == 0.5  # 20 pips < 0.25 ATR of 100
+        assert status["EURUSD"]["interval"] == 1.0
+
+    def test_symbols_skipped_until_due(self, cadence, clock):
+        run_cycle(cadence, {"EURUSD": (50.0,), "GBPUSD": (1.0,)})
+        clock.now += 0.5
+        assert cadence.begin_cycle({"EURUSD", "GBPUSD", "USDJPY"}) == {"GBPUSD", "USDJPY"}
+        assert cadence.stats == {"polls": 4, "skipped": 1}
+
+    def test_no_price_uses_base_interval_and_finished_symbols_dropped(self, cadence):
+        run_cycle(cadence, {}, pending={"EURUSD"})
+        assert cadence.get_status()["EURUSD"]["interval"] == 2.0
+        run_cycle(cadence, {}, pending=set())
+        assert cadence.get_status() == {}
+
+    def test_sleep_time_bounded(self, cadence, clock):
+        assert cadence.sleep_time(False) == 2.0
+        run_cycle(cadence, {"EURUSD": (1.0,)})
+        assert cadence.sleep_time(True) == 0.5
+        clock.now += 5
+        assert cadence.sleep_time(True) == 0.5  # overdue symbols never spin the loop
+
+    def test_disabled_polls_everything_at_base(self, clock):
+        cadence = AdaptiveCadence(2.0, {"enabled": False}, clock=clock)
+        run_cycle(cadence, {"EURUSD": (500.0,)})
+        assert cadence.begin_cycle({"EURUSD"}) == {"EURUSD"}
+        assert cadence.sleep_time(True) == 2.0
+
+
+class FakeMT5:
+    def __init__(self, price):
+        self.price = price
+        self.calls = 0
+
+    def get_current_price(self, symbol):
+        self.calls += 1
+        return self.price
+
+
+@pytest.fixture
+def service(clock):
+    config = {
+        "re_entry_config": {
+            "price_monitor_interval_seconds": 2,
+            "sl_hunt_reentry_enabled": True,
+            "tp_reentry_enabled": True,
+            "exit_continuation_enabled": False,
+            "tp_continuation_price_gap_pips": 2
+        },
+        "symbol_config": {"EURUSD": {"pip_size": 0.0001}},
+        "profit_booking_config": {"enabled": False}
+    }
+    service = PriceMonitorService(config, FakeMT5(1.1000), None, None, None, None)
+    service.cadence = AdaptiveCadence(2, {"max_interval_seconds": 8.0}, clock=clock)
+    expires = datetime.now() + timedelta(minutes=5)
+    service.sl_hunt_pending["EURUSD"] = [
+        {"target_price": 1.1100, "direction": "buy", "chain_id": "C1", "expiration_time": expires}
+    ]
+    service.tp_continuation_pending["EURUSD"] = [
+        {"tp_price": 1.1200, "direction": "buy", "chain_id": "C2", "expiration_time": expires}
+    ]
+    return service
+
+
+class TestPriceMonitorCadence:
+    """Test the service polls distant triggers less often"""
+
+    async def test_one_quote_per_symbol_per_cycle(self, service):
+        await service._check_all_opportunities()
+
+        assert service.mt5_client.calls == 1
+        assert service.get_service_status()["cadence"]["symbols"]["EURUSD"]["interval"] == 1.0
+
+    async def test_distant_trigger_skipped_until_due(self, service, clock):
+        await service._check_all_opportunities()
+        clock.now += 0.5
+        await service._check_all_opportunities()
+        assert service.mt5_client.calls == 1
+
+        clock.now += 0.5
+        await service._check_all_opportunities()
+        assert service.mt5_client.calls == 2
+        assert service.cadence.get_status()["EURUSD"]["interval"] == 2.0
+
+    async def test_near_trigger_polled_fast(self, service, clock):
+        service.mt5_client.price = 1.1098
+        service.set_atr_provider(lambda symbol: None)
+        await service._check_all_opportunities()
+
+        assert service.cadence.get_status()["EURUSD"]["interval"] == 0.5
+        assert service.cadence.sleep_time(True) == 0.5
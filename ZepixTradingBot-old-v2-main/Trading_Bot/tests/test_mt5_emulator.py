@@ -0,0 +1,187 @@
+"""
+Tests for MT5 Emulator
+Verifies the emulated MetaTrader5 API surface used by MT5Client
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import random
+
+from src.simulation import MT5Emulator, SymbolSpec, LatencyModel, ErrorInjection, VirtualClock
+from src.simulation import mt5_emulator as mt5e
+
+
+def make_emulator(**kwargs):
+    clock = VirtualClock(1_700_000_000)
+    kwargs.setdefault('seed', 7)
+    emulator = MT5Emulator(clock=clock.time, **kwargs)
+    return emulator, clock
+
+
+def buy_request(symbol='XAUUSD', volume=0.1, sl=0.0, tp=0.0):
+    return {
+        "action": mt5e.TRADE_ACTION_DEAL, "symbol": symbol, "volume": volume,
+        "type": mt5e.ORDER_TYPE_BUY, "price": 0.0, "sl": sl, "tp": tp,
+        "deviation": 20, "magic": 234000, "comment": "test",
+        "type_time": mt5e.ORDER_TIME_GTC, "type_filling": mt5e.ORDER_FILLING_IOC,
+    }
+
+
+class TestMarketData:
+    """Test symbol_info / symbol_info_tick"""
+
+    def test_symbol_info_fields(self):
+        emulator, _ = make_emulator()
+        info = emulator.symbol_info('EURUSD')
+        assert info.digits == 5
+        assert info.point == 0.00001
+        assert info.visible is True
+
+    def test_unknown_symbol_returns_none(self):
+        emulator, _ = make_emulator()
+        assert emulator.symbol_info('NOPE') is None
+        assert emulator.last_error()[0] != mt5e.RES_S_OK
+
+    def test_alias_resolves_to_same_symbol(self):
+        emulator, _ = make_emulator()
+        assert emulator.symbol_info_tick('GOLD').bid == emulator.symbol_info_tick('XAUUSD').bid
+
+    def test_random_walk_moves_with_clock(self):
+        emulator, clock = make_emulator()
+        first = emulator.symbol_info_tick('XAUUSD').bid
+        clock.advance(3600)
+        second = emulator.symbol_info_tick('XAUUSD')
+        assert second.bid != first
+        assert second.ask > second.bid
+
+    def test_seed_is_reproducible(self):
+        a, ca = make_emulator(seed=1)
+        b, cb = make_emulator(seed=1)
+        ca.advance(60)
+        cb.advance(60)
+        assert a.symbol_info_tick('EURUSD').bid == b.symbol_info_tick('EURUSD').bid
+
+
+class TestTrading:
+    """Test order_send / positions_get / history_deals_get / account_info"""
+
+    def test_open_and_close_position(self):
+        emulator, _ = make_emulator()
+        result = emulator.order_send(buy_request())
+        assert result.retcode == mt5e.TRADE_RETCODE_DONE
+        positions = emulator.positions_get(ticket=result.order)
+        assert len(positions) == 1
+
+        close = emulator.order_send({
+            "action": mt5e.TRADE_ACTION_DEAL, "position": result.order, "symbol": "XAUUSD",
+            "volume": 0.1, "type": mt5e.ORDER_TYPE_SELL,
+        })
+        assert close.retcode == mt5e.TRADE_RETCODE_DONE
+        assert emulator.positions_get(ticket=result.order) == ()
+        deals = emulator.history_deals_get(position=result.order)
+        assert [d.entry for d in deals] == [mt5e.DEAL_ENTRY_IN, mt5e.DEAL_ENTRY_OUT]
+
+    def test_partial_close_keeps_remainder(self):
+        emulator, _ = make_emulator()
+        ticket = emulator.order_send(buy_request(volume=1.0)).order
+        emulator.order_send({"action": mt5e.TRADE_ACTION_DEAL, "position": ticket, "volume": 0.4})
+        assert emulator.positions_get(ticket=ticket)[0].volume == pytest.approx(0.6)
+
+    def test_tp_auto_fill_updates_balance(self):
+        emulator, _ = make_emulator()
+        ask = emulator.symbol_info_tick('XAUUSD').ask
+        ticket = emulator.order_send(buy_request(volume=1.0, sl=ask - 10, tp=ask + 5)).order
+        deals = emulator.set_price('XAUUSD', ask + 6)
+        assert len(deals) == 1
+        assert deals[0].reason == mt5e.DEAL_REASON_TP
+        assert deals[0].profit == pytest.approx(500.0)
+        assert emulator.account_info().balance == pytest.approx(10500.0)
+        assert emulator.positions_get(ticket=ticket) == ()
+
+    def test_sl_modify_then_hit(self):
+        emulator, _ = make_emulator()
+        bid = emulator.symbol_info_tick('EURUSD').bid
+        ticket = emulator.order_send(buy_request('EURUSD', 1.0)).order
+        result = emulator.order_send({"action": mt5e.TRADE_ACTION_SLTP, "position": ticket,
+                                      "sl": bid - 0.0010, "tp": 0.0})
+        assert result.retcode == mt5e.TRADE_RETCODE_DONE
+        deals = emulator.set_price('EURUSD', bid - 0.0020)
+        assert deals[0].reason == mt5e.DEAL_REASON_SL
+        assert deals[0].profit < 0
+
+    def test_no_money(self):
+        emulator, _ = make_emulator(balance=100.0)
+        result = emulator.order_send(buy_request('XAUUSD', 50.0))
+        assert result.retcode == mt5e.TRADE_RETCODE_NO_MONEY
+
+    def test_account_info_tracks_floating(self):
+        emulator, _ = make_emulator()
+        ask = emulator.symbol_info_tick('XAUUSD').ask
+        emulator.order_send(buy_request(volume=1.0))
+        emulator.set_price('XAUUSD', ask + 1)
+        info = emulator.account_info()
+        assert info.profit == pytest.approx(100.0, abs=0.5)
+        assert info.margin > 0
+
+    def test_many_positions(self):
+        emulator, _ = make_emulator(balance=10_000_000.0)
+        for _ in range(2000):
+            assert emulator.order_send(buy_request('EURUSD', 0.01)).retcode == mt5e.TRADE_RETCODE_DONE
+        assert emulator.positions_total() == 2000
+        assert len(emulator.positions_get(symbol='EURUSD')) == 2000
+
+
+class TestFaultInjection:
+    """Test latency and error injection"""
+
+    def test_fail_next(self):
+        emulator, _ = make_emulator()
+        emulator.fail_next('order_send', mt5e.TRADE_RETCODE_REQUOTE, "Requote")
+        assert emulator.order_send(buy_request()).retcode == mt5e.TRADE_RETCODE_REQUOTE
+        assert emulator.order_send(buy_request()).retcode == mt5e.TRADE_RETCODE_DONE
+
+    def test_error_rate(self):
+        emulator, _ = make_emulator(errors={'symbol_info_tick': ErrorInjection(rate=1.0)})
+        assert emulator.symbol_info_tick('EURUSD') is None
+        assert emulator.last_error()[1] == "Injected failure"
+
+    def test_latency_applied(self):
+        slept = []
+        emulator, _ = make_emulator(latency={'default': LatencyModel('fixed', 0.05)},
+                                    sleep=slept.append)
+        emulator.account_info()
+        emulator.positions_get()
+        assert slept == [0.05, 0.05]
+        assert emulator.get_stats()['calls']['account_info'] == 1
+
+    def test_latency_models(self):
+        rng = random.Random(3)
+        assert LatencyModel('fixed', 0.01).sample(rng) == 0.01
+        assert 0.01 <= LatencyModel('uniform', 0.01, 0.02).sample(rng) <= 0.02
+        assert LatencyModel('normal', 0.0, 0.0).sample(rng) == 0.0
+        assert LatencyModel('lognormal', 0.02, 0.5).sample(rng) > 0
+
+
+class TestMT5ClientIntegration:
+    """MT5Client driven by the emulator instead of a terminal"""
+
+    def test_client_round_trip(self):
+        pytest.importorskip("pydantic")
+        from src.clients.mt5_client import MT5Client
+
+        config = {
+            "simulate_orders": False, "mt5_retries": 1, "mt5_wait": 0,
+            "mt5_login": 1, "mt5_password": "x", "mt5_server": "Emulator",
+            "symbol_mapping": {"XAUUSD": "GOLD"},
+        }
+        emulator, _ = make_emulator()
+        client = MT5Client(config, mt5_module=emulator)
+        assert client.initialize()
+
+        price = client.get_current_price('XAUUSD')
+        ticket = client.place_order('XAUUSD', 'buy', 0.1, price, sl=price - 10, tp=price + 10)
+        assert ticket is not None
+        assert client.get_position(ticket)['symbol'] == 'GOLD'
+        assert client.close_position(ticket)
+        assert client.get_closed_trade_profit(ticket) is not None
@@ -0,0 +1,190 @@
+"""
+Tests for Order Pipeline
+Verifies snapshot preparation, back-to-back submission, rollback and the dual-order callers
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+from unittest.mock import Mock
+
+from src.clients.mt5_client import MT5Client
+from src.clients.order_pipeline import OrderLeg, supports_order_batch
+from src.core.services.order_execution_service import OrderExecutionService
+from src.monitoring.metrics_registry import get_metrics_registry
+from src.simulation import MT5Emulator, VirtualClock
+
+
+def make_client(**emulator_kwargs):
+    config = {
+        "simulate_orders": False, "mt5_retries": 1, "mt5_wait": 0,
+        "mt5_login": 1, "mt5_password": "x", "mt5_server": "Emulator",
+        "symbol_mapping": {"XAUUSD": "GOLD"},
+    }
+    emulator = MT5Emulator(clock=VirtualClock(1_700_000_000).time, seed=7, **emulator_kwargs)
+    client = MT5Client(config, mt5_module=emulator)
+    assert client.initialize()
+    return client, emulator
+
+
+def dual_legs(price: float, lot: float = 0.05):
+    return [
+        OrderLeg("A", "XAUUSD", "buy", lot, sl=price - 10, tp=price + 20, comment="TEST_A"),
+        OrderLeg("B", "XAUUSD", "buy", lot, sl=price - 5, tp=price + 10, comment="TEST_B"),
+    ]
+
+
+class TestOrderPipeline:
+    """Test prepare / submit / rollback against the emulator"""
+
+    def test_both_legs_from_one_snapshot(self):
+        client, emulator = make_client()
+        price = client.get_current_price("XAUUSD")
+        before = dict(emulator.call_counts)
+
+        result = client.place_order_batch(dual_legs(price))
+
+        assert result.success
+        ticket_a, ticket_b = result.tickets
+        assert ticket_a and ticket_b and ticket_a != ticket_b
+        assert client.get_position(ticket_a)["sl"] == pytest.approx(price - 10)
+        assert client.get_position(ticket_b)["sl"] == pytest.approx(price - 5)
+
+        calls = {k: v - before.get(k, 0) for k, v in emulator.call_counts.items()}
+        assert calls.get("symbol_info", 0) == 1
+        assert calls.get("symbol_info_tick", 0) == 1
+        assert calls["order_send"] == 2
+        assert all(leg.submit_ms >= 0 for leg in result.legs)
+
+    def test_failed_first_leg_stops_batch(self):
+        client, emulator = make_client()
+        price = client.get_current_price("XAUUSD")
+        emulator.fail_next("order_send")
+
+        result = client.place_order_batch(dual_legs(price))
+        assert not result.success
+        assert result.tickets == (None, None)
+        assert result.legs[1].error == "Not submitted"
+        assert emulator.call_counts["order_send"] == 1
+
+    def test_failed_second_leg_rolls_back_first(self):
+        client, emulator = make_client()
+        price = client.get_current_price("XAUUSD")
+        real_send = emulator.order_send
+        sent = []
+
+        def send_then_fail(request):
+            sent.append(request["comment"])
+            if request["comment"] == "TEST_B":
+                emulator.fail_next("order_send")
+            return real_send(request)
+
+        emulator.order_send = send_then_fail
+        result = client.place_order_batch(dual_legs(price))
+
+        assert sent[:2] == ["TEST_A", "TEST_B"]  # then the rollback close
+        assert not result.success
+        assert result.legs[0].ticket is not None
+        assert result.legs[0].rolled_back
+        assert result.tickets == (None, None)
+        assert client.get_positions() == []
+
+    def test_invalid_leg_sends_nothing(self):
+        client, emulator = make_client()
+        price = client.get_current_price("XAUUSD")
+        legs = dual_legs(price)
+        legs[1].sl = price + 5  # BUY with SL above entry
+
+        result = client.place_order_batch(legs)
+        assert not result.success
+        assert "Leg B invalid" in result.error
+        assert emulator.call_counts.get("order_send", 0) == 0
+
+    def test_insufficient_margin_sends_nothing(self):
+        client, emulator = make_client(balance=100.0)
+        price = client.get_current_price("XAUUSD")
+
+        result = client.place_order_batch(dual_legs(price, lot=1.0))
+        assert not result.success
+        assert "Insufficient margin" in result.error
+        assert emulator.call_counts.get("order_send", 0) == 0
+
+    def test_latency_metrics_recorded(self):
+        client, _ = make_client()
+        price = client.get_current_price("XAUUSD")
+        client.place_order_batch(dual_legs(price))
+
+        text = get_metrics_registry().render()
+        assert 'zepix_order_leg_submit_seconds_count{leg="A",status="filled"}' in text
+        assert "zepix_order_leg_gap_seconds_count" in text
+
+    def test_simulation_mode_returns_tickets(self):
+        client = MT5Client({"simulate_orders": True, "mt5_retries": 1, "mt5_wait": 0},
+                           mt5_module=MT5Emulator(seed=1))
+        client.initialized = True
+        result = client.place_order_batch(dual_legs(2650.0))
+        assert result.success
+        assert all(result.tickets)
+
+
+class TestDualOrderCallers:
+    """Test OrderExecutionService routing through the pipeline"""
+
+    def test_capability_flag(self):
+        client, _ = make_client()
+        assert supports_order_batch(client)
+        assert not supports_order_batch(Mock())
+
+    def test_v6_dual_orders_use_batch(self):
+        client, emulator = make_client()
+        service = OrderExecutionService(client, {}, Mock())
+        price = client.get_current_price("XAUUSD")
+
+        ticket_a, ticket_b = asyncio.run(service.place_dual_orders_v6(
+            plugin_id="v6_price_action_5m", symbol="XAUUSD", direction="BUY",
+            lot_size_total=0.10, sl_price=price - 10, tp1_price=price + 10, tp2_price=price + 20
+        ))
+
+        assert ticket_a and ticket_b
+        assert client.get_position(ticket_a)["tp"] == pytest.approx(price + 20)
+        assert client.get_position(ticket_b)["tp"] == pytest.approx(price + 10)
+        assert emulator.call_counts.get("symbol_info_tick", 0) == 2  # get_current_price + batch
+
+    @staticmethod
+    def place_v3_failing_b(client, emulator, fail_rollback=False):
+        """Place V3 dual orders where Order B (and optionally the rollback close) fails"""
+        service = OrderExecutionService(client, {}, Mock())
+        price = client.get_current_price("XAUUSD")
+        real_send = emulator.order_send
+        sent = []
+
+        def send_then_fail(request):
+            sent.append(request["comment"])
+            if request["comment"] == "V3_B_v3_combined_LOGIC2":
+                emulator.fail_next("order_send", count=2 if fail_rollback else 1)
+            return real_send(request)
+
+        emulator.order_send = send_then_fail
+        result = asyncio.run(service.place_dual_orders_v3(
+            plugin_id="v3_combined", symbol="XAUUSD", direction="BUY", lot_size_total=0.10,
+            order_a_sl=price - 10, order_a_tp=price + 20,
+            order_b_sl=price - 5, order_b_tp=price + 10, logic_route="LOGIC2"
+        ))
+        return result, sent
+
+    def test_v3_dual_orders_roll_back_on_failure(self):
+        client, emulator = make_client()
+        result, sent = self.place_v3_failing_b(client, emulator)
+
+        assert sent[:2] == ["V3_A_v3_combined_LOGIC2", "V3_B_v3_combined_LOGIC2"]
+        assert len(sent) == 3  # rollback close of Order A
+        assert result == (None, None)
+        assert client.get_positions() == []
+
+    def test_v3_dual_orders_keep_leg_when_rollback_fails(self):
+        client, emulator = make_client()
+        (ticket_a, ticket_b), _ = self.place_v3_failing_b(client, emulator, fail_rollback=True)
+
+        assert ticket_a is not None and ticket_b is None
+        assert [p["ticket"] for p in client.get_positions()] == [ticket_a]
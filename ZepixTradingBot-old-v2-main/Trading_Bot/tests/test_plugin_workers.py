@@ -0,0 +1,250 @@
+"""
+Tests for Process-Isolated Plugin Workers
+IPC round trips, ServiceAPI proxy, crash containment and budget enforcement
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from src.core.plugin_system.plugin_registry import PluginRegistry
+from src.core.plugin_system.plugin_worker import (
+    PluginWorker, PluginWorkerError, PluginWorkerSupervisor, ServiceAPIProxy,
+    WireCodec, WorkerBudget, build_service_manifest
+)
+
+PLUGIN_MODULE = "tests.worker_plugins.echo_worker.plugin"
+PLUGIN_CLASS = "EchoWorkerPlugin"
+
+
+class FakeReentryService:
+    def __init__(self):
+        self.started = []
+
+    async def start_recovery(self, symbol):
+        self.started.append(symbol)
+        return f"recovering {symbol}"
+
+
+class FakeServiceAPI:
+    """Mixes async, sync, nested and value attributes like ServiceAPI"""
+
+    def __init__(self):
+        self.mode = "live"
+        self.reentry_service = FakeReentryService()
+
+    async def get_price(self, symbol):
+        await asyncio.sleep(0)
+        return {"symbol": symbol, "bid": 2030.5}
+
+    def get_balance(self):
+        return 10000.0
+
+
+def fast_budget(**overrides):
+    values = dict(heartbeat_interval=0.1, heartbeat_timeout=5.0, call_timeout=10.0,
+                  restart_backoff=0.0, max_backoff=0.0)
+    values.update(overrides)
+    return WorkerBudget(**values)
+
+
+async def wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+class TestWireCodec:
+    """Test message encoding"""
+
+    def test_pickle_round_trip_sanitizes_unpicklable(self):
+        codec = WireCodec("pickle")
+        message = ["result", 1, True, {"at": datetime(2026, 10, 19), "fn": lambda: None}]
+        decoded = codec.decode(codec.encode(message))
+        assert decoded[3]["at"] == datetime(2026, 10, 19).isoformat()
+        assert isinstance(decoded[3]["fn"], str)
+
+    def test_manifest_describes_services(self):
+        manifest = build_service_manifest(FakeServiceAPI())
+        assert manifest["get_price"] == "async"
+        assert manifest["get_balance"] == "sync"
+        assert manifest["reentry_service.start_recovery"] == "async"
+        assert manifest["mode"] == ["value", "live"]
+
+    def test_proxy_rejects_unknown_attributes(self):
+        proxy = ServiceAPIProxy(channel=None, manifest={"get_balance": "sync"})
+        assert not hasattr(proxy, "place_order")
+
+    def test_budget_from_config_ignores_unknown_keys(self):
+        budget = WorkerBudget.from_config({"memory_mb": 64, "bogus": 1})
+        assert budget.memory_mb == 64
+
+
+class TestPluginWorker:
+    """Test a single worker process"""
+
+    @pytest.mark.asyncio
+    async def test_invoke_round_trip_with_service_calls(self):
+        service_api = FakeServiceAPI()
+        worker = PluginWorker("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {}, service_api,
+                              budget=fast_budget())
+        worker.start()
+        try:
+            assert worker.pid != os.getpid()
+            assert worker.get_supported_strategies() == ["ECHO"]
+            assert worker.priority == 3
+
+            result = await worker.process_signal({"symbol": "XAUUSD"})
+            assert result["pid"] == worker.pid
+            assert result["price"] == {"symbol": "XAUUSD", "bid": 2030.5}
+            assert result["balance"] == 10000.0
+            assert result["recovery"] == "recovering XAUUSD"
+            assert result["mode"] == "live"
+            assert service_api.reentry_service.started == ["XAUUSD"]
+
+            worker.enabled = False
+            result = await worker.process_signal({"symbol": "EURUSD"})
+            assert result["enabled"] is False
+        finally:
+            await worker.shutdown()
+        assert not worker.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_plugin_errors_are_reported(self):
+        worker = PluginWorker("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {}, FakeServiceAPI(),
+                              budget=fast_budget())
+        worker.start()
+        try:
+            with pytest.raises(PluginWorkerError, match="ValueError: boom"):
+                await worker.fail("boom")
+            assert worker.stats["errors"] == 1
+            with pytest.raises(AttributeError):
+                worker.not_a_method
+        finally:
+            await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self):
+        worker = PluginWorker("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {}, FakeServiceAPI(),
+                              budget=fast_budget(call_timeout=0.5))
+        worker.start()
+        try:
+            with pytest.raises(PluginWorkerError, match="timed out"):
+                await worker.sleep_forever()
+        finally:
+            worker.kill()
+
+    def test_start_failure(self):
+        worker = PluginWorker("echo_worker", PLUGIN_MODULE, "MissingPlugin", {}, FakeServiceAPI(),
+                              budget=fast_budget())
+        with pytest.raises(PluginWorkerError, match="failed to start"):
+            worker.start()
+
+
+class TestPluginWorkerSupervisor:
+    """Test crash containment and budget enforcement"""
+
+    @pytest.mark.asyncio
+    async def test_crash_is_contained_and_restarted(self):
+        supervisor = PluginWorkerSupervisor(FakeServiceAPI(), budget=fast_budget())
+        worker = supervisor.spawn("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {})
+        first_pid = worker.pid
+        try:
+            with pytest.raises(PluginWorkerError, match="exited"):
+                await worker.crash()
+            assert await wait_until(lambda: not worker.is_alive())
+
+            assert supervisor.check_workers() == {"echo_worker": "restart_scheduled"}
+            assert supervisor.check_workers() == {"echo_worker": "restarted"}
+            assert worker.pid != first_pid
+            result = await worker.process_signal({"symbol": "XAUUSD"})
+            assert result["pid"] == worker.pid
+        finally:
+            await supervisor.stop()
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_triggers_restart(self):
+        supervisor = PluginWorkerSupervisor(FakeServiceAPI(), budget=fast_budget())
+        worker = supervisor.spawn("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {})
+        try:
+            await wait_until(lambda: worker.rss_mb > 0)
+            worker.budget = fast_budget(memory_mb=worker.rss_mb + 50)
+            first_pid = worker.pid
+            await worker.allocate(100)
+            assert await wait_until(lambda: worker.rss_mb > worker.budget.memory_mb)
+
+            assert supervisor.check_workers() == {"echo_worker": "restart_scheduled"}
+            supervisor.check_workers()
+            assert worker.is_alive() and worker.pid != first_pid
+        finally:
+            await supervisor.stop()
+
+    @pytest.mark.asyncio
+    async def test_cpu_budget_triggers_restart(self):
+        supervisor = PluginWorkerSupervisor(
+            FakeServiceAPI(), budget=fast_budget(cpu_percent=20, over_budget_beats=2)
+        )
+        worker = supervisor.spawn("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {})
+        try:
+            burn = asyncio.ensure_future(worker.burn(3.0))
+            assert await wait_until(lambda: worker.over_budget_beats >= 2)
+            assert supervisor.check_workers() == {"echo_worker": "restart_scheduled"}
+            with pytest.raises(PluginWorkerError):
+                await burn
+        finally:
+            await supervisor.stop()
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_disable_plugin(self):
+        supervisor = PluginWorkerSupervisor(FakeServiceAPI(), budget=fast_budget(max_restarts=1))
+        worker = supervisor.spawn("echo_worker", PLUGIN_MODULE, PLUGIN_CLASS, {})
+        try:
+            worker.kill()
+            supervisor.check_workers()
+            supervisor.check_workers()
+            worker.kill()
+            assert supervisor.check_workers() == {"echo_worker": "disabled"}
+            assert worker.enabled is False
+            assert supervisor.get_status()["echo_worker"]["failed"]
+        finally:
+            await supervisor.stop()
+
+
+class TestRegistryProcessMode:
+    """Test PluginRegistry with execution_mode=process"""
+
+    @pytest.mark.asyncio
+    async def test_registry_routes_to_worker(self):
+        config = {
+            "plugin_system": {
+                "plugin_dir": "tests/worker_plugins",
+                "execution_mode": "process",
+                "workers": {"budget": {"heartbeat_interval": 0.1}},
+            },
+            "plugins": {"echo_worker": {"enabled": True}},
+        }
+        registry = PluginRegistry(config, FakeServiceAPI())
+        try:
+            assert registry.load_plugin("echo_worker") is True
+            plugin = registry.get_plugin_for_signal({"strategy": "ECHO", "timeframe": "5m"})
+            assert isinstance(plugin, PluginWorker)
+            result = await plugin.process_signal({"symbol": "XAUUSD"})
+            assert result["plugin_id"] == "echo_worker"
+
+            calls = plugin.stats["calls"]
+            assert registry.broadcast_signal({"strategy": "ECHO"}) == [plugin]
+            assert plugin.stats["calls"] == calls  # served from the handshake, no blocking IPC
+
+            assert registry.disable_plugin("echo_worker")
+            assert registry.get_plugin_for_signal({"strategy": "ECHO", "timeframe": "5m"}) is None
+            assert registry.get_plugin_status("echo_worker")["execution_mode"] == "process"
+        finally:
+            await registry.shutdown_workers()
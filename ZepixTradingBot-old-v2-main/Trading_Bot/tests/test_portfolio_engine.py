@@ -0,0 +1,119 @@
+"""
+Tests for Portfolio Engine
+Verifies vectorized PnL, chain PnL and unpriced symbol reporting
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from src.models import Trade
+from src.managers.portfolio_engine import PortfolioEngine
+
+
+CONFIG = {
+    "symbol_config": {
+        "XAUUSD": {"pip_size": 0.01, "pip_value_per_std_lot": 1.0},
+        "EURUSD": {"pip_size": 0.0001, "pip_value_per_std_lot": 10.0},
+    }
+}
+
+
+def _trade(symbol, direction, entry, sl, lot, trade_id, chain=None, level=0):
+    return Trade(symbol=symbol, entry=entry, sl=sl, tp=0.0, lot_size=lot,
+                 direction=direction, strategy="combinedlogic-1", open_time="now",
+                 trade_id=trade_id, profit_chain_id=chain, profit_level=level)
+
+
+def _reference_pnl(trade, price):
+    spec = CONFIG["symbol_config"][trade.symbol]
+    diff = price - trade.entry if trade.direction == "buy" else trade.entry - price
+    return diff / spec["pip_size"] * spec["pip_value_per_std_lot"] * trade.lot_size
+
+
+@pytest.fixture
+def trades():
+    return [
+        _trade("XAUUSD", "buy", 2000.0, 1990.0, 0.10, 1, chain="PB_1", level=0),
+        _trade("XAUUSD", "buy", 2002.0, 1995.0, 0.10, 2, chain="PB_1", level=0),
+        _trade("XAUUSD", "sell", 2010.0, 2020.0, 0.05, 3),
+        _trade("EURUSD", "sell", 1.1000, 1.1050, 0.20, 4),
+    ]
+
+
+class TestPortfolioEngine:
+    """Test vectorized figures against the per-trade formula"""
+
+    def test_matches_per_trade_formula(self, trades):
+        engine = PortfolioEngine(CONFIG)
+        prices = {"XAUUSD": 2005.0, "EURUSD": 1.0980}
+        snapshot = engine.evaluate(engine.build(trades), prices)
+
+        expected = [_reference_pnl(t, prices[t.symbol]) for t in trades]
+        assert snapshot.trade_pnl.tolist() == pytest.approx(expected)
+        assert snapshot.total_pnl == pytest.approx(sum(expected))
+        assert snapshot.symbol_pnl["EURUSD"] == pytest.approx(expected[3])
+        assert snapshot.chain_pnl[("PB_1", 0)] == pytest.approx(expected[0] + expected[1])
+
+    def test_missing_price_and_unknown_symbol_are_excluded(self, trades):
+        engine = PortfolioEngine(CONFIG)
+        trades.append(_trade("BTCUSD", "buy", 60000.0, 0.0, 0.01, 5))
+        book = engine.build(trades)
+        assert len(book) == 4 and len(book.skipped) == 1
+
+        snapshot = engine.evaluate(book, {"XAUUSD": 2005.0})
+        assert snapshot.missing_prices == ["EURUSD"]
+        assert snapshot.unpriced_symbols == ["BTCUSD"]
+        assert snapshot.to_dict()["unpriced_symbols"] == ["BTCUSD"]
+        assert [d["trade_id"] for d in snapshot.trade_details()] == [1, 2, 3]
+
+    def test_empty_book(self):
+        engine = PortfolioEngine(CONFIG)
+        snapshot = engine.evaluate(engine.build([]), {})
+        assert snapshot.total_pnl == 0.0
+        assert snapshot.unpriced_symbols == []
+
+    def test_unpriced_symbol_logged_once(self, caplog):
+        engine = PortfolioEngine(CONFIG)
+        trades = [_trade("BTCUSD", "buy", 60000.0, 0.0, 0.01, 5)]
+        with caplog.at_level("WARNING", logger="src.managers.portfolio_engine"):
+            engine.build(trades)
+            engine.build(trades)
+        assert [r.message for r in caplog.records if "BTCUSD" in r.message] == [
+            "[Portfolio] No symbol_config pip_value_per_std_lot for ['BTCUSD']; "
+            "their trades are excluded from PnL"
+        ]
+
+
+class TestPortfolioConsumers:
+    """Test RiskManager and ProfitBookingManager read from the engine"""
+
+    def test_risk_manager_fetches_one_price_per_symbol(self, trades, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        from src.managers.risk_manager import RiskManager
+
+        rm = RiskManager(CONFIG)
+        engine = MagicMock()
+        engine.get_open_trades.return_value = trades
+        mt5 = MagicMock()
+        mt5.get_current_price.side_effect = lambda s: {"XAUUSD": 2005.0, "EURUSD": 1.0980}[s]
+
+        result = rm.get_live_open_trades_pnl(engine, mt5)
+        assert mt5.get_current_price.call_count == 2
+        assert len(result["trade_details"]) == 4
+        assert result["unpriced_symbols"] == []
+        assert result["total_live_pnl"] == pytest.approx(rm.portfolio.last_snapshot.total_pnl)
+
+    def test_profit_booking_chain_pnl(self, trades):
+        from src.managers.profit_booking_manager import ProfitBookingManager
+
+        mt5 = MagicMock()
+        mt5.get_current_price.return_value = 2005.0
+        manager = ProfitBookingManager(CONFIG, mt5, MagicMock(), MagicMock(), MagicMock())
+        chain = MagicMock(chain_id="PB_1", current_level=0, symbol="XAUUSD")
+
+        expected = _reference_pnl(trades[0], 2005.0) + _reference_pnl(trades[1], 2005.0)
+        assert manager.calculate_combined_pnl(chain, trades) == pytest.approx(expected)
+        assert manager.calculate_individual_pnl(trades[2], 2005.0) == pytest.approx(
+            _reference_pnl(trades[2], 2005.0))
@@ -0,0 +1,145 @@
+"""
+Tests for On-Demand Profiler
+Verifies stack sampling, blocking-section detection, cProfile sessions and the /profile command
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, AsyncMock
+
+from src.monitoring.profiler import ProfilerManager
+
+
+@pytest.fixture
+def profiler():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield ProfilerManager(output_dir=tmp)
+
+
+def _blocking_work(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def _busy_coroutine():
+    _blocking_work(0.15)
+    await asyncio.sleep(0.1)
+
+
+class TestSamplingProfiler:
+    """Test the stack-sampling mode"""
+
+    def test_detects_blocking_section_and_writes_collapsed_stacks(self, profiler):
+        async def scenario():
+            profiler.start(duration=5, mode="sample", interval=0.002, block_threshold_ms=50)
+            await _busy_coroutine()
+            return profiler.stop()
+
+        report = asyncio.run(scenario())
+        assert report.samples > 0
+        assert any("_blocking_work" in f for f, _ in report.top_functions)
+        assert any("_busy_coroutine" in f for f, _ in report.top_coroutines)
+        assert report.blocking_sections
+        assert report.blocking_sections[0].duration_ms >= 50
+        assert "_blocking_work" in report.blocking_sections[0].top_stack
+
+        with open(report.output_path) as f:
+            line = f.readline().strip()
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+    def test_idle_loop_has_no_blocking_sections(self, profiler):
+        report = asyncio.run(profiler.run(duration=0.2, mode="sample", block_threshold_ms=50))
+        assert report.blocking_sections == []
+        assert report.idle_samples > 0
+
+    def test_only_one_session_at_a_time(self, profiler):
+        profiler.start(duration=1, mode="sample")
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.start(duration=1, mode="sample")
+        finally:
+            profiler.stop()
+        assert not profiler.is_running
+
+    def test_stale_timer_does_not_stop_new_session(self, profiler):
+        first = profiler.start(duration=1)
+        profiler.stop()
+        second = profiler.start(duration=1)
+        try:
+            assert second != first
+            assert profiler.stop(session_id=first) is None
+            assert profiler.is_running
+        finally:
+            profiler.stop()
+
+
+class TestCProfileMode:
+    """Test the deterministic cProfile mode"""
+
+    def test_cprofile_dump(self, profiler):
+        profiler.start(duration=5, mode="cprofile")
+        _blocking_work(0.01)
+        report = profiler.stop()
+        assert report.output_path.endswith(".prof")
+        assert os.path.exists(report.output_path)
+        assert "_blocking_work" in report.summary_text
+
+    def test_unknown_mode_rejected(self, profiler):
+        with pytest.raises(ValueError):
+            profiler.start(mode="perf")
+
+
+class TestProfileCommand:
+    """Test the controller bot /profile handler"""
+
+    def test_profile_command_replies_with_summary_and_file(self, profiler, monkeypatch):
+        pytest.importorskip("telegram")
+        from src.telegram.commands.system import profile_handler
+
+        monkeypatch.setattr(profile_handler, "get_profiler", lambda: profiler)
+        handler = profile_handler.ProfileHandler(MagicMock())
+        update = MagicMock()
+        update.message.reply_text = AsyncMock()
+        update.message.reply_document = AsyncMock()
+        context = MagicMock()
+        context.args = ["1"]
+
+        async def scenario():
+            await handler.execute(update, context)  # returns before the session ends
+            assert profiler.is_running
+            await asyncio.sleep(1.2)  # /profile runs for at least 1s
+
+        asyncio.run(scenario())
+
+        summary = update.message.reply_text.call_args_list[-1].args[0]
+        assert "PROFILE" in summary
+        update.message.reply_document.assert_awaited_once()
+
+    def test_session_stopped_elsewhere(self, profiler, monkeypatch):
+        pytest.importorskip("telegram")
+        from src.telegram.commands.system import profile_handler
+
+        monkeypatch.setattr(profile_handler, "get_profiler", lambda: profiler)
+        handler = profile_handler.ProfileHandler(MagicMock())
+        update = MagicMock()
+        update.message.reply_text = AsyncMock()
+        update.message.reply_document = AsyncMock()
+        context = MagicMock()
+        context.args = ["1"]
+
+        async def scenario():
+            await handler.execute(update, context)
+            assert profiler.stop() is not None  # e.g. POST /profiler/stop
+            await asyncio.sleep(1.2)  # /profile runs for at least 1s
+
+        asyncio.run(scenario())
+
+        assert "stopped elsewhere" in update.message.reply_text.call_args_list[-1].args[0]
+        update.message.reply_document.assert_not_awaited()
@@ -0,0 +1,155 @@
+"""
+Tests for Menu Render Cache
+Verifies memoized menu rendering, state fingerprints and config-change invalidation
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import json
+from unittest.mock import MagicMock
+
+from src.config import Config
+from src.core.config_manager import ConfigManager, create_config_manager
+from src.telegram.render_cache import (
+    MenuRenderCache, RenderedMarkup, serialize_markup, get_menu_render_cache
+)
+from src.telegram.menu_builder import MenuFactory
+from src.telegram.plugin_selection_menu_builder import PluginSelectionMenuBuilder
+
+
+class TestMenuRenderCache:
+    """Test keying, eviction and invalidation"""
+
+    def test_renders_once_per_fingerprint(self):
+        cache = MenuRenderCache()
+        render = MagicMock(return_value=("text", {"inline_keyboard": [[{"text": "A", "callback_data": "a"}]]}))
+
+        first = cache.get_or_render("menu", ("on",), render)
+        second = cache.get_or_render("menu", ("on",), render)
+        cache.get_or_render("menu", ("off",), render)
+
+        assert first is second
+        assert render.call_count == 2
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 2
+
+    def test_dict_markup_carries_json(self):
+        cache = MenuRenderCache()
+        markup = {"inline_keyboard": [[{"text": "🏠 Home", "callback_data": "menu_main"}]]}
+        menu = cache.get_or_render("home", (), lambda: (None, markup))
+
+        assert isinstance(menu.reply_markup, RenderedMarkup)
+        assert menu.reply_markup == markup
+        assert json.loads(serialize_markup(menu.reply_markup)) == markup
+        assert serialize_markup(markup) is markup
+
+    def test_lru_eviction(self):
+        cache = MenuRenderCache(max_entries=2)
+        for i in range(3):
+            cache.get_or_render("m", i, lambda: ("t", None))
+        assert len(cache) == 2
+        assert cache.get_stats()["evicted"] == 1
+
+    def test_invalidate_by_menu_and_config_key(self):
+        cache = MenuRenderCache()
+        cache.get_or_render("timeframe", (True,), lambda: ("t", None),
+                            depends_on=("timeframe_specific_config",))
+        cache.get_or_render("risk", (), lambda: ("r", None), depends_on=("risk_tiers",))
+        cache.get_or_render("static", (), lambda: ("s", None))
+
+        assert cache.invalidate_config_keys(["timeframe_specific_config.enabled"]) == 1
+        assert cache.invalidate_config_keys(["risk_tiers.5000.daily_loss_limit"]) == 1
+        assert cache.invalidate_config_keys(["symbol"]) == 0
+        assert cache.invalidate("static") == 1
+        assert len(cache) == 0
+
+    def test_config_manager_observer_invalidates(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"timeframe_specific_config": {"enabled": False}}))
+        manager = ConfigManager(str(config_path), str(tmp_path / "plugins"), enable_watching=False)
+
+        cache = MenuRenderCache()
+        cache.attach(manager)
+        cache.attach(manager)
+        assert manager._observers.count(cache.on_config_change) == 1
+
+        cache.get_or_render("timeframe", (False,), lambda: ("t", None),
+                            depends_on=("timeframe_specific_config",))
+        manager.update("timeframe_specific_config", {"enabled": True}, save=False)
+        assert len(cache) == 0
+
+        cache.detach(manager)
+        assert cache.on_config_change not in manager._observers
+
+    def test_bot_config_updates_invalidate(self, monkeypatch):
+        config = Config()
+        monkeypatch.setattr(config, "save_config", lambda: None)
+        cache = MenuRenderCache()
+        cache.attach(config)
+
+        for update in (lambda: config.update_nested("timeframe_specific_config.enabled", True),
+                       lambda: config.update("timeframe_specific_config", {"enabled": False})):
+            cache.get_or_render("timeframe", (update,), lambda: ("t", None),
+                                depends_on=("timeframe_specific_config",))
+            update()
+            assert len(cache) == 0
+        cache.detach(config)
+
+    def test_config_manager_factory_attaches_shared_cache(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({}))
+        manager = create_config_manager(str(config_path), str(tmp_path / "plugins"), enable_watching=False)
+
+        shared = get_menu_render_cache()
+        assert shared.on_config_change in manager._observers
+        shared.detach(manager)
+
+
+class TestCachedMenus:
+    """Test menu builders served from the shared cache"""
+
+    def test_menu_factory_reuses_keyboards(self):
+        assert MenuFactory.create_main_menu() is MenuFactory.create_main_menu()
+        assert MenuFactory.create_back_only_menu("a")["inline_keyboard"][0][0]["callback_data"] == "a"
+        assert MenuFactory.create_back_only_menu("b")["inline_keyboard"][0][0]["callback_data"] == "b"
+
+    def test_plugin_selection_keyboard_per_command(self):
+        status = PluginSelectionMenuBuilder.build_selection_keyboard('/status')
+        assert status is PluginSelectionMenuBuilder.build_selection_keyboard('status')
+        no_both = PluginSelectionMenuBuilder.build_selection_keyboard('/status', include_both=False)
+        assert len(no_both["inline_keyboard"]) == len(status["inline_keyboard"]) - 1
+
+    def test_menu_manager_timeframe_menu_follows_toggle(self):
+        pytest.importorskip("pytz")
+        from src.menu.menu_manager import MenuManager
+
+        bot = MagicMock()
+        bot.config = {"timeframe_specific_config": {"enabled": False}}
+        manager = MenuManager(bot)
+
+        manager.show_timeframe_menu(1, 2)
+        off_keyboard = bot.edit_message.call_args.args[2]
+        assert off_keyboard["inline_keyboard"][0][0]["text"] == "❌ Toggle System"
+
+        bot.config["timeframe_specific_config"]["enabled"] = True
+        manager.show_timeframe_menu(1, 2)
+        on_keyboard = bot.edit_message.call_args.args[2]
+        assert on_keyboard["inline_keyboard"][0][0]["text"] == "✅ Toggle System"
+
+        manager.show_timeframe_menu(1, 2)
+        assert bot.edit_message.call_args.args[2] is on_keyboard
+
+    def test_menu_manager_main_menu_is_sent(self):
+        pytest.importorskip("pytz")
+        from src.menu.menu_manager import MenuManager
+
+        bot = MagicMock()
+        bot.config = {"symbol": "XAUUSD"}
+        manager = MenuManager(bot)
+
+        manager.show_main_menu(1, 5)
+        text, message_id, keyboard = bot.edit_message.call_args.args
+        assert "XAUUSD" in text and message_id == 5
+        assert keyboard["inline_keyboard"][-1][1]["callback_data"] == "menu_main"
+        assert get_menu_render_cache().get_stats()["entries"] >= 1
@@ -0,0 +1,212 @@
+"""
+Tests for Offline Replay Engine
+Verifies virtual clock, simulated broker fills and per-plugin replay PnL
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import json
+import os
+import tempfile
+from datetime import datetime
+
+from src.simulation import (
+    VirtualClock, to_epoch, SimulatedBroker, Tick,
+    ReplayEngine, ReplayAlert, load_ticks, load_alerts
+)
+
+
+CONFIG = {
+    "symbol_config": {
+        "XAUUSD": {"pip_size": 0.01, "pip_value_per_std_lot": 1.0, "contract_size": 100},
+        "EURUSD": {"pip_size": 0.0001, "pip_value_per_std_lot": 10.0, "contract_size": 100000}
+    },
+    "symbol_mapping": {"XAUUSD": "GOLD"}
+}
+
+
+class FakeRouter:
+    """Minimal PluginRouter stand-in that opens one order per signal"""
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.signals = []
+
+    async def route_signal(self, signal):
+        self.signals.append(signal)
+        price = self.broker.get_current_price(signal['symbol'])
+        direction = signal['signal_type']
+        sl = price - 5 if direction == 'BUY' else price + 5
+        tp = price + 5 if direction == 'BUY' else price - 5
+        ticket = self.broker.place_order(
+            signal['symbol'], direction, 0.1, 0.0, sl=sl, tp=tp,
+            comment=f"{signal['plugin_hint']}|entry"
+        )
+        return {'status': 'success', 'ticket': ticket}
+
+
+# ============================================================================
+# Virtual Clock
+# ============================================================================
+
+class TestVirtualClock:
+    """Test VirtualClock"""
+
+    def test_advance_only_moves_forward(self):
+        clock = VirtualClock(1000.0)
+        assert clock.advance_to(1500.0) == 500.0
+        assert clock.advance_to(1200.0) == 0.0
+        assert clock.time() == 1500.0
+
+    def test_to_epoch_formats(self):
+        assert to_epoch(1700000000) == 1700000000.0
+        assert to_epoch(1700000000000) == 1700000000.0
+        assert to_epoch("2024-01-01T00:00:00Z") == to_epoch(datetime(2024, 1, 1))
+
+    def test_sleep_advances_without_waiting(self):
+        clock = VirtualClock(0.0)
+        asyncio.run(clock.sleep(3600))
+        assert clock.time() == 3600.0
+
+
+# ============================================================================
+# Simulated Broker
+# ============================================================================
+
+class TestSimulatedBroker:
+    """Test SimulatedBroker fills and SL/TP"""
+
+    def test_rejects_without_quote(self):
+        broker = SimulatedBroker(CONFIG)
+        assert broker.place_order('XAUUSD', 'BUY', 0.1) is None
+
+    def test_buy_fills_at_ask_and_hits_tp(self):
+        broker = SimulatedBroker(CONFIG)
+        broker.on_tick(Tick(1.0, 'XAUUSD', 2650.0, 2650.2))
+        ticket = broker.place_order('XAUUSD', 'BUY', 1.0, 0.0, sl=2645.0, tp=2655.0,
+                                    comment='v3_combined|test')
+        assert broker.get_position(ticket)['price_open'] == 2650.2
+
+        deals = broker.on_tick(Tick(2.0, 'XAUUSD', 2655.1, 2655.3))
+        assert len(deals) == 1
+        assert deals[0].reason == 'TP_HIT'
+        assert deals[0].owner == 'v3_combined'
+        # (2655.0 - 2650.2) / 0.01 pips * $1 per pip per lot
+        assert deals[0].profit == pytest.approx(480.0)
+        assert broker.get_position(ticket) is None
+
+    def test_sell_hits_sl(self):
+        broker = SimulatedBroker(CONFIG)
+        broker.on_tick(Tick(1.0, 'EURUSD', 1.0850, 1.0851))
+        broker.place_order('EURUSD', 'SELL', 1.0, 0.0, sl=1.0870, tp=1.0800)
+        deals = broker.on_tick(Tick(2.0, 'EURUSD', 1.0871, 1.0872))
+        assert deals[0].reason == 'SL_HIT'
+        assert deals[0].profit == pytest.approx(-200.0)
+
+    def test_owner_resolution_from_order_service_comment(self):
+        broker = SimulatedBroker(CONFIG)
+        assert broker.resolve_owner('V6_A_v6_price_action_15m_ORDER_A') == 'v6_price_action_15m'
+        assert broker.resolve_owner('V3_B_v3_combined_LOGIC2') == 'v3_combined'
+        assert broker.resolve_owner('') == 'core'
+
+    def test_broker_symbol_is_mapped_back(self):
+        broker = SimulatedBroker(CONFIG)
+        broker.on_tick(Tick(1.0, 'XAUUSD', 2650.0, 2650.2))
+        assert broker.get_current_price('GOLD') == pytest.approx(2650.1)
+
+
+# ============================================================================
+# Data Loading
+# ============================================================================
+
+class TestLoaders:
+    """Test tick and alert file loaders"""
+
+    def test_load_bar_csv_expands_ticks(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write("timestamp,symbol,open,high,low,close\n")
+            f.write("2024-01-01T00:00:00,XAUUSD,2650,2655,2648,2653\n")
+            path = f.name
+        try:
+            ticks = list(load_ticks(path))
+            assert [t.bid for t in ticks] == [2650.0, 2648.0, 2655.0, 2653.0]
+        finally:
+            os.unlink(path)
+
+    def test_load_alerts_sorted(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+            f.write(json.dumps({"timestamp": 200, "payload": {"type": "entry_v3"}}) + "\n")
+            f.write("not json\n")
+            f.write(json.dumps({"time": 100, "type": "entry_v6"}) + "\n")
+            path = f.name
+        try:
+            alerts = load_alerts(path)
+            assert [a.timestamp for a in alerts] == [100.0, 200.0]
+            assert alerts[1].payload == {"type": "entry_v3"}
+        finally:
+            os.unlink(path)
+
+
+# ============================================================================
+# Replay Engine
+# ============================================================================
+
+class TestReplayEngine:
+    """Test end-to-end replay through a router target"""
+
+    def _ticks(self):
+        return [
+            Tick(100.0, 'XAUUSD', 2650.0, 2650.0),
+            Tick(200.0, 'XAUUSD', 2656.0, 2656.0),   # BUY TP hit
+            Tick(300.0, 'XAUUSD', 2656.0, 2656.0),
+            Tick(86400.0, 'XAUUSD', 2662.0, 2662.0),  # SELL SL hit
+        ]
+
+    def test_replay_per_plugin_pnl(self):
+        broker = SimulatedBroker(CONFIG)
+        router = FakeRouter(broker)
+        alerts = [
+            ReplayAlert(100.0, {"type": "entry_v3", "symbol": "XAUUSD", "signal_type": "BUY"}),
+            ReplayAlert(300.0, {"type": "entry_v6", "symbol": "XAUUSD", "signal_type": "SELL",
+                                "timeframe": "15m"}),
+        ]
+        result = asyncio.run(ReplayEngine(router, broker).run(alerts, self._ticks()))
+
+        assert result.alerts_processed == 2
+        assert result.ticks_processed == 4
+        assert result.simulated_seconds == pytest.approx(86300.0)
+        assert result.per_plugin['v3_combined'].wins == 1
+        assert result.per_plugin['v3_combined'].net_pnl == pytest.approx(50.0)
+        assert result.per_plugin['v6_price_action_15m'].losses == 1
+        assert result.per_plugin['v6_price_action_15m'].net_pnl == pytest.approx(-50.0)
+        assert result.final_balance == pytest.approx(10000.0)
+        assert "PER-PLUGIN PnL" in result.format_report()
+
+    def test_alert_sees_tick_with_same_timestamp(self):
+        broker = SimulatedBroker(CONFIG)
+        router = FakeRouter(broker)
+        alerts = [ReplayAlert(100.0, {"type": "entry_v3", "symbol": "XAUUSD", "signal_type": "BUY"})]
+        asyncio.run(ReplayEngine(router, broker).run(alerts, self._ticks()[:1]))
+        assert len(broker.get_open_positions()) == 1
+
+    def test_engine_target_errors_are_counted(self):
+        class FailingEngine:
+            async def process_alert(self, data):
+                raise RuntimeError("boom")
+
+        broker = SimulatedBroker(CONFIG)
+        alerts = [ReplayAlert(100.0, {"type": "entry", "symbol": "XAUUSD"})]
+        result = asyncio.run(ReplayEngine(FailingEngine(), broker).run(alerts, []))
+        assert result.alerts_failed == 1
+        assert "boom" in result.errors[0]
+
+    def test_close_at_end_realizes_open_positions(self):
+        broker = SimulatedBroker(CONFIG)
+        router = FakeRouter(broker)
+        alerts = [ReplayAlert(100.0, {"type": "entry_v3", "symbol": "XAUUSD", "signal_type": "BUY"})]
+        ticks = [Tick(100.0, 'XAUUSD', 2650.0, 2650.0), Tick(150.0, 'XAUUSD', 2652.0, 2652.0)]
+        result = asyncio.run(ReplayEngine(router, broker).run(alerts, ticks, close_at_end=True))
+        assert broker.get_open_positions() == []
+        assert result.per_plugin['v3_combined'].net_pnl == pytest.approx(20.0)
@@ -0,0 +1,166 @@
+"""
+Tests for Risk Ledger
+Verifies in-memory counters, batched journal writes, compaction and crash recovery
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import json
+import os
+import tempfile
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.managers.risk_ledger import RiskLedger
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _ledger(tmp_dir, **kwargs):
+    kwargs.setdefault("background", False)
+    return RiskLedger(snapshot_path=os.path.join(tmp_dir, "stats.json"), **kwargs)
+
+
+class TestLedgerCounters:
+    """Test in-memory bookkeeping"""
+
+    def test_pnl_and_loss_update_memory_without_io(self, tmp_dir):
+        ledger = _ledger(tmp_dir)
+        ledger.record_pnl(25.0)
+        ledger.record_pnl(-10.0)
+        ledger.record_loss(5.0)
+
+        state = ledger.state
+        assert state.daily_profit == 25.0
+        assert state.daily_loss == 15.0
+        assert state.lifetime_loss == 15.0
+        assert state.total_trades == 2
+        assert state.winning_trades == 1
+        assert not os.path.exists(ledger.journal_path)
+
+    def test_resets(self, tmp_dir):
+        ledger = _ledger(tmp_dir)
+        ledger.record_pnl(-10.0)
+        ledger.reset_daily()
+        assert ledger.state.daily_loss == 0.0
+        assert ledger.state.lifetime_loss == 10.0
+        assert ledger.state.total_trades == 1
+
+        ledger.reset_daily(include_trades=True)
+        ledger.reset_lifetime()
+        assert ledger.state.total_trades == 0
+        assert ledger.state.lifetime_loss == 0.0
+
+    def test_unknown_field_rejected(self, tmp_dir):
+        with pytest.raises(ValueError):
+            _ledger(tmp_dir).set_values(balance=1.0)
+
+
+class TestLedgerPersistence:
+    """Test journal batching, compaction and recovery"""
+
+    def test_burst_is_written_with_one_fsync(self, tmp_dir):
+        ledger = _ledger(tmp_dir)
+        for _ in range(50):
+            ledger.record_pnl(-1.0)
+        assert ledger.flush()
+        assert ledger.stats["fsyncs"] == 1
+
+        with open(ledger.journal_path) as f:
+            assert len(f.readlines()) == 50
+
+    def test_replay_recovers_after_crash(self, tmp_dir):
+        ledger = _ledger(tmp_dir)
+        ledger.record_pnl(-12.5)
+        ledger.record_pnl(30.0)
+        ledger.flush()
+
+        recovered = _ledger(tmp_dir)
+        assert recovered.state.daily_loss == 12.5
+        assert recovered.state.daily_profit == 30.0
+        assert recovered.state.total_trades == 2
+        assert recovered.stats["replayed"] == 2
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self, tmp_dir):
+        ledger = _ledger(tmp_dir, compact_every=3)
+        for _ in range(3):
+            ledger.record_loss(2.0)
+        ledger.flush()
+
+        with open(ledger.snapshot_path) as f:
+            snapshot = json.load(f)
+        assert snapshot["lifetime_loss"] == 6.0
+        assert snapshot["journal_seq"] == 3
+        assert os.path.getsize(ledger.journal_path) == 0
+
+        ledger.record_loss(1.0)
+        ledger.flush()
+        assert _ledger(tmp_dir).state.lifetime_loss == 7.0
+
+    def test_entries_already_in_snapshot_are_not_replayed_twice(self, tmp_dir):
+        ledger = _ledger(tmp_dir)
+        ledger.record_loss(4.0)
+        ledger.flush()
+        with open(ledger.journal_path) as f:
+            journal = f.read()
+        ledger.flush(compact=True)
+
+        # Simulate a crash between snapshot replace and journal truncate
+        with open(ledger.journal_path, "w") as f:
+            f.write(journal)
+        assert _ledger(tmp_dir).state.lifetime_loss == 4.0
+
+    def test_torn_line_and_stale_day(self, tmp_dir):
+        snapshot = os.path.join(tmp_dir, "stats.json")
+        with open(snapshot, "w") as f:
+            json.dump({"date": "2020-01-01", "daily_loss": 40.0, "lifetime_loss": 90.0,
+                       "total_trades": 3, "winning_trades": 1}, f)
+        with open(os.path.join(tmp_dir, "risk_journal.jsonl"), "w") as f:
+            f.write('{"seq": 1, "op": "loss", "date": "2020-01-01", "amount": 10.0}\n{"seq": 2, "op"')
+
+        ledger = _ledger(tmp_dir)
+        assert ledger.state.date == str(date.today())
+        assert ledger.state.daily_loss == 0.0
+        assert ledger.state.lifetime_loss == 100.0
+        assert ledger.state.total_trades == 3
+
+    def test_background_writer_persists_and_close_compacts(self, tmp_dir):
+        ledger = _ledger(tmp_dir, background=True, flush_interval=0.01)
+        ledger.record_pnl(-3.0)
+        ledger.close()
+
+        with open(ledger.snapshot_path) as f:
+            assert json.load(f)["daily_loss"] == 3.0
+
+
+class TestRiskManagerIntegration:
+    """Test RiskManager backed by the ledger"""
+
+    def test_risk_manager_uses_ledger(self, tmp_dir, monkeypatch):
+        monkeypatch.chdir(tmp_dir)
+        from src.managers.risk_manager import RiskManager
+
+        config = {"risk_tiers": {"5000": {"daily_loss_limit": 20.0, "max_total_loss": 100.0}}}
+        rm = RiskManager(config)
+        rm.ledger.background = False
+        rm.mt5_client = MagicMock()
+        rm.mt5_client.get_account_balance.return_value = 5000
+
+        rm.update_pnl(-15.0)
+        rm.record_loss(6.0)
+        assert rm.daily_loss == 21.0
+        assert rm.check_daily_limit() is False
+
+        assert rm.reset_daily_loss() is True
+        with open(rm.stats_file) as f:
+            assert json.load(f)["daily_loss"] == 0.0
+        assert rm.check_daily_limit() is True
+
+        rm.lifetime_loss = 50.0
+        rm.ledger.flush()
+        assert RiskManager(config).lifetime_loss == 50.0
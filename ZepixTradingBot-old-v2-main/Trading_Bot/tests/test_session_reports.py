@@ -0,0 +1,135 @@
+"""
+Tests for Materialised Session Reports
+Verifies incremental session summaries, frozen reports and session end detection
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from src.database import TradeDatabase
+from src.database.connection_manager import get_connection_manager
+from src.models import Trade
+from src.managers.session_manager import SessionManager
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    db = TradeDatabase()
+    yield db
+    db.conn.close()
+    get_connection_manager().close(db.db.path)
+
+
+@pytest.fixture
+def manager(db):
+    return SessionManager({}, db, mt5_client=None)
+
+
+def make_trade(session_id, pnl, status="closed", **kwargs):
+    now = datetime.now().isoformat()
+    return Trade(symbol="XAUUSD", entry=2000.0, sl=1990.0, tp=2020.0, lot_size=0.1, direction="buy",
+                 strategy="LOGIC1", status=status, open_time=now, close_time=now, pnl=pnl,
+                 session_id=session_id, **kwargs)
+
+
+class TestSessionSummary:
+    """Test the summary row is maintained as trades close"""
+
+    def test_closed_trades_update_summary(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        db.save_trade(make_trade(session_id, 0.0, status="open"))
+        db.save_trade(make_trade(session_id, 40.0, profit_chain_id="PC1"))
+        db.save_trade(make_trade(session_id, 10.0, profit_chain_id="PC1", is_re_entry=True))
+        db.save_trade(make_trade(session_id, -15.0, order_type="DUAL_B"))
+
+        report = manager.get_session_report(session_id)
+        assert (report["total_trades"], report["total_pnl"]) == (3, 35.0)
+        assert report["breakdown"] == {
+            "wins": 2, "losses": 1, "total_profit": 50.0, "total_loss": -15.0, "dual_orders": 1,
+            "profit_chains": 1, "reentries": 1, "win_rate": pytest.approx(66.67, abs=0.01)
+        }
+
+    def test_saving_a_closed_trade_again_is_idempotent(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        trade = make_trade(session_id, 0.0, status="open", trade_id=101)
+        db.save_trade(trade)
+        trade.status, trade.pnl = "closed", 10.0
+        db.save_trade(trade)
+        db.save_trade(trade)
+
+        report = manager.get_session_report(session_id)
+        assert (report["total_trades"], report["total_pnl"], report["breakdown"]["wins"]) == (1, 10.0, 1)
+
+        trade.pnl = -4.0  # corrected close: the old pnl is replaced, not added
+        db.save_trade(trade)
+        report = manager.get_session_report(session_id)
+        assert (report["total_trades"], report["total_pnl"]) == (1, -4.0)
+        assert (report["breakdown"]["wins"], report["breakdown"]["losses"]) == (0, 1)
+
+    def test_rebuild_matches_incremental(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        for pnl, chain in ((25.0, "PC1"), (-5.0, "PC2"), (12.5, "PC2")):
+            db.save_trade(make_trade(session_id, pnl, profit_chain_id=chain))
+        incremental = manager.get_session_report(session_id)
+
+        manager.update_session()
+        assert manager.get_session_report(session_id) == incremental
+
+
+class TestFrozenReports:
+    """Test reports are written once at session end and read by key"""
+
+    def test_close_freezes_report(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        db.save_trade(make_trade(session_id, 30.0))
+        closed = manager.close_session("TP_HIT")
+
+        assert closed["status"] == "COMPLETED" and closed["exit_reason"] == "TP_HIT"
+        stored = db.conn.execute("SELECT report FROM session_reports WHERE session_id = ?",
+                                 (session_id,)).fetchone()
+        assert json.loads(stored[0]) == closed
+        db.save_trade(make_trade(session_id, 99.0))  # late save does not touch the frozen report
+        assert manager.get_session_report(session_id)["total_pnl"] == 30.0
+
+    def test_legacy_completed_session_frozen_on_first_read(self, db):
+        db.create_session("SES_OLD", "EURUSD", "sell", "BEARISH")
+        db.conn.execute("UPDATE trading_sessions SET status = 'COMPLETED' WHERE session_id = 'SES_OLD'")
+        db.conn.commit()
+        trade = make_trade("SES_OLD", 20.0)
+        db.save_trade(trade)
+        db.conn.execute("UPDATE trading_sessions SET total_trades = 0, total_pnl = 0, wins = 0")
+        db.conn.commit()
+
+        assert db.get_session_report("SES_OLD")["breakdown"]["wins"] == 1
+        assert db.conn.execute("SELECT COUNT(*) FROM session_reports").fetchone() == (1,)
+
+    def test_today_list_from_summary_rows(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        db.save_trade(make_trade(session_id, 5.0))
+        sessions = manager.get_today_sessions()
+
+        assert [(s["session_id"], s["total_pnl"]) for s in sessions] == [(session_id, 5.0)]
+        assert "metadata" not in sessions[0]
+
+
+class TestSessionEnd:
+    """Test the session closes once its trades have all closed"""
+
+    def test_check_session_end(self, db, manager):
+        session_id = manager.create_session("XAUUSD", "buy", "BULLISH")
+        assert manager.check_session_end([]) is None  # no trades yet
+
+        trade = make_trade(session_id, 0.0, status="open")
+        assert manager.check_session_end([trade]) is None
+
+        trade.status, trade.pnl = "closed", 12.0
+        db.save_trade(trade)
+        report = manager.check_session_end([])
+        assert report["session_id"] == session_id and report["total_pnl"] == 12.0
+        assert manager.get_active_session() is None
@@ -0,0 +1,184 @@
+"""
+Tests for Session Store
+Verifies TTL expiry, LRU cap, lock reclamation and SQLite spill
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+
+from src.utils.session_store import SessionStore, TimerWheel
+from src.menu.context_manager import ContextManager
+from src.menu.command_executor import EXECUTION_LOG_LIMIT, CommandExecutor
+from src.monitoring.metrics_registry import SESSION_STORE_ENTRIES
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTimerWheel:
+    """Test keys come back once their tick is passed"""
+
+    def test_advance_returns_passed_slots(self):
+        wheel = TimerWheel(tick_seconds=1.0, slots=8, now=0.0)
+        slot = wheel.schedule("a", 2.5)
+        wheel.schedule("b", 20.0)  # more than one revolution away
+        assert wheel.advance(1.0) == []
+        assert wheel.advance(3.0) == ["a"]
+        wheel.cancel("a", slot)  # the owner drops keys it expired
+        assert wheel.advance(30.0) == ["b"]
+
+
+class TestSessionStore:
+    """Test expiry, eviction and accounting"""
+
+    def test_entries_expire_after_ttl(self, clock):
+        evicted = []
+        store = SessionStore("t_ttl", ttl_seconds=10, clock=clock,
+                             on_evict=lambda k, v, reason: evicted.append((k, reason)))
+        store.set(1, {"menu": "main"})
+        clock.now += 9
+        assert store.get(1) == {"menu": "main"}
+        clock.now += 2
+        assert store.get(1) is None
+        assert evicted == [(1, "expired")]
+        assert len(store) == 0 and store.get_stats()["memory_bytes"] == 0
+
+    def test_expire_sweeps_without_access(self, clock):
+        store = SessionStore("t_sweep", ttl_seconds=5, clock=clock)
+        for key in range(100):
+            store.set(key, key, ttl=5 if key % 2 else 50)
+        clock.now += 6
+        assert store.expire() == 50
+        assert sorted(store.keys()) == list(range(0, 100, 2))
+
+    def test_sliding_and_touch_extend_ttl(self, clock):
+        store = SessionStore("t_sliding", ttl_seconds=10, sliding=True, clock=clock)
+        store.set("a", 1)
+        for _ in range(3):
+            clock.now += 8
+            assert store.get("a") == 1
+        store.touch("a", ttl=100)
+        clock.now += 50
+        assert "a" in store
+
+    def test_lru_cap_evicts_least_recently_used(self, clock):
+        store = SessionStore("t_lru", max_entries=3, clock=clock)
+        for key in "abc":
+            store.set(key, key)
+        store.get("a")
+        store.set("d", "d")
+        assert store.keys() == ["c", "a", "d"]
+        assert store.get_stats()["lru"] == 1
+        assert SESSION_STORE_ENTRIES.labels(store="t_lru").value == 3
+
+
+class TestLockReclamation:
+    """Test per-key locks are dropped with their entry"""
+
+    def test_lock_reclaimed_on_delete(self, clock):
+        store = SessionStore("t_locks", clock=clock)
+        store.set(1, "state")
+        lock = store.get_lock(1)
+        assert store.get_lock(1) is lock
+        store.discard(1)
+        assert store.get_stats()["locks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_held_lock_reclaimed_on_next_sweep(self, clock):
+        store = SessionStore("t_held", ttl_seconds=5, clock=clock)
+        store.set(1, "state")
+        async with store.get_lock(1):
+            clock.now += 10
+            store.expire()
+            assert store.get_stats()["locks"] == 1
+        store.expire()
+        assert store.get_stats()["locks"] == 0
+
+    def test_lock_reclaimed_on_lru_eviction_without_spill(self, clock):
+        store = SessionStore("t_lru_locks", max_entries=1, clock=clock)
+        store.set("a", 1)
+        store.get_lock("a")
+        store.set("b", 2)
+        assert "a" not in store._locks
+
+    def test_orphan_locks_swept_as_store_is_used(self, clock):
+        store = SessionStore("t_orphans", sweep_interval=60, clock=clock)
+        store.get_lock("never_set")
+        store.get("other")
+        assert store.get_stats()["locks"] == 1
+        clock.now += 61
+        store.get("other")
+        assert store.get_stats()["locks"] == 0
+
+
+class TestSpill:
+    """Test LRU spill to SQLite and recovery after restart"""
+
+    def test_lru_evicted_entries_are_promoted(self, tmp_path, clock):
+        store = SessionStore("t_spill", max_entries=2, spill_path=str(tmp_path / "s.db"), clock=clock)
+        for key in range(4):
+            store.set(key, {"n": key})
+        assert len(store) == 2
+        assert store.get(0) == {"n": 0}
+        assert store.get_stats()["promoted"] == 1
+        store.close()
+
+    def test_restart_restores_unexpired_entries(self, tmp_path, clock):
+        path = str(tmp_path / "s.db")
+        store = SessionStore("t_restart", ttl_seconds=60, spill_path=path, clock=clock)
+        store.set("keep", [1, 2])
+        store.set("short", "x", ttl=5)
+        store.set("gone", "y")
+        store.discard("gone")
+        store.close()
+
+        clock.now += 10
+        restored = SessionStore("t_restart", ttl_seconds=60, spill_path=path, clock=clock)
+        assert restored.items() == [("keep", [1, 2])]
+        clock.now += 51
+        assert restored.get("keep") is None
+        restored.close()
+
+
+class TestIntegrations:
+    """Test the menu context, conversation and execution log bounds"""
+
+    def test_context_manager_reports_expiry_once(self):
+        manager = ContextManager(expiration_minutes=30)
+        manager.store._clock = clock = FakeClock()
+        manager.store._wheel = TimerWheel(now=clock.now)
+        manager.set_context(7, {"current_menu": "menu_trading"})
+        assert manager.user_contexts[7]["current_menu"] == "menu_trading"
+        assert not manager._is_expired(7)
+
+        clock.now += 31 * 60
+        assert manager._is_expired(7)
+        assert manager.get_context(7)["current_menu"] == "menu_main"
+        assert not manager._is_expired(7)
+
+    @pytest.mark.asyncio
+    async def test_conversation_clear_reclaims_lock(self):
+        from src.telegram.core.conversation_state_manager import state_manager
+        state_manager.start_flow(99, "buy")
+        await state_manager.update_state(99, lambda state: state.add_data("symbol", "XAUUSD"))
+        assert state_manager.get_state(99).get_data("symbol") == "XAUUSD"
+        state_manager.clear_state(99)
+        assert state_manager.get_state(99) is None
+        assert 99 not in state_manager.states._locks
+
+    def test_execution_log_is_bounded(self):
+        executor = CommandExecutor(telegram_bot=None)
+        executor.execution_log.extend({"status": "success"} for _ in range(EXECUTION_LOG_LIMIT + 10))
+        assert len(executor.execution_log) == EXECUTION_LOG_LIMIT
+        assert len(executor.get_execution_log(limit=20)) == 20
@@ -6,6 +6,9 @@ Part of Plan 11: Shadow Mode Testing
 Version: 1.0.0
 Date: 2026-01-15
 """
+import asyncio
+import threading
+import time
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
@@ -541,6 +544,167 @@ class TestTradingEngineIntegration:
         assert hasattr(te, 'ExecutionMode')
 
 
+# ============================================================================
+# Test Bounded Buffers and Background Evaluation
+# ============================================================================
+
+def _compare(manager, signal_id, plugin_action='execute'):
+    manager.record_legacy_decision(signal_id, 'execute', 'valid')
+    manager.record_plugin_decision('v3_combined', signal_id, plugin_action, 'valid')
+    return manager.compare_decisions(signal_id)
+
+
+class TestBoundedBuffers:
+    """Test ring buffers and rolling discrepancy statistics"""
+    
+    @pytest.fixture
+    def manager(self):
+        manager = ShadowModeManager({'max_tracked_signals': 5, 'max_comparisons': 4})
+        manager.enable_shadow_plugin('v3_combined')
+        return manager
+    
+    def test_buffers_are_bounded(self, manager):
+        """Test decisions, comparisons and virtual orders keep only the newest"""
+        for i in range(10):
+            _compare(manager, f'sig_{i}')
+            manager.record_virtual_order('v3_combined', f'sig_{i}', {'symbol': 'EURUSD'})
+        
+        assert list(manager._decisions) == [f'sig_{i}' for i in range(5, 10)]
+        assert [c.signal_id for c in manager._comparisons] == [f'sig_{i}' for i in range(6, 10)]
+        assert len(manager.get_virtual_orders(100)) == 4
+        assert manager._stats['signals_processed'] == 10
+    
+    def test_rolling_discrepancy_stats(self, manager):
+        """Test rolling counts follow the comparison window"""
+        for i in range(4):
+            _compare(manager, f'sig_{i}', plugin_action='reject')
+        for i in range(4, 7):
+            _compare(manager, f'sig_{i}')
+        
+        rolling = manager.get_discrepancy_stats()
+        assert rolling['window'] == 4
+        assert rolling['window_by_type'] == {'action_mismatch': 1}
+        assert rolling['window_match_rate'] == 75.0
+        assert rolling['total_by_type'] == {'action_mismatch': 4}
+        assert rolling['by_plugin']['v3_combined']['matches'] == 3
+    
+    def test_export_jsonl_and_comparison_log(self, tmp_path):
+        """Test JSONL export and the streaming comparison log"""
+        log_path = tmp_path / 'comparisons.jsonl'
+        manager = ShadowModeManager({'comparison_log': str(log_path)})
+        manager.enable_shadow_plugin('v3_combined')
+        _compare(manager, 'sig_1')
+        _compare(manager, 'sig_2', plugin_action='skip')
+        
+        export_path = tmp_path / 'export.jsonl'
+        manager.export_comparisons(str(export_path))
+        exported = [json.loads(line) for line in export_path.read_text().splitlines()]
+        assert [c['match'] for c in exported] == [True, False]
+        assert log_path.read_text().splitlines() == export_path.read_text().splitlines()
+
+
+class TestBackgroundShadowEvaluation:
+    """Test shadow plugins run off the live path"""
+    
+    @pytest.fixture
+    def manager(self):
+        manager = ShadowModeManager({'queue_size': 2})
+        manager.set_mode(ExecutionMode.SHADOW)
+        manager.enable_shadow_plugin('v3_shadow')
+        return manager
+    
+    async def test_submit_returns_before_evaluation(self, manager):
+        """Test the live caller never waits on shadow plugins"""
+        evaluated = []
+        discrepancies = []
+        
+        async def evaluator(plugin_id, signal):
+            evaluated.append(plugin_id)
+            return {'status': 'skipped', 'message': 'filtered'}
+        
+        async def on_discrepancy(comparison):
+            discrepancies.append(comparison)
+        
+        manager.set_evaluator(evaluator, on_discrepancy)
+        assert manager.submit_shadow({'signal_id': 's1', 'symbol': 'EURUSD'}, 'v3_combined',
+                                     {'status': 'success', 'symbol': 'EURUSD'})
+        assert evaluated == []
+        
+        await manager.drain()
+        assert evaluated == ['v3_shadow']
+        assert discrepancies[0].discrepancy_type == 'action_mismatch'
+        assert manager.get_stats()['shadow_evaluated'] == 1
+        await manager.stop()
+    
+    async def test_full_queue_drops_shadow_work(self, manager):
+        """Test a saturated shadow queue drops evaluations instead of blocking"""
+        async def slow_evaluator(plugin_id, signal):
+            await asyncio.sleep(10)
+        
+        manager.set_evaluator(slow_evaluator)
+        results = [manager.submit_shadow({'signal_id': f's{i}'}, 'v3_combined', {'status': 'success'})
+                   for i in range(4)]
+        
+        assert results == [True, True, False, False]
+        assert manager.get_stats()['shadow_dropped'] == 2
+        await manager.stop()
+    
+    async def test_blocking_plugin_runs_off_the_live_loop(self, manager):
+        """Test a shadow plugin that blocks its thread does not stall the live loop"""
+        threads = []
+        
+        async def blocking_evaluator(plugin_id, signal):
+            threads.append(threading.current_thread().name)
+            time.sleep(0.3)  # CPU-bound / synchronous plugin code
+            return {'status': 'skipped'}
+        
+        manager.set_evaluator(blocking_evaluator)
+        assert manager.submit_shadow({'signal_id': 's1'}, 'v3_combined', {'status': 'skipped'})
+        
+        ticks = 0
+        drained = asyncio.ensure_future(manager.drain())
+        while not drained.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        
+        assert threads == ['ShadowEvaluator']
+        assert ticks >= 10
+        assert manager.get_stats()['shadow_evaluated'] == 1
+        await manager.stop()
+        assert manager._shadow_thread is None
+    
+    async def test_timed_out_plugin_is_cancelled(self):
+        """Test evaluation_timeout bounds each shadow plugin evaluation"""
+        manager = ShadowModeManager({'evaluation_timeout': 0.05})
+        manager.set_mode(ExecutionMode.SHADOW)
+        manager.enable_shadow_plugin('v3_shadow')
+        cancelled = []
+        
+        async def hung_evaluator(plugin_id, signal):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(plugin_id)
+                raise
+        
+        manager.set_evaluator(hung_evaluator)
+        manager.submit_shadow({'signal_id': 's1'}, 'v3_combined', {'status': 'skipped'})
+        await manager.drain()
+        await asyncio.sleep(0.05)
+        
+        assert cancelled == ['v3_shadow']
+        assert manager.get_stats()['shadow_errors'] == 1
+        assert manager.get_discrepancies()[0].plugin_decision.reason == 'shadow_timeout'
+        await manager.stop()
+    
+    def test_inactive_without_shadow_mode(self, manager):
+        """Test nothing is queued outside shadow mode or without a loop"""
+        manager.set_evaluator(AsyncMock())
+        assert not manager.submit_shadow({}, 'v3_combined', {})  # no running loop
+        manager.set_mode(ExecutionMode.LEGACY_ONLY)
+        assert not manager.submit_shadow({}, 'v3_combined', {})
+
+
 # ============================================================================
 # Summary
 # ============================================================================
@@ -554,6 +718,8 @@ class TestTradingEngineIntegration:
 # - StatisticsAndReporting: 6 tests
 # - ShadowCommands: 3 tests
 # - TradingEngineIntegration: 1 test
+# - BoundedBuffers: 3 tests
+# - BackgroundShadowEvaluation: 5 tests
 # ============================================================================
 
 if __name__ == '__main__':
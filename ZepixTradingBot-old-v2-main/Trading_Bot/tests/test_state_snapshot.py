@@ -0,0 +1,181 @@
+"""
+Tests for Warm-Restart State Snapshots
+Snapshot file round trips and manager restore behaviour
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.state_snapshot import StateSnapshotStore, register_engine_sections, MAGIC
+
+
+class Holder:
+    def __init__(self, value=None):
+        self.value = value
+
+    def export_snapshot_state(self):
+        return self.value
+
+    def restore_snapshot_state(self, state):
+        self.value = state
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "state_snapshot.bin")
+
+
+class TestStateSnapshotStore:
+    """Test save, incremental skip and restore"""
+
+    def test_round_trip(self, snapshot_path):
+        source = Holder({"at": datetime(2026, 10, 19, 9, 30), "items": [1, 2, 3]})
+        store = StateSnapshotStore(snapshot_path)
+        store.register("holder", source.export_snapshot_state, source.restore_snapshot_state)
+        assert store.save()
+        with open(snapshot_path, "rb") as f:
+            assert f.read().startswith(MAGIC)
+
+        target = Holder()
+        restore = StateSnapshotStore(snapshot_path)
+        restore.register("holder", target.export_snapshot_state, target.restore_snapshot_state)
+        assert restore.restore_all() == ["holder"]
+        assert target.value == source.value
+
+    def test_unchanged_state_is_not_rewritten(self, snapshot_path):
+        a, b = Holder([1]), Holder([2])
+        store = StateSnapshotStore(snapshot_path)
+        store.register("a", a.export_snapshot_state, a.restore_snapshot_state)
+        store.register("b", b.export_snapshot_state, b.restore_snapshot_state)
+        assert store.save()
+        assert store.save() is False
+        assert store.stats["skipped"] == 1
+
+        a.value.append(3)
+        assert store.save()
+        assert store.stats["sections_written"] == 3  # a and b, then only a
+
+    def test_unpicklable_section_keeps_previous_state(self, snapshot_path):
+        holder = Holder({"ok": 1})
+        store = StateSnapshotStore(snapshot_path)
+        store.register("holder", holder.export_snapshot_state, holder.restore_snapshot_state)
+        store.save()
+        holder.value = {"bad": lambda: None}
+        store.save(force=True)
+        assert store.stats["errors"] == 1
+        assert store.load()["sections"]["holder"] == {"ok": 1}
+
+    def test_stale_and_corrupt_snapshots_are_ignored(self, snapshot_path):
+        holder = Holder("state")
+        store = StateSnapshotStore(snapshot_path, max_age_seconds=60)
+        store.register("holder", holder.export_snapshot_state, holder.restore_snapshot_state)
+        store.save()
+        assert store.load() is not None
+
+        store.max_age_seconds = 0.001
+        time.sleep(0.01)
+        assert store.restore_all() == []
+
+        with open(snapshot_path, "wb") as f:
+            f.write(b"garbage")
+        assert store.load() is None
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_final_snapshot(self, snapshot_path):
+        holder = Holder({"n": 1})
+        store = StateSnapshotStore(snapshot_path, interval=60)
+        store.register("holder", holder.export_snapshot_state, holder.restore_snapshot_state)
+        await store.start()
+        holder.value["n"] = 2
+        await store.stop()
+        assert store.load()["sections"]["holder"] == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_periodic_write_runs_off_the_loop(self, snapshot_path, monkeypatch):
+        holder = Holder({"n": 1})
+        store = StateSnapshotStore(snapshot_path, interval=0.01)
+        store.register("holder", holder.export_snapshot_state, holder.restore_snapshot_state)
+        writer_threads = []
+        replace_file = store._replace_file
+
+        def record_thread(*args):
+            writer_threads.append(threading.current_thread())
+            return replace_file(*args)
+
+        monkeypatch.setattr(store, "_replace_file", record_thread)
+        await store.start()
+        while not writer_threads:
+            await asyncio.sleep(0.01)
+        await store.stop()
+
+        assert writer_threads[0] is not threading.current_thread()
+        assert store.load()["sections"]["holder"] == {"n": 1}
+
+    def test_failed_write_is_retried(self, snapshot_path, tmp_path):
+        holder = Holder({"n": 1})
+        store = StateSnapshotStore(str(tmp_path / "missing" / "file" / "x.bin"))
+        store.register("holder", holder.export_snapshot_state, holder.restore_snapshot_state)
+        (tmp_path / "missing").write_text("not a directory")
+        assert store.save() is False
+
+        store.path = snapshot_path
+        assert store.save()
+
+
+class TestManagerSections:
+    """Test the managers' export/restore hooks"""
+
+    def test_price_monitor_drops_expired_windows(self, snapshot_path):
+        from src.services.price_monitor_service import PriceMonitorService
+
+        def make():
+            return PriceMonitorService({}, None, None, None, None, None)
+
+        source = make()
+        now = datetime.now()
+        source.sl_hunt_pending["XAUUSD"] = [
+            {"target_price": 2030.0, "direction": "buy", "chain_id": "c1", "expiration_time": now + timedelta(minutes=5)},
+            {"target_price": 2031.0, "direction": "buy", "chain_id": "c2", "expiration_time": now - timedelta(minutes=1)},
+        ]
+        source.exit_continuation_pending["EURUSD"] = {"exit_price": 1.08, "expiration_time": now + timedelta(minutes=5)}
+
+        engine = type("Engine", (), {"price_monitor": source})()
+        register_engine_sections(StateSnapshotStore(snapshot_path), engine).save()
+
+        target = make()
+        engine = type("Engine", (), {"price_monitor": target})()
+        assert register_engine_sections(StateSnapshotStore(snapshot_path), engine).restore_all() == ["price_monitor"]
+        assert [p["chain_id"] for p in target.sl_hunt_pending["XAUUSD"]] == ["c1"]
+        assert target.exit_continuation_pending["EURUSD"]["exit_price"] == 1.08
+        assert target.monitored_symbols == {"XAUUSD", "EURUSD"}
+
+    def test_alert_processor_and_reentry_manager(self, snapshot_path):
+        from src.processors.alert_processor import AlertProcessor
+        from src.managers.reentry_manager import ReEntryManager
+        from src.models import Alert, ReEntryChain
+
+        processor = AlertProcessor({})
+        processor.recent_alerts.append(Alert(type="entry", symbol="XAUUSD", signal="buy", tf="5m",
+                                             raw_data={"timestamp": datetime.now().isoformat()}))
+        reentry = ReEntryManager({"re_entry_config": {}})
+        stamp = datetime.now().isoformat()
+        reentry.active_chains["c1"] = ReEntryChain(
+            chain_id="c1", symbol="XAUUSD", direction="buy", original_entry=2030.0,
+            original_sl_distance=2.0, current_level=1, max_level=3, created_at=stamp, last_update=stamp
+        )
+        engine = type("Engine", (), {"alert_processor": processor, "reentry_manager": reentry})()
+        register_engine_sections(StateSnapshotStore(snapshot_path), engine).save()
+
+        fresh_processor = AlertProcessor({})
+        fresh_reentry = ReEntryManager({"re_entry_config": {}})
+        engine = type("Engine", (), {"alert_processor": fresh_processor, "reentry_manager": fresh_reentry})()
+        restored = register_engine_sections(StateSnapshotStore(snapshot_path), engine).restore_all()
+        assert sorted(restored) == ["alert_processor", "reentry_manager"]
+        assert fresh_processor.recent_alerts[0].symbol == "XAUUSD"
+        assert fresh_reentry.active_chains["c1"].current_level == 1
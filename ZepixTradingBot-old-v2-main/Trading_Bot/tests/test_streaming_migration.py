@@ -0,0 +1,157 @@
+"""
+Tests for Streaming Migration
+Verifies chunked copying, checkpoint resume, online backups and the migration tools
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import os
+import sqlite3
+import tempfile
+
+from src.utils.streaming_migration import (
+    stream_copy, load_checkpoint, online_backup
+)
+from src.utils.data_migration_tool import DataMigrationTool, MigrationStatus
+from src.utils.database_migration import DatabaseMigration
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+def _make_v4_db(path: str, rows: int):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE trades (
+            trade_id INTEGER, symbol TEXT, direction TEXT, lot_size REAL,
+            entry_price REAL, sl_price REAL, tp_price REAL, open_time TEXT,
+            close_time TEXT, exit_price REAL, pnl REAL, commission REAL, swap REAL,
+            status TEXT, strategy TEXT, logic_type TEXT, order_type TEXT,
+            chain_id TEXT, chain_level INTEGER, profit_chain_id TEXT, profit_level INTEGER,
+            session_id TEXT, lot_multiplier REAL, sl_multiplier REAL
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO trades (trade_id, symbol, direction, lot_size, entry_price, pnl, status, strategy) "
+        "VALUES (?, 'XAUUSD', 'BUY', 0.1, 2000.0, ?, 'closed', 'combinedlogic-1')",
+        [(1000 + i, 1.5) for i in range(rows)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def _simple_tables(tmp_dir, rows):
+    source = sqlite3.connect(os.path.join(tmp_dir, "source.db"))
+    source.execute("CREATE TABLE items (name TEXT, value INTEGER)")
+    source.executemany("INSERT INTO items VALUES (?, ?)", [(f"n{i}", i) for i in range(rows)])
+    source.commit()
+    target = sqlite3.connect(os.path.join(tmp_dir, "target.db"))
+    target.execute("CREATE TABLE items (name TEXT UNIQUE, value INTEGER NOT NULL)")
+    return source, target
+
+
+class TestStreamCopy:
+    """Test the chunked copy pipeline"""
+
+    def test_copies_in_chunks_and_reports_throughput(self, tmp_dir):
+        source, target = _simple_tables(tmp_dir, 25)
+        seen = []
+        stats = stream_copy(
+            source, target, job="items", table="items",
+            insert_sql="INSERT INTO items (name, value) VALUES (?, ?)",
+            transform=lambda r: (r["name"], r["value"] * 2),
+            chunk_size=10, progress=lambda s: seen.append(s.rows_read)
+        )
+        assert stats.rows_written == 25
+        assert stats.chunks == 3
+        assert seen == [10, 20, 25]
+        assert stats.rows_per_second > 0
+        assert target.execute("SELECT SUM(value) FROM items").fetchone()[0] == 2 * sum(range(25))
+        assert load_checkpoint(target, "items") == (0, 0)
+        assert source.row_factory is None
+
+    def test_resumes_after_interruption(self, tmp_dir):
+        source, target = _simple_tables(tmp_dir, 30)
+
+        def interrupt(stats):
+            if stats.chunks == 2:
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            stream_copy(source, target, job="items", table="items",
+                        insert_sql="INSERT INTO items (name, value) VALUES (?, ?)",
+                        transform=lambda r: (r["name"], r["value"]),
+                        chunk_size=10, progress=interrupt)
+        assert load_checkpoint(target, "items")[1] == 20
+
+        stats = stream_copy(source, target, job="items", table="items",
+                            insert_sql="INSERT INTO items (name, value) VALUES (?, ?)",
+                            transform=lambda r: (r["name"], r["value"]), chunk_size=10)
+        assert stats.resumed_from == 20
+        assert stats.rows_read == 10
+        assert target.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 30
+
+    def test_bad_rows_fail_individually(self, tmp_dir):
+        source, target = _simple_tables(tmp_dir, 5)
+        source.execute("INSERT INTO items VALUES ('broken', NULL)")
+        source.commit()
+        stats = stream_copy(source, target, job="items", table="items",
+                            insert_sql="INSERT INTO items (name, value) VALUES (?, ?)",
+                            transform=lambda r: (r["name"], r["value"]), chunk_size=100)
+        assert stats.rows_written == 5
+        assert stats.rows_failed == 1
+
+    def test_online_backup(self, tmp_dir):
+        source, _ = _simple_tables(tmp_dir, 3)
+        backup = online_backup(os.path.join(tmp_dir, "source.db"),
+                               os.path.join(tmp_dir, "backups", "source.db.backup"))
+        conn = sqlite3.connect(backup)
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 3
+
+
+class TestMigrationTools:
+    """Test both migration tools on the streaming pipeline"""
+
+    def test_data_migration_tool_streams_and_skips_duplicates(self, tmp_dir):
+        source_db = os.path.join(tmp_dir, "trading_bot.db")
+        _make_v4_db(source_db, 120)
+        tool = DataMigrationTool(source_db=source_db, target_dir=tmp_dir,
+                                 backup_dir=os.path.join(tmp_dir, "backups"))
+
+        assert tool.migrate_to_plugin("combined_v3", dry_run=True).records_migrated == 120
+        result = tool.migrate_to_plugin("combined_v3", dry_run=False, chunk_size=50)
+        assert result.status == MigrationStatus.COMPLETED
+        assert result.records_migrated == 120
+        assert result.chunks == 3
+        assert result.integrity_check_passed
+        assert "Rows/sec" in tool.format_migration_report(result)
+
+        again = tool.migrate_to_plugin("combined_v3", dry_run=False, chunk_size=50)
+        assert again.records_migrated == 0
+        assert again.records_skipped == 120
+        assert os.listdir(os.path.join(tmp_dir, "backups"))
+
+    def test_database_migration_streams_v6_trades(self, tmp_dir):
+        data_dir = os.path.join(tmp_dir, "data")
+        os.makedirs(data_dir)
+        shared = sqlite3.connect(os.path.join(data_dir, "zepix_trading.db"))
+        shared.execute("CREATE TABLE trades (id TEXT, symbol TEXT, direction TEXT, "
+                       "entry_price REAL, exit_price REAL, strategy TEXT)")
+        shared.executemany("INSERT INTO trades VALUES (?, 'EURUSD', 'BUY', 1.1, NULL, 'V6_1M')",
+                           [(f"t{i}",) for i in range(7)])
+        shared.commit()
+
+        v6 = sqlite3.connect(os.path.join(data_dir, "zepix_price_action.db"))
+        v6.execute("CREATE TABLE trades (trade_id TEXT, plugin_id TEXT, symbol TEXT, direction TEXT, "
+                   "timeframe TEXT, entry_price REAL, lot_size REAL, status TEXT)")
+        v6.commit()
+
+        migration = DatabaseMigration(tmp_dir, chunk_size=3)
+        stats = migration._migrate_v6_data(shared, dry_run=False)
+        assert stats.migrated_count == 7
+        assert stats.failed_count == 0
+        assert v6.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 7
@@ -0,0 +1,162 @@
+"""
+Tests for Telegram Dispatch
+Verifies lazy command handler loading and precompiled callback dispatch tables
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import importlib
+from unittest.mock import MagicMock, AsyncMock
+
+pytest.importorskip("telegram.ext")
+
+from src.telegram.core.dispatch_table import CallbackDispatchTable
+from src.telegram.core.lazy_handlers import HANDLER_MANIFEST, LazyHandlerRegistry
+from src.telegram.core.callback_router import CallbackRouter
+from src.clients.menu_callback_handler import MenuCallbackHandler
+from src.monitoring.metrics_registry import get_metrics_registry
+
+
+def make_update(data: str):
+    update = MagicMock()
+    update.callback_query.data = data
+    update.callback_query.answer = AsyncMock()
+    update.callback_query.edit_message_text = AsyncMock()
+    return update
+
+
+class TestDispatchTable:
+    """Test exact and longest-prefix resolution"""
+
+    def test_exact_before_prefix_and_longest_prefix_wins(self):
+        table = CallbackDispatchTable("test")
+        table.add_exact("menu_main", "main")
+        table.add_prefix("menu_", "category")
+        table.add_prefix("toggle_", "toggle")
+        table.add_prefix("toggle_level_", "level")
+
+        assert table.resolve("menu_main") == "main"
+        assert table.resolve("menu_risk") == "category"
+        assert table.resolve("toggle_level_2") == "level"
+        assert table.resolve("toggle_sl_hunt") == "toggle"
+        assert table.resolve("toggle") is None
+        assert table.match("menu_x") == ("menu_", "category")
+        assert len(table) == 4
+
+    def test_stats_and_metric(self):
+        table = CallbackDispatchTable("stats_test")
+        table.add_prefix("a_", 1)
+        table.resolve("a_b")
+        table.resolve("zzz")
+
+        stats = table.get_stats()
+        assert stats["dispatches"] == 2
+        assert stats["misses"] == 1
+        assert 'zepix_telegram_dispatch_seconds_count{router="stats_test"} 2' in get_metrics_registry().render()
+
+
+class TestLazyHandlers:
+    """Test manifest-driven handler loading"""
+
+    def test_handler_imported_on_first_use(self):
+        bot = MagicMock()
+        registry = LazyHandlerRegistry(bot, {"status_handler": HANDLER_MANIFEST["status_handler"]})
+        registry.install()
+
+        proxy = bot.status_handler
+        assert not proxy.loaded
+        assert registry.get_stats()["loaded"] == 0
+
+        assert proxy.get_command_name() == "/status"
+        assert proxy.loaded
+        assert type(proxy.resolve()).__name__ == "StatusHandler"
+        assert registry.get_stats()["loaded"] == 1
+
+    def test_handle_delegates_after_loading(self):
+        bot = MagicMock()
+        registry = LazyHandlerRegistry(bot, {"blocking_handler": HANDLER_MANIFEST["blocking_handler"]})
+        registry.install()
+        update = MagicMock()
+        update.message.reply_text = AsyncMock()
+        context = MagicMock()
+        context.args = []
+
+        asyncio.run(bot.blocking_handler.handle(update, context))
+        assert "EVENT LOOP BLOCKING" in update.message.reply_text.call_args.args[0]
+
+    def test_every_manifest_entry_resolves(self):
+        for attr, target in HANDLER_MANIFEST.items():
+            module_name, class_name = target.split(":")
+            module = importlib.import_module(module_name)
+            assert hasattr(module, class_name), attr
+
+    def test_controller_bot_defers_handlers(self):
+        from src.telegram.bots.controller_bot import ControllerBot
+
+        bot = ControllerBot("123:abc")
+        stats = bot.get_dispatch_stats()
+        assert stats["handlers"]["handlers"] == len(HANDLER_MANIFEST)
+        assert stats["handlers"]["loaded"] == 0
+        assert not bot.logic2_handler.loaded
+
+    def test_manifest_binds_only_the_core_handlers(self):
+        from src.telegram.bots.controller_bot import ControllerBot
+
+        bot = ControllerBot("123:abc")
+        assert len(HANDLER_MANIFEST) == 54
+        for attr in ("logic3_config_handler", "tf5m_handler", "weekly_handler", "booking_handler"):
+            assert attr not in HANDLER_MANIFEST
+            assert not hasattr(bot, attr)
+
+
+class TestCallbackRouter:
+    """Test CallbackRouter routing through its dispatch table"""
+
+    def test_domain_prefix_routes_to_bot_method(self):
+        bot = MagicMock(spec=["handle_trading_positions"])
+        bot.handle_trading_positions = AsyncMock()
+        router = CallbackRouter(bot)
+
+        handled = asyncio.run(router.handle_callback(make_update("trading_positions"), MagicMock()))
+        assert handled
+        bot.handle_trading_positions.assert_awaited_once()
+
+    def test_unrouted_data_is_not_handled(self):
+        router = CallbackRouter(MagicMock())
+        assert not asyncio.run(router.handle_callback(make_update("unknown_thing"), MagicMock()))
+        assert not asyncio.run(router.handle_callback(make_update("system"), MagicMock()))
+        assert router.dispatch_table.get_stats()["misses"] == 2
+
+
+class TestMenuCallbackHandler:
+    """Test the compiled menu callback table keeps the old elif ordering"""
+
+    @pytest.fixture
+    def handler(self):
+        bot = MagicMock()
+        return MenuCallbackHandler(bot)
+
+    def test_main_and_category_menus(self, handler):
+        assert handler.handle_menu_callback("menu_main", 1, 2)
+        handler.menu_manager.show_main_menu.assert_called_once_with(1, 2)
+
+        assert handler.handle_menu_callback("menu_trading", 1, 2)
+        handler.menu_manager.show_category_menu.assert_called_once_with(1, "trading", 2)
+
+        assert handler.handle_menu_callback("menu_timeframe", 1, 2)
+        handler.menu_manager.show_timeframe_menu.assert_called_once_with(1, 2)
+
+    def test_toggle_routes(self, handler):
+        assert handler.handle_menu_callback("toggle_level_3", 1, 2)
+        handler.bot.profit_booking_menu_handler.toggle_level.assert_called_once_with("3", 1, 2)
+
+        assert handler.handle_menu_callback("toggle_profit_protection", 1, 2)
+        handler.bot.profit_booking_menu_handler.toggle_level.assert_called_once()
+
+        assert handler.handle_menu_callback("toggle_sl_hunt", 1, 2)
+        handler.bot.reentry_menu_handler.handle_toggle_callback.assert_called_once_with("toggle_sl_hunt", 1, 2)
+
+    def test_unknown_callback_not_handled(self, handler):
+        assert not handler.handle_menu_callback("something_else", 1, 2)
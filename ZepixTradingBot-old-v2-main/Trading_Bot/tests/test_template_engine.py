@@ -0,0 +1,116 @@
+"""
+Tests for Template Engine
+Verifies compiled notification templates and per-notification render reuse
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import re
+import pytest
+from unittest.mock import Mock
+
+from src.telegram.template_engine import (
+    REQUIRED, CompiledTemplate, compile_template, get_compiled, when
+)
+from src.telegram.notification_router import (
+    NotificationFormatter, NotificationPriority, NotificationType,
+    create_default_router
+)
+from src.telegram.unified_notification_router import UnifiedNotificationRouter
+from src.telegram.notification_templates import NotificationTemplates
+
+
+class TestCompileTemplate:
+    """Test compilation, declared fields and computed values"""
+
+    def test_defaults_specs_and_escaped_braces(self):
+        template = compile_template(
+            "{symbol}: ${profit:+.2f} {{raw}} {note!r}",
+            fields={"symbol": "N/A", "profit": 0, "note": ""},
+        )
+        assert template({"profit": 1.5}) == "N/A: $+1.50 {raw} ''"
+        assert template.fields == ("symbol", "profit", "note")
+
+    def test_undeclared_placeholder_fails_at_compile(self):
+        with pytest.raises(ValueError, match="undeclared field 'loss'"):
+            compile_template("{symbol} {loss}", fields={"symbol": "N/A"})
+        with pytest.raises(ValueError, match="unsupported placeholder"):
+            compile_template("{trade.symbol}", fields={"trade": None})
+
+    def test_computed_values_receive_fields_by_name(self):
+        template = compile_template(
+            "{status} lvl {next_level}",
+            fields={"enabled": False, "level": 1},
+            computed={
+                "status": lambda enabled: "ON" if enabled else "OFF",
+                "next_level": lambda data, level: data.get("next_level", level + 1),
+            },
+        )
+        assert template({"enabled": True, "level": 2}) == "ON lvl 3"
+        assert template({"next_level": 9}) == "OFF lvl 9"
+
+    def test_when_block_and_time_builtin(self):
+        template = compile_template(
+            "A\n{sl_line}{time}",
+            computed={"sl_line": when("sl", "SL: {sl}\n")},
+        )
+        assert template({"sl": 1.1}).startswith("A\nSL: 1.1\n")
+        assert re.fullmatch(r"A\n\d\d:\d\d:\d\d", template({"sl": 0}))
+
+    def test_required_fields_raise_key_error(self):
+        template = compile_template("{a}", fields={"a": REQUIRED})
+        with pytest.raises(KeyError):
+            template({})
+
+    def test_adhoc_templates_are_memoized(self):
+        assert get_compiled("{x:.1f}") is get_compiled("{x:.1f}")
+        assert NotificationTemplates.format_template("{a} {b}", {"a": 1}).endswith(
+            "<i>Missing data: 'b'</i>"
+        )
+
+
+class TestNotificationFormats:
+    """Test the router formatters are compiled and keep their output"""
+
+    def test_default_formatters_are_compiled(self):
+        router = create_default_router()
+        compiled = [f for f in router.formatters.values() if isinstance(f, CompiledTemplate)]
+        assert len(compiled) >= 30
+
+    def test_formatter_output(self):
+        message = NotificationFormatter.format_v6_exit(
+            {"timeframe": "1h", "symbol": "XAUUSD", "pnl": -4.5, "pips": 3, "exit_reason": "SL"}
+        )
+        assert message.startswith(" <b>V6 EXIT</b> | 1H\n")
+        assert "<b>P&L:</b> $-4.50 (+3.0 pips)\n<b>Reason:</b> SL\n" in message
+        assert NotificationFormatter.format_voice_sl_hit({"symbol": "X", "loss": -2}) == \
+            "Stop loss hit. X loss 2.00 dollars"
+
+    def test_unified_router_formatters(self):
+        router = UnifiedNotificationRouter()
+        assert router._format_notification("trade_exit", {"profit": -1}).startswith("🔴 <b>EXIT ALERT</b>")
+        assert "<b>Title</b>" in router._format_notification("unknown", {"title": "Title"})
+
+
+class TestNotificationRenderReuse:
+    """Test a notification is formatted once across targets and voice"""
+
+    def test_send_formats_once_for_all_targets(self):
+        callbacks = [Mock(return_value=1) for _ in range(4)]
+        router = create_default_router(*callbacks)
+        formatter = Mock(return_value="text")
+        router.register_formatter(NotificationType.ENTRY, formatter)
+
+        assert router.send(NotificationType.ENTRY, "msg", {"a": 1}, priority=NotificationPriority.CRITICAL)
+
+        formatter.assert_called_once_with({"a": 1})
+        for callback in callbacks[:3]:
+            callback.assert_called_once_with("text")
+        callbacks[3].assert_called_once_with("text", NotificationPriority.CRITICAL)
+
+    def test_formatter_error_falls_back_to_message(self):
+        callback = Mock(return_value=1)
+        router = create_default_router(callback)
+        router.register_formatter(NotificationType.INFO, Mock(side_effect=ValueError))
+        assert router.send(NotificationType.INFO, "raw")
+        callback.assert_called_once_with("raw")
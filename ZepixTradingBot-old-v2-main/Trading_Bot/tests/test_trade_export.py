@@ -0,0 +1,150 @@
+"""
+Tests for Trade Export
+Verifies streamed CSV/gzip/Parquet exports, filters and the download route
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+import csv
+import gzip
+import os
+import sqlite3
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from src.database.trade_export import TradeExporter, ExportRequest
+from src.database.analytics_queries import AnalyticsQueries
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trading_bot.db")
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE trades (
+                trade_id INTEGER, symbol TEXT, direction TEXT, lot_size REAL,
+                entry_price REAL, exit_price REAL, pnl REAL, open_time TEXT,
+                close_time TEXT, status TEXT, strategy TEXT, logic_type TEXT
+            )
+        """)
+        today = date.today()
+        rows = []
+        for i in range(25):
+            day = (today - timedelta(days=i % 5)).isoformat()
+            logic = "v3_combined_logic1" if i % 2 else "v6_price_action_15m"
+            rows.append((i, "XAUUSD", "buy", 0.1, 2000.0, 2001.0, 10.0 if i % 3 else -5.0,
+                         f"{day} 09:00:00", f"{day} 10:00:00", "closed", logic, logic))
+        # Old and still-open trades are never exported
+        rows.append((100, "EURUSD", "sell", 0.1, 1.1, 1.09, 7.0, "2020-01-01 09:00:00",
+                     "2020-01-01 10:00:00", "closed", "v3_combined_logic2", "v3_combined_logic2"))
+        rows.append((101, "EURUSD", "sell", 0.1, 1.1, None, None, f"{today} 09:00:00",
+                     None, "open", "v3_combined_logic2", "v3_combined_logic2"))
+        conn.executemany("INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+        yield path
+
+
+class TestTradeExporter:
+    """Test streamed export files"""
+
+    def test_csv_export_in_chunks(self, db_path):
+        exporter = TradeExporter(db_path, chunk_size=4)
+        chunks = list(exporter.iter_chunks(ExportRequest.last_days(30)))
+        assert [len(rows) for _, rows in chunks] == [4, 4, 4, 4, 4, 4, 1]
+
+        result = exporter.export(ExportRequest.last_days(30))
+        try:
+            with open(result.path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            assert result.rows == len(rows) == 25
+            assert result.filename.startswith("trades_") and result.filename.endswith(".csv")
+            assert {"symbol", "pnl", "duration_mins"} <= set(rows[0])
+        finally:
+            result.cleanup()
+        assert not os.path.exists(result.path)
+
+    def test_gzip_and_filters(self, db_path):
+        exporter = TradeExporter(db_path)
+        today = date.today()
+        request = ExportRequest(compress=True, plugin="v6", start=today - timedelta(days=1), end=today)
+        result = exporter.export(request)
+        try:
+            with gzip.open(result.path, "rt", newline="") as f:
+                rows = list(csv.DictReader(f))
+            assert result.filename.endswith(".csv.gz")
+            assert rows and all(r["logic_type"].startswith("v6") for r in rows)
+            assert all(r["close_time"][:10] >= (today - timedelta(days=1)).isoformat() for r in rows)
+        finally:
+            result.cleanup()
+
+    def test_empty_export_keeps_header(self, db_path):
+        result = TradeExporter(db_path).export(ExportRequest(plugin="nothing_matches"))
+        try:
+            with open(result.path) as f:
+                assert f.read().startswith("open_time,close_time,symbol")
+            assert result.rows == 0
+        finally:
+            result.cleanup()
+
+    def test_daily_summary_matches_analytics_queries(self, db_path):
+        conn = sqlite3.connect(db_path)
+        queries = AnalyticsQueries(conn)
+        summaries = queries.prepare_daily_summary_export(days=5)
+        assert len(summaries) == 5
+        assert sum(s["trade_count"] for s in summaries) == 25
+        assert isinstance(summaries[0]["date"], date)
+        assert sum(s["v3_pnl"] + s["v6_pnl"] for s in summaries) == pytest.approx(
+            sum(s["pnl"] for s in summaries))
+        assert len(queries.prepare_trades_export(days=30)) == 25
+
+    def test_invalid_request_rejected(self, db_path):
+        with pytest.raises(ValueError):
+            TradeExporter(db_path).export(ExportRequest(fmt="xlsx"))
+        with pytest.raises(ValueError):
+            TradeExporter(db_path).export(ExportRequest(fmt="parquet", compress=True))
+
+    def test_parquet_export(self, db_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        result = asyncio.run(TradeExporter(db_path, chunk_size=10).export_async(
+            ExportRequest.last_days(30, fmt="parquet")))
+        try:
+            table = pq.read_table(result.path)
+            assert table.num_rows == 25
+            assert str(table.schema.field("symbol").type) == "string"
+        finally:
+            result.cleanup()
+
+
+class TestExportRoute:
+    """Test the FastAPI download route"""
+
+    def test_download_and_cleanup(self, db_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        import src.app as app_module
+
+        engine = MagicMock()
+        engine.db.conn = sqlite3.connect(db_path, check_same_thread=False)
+        monkeypatch.setattr(app_module, "trading_engine", engine)
+        created = []
+        original = TradeExporter.export
+
+        def tracking_export(self, request):
+            result = original(self, request)
+            created.append(result.path)
+            return result
+
+        monkeypatch.setattr(TradeExporter, "export", tracking_export)
+        client = TestClient(app_module.app)
+
+        response = client.get("/export/trades", params={"days": 30, "plugin": "v3"})
+        assert response.status_code == 200
+        assert response.headers["x-export-rows"] == "12"
+        assert response.text.startswith("open_time")
+        assert created and not os.path.exists(created[0])
+
+        assert client.get("/export/trades", params={"format": "xlsx"}).status_code == 400
@@ -0,0 +1,163 @@
+"""
+Tests for View State Store
+Verifies live menu refresh: header re-render, change detection and the edit budget
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import pytest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+pytest.importorskip("telegram.ext")
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
+
+from src.telegram.headers.header_refresh_manager import HeaderRefreshManager
+from src.telegram.headers.view_state_store import ViewStateStore, compose_message, content_hash
+from src.monitoring.metrics_registry import get_metrics_registry
+
+
+def keyboard(label: str = "Back"):
+    return InlineKeyboardMarkup([[InlineKeyboardButton(label, callback_data="nav_back")]])
+
+
+class Clock:
+    """Header callable whose output changes only when ``now`` changes"""
+
+    def __init__(self):
+        self.now = "12:00"
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"HEADER {self.now}"
+
+
+def make_manager(max_edits_per_minute: int = 20):
+    bot = MagicMock()
+    bot.bot.edit_message_text = AsyncMock()
+    return HeaderRefreshManager(bot, max_edits_per_minute=max_edits_per_minute), bot.bot.edit_message_text
+
+
+class TestViewStateStore:
+    """Test recording and hashing of views"""
+
+    def test_one_view_per_chat(self):
+        store = ViewStateStore()
+        store.record(1, 10, "a")
+        store.record(1, 11, "b")
+        store.record(2, 20, "c")
+
+        assert len(store) == 2
+        assert store.get(1).message_id == 11
+        store.discard(1, message_id=10)
+        assert store.get(1) is not None
+        store.discard(1)
+        assert store.get(1) is None
+
+    def test_hash_covers_text_and_markup(self):
+        assert content_hash("x", keyboard("A")) == content_hash("x", keyboard("A"))
+        assert content_hash("x", keyboard("A")) != content_hash("x", keyboard("B"))
+        assert content_hash("x") != content_hash("y")
+
+        view = ViewStateStore().record(1, 10, "body", keyboard(), header_text="H")
+        assert view.content_hash == content_hash(compose_message("H", "body"), keyboard())
+
+
+class TestHeaderRefresh:
+    """Test refresh ticks against a mocked Bot API"""
+
+    def test_unchanged_view_is_not_edited(self):
+        manager, edit = make_manager()
+        clock = Clock()
+        manager.track_view(1, 10, "Menu", keyboard(), header_text=clock(), header=clock)
+
+        tick = asyncio.run(manager.refresh_tick())
+        assert tick["unchanged"] == 1
+        edit.assert_not_awaited()
+
+    def test_changed_header_edits_once(self):
+        manager, edit = make_manager()
+        clock = Clock()
+        manager.track_view(1, 10, "Menu", keyboard(), header_text=clock(), header=clock)
+
+        clock.now = "12:01"
+        assert asyncio.run(manager.refresh_tick())["edited"] == 1
+        assert edit.call_args.kwargs["text"] == "HEADER 12:01\nMenu"
+        assert edit.call_args.kwargs["message_id"] == 10
+
+        assert asyncio.run(manager.refresh_tick())["unchanged"] == 1
+        assert edit.await_count == 1
+
+    def test_header_rendered_once_per_key_per_tick(self):
+        manager, edit = make_manager()
+        clock = Clock()
+        for chat_id in range(5):
+            manager.track_view(chat_id, 100 + chat_id, "Menu", header_text="old",
+                               header=clock, header_key="compact")
+        clock.calls = 0
+
+        assert asyncio.run(manager.refresh_tick())["edited"] == 5
+        assert clock.calls == 1
+
+    def test_body_and_keyboard_are_reused(self):
+        manager, edit = make_manager()
+        manager.track_view(1, 10, "Static", keyboard(), header_text="old", header=lambda: "new")
+
+        assert asyncio.run(manager.refresh_tick())["edited"] == 1
+        assert edit.call_args.kwargs["text"] == "new\nStatic"
+        assert edit.call_args.kwargs["reply_markup"] == keyboard()
+
+    def test_edit_budget_defers_rest_to_next_tick(self):
+        manager, edit = make_manager(max_edits_per_minute=2)
+        for chat_id in range(3):
+            manager.track_view(chat_id, 100 + chat_id, "Menu", header_text="old", header=lambda: "new")
+
+        tick = asyncio.run(manager.refresh_tick())
+        assert tick["edited"] == 2
+        assert tick["deferred"] == 1
+
+        manager.edit_bucket.tokens = 2
+        tick = asyncio.run(manager.refresh_tick())
+        assert tick == {"edited": 1, "unchanged": 2, "deferred": 0, "failed": 0}
+        assert 'zepix_telegram_view_refresh_total{result="deferred"}' in get_metrics_registry().render()
+
+    def test_deleted_message_is_dropped(self):
+        manager, edit = make_manager()
+        edit.side_effect = BadRequest("Message to edit not found")
+        manager.track_view(1, 10, "Menu", header_text="old", header=lambda: "new")
+
+        assert asyncio.run(manager.refresh_tick())["failed"] == 1
+        assert manager.active_messages == {}
+        assert len(manager.view_store) == 0
+
+    def test_register_message_replaces_chat_view(self):
+        manager, edit = make_manager()
+        manager.track_view(1, 10, "Menu", header_text="old", header=lambda: "new")
+        manager.register_message(1, 11)
+
+        assert asyncio.run(manager.refresh_tick())["edited"] == 0
+        edit.assert_not_awaited()
+
+
+class TestMenuIntegration:
+    """Test menus sent through the controller bot are tracked"""
+
+    def test_send_menu_records_view(self):
+        from src.telegram.bots.controller_bot import ControllerBot
+
+        bot = ControllerBot("123:abc")
+        update = MagicMock()
+        update.effective_chat.id = 42
+        update.callback_query.message.message_id = 7
+        update.callback_query.edit_message_text = AsyncMock()
+
+        asyncio.run(bot.main_menu.send_menu(update, MagicMock()))
+
+        sent = update.callback_query.edit_message_text.call_args.kwargs["text"]
+        view = bot.header_refresh_manager.view_store.get(42)
+        assert view.message_id == 7
+        assert view.content_hash == content_hash(sent, view.reply_markup)
+        assert "\\n" not in sent
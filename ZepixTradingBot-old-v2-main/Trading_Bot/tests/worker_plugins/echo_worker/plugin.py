@@ -0,0 +1,67 @@
+"""
+Echo Worker Plugin - test fixture for process-isolated plugin workers
+Loaded inside worker processes by tests/test_plugin_workers.py
+
+Version: 1.0.0
+Date: 2026-10-19
+"""
+import os
+import time
+from typing import Dict, Any, List
+
+
+class EchoWorkerPlugin:
+    """Minimal plugin exercising the ServiceAPI proxy and budget limits"""
+
+    def __init__(self, plugin_id: str, config: Dict[str, Any], service_api):
+        self.plugin_id = plugin_id
+        self.config = config
+        self.service_api = service_api
+        self.enabled = config.get("enabled", True)
+        self.priority = 3
+        self._ballast = []
+
+    def get_supported_strategies(self) -> List[str]:
+        return ["ECHO"]
+
+    def get_supported_timeframes(self) -> List[str]:
+        return ["5m"]
+
+    def can_process_signal(self, signal: Dict[str, Any]) -> bool:
+        return signal.get("strategy") == "ECHO"
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"plugin_id": self.plugin_id, "enabled": self.enabled}
+
+    async def process_signal(self, signal: Dict[str, Any]) -> Dict[str, Any]:
+        price = await self.service_api.get_price(signal["symbol"])
+        balance = self.service_api.get_balance()
+        recovery = await self.service_api.reentry_service.start_recovery(signal["symbol"])
+        return {
+            "plugin_id": self.plugin_id,
+            "pid": os.getpid(),
+            "price": price,
+            "balance": balance,
+            "recovery": recovery,
+            "mode": self.service_api.mode,
+            "enabled": self.enabled,
+        }
+
+    async def fail(self, message: str):
+        raise ValueError(message)
+
+    async def crash(self):
+        os._exit(3)
+
+    async def allocate(self, mb: int) -> int:
+        self._ballast.append(bytearray(mb * 1024 * 1024))
+        return len(self._ballast)
+
+    async def burn(self, seconds: float) -> float:
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            pass
+        return seconds
+
+    async def sleep_forever(self):
+        time.sleep(3600)